@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: manager.py - Memory Sections Management Handler
 # Date: 2026-02-04
-# Version: 1.1.0
+# Version: 1.1.1
 # Category: memory_bank/handlers/learnings
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.1 (2026-10-18): process_all_branches() reads branches via detector._read_registry
 #   - v1.1.0 (2026-02-04): Added recently_completed management + status count updates
 #   - v1.0.0 (2026-02-04): Initial version - timestamp tracking, max_entries, vectorization
 #
@@ -959,13 +960,9 @@ def process_all_branches() -> Dict[str, Any]:
     if not registry_path.exists():
         return {'success': False, 'error': 'BRANCH_REGISTRY.json not found'}
 
-    try:
-        with open(registry_path, 'r', encoding='utf-8') as f:
-            registry = json.load(f)
-    except Exception as e:
-        return {'success': False, 'error': f'Failed to read registry: {e}'}
-
-    branches = registry.get('branches', [])
+    # Drone's shared registry cache when available, else a direct read
+    from MEMORY_BANK.apps.handlers.monitor.detector import _read_registry
+    branches = _read_registry()
     results: Dict[str, Any] = {
         'success': True,
         'processed': 0,
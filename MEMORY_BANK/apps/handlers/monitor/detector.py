@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: detector.py - Rollover Trigger Detection Handler
 # Date: 2025-11-16
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: memory_bank/handlers/monitor
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): _read_registry() uses drone's cached registry when available
 #   - v0.1.0 (2025-11-16): Initial version - detect 600-line rollover triggers
 #
 # CODE STANDARDS:
@@ -69,9 +70,18 @@ def _read_registry() -> List[Dict[str, Any]]:
     """
     Read BRANCH_REGISTRY.json
 
+    Prefers drone's shared registry cache (parsed once per file change);
+    falls back to reading the file directly so the handler stays transportable.
+
     Returns:
         List of branch dictionaries
     """
+    try:
+        from drone.apps.modules.branch_registry import load_registry
+        return load_registry().get('branches', [])
+    except ImportError:
+        pass
+
     registry_path = Path.home() / "BRANCH_REGISTRY.json"
 
     if not registry_path.exists():
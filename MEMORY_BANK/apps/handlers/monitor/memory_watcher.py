@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: memory_watcher.py - Memory File System Watcher
 # Date: 2025-11-26
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: memory_bank/handlers/monitor
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Branch paths via detector._read_registry (drone's cached registry)
 #   - v1.0.0 (2025-11-26): Initial version
 #     * Watches memory files for modifications
 #     * Auto-updates line counts on file changes
@@ -49,7 +50,7 @@
 
 # Handler imports (domain-organized)
 from MEMORY_BANK.apps.handlers.tracking.line_counter import update_line_count
-from MEMORY_BANK.apps.handlers.monitor.detector import check_single_file
+from MEMORY_BANK.apps.handlers.monitor.detector import check_single_file, _read_registry
 
 # Lazy logger import to avoid circular dependency with prax
 _logger = None
@@ -368,25 +369,14 @@ def _get_branch_paths() -> list[Path]:
     Returns:
         List of Path objects for each branch
     """
-    import json
-
-    registry_path = Path.home() / "BRANCH_REGISTRY.json"
-
-    if not registry_path.exists():
-        return []
-
     try:
-        with open(registry_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            branches = data.get('branches', [])
-
-            paths = []
-            for branch in branches:
-                branch_path = Path(branch.get('path', ''))
-                if branch_path.exists():
-                    paths.append(branch_path)
+        paths = []
+        for branch in _read_registry():
+            branch_path = Path(branch.get('path', ''))
+            if branch_path.exists():
+                paths.append(branch_path)
 
-            return paths
+        return paths
     except Exception:
         return []
 
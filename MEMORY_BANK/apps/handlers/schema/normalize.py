@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: normalize.py - Memory File Schema Normalizer
 # Date: 2026-01-22
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: memory_bank/handlers/schema
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): Branches via detector._read_registry (drone's cached registry)
 #   - v0.1.0 (2026-01-22): Initial version - normalize metadata schema
 #
 # CODE STANDARDS:
@@ -159,12 +160,8 @@ def normalize_all_memory_files(dry_run: bool = False) -> Dict[str, Any]:
     if not registry_path.exists():
         return {'success': False, 'error': "BRANCH_REGISTRY.json not found"}
 
-    try:
-        with open(registry_path, 'r', encoding='utf-8') as f:
-            registry = json.load(f)
-            branches = registry.get('branches', [])
-    except Exception as e:
-        return {'success': False, 'error': f"Failed to read registry: {e}"}
+    from MEMORY_BANK.apps.handlers.monitor.detector import _read_registry
+    branches = _read_registry()
 
     results = {
         'success': True,
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: pusher.py - Living Template Push Handler
 # Date: 2026-02-14
-# Version: 1.0.0
+# Version: 1.0.1
 # Category: memory_bank/handlers/templates
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.0.1 (2026-10-18): _load_registry() via detector._read_registry (drone's cached registry)
 #   - v1.0.0 (2026-02-14): Initial version
 #     * Reads living templates from Memory Bank
 #     * Pushes structural updates to all branch memory files
@@ -278,12 +279,8 @@ def _load_registry() -> Optional[List[Dict[str, Any]]]:
     """Load branch registry and return list of active branches."""
     if not REGISTRY_PATH.exists():
         return None
-    try:
-        with open(REGISTRY_PATH, 'r', encoding='utf-8') as f:
-            registry = json.load(f)
-        return [b for b in registry.get("branches", []) if b.get("status") == "active"]
-    except (json.JSONDecodeError, KeyError):
-        return None
+    from MEMORY_BANK.apps.handlers.monitor.detector import _read_registry
+    return [b for b in _read_registry() if b.get("status") == "active"]
 
 
 def _find_memory_files(branch_path: Path) -> Dict[str, List[Path]]:
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: templates.py - Living Template Orchestration Module
 # Date: 2026-02-14
-# Version: 1.0.0
+# Version: 1.0.1
 # Category: memory_bank/modules
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.0.1 (2026-10-18): Registry branches via detector._read_registry (drone's cached registry)
 #   - v1.0.0 (2026-02-14): Initial version - Phase 3 of FPLAN-0340
 #     * push-templates: Push living template updates to all branches
 #     * diff-templates: Show template diffs per branch
@@ -48,7 +49,7 @@
 # Handler imports (domain-organized)
 from MEMORY_BANK.apps.handlers.templates.pusher import push_templates, get_template_status
 from MEMORY_BANK.apps.handlers.templates.differ import diff_template_vs_branch
-from MEMORY_BANK.apps.handlers.json.json_handler import read_memory_file_data
+from MEMORY_BANK.apps.handlers.monitor.detector import _read_registry
 
 # Branch registry for iteration
 REGISTRY_PATH = Path.home() / "BRANCH_REGISTRY.json"
@@ -363,7 +364,7 @@ def _display_status(status: dict) -> None:
 
 def _load_branches_from_registry() -> list | None:
     """
-    Load active branches from BRANCH_REGISTRY.json via json_handler.
+    Load active branches from BRANCH_REGISTRY.json (drone's shared cache when available).
 
     Returns:
         List of branch dicts or None on error
@@ -371,10 +372,7 @@ def _load_branches_from_registry() -> list | None:
     if not REGISTRY_PATH.exists():
         return None
     try:
-        data = read_memory_file_data(REGISTRY_PATH)
-        if data is None:
-            return None
-        return [b for b in data.get('branches', []) if b.get('status') == 'active']
+        return [b for b in _read_registry() if b.get('status') == 'active']
     except Exception as e:
         logger.error(f"[templates] Failed to load branch registry: {e}")
         return None
@@ -5,10 +5,12 @@
 # META DATA HEADER
 # Name: summarizer.py - File change summarization
 # Date: 2026-02-18
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: Nexus/handlers/cortex
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): get_cortex_block(relative_times=False) - absolute change
+#     times, so the block only changes when cortex.json does
 #   - v1.0.0 (2026-02-18): Initial build from v1 cortex_module.py
 #
 # CODE STANDARDS:
@@ -26,7 +28,7 @@
 import sys
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 AIPASS_ROOT = Path.home() / "aipass_core"
@@ -125,12 +127,15 @@ def batch_refresh(changes: dict, llm_client=None, watch_dir: "Path | None" = Non
     logger.info(f"Batch refreshed {len(changes)} file summaries")
 
 
-def get_cortex_block() -> str:
+def get_cortex_block(relative_times: bool = True) -> str:
     """Format cortex state as text block for system prompt injection.
 
     Returns a string like:
         File Awareness:
         - watcher.py: Filesystem watcher (modified 2min ago)
+
+    With relative_times=False change times are absolute
+    ("modified at 2026-10-18 14:02 UTC").
     """
     cortex = load_cortex_data()
     files = cortex.get("files", {})
@@ -159,10 +164,9 @@ def get_cortex_block() -> str:
         if not meta.get("file_exists", True):
             status_parts.append("DELETED")
         elif meta.get("last_change_type", "existing") != "existing":
-            status_parts.append(
-                f"{meta['last_change_type']} "
-                f"{_format_time_ago(meta.get('last_change_time', ''), now)}"
-            )
+            when = (_format_time_ago(meta.get('last_change_time', ''), now) if relative_times
+                    else _format_change_time(meta.get('last_change_time', '')))
+            status_parts.append(f"{meta['last_change_type']} {when}")
             if meta.get("changes_this_session", 0) > 1:
                 status_parts.append(f"{meta['changes_this_session']}x this session")
 
@@ -264,6 +268,17 @@ def _simple_summarize(filepath: Path) -> str:
     return f"{type_desc} ({size_desc}){hint}"
 
 
+def _format_change_time(iso_timestamp: str) -> str:
+    """Format ISO timestamp as absolute UTC time (e.g. 'at 2026-10-18 14:02 UTC')."""
+    if not iso_timestamp:
+        return ""
+    try:
+        dt = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
+        return f"at {dt.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}"
+    except (ValueError, TypeError):
+        return ""
+
+
 def _format_time_ago(iso_timestamp: str, now: "datetime | None" = None) -> str:
     """Format ISO timestamp as relative time (e.g. '2min ago')."""
     if not iso_timestamp:
@@ -12,7 +12,8 @@
     load_knowledge, add_entry, search_knowledge, get_recent
 )
 from .vector_memory import (
-    store_memory, search_memories, get_memory_count
+    store_memory, search_memories, get_memory_count,
+    flush_memories, warm_up as warm_up_vector_memory
 )
 from .auto_knowledge import (
     detect_and_store, detect_learn_command, detect_memory_search
@@ -50,6 +51,8 @@
     'store_memory',
     'search_memories',
     'get_memory_count',
+    'flush_memories',
+    'warm_up_vector_memory',
 
     # Auto-knowledge extraction
     'detect_and_store',
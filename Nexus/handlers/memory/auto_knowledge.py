@@ -5,10 +5,11 @@
 # META DATA HEADER
 # Name: auto_knowledge.py - Autonomous knowledge extraction from conversation
 # Date: 2026-02-18
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: Nexus/handlers/memory
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Stored facts also queued to vector memory (background write)
 #   - v1.0.0 (2026-02-18): Initial build from v1 nexus.py auto-learn patterns
 #
 # CODE STANDARDS:
@@ -26,7 +27,8 @@
 - Fact patterns: When user explicitly marks important info
 - Memory search: Detects recall intent ("remember when...")
 
-Integrates with knowledge_base.add_entry() for storage.
+Integrates with knowledge_base.add_entry() for storage; facts are also
+queued to vector memory so memory search can recall them.
 """
 
 import sys
@@ -260,7 +262,7 @@ def _detect_learn_command(user_input: str) -> Optional[str]:
 
 
 def _store_fact(fact: str, source: str) -> None:
-    """Store a fact in the knowledge base.
+    """Store a fact in the knowledge base and queue it for vector memory.
 
     Args:
         fact:   The fact text to store.
@@ -272,3 +274,9 @@ def _store_fact(fact: str, source: str) -> None:
         logger.info("Stored knowledge [%s]: %s", source, fact[:80])
     except Exception as exc:
         logger.warning("Failed to store knowledge: %s", exc)
+
+    try:
+        from handlers.memory.vector_memory import store_memory
+        store_memory(fact, {"source": source})  # queued - embedding happens off the chat loop
+    except Exception as exc:
+        logger.warning("Failed to queue vector memory: %s", exc)
@@ -1,81 +1,307 @@
 #!/home/aipass/.venv/bin/python3
 # -*- coding: utf-8 -*-
-"""Vector memory wrapper for Nexus v2 - uses Memory Bank's ChromaDB subprocess"""
+"""Vector memory for Nexus v2 - long-lived ChromaDB backend with background warm-up and batched writes
 
+One backend per Nexus session instead of one subprocess per operation:
+- in-process when chromadb and sentence-transformers import here,
+- otherwise a vector_worker.py process under Memory Bank's venv (JSON lines over a pipe).
+
+warm_up() loads it on a background thread. store_memory() only queues the
+text; a writer thread embeds and adds queued memories in batches, so chat
+replies never wait on embedding. Searches and counts see queued writes.
+"""
+
+import atexit
+import importlib.util
 import json
-import sys
+import logging
+import queue
+import selectors
 import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 AIPASS_ROOT = Path.home() / "aipass_core"
 sys.path.insert(0, str(AIPASS_ROOT))
 
-# Memory Bank ChromaDB subprocess paths
+logger = logging.getLogger("nexus.vector_memory")
+
+# Memory Bank's venv has the ChromaDB-compatible Python
 MEMORY_BANK_VENV_PYTHON = Path.home() / "MEMORY_BANK" / ".venv" / "bin" / "python3"
-CHROMA_SUBPROCESS_SCRIPT = Path.home() / "MEMORY_BANK" / "apps" / "handlers" / "storage" / "chroma_subprocess.py"
+VECTOR_WORKER_SCRIPT = Path(__file__).resolve().parent / "vector_worker.py"
 
-COLLECTION_NAME = "nexus_memories"
+REQUEST_TIMEOUT = 30          # seconds per backend request
+WARM_UP_TIMEOUT = 120         # first embedding model load may download weights
+READ_WAIT_SECONDS = 30        # how long a search/count waits for warm-up and queued writes
+WRITE_BATCH_SIZE = 32         # memories per add request
+EXIT_FLUSH_SECONDS = 5        # pending writes flushed at interpreter exit
 
-def _call_chroma_subprocess(operation: str, **kwargs) -> dict:
-    """Call Memory Bank's ChromaDB subprocess with JSON I/O."""
-    if not MEMORY_BANK_VENV_PYTHON.exists():
-        return {"error": "Memory Bank venv not found", "success": False}
-
-    if not CHROMA_SUBPROCESS_SCRIPT.exists():
-        return {"error": "ChromaDB subprocess script not found", "success": False}
-
-    try:
-        # Build request
-        request = {
-            "operation": operation,
-            "collection": COLLECTION_NAME,
-            **kwargs
-        }
-
-        # Call subprocess
-        result = subprocess.run(
-            [str(MEMORY_BANK_VENV_PYTHON), str(CHROMA_SUBPROCESS_SCRIPT)],
-            input=json.dumps(request),
-            capture_output=True,
-            text=True,
-            timeout=30
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+class _InProcessBackend:
+    """vector_worker.handle_request() in this interpreter"""
+
+    def __init__(self):
+        from .vector_worker import handle_request
+        self._handle = handle_request
+        self._lock = threading.Lock()
+        self.alive = True
+
+    def request(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        with self._lock:
+            return self._handle(payload)
+
+    def close(self) -> None:
+        self.alive = False
+
+
+class _WorkerProcess:
+    """vector_worker.py running under another Python, one JSON line per request/response"""
+
+    def __init__(self, command: list):
+        self._proc = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, bufsize=1
         )
+        self._lock = threading.Lock()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._proc.stdout, selectors.EVENT_READ)
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def request(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        with self._lock:
+            if not self.alive:
+                return {"success": False, "error": "Vector worker exited"}
+            try:
+                self._proc.stdin.write(json.dumps(payload) + "\n")
+                self._proc.stdin.flush()
+                if not self._selector.select(timeout):
+                    # State unknown after a timeout - stop the worker, the next warm_up() restarts it
+                    self.close()
+                    return {"success": False, "error": "Vector worker timeout"}
+                line = self._proc.stdout.readline()
+            except (OSError, ValueError) as e:
+                return {"success": False, "error": f"Vector worker error: {e}"}
+        if not line:
+            return {"success": False, "error": "Vector worker exited"}
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as e:
+            return {"success": False, "error": f"Invalid JSON response: {e}"}
+
+    def close(self) -> None:
+        if self.alive:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+        self._selector.close()
+
+
+def _start_backend():
+    """In-process if the libraries import here, else a worker under Memory Bank's venv."""
+    if importlib.util.find_spec("chromadb") and importlib.util.find_spec("sentence_transformers"):
+        return _InProcessBackend()
+    if not MEMORY_BANK_VENV_PYTHON.exists():
+        logger.info("Vector memory unavailable: Memory Bank venv not found")
+        return None
+    return _WorkerProcess([str(MEMORY_BANK_VENV_PYTHON), str(VECTOR_WORKER_SCRIPT)])
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+class VectorMemoryService:
+    """Owns the backend, its warm-up thread and the batched write queue."""
 
-        if result.returncode != 0:
-            return {"error": f"Subprocess failed: {result.stderr}", "success": False}
+    def __init__(self, backend_factory: Optional[Callable[[], Any]] = None):
+        self._factory = backend_factory or _start_backend
+        self._backend = None
+        self._error = "not started"
+        self._opened = threading.Event()   # collection open - counts can run
+        self._ready = threading.Event()    # embedding model loaded - adds/queries can run
+        self._warm_lock = threading.Lock()
+        self._warm_thread = None
+        self._writes: "queue.Queue" = queue.Queue()
+        self._writer = None
+        self._pending = 0
+        self._idle = threading.Condition()
+        self.stats = {"open_ms": None, "warm_ms": None, "batches": 0, "stored": 0, "failed": 0}
 
-        # Parse response
-        return json.loads(result.stdout)
+    # --- warm-up ---
+
+    def warm_up(self) -> None:
+        """Start loading the backend on a background thread (no-op once started)."""
+        with self._warm_lock:
+            if self._warm_thread is not None:
+                return
+            self._warm_thread = threading.Thread(target=self._warm, name="nexus-vector-warmup", daemon=True)
+            self._warm_thread.start()
+
+    def _warm(self) -> None:
+        start = time.perf_counter()
+        backend = None
+        warmed = False
+        try:
+            backend = self._factory()
+            if backend is None:
+                self._error = "no vector backend available"
+                return
+            result = backend.request({"operation": "count"}, WARM_UP_TIMEOUT)
+            if not result.get("success"):
+                self._error = result.get("error", "open failed")
+                return
+            self._backend = backend
+            self.stats["open_ms"] = (time.perf_counter() - start) * 1000
+            self._opened.set()
+
+            result = backend.request({"operation": "warm"}, WARM_UP_TIMEOUT)
+            if not result.get("success"):
+                self._error = result.get("error", "warm-up failed")
+                return
+            warmed = True
+            self.stats["warm_ms"] = (time.perf_counter() - start) * 1000
+            logger.info("Vector memory warm in %.0f ms", self.stats["warm_ms"])
+        except Exception as e:
+            self._error = f"warm-up error: {e}"
+        finally:
+            if not warmed:
+                logger.warning("Vector memory unavailable: %s", self._error)
+                self._backend = None
+                if backend is not None:
+                    backend.close()
+            self._opened.set()
+            self._ready.set()
+
+    def _reset(self) -> None:
+        """Forget a dead backend so the next request starts a new one."""
+        with self._warm_lock:
+            if self._warm_thread is None or self._warm_thread.is_alive():
+                return
+            self._backend = None
+            self._opened.clear()
+            self._ready.clear()
+            self._warm_thread = None
+
+    def _request(self, payload: Dict[str, Any], wait: float, needs_model: bool = True) -> Dict[str, Any]:
+        self.warm_up()
+        if not (self._ready if needs_model else self._opened).wait(wait):
+            return {"success": False, "error": "Vector memory still warming up"}
+        backend = self._backend
+        if backend is None:
+            return {"success": False, "error": self._error}
+        result = backend.request(payload, REQUEST_TIMEOUT)
+        if not backend.alive:
+            self._reset()
+        return result
+
+    # --- writes ---
+
+    def store(self, text: str, metadata: Optional[dict] = None) -> bool:
+        """Queue a memory for the writer thread."""
+        if not text or not text.strip():
+            return False
+        if self._ready.is_set() and self._backend is None:
+            return False  # backend known to be unavailable this session
+        with self._idle:
+            self._pending += 1
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="nexus-vector-writer", daemon=True)
+                self._writer.start()
+        self._writes.put((text, metadata))
+        return True
+
+    def _write_loop(self) -> None:
+        while True:
+            # Whatever queued up while the previous batch (or warm-up) was running goes together
+            batch = [self._writes.get()]
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+
+            result = self._request({
+                "operation": "add",
+                "documents": [text for text, _ in batch],
+                "metadatas": [metadata for _, metadata in batch],
+            }, WARM_UP_TIMEOUT)
+            if result.get("success"):
+                self.stats["batches"] += 1
+                self.stats["stored"] += len(batch)
+            else:
+                self.stats["failed"] += len(batch)
+                logger.warning("Vector memory write failed (%d dropped): %s", len(batch), result.get("error"))
+
+            with self._idle:
+                self._pending -= len(batch)
+                self._idle.notify_all()
+
+    def flush(self, timeout: float = READ_WAIT_SECONDS) -> bool:
+        """Wait until every queued memory has been written (or dropped)."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    # --- reads ---
+
+    def search(self, query: str, n: int = 5) -> Dict[str, Any]:
+        deadline = time.monotonic() + READ_WAIT_SECONDS
+        self.flush(READ_WAIT_SECONDS)
+        return self._request({"operation": "query", "query_texts": [query], "n_results": n},
+                             max(0.0, deadline - time.monotonic()))
+
+    def count(self) -> Dict[str, Any]:
+        deadline = time.monotonic() + READ_WAIT_SECONDS
+        self.flush(READ_WAIT_SECONDS)
+        return self._request({"operation": "count"}, max(0.0, deadline - time.monotonic()),
+                             needs_model=False)
+
+    def close(self, timeout: float = EXIT_FLUSH_SECONDS) -> None:
+        """Flush pending writes, then stop the backend."""
+        if self._pending:
+            self.flush(timeout)
+        backend = self._backend
+        if backend is not None:
+            backend.close()
+
+
+_service = VectorMemoryService()
+atexit.register(_service.close)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def warm_up() -> None:
+    """Start loading the vector backend in the background (call at startup)."""
+    _service.warm_up()
 
-    except subprocess.TimeoutExpired:
-        return {"error": "Subprocess timeout", "success": False}
-    except json.JSONDecodeError as e:
-        return {"error": f"Invalid JSON response: {e}", "success": False}
-    except Exception as e:
-        return {"error": f"Subprocess error: {e}", "success": False}
 
 def store_memory(text: str, metadata: Optional[dict] = None) -> bool:
-    """Store a memory in vector database."""
-    result = _call_chroma_subprocess(
-        "add",
-        documents=[text],
-        metadatas=[metadata] if metadata else None
-    )
+    """Queue a memory for a batched background write. Returns True once queued."""
+    return _service.store(text, metadata)
 
-    if not result.get("success", False):
-        # Graceful fallback - log but don't crash
-        return False
 
-    return True
+def flush_memories(timeout: float = READ_WAIT_SECONDS) -> bool:
+    """Wait for queued memories to be written. Returns False on timeout."""
+    return _service.flush(timeout)
+
 
 def search_memories(query: str, n: int = 5) -> list:
     """Search vector memories by semantic similarity."""
-    result = _call_chroma_subprocess(
-        "query",
-        query_texts=[query],
-        n_results=n
-    )
+    result = _service.search(query, n)
 
     if not result.get("success", False):
         # Graceful fallback - return empty list
@@ -84,20 +310,23 @@ def search_memories(query: str, n: int = 5) -> list:
     # Extract documents from response
     documents = result.get("documents", [[]])[0] if result.get("documents") else []
     metadatas = result.get("metadatas", [[]])[0] if result.get("metadatas") else []
+    distances = result.get("distances", [[]])[0] if result.get("distances") else []
 
     # Combine documents and metadata
     results = []
     for i, doc in enumerate(documents):
         results.append({
             "text": doc,
-            "metadata": metadatas[i] if i < len(metadatas) else {}
+            "metadata": metadatas[i] if i < len(metadatas) else {},
+            "distance": distances[i] if i < len(distances) else None
         })
 
     return results
 
+
 def get_memory_count() -> int:
     """Get count of stored vector memories."""
-    result = _call_chroma_subprocess("count")
+    result = _service.count()
 
     if not result.get("success", False):
         # Graceful fallback - return 0
@@ -0,0 +1,162 @@
+#!/home/aipass/MEMORY_BANK/.venv/bin/python3
+# -*- coding: utf-8 -*-
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: vector_worker.py - Long-lived ChromaDB worker for Nexus vector memory
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: Nexus/handlers/memory
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial - one process per Nexus session, JSON lines
+#     over stdin/stdout, chromadb + embedding model loaded once
+#
+# CODE STANDARDS:
+#   - Runs under Memory Bank's venv (ChromaDB compatible Python)
+#   - Errors returned as {"success": False, "error": ...}, never raised
+#   - Importable: handle_request() is also used in-process
+# =============================================
+
+"""
+Vector Worker - Memory Bank ChromaDB access for Nexus.
+
+Started once per Nexus session by vector_memory.py. Each request is one
+JSON line on stdin, each response one JSON line on stdout:
+
+    {"operation": "warm"}                                 -> {"success", "count"}
+    {"operation": "add", "documents", "metadatas"}        -> {"success", "added"}
+    {"operation": "query", "query_texts", "n_results"}    -> {"success", "documents", "metadatas", "distances"}
+    {"operation": "count"}                                -> {"success", "count"}
+
+Embeddings come from Memory Bank's embedder (all-MiniLM-L6-v2) and the
+collection from its shared ChromaDB client, so both are loaded on the
+first request and reused for the life of the process.
+"""
+
+import sys
+import json
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Memory Bank imports resolve from home (same as chroma_subprocess.py)
+sys.path.insert(0, str(Path.home()))
+
+COLLECTION_NAME = "nexus_memories"
+
+_collection = None
+
+
+def _get_collection():
+    """Open (or create) the Nexus collection once per process."""
+    global _collection
+    if _collection is None:
+        from MEMORY_BANK.apps.handlers.symbolic.chroma_client import get_collection
+
+        result = get_collection(COLLECTION_NAME)
+        if not result.get("success"):
+            raise RuntimeError(result.get("error", "collection unavailable"))
+        _collection = result["collection"]
+    return _collection
+
+
+def _embed(texts: List[str]) -> List[List[float]]:
+    """Embed texts with Memory Bank's singleton embedding model."""
+    from MEMORY_BANK.apps.handlers.vector.embedder import encode_batch
+
+    result = encode_batch(texts)
+    if not result.get("success"):
+        raise RuntimeError(result.get("error", "embedding failed"))
+    return [emb.tolist() if hasattr(emb, "tolist") else list(emb) for emb in result["embeddings"]]
+
+
+def _clean_metadata(metadata: Any) -> Dict[str, Any]:
+    """ChromaDB metadata must be a non-empty dict of str/int/float/bool."""
+    clean = {"source": "nexus", "stored_at": datetime.now().isoformat(timespec="seconds")}
+    for key, value in (metadata or {}).items():
+        if value is None:
+            continue
+        clean[str(key)] = value if isinstance(value, (str, int, float, bool)) else str(value)
+    return clean
+
+
+def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one vector memory operation.
+
+    Args:
+        request: {"operation": ..., **params}
+
+    Returns:
+        Result dict with "success" and operation-specific fields.
+    """
+    operation = request.get("operation")
+    try:
+        if operation == "warm":
+            collection = _get_collection()
+            _embed(["warm up"])
+            return {"success": True, "count": collection.count()}
+
+        if operation == "count":
+            return {"success": True, "count": _get_collection().count()}
+
+        if operation == "add":
+            documents = [d for d in request.get("documents") or [] if d]
+            if not documents:
+                return {"success": True, "added": 0}
+            metadatas = list(request.get("metadatas") or [])
+            metadatas += [None] * (len(documents) - len(metadatas))
+            _get_collection().add(
+                ids=[uuid.uuid4().hex for _ in documents],
+                embeddings=_embed(documents),
+                documents=documents,
+                metadatas=[_clean_metadata(m) for m in metadatas],
+            )
+            return {"success": True, "added": len(documents)}
+
+        if operation == "query":
+            collection = _get_collection()
+            query_texts = request.get("query_texts") or []
+            n_results = min(int(request.get("n_results", 5)), collection.count())
+            if not query_texts or n_results <= 0:
+                return {"success": True, "documents": [[]], "metadatas": [[]], "distances": [[]]}
+            result = collection.query(
+                query_embeddings=_embed(query_texts),
+                n_results=n_results,
+                include=["documents", "metadatas", "distances"],
+            )
+            return {
+                "success": True,
+                "documents": result.get("documents") or [[]],
+                "metadatas": result.get("metadatas") or [[]],
+                "distances": result.get("distances") or [[]],
+            }
+
+        return {"success": False, "error": f"Unknown operation: {operation}"}
+
+    except Exception as e:
+        return {"success": False, "error": f"{operation} failed: {e}"}
+
+
+def main():
+    """Serve JSON-line requests until stdin closes."""
+    # Library output (model download progress, warnings) must not corrupt the protocol
+    out = sys.stdout
+    sys.stdout = sys.stderr
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = {"success": False, "error": f"Invalid JSON request: {e}"}
+        else:
+            response = handle_request(request)
+        out.write(json.dumps(response, default=str) + "\n")
+        out.flush()
+
+
+if __name__ == "__main__":
+    main()
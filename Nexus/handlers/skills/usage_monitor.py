@@ -17,7 +17,10 @@
 # Session-level tracking (mutable state)
 SESSION_STATS = {
     "requests": 0,
-    "session_start": datetime.now(timezone.utc).isoformat()
+    "session_start": datetime.now(timezone.utc).isoformat(),
+    "streamed": 0,
+    "ttft_ms_total": 0.0,
+    "last_ttft_ms": None
 }
 
 def _load_log():
@@ -36,13 +39,27 @@ def log_request():
     """Log an API request (called externally)"""
     SESSION_STATS["requests"] += 1
 
+def log_stream_timing(ttft_ms: Optional[float]):
+    """Record time to first token for a streamed reply (called externally)"""
+    if ttft_ms is None:
+        return
+    SESSION_STATS["streamed"] += 1
+    SESSION_STATS["ttft_ms_total"] += ttft_ms
+    SESSION_STATS["last_ttft_ms"] = ttft_ms
+
+def _avg_ttft_ms() -> Optional[float]:
+    if not SESSION_STATS["streamed"]:
+        return None
+    return SESSION_STATS["ttft_ms_total"] / SESSION_STATS["streamed"]
+
 def save_session_usage():
     """Save session usage to log (called on session end)"""
     log = _load_log()
     entry = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "session_start": SESSION_STATS["session_start"],
-        "requests": SESSION_STATS["requests"]
+        "requests": SESSION_STATS["requests"],
+        "avg_ttft_ms": _avg_ttft_ms()
     }
     log.insert(0, entry)
     _save_log(log)
@@ -60,6 +77,11 @@ def handle_request(user_input: str) -> Optional[str]:
         recent = log[:5] if log else []
 
         lines = [f"Session: {SESSION_STATS['requests']} API requests"]
+        avg_ttft = _avg_ttft_ms()
+        if avg_ttft is not None:
+            lines.append(f"Time to first token: avg {avg_ttft:.0f} ms, "
+                         f"last {SESSION_STATS['last_ttft_ms']:.0f} ms "
+                         f"({SESSION_STATS['streamed']} streamed replies)")
         if recent:
             lines.append(f"Recent sessions ({len(log)} total):")
             for entry in recent:
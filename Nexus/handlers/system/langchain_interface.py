@@ -5,10 +5,11 @@
 # META DATA HEADER
 # Name: langchain_interface.py - LangChain enhanced chat wrapper
 # Date: 2026-02-18
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: Nexus/handlers/system
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): langchain_enhanced_chat_stream() - token deltas via client.stream()
 #   - v1.0.0 (2026-02-18): Initial build with LangChain OpenAI wrapper
 #
 # CODE STANDARDS:
@@ -21,13 +22,14 @@
 
 Provides LangChain-based chat with message conversion, token estimation,
 and actual usage logging. Returns None on failure so callers can fall
-back to the direct LLM client.
+back to the direct LLM client. langchain_enhanced_chat_stream() yields
+the reply as token deltas instead.
 """
 
 import sys
 import logging
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Iterator
 
 AIPASS_ROOT = Path.home() / "aipass_core"
 sys.path.insert(0, str(AIPASS_ROOT))
@@ -176,6 +178,57 @@ def langchain_enhanced_chat(  # noqa: ARG001 - temperature kept for API consiste
         return None
 
 
+def langchain_enhanced_chat_stream(  # noqa: ARG001 - temperature kept for API consistency
+    provider: str,
+    client: Any,
+    model: str,
+    messages: list,
+    temperature: float = 0.7,
+) -> Optional[Iterator[str]]:
+    """Stream a reply through the LangChain pipeline as text deltas.
+
+    Same checks as langchain_enhanced_chat(). Returns None when LangChain
+    cannot be used, so the caller can fall back to llm_client.chat_stream().
+    Errors raised while iterating propagate to the caller.
+
+    Args:
+        provider:    Provider name (currently only 'openai').
+        client:      LangChain client from make_langchain_client().
+        model:       Model identifier (for logging).
+        messages:    List of {"role": ..., "content": ...} dicts.
+        temperature: Sampling temperature (for logging).
+
+    Returns:
+        Iterator of text deltas, or None if unavailable.
+    """
+    if not LANGCHAIN_AVAILABLE or not LANGCHAIN_MESSAGES_AVAILABLE:
+        return None
+
+    if client is None:
+        logger.warning("LangChain client is None, cannot chat")
+        return None
+
+    if provider != "openai":
+        logger.warning("LangChain enhanced chat only supports openai, got '%s'", provider)
+        return None
+
+    return _stream_deltas(client, model, messages)
+
+
+def _stream_deltas(client: Any, model: str, messages: list) -> Iterator[str]:
+    """Yield content deltas from client.stream(), then log the token estimate."""
+    lc_messages = _convert_messages(messages)
+    parts = []
+    for chunk in client.stream(lc_messages):
+        content = getattr(chunk, "content", "")
+        if isinstance(content, str) and content:
+            parts.append(content)
+            yield content
+
+    # Token estimate over the assembled reply (same shape as an invoke() response)
+    _log_token_estimate(model, messages, AIMessage(content="".join(parts)))  # type: ignore[misc]
+
+
 # ---------------------------------------------------------------------------
 # Message conversion
 # ---------------------------------------------------------------------------
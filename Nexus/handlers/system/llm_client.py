@@ -5,10 +5,13 @@
 # META DATA HEADER
 # Name: llm_client.py - Multi-provider LLM client with unified chat interface
 # Date: 2026-02-18
-# Version: 2.1.0
+# Version: 2.2.1
 # Category: Nexus/handlers/system
 #
 # CHANGELOG (Max 5 entries):
+#   - v2.2.1 (2026-10-18): Anthropic gets every system message (merged), Gemini is
+#     sent the last user message - mid-conversation context messages no longer lost
+#   - v2.2.0 (2026-10-18): Streaming chat_stream() with time-to-first-token metrics
 #   - v2.1.0 (2026-02-18): Multi-provider support (OpenAI, Anthropic, Mistral, Google)
 #   - v2.0.0 (2026-02-08): OpenAI-only client with make_client/chat interface
 #
@@ -23,13 +26,18 @@
 Supports OpenAI, Anthropic, Mistral, and Google Gemini with graceful
 degradation when SDKs aren't installed. Provider auto-detection from
 model names.
+
+chat() returns the complete reply; chat_stream() yields text deltas as
+they arrive (native streaming for OpenAI and Anthropic, one delta for
+Mistral and Google) and records time to first token.
 """
 
 import sys
 import os
 import logging
+import time
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Iterable, Iterator
 
 AIPASS_ROOT = Path.home() / "aipass_core"
 sys.path.insert(0, str(AIPASS_ROOT))
@@ -234,13 +242,7 @@ def chat(
     # --- Anthropic ---
     if provider == "anthropic":
         # Anthropic expects system message separately
-        system_msg = None
-        chat_messages = []
-        for msg in messages:
-            if msg["role"] == "system":
-                system_msg = msg["content"]
-            else:
-                chat_messages.append(msg)
+        system_msg, chat_messages = _split_system(messages)
 
         kwargs = {
             "model": model,
@@ -266,12 +268,15 @@ def chat(
     # --- Google Gemini ---
     if provider == "google":
         mdl = client.GenerativeModel(model)
-        # Convert messages: Gemini expects a different format
+        # Convert messages: Gemini expects a different format. The last user
+        # message is sent; context messages after it stay in the history.
+        last_user = max((i for i, msg in enumerate(messages) if msg["role"] == "user"),
+                        default=len(messages) - 1)
         history = []
         last_content = ""
-        for msg in messages:
+        for i, msg in enumerate(messages):
             role = "user" if msg["role"] in ("user", "system") else "model"
-            if msg == messages[-1]:
+            if i == last_user:
                 last_content = msg["content"]
             else:
                 history.append({"role": role, "parts": [msg["content"]]})
@@ -282,6 +287,127 @@ def chat(
     raise ValueError(f"Unknown provider: {provider}")
 
 
+def _split_system(messages: list) -> tuple:
+    """(system text, other messages) for APIs that take the system prompt separately.
+
+    Every system message is kept - context injected mid-conversation is appended
+    to the system prompt in order rather than replacing it.
+    """
+    system_parts = [msg["content"] for msg in messages if msg["role"] == "system" and msg["content"]]
+    chat_messages = [msg for msg in messages if msg["role"] != "system"]
+    return "\n\n".join(system_parts) or None, chat_messages
+
+
+# ---------------------------------------------------------------------------
+# Streaming chat interface
+# ---------------------------------------------------------------------------
+
+def chat_stream(
+    client: Any,
+    messages: list,
+    model: str = "gpt-4.1",
+    temperature: float = 0.7,
+    provider: Optional[str] = None,
+    stats: Optional[dict] = None,
+) -> Iterator[str]:
+    """Send messages to an LLM and yield the response text as it arrives.
+
+    Same arguments as chat(). OpenAI and Anthropic stream natively;
+    Mistral and Google yield the complete reply as a single delta.
+    Joining the deltas gives the reply chat() would return, before strip().
+
+    Args:
+        client:      SDK client returned by make_client().
+        messages:    List of {"role": ..., "content": ...} dicts.
+        model:       Model identifier.
+        temperature: Sampling temperature.
+        provider:    Explicit provider name. Auto-detected if None.
+        stats:       Optional dict filled with ttft_ms, total_ms, chars, chunks.
+    """
+    if provider is None:
+        provider = _detect_provider_from_client(client)
+
+    return timed_stream(
+        _provider_deltas(client, messages, model, temperature, provider),
+        stats=stats,
+        label=f"{provider}:{model}",
+    )
+
+
+def _provider_deltas(client: Any, messages: list, model: str,
+                     temperature: float, provider: str) -> Iterator[str]:
+    """Yield raw text deltas from the provider's streaming API."""
+    # --- OpenAI ---
+    if provider == "openai":
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+        return
+
+    # --- Anthropic ---
+    if provider == "anthropic":
+        system_msg, chat_messages = _split_system(messages)
+
+        kwargs = {
+            "model": model,
+            "messages": chat_messages,
+            "temperature": temperature,
+            "max_tokens": 4096,
+            "stream": True,
+        }
+        if system_msg:
+            kwargs["system"] = system_msg
+
+        for event in client.messages.create(**kwargs):
+            if event.type == "content_block_delta" and getattr(event.delta, "type", "") == "text_delta":
+                yield event.delta.text
+        return
+
+    # --- Mistral / Google: no incremental API wired up, one complete delta ---
+    if provider in ("mistral", "google"):
+        yield chat(client, messages, model=model, temperature=temperature, provider=provider)
+        return
+
+    raise ValueError(f"Unknown provider: {provider}")
+
+
+def timed_stream(deltas: Iterable[str], stats: Optional[dict] = None,
+                 label: str = "") -> Iterator[str]:
+    """Pass deltas through, recording time to first token and total time.
+
+    The clock starts when the first delta is requested (which is when the
+    request is sent for a lazy provider stream). Empty deltas are dropped.
+
+    Args:
+        deltas: Iterable of text deltas.
+        stats:  Optional dict filled with ttft_ms, total_ms, chars, chunks.
+        label:  Provider/model label for logs.
+    """
+    stats = stats if stats is not None else {}
+    stats.update(ttft_ms=None, total_ms=None, chars=0, chunks=0)
+    start = time.perf_counter()
+    try:
+        for delta in deltas:
+            if not delta:
+                continue
+            if stats["ttft_ms"] is None:
+                stats["ttft_ms"] = (time.perf_counter() - start) * 1000
+            stats["chars"] += len(delta)
+            stats["chunks"] += 1
+            yield delta
+    finally:
+        stats["total_ms"] = (time.perf_counter() - start) * 1000
+        if stats["ttft_ms"] is not None:
+            logger.info("Stream [%s]: first token %.0f ms, complete %.0f ms, %d chars",
+                        label, stats["ttft_ms"], stats["total_ms"], stats["chars"])
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -5,10 +5,14 @@
 # META DATA HEADER
 # Name: prompt_builder.py - System prompt builder with memory injection
 # Date: 2026-02-18
-# Version: 2.0.0
+# Version: 2.2.0
 # Category: Nexus/handlers/system
 #
 # CHANGELOG (Max 5 entries):
+#   - v2.2.0 (2026-10-18): Clock moved out of the system prompt (build_turn_context),
+#     cortex change times absolute - the prompt only changes with its sources
+#   - v2.1.0 (2026-10-18): Cached prompt sections keyed on source file signatures,
+#     per-section token estimates (build_cached_prompt, get_prompt_stats)
 #   - v2.0.0 (2026-02-18): Rich prompt with memory, cortex, execution layers
 #   - v1.0.0 (2026-02-08): Initial lean identity-only prompt builder
 #
@@ -24,12 +28,19 @@
 Two modes:
 - build_system_prompt(): Lean identity-only prompt (original)
 - build_rich_prompt(): Full prompt with identity + session + memory + cortex + execution
+- build_cached_prompt(): Same rich prompt from cached sections - each section is
+  re-rendered only when its source file (profile, pulse, knowledge, summaries,
+  cortex) changes, so unchanged sections cost a stat() per turn
+- build_turn_context(): The current time, sent with the latest user message on
+  each call so the system prompt stays byte-identical between turns (prefix caching)
 
 V1 dumped everything (10k+). V2 lean was too sparse (444). This is the middle ground.
 """
 
+import importlib
 import json
 import logging
+import time
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional, Dict, List, Any
@@ -179,7 +190,6 @@ def _build_session_section(memory_context: dict) -> str:
             lines.append(f"Ticks this session: {ticks}")
     if total_sessions is not None:
         lines.append(f"Total sessions: {total_sessions}")
-    lines.append(f"Current time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
     return "\n".join(lines)
 
 
@@ -239,42 +249,184 @@ def _build_shorthand_section(profile: dict) -> str:
 
 # ─── Convenience: gather context from subsystems ─────────────────
 
-def gather_memory_context() -> Dict[str, Any]:
-    """Collect memory context from all subsystems. Local imports for safety."""
-    context: Dict[str, Any] = {}
+def _gather_pulse() -> Dict[str, Any]:
+    """Pulse tick and session counters."""
     try:
         from handlers.memory.pulse_manager import get_pulse_data
         pulse = get_pulse_data()
-        context['pulse_tick'] = pulse.get('current_tick')
-        context['total_sessions'] = pulse.get('total_sessions')
-        context['session_start_tick'] = pulse.get('session_start_tick')
+        return {
+            'pulse_tick': pulse.get('current_tick'),
+            'total_sessions': pulse.get('total_sessions'),
+            'session_start_tick': pulse.get('session_start_tick'),
+        }
     except Exception as e:
         logger.info(f"Pulse data unavailable: {e}")
+        return {}
+
+
+def _gather_knowledge() -> Dict[str, Any]:
+    """Most recent knowledge entries."""
     try:
         from handlers.memory.knowledge_base import get_recent
-        context['recent_knowledge'] = get_recent(MAX_KNOWLEDGE_ENTRIES)
+        return {'recent_knowledge': get_recent(MAX_KNOWLEDGE_ENTRIES)}
     except Exception as e:
         logger.info(f"Knowledge base unavailable: {e}")
+        return {}
+
+
+def _gather_summaries() -> Dict[str, Any]:
+    """Last session summaries, one line each."""
     try:
         from handlers.memory.summary import get_context_summary
         summary_text = get_context_summary(MAX_SUMMARIES)
         if summary_text:
-            context['session_summaries'] = summary_text.split("\n")
+            return {'session_summaries': summary_text.split("\n")}
     except Exception as e:
         logger.info(f"Session summaries unavailable: {e}")
+    return {}
+
+
+def gather_memory_context() -> Dict[str, Any]:
+    """Collect memory context from all subsystems. Local imports for safety."""
+    context: Dict[str, Any] = {}
+    context.update(_gather_pulse())
+    context.update(_gather_knowledge())
+    context.update(_gather_summaries())
     return context
 
 
 def gather_cortex_block() -> str:
-    """Get cortex block from summarizer."""
+    """Get cortex block from summarizer (absolute change times - stable between turns)."""
     try:
         from handlers.cortex.summarizer import get_cortex_block
-        return get_cortex_block()
+        return get_cortex_block(relative_times=False)
     except Exception as e:
         logger.info(f"Cortex block unavailable: {e}")
         return ""
 
 
+# ─── Cached assembly ─────────────────────────────────────────────
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 tokens per 3 words)."""
+    return len(text.split()) * 4 // 3
+
+
+def _file_signature(path: Optional[Path]) -> Optional[tuple]:
+    """(mtime_ns, size, inode) of a source file; None if missing."""
+    if path is None:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _source_path(module: str, attr: str) -> Optional[Path]:
+    """Data file path of a memory/cortex handler (None if it can't be imported)."""
+    try:
+        return getattr(importlib.import_module(module), attr)
+    except Exception:
+        return None
+
+
+class PromptContextCache:
+    """Rendered prompt sections, each re-rendered only when its key changes.
+
+    A key is anything comparable - usually source file signatures.
+    """
+
+    def __init__(self):
+        self._sections: Dict[str, Dict[str, Any]] = {}
+
+    def section(self, name: str, key: Any, render) -> str:
+        """Cached text for `name`, calling `render()` only if `key` changed."""
+        entry = self._sections.get(name)
+        if entry is not None and entry['key'] == key:
+            entry['hits'] += 1
+            return entry['text']
+
+        start = time.perf_counter()
+        text = render()
+        self._sections[name] = {
+            'key': key,
+            'text': text,
+            'tokens': estimate_tokens(text),
+            'chars': len(text),
+            'builds': (entry['builds'] if entry else 0) + 1,
+            'hits': entry['hits'] if entry else 0,
+            'build_ms': (time.perf_counter() - start) * 1000,
+        }
+        return text
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-section tokens, chars, builds, hits and last build time."""
+        return {name: {k: v for k, v in entry.items() if k not in ('key', 'text')}
+                for name, entry in self._sections.items()}
+
+    def clear(self) -> None:
+        self._sections.clear()
+
+
+_context_cache = PromptContextCache()
+
+
+def build_cached_prompt(exec_summary: Optional[str] = None) -> str:
+    """Build the rich prompt, re-rendering only sections whose sources changed.
+
+    Same text as build_rich_prompt(memory_context=gather_memory_context(),
+    cortex_block=gather_cortex_block(), exec_summary=exec_summary). Nothing in
+    it depends on the clock - see build_turn_context().
+    """
+    profile_key = _file_signature(CONFIG_PATH)
+
+    def from_profile(builder_fn):
+        profile = load_profile()
+        return builder_fn(profile) if profile else ""
+
+    identity = _context_cache.section("identity", profile_key,
+                                      lambda: from_profile(_build_identity_section))
+    if not identity:
+        return "You are Nexus, an AI assistant."
+
+    pulse_path = _source_path("handlers.memory.pulse_manager", "DATA_PATH")
+    knowledge_path = _source_path("handlers.memory.knowledge_base", "DATA_PATH")
+    summary_path = _source_path("handlers.memory.summary", "DATA_PATH")
+    cortex_path = _source_path("handlers.cortex.summarizer", "CORTEX_PATH")
+
+    sections = [identity]
+    for name, key, render in [
+        ("session", _file_signature(pulse_path),
+         lambda: _build_session_section(_gather_pulse())),
+        ("knowledge", _file_signature(knowledge_path),
+         lambda: _build_knowledge_section(_gather_knowledge())),
+        ("memory", _file_signature(summary_path),
+         lambda: _build_memory_section(_gather_summaries())),
+        ("cortex", _file_signature(cortex_path),
+         lambda: _build_cortex_section(gather_cortex_block())),
+        ("execution", exec_summary,
+         lambda: _build_execution_section(exec_summary)),
+        ("shorthand", profile_key,
+         lambda: from_profile(_build_shorthand_section)),
+    ]:
+        section = _context_cache.section(name, key, render)
+        if section:
+            sections.append(section)
+
+    return "\n\n".join(sections)
+
+
+def build_turn_context() -> str:
+    """Per-call context kept out of the system prompt (sent with the latest user message)."""
+    return f"Current time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}"
+
+
+def get_prompt_stats() -> Dict[str, Dict[str, Any]]:
+    """Token estimate and cache counters per prompt section (from build_cached_prompt)."""
+    return _context_cache.stats()
+
+
 # ─── Test entry point ────────────────────────────────────────────
 
 if __name__ == "__main__":
@@ -286,5 +438,9 @@ def gather_cortex_block() -> str:
     cortex = gather_cortex_block()
     rich = build_rich_prompt(memory_context=memory_ctx, cortex_block=cortex)
     words = len(rich.split())
-    print("RICH:", len(rich), "chars |", words, "words | ~tokens:", words * 4 // 3)
+    print("RICH:", len(rich), "chars |", words, "words | ~tokens:", estimate_tokens(rich))
     print(rich)
+
+    build_cached_prompt()
+    for section, stats in get_prompt_stats().items():
+        print(f"  {section:<10} ~{stats['tokens']:>5} tokens  ({stats['build_ms']:.2f} ms to build)")
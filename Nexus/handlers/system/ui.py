@@ -4,6 +4,7 @@
 
 import sys
 from pathlib import Path
+from typing import Iterable
 
 AIPASS_ROOT = Path.home() / "aipass_core"
 sys.path.insert(0, str(AIPASS_ROOT))
@@ -42,6 +43,20 @@ def print_nexus_response(response: str):
     console.print()
     console.print(f"[bold magenta]Nexus:[/bold magenta] {response}")
 
+def print_nexus_stream(deltas: Iterable[str]) -> str:
+    """Print a streamed Nexus response as it arrives; return the assembled text"""
+    console.print()
+    console.print("[bold magenta]Nexus:[/bold magenta] ", end="")
+    parts = []
+    try:
+        for delta in deltas:
+            parts.append(delta)
+            console.print(delta, end="", markup=False, highlight=False, soft_wrap=True)
+            console.file.flush()
+    finally:
+        console.print()
+    return "".join(parts).strip()
+
 def print_error(message: str):
     """Print error message"""
     console.print(f"[red bold]Error:[/red bold] {message}")
@@ -5,15 +5,19 @@
 # META DATA HEADER
 # Name: nexus.py - Nexus conversational AI main chat loop
 # Date: 2026-02-18
-# Version: 3.0.0
+# Version: 3.3.1
 # Category: Nexus/apps
 #
 # CHANGELOG (Max 5 entries):
+#   - v3.3.1 (2026-10-18): Current time sent with the latest user message per call,
+#     system prompt only changes with its sources (provider prefix caching)
+#   - v3.3.0 (2026-10-18): System prompt refreshed every turn from cached sections
+#   - v3.2.0 (2026-10-18): Vector memory warmed in the background at startup
+#   - v3.1.0 (2026-10-18): Streamed replies - deltas rendered as they arrive,
+#     code extraction and auto-knowledge on the assembled reply, TTFT tracking
 #   - v3.0.0 (2026-02-18): Full v1 feature transfer - config-based provider,
 #     LangChain, rich prompt, cortex, execution engine, auto-knowledge,
 #     shorthand parsing, error recovery
-#   - v2.0.0 (2026-02-14): Basic chat loop with skills and memory
-#   - v1.0.0 (2026-02-08): Initial entry point
 #
 # CODE STANDARDS:
 #   - Graceful degradation: every component optional
@@ -53,7 +57,7 @@
 
 # System handlers (required)
 from handlers.system import ui
-from handlers.system.llm_client import make_client, chat
+from handlers.system.llm_client import make_client, chat_stream, timed_stream
 
 # Config loader (optional - falls back to default OpenAI)
 get_ready_config = None
@@ -67,11 +71,11 @@
 
 # LangChain (optional)
 make_langchain_client = None
-langchain_enhanced_chat = None
+langchain_enhanced_chat_stream = None
 lc_is_available = None
 try:
     from handlers.system.langchain_interface import (  # type: ignore[assignment]
-        make_langchain_client, langchain_enhanced_chat, is_available as lc_is_available
+        make_langchain_client, langchain_enhanced_chat_stream, is_available as lc_is_available
     )
     LANGCHAIN_AVAILABLE = True
 except ImportError:
@@ -79,14 +83,11 @@
     logger.info("LangChain interface unavailable")
 
 # Rich prompt builder
-build_rich_prompt = None
-gather_memory_context = None
-gather_cortex_block = None
+build_cached_prompt = None
+build_turn_context = None
 build_system_prompt = None
 try:
-    from handlers.system.prompt_builder import (  # type: ignore[assignment]
-        build_rich_prompt, gather_memory_context, gather_cortex_block
-    )
+    from handlers.system.prompt_builder import build_cached_prompt, build_turn_context  # type: ignore[assignment]
     RICH_PROMPT_AVAILABLE = True
 except ImportError:
     RICH_PROMPT_AVAILABLE = False
@@ -98,7 +99,7 @@
     save_session, get_session_count,
     start_session as start_pulse_session,
     load_knowledge, get_memory_count as get_vector_count,
-    search_memories
+    search_memories, warm_up_vector_memory
 )
 
 # Auto-knowledge extraction (optional)
@@ -125,6 +126,7 @@
 
 # Skills
 from handlers.skills import discover_skills, route_to_skill
+from handlers.skills.usage_monitor import log_request, log_stream_timing
 
 # Execution engine (optional)
 ExecutionContext = None
@@ -203,19 +205,35 @@ def _build_system_prompt(exec_context=None):
         Complete system prompt string.
     """
     if RICH_PROMPT_AVAILABLE:
-        memory_ctx = gather_memory_context()  # type: ignore[misc]
-        cortex_block = gather_cortex_block()  # type: ignore[misc]
+        # Sections are cached; only those whose source files changed are rebuilt
         exec_summary = exec_context.get_context_summary() if exec_context else None
-        return build_rich_prompt(  # type: ignore[misc]
-            memory_context=memory_ctx,
-            cortex_block=cortex_block,
-            exec_summary=exec_summary,
-        )
+        return build_cached_prompt(exec_summary=exec_summary)  # type: ignore[misc]
 
     # Fallback to lean prompt
     return build_system_prompt()  # type: ignore[misc]
 
 
+def _with_turn_context(messages, turn_context):
+    """Copy of messages with per-call context prepended to the latest user message.
+
+    A separate trailing system message would be dropped or misplaced by
+    providers that take one system prompt (Anthropic) or send only the last
+    message (Gemini); the user turn reaches every provider.
+
+    Args:
+        messages:      Current message list (not modified).
+        turn_context:  Text from build_turn_context().
+
+    Returns:
+        New message list for this call.
+    """
+    for i in range(len(messages) - 1, -1, -1):
+        if messages[i]["role"] == "user":
+            turn = {"role": "user", "content": f"[{turn_context}]\n{messages[i]['content']}"}
+            return messages[:i] + [turn] + messages[i + 1:]
+    return messages
+
+
 def _init_cortex():
     """Start cortex file watcher if available.
 
@@ -276,16 +294,15 @@ def _handle_memory_search(user_input, messages):
     return None  # Don't short-circuit — let LLM respond with context
 
 
-def _process_execution(user_input, exec_context, messages):
-    """Check for execution intent and run code if detected.
+def _detect_execution(user_input, exec_context):
+    """Check whether the user asked for code to be run.
 
     Args:
         user_input:   The user's message.
         exec_context: ExecutionContext instance.
-        messages:     Current message list (modified in place).
 
     Returns:
-        Execution result string to display, or None if not an execution request.
+        Intent dict if the reply's code should be executed, else None.
     """
     if not EXECUTION_AVAILABLE or exec_context is None:
         return None
@@ -297,18 +314,34 @@ def _process_execution(user_input, exec_context, messages):
     if intent.get("confidence", 0) < 0.5:
         return None
 
-    result = handle_execution_request(user_input, exec_context)  # type: ignore[misc]
-    if result and result.get("output"):
-        output = result["output"]
-        # Inject execution result into context for LLM awareness
-        messages.append({
-            "role": "system",
-            "content": f"Code execution result:\n```\n{output}\n```"
-        })
-        ui.print_status(f"[Execution] {intent['intent']}: {intent.get('detail', '')}")
-        return output
+    return intent
 
-    return None
+
+def _process_execution(user_input, response, intent, exec_context, messages):
+    """Extract code blocks from the assembled reply and run them.
+
+    Args:
+        user_input:   The user's message.
+        response:     Nexus's complete (assembled) response text.
+        intent:       Intent dict from _detect_execution().
+        exec_context: ExecutionContext instance.
+        messages:     Current message list (modified in place).
+
+    Returns:
+        Execution output string to display, or None if nothing ran.
+    """
+    result = handle_execution_request(user_input, response, exec_context)  # type: ignore[misc]
+    output = result.get("combined_output") if result else None
+    if not output:
+        return None
+
+    # Inject execution result into context for LLM awareness on the next turn
+    messages.append({
+        "role": "system",
+        "content": f"Code execution result:\n```\n{output}\n```"
+    })
+    ui.print_status(f"[Execution] {intent['intent']}: {intent.get('detail', '')}")
+    return output
 
 
 def _process_auto_knowledge(user_input, response):
@@ -349,10 +382,11 @@ def _get_tone_injection(user_input):
         return None
 
 
-def _send_to_llm(client, messages, model, temperature, provider, lc_client):
-    """Send messages to LLM with LangChain fallback.
+def _stream_llm_reply(client, messages, model, temperature, provider, lc_client):
+    """Stream the LLM reply to the terminal with LangChain fallback.
 
-    Tries LangChain first if available, falls back to direct client.
+    Tries LangChain first if available. If it fails before the first token,
+    falls back to the direct client; a failure mid-reply keeps what arrived.
 
     Args:
         client:      Direct SDK client.
@@ -363,21 +397,36 @@ def _send_to_llm(client, messages, model, temperature, provider, lc_client):
         lc_client:   LangChain client or None.
 
     Returns:
-        Response text string.
+        Tuple of (assembled response text, stats dict with ttft_ms/total_ms).
     """
-    # Try LangChain enhanced chat first
-    if LANGCHAIN_AVAILABLE and lc_client is not None:
-        try:
-            lc_response = langchain_enhanced_chat(  # type: ignore[misc]
-                provider, lc_client, model, messages, temperature
-            )
-            if lc_response:
-                return lc_response
-        except Exception as exc:
-            logger.warning("LangChain chat failed, falling back: %s", exc)
+    stats = {}
+    label = f"{provider}:{model}"
+
+    def deltas():
+        # Try LangChain enhanced chat first
+        if LANGCHAIN_AVAILABLE and lc_client is not None:
+            started = False
+            try:
+                lc_stream = langchain_enhanced_chat_stream(  # type: ignore[misc]
+                    provider, lc_client, model, messages, temperature
+                )
+                if lc_stream is not None:
+                    for delta in lc_stream:
+                        started = True
+                        yield delta
+                    if started:
+                        return
+            except Exception as exc:
+                if started:
+                    logger.warning("LangChain stream broke mid-reply: %s", exc)
+                    return
+                logger.warning("LangChain chat failed, falling back: %s", exc)
 
-    # Direct client
-    return chat(client, messages, model=model, temperature=temperature, provider=provider)
+        # Direct client
+        yield from chat_stream(client, messages, model=model, temperature=temperature, provider=provider)
+
+    response = ui.print_nexus_stream(timed_stream(deltas(), stats=stats, label=label))
+    return response, stats
 
 
 # ---------------------------------------------------------------------------
@@ -388,6 +437,9 @@ def main():
     """Start Nexus conversational AI chat loop."""
     ui.print_startup_banner()
 
+    # Load the vector backend while the provider and skills initialize
+    warm_up_vector_memory()
+
     # --- Pulse session ---
     pulse_data = start_pulse_session()
     current_tick = pulse_data["current_tick"]
@@ -453,6 +505,13 @@ def main():
             # Add user message
             messages.append({"role": "user", "content": user_input})
 
+            # Refresh system prompt (cached sections - only changes when a source file does,
+            # so the provider's prefix cache survives between turns)
+            refreshed = _build_system_prompt(exec_context)
+            if refreshed != messages[0]["content"]:
+                messages[0] = {"role": "system", "content": refreshed}
+                logger.info("System prompt refreshed (%d chars)", len(refreshed))
+
             # Shorthand/tone detection — inject context if detected
             tone_ctx = _get_tone_injection(user_input)
             if tone_ctx:
@@ -461,33 +520,35 @@ def main():
             # Memory search — inject recalled memories if triggered
             _handle_memory_search(user_input, messages)
 
-            # Execution engine — run code if intent detected
-            exec_output = _process_execution(user_input, exec_context, messages)
-            if exec_output:
-                # Show execution output, but still get LLM commentary
-                ui.print_hint(f"[Output]\n{exec_output}")
+            # Execution engine — decide now, run the reply's code once assembled
+            exec_intent = _detect_execution(user_input, exec_context)
 
-            # Send to LLM
-            response = _send_to_llm(
-                client, messages, model, temperature, provider, lc_client
+            # Clock goes with this turn's user message, not into messages[0] or the history
+            request = messages
+            if RICH_PROMPT_AVAILABLE:
+                request = _with_turn_context(messages, build_turn_context())  # type: ignore[misc]
+
+            # Stream the LLM reply (printed as it arrives)
+            response, stream_stats = _stream_llm_reply(
+                client, request, model, temperature, provider, lc_client
             )
+            log_request()
+            log_stream_timing(stream_stats.get("ttft_ms"))
 
             # Add response to history
             messages.append({"role": "assistant", "content": response})
 
-            # Print response
-            ui.print_nexus_response(response)
+            # Code extraction on the assembled reply
+            if exec_intent:
+                exec_output = _process_execution(
+                    user_input, response, exec_intent, exec_context, messages
+                )
+                if exec_output:
+                    ui.print_hint(f"[Output]\n{exec_output}")
 
-            # Auto-knowledge extraction (post-response)
+            # Auto-knowledge extraction (post-response, assembled reply)
             _process_auto_knowledge(user_input, response)
 
-            # Refresh system prompt periodically (every 10 turns)
-            turn_count = sum(1 for m in messages if m["role"] == "user")
-            if turn_count % 10 == 0:
-                refreshed = _build_system_prompt(exec_context)
-                messages[0] = {"role": "system", "content": refreshed}
-                logger.info("System prompt refreshed at turn %d", turn_count)
-
         except KeyboardInterrupt:
             break
         except Exception as exc:
@@ -117,6 +117,15 @@ def test_cortex_time_ago():
     assert "d ago" in _format_time_ago(days, now)
 
 
+def test_cortex_change_time_absolute():
+    """_format_change_time renders the change time in UTC."""
+    from handlers.cortex.summarizer import _format_change_time
+
+    assert _format_change_time("2026-10-18T09:30:00+00:00") == "at 2026-10-18 09:30 UTC"
+    assert _format_change_time("2026-10-18T11:30:00+02:00") == "at 2026-10-18 09:30 UTC"
+    assert _format_change_time("not a time") == ""
+
+
 def test_cortex_session_reset():
     """reset_session_counters clears change counts."""
     from handlers.cortex.summarizer import reset_session_counters, load_cortex_data
@@ -0,0 +1,155 @@
+#!/home/aipass/.venv/bin/python3
+# -*- coding: utf-8 -*-
+"""Tests for cached rich prompt assembly (prompt_builder.build_cached_prompt)."""
+
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+NEXUS_DIR = Path(__file__).resolve().parent.parent
+if str(NEXUS_DIR) not in sys.path:
+    sys.path.insert(0, str(NEXUS_DIR))
+
+from handlers.system import prompt_builder as pb
+from handlers.memory import pulse_manager, knowledge_base, summary
+from handlers.cortex import summarizer
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    """Pulse, knowledge, summaries and cortex data in tmp_path; empty section cache"""
+    monkeypatch.setattr(pulse_manager, "DATA_PATH", tmp_path / "pulse.json")
+    monkeypatch.setattr(knowledge_base, "DATA_PATH", tmp_path / "knowledge_base.json")
+    monkeypatch.setattr(summary, "DATA_PATH", tmp_path / "session_summaries.json")
+    monkeypatch.setattr(summarizer, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(summarizer, "CORTEX_PATH", tmp_path / "cortex.json")
+    monkeypatch.setattr(pb, "_context_cache", pb.PromptContextCache())
+
+    pulse_manager.start_session()
+    knowledge_base.add_entry("Nexus runs on the AIPass branch system", source="user")
+    summary.save_summary("Set up the cortex watcher", 940, ["cortex"])
+    summarizer.save_cortex_data({"files": {
+        "watcher.py": {"summary": "Filesystem watcher", "last_change_type": "existing"},
+    }})
+    return tmp_path
+
+
+def _uncached(exec_summary=None):
+    return pb.build_rich_prompt(memory_context=pb.gather_memory_context(),
+                                cortex_block=pb.gather_cortex_block(), exec_summary=exec_summary)
+
+
+def _builds():
+    return {name: stats["builds"] for name, stats in pb.get_prompt_stats().items()}
+
+
+def test_cached_matches_uncached(sources):
+    """Cached assembly produces the same prompt as the uncached builder."""
+    assert pb.build_cached_prompt() == _uncached()
+    assert pb.build_cached_prompt("Variables: x") == _uncached("Variables: x")
+
+
+def test_unchanged_sections_not_rebuilt(sources):
+    """A second build with no source changes renders nothing."""
+    first = pb.build_cached_prompt()
+    builds = _builds()
+    assert pb.build_cached_prompt() == first
+    assert _builds() == builds
+    assert all(stats["hits"] == 1 for stats in pb.get_prompt_stats().values())
+
+
+def test_only_changed_section_rebuilt(sources):
+    """Changing one source re-renders just its section."""
+    pb.build_cached_prompt()
+    before = _builds()
+
+    knowledge_base.add_entry("Deployment target is Ubuntu 24.04", source="user")
+    prompt = pb.build_cached_prompt()
+    assert "Deployment target is Ubuntu 24.04" in prompt
+    assert prompt == _uncached()
+
+    after = _builds()
+    assert after["knowledge"] == before["knowledge"] + 1
+    assert {k: v for k, v in after.items() if k != "knowledge"} == \
+           {k: v for k, v in before.items() if k != "knowledge"}
+
+    pb.build_cached_prompt("Variables: df")
+    assert _builds()["execution"] == before["execution"] + 1
+
+
+def test_prompt_independent_of_clock(sources, monkeypatch):
+    """Recent cortex changes and the clock don't make the prompt differ between turns."""
+    summarizer.save_cortex_data({"files": {
+        "watcher.py": {"summary": "Filesystem watcher", "last_change_type": "modified",
+                       "last_change_time": "2026-10-18T09:30:00+00:00", "changes_this_session": 1},
+    }})
+    first = pb.build_cached_prompt()
+    assert "modified at 2026-10-18 09:30 UTC" in first
+    assert "Current time" not in first and " ago" not in first
+
+    # An hour later with no source changes: identical prompt, nothing re-rendered
+    later = datetime.now() + timedelta(hours=1)
+    monkeypatch.setattr(summarizer, "datetime", type("Later", (datetime,), {"now": staticmethod(lambda tz=None: later)}))
+    builds = _builds()
+    assert pb.build_cached_prompt() == first
+    assert _builds() == builds
+    assert pb.build_turn_context().startswith("Current time: ")
+
+
+def test_section_token_estimates(sources):
+    """Each section reports its own token estimate."""
+    prompt = pb.build_cached_prompt()
+    stats = pb.get_prompt_stats()
+    assert set(stats) == {"identity", "session", "knowledge", "memory", "cortex", "execution", "shorthand"}
+    assert stats["execution"]["tokens"] == 0
+    assert stats["knowledge"]["tokens"] == pb.estimate_tokens(pb._build_knowledge_section(pb._gather_knowledge()))
+    assert abs(sum(s["tokens"] for s in stats.values()) - pb.estimate_tokens(prompt)) <= len(stats)
+
+
+def test_turn_build_time(sources):
+    """Per-turn prompt build: uncached vs cached (unchanged and one-section change)."""
+    # Full-size sources: 200 knowledge entries, 10 summaries, 500 tracked files
+    knowledge_base.save_knowledge([
+        {"timestamp": "2026-10-18T00:00:00+00:00", "text": f"fact number {i} " + "detail " * 30, "source": "auto"}
+        for i in range(200)])
+    for i in range(10):
+        summary.save_summary(f"Session {i} " + "notes " * 80, 900 + i, ["topic"] * 5)
+    now = datetime.now().isoformat()
+    summarizer.save_cortex_data({"files": {
+        f"pkg/module_{i}.py": {"summary": "Module summary " * 10, "last_change_type": "modified" if i % 3 else "existing",
+                               "last_change_time": now, "changes_this_session": i % 4}
+        for i in range(500)}})
+    turns = 50
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        uncached = _uncached()
+    uncached_ms = (time.perf_counter() - start) * 1000 / turns
+
+    pb.build_cached_prompt()
+    start = time.perf_counter()
+    for _ in range(turns):
+        cached = pb.build_cached_prompt()
+    cached_ms = (time.perf_counter() - start) * 1000 / turns
+    assert cached == uncached
+
+    changed = 0.0
+    for i in range(turns):
+        knowledge_base.add_entry(f"new fact {i} for the knowledge section")
+        start = time.perf_counter()
+        pb.build_cached_prompt()
+        changed += time.perf_counter() - start
+    changed_ms = changed * 1000 / turns
+
+    tokens = {name: s["tokens"] for name, s in pb.get_prompt_stats().items()}
+    print(f"\nPrompt build per turn ({json.dumps(tokens)} tokens): uncached {uncached_ms:.2f} ms, "
+          f"cached unchanged {cached_ms:.3f} ms, knowledge changed {changed_ms:.2f} ms")
+    assert cached_ms * 10 < uncached_ms
+    assert changed_ms < uncached_ms
@@ -0,0 +1,247 @@
+#!/home/aipass/.venv/bin/python3
+# -*- coding: utf-8 -*-
+"""Tests for streamed chat (llm_client.chat_stream, ui.print_nexus_stream) against a local stub server."""
+
+import io
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+# Ensure Nexus root is on path
+NEXUS_DIR = Path(__file__).resolve().parent.parent
+if str(NEXUS_DIR) not in sys.path:
+    sys.path.insert(0, str(NEXUS_DIR))
+
+# llm_client loads ~/.env at import time; keep the test independent of it
+with patch.dict(sys.modules, {"dotenv": MagicMock()}):
+    from handlers.system import llm_client
+
+FIRST_TOKEN_DELAY = 0.05
+TOKEN_DELAY = 0.03
+REPLY_TOKENS = ["Here ", "is ", "the ", "listing:\n", "```python\n", "import os\n",
+                "print(sorted(os.listdir('.')))", "\n```\n", "Want ", "more?"]
+
+
+# ---------------------------------------------------------------------------
+# Stub OpenAI-compatible server
+# ---------------------------------------------------------------------------
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """/v1/chat/completions: SSE chunks when stream=true, one JSON body otherwise"""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if body.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            time.sleep(FIRST_TOKEN_DELAY)
+            self._event({"role": "assistant", "content": ""})
+            for token in REPLY_TOKENS:
+                self._event({"content": token})
+                time.sleep(TOKEN_DELAY)
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+            return
+
+        time.sleep(FIRST_TOKEN_DELAY + TOKEN_DELAY * len(REPLY_TOKENS))
+        payload = json.dumps({
+            "id": "stub", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": "".join(REPLY_TOKENS)}}],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _event(self, delta):
+        chunk = {"id": "stub", "object": "chat.completion.chunk", "created": 0, "model": "gpt-4.1",
+                 "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+        self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def openai_client():
+    """Real OpenAI SDK client pointed at the stub server"""
+    openai = pytest.importorskip("openai")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = openai.OpenAI(api_key="stub", base_url=f"http://127.0.0.1:{server.server_address[1]}/v1",
+                           max_retries=0)
+    yield client
+    server.shutdown()
+
+
+MESSAGES = [{"role": "system", "content": "You are Nexus."}, {"role": "user", "content": "list files"}]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_openai_stream_matches_chat(openai_client):
+    """chat_stream() deltas assemble to the same reply chat() returns."""
+    deltas = list(llm_client.chat_stream(openai_client, MESSAGES, provider="openai"))
+    assert deltas == REPLY_TOKENS
+    assert "".join(deltas).strip() == llm_client.chat(openai_client, MESSAGES, provider="openai")
+
+
+def test_anthropic_stream_text_deltas():
+    """Anthropic stream events yield only text_delta content."""
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        yield SimpleNamespace(type="message_start")
+        yield SimpleNamespace(type="content_block_start")
+        for token in ("Hel", "lo"):
+            yield SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="text_delta", text=token))
+        yield SimpleNamespace(type="content_block_delta",
+                              delta=SimpleNamespace(type="input_json_delta", partial_json="{}"))
+        yield SimpleNamespace(type="message_stop")
+
+    client = SimpleNamespace(messages=SimpleNamespace(create=create))
+    stats = {}
+    assert list(llm_client.chat_stream(client, MESSAGES, model="claude-x", provider="anthropic",
+                                       stats=stats)) == ["Hel", "lo"]
+    assert calls[0]["stream"] is True
+    assert calls[0]["system"] == "You are Nexus."
+    assert calls[0]["messages"] == [{"role": "user", "content": "list files"}]
+    assert stats["chars"] == 5 and stats["chunks"] == 2
+
+
+TURN_MESSAGES = [
+    {"role": "system", "content": "You are Nexus."},
+    {"role": "user", "content": "hi"},
+    {"role": "assistant", "content": "hello"},
+    {"role": "user", "content": "[Current time: 2026-10-18 23:30 UTC]\nlist files"},
+    {"role": "system", "content": "Tone: terse"},
+]
+
+
+def test_anthropic_keeps_every_system_message():
+    """Context messages after the user turn extend the system prompt, never replace it."""
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        yield SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="text_delta", text="ok"))
+
+    client = SimpleNamespace(messages=SimpleNamespace(create=create))
+    assert list(llm_client.chat_stream(client, TURN_MESSAGES, model="claude-x", provider="anthropic")) == ["ok"]
+    assert calls[0]["system"] == "You are Nexus.\n\nTone: terse"
+    assert [m["role"] for m in calls[0]["messages"]] == ["user", "assistant", "user"]
+    assert calls[0]["messages"][-1]["content"].endswith("list files")
+
+
+def test_google_sends_last_user_message():
+    """Gemini is sent the user's turn; trailing context goes into the history."""
+    sessions = []
+
+    class FakeModel:
+        def __init__(self, model):
+            self.model = model
+
+        def start_chat(self, history):
+            session = SimpleNamespace(history=history, sent=None)
+
+            def send_message(content):
+                session.sent = content
+                return SimpleNamespace(text=" files listed ")
+
+            session.send_message = send_message
+            sessions.append(session)
+            return session
+
+    client = SimpleNamespace(GenerativeModel=FakeModel)
+    assert list(llm_client.chat_stream(client, TURN_MESSAGES, model="gemini-x", provider="google")) == ["files listed"]
+    assert sessions[0].sent == TURN_MESSAGES[3]["content"]
+    assert [h["parts"][0] for h in sessions[0].history] == ["You are Nexus.", "hi", "hello", "Tone: terse"]
+
+
+def test_timed_stream_stats():
+    """timed_stream() records first-token and total time, skipping empty deltas."""
+    def slow():
+        yield ""
+        time.sleep(0.05)
+        yield "a"
+        time.sleep(0.05)
+        yield "b"
+
+    stats = {}
+    assert list(llm_client.timed_stream(slow(), stats=stats)) == ["a", "b"]
+    assert 40 <= stats["ttft_ms"] < stats["total_ms"]
+    assert stats["chunks"] == 2
+
+
+def test_ui_renders_incrementally():
+    """print_nexus_stream() writes each delta before the next arrives."""
+    from handlers.system import ui
+
+    buffer = io.StringIO()
+    seen = []
+
+    def deltas():
+        for token in ("one ", "two"):
+            yield token
+            seen.append(buffer.getvalue())
+
+    with patch.object(ui, "console", ui.Console(file=buffer, force_terminal=False, width=200)):
+        assert ui.print_nexus_stream(deltas()) == "one two"
+    assert seen[0].endswith("one ")
+    assert seen[1].endswith("one two")
+
+
+def test_code_blocks_from_assembled_stream(openai_client):
+    """Code fences split across deltas are extracted from the assembled reply."""
+    from handlers.execution.runner import extract_code_blocks
+
+    assembled = "".join(llm_client.chat_stream(openai_client, MESSAGES, provider="openai"))
+    assert extract_code_blocks(assembled) == ["import os\nprint(sorted(os.listdir('.')))"]
+    # No single delta carries a complete block
+    assert all(extract_code_blocks(token) == [] for token in REPLY_TOKENS)
+
+
+def test_time_to_first_token(openai_client):
+    """First visible text arrives well before the full reply."""
+    start = time.perf_counter()
+    llm_client.chat(openai_client, MESSAGES, provider="openai")
+    blocking = (time.perf_counter() - start) * 1000
+
+    stats = {}
+    for _ in llm_client.chat_stream(openai_client, MESSAGES, provider="openai", stats=stats):
+        pass
+
+    print(f"\nStub reply ({len(REPLY_TOKENS)} tokens): chat() first text at {blocking:.0f} ms, "
+          f"chat_stream() first token {stats['ttft_ms']:.0f} ms, complete {stats['total_ms']:.0f} ms")
+    assert stats["ttft_ms"] * 2 < blocking
+    assert stats["total_ms"] >= TOKEN_DELAY * (len(REPLY_TOKENS) - 1) * 1000
+
+
+def test_usage_monitor_reports_ttft():
+    """usage_monitor tracks time to first token per session."""
+    from handlers.skills import usage_monitor
+
+    with patch.dict(usage_monitor.SESSION_STATS, {"streamed": 0, "ttft_ms_total": 0.0, "last_ttft_ms": None}):
+        usage_monitor.log_stream_timing(None)
+        usage_monitor.log_stream_timing(100.0)
+        usage_monitor.log_stream_timing(300.0)
+        with patch.object(usage_monitor, "_load_log", return_value=[]):
+            report = usage_monitor.handle_request("usage")
+    assert "avg 200 ms, last 300 ms (2 streamed replies)" in report
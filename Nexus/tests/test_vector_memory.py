@@ -0,0 +1,223 @@
+#!/home/aipass/.venv/bin/python3
+# -*- coding: utf-8 -*-
+"""Tests for the long-lived vector memory service (vector_memory.py, vector_worker.py).
+
+The real worker runs against a stand-in MEMORY_BANK package under a temporary
+HOME whose imports are slow on purpose, like chromadb and the embedding model.
+"""
+
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+NEXUS_DIR = Path(__file__).resolve().parent.parent
+if str(NEXUS_DIR) not in sys.path:
+    sys.path.insert(0, str(NEXUS_DIR))
+
+from handlers.memory import vector_memory
+
+CHROMA_IMPORT_SECONDS = 0.3
+MODEL_LOAD_SECONDS = 0.7
+
+FAKE_CHROMA_CLIENT = f'''
+import json, math, time
+from pathlib import Path
+time.sleep({CHROMA_IMPORT_SECONDS})  # chromadb import
+
+STORE = Path.home() / "fake_chroma.json"
+
+class Collection:
+    def _load(self):
+        return json.loads(STORE.read_text()) if STORE.exists() else []
+
+    def count(self):
+        return len(self._load())
+
+    def add(self, ids, embeddings, documents, metadatas):
+        rows = self._load() + [list(r) for r in zip(ids, embeddings, documents, metadatas)]
+        STORE.write_text(json.dumps(rows))
+
+    def query(self, query_embeddings, n_results, include):
+        rows = self._load()
+        def distance(a, b):
+            return 1 - sum(x * y for x, y in zip(a, b))
+        out = {{"documents": [], "metadatas": [], "distances": []}}
+        for q in query_embeddings:
+            ranked = sorted(rows, key=lambda r: distance(q, r[1]))[:n_results]
+            out["documents"].append([r[2] for r in ranked])
+            out["metadatas"].append([r[3] for r in ranked])
+            out["distances"].append([distance(q, r[1]) for r in ranked])
+        return out
+
+def get_collection(name):
+    return {{"success": True, "collection": Collection()}}
+'''
+
+FAKE_EMBEDDER = f'''
+import math, time
+time.sleep({MODEL_LOAD_SECONDS})  # torch + sentence-transformers model load
+
+def encode_batch(texts):
+    embeddings = []
+    for text in texts:
+        vec = [0.0] * 26
+        for ch in text.lower():
+            if "a" <= ch <= "z":
+                vec[ord(ch) - 97] += 1
+        norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+        embeddings.append([v / norm for v in vec])
+    return {{"success": True, "embeddings": embeddings}}
+'''
+
+
+@pytest.fixture
+def fake_home(tmp_path, monkeypatch):
+    """HOME with a stand-in MEMORY_BANK package; worker processes inherit it"""
+    handlers = tmp_path / "MEMORY_BANK" / "apps" / "handlers"
+    for package in ("symbolic", "vector"):
+        (handlers / package).mkdir(parents=True)
+    for directory in (tmp_path / "MEMORY_BANK", tmp_path / "MEMORY_BANK" / "apps", handlers,
+                      handlers / "symbolic", handlers / "vector"):
+        (directory / "__init__.py").write_text("")
+    (handlers / "symbolic" / "chroma_client.py").write_text(textwrap.dedent(FAKE_CHROMA_CLIENT))
+    (handlers / "vector" / "embedder.py").write_text(textwrap.dedent(FAKE_EMBEDDER))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+def _worker():
+    return vector_memory._WorkerProcess([sys.executable, str(vector_memory.VECTOR_WORKER_SCRIPT)])
+
+
+@pytest.fixture
+def service(fake_home):
+    svc = vector_memory.VectorMemoryService(backend_factory=_worker)
+    yield svc
+    svc.close()
+
+
+# ---------------------------------------------------------------------------
+# Worker protocol
+# ---------------------------------------------------------------------------
+
+def test_worker_protocol(fake_home):
+    """One process serves count/add/query/warm requests over JSON lines."""
+    worker = _worker()
+    try:
+        assert worker.request({"operation": "count"}, 10) == {"success": True, "count": 0}
+        added = worker.request({"operation": "add", "documents": ["cortex watches files", "pulse tick"],
+                                "metadatas": [{"source": "test", "tags": ["a"]}]}, 10)
+        assert added == {"success": True, "added": 2}
+        result = worker.request({"operation": "query", "query_texts": ["pulse tick"], "n_results": 5}, 10)
+        assert result["documents"][0] == ["pulse tick", "cortex watches files"]
+        assert result["metadatas"][0][1]["tags"] == "['a']"
+        assert result["metadatas"][0][0]["source"] == "nexus"
+        assert worker.request({"operation": "nope"}, 10)["success"] is False
+        assert worker.alive
+    finally:
+        worker.close()
+    assert not worker.alive
+
+
+def test_store_is_queued_and_batched(service):
+    """store() returns before the backend is even loaded; writes land in batches."""
+    start = time.perf_counter()
+    for i in range(20):
+        assert service.store(f"memory number {i}", {"turn": i}) is True
+    queued_ms = (time.perf_counter() - start) * 1000
+
+    assert queued_ms < 50
+    assert service.flush(10) is True
+    assert service.count() == {"success": True, "count": 20}
+    assert service.stats["stored"] == 20
+    assert service.stats["batches"] < 20
+
+
+def test_search_sees_queued_writes(service, monkeypatch):
+    """search_memories() waits for pending writes and keeps the result shape."""
+    monkeypatch.setattr(vector_memory, "_service", service)
+    vector_memory.store_memory("the deployment target is ubuntu")
+    vector_memory.store_memory("zebra quiz")
+
+    results = vector_memory.search_memories("deployment ubuntu", n=1)
+    assert [r["text"] for r in results] == ["the deployment target is ubuntu"]
+    assert results[0]["metadata"]["source"] == "nexus"
+    assert vector_memory.get_memory_count() == 2
+
+
+def test_unavailable_backend(monkeypatch):
+    """No backend: reads fall back to empty, stores are refused once that is known."""
+    svc = vector_memory.VectorMemoryService(backend_factory=lambda: None)
+    monkeypatch.setattr(vector_memory, "_service", svc)
+    assert vector_memory.search_memories("anything") == []
+    assert vector_memory.get_memory_count() == 0
+    assert vector_memory.store_memory("lost") is False
+
+
+def test_worker_restarts_after_exit(service):
+    """A worker that dies is replaced on the next request."""
+    assert service.count()["success"]
+    service._backend._proc.kill()
+    service._backend._proc.wait()
+
+    assert service.count()["success"] is False
+    assert service.count() == {"success": True, "count": 0}
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def test_turn_latency_cold_and_warm(fake_home):
+    """Per-turn memory latency: process per operation vs long-lived service."""
+    turns = 5
+
+    # Previous approach: a fresh interpreter importing everything per operation
+    def per_operation(payload):
+        import json
+        result = subprocess.run([sys.executable, str(vector_memory.VECTOR_WORKER_SCRIPT)],
+                                input=json.dumps(payload), capture_output=True, text=True, timeout=30)
+        return json.loads(result.stdout)
+
+    start = time.perf_counter()
+    for i in range(turns):
+        per_operation({"operation": "add", "documents": [f"old turn {i}"]})
+        per_operation({"operation": "query", "query_texts": [f"turn {i}"], "n_results": 3})
+    subprocess_turn = (time.perf_counter() - start) / turns
+
+    svc = vector_memory.VectorMemoryService(backend_factory=_worker)
+    try:
+        # Cold: warm-up started at startup, first turn arrives immediately
+        start = time.perf_counter()
+        svc.warm_up()
+        svc.store("cold turn")
+        assert svc.search("cold turn")["documents"][0][0] == "cold turn"
+        cold_turn = time.perf_counter() - start
+
+        # Warm: the store is queued, the search sees it
+        latencies, store_latencies = [], []
+        for i in range(turns):
+            start = time.perf_counter()
+            svc.store(f"warm turn {i}")
+            store_latencies.append(time.perf_counter() - start)
+            assert svc.search(f"warm turn {i}", n=3)["success"]
+            latencies.append(time.perf_counter() - start)
+        warm_turn = sum(latencies) / turns
+        store_wait = max(store_latencies)
+    finally:
+        svc.close()
+
+    print(f"\nPer-turn memory latency (store + search): process per operation "
+          f"{subprocess_turn * 1000:.0f} ms, service cold {cold_turn * 1000:.0f} ms "
+          f"(warm-up {svc.stats['warm_ms']:.0f} ms), warm {warm_turn * 1000:.1f} ms; "
+          f"store on the chat path {store_wait * 1000:.2f} ms")
+    assert cold_turn < subprocess_turn
+    assert warm_turn * 10 < subprocess_turn
+    assert store_wait < 0.01
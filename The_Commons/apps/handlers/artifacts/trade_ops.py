@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: trade_ops.py - Trading & Ephemeral Item Operations Handler
 # Date: 2026-02-18
-# Version: 1.0.0
+# Version: 1.1.1
 # Category: the_commons/handlers/artifacts
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.1 (2026-10-18): drone registry import guarded - direct registry read when drone is absent
+#   - v1.1.0 (2026-10-18): Branch lookups via drone's cached registry (name map, no per-call parse)
 #   - v1.0.0 (2026-02-18): Initial creation (FPLAN-0356 Phase 5)
 #
 # CODE STANDARDS:
@@ -62,6 +64,35 @@
 # HELPER FUNCTIONS
 # =============================================================================
 
+def _registry_branch(name: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a branch by exact name in BRANCH_REGISTRY.
+
+    Uses drone's cached registry when drone is importable, otherwise reads
+    the registry file directly.
+
+    Args:
+        name: Branch name (e.g., "SEED")
+
+    Returns:
+        Branch dict, or None if not found
+    """
+    try:
+        from drone.apps.modules.branch_registry import get_branch_by_name
+        branch = get_branch_by_name(name)
+        return branch if branch and branch.get("name") == name else None
+    except ImportError:
+        pass  # drone not importable - read the registry directly
+
+    if not BRANCH_REGISTRY_PATH.exists():
+        return None
+    registry = json.loads(BRANCH_REGISTRY_PATH.read_text(encoding="utf-8"))
+    for branch in registry.get("branches", []):
+        if branch.get("name") == name:
+            return branch
+    return None
+
+
 def _get_branch_artifacts_path(branch_name: str) -> Optional[Path]:
     """
     Look up a branch's path from BRANCH_REGISTRY and return its artifacts/ folder.
@@ -72,16 +103,9 @@ def _get_branch_artifacts_path(branch_name: str) -> Optional[Path]:
     Returns:
         Path to the branch's artifacts/ folder, or None if not found
     """
-    if not BRANCH_REGISTRY_PATH.exists():
-        return None
-
     try:
-        registry = json.loads(BRANCH_REGISTRY_PATH.read_text(encoding="utf-8"))
-        for branch in registry.get("branches", []):
-            if branch.get("name") == branch_name:
-                branch_path = Path(branch["path"])
-                return branch_path / "artifacts"
-        return None
+        branch = _registry_branch(branch_name)
+        return Path(branch["path"]) / "artifacts" if branch else None
     except Exception:
         return None
 
@@ -212,15 +236,8 @@ def _resolve_branch_name(mention: str) -> Optional[str]:
     """
     name = mention.lstrip("@").upper()
 
-    if not BRANCH_REGISTRY_PATH.exists():
-        return None
-
     try:
-        registry = json.loads(BRANCH_REGISTRY_PATH.read_text(encoding="utf-8"))
-        for branch in registry.get("branches", []):
-            if branch.get("name") == name:
-                return name
-        return None
+        return name if _registry_branch(name) else None
     except Exception:
         return None
 
@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: writer.py - Dashboard File Handler
 # Date: 2026-02-08
-# Version: 1.0.0
+# Version: 1.2.0
 # Category: the_commons/handlers/dashboard
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): Writes through devpulse's dashboard section store (locked, atomic, skip-if-unchanged)
+#   - v1.1.0 (2026-10-18): Branch path lookup via drone's cached registry when available
 #   - v1.0.0 (2026-02-08): Initial creation - dashboard read/write for commons_activity
 #
 # CODE STANDARDS:
@@ -23,6 +25,10 @@
 Handles the commons_activity section that shows catchup data
 on each branch's dashboard.
 
+Writes go through devpulse's dashboard section store when it is importable,
+so they are serialized with every other dashboard writer and skipped when
+the section is unchanged; otherwise the file is rewritten directly.
+
 Usage:
     from handlers.dashboard.writer import write_commons_activity
 
@@ -50,6 +56,15 @@ def _find_branch_path(branch_name: str) -> Optional[Path]:
     Returns:
         Path to the branch directory, or None if not found
     """
+    try:
+        from drone.apps.modules.branch_registry import get_branch_by_name
+        branch = get_branch_by_name(branch_name)
+        if branch and branch.get("name") == branch_name:
+            return Path(branch["path"])
+        return None
+    except ImportError:
+        pass  # drone not importable - read the registry directly
+
     if not REGISTRY_PATH.exists():
         return None
 
@@ -84,6 +99,13 @@ def write_commons_activity(branch_name: str, activity: Dict[str, Any]) -> bool:
     if not dashboard_file.exists():
         return False
 
+    try:
+        from aipass_os.dev_central.devpulse.apps.modules.dashboard import update_sections
+    except ImportError:
+        pass  # devpulse not importable - read-modify-write directly
+    else:
+        return update_sections(found_path, {"commons_activity": activity})
+
     try:
         dashboard_data = json.loads(dashboard_file.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError):
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: identity_ops.py - Identity Operations Handler
 # Date: 2026-02-18
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: the_commons/handlers/identity
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Registry path lookup via drone's cached snapshot
 #   - v1.0.0 (2026-02-18): Initial creation from module refactor (FPLAN-0356 Phase 1)
 #
 # CODE STANDARDS:
@@ -25,7 +26,6 @@
 
 import sys
 import re
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -87,20 +87,12 @@ def get_branch_info_from_registry(branch_path: Path) -> Optional[Dict[str, Any]]
     Returns:
         Dict with branch info from registry, or None if not found
     """
-    if not BRANCH_REGISTRY_PATH.exists():
-        return None
-
     try:
-        with open(BRANCH_REGISTRY_PATH, 'r', encoding='utf-8') as f:
-            registry = json.load(f)
-
-        branch_path_str = str(branch_path.resolve())
+        from drone.apps.modules.branch_registry import get_snapshot
 
-        for branch in registry.get("branches", []):
-            if str(Path(branch["path"]).resolve()) == branch_path_str:
-                return branch
-
-        return None
+        # Resolved-path map is built once per registry version
+        branch = get_snapshot().by_resolved_path().get(str(branch_path.resolve()))
+        return dict(branch) if branch else None
 
     except Exception:
         return None
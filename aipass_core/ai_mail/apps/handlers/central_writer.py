@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: central_writer.py - AI_MAIL Central File Writer
 # Date: 2025-11-27
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: ai_mail/handlers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Branch names from drone's cached registry snapshot
 #   - v1.0.0 (2025-11-27): Initial implementation - central file writer
 #
 # CODE STANDARDS:
@@ -148,6 +149,13 @@ def get_valid_branch_names() -> set:
         FileNotFoundError: If BRANCH_REGISTRY.json doesn't exist
         json.JSONDecodeError: If BRANCH_REGISTRY.json is malformed
     """
+    from drone.apps.modules.branch_registry import get_snapshot
+
+    snapshot = get_snapshot()
+    if snapshot.signature is not None:
+        return {branch["name"].upper() for branch in snapshot.branches}
+
+    # Missing or unreadable - the direct read raises the specific error
     with open(BRANCH_REGISTRY, 'r', encoding='utf-8') as f:
         registry_data = stdlib_json.load(f)
 
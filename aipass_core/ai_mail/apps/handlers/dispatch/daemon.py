@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: daemon.py - Dispatch Daemon Handler
 # Date: 2026-02-17
-# Version: 1.1.0
+# Version: 1.2.0
 # Category: ai_mail/handlers/dispatch
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): Branch list from drone's cached registry (re-parsed only on change)
 #   - v1.1.0 (2026-02-18): FPLAN-0352 - Telegram notifications for daemon lifecycle events
 #   - v1.0.0 (2026-02-17): Initial version - continuous polling daemon for autonomous dispatch
 #
@@ -229,7 +230,17 @@ def _remove_pid_file() -> None:
 
 
 def get_registered_branches() -> list:
-    """Load all registered branches from BRANCH_REGISTRY.json."""
+    """Load all registered branches from BRANCH_REGISTRY.json.
+
+    Prefers drone's shared registry cache - each poll costs a stat() unless the
+    registry changed; falls back to reading the file if drone is not importable.
+    """
+    try:
+        from drone.apps.modules.branch_registry import get_snapshot
+        return list(get_snapshot().branches)
+    except ImportError:
+        pass
+
     data = _read_json(BRANCH_REGISTRY)
     if data is None:
         return []
@@ -4,15 +4,15 @@
 # META DATA HEADER
 # Name: delivery.py - Email Delivery Handler
 # Date: 2025-12-02
-# Version: 3.0.0
+# Version: 3.1.0
 # Category: ai_mail/handlers/email
 #
 # CHANGELOG (Max 5 entries):
+#   - v3.1.0 (2026-10-18): get_all_branches() reads drone's cached registry, derived list memoized per registry version
 #   - v3.0.0 (2026-02-17): Remove spawn logic — delivery is write-only, daemon handles all spawning
 #   - v2.4.0 (2026-02-10): Seed compliance - remove logger calls, cross-handler imports, fix naming, add json_handler
 #   - v2.3.0 (2026-02-10): Phase 3 polish - concise bounce messages, dispatch chain logging, hardened loop detection
 #   - v2.2.0 (2026-02-10): DEV_CENTRAL dispatch protection, notification throttling, self-reply loop detection
-#   - v2.0.0 (2026-02-09): Add fcntl.flock inbox.json locking to prevent concurrent write corruption
 #
 # CODE STANDARDS:
 #   - Handler independence: NO cross-handler or module imports
@@ -46,6 +46,10 @@
 # Lazy imports to avoid circular dependencies
 _CONSOLE = None
 _INBOX_LOCK = None
+_REGISTRY_SNAPSHOT = None
+
+# Derived branch list, rebuilt only when the registry signature changes
+_BRANCH_LIST_CACHE: Tuple[Optional[Tuple[int, int]], List[Dict]] = (None, [])
 
 
 def _get_inbox_lock():
@@ -66,24 +70,35 @@ def _get_console():
     return _CONSOLE
 
 
+def _get_registry_snapshot():
+    """Lazy import drone's cached branch registry snapshot."""
+    global _REGISTRY_SNAPSHOT
+    if _REGISTRY_SNAPSHOT is None:
+        from drone.apps.modules.branch_registry import get_snapshot
+        _REGISTRY_SNAPSHOT = get_snapshot
+    return _REGISTRY_SNAPSHOT()
+
+
 def get_all_branches() -> List[Dict]:
     """
     Get list of all branches for email routing.
     Reads from AIPass branch registry at /home/aipass/BRANCH_REGISTRY.json
+    via drone's shared cache (parsed once per registry change).
 
     Returns:
         List of dicts with branch info:
         [{"name": "AIPASS.admin", "path": "/", "email": "@admin"}, ...]
     """
-    registry_file = Path("/home/aipass/BRANCH_REGISTRY.json")
+    global _BRANCH_LIST_CACHE
     branches = []
 
-    if not registry_file.exists():
-        return []
-
     try:
-        with open(registry_file, 'r', encoding='utf-8') as f:
-            registry_data = json.load(f)
+        snapshot = _get_registry_snapshot()
+        if snapshot.signature is None:
+            return []
+        if _BRANCH_LIST_CACHE[0] == snapshot.signature:
+            return [dict(b) for b in _BRANCH_LIST_CACHE[1]]
+        registry_data = snapshot.data
 
         # Parse branch entries from JSON structure
         for branch in registry_data.get("branches", []):
@@ -126,7 +141,8 @@ def get_all_branches() -> List[Dict]:
             else:
                 email_map[branch["email"]] = branch["name"]
 
-        return branches
+        _BRANCH_LIST_CACHE = (snapshot.signature, branches)
+        return [dict(b) for b in branches]
 
     except Exception:
         return []
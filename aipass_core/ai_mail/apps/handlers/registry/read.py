@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: read.py - Registry Read Handler
 # Date: 2025-11-15
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: ai_mail/handlers/registry
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Read branches through drone's cached registry snapshot
 #   - v1.0.0 (2025-11-15): Extracted from ai_mail_cli.py
 #
 # CODE STANDARDS:
@@ -31,7 +32,6 @@
 """
 
 import sys
-import json
 from pathlib import Path
 from typing import List, Dict
 
@@ -40,6 +40,7 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 
 from cli.apps.modules import console
+from drone.apps.modules.branch_registry import load_registry
 
 # Constants
 MODULE_NAME = "registry.read"
@@ -60,12 +61,9 @@ def get_all_branches() -> List[Dict]:
     """
     branches = []
 
-    if not BRANCH_REGISTRY_PATH.exists():
-        return []
-
     try:
-        with open(BRANCH_REGISTRY_PATH, 'r', encoding='utf-8') as f:
-            registry_data = json.load(f)
+        # Shared cache - one parse per registry change across all callers
+        registry_data = load_registry()
 
         # Parse branch entries from JSON structure
         for branch in registry_data.get("branches", []):
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: branch_detection.py - Branch Auto-Detection Handler
 # Date: 2025-11-18
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: ai_mail/handlers/users
 #
 # CHANGELOG:
+#   - v1.1.0 (2026-10-18): Registry lookup by resolved path via drone's cached snapshot
 #   - v1.0.0 (2025-11-18): Initial creation - PWD/CWD branch detection
 #
 # CODE STANDARDS:
@@ -27,7 +28,6 @@
 # IMPORTS
 # =============================================
 import os
-import json
 import sys
 from pathlib import Path
 from typing import Dict
@@ -124,23 +124,12 @@ def get_branch_info_from_registry(branch_path: Path) -> Dict | None:
     Returns:
         Dict with branch info from registry, or None if not found
     """
-    if not BRANCH_REGISTRY_PATH.exists():
-        return None
-
     try:
-        with open(BRANCH_REGISTRY_PATH, 'r', encoding='utf-8') as f:
-            registry = json.load(f)
-
-        # Normalize branch_path for comparison
-        branch_path_str = str(branch_path.resolve())
+        from drone.apps.modules.branch_registry import get_snapshot
 
-        # Search registry for matching path
-        for branch in registry.get("branches", []):
-            if Path(branch["path"]).resolve() == Path(branch_path_str):
-                # Found match - return branch info
-                return branch
-
-        return None
+        # Resolved-path map is built once per registry version
+        branch = get_snapshot().by_resolved_path().get(str(branch_path.resolve()))
+        return dict(branch) if branch else None
 
     except Exception:
         return None
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: user.py - User Info Handler
 # Date: 2025-11-30
-# Version: 2.0.0
+# Version: 2.1.0
 # Category: ai_mail/handlers/users
 #
 # CHANGELOG:
+#   - v2.1.0 (2026-10-18): Registry read through drone's cached snapshot (load_registry)
 #   - v2.0.0 (2025-11-30): Removed all fallbacks - fail hard if branch detection fails
 #   - v1.1.0 (2025-11-15): Renamed domain config -> users for business purpose naming
 #   - v1.0.0 (2025-11-15): Extracted from ai_mail_cli.py
@@ -108,17 +109,10 @@ def get_user_by_email(email: str) -> Dict | None:
     Returns:
         Dict containing user info, or None if not found
     """
-    from .branch_detection import get_branch_info_from_registry
-
-    # Use registry lookup
-    registry_path = Path.home() / "BRANCH_REGISTRY.json"
-    if not registry_path.exists():
-        return None
-
     try:
-        import json
-        with open(registry_path, 'r', encoding='utf-8') as f:
-            registry = json.load(f)
+        # Shared cache - one parse per registry change ({"branches": []} if missing)
+        from drone.apps.modules.branch_registry import load_registry
+        registry = load_registry()
 
         for branch in registry.get("branches", []):
             if branch.get("email") == email:
@@ -141,14 +135,9 @@ def get_all_users() -> Dict[str, Dict]:
     Returns:
         Dict mapping branch emails to user info dicts
     """
-    registry_path = Path.home() / "BRANCH_REGISTRY.json"
-    if not registry_path.exists():
-        return {}
-
     try:
-        import json
-        with open(registry_path, 'r', encoding='utf-8') as f:
-            registry = json.load(f)
+        from drone.apps.modules.branch_registry import load_registry
+        registry = load_registry()
 
         users = {}
         for branch in registry.get("branches", []):
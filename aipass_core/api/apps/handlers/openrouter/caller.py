@@ -4,19 +4,27 @@
 # META DATA HEADER
 # Name: caller.py
 # Date: 2025-11-16
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: api/handlers
 #
 # CHANGELOG:
+#   - v1.1.0 (2026-10-18): Caller from contextvar/AIPASS_CALLER, memoized code-object detection (no inspect.stack)
 #   - v1.0.0 (2025-11-16): Initial caller detection handler extracted from archive
 # =============================================
 
 """
 OpenRouter Caller Detection Handler
 
-Stack-based caller detection with JSON folder path resolution.
+Caller detection with JSON folder path resolution.
 Supports flow, prax, and skills module detection.
 
+Resolution order (first match wins):
+1. caller_context() / set_caller() - contextvar set by the calling code
+2. AIPASS_CALLER environment variable - set by drone for branch commands
+3. Stack detection - walks raw frames (sys._getframe, no source lookups);
+   the result per code object is memoized, so each call site's path is
+   only examined once per process
+
 Usage:
     from api.apps.handlers.openrouter.caller import get_caller_info
 
@@ -33,15 +41,17 @@
 sys.path.append(str(AIPASS_ROOT))
 
 # Standard library imports
-import inspect
-from typing import Dict, Any, Optional, Tuple
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, Optional, Tuple
 
 # =============================================
 # CONFIGURATION
 # =============================================
 
 MODULE_NAME = "openrouter.caller"
-MODULE_VERSION = "1.0.0"
+MODULE_VERSION = "1.1.0"
 
 CALLER_PATTERNS = {
     "flow": "flow_json",
@@ -49,29 +59,47 @@
     "skills": "{category}_json",
 }
 
+# Set by drone when it runs a branch command (see drone system_operations.run_branch_module)
+CALLER_ENV_VAR = "AIPASS_CALLER"
+
+_caller_var: ContextVar[Optional[str]] = ContextVar("aipass_caller", default=None)
+
+# code object -> detected caller info (None: frame is not a flow/prax/skills file)
+_code_callers: Dict[Any, Optional[Dict[str, Any]]] = {}
+
+# (caller name, detection method) -> caller info for context/environment callers
+_named_callers: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
 # =============================================
 # CALLER DETECTION FUNCTIONS
 # =============================================
 
 def get_caller_info() -> Optional[Dict[str, Any]]:
     """
-    Detect calling module via stack inspection.
+    Identify the calling module (contextvar, then AIPASS_CALLER, then stack).
 
     Returns dict with: caller_name, caller_path, json_folder, category, detection_method
     Returns None if detection fails.
     """
     try:
-        stack = inspect.stack()
-
-        for frame_info in stack[1:]:
-            frame_path = Path(frame_info.filename)
-
-            if "flow" in frame_path.parts:
-                return _detect_flow_caller(frame_path)
-            elif "prax" in frame_path.parts:
-                return _detect_prax_caller(frame_path)
-            elif any("skills" in part for part in frame_path.parts):
-                return _detect_skills_caller(frame_path)
+        name = _caller_var.get()
+        if name:
+            return _named_caller_info(name, "context")
+
+        name = os.environ.get(CALLER_ENV_VAR)
+        if name:
+            return _named_caller_info(name, "environment")
+
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            if code in _code_callers:
+                info = _code_callers[code]
+            else:
+                info = _code_callers[code] = _detect_from_path(Path(code.co_filename))
+            if info:
+                return dict(info)
+            frame = frame.f_back
 
         # logger.info(f"[{MODULE_NAME}] Could not detect caller from stack trace")
         return None
@@ -81,6 +109,32 @@ def get_caller_info() -> Optional[Dict[str, Any]]:
         return None
 
 
+def set_caller(caller: Optional[str]):
+    """
+    Set the caller for the current context (thread/task).
+
+    Returns:
+        Token for _caller_var.reset() - prefer caller_context() for scoped use
+    """
+    return _caller_var.set(caller)
+
+
+@contextmanager
+def caller_context(caller: str) -> Iterator[None]:
+    """
+    Attribute API requests made inside the block to `caller`.
+
+    Example:
+        >>> with caller_context("flow_plan_summarizer"):
+        ...     get_response(prompt, model=model)
+    """
+    token = _caller_var.set(caller)
+    try:
+        yield
+    finally:
+        _caller_var.reset(token)
+
+
 def get_caller_name_from_stack() -> Optional[str]:
     """Extract caller name from call stack (simplified version)."""
     caller_info = get_caller_info()
@@ -106,11 +160,11 @@ def get_json_folder_path(caller: str) -> Optional[Path]:
     Fallback method when stack detection doesn't provide path.
     """
     try:
-        if caller.startswith("flow_"):
+        if caller == "flow" or caller.startswith("flow_"):
             base_path = AIPASS_ROOT / "flow"
             json_folder = base_path / "flow_json"
 
-        elif caller.startswith("prax_"):
+        elif caller == "prax" or caller.startswith("prax_"):
             base_path = AIPASS_ROOT / "prax"
             json_folder = base_path / "prax_json"
 
@@ -158,6 +212,39 @@ def detect_caller_category(caller_path: Path) -> str:
 # INTERNAL DETECTION HELPERS
 # =============================================
 
+def _detect_from_path(frame_path: Path) -> Optional[Dict[str, Any]]:
+    """Run the path-pattern detectors for one source file (None if no pattern matches)."""
+    if "flow" in frame_path.parts:
+        return _detect_flow_caller(frame_path)
+    elif "prax" in frame_path.parts:
+        return _detect_prax_caller(frame_path)
+    elif any("skills" in part for part in frame_path.parts):
+        return _detect_skills_caller(frame_path)
+    return None
+
+
+def _named_caller_info(caller_name: str, method: str) -> Dict[str, Any]:
+    """Caller info for an explicitly named caller (context or environment), built once per name."""
+    info = _named_callers.get((caller_name, method))
+    if info is None:
+        info = _named_callers[(caller_name, method)] = _build_named_caller_info(caller_name, method)
+    return dict(info)
+
+
+def _build_named_caller_info(caller_name: str, method: str) -> Dict[str, Any]:
+    """Resolve path, JSON folder and category for a named caller."""
+    main_file = getattr(sys.modules.get("__main__"), "__file__", None)
+    caller_path = Path(main_file) if main_file else Path(caller_name)
+
+    return {
+        "caller_name": caller_name,
+        "caller_path": caller_path,
+        "json_folder": get_json_folder_path(caller_name),
+        "category": detect_caller_category(Path(caller_name.split("_")[0])),
+        "detection_method": method
+    }
+
+
 def _detect_flow_caller(frame_path: Path) -> Dict[str, Any]:
     """Detect flow module caller from stack frame path."""
     try:
@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: client.py - OpenRouter Client Handler
 # Date: 2025-11-15
-# Version: 3.0.0
+# Version: 3.2.0
 # Category: api/handlers/openrouter
 #
 # CHANGELOG (Max 5 entries):
+#   - v3.2.0 (2026-10-18): Opt-in response cache with single-flight in get_response(); outcomes sent to usage tracking
+#   - v3.1.0 (2026-10-18): Usage tracking queued on the background collector - no metrics wait in get_response()
 #   - v3.0.0 (2026-02-20): Fallback model chain in get_response() + retry logic in make_api_request()
 #   - v2.0.0 (2025-11-16): Complete extraction from archive - client creation, API requests, response handling
 #   - v1.0.0 (2025-11-15): Initial handler stub
@@ -34,7 +36,7 @@
 Standards:
 - Uses console.print() for user output (NO print())
 - Uses logger.info() for system logging
-- Integrates with auth/keys, caller detection, usage tracking handlers
+- Integrates with auth/keys, caller detection, response cache, usage tracking handlers
 - Standalone functions (no classes)
 - Complete error handling with graceful failures
 """
@@ -64,7 +66,8 @@
 # Handler imports
 from api.apps.handlers.auth.keys import get_api_key
 from api.apps.handlers.openrouter.caller import get_caller_info
-from api.apps.handlers.usage.tracking import track_usage
+from api.apps.handlers.openrouter.response_cache import cached_call, get_cache_limits, make_cache_key
+from api.apps.handlers.usage.collector import enqueue_usage, record_cache_event
 
 # =============================================
 # CONFIGURATION
@@ -284,26 +287,32 @@ def extract_response(response: Any) -> Optional[Dict[str, Any]]:
 # MAIN API CALL
 # =============================================
 
-def get_response(prompt: str, caller: Optional[str] = None, model: Optional[str] = None, **kwargs) -> Optional[Dict[str, Any]]:
+def get_response(prompt: str, caller: Optional[str] = None, model: Optional[str] = None,
+                 cache: Optional[bool] = None, **kwargs) -> Optional[Dict[str, Any]]:
     """
     Main API call - get response from OpenRouter with full tracking integration.
 
     This is the primary entry point that integrates all handlers:
     - Detects caller automatically if not provided
+    - Answers from the response cache when enabled (response_cache handler)
     - Retrieves API key via auth/keys handler
     - Creates/caches client
     - Makes API request
     - Extracts response
-    - Tracks usage via usage/tracking handler
+    - Queues usage tracking on the background collector (usage/collector handler)
 
     Args:
         prompt: User prompt text
         caller: Module making the request (auto-detected if not provided)
         model: Model to use (required - caller must provide from branch config)
+        cache: Use the response cache (None = caller's "enabled" setting in
+            api_config.json response_cache, off by default). Only for
+            deterministic prompts - a cached answer is returned verbatim.
         **kwargs: Additional OpenAI API parameters
 
     Returns:
         Dict with 'content', 'id', 'model' or None on failure
+        (cache hits also carry 'cached': True)
 
     Example:
         >>> response = get_response("What is Python?", caller="cli", model="anthropic/claude-3.5-sonnet")
@@ -327,38 +336,63 @@ def get_response(prompt: str, caller: Optional[str] = None, model: Optional[str]
         console.print("[yellow]Callers must provide their own model via branch config (e.g., flow_json/openrouter_config.json)[/yellow]")
         return None
 
-    # Step 3: Get API key
+    # Step 3: Convert prompt to messages format
+    messages = [{"role": "user", "content": prompt}]
+
+    # Step 4: Response cache (opt-in) - identical concurrent requests share one call
+    limits = get_cache_limits(caller)
+    if not (limits["enabled"] if cache is None else cache):
+        return _request_response(messages, caller, model, **kwargs)
+
+    key = make_cache_key(model, messages, **kwargs)
+    result, outcome, saved_ms = cached_call(
+        caller, key, model, lambda: _request_response(messages, caller, model, **kwargs), limits)
+    try:
+        record_cache_event(caller, outcome, saved_ms)
+    except Exception as e:
+        # logger.warning(f"Cache tracking failed: {e}")
+        pass
+
+    # logger.info(f"Response cache {outcome} - caller: {caller}, model: {model}")
+    return result
+
+
+def _request_response(messages: List[Dict], caller: str, model: str, **kwargs) -> Optional[Dict[str, Any]]:
+    """
+    Upstream part of get_response(): key, client, request, extraction, usage tracking
+
+    Returns:
+        Dict with 'content', 'id', 'model' or None on failure
+    """
+    # Step 5: Get API key
     api_key = get_api_key("openrouter")
     if not api_key:
         # logger.error("Cannot get response - no API key available")
         console.print("[red]Error: No OpenRouter API key available[/red]")
         return None
 
-    # Step 4: Get or create client
+    # Step 6: Get or create client
     client = get_cached_client(api_key)
     if not client:
         # logger.error("Cannot get response - client creation failed")
         return None
 
-    # Step 5: Convert prompt to messages format
-    messages = [{"role": "user", "content": prompt}]
-
-    # Step 6: Make API request
+    # Step 7: Make API request
     response = make_api_request(client, messages, model, **kwargs)
     if not response:
         # logger.error(f"API request failed - caller: {caller}, model: {model}")
         return None
 
-    # Step 7: Extract response
+    # Step 8: Extract response
     result = extract_response(response)
     if not result:
         # logger.error("Response extraction failed")
         return None
 
-    # Step 8: Track usage (if response has ID)
+    # Step 9: Track usage (if response has ID) - metrics are fetched off the caller path
     if result.get("id"):
         try:
-            track_usage(result["id"], caller if caller else "unknown", model, api_key)
+            enqueue_usage(result["id"], caller if caller else "unknown", model, api_key)
         except Exception as e:
             # logger.warning(f"Usage tracking failed: {e}")
             # Don't fail the request if tracking fails
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: models.py - OpenRouter Model Management
 # Date: 2025-11-16
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: api/handlers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Persistent TTL model catalog - id index, free/pricing buckets, stale-while-revalidate
 #   - v1.0.0 (2025-11-16): Complete handler - model fetching, filtering, pricing
 # =============================================
 
@@ -20,6 +21,16 @@
 - Parse model data and capabilities
 - Extract model metadata (context, pricing, capabilities)
 
+Model catalog cache:
+- The catalog is kept in api_json/model_catalog.json with its fetch time and
+  the ETag/Last-Modified validators, so new processes start without a fetch
+- In memory it is indexed by id, with the free bucket and a cost-sorted list
+  precomputed once per fetch
+- Within CATALOG_TTL_SECONDS the cache is served as is; an older copy (up to
+  CATALOG_MAX_STALE_SECONDS) is still served immediately while a background
+  thread revalidates it with a conditional request
+- Only a missing or expired catalog makes the caller wait on the network
+
 Extracted from:
 - /home/aipass/aipass_core/api/apps/archive.temp/openrouter.py
 - /home/aipass/aipass_core/api/.archive/find_free_models.py
@@ -32,7 +43,12 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 
 # Standard library imports
-from typing import Dict, List, Optional
+import json
+import os
+import threading
+import time
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional
 
 # Console import (NO print())
 from cli.apps.modules import console
@@ -52,20 +68,41 @@
 DEFAULT_TIMEOUT = 10
 MODULE_NAME = "openrouter.models"
 
+API_JSON_DIR = AIPASS_ROOT / "api" / "api_json"
+CATALOG_FILE = "model_catalog.json"
+
+# Seconds a fetched catalog is served without revalidation
+CATALOG_TTL_SECONDS = 3600
+
+# Older copies are served while a background refresh runs; beyond this, callers wait for a fetch
+CATALOG_MAX_STALE_SECONDS = 7 * 24 * 3600
+
+# =============================================
+# CATALOG STATE
+# =============================================
+
+_catalog_lock = threading.Lock()
+_fetch_lock = threading.Lock()  # One catalog request at a time
+_catalog: Optional[Dict[str, Any]] = None
+_refreshing = False
+_session: Optional[requests.Session] = None
+
 
 # =============================================
 # CORE FUNCTIONS
 # =============================================
 
-def get_available_models(api_key: Optional[str] = None) -> List[Dict]:
+def get_available_models(api_key: Optional[str] = None, force_refresh: bool = False) -> List[Dict]:
     """
-    Fetch all models from OpenRouter API
+    Get all models from the OpenRouter model catalog
 
     Returns full model data including pricing, context length,
-    and capabilities for all available models.
+    and capabilities for all available models. Served from the
+    catalog cache; the API is only queried when no usable copy exists.
 
     Args:
         api_key: Optional OpenRouter API key (fetches from keys handler if None)
+        force_refresh: Query the API even if the cached catalog is fresh
 
     Returns:
         List of model dictionaries with full metadata, empty list on failure
@@ -75,24 +112,12 @@ def get_available_models(api_key: Optional[str] = None) -> List[Dict]:
         >>> console.print(f"Found {len(models)} models")
     """
     try:
-        # Get API key if not provided
-        if not api_key:
-            api_key = get_api_key("openrouter")
+        catalog = get_catalog(api_key, force_refresh)
+        if catalog:
+            return list(catalog["models"])
 
-        if not api_key:
-            # logger.info(f"[{MODULE_NAME}] No API key available for OpenRouter")
-            console.print("[yellow]No OpenRouter API key found[/yellow]")
-            return []
-
-        # Fetch models from API
-        models = fetch_models_from_api(api_key)
-
-        if models:
-            # logger.info(f"[{MODULE_NAME}] Fetched {len(models)} models from OpenRouter")
-            return models
-        else:
-            # logger.info(f"[{MODULE_NAME}] No models returned from API")
-            return []
+        # logger.info(f"[{MODULE_NAME}] No models available")
+        return []
 
     except Exception as e:
         # logger.info(f"[{MODULE_NAME}] Failed to get available models: {e}")
@@ -102,9 +127,10 @@ def get_available_models(api_key: Optional[str] = None) -> List[Dict]:
 
 def get_free_models(api_key: Optional[str] = None) -> List[Dict]:
     """
-    Fetch only free models ($0 pricing) from OpenRouter
+    Get only free models ($0 pricing) from OpenRouter
 
-    Filters models where both prompt and completion costs are zero.
+    Models where both prompt and completion costs are zero, read
+    from the catalog's precomputed free bucket.
     Useful for finding models that can be used without charges.
 
     Args:
@@ -119,17 +145,12 @@ def get_free_models(api_key: Optional[str] = None) -> List[Dict]:
         ...     console.print(f"Free: {model['id']}")
     """
     try:
-        # Get all models first
-        all_models = get_available_models(api_key)
-
-        if not all_models:
+        catalog = get_catalog(api_key)
+        if not catalog:
             return []
 
-        # Filter for free models
-        free_models = filter_by_pricing(all_models, max_cost=0.0)
-
-        # logger.info(f"[{MODULE_NAME}] Found {len(free_models)} free models")
-        return free_models
+        # logger.info(f"[{MODULE_NAME}] Found {len(catalog['free'])} free models")
+        return list(catalog["free"])
 
     except Exception as e:
         # logger.info(f"[{MODULE_NAME}] Failed to get free models: {e}")
@@ -137,74 +158,50 @@ def get_free_models(api_key: Optional[str] = None) -> List[Dict]:
         return []
 
 
-def fetch_models_from_api(api_key: str) -> List[Dict]:
+def get_models_by_max_cost(max_cost: float, api_key: Optional[str] = None) -> List[Dict]:
     """
-    Query OpenRouter models endpoint and parse response
+    Get catalog models whose prompt and completion costs are both <= max_cost
 
-    Makes HTTP request to OpenRouter API and extracts model data.
-    Handles authentication, timeouts, and error responses.
+    Same selection as filter_by_pricing() over the whole catalog, answered
+    from the cost-sorted index (cheapest first) instead of a scan.
 
     Args:
-        api_key: Valid OpenRouter API key
+        max_cost: Maximum cost threshold (0.0 for free only)
+        api_key: Optional OpenRouter API key
 
     Returns:
-        List of model dictionaries, empty list on failure
-
-    Raises:
-        No exceptions raised - returns empty list on all errors
+        Matching models ordered by cost, empty list on failure
     """
     try:
-        # Prepare request headers
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
+        catalog = get_catalog(api_key)
+        if not catalog:
+            return []
 
-        # Make API request
-        # logger.info(f"[{MODULE_NAME}] Requesting models from OpenRouter API")
-        response = requests.get(
-            OPENROUTER_API_URL,
-            headers=headers,
-            timeout=DEFAULT_TIMEOUT
-        )
+        return catalog["by_cost"][:bisect_right(catalog["costs"], max_cost)]
 
-        # Check response status
-        if response.status_code != 200:
-            # logger.info(f"[{MODULE_NAME}] API request failed with status {response.status_code}")
-            console.print(f"[red]OpenRouter API error: {response.status_code}[/red]")
-            return []
+    except Exception as e:
+        # logger.info(f"[{MODULE_NAME}] Error filtering models by cost: {e}")
+        return []
 
-        # Parse JSON response
-        data = response.json()
 
-        # Extract models from response
-        if "data" in data and isinstance(data["data"], list):
-            models = data["data"]
-            # logger.info(f"[{MODULE_NAME}] Successfully parsed {len(models)} models")
-            return models
-        else:
-            # logger.info(f"[{MODULE_NAME}] Invalid response format - no 'data' field")
-            return []
+def fetch_models_from_api(api_key: str) -> List[Dict]:
+    """
+    Query OpenRouter models endpoint and parse response
 
-    except requests.exceptions.Timeout:
-        # logger.info(f"[{MODULE_NAME}] API request timeout after {DEFAULT_TIMEOUT}s")
-        console.print(f"[red]Request timeout - OpenRouter API not responding[/red]")
-        return []
+    Always makes the HTTP request (no cache check); a successful
+    response also refreshes the catalog cache.
 
-    except requests.exceptions.RequestException as e:
-        # logger.info(f"[{MODULE_NAME}] Network error: {e}")
-        console.print(f"[red]Network error: {e}[/red]")
-        return []
+    Args:
+        api_key: Valid OpenRouter API key
 
-    except ValueError as e:
-        # logger.info(f"[{MODULE_NAME}] JSON parse error: {e}")
-        console.print(f"[red]Invalid JSON response from API[/red]")
-        return []
+    Returns:
+        List of model dictionaries, empty list on failure
 
-    except Exception as e:
-        # logger.info(f"[{MODULE_NAME}] Unexpected error fetching models: {e}")
-        console.print(f"[red]Error: {e}[/red]")
-        return []
+    Raises:
+        No exceptions raised - returns empty list on all errors
+    """
+    catalog = _fetch_catalog(api_key)
+    return list(catalog["models"]) if catalog else []
 
 
 def filter_by_pricing(models: List[Dict], max_cost: float = 0.0) -> List[Dict]:
@@ -265,15 +262,12 @@ def get_model_by_id(model_id: str, api_key: Optional[str] = None) -> Optional[Di
         Model dictionary if found, None otherwise
     """
     try:
-        all_models = get_available_models(api_key)
-
-        for model in all_models:
-            if model.get("id") == model_id:
-                # logger.info(f"[{MODULE_NAME}] Found model: {model_id}")
-                return model
+        catalog = get_catalog(api_key)
+        if not catalog:
+            return None
 
-        # logger.info(f"[{MODULE_NAME}] Model not found: {model_id}")
-        return None
+        # logger.info(f"[{MODULE_NAME}] Model lookup: {model_id}")
+        return catalog["by_id"].get(model_id)
 
     except Exception as e:
         # logger.info(f"[{MODULE_NAME}] Error finding model {model_id}: {e}")
@@ -340,6 +334,302 @@ def list_model_ids(models: List[Dict]) -> List[str]:
         return []
 
 
+# =============================================
+# MODEL CATALOG CACHE
+# =============================================
+
+def get_catalog(api_key: Optional[str] = None, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Get the indexed model catalog, fetching it only when no usable copy exists
+
+    A copy younger than CATALOG_TTL_SECONDS is returned as is. An older one
+    (up to CATALOG_MAX_STALE_SECONDS) is returned immediately and revalidated
+    in the background. Otherwise the caller waits for a fetch; an expired copy
+    is only returned if that fetch fails.
+
+    Args:
+        api_key: Optional OpenRouter API key (fetches from keys handler if None)
+        force_refresh: Revalidate with the API even if the cached catalog is fresh
+
+    Returns:
+        Catalog dict (models, by_id, free, costs, by_cost, fetched_at) or None
+    """
+    catalog = _current_catalog()
+    if catalog and not force_refresh:
+        age = time.time() - catalog["fetched_at"]
+        if age <= CATALOG_TTL_SECONDS:
+            return catalog
+        if age <= CATALOG_MAX_STALE_SECONDS:
+            _start_revalidate(api_key)
+            return catalog
+
+    if not api_key:
+        api_key = get_api_key("openrouter")
+
+    if not api_key:
+        # logger.info(f"[{MODULE_NAME}] No API key available for OpenRouter")
+        console.print("[yellow]No OpenRouter API key found[/yellow]")
+        return catalog
+
+    with _fetch_lock:
+        latest = _current_catalog()
+        # Another caller may have fetched while we waited for the lock
+        if latest and latest is not catalog and not force_refresh and time.time() - latest["fetched_at"] <= CATALOG_TTL_SECONDS:
+            return latest
+        return _fetch_catalog(api_key, latest) or latest
+
+
+def get_catalog_info() -> Dict[str, Any]:
+    """
+    Describe the cached model catalog
+
+    Returns:
+        Dict with cached, models, free, age_seconds, fresh, refreshing, path
+    """
+    path = API_JSON_DIR / CATALOG_FILE
+    catalog = _current_catalog()
+    if not catalog:
+        return {"cached": False, "path": str(path)}
+
+    age = time.time() - catalog["fetched_at"]
+    return {
+        "cached": True,
+        "models": len(catalog["models"]),
+        "free": len(catalog["free"]),
+        "age_seconds": round(age),
+        "fresh": age <= CATALOG_TTL_SECONDS,
+        "refreshing": _refreshing,
+        "path": str(path)
+    }
+
+
+def clear_catalog_cache(remove_file: bool = False) -> None:
+    """
+    Drop the in-memory catalog (and optionally the on-disk copy)
+
+    Args:
+        remove_file: Also delete api_json/model_catalog.json
+    """
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
+    if remove_file:
+        (API_JSON_DIR / CATALOG_FILE).unlink(missing_ok=True)
+    # logger.info(f"[{MODULE_NAME}] Cleared model catalog cache")
+
+
+def _current_catalog() -> Optional[Dict[str, Any]]:
+    """In-memory catalog, replaced by the on-disk copy when another process refreshed it"""
+    global _catalog
+    with _catalog_lock:
+        catalog = _catalog
+    if catalog and time.time() - catalog["fetched_at"] <= CATALOG_TTL_SECONDS:
+        return catalog
+
+    path = API_JSON_DIR / CATALOG_FILE
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return catalog
+    if catalog and catalog["file_mtime"] == mtime:
+        return catalog
+
+    loaded = _read_catalog_file(path)
+    if loaded and (not catalog or loaded["fetched_at"] > catalog["fetched_at"]):
+        loaded["file_mtime"] = mtime
+        with _catalog_lock:
+            _catalog = loaded
+        return loaded
+    return catalog
+
+
+def _fetch_catalog(api_key: str, current: Optional[Dict[str, Any]] = None, quiet: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Request the models endpoint and install the result as the catalog (caller holds _fetch_lock)
+
+    With a current catalog the request is conditional (If-None-Match /
+    If-Modified-Since); a 304 keeps its models and index and only renews
+    fetched_at.
+
+    Returns:
+        New catalog dict, None on failure
+    """
+    global _catalog, _session
+    try:
+        # Prepare request headers
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        if current and current.get("etag"):
+            headers["If-None-Match"] = current["etag"]
+        if current and current.get("last_modified"):
+            headers["If-Modified-Since"] = current["last_modified"]
+
+        # Make API request over a reused connection
+        # logger.info(f"[{MODULE_NAME}] Requesting models from OpenRouter API")
+        if _session is None:
+            _session = requests.Session()
+        response = _session.get(
+            OPENROUTER_API_URL,
+            headers=headers,
+            timeout=DEFAULT_TIMEOUT
+        )
+
+        if response.status_code == 304 and current:
+            # logger.info(f"[{MODULE_NAME}] Model catalog not modified")
+            catalog = {**current, "fetched_at": time.time()}
+
+        elif response.status_code == 200:
+            # Parse JSON response and extract models
+            data = response.json()
+            if not ("data" in data and isinstance(data["data"], list)):
+                # logger.info(f"[{MODULE_NAME}] Invalid response format - no 'data' field")
+                return None
+            catalog = _build_catalog(
+                data["data"],
+                time.time(),
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified")
+            )
+            # logger.info(f"[{MODULE_NAME}] Successfully parsed {len(catalog['models'])} models")
+
+        else:
+            # logger.info(f"[{MODULE_NAME}] API request failed with status {response.status_code}")
+            if not quiet:
+                console.print(f"[red]OpenRouter API error: {response.status_code}[/red]")
+            return None
+
+    except requests.exceptions.Timeout:
+        # logger.info(f"[{MODULE_NAME}] API request timeout after {DEFAULT_TIMEOUT}s")
+        if not quiet:
+            console.print("[red]Request timeout - OpenRouter API not responding[/red]")
+        return None
+
+    except requests.exceptions.RequestException as e:
+        # logger.info(f"[{MODULE_NAME}] Network error: {e}")
+        if not quiet:
+            console.print(f"[red]Network error: {e}[/red]")
+        return None
+
+    except ValueError as e:
+        # logger.info(f"[{MODULE_NAME}] JSON parse error: {e}")
+        if not quiet:
+            console.print("[red]Invalid JSON response from API[/red]")
+        return None
+
+    except Exception as e:
+        # logger.info(f"[{MODULE_NAME}] Unexpected error fetching models: {e}")
+        if not quiet:
+            console.print(f"[red]Error: {e}[/red]")
+        return None
+
+    _write_catalog_file(catalog)
+    with _catalog_lock:
+        _catalog = catalog
+    return catalog
+
+
+def _start_revalidate(api_key: Optional[str]) -> None:
+    """Refresh a stale catalog on a background thread (at most one at a time)"""
+    global _refreshing
+    with _catalog_lock:
+        if _refreshing:
+            return
+        _refreshing = True
+    threading.Thread(target=_revalidate, args=(api_key,), name="model-catalog-refresh", daemon=True).start()
+
+
+def _revalidate(api_key: Optional[str]) -> None:
+    """Background refresh - failures keep serving the current copy"""
+    global _refreshing
+    try:
+        if not api_key:
+            api_key = get_api_key("openrouter")
+        if api_key:
+            with _fetch_lock:
+                current = _current_catalog()
+                if not current or time.time() - current["fetched_at"] > CATALOG_TTL_SECONDS:
+                    _fetch_catalog(api_key, current, quiet=True)
+    except Exception as e:
+        # logger.info(f"[{MODULE_NAME}] Background catalog refresh failed: {e}")
+        pass
+    finally:
+        with _catalog_lock:
+            _refreshing = False
+
+
+def _model_cost(model: Dict) -> Optional[float]:
+    """Higher of prompt/completion cost (the filter_by_pricing criterion), None if unparseable"""
+    pricing = model.get("pricing") or {}
+    try:
+        return max(float(pricing.get("prompt", "0")), float(pricing.get("completion", "0")))
+    except (ValueError, TypeError):
+        return None
+
+
+def _build_catalog(models: List[Dict], fetched_at: float, etag: Optional[str] = None,
+                   last_modified: Optional[str] = None) -> Dict[str, Any]:
+    """Index a model list: by id, free bucket (API order), cost-sorted list for threshold queries"""
+    by_id = {}
+    free = []
+    priced = []
+    for model in models:
+        model_id = model.get("id")
+        if model_id:
+            by_id.setdefault(model_id, model)
+        cost = _model_cost(model)
+        if cost is None:
+            continue
+        priced.append((cost, model))
+        if cost <= 0.0:
+            free.append(model)
+    priced.sort(key=lambda item: item[0])
+
+    return {
+        "models": models,
+        "by_id": by_id,
+        "free": free,
+        "costs": [cost for cost, _ in priced],
+        "by_cost": [model for _, model in priced],
+        "fetched_at": fetched_at,
+        "etag": etag,
+        "last_modified": last_modified,
+        "file_mtime": None
+    }
+
+
+def _read_catalog_file(path: Path) -> Optional[Dict[str, Any]]:
+    """Load and index the on-disk catalog, None if missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return _build_catalog(data["models"], float(data["fetched_at"]), data.get("etag"), data.get("last_modified"))
+    except Exception as e:
+        # logger.info(f"[{MODULE_NAME}] Could not read model catalog {path}: {e}")
+        return None
+
+
+def _write_catalog_file(catalog: Dict[str, Any]) -> None:
+    """Persist the catalog atomically (readers never see a partial file)"""
+    path = API_JSON_DIR / CATALOG_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{CATALOG_FILE}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "fetched_at": catalog["fetched_at"],
+                "etag": catalog["etag"],
+                "last_modified": catalog["last_modified"],
+                "models": catalog["models"]
+            }, f)
+        os.replace(tmp_path, path)
+        catalog["file_mtime"] = path.stat().st_mtime
+    except Exception as e:
+        # logger.info(f"[{MODULE_NAME}] Could not write model catalog: {e}")
+        pass
+
+
 # =============================================
 # CONVENIENCE FUNCTIONS
 # =============================================
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: provision.py - Caller Auto-Provisioning Handler
 # Date: 2025-11-16
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: api/handlers/openrouter
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Per-process cache of provisioned folders and caller configs
 #   - v1.0.0 (2025-11-16): Initial handler - auto-provision caller configs
 # =============================================
 
@@ -20,6 +21,7 @@
 - Set default model/temperature/max_tokens
 - Initialize caller-specific tracking files
 - Ensure caller has complete 3-file JSON structure
+- Folder and config checks hit the disk once per process (cached)
 
 COMPLIANT STANDARDS:
 - Uses console.print() for output (NO print())
@@ -35,13 +37,18 @@
 AIPASS_ROOT = Path.home() / "aipass_core"
 sys.path.insert(0, str(AIPASS_ROOT))
 
+import copy
 import json
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 
 from cli.apps.modules import console
 
-from api.apps.handlers.openrouter.caller import detect_caller_from_stack
+from api.apps.handlers.openrouter.caller import detect_caller_from_stack, get_json_folder_path
+
+# Per-process provisioning cache - folders known to exist, configs by file path
+_known_folders: set = set()
+_caller_configs: Dict[Path, Dict[str, Any]] = {}
 
 
 # ===========================================
@@ -166,10 +173,15 @@ def provision_json_folder(json_folder: Path) -> bool:
         True if folder exists or created, False on error
     """
     try:
+        if json_folder in _known_folders:
+            return True
+
         if json_folder.exists():
+            _known_folders.add(json_folder)
             return True
 
         json_folder.mkdir(parents=True, exist_ok=True)
+        _known_folders.add(json_folder)
         # logger.info(f"Created JSON folder: {json_folder}")
         console.print(f"[green]Created JSON folder:[/green] {json_folder}")
 
@@ -244,7 +256,8 @@ def ensure_caller_config(caller: str | None = None) -> Dict[str, Any]:
     Ensure caller has API configuration, create if missing
 
     Auto-detects caller if not provided. Creates complete 3-file
-    JSON structure with default OpenRouter settings.
+    JSON structure with default OpenRouter settings. The config is
+    read from disk once per process; later calls return a copy.
 
     Args:
         caller: Optional caller name (auto-detected if None)
@@ -253,10 +266,9 @@ def ensure_caller_config(caller: str | None = None) -> Dict[str, Any]:
         Dict with config or empty dict if unable to provision
     """
     try:
-        # Auto-detect caller if not provided
-        json_folder = None
+        # Detect caller and JSON folder (one detection)
+        detected_caller, json_folder = detect_caller_from_stack()
         if not caller:
-            detected_caller, json_folder = detect_caller_from_stack()
             if detected_caller:
                 caller = detected_caller
                 # logger.info(f"Auto-detected caller: {caller}")
@@ -265,9 +277,9 @@ def ensure_caller_config(caller: str | None = None) -> Dict[str, Any]:
                 console.print("[yellow]Warning:[/yellow] Could not detect caller module")
                 return {}
 
-        # Get JSON folder path if not already detected
+        # Fall back to the caller-name pattern if detection gave no folder
         if not json_folder:
-            _, json_folder = detect_caller_from_stack()
+            json_folder = get_json_folder_path(caller)
             if not json_folder:
                 # logger.error(f"Could not determine JSON folder for {caller}")
                 console.print(f"[red]Error:[/red] Could not find JSON folder for '{caller}'")
@@ -276,17 +288,24 @@ def ensure_caller_config(caller: str | None = None) -> Dict[str, Any]:
         # Check if config already exists
         config_file = json_folder / "openrouter_skill_config.json"
 
+        if config_file in _caller_configs:
+            return copy.deepcopy(_caller_configs[config_file])
+
         if config_file.exists():
             config = read_json(config_file)
             if config:
                 # logger.info(f"Using existing config for {caller}")
-                return config
+                _caller_configs[config_file] = config
+                return copy.deepcopy(config)
             else:
                 # logger.warning(f"Config file corrupted for {caller}, regenerating")
                 console.print(f"[yellow]Warning:[/yellow] Corrupted config, regenerating...")
 
         # Create new config
-        return create_caller_config(caller, json_folder)
+        config = create_caller_config(caller, json_folder)
+        if config:
+            _caller_configs[config_file] = config
+        return copy.deepcopy(config)
 
     except Exception as e:
         # logger.error(f"Failed to ensure config for {caller}: {e}")
@@ -294,3 +313,10 @@ def ensure_caller_config(caller: str | None = None) -> Dict[str, Any]:
         return {}
 
 
+def clear_provision_cache() -> None:
+    """
+    Forget cached folders and configs (next call re-reads the disk)
+    Useful for testing or after editing a caller's config file.
+    """
+    _known_folders.clear()
+    _caller_configs.clear()
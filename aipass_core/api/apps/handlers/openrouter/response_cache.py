@@ -0,0 +1,348 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: response_cache.py - OpenRouter Response Cache Handler
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: api/handlers/openrouter
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial handler - prompt-hash response cache with single-flight
+# =============================================
+
+"""
+OpenRouter Response Cache Handler
+
+Opt-in cache for deterministic get_response() calls (unchanged plans being
+re-summarized, Memory Bank dedup checks, cortex file summaries):
+- Key: SHA-256 of (model, messages, request parameters such as temperature
+  and max_tokens)
+- Store: api_json/response_cache.db (SQLite), shared by all processes,
+  entries scoped per caller
+- Limits per caller: TTL and max entries (least recently used evicted),
+  read from the "response_cache" block of api_config.json
+- Single-flight: concurrent identical requests in a process share one
+  upstream call
+
+Config (api_config.json):
+    "config": {
+        "response_cache": {
+            "default": {"ttl_seconds": 86400, "max_entries": 500},
+            "callers": {"flow_plan_summarizer": {"enabled": true, "ttl_seconds": 604800}}
+        }
+    }
+
+Functions: make_cache_key(), get_cache_limits(), cached_call(), lookup(),
+store_response(), clear_response_cache(), get_response_cache_info()
+"""
+
+# AIPASS_ROOT setup
+import sys
+from pathlib import Path
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+# Standard library imports
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# =============================================
+# MODULE CONSTANTS
+# =============================================
+
+MODULE_NAME = "response_cache"
+API_JSON_DIR = AIPASS_ROOT / "api" / "api_json"
+CACHE_DB_FILE = "response_cache.db"
+CONFIG_FILE = "api_config.json"
+
+# Limits for callers without their own entry; caching stays off unless enabled
+DEFAULT_LIMITS = {
+    "enabled": False,
+    "ttl_seconds": 24 * 3600,
+    "max_entries": 500
+}
+
+# Seconds a writer waits for another process' transaction
+BUSY_TIMEOUT = 30
+
+# A hit only rewrites last_used when it is older than this (LRU order to the minute, reads stay read-only)
+LRU_TOUCH_SECONDS = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    caller TEXT NOT NULL,
+    key TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    latency_ms REAL NOT NULL,
+    created REAL NOT NULL,
+    expires REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (caller, key)
+);
+CREATE INDEX IF NOT EXISTS idx_responses_lru ON responses(caller, last_used);
+"""
+
+_initialized = set()
+_init_lock = threading.Lock()
+
+# In-flight upstream calls: (caller, key) -> {"event", "result", "latency_ms"}
+_flights: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_flights_lock = threading.Lock()
+
+# api_config.json response_cache block, reloaded when the file changes
+_settings = {"mtime": None, "block": {}}
+
+
+# =============================================
+# KEYS AND LIMITS
+# =============================================
+
+def make_cache_key(model: str, messages: List[Dict[str, Any]], **params) -> str:
+    """
+    Hash a request into its cache key
+
+    Args:
+        model: Model identifier
+        messages: Chat messages in OpenAI format
+        **params: Request parameters (temperature, max_tokens, ...)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps({"model": model, "messages": messages, "params": params},
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cache_limits(caller: str) -> Dict[str, Any]:
+    """
+    Cache settings for a caller: DEFAULT_LIMITS < config default < config caller entry
+
+    Args:
+        caller: Module name making the request
+
+    Returns:
+        Dict with enabled, ttl_seconds, max_entries
+    """
+    block = _load_settings()
+    limits = dict(DEFAULT_LIMITS)
+    limits.update(block.get("default") or {})
+    limits.update((block.get("callers") or {}).get(caller) or {})
+    return limits
+
+
+def _load_settings() -> Dict[str, Any]:
+    """response_cache block of api_config.json ({} if absent or unreadable)"""
+    path = API_JSON_DIR / CONFIG_FILE
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return {}
+    if _settings["mtime"] != mtime:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                block = json.load(f).get("config", {}).get("response_cache") or {}
+        except Exception as e:
+            # logger.warning(f"[{MODULE_NAME}] Could not read response_cache config: {e}")
+            block = {}
+        _settings.update(mtime=mtime, block=block)
+    return _settings["block"]
+
+
+# =============================================
+# CONNECTION
+# =============================================
+
+def connect() -> sqlite3.Connection:
+    """
+    Open the response cache database, creating the schema once per path
+
+    Returns:
+        sqlite3 connection (caller closes it)
+    """
+    path = API_JSON_DIR / CACHE_DB_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=BUSY_TIMEOUT)
+    # WAL without a sync per commit: a lost last_used update or entry only costs a miss
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+    key = str(path.resolve())
+    if key not in _initialized:
+        with _init_lock:
+            if key not in _initialized:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(SCHEMA)
+                _initialized.add(key)
+    return conn
+
+
+# =============================================
+# CACHE OPERATIONS
+# =============================================
+
+def cached_call(caller: str, key: str, model: str, call: Callable[[], Optional[Dict[str, Any]]],
+                limits: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str, float]:
+    """
+    Answer a request from the cache, or make it once for all concurrent askers
+
+    Args:
+        caller: Module name making the request (cache scope)
+        key: make_cache_key() digest
+        model: Model identifier (stored for inspection)
+        call: Makes the upstream request; returns the response dict or None
+        limits: get_cache_limits() result
+
+    Returns:
+        (response or None, outcome "hit" | "miss" | "coalesced",
+         upstream milliseconds the caller did not wait for)
+    """
+    found = lookup(caller, key)
+    if found:
+        return found[0], "hit", found[1]
+
+    with _flights_lock:
+        flight = _flights.get((caller, key))
+        leader = flight is None
+        if leader:
+            flight = _flights[(caller, key)] = {"event": threading.Event(), "result": None, "latency_ms": 0.0}
+
+    if not leader:
+        flight["event"].wait()
+        result = flight["result"]
+        return (dict(result) if result else None), "coalesced", flight["latency_ms"]
+
+    try:
+        # A leader that just finished may have stored it between our lookup and the flight
+        found = lookup(caller, key)
+        if found:
+            flight.update(result=found[0], latency_ms=found[1])
+            return found[0], "hit", found[1]
+
+        start = time.perf_counter()
+        result = call()
+        latency_ms = (time.perf_counter() - start) * 1000
+        if result:
+            store_response(caller, key, model, result, latency_ms, limits)
+        flight.update(result=result, latency_ms=latency_ms)
+        return result, "miss", 0.0
+
+    finally:
+        with _flights_lock:
+            _flights.pop((caller, key), None)
+        flight["event"].set()
+
+
+def lookup(caller: str, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+    """
+    Fetch an unexpired cached response and mark it used (at most once a minute)
+
+    Returns:
+        (response dict with "cached": True, original upstream latency in ms) or None
+    """
+    try:
+        conn = connect()
+        try:
+            row = conn.execute(
+                "SELECT response, latency_ms, expires, last_used FROM responses WHERE caller = ? AND key = ?",
+                (caller, key)).fetchone()
+            now = time.time()
+            if not row or row[2] <= now:
+                return None
+            if now - row[3] > LRU_TOUCH_SECONDS:
+                with conn:
+                    conn.execute("UPDATE responses SET last_used = ? WHERE caller = ? AND key = ?",
+                                 (now, caller, key))
+        finally:
+            conn.close()
+        return {**json.loads(row[0]), "cached": True}, row[1]
+
+    except Exception as e:
+        # logger.warning(f"[{MODULE_NAME}] Cache lookup failed: {e}")
+        return None
+
+
+def store_response(caller: str, key: str, model: str, result: Dict[str, Any], latency_ms: float,
+                   limits: Dict[str, Any]) -> bool:
+    """
+    Cache a response, then apply the caller's TTL and size limit
+
+    Returns:
+        True if stored, False on error
+    """
+    try:
+        now = time.time()
+        conn = connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (caller, key, model, response, latency_ms, created, expires, "
+                    "last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (caller, key, model, json.dumps(result), latency_ms, now,
+                     now + float(limits["ttl_seconds"]), now))
+                conn.execute("DELETE FROM responses WHERE caller = ? AND expires <= ?", (caller, now))
+                conn.execute(
+                    "DELETE FROM responses WHERE caller = ? AND key IN (SELECT key FROM responses "
+                    "WHERE caller = ? ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (caller, caller, int(limits["max_entries"])))
+        finally:
+            conn.close()
+        return True
+
+    except Exception as e:
+        # logger.warning(f"[{MODULE_NAME}] Could not cache response: {e}")
+        return False
+
+
+# =============================================
+# MAINTENANCE
+# =============================================
+
+def clear_response_cache(caller: Optional[str] = None) -> int:
+    """
+    Delete cached responses
+
+    Args:
+        caller: Only this caller's entries (None = all)
+
+    Returns:
+        Number of entries deleted
+    """
+    try:
+        conn = connect()
+        try:
+            with conn:
+                if caller:
+                    return conn.execute("DELETE FROM responses WHERE caller = ?", (caller,)).rowcount
+                return conn.execute("DELETE FROM responses").rowcount
+        finally:
+            conn.close()
+
+    except Exception as e:
+        # logger.warning(f"[{MODULE_NAME}] Could not clear response cache: {e}")
+        return 0
+
+
+def get_response_cache_info() -> Dict[str, int]:
+    """
+    Cached entries per caller
+
+    Returns:
+        Dict of {caller: entry count}
+    """
+    try:
+        conn = connect()
+        try:
+            rows = conn.execute("SELECT caller, count(*) FROM responses GROUP BY caller").fetchall()
+        finally:
+            conn.close()
+        return {caller: count for caller, count in rows}
+
+    except Exception as e:
+        # logger.warning(f"[{MODULE_NAME}] Could not read response cache: {e}")
+        return {}
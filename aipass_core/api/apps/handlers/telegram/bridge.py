@@ -4,19 +4,15 @@
 # META DATA HEADER
 # Name: bridge.py - Telegram Bridge Service
 # Date: 2026-02-04
-# Version: 4.6.0
+# Version: 4.7.0
 # Category: api/handlers/telegram
 #
 # CHANGELOG (Max 5 entries):
+#   - v4.7.0 (2026-10-18): Transcript position via transcript_tail - appended bytes only, offset/inode in pending file
 #   - v4.6.0 (2026-02-17): FPLAN-0351 Layer 3 - transcript position tracking in pending file for Stop hook
 #   - v4.5.0 (2026-02-15): Sticky branch routing - @branch switch persists until next explicit @switch
 #   - v4.4.0 (2026-02-15): Add startup health check - fail fast if Telegram API unreachable
 #   - v4.3.0 (2026-02-15): Integrate telegram_standards.py for shared commands
-#   - v4.1.0 (2026-02-13): Add /help command + show chat_id in /status
-#   - v4.0.0 (2026-02-12): tmux persistent sessions - replace spawn-and-capture with tmux injection + Stop hook
-#   - v3.0.0 (2026-02-10): Photo/document/file upload handling (Phase 5 FPLAN-0312)
-#   - v2.9.0 (2026-02-10): Edit-in-place progress messages (Phase 4 FPLAN-0312)
-#   - v2.8.0 (2026-02-10): Session persistence + /new, /status commands (Phase 3)
 #
 # CODE STANDARDS:
 #   - Pure functions with proper error raising
@@ -75,6 +71,9 @@
     save_session, clear_session, get_session_info, get_session,
     get_session_by_branch
 )
+from api.apps.handlers.telegram.transcript_tail import (
+    mark_position, clear_position
+)
 from api.apps.handlers.telegram.file_handler import (
     download_telegram_file, detect_file_type, build_file_prompt,
     cleanup_file, MAX_FILE_SIZE
@@ -331,19 +330,6 @@ def resolve_branch_target(message: str) -> tuple[str, str, Path]:
 # PENDING FILE COORDINATION
 # =============================================
 
-def _get_transcript_line_count(branch_path: Path, session_id: str) -> int:
-    """Get current line count of the JSONL transcript for Layer 3 position tracking."""
-    slug = str(branch_path).replace("/", "-")
-    transcript = Path.home() / ".claude" / "projects" / slug / f"{session_id}.jsonl"
-    if not transcript.exists():
-        return 0
-    try:
-        text = transcript.read_text(encoding="utf-8").strip()
-        return len(text.split("\n")) if text else 0
-    except OSError:
-        return 0
-
-
 def write_pending_file(
     branch_name: str,
     chat_id: int,
@@ -373,10 +359,11 @@ def write_pending_file(
     """
     PENDING_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Layer 3 (FPLAN-0351): Record transcript position at injection time
-    transcript_line_after = 0
+    # Layer 3 (FPLAN-0351): Record transcript position at injection time.
+    # The tail tracker only reads bytes appended since the last mark.
+    position: Dict[str, Any] = {}
     if branch_path:
-        transcript_line_after = _get_transcript_line_count(branch_path, session_id)
+        position = mark_position(branch_name, branch_path, session_id)
 
     pending_data = {
         "chat_id": chat_id,
@@ -386,7 +373,9 @@ def write_pending_file(
         "processing_message_id": processing_message_id,
         "timestamp": time.time(),
         "branch_name": branch_name,
-        "transcript_line_after": transcript_line_after,
+        "transcript_line_after": position.get("lines", 0),
+        "transcript_offset": position.get("offset", 0),
+        "transcript_inode": position.get("inode", 0),
     }
 
     pending_path = PENDING_DIR / f"telegram-{branch_name}.json"
@@ -890,6 +879,9 @@ async def handle_new(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
     # Kill the tmux session
     kill_session(branch_name)
 
+    # Forget the old transcript position
+    clear_position(branch_name, get_session_id_from_store(branch_name) or f"tmux-{branch_name}")
+
     # Clear session store
     if chat_id:
         clear_session(chat_id)
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: direct_chat.py - Config-Driven Telegram Direct Chat
 # Date: 2026-02-15
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: api/handlers/telegram
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): asyncio update pipeline - per-chat/branch worker queues, batched offset checkpoints, backpressure
 #   - v1.0.0 (2026-02-15): Initial - extracted from assistant_chat.py, config-driven with standards integration
 #
 # CODE STANDARDS:
@@ -40,6 +41,18 @@
   -> Stop hook deletes pending file
   -> Continue polling for next message
 
+Update pipeline (asyncio, run_update_pipeline):
+  - One long-poll fetcher; each update is routed to a worker queue keyed
+    by (chat_id, branch), so a slow conversation never blocks another.
+    Updates within one conversation stay in order.
+  - Blocking work (urllib, tmux, downloads) runs in worker threads.
+  - Backpressure: fetching pauses while MAX_IN_FLIGHT updates are
+    unfinished; a conversation whose queue (WORKER_QUEUE_SIZE) is full
+    gets a busy notice instead of an unbounded backlog.
+  - The offset checkpoint is the oldest unfinished update, written every
+    OFFSET_CHECKPOINT_UPDATES updates or OFFSET_CHECKPOINT_INTERVAL seconds
+    instead of once per update.
+
 Usage:
     from api.apps.handlers.telegram.direct_chat import run
 
@@ -58,6 +71,7 @@
 # IMPORTS (stdlib only)
 # =============================================
 
+import asyncio
 import atexit
 import json
 import logging
@@ -65,11 +79,12 @@
 import signal
 import subprocess
 import sys
+import threading
 import time
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Hashable, Optional
 from urllib.error import URLError
 from urllib.request import Request, urlopen
 
@@ -102,7 +117,20 @@
 RATE_LIMIT_COOLDOWN = 1.0  # Minimum seconds between messages
 
 # Telegram API
+TELEGRAM_API_BASE = "https://api.telegram.org"
 POLL_TIMEOUT = 30  # Long-poll timeout in seconds
+POLL_ERROR_BACKOFF = 5  # Seconds to wait after a failed poll
+
+# Update pipeline
+WORKER_QUEUE_SIZE = 8  # Queued updates per conversation before it counts as busy
+MAX_IN_FLIGHT = 64  # Unfinished updates before fetching pauses
+WORKER_IDLE_TIMEOUT = 300  # Seconds before an idle conversation worker exits
+OFFSET_CHECKPOINT_UPDATES = 20  # Checkpoint after this many finished updates...
+OFFSET_CHECKPOINT_INTERVAL = 5.0  # ...or this many seconds, whichever comes first
+BUSY_MESSAGE = "Still working on your earlier messages - please wait and resend."
+
+# Guards the shared state dict across conversation worker threads
+_state_lock = threading.Lock()
 
 # Pending file coordination
 PENDING_DIR = Path.home() / ".aipass" / "telegram_pending"
@@ -520,7 +548,7 @@ def poll_updates(bot_token: str, offset: int, logger: logging.Logger) -> list:
         List of update dicts from Telegram API
     """
     url = (
-        f"https://api.telegram.org/bot{bot_token}/getUpdates"
+        f"{TELEGRAM_API_BASE}/bot{bot_token}/getUpdates"
         f"?offset={offset}&timeout={POLL_TIMEOUT}"
     )
 
@@ -556,7 +584,7 @@ def send_telegram_message(bot_token: str, chat_id: str, text: str, logger: loggi
     Returns:
         True if sent successfully
     """
-    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    url = f"{TELEGRAM_API_BASE}/bot{bot_token}/sendMessage"
 
     payload = {
         "chat_id": int(chat_id),
@@ -601,7 +629,7 @@ def download_telegram_file(
         Path to the downloaded file, or None on failure
     """
     # Step 1: Get file info from Telegram
-    url = f"https://api.telegram.org/bot{bot_token}/getFile?file_id={file_id}"
+    url = f"{TELEGRAM_API_BASE}/bot{bot_token}/getFile?file_id={file_id}"
     try:
         with urlopen(Request(url), timeout=15) as resp:
             data = json.loads(resp.read().decode("utf-8"))
@@ -626,7 +654,7 @@ def download_telegram_file(
         return None
 
     # Step 2: Download the file
-    download_url = f"https://api.telegram.org/file/bot{bot_token}/{file_path}"
+    download_url = f"{TELEGRAM_API_BASE}/file/bot{bot_token}/{file_path}"
 
     TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -722,7 +750,7 @@ def process_update(
         pending_file: Path to the pending JSON file
         bot_name: Display name for the bot
         custom_commands: Optional bot-specific commands dict
-        state: Mutable state dict (last_message_time, running, message_count)
+        state: Mutable state dict (last_message_time per chat, running, message_count)
         logger: Logger instance
     """
     message = update.get("message")
@@ -831,15 +859,18 @@ def process_update(
         logger.info("Ignoring unsupported message type from Patrick")
         return
 
-    # Rate limiting
+    # Rate limiting (per chat - conversations are processed concurrently)
     now = time.time()
-    if now - state["last_message_time"] < RATE_LIMIT_COOLDOWN:
-        logger.warning("Rate limited - message too soon (%.1fs)", now - state["last_message_time"])
-        return
-    state["last_message_time"] = now
+    with _state_lock:
+        last_times = state.setdefault("last_message_time", {})
+        elapsed = now - last_times.get(chat_id, 0.0)
+        if elapsed < RATE_LIMIT_COOLDOWN:
+            logger.warning("Rate limited - message too soon (%.1fs)", elapsed)
+            return
+        last_times[chat_id] = now
 
-    # Track message count
-    state["message_count"] = state.get("message_count", 0) + 1
+        # Track message count
+        state["message_count"] = state.get("message_count", 0) + 1
 
     logger.info("Processing message (msg_id=%d)", message_id)
 
@@ -865,6 +896,215 @@ def process_update(
     logger.info("Message processed successfully (msg_id=%d)", message_id)
 
 
+# =============================================
+# UPDATE PIPELINE (asyncio)
+# =============================================
+
+def route_key(update: dict, branch_name: str) -> Hashable:
+    """
+    Conversation key for an update: (chat_id, branch).
+
+    Updates with the same key are handled in order by one worker; different
+    keys are handled concurrently.
+
+    Args:
+        update: Telegram update dict
+        branch_name: Branch this bot serves
+
+    Returns:
+        (chat_id string, branch_name) tuple
+    """
+    message = update.get("message") or update.get("edited_message") or {}
+    return str(message.get("chat", {}).get("id", "")), branch_name
+
+
+def _checkpoint_offset(pipeline: dict) -> int:
+    """Oldest unfinished update_id, or the next fetch offset when all are done."""
+    in_flight = pipeline["in_flight"]
+    return min(in_flight) if in_flight else pipeline["next_offset"]
+
+
+def _maybe_checkpoint(pipeline: dict, force: bool = False) -> None:
+    """Write the offset checkpoint once enough updates or time have passed."""
+    offset = _checkpoint_offset(pipeline)
+    if offset <= pipeline["saved_offset"]:
+        return
+    due = (
+        force
+        or pipeline["unsaved"] >= pipeline["checkpoint_every"]
+        or time.monotonic() - pipeline["saved_at"] >= pipeline["checkpoint_interval"]
+    )
+    if not due:
+        return
+    try:
+        pipeline["checkpoint"](offset)
+    except Exception as e:
+        pipeline["logger"].error("Offset checkpoint failed: %s", e)
+        return
+    pipeline["saved_offset"] = offset
+    pipeline["saved_at"] = time.monotonic()
+    pipeline["unsaved"] = 0
+    pipeline["stats"]["checkpoints"] += 1
+
+
+async def _finish_update(pipeline: dict, update_id: int) -> None:
+    """Mark an update finished, checkpoint if due, and wake a paused fetcher."""
+    pipeline["in_flight"].discard(update_id)
+    pipeline["unsaved"] += 1
+    _maybe_checkpoint(pipeline)
+    async with pipeline["slots"]:
+        pipeline["slots"].notify_all()
+
+
+async def _conversation_worker(pipeline: dict, key: Hashable, queue: asyncio.Queue) -> None:
+    """Handle one conversation's updates in order; exit after WORKER_IDLE_TIMEOUT idle."""
+    logger = pipeline["logger"]
+    while True:
+        try:
+            update = await asyncio.wait_for(queue.get(), pipeline["idle_timeout"])
+        except asyncio.TimeoutError:
+            if queue.empty():
+                pipeline["workers"].pop(key, None)
+                return
+            continue
+
+        update_id = update.get("update_id", 0)
+        try:
+            await asyncio.to_thread(pipeline["handle"], update)
+            pipeline["stats"]["processed"] += 1
+        except Exception as e:
+            pipeline["stats"]["errors"] += 1
+            logger.error("Error handling update %s: %s: %s", update_id, type(e).__name__, e)
+        finally:
+            queue.task_done()
+            await _finish_update(pipeline, update_id)
+
+
+async def _dispatch(pipeline: dict, update: dict) -> None:
+    """Queue an update on its conversation's worker, or answer busy if that queue is full."""
+    update_id = update.get("update_id", 0)
+    key = pipeline["route"](update)
+
+    worker = pipeline["workers"].get(key)
+    if worker is None:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=pipeline["queue_size"])
+        task = asyncio.create_task(_conversation_worker(pipeline, key, queue))
+        worker = pipeline["workers"][key] = {"queue": queue, "task": task}
+
+    pipeline["in_flight"].add(update_id)
+    try:
+        worker["queue"].put_nowait(update)
+        return
+    except asyncio.QueueFull:
+        pass
+
+    # Conversation is busy: tell the sender instead of growing the backlog
+    pipeline["stats"]["busy"] += 1
+    pipeline["logger"].warning("Conversation %s busy - update %s not queued", key, update_id)
+    if pipeline["notify_busy"]:
+        try:
+            await asyncio.to_thread(pipeline["notify_busy"], update)
+        except Exception as e:
+            pipeline["logger"].error("Busy notice failed: %s", e)
+    await _finish_update(pipeline, update_id)
+
+
+async def run_update_pipeline(
+    fetch: Callable[[int], list],
+    handle: Callable[[dict], None],
+    offset: int,
+    checkpoint: Callable[[int], None],
+    state: dict,
+    logger: logging.Logger,
+    route: Callable[[dict], Hashable],
+    notify_busy: Optional[Callable[[dict], None]] = None,
+    queue_size: int = WORKER_QUEUE_SIZE,
+    max_in_flight: int = MAX_IN_FLIGHT,
+    checkpoint_every: int = OFFSET_CHECKPOINT_UPDATES,
+    checkpoint_interval: float = OFFSET_CHECKPOINT_INTERVAL,
+    idle_timeout: float = WORKER_IDLE_TIMEOUT,
+) -> int:
+    """
+    Fetch updates and hand them to per-conversation workers until state["running"] is False.
+
+    Args:
+        fetch: Blocking long-poll, fetch(offset) -> list of updates
+        handle: Blocking per-update handler (runs in a worker thread)
+        offset: Starting update offset
+        checkpoint: Persists an offset, checkpoint(offset)
+        state: Mutable state dict; "running" stops the loop, "pipeline_stats" is filled in
+        logger: Logger instance
+        route: Conversation key for an update (see route_key)
+        notify_busy: Called with an update dropped because its conversation is busy
+        queue_size: Queued updates per conversation before it counts as busy
+        max_in_flight: Unfinished updates before fetching pauses
+        checkpoint_every: Finished updates between offset checkpoints
+        checkpoint_interval: Seconds between offset checkpoints
+        idle_timeout: Seconds before an idle conversation worker exits
+
+    Returns:
+        The final checkpointed offset
+    """
+    stats = {"fetched": 0, "processed": 0, "errors": 0, "busy": 0, "checkpoints": 0}
+    state["pipeline_stats"] = stats
+    pipeline = {
+        "handle": handle,
+        "route": route,
+        "notify_busy": notify_busy,
+        "checkpoint": checkpoint,
+        "logger": logger,
+        "queue_size": queue_size,
+        "idle_timeout": idle_timeout,
+        "checkpoint_every": checkpoint_every,
+        "checkpoint_interval": checkpoint_interval,
+        "workers": {},
+        "in_flight": set(),
+        "next_offset": offset,
+        "saved_offset": offset,
+        "saved_at": time.monotonic(),
+        "unsaved": 0,
+        "slots": asyncio.Condition(),
+        "stats": stats,
+    }
+
+    while state["running"]:
+        # Backpressure: stop pulling from Telegram while too much is unfinished
+        async with pipeline["slots"]:
+            await pipeline["slots"].wait_for(
+                lambda: len(pipeline["in_flight"]) < max_in_flight or not state["running"]
+            )
+        if not state["running"]:
+            break
+
+        try:
+            updates = await asyncio.to_thread(fetch, pipeline["next_offset"])
+        except Exception as e:
+            logger.error("Error in poll loop: %s: %s", type(e).__name__, e)
+            await asyncio.sleep(POLL_ERROR_BACKOFF)
+            continue
+
+        for update in updates:
+            update_id = update.get("update_id", 0)
+            if update_id < pipeline["next_offset"]:
+                continue
+            pipeline["next_offset"] = update_id + 1
+            stats["fetched"] += 1
+            await _dispatch(pipeline, update)
+
+        _maybe_checkpoint(pipeline)
+
+    # Drain: let queued updates finish, then write the final checkpoint
+    tasks = [worker["task"] for worker in pipeline["workers"].values()]
+    for worker in list(pipeline["workers"].values()):
+        await worker["queue"].join()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    _maybe_checkpoint(pipeline, force=True)
+    return pipeline["saved_offset"]
+
+
 # =============================================
 # RUN - CONFIG-DRIVEN ENTRY POINT
 # =============================================
@@ -886,8 +1126,8 @@ def run(
     assistant_chat.py and test_chat.py. All bot-specific values are
     passed as parameters.
 
-    Sets up logging, lock file, signal handlers, and enters the long-polling
-    loop. Runs indefinitely until SIGTERM/SIGINT.
+    Sets up logging, lock file, signal handlers, and runs the asyncio update
+    pipeline (run_update_pipeline). Runs indefinitely until SIGTERM/SIGINT.
 
     Args:
         branch_name: Branch identifier (e.g., "assistant", "test").
@@ -919,7 +1159,7 @@ def run(
 
     # Mutable state (dict to avoid global keyword)
     state = {
-        "last_message_time": 0.0,
+        "last_message_time": {},
         "running": True,
         "message_count": 0,
         "start_time": time.time(),
@@ -977,47 +1217,48 @@ def cleanup():
     offset = load_offset(offset_file, logger)
     logger.info("Starting poll loop (offset=%d)", offset)
 
-    # ---- Main polling loop ----
+    # ---- Update pipeline ----
+
+    def fetch(current_offset: int) -> list:
+        # Update uptime for /status command
+        elapsed = time.time() - state["start_time"]
+        hours, remainder = divmod(int(elapsed), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        state["uptime"] = f"{hours}h {minutes}m {seconds}s"
+        return poll_updates(bot_token, current_offset, logger)
+
+    def handle(update: dict) -> None:
+        process_update(
+            update=update,
+            bot_token=bot_token,
+            branch_name=branch_name,
+            session_name=session_name,
+            work_dir=work_dir,
+            pending_file=pending_file,
+            bot_name=bot_name,
+            custom_commands=custom_commands,
+            state=state,
+            logger=logger,
+        )
 
-    while state["running"]:
-        try:
-            # Update uptime for /status command
-            elapsed = time.time() - state["start_time"]
-            hours, remainder = divmod(int(elapsed), 3600)
-            minutes, seconds = divmod(remainder, 60)
-            state["uptime"] = f"{hours}h {minutes}m {seconds}s"
-
-            updates = poll_updates(bot_token, offset, logger)
-
-            for update in updates:
-                if not state["running"]:
-                    break
-
-                process_update(
-                    update=update,
-                    bot_token=bot_token,
-                    branch_name=branch_name,
-                    session_name=session_name,
-                    work_dir=work_dir,
-                    pending_file=pending_file,
-                    bot_name=bot_name,
-                    custom_commands=custom_commands,
-                    state=state,
-                    logger=logger,
-                )
-
-                # Advance offset past this update
-                new_offset = update.get("update_id", 0) + 1
-                if new_offset > offset:
-                    offset = new_offset
-                    save_offset(offset, offset_file, logger)
-
-        except KeyboardInterrupt:
-            logger.info("KeyboardInterrupt received")
-            break
-        except Exception as e:
-            logger.error("Error in poll loop: %s: %s", type(e).__name__, e)
-            time.sleep(5)  # Back off on error
+    def notify_busy(update: dict) -> None:
+        chat_id, _ = route_key(update, branch_name)
+        if chat_id == PATRICK_CHAT_ID:
+            send_telegram_message(bot_token, chat_id, BUSY_MESSAGE, logger)
+
+    try:
+        asyncio.run(run_update_pipeline(
+            fetch=fetch,
+            handle=handle,
+            offset=offset,
+            checkpoint=lambda new_offset: save_offset(new_offset, offset_file, logger),
+            state=state,
+            logger=logger,
+            route=lambda update: route_key(update, branch_name),
+            notify_busy=notify_busy,
+        ))
+    except KeyboardInterrupt:
+        logger.info("KeyboardInterrupt received")
 
     logger.info("Poll loop exited")
     return 0
@@ -0,0 +1,337 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: transcript_tail.py - Claude Transcript Tail Tracker
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: api/handlers/telegram
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial - per-session (inode, offset, lines) tracking, append-only reads
+#
+# CODE STANDARDS:
+#   - Pure functions with proper error raising
+#   - No Prax imports (handler tier 3)
+# =============================================
+
+"""
+Claude Transcript Tail Tracker
+
+Claude Code appends one JSON record per line to
+~/.claude/projects/{slug}/{session_id}.jsonl, and long-lived tmux sessions
+grow these transcripts to hundreds of MB. Instead of re-reading the whole
+file per message, a position is kept per branch session:
+
+    {"path", "inode", "offset", "lines", "reply"}
+
+- offset/lines: bytes and complete lines already consumed
+- reply: assistant text seen since the last user prompt
+
+Only bytes past the offset are read, and only complete lines are consumed
+(a record still being written is picked up on the next read). A changed
+inode (rotation) or a file shorter than the offset (truncation) restarts
+the position at the top of the new file.
+
+File location: ~/.aipass/telegram_transcript_tail.json
+Format: {"{branch_name}:{session_id}": position}
+
+Thread-safe via fcntl.flock file locking.
+"""
+
+# Infrastructure
+import sys
+from pathlib import Path
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+# Standard library
+import fcntl
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("telegram_transcript_tail")
+
+CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
+TAIL_STATE_FILE = Path.home() / ".aipass" / "telegram_transcript_tail.json"
+
+# Read size when counting lines in a transcript seen for the first time
+COUNT_CHUNK_SIZE = 1024 * 1024
+
+
+# =============================================
+# PATHS
+# =============================================
+
+def get_transcript_path(branch_path: Path, session_id: str) -> Path:
+    """
+    Locate the Claude Code transcript for a session.
+
+    Args:
+        branch_path: Working directory the session runs in
+        session_id: Claude Code session ID
+
+    Returns:
+        Path to the session's JSONL transcript (may not exist yet)
+    """
+    slug = str(branch_path).replace("/", "-")
+    return CLAUDE_PROJECTS_DIR / slug / f"{session_id}.jsonl"
+
+
+# =============================================
+# STATE FILE
+# =============================================
+
+def _update_state(key: str, update) -> Dict[str, Any]:
+    """
+    Apply `update(position) -> position` to one entry under an exclusive lock.
+    An update returning None removes the entry.
+
+    Returns:
+        The updated position
+    """
+    TAIL_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(TAIL_STATE_FILE, "a+", encoding="utf-8") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            f.seek(0)
+            try:
+                data = json.loads(f.read() or "{}")
+            except json.JSONDecodeError:
+                data = {}
+            if not isinstance(data, dict):
+                data = {}
+
+            position = update(data.get(key))
+            if position is None:
+                data.pop(key, None)
+            else:
+                data[key] = position
+
+            f.seek(0)
+            f.truncate()
+            json.dump(data, f, indent=2)
+            f.flush()
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    return position
+
+
+def get_position(branch_name: str, session_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the stored position for a branch session.
+
+    Returns:
+        Position dict, or None if the session has not been tracked
+    """
+    if not TAIL_STATE_FILE.exists():
+        return None
+    try:
+        with open(TAIL_STATE_FILE, "r", encoding="utf-8") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+            try:
+                data = json.load(f)
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return data.get(f"{branch_name}:{session_id}") if isinstance(data, dict) else None
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("Failed to read transcript tail state: %s", e)
+        return None
+
+
+def clear_position(branch_name: str, session_id: str) -> bool:
+    """
+    Forget the stored position for a branch session.
+
+    Returns:
+        True if an entry was removed
+    """
+    removed = []
+
+    def drop(position):
+        removed.append(position)
+        return None
+
+    try:
+        _update_state(f"{branch_name}:{session_id}", drop)
+    except OSError as e:
+        logger.warning("Failed to clear transcript tail state: %s", e)
+        return False
+    return bool(removed[0]) if removed else False
+
+
+# =============================================
+# READING
+# =============================================
+
+def _new_position(path: Path, inode: int) -> Dict[str, Any]:
+    return {"path": str(path), "inode": inode, "offset": 0, "lines": 0, "reply": []}
+
+
+def read_appended(path: Path, position: Optional[Dict[str, Any]],
+                  parse: bool = True) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Read the complete records appended to a transcript since `position`.
+
+    Args:
+        path: Transcript file
+        position: Previous position (None = start of file)
+        parse: Decode the new lines as JSON; False only advances the position
+
+    Returns:
+        (new records, new position). A missing file returns ([], position).
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return [], position or _new_position(path, 0)
+
+    if (not position or position.get("inode") != stat.st_ino
+            or position.get("path") != str(path) or stat.st_size < position.get("offset", 0)):
+        if position:
+            logger.info("Transcript %s rotated or truncated - restarting from the top", path.name)
+        position = _new_position(path, stat.st_ino)
+    else:
+        position = dict(position)
+
+    start = position["offset"]
+    if stat.st_size == start:
+        return [], position
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        if not parse:
+            # Count newlines in chunks; the final partial line stays unconsumed
+            lines, consumed, tail = 0, start, b""
+            while True:
+                chunk = f.read(COUNT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                lines += chunk.count(b"\n")
+                cut = chunk.rfind(b"\n")
+                if cut >= 0:
+                    consumed += len(tail) + cut + 1
+                    tail = chunk[cut + 1:]
+                else:
+                    tail += chunk
+            position["offset"] = consumed
+            position["lines"] += lines
+            return [], position
+        data = f.read(stat.st_size - start)
+
+    cut = data.rfind(b"\n")
+    if cut < 0:
+        return [], position
+    complete = data[:cut + 1]
+    position["offset"] = start + len(complete)
+    position["lines"] += complete.count(b"\n")
+
+    records = []
+    for line in complete.splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return records, position
+
+
+def _text_blocks(record: Dict[str, Any]) -> List[str]:
+    """Text content of a transcript record (tool_use/tool_result blocks skipped)"""
+    content = (record.get("message") or {}).get("content")
+    if isinstance(content, str):
+        return [content] if content.strip() else []
+    if not isinstance(content, list):
+        return []
+    return [block.get("text", "") for block in content
+            if isinstance(block, dict) and block.get("type") == "text" and block.get("text", "").strip()]
+
+
+def apply_records(reply: List[str], records: List[Dict[str, Any]]) -> List[str]:
+    """
+    Fold new records into the reply being assembled.
+
+    A user prompt (a user record with text) starts a new reply; assistant
+    text blocks are appended. Tool results are user records without text
+    and do not reset the reply.
+
+    Returns:
+        Assistant text blocks since the last user prompt
+    """
+    reply = list(reply)
+    for record in records:
+        kind = record.get("type")
+        if kind == "user":
+            if _text_blocks(record):
+                reply = []
+        elif kind == "assistant":
+            reply.extend(_text_blocks(record))
+    return reply
+
+
+# =============================================
+# SESSION TRACKING
+# =============================================
+
+def mark_position(branch_name: str, branch_path: Path, session_id: str) -> Dict[str, Any]:
+    """
+    Advance a session's position to the end of its transcript.
+
+    Called when a message is injected: everything before this point belongs
+    to earlier turns, so the reply starts empty. Only bytes appended since
+    the previous mark or pickup are read.
+
+    Args:
+        branch_name: Branch the session belongs to
+        branch_path: Working directory of the session
+        session_id: Claude Code session ID
+
+    Returns:
+        Position dict (offset/lines 0 when there is no transcript yet)
+    """
+    path = get_transcript_path(branch_path, session_id)
+
+    def advance(position):
+        _, position = read_appended(path, position, parse=False)
+        position["reply"] = []
+        return position
+
+    try:
+        return _update_state(f"{branch_name}:{session_id}", advance)
+    except OSError as e:
+        logger.warning("Failed to track transcript position: %s", e)
+        _, position = read_appended(path, None, parse=False)
+        return position
+
+
+def pick_up_reply(branch_name: str, branch_path: Path, session_id: str) -> Optional[str]:
+    """
+    Read the records appended since the last mark/pickup and return the reply.
+
+    Args:
+        branch_name: Branch the session belongs to
+        branch_path: Working directory of the session
+        session_id: Claude Code session ID
+
+    Returns:
+        Assistant text since the last user prompt, or None if there is none yet
+    """
+    path = get_transcript_path(branch_path, session_id)
+
+    def advance(position):
+        # A rotated/truncated transcript comes back as a fresh position with an empty reply
+        records, position = read_appended(path, position)
+        position["reply"] = apply_records(position.get("reply", []), records)
+        return position
+
+    try:
+        position = _update_state(f"{branch_name}:{session_id}", advance)
+    except OSError as e:
+        logger.warning("Failed to read transcript tail: %s", e)
+        return None
+
+    reply = position.get("reply") or []
+    return "\n".join(reply) if reply else None
+
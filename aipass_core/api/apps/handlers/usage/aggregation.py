@@ -4,12 +4,14 @@
 # META DATA HEADER
 # Name: aggregation.py - Usage Aggregation Handler
 # Date: 2025-11-15
-# Version: 1.0.0
+# Version: 1.4.0
 # Category: api/handlers/usage
 #
 # CHANGELOG (Max 5 entries):
-#   - v1.0.0 (2025-11-15): Initial handler - usage stats aggregation
 #   - v1.1.0 (2025-11-16): Extracted aggregation logic from archive
+#   - v1.2.0 (2026-10-18): Totals replayed from the append-only usage log on top of legacy JSON
+#   - v1.3.0 (2026-10-18): Queries answered from usage store rollup tables
+#   - v1.4.0 (2026-10-18): get_cache_summary() - response cache hit rate and saved latency
 # =============================================
 
 """
@@ -21,8 +23,12 @@
 - Cost, token, and latency aggregation
 - Model usage tracking and breakdown
 
+Queries read the rollup tables of the usage store (store.py), so their cost
+does not grow with the number of recorded generations.
+
 Extracted from: /home/aipass/aipass_core/api/apps/archive.temp/api_usage.py
-Functions: get_caller_usage(), get_session_summary(), get_daily_usage()
+Functions: get_caller_usage(), get_session_summary(), get_daily_usage(),
+get_model_breakdown(), get_cache_summary()
 """
 
 # AIPASS_ROOT setup
@@ -35,8 +41,7 @@
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
-# Standard library for JSON operations
-import json
+from api.apps.handlers.usage import store
 
 
 # =============================================
@@ -44,8 +49,6 @@
 # =============================================
 
 MODULE_NAME = "aggregation"
-DATA_FILE = "usage_tracker_data.json"  # Standard 3-file pattern
-API_JSON_DIR = AIPASS_ROOT / "api" / "api_json"
 
 
 # =============================================
@@ -64,22 +67,8 @@ def get_caller_usage(caller: str) -> Dict[str, Any]:
         Returns empty dict {} if no data found
     """
     try:
-        # Load usage data from JSON
-        data_path = API_JSON_DIR / DATA_FILE
-        if not data_path.exists():
-            # logger.info(f"[{MODULE_NAME}] No usage data file found")
-            return {}
-
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        if not data or "data" not in data:
-            # logger.info(f"[{MODULE_NAME}] No usage data available")
-            return {}
-
-        # Extract caller-specific data
-        usage_by_caller = data["data"].get("usage_by_caller", {})
-        caller_data = usage_by_caller.get(caller, {})
+        # Caller rollup + per-model counts
+        caller_data = store.get_caller_rollup(caller)
 
         if not caller_data:
             # logger.info(f"[{MODULE_NAME}] No usage data found for caller: {caller}")
@@ -105,21 +94,8 @@ def get_session_summary(session_id: Optional[str] = None) -> Dict[str, Any]:
         Returns empty dict {} if no session data found
     """
     try:
-        # Load usage data from JSON
-        data_path = API_JSON_DIR / DATA_FILE
-        if not data_path.exists():
-            # logger.info(f"[{MODULE_NAME}] No session data file found")
-            return {}
-
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        if not data or "data" not in data:
-            # logger.info(f"[{MODULE_NAME}] No session data available")
-            return {}
-
-        # Extract session summary
-        session_data = data["data"].get("current_session", {})
+        # Sum of caller rollups
+        session_data = store.get_session_totals()
 
         if not session_data:
             # logger.info(f"[{MODULE_NAME}] No session summary found")
@@ -149,22 +125,8 @@ def get_daily_usage(date: Optional[str] = None) -> Dict[str, Any]:
         if not date:
             date = datetime.now().date().isoformat()
 
-        # Load usage data from JSON
-        data_path = API_JSON_DIR / DATA_FILE
-        if not data_path.exists():
-            # logger.info(f"[{MODULE_NAME}] No daily usage data file found")
-            return {}
-
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        if not data or "data" not in data:
-            # logger.info(f"[{MODULE_NAME}] No daily usage data available")
-            return {}
-
-        # Extract daily totals
-        daily_totals = data["data"].get("daily_totals", {})
-        daily_data = daily_totals.get(date, {})
+        # Daily rollup row
+        daily_data = store.get_daily_rollup(date)
 
         if not daily_data:
             # logger.info(f"[{MODULE_NAME}] No usage data found for date: {date}")
@@ -255,35 +217,8 @@ def get_model_breakdown(caller: Optional[str] = None) -> Dict[str, Dict[str, int
         Returns empty dict {} if no data found
     """
     try:
-        data_path = API_JSON_DIR / DATA_FILE
-        if not data_path.exists():
-            # logger.info(f"[{MODULE_NAME}] No model breakdown data file found")
-            return {}
-
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        if not data or "data" not in data:
-            # logger.info(f"[{MODULE_NAME}] No model breakdown data available")
-            return {}
-
-        model_stats = {}
-        usage_by_caller = data["data"].get("usage_by_caller", {})
-
-        if caller:
-            # Single caller breakdown
-            caller_data = usage_by_caller.get(caller, {})
-            models_used = caller_data.get("models_used", {})
-            for model, count in models_used.items():
-                model_stats[model] = {"requests": count}
-        else:
-            # Global breakdown across all callers
-            for caller_name, caller_data in usage_by_caller.items():
-                models_used = caller_data.get("models_used", {})
-                for model, count in models_used.items():
-                    if model not in model_stats:
-                        model_stats[model] = {"requests": 0}
-                    model_stats[model]["requests"] += count
+        # Caller/model rollup (summed across callers when caller is None)
+        model_stats = store.get_model_rollup(caller)
 
         # logger.info(f"[{MODULE_NAME}] Retrieved model breakdown: {len(model_stats)} models")
         return model_stats
@@ -291,3 +226,37 @@ def get_model_breakdown(caller: Optional[str] = None) -> Dict[str, Dict[str, int
     except Exception as e:
         # logger.error(f"[{MODULE_NAME}] Failed to get model breakdown: {e}")
         return {}
+
+
+def get_cache_summary(caller: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Response cache effectiveness for one caller or all callers
+
+    Args:
+        caller: Optional caller name to filter by (None = all callers)
+
+    Returns:
+        Dict with hits, misses, coalesced, hit_rate (hits + coalesced over
+        all cached-path requests), saved_seconds
+        Returns empty dict {} if no cached requests were recorded
+    """
+    try:
+        counts = store.get_cache_rollup(caller)
+        served = counts["hits"] + counts["coalesced"]
+        total = served + counts["misses"]
+
+        if not total:
+            # logger.info(f"[{MODULE_NAME}] No response cache activity recorded")
+            return {}
+
+        return {
+            "hits": counts["hits"],
+            "misses": counts["misses"],
+            "coalesced": counts["coalesced"],
+            "hit_rate": served / total,
+            "saved_seconds": counts["saved_ms"] / 1000
+        }
+
+    except Exception as e:
+        # logger.error(f"[{MODULE_NAME}] Failed to get cache summary: {e}")
+        return {}
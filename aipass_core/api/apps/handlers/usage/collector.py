@@ -0,0 +1,336 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: collector.py - Background Usage Collector Handler
+# Date: 2026-10-18
+# Version: 1.2.1
+# Category: api/handlers/usage
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.2.1 (2026-10-18): Batches the usage store rejects are re-queued (retried, spilled at exit)
+#   - v1.2.0 (2026-10-18): record_cache_event() - response cache counters written by the worker
+#   - v1.1.0 (2026-10-18): Results stored in the SQLite usage store
+#   - v1.0.0 (2026-10-18): Initial handler - off-caller-path generation metrics collection
+# =============================================
+
+"""
+Background Usage Collector Handler
+
+Takes usage tracking off the request path:
+- enqueue_usage() records (generation_id, caller, model) and returns immediately
+- A worker thread waits DEFAULT_GENERATION_CHECK_DELAY per generation, then looks
+  up every due generation as one batch over a shared HTTP session
+- Lookups that fail are retried later (RETRY_DELAYS) before being logged as failed
+- Each batch of results is one usage store transaction
+  (tracking.append_usage_records -> store.record_usage)
+- Response cache events (record_cache_event) are summed per caller in memory
+  and written by the same worker (tracking.append_cache_stats)
+- A batch the usage store rejects goes back on the queue and is tried again
+  after STORE_RETRY_DELAY (looked-up generations are spilled with the rest at exit)
+
+At interpreter exit the collector waits up to EXIT_FLUSH_SECONDS for
+outstanding lookups, then spills the rest to usage_pending.jsonl; the next
+collector in any process picks them up.
+
+Functions: enqueue_usage(), record_cache_event(), flush_usage(), get_collector_stats()
+"""
+
+# AIPASS_ROOT setup
+import sys
+from pathlib import Path
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+# Standard library imports
+import atexit
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import requests
+
+from api.apps.handlers.usage import tracking
+
+# =============================================
+# MODULE CONSTANTS
+# =============================================
+
+MODULE_NAME = "collector"
+PENDING_FILE = "usage_pending.jsonl"
+
+# Seconds before each retry after a failed lookup (attempt 1 waits the first entry)
+RETRY_DELAYS = (3, 10, 30, 120)
+
+# Concurrent metric lookups per batch
+BATCH_WORKERS = 4
+
+# Seconds before a batch the usage store rejected is written again
+STORE_RETRY_DELAY = 10
+
+# Max seconds the interpreter waits at exit before spilling to the pending file
+EXIT_FLUSH_SECONDS = 5
+
+# =============================================
+# COLLECTOR STATE
+# =============================================
+
+_cond = threading.Condition()
+_pending: List[Dict[str, Any]] = []  # Waiting for their due time
+_cache_counts: Dict[str, Dict[str, float]] = {}  # Response cache counters not yet written
+_cache_due = 0.0  # Monotonic time the cache counters may be written (after a store failure)
+_in_flight = 0
+_worker: Optional[threading.Thread] = None
+_stats = {"enqueued": 0, "recorded": 0, "retried": 0, "failed": 0, "spilled": 0, "recovered": 0,
+          "store_errors": 0}
+
+
+# =============================================
+# PUBLIC API
+# =============================================
+
+def enqueue_usage(generation_id: str, caller: str, model: str = "unknown", api_key: Optional[str] = None) -> None:
+    """
+    Queue a generation for background usage tracking (returns immediately)
+
+    Args:
+        generation_id: OpenRouter generation ID from API response
+        caller: Module name that made the API call
+        model: Model name used for the request
+        api_key: OpenRouter API key (optional, loaded by the worker if not provided)
+    """
+    item = {
+        "generation_id": generation_id,
+        "caller": caller,
+        "model": model,
+        "api_key": api_key,
+        "timestamp": datetime.now().isoformat(),
+        "due": time.monotonic() + tracking.DEFAULT_GENERATION_CHECK_DELAY,
+        "attempts": 0
+    }
+    with _cond:
+        _pending.append(item)
+        _stats["enqueued"] += 1
+        _ensure_worker()
+        _cond.notify_all()
+
+
+def record_cache_event(caller: str, outcome: str, saved_ms: float = 0.0) -> None:
+    """
+    Count a response cache outcome for the usage store (returns immediately)
+
+    Args:
+        caller: Module name that made the call
+        outcome: "hit", "miss" or "coalesced"
+        saved_ms: Upstream latency the caller did not wait for
+    """
+    field = {"hit": "hits", "miss": "misses", "coalesced": "coalesced"}[outcome]
+    with _cond:
+        counts = _cache_counts.setdefault(caller, {"hits": 0, "misses": 0, "coalesced": 0, "saved_ms": 0.0})
+        counts[field] += 1
+        counts["saved_ms"] += saved_ms
+        _ensure_worker()
+        _cond.notify_all()
+
+
+def flush_usage(timeout: Optional[float] = None, spill: bool = True) -> bool:
+    """
+    Wait for queued generations to be recorded
+
+    Args:
+        timeout: Max seconds to wait (None = until done)
+        spill: Write still-unresolved generations to the pending file on timeout
+
+    Returns:
+        True if nothing is left outstanding
+    """
+    with _cond:
+        done = _cond.wait_for(lambda: not _pending and not _cache_counts and _in_flight == 0, timeout)
+        if done or not spill:
+            return done
+        spilled = list(_pending)
+        _pending.clear()
+        _stats["spilled"] += len(spilled)
+    _write_pending(spilled)
+    return False
+
+
+def get_collector_stats() -> Dict[str, Any]:
+    """
+    Counters for this process' collector
+
+    Returns:
+        Dict with enqueued, recorded, retried, failed, spilled, recovered, store_errors, outstanding
+    """
+    with _cond:
+        return {**_stats, "outstanding": len(_pending) + _in_flight}
+
+
+# =============================================
+# WORKER
+# =============================================
+
+def _ensure_worker() -> None:
+    """Start the worker thread on first use (caller holds _cond)"""
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    recovered = _claim_pending()
+    _pending.extend(recovered)
+    _stats["recovered"] += len(recovered)
+    _worker = threading.Thread(target=_run, name="usage-collector", daemon=True)
+    _worker.start()
+
+
+def _run() -> None:
+    """Worker loop - sleep until the earliest due generation, then look up the due batch"""
+    global _in_flight, _cache_due
+    session = requests.Session()
+    while True:
+        with _cond:
+            while True:
+                now = time.monotonic()
+                batch = [item for item in _pending if item["due"] <= now]
+                if batch or (_cache_counts and _cache_due <= now):
+                    break
+                dues = [item["due"] for item in _pending] + ([_cache_due] if _cache_counts else [])
+                _cond.wait(min(dues) - now if dues else None)
+            for item in batch:
+                _pending.remove(item)
+            cache_counts = {}
+            if _cache_due <= now:
+                cache_counts = dict(_cache_counts)
+                _cache_counts.clear()
+            _in_flight += len(batch) + bool(cache_counts)
+
+        cache_stored = not cache_counts or tracking.append_cache_stats(cache_counts)
+
+        records, retry = _lookup_batch(batch, session) if batch else ([], [])
+        stored = not records or tracking.append_usage_records(records)
+
+        with _cond:
+            if not cache_stored:
+                # Keep the counters (plus any counted meanwhile) for the next write
+                for caller, counts in cache_counts.items():
+                    merged = _cache_counts.setdefault(caller, {"hits": 0, "misses": 0, "coalesced": 0, "saved_ms": 0.0})
+                    for field, value in counts.items():
+                        merged[field] += value
+                _cache_due = time.monotonic() + STORE_RETRY_DELAY
+                _stats["store_errors"] += 1
+            if not stored:
+                # Look the generations up again later; at exit they spill to the pending file
+                due = time.monotonic() + STORE_RETRY_DELAY
+                for item in batch:
+                    if item not in retry:
+                        item["due"] = due
+                        _pending.append(item)
+                _stats["store_errors"] += 1
+            else:
+                _stats["recorded"] += sum(1 for r in records if r["status"] == "ok")
+                _stats["failed"] += sum(1 for r in records if r["status"] == "failed")
+            _pending.extend(retry)
+            _stats["retried"] += len(retry)
+            _in_flight -= len(batch) + bool(cache_counts)
+            _cond.notify_all()
+
+
+def _lookup_batch(batch: List[Dict[str, Any]], session: requests.Session):
+    """
+    Query metrics for a batch of due generations
+
+    Returns:
+        (records to append, items to retry)
+    """
+    default_key = None
+    if any(not item["api_key"] for item in batch):
+        try:
+            from api.apps.handlers.auth.keys import get_api_key
+            default_key = get_api_key("openrouter")
+        except Exception:
+            default_key = None
+
+    def lookup(item):
+        api_key = item["api_key"] or default_key
+        if not api_key:
+            return None
+        return tracking.get_generation_metrics(item["generation_id"], api_key, session=session)
+
+    with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(batch))) as pool:
+        results = list(pool.map(lookup, batch))
+
+    records, retry = [], []
+    for item, metrics in zip(batch, results):
+        if metrics:
+            records.append(_record(item, "ok", usage_data=metrics))
+        elif item["attempts"] < len(RETRY_DELAYS):
+            item["due"] = time.monotonic() + RETRY_DELAYS[item["attempts"]]
+            item["attempts"] += 1
+            retry.append(item)
+        else:
+            records.append(_record(item, "failed", error="Failed to retrieve generation metrics"))
+    return records, retry
+
+
+def _record(item: Dict[str, Any], status: str, **fields) -> Dict[str, Any]:
+    """Usage log record for a queued generation"""
+    return {
+        "timestamp": item["timestamp"],
+        "generation_id": item["generation_id"],
+        "caller": item["caller"],
+        "model": item["model"],
+        "status": status,
+        **fields
+    }
+
+
+# =============================================
+# PENDING FILE (cross-process handoff)
+# =============================================
+
+def _write_pending(items: List[Dict[str, Any]]) -> None:
+    """Append unresolved generations to the pending file (API keys are not persisted)"""
+    if not items:
+        return
+    try:
+        tracking.API_JSON_DIR.mkdir(parents=True, exist_ok=True)
+        lines = "".join(
+            json.dumps({k: item[k] for k in ("generation_id", "caller", "model", "timestamp", "attempts")}) + "\n"
+            for item in items
+        )
+        with open(tracking.API_JSON_DIR / PENDING_FILE, 'a', encoding='utf-8') as f:
+            f.write(lines)
+    except Exception:
+        pass  # Usage tracking never fails the caller
+
+
+def _claim_pending() -> List[Dict[str, Any]]:
+    """Atomically take over the pending file left by earlier processes"""
+    pending_path = tracking.API_JSON_DIR / PENDING_FILE
+    if not pending_path.exists():
+        return []
+    claimed = pending_path.with_name(f"{PENDING_FILE}.{os.getpid()}")
+    try:
+        os.replace(pending_path, claimed)
+        with open(claimed, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        claimed.unlink()
+    except OSError:
+        return []  # Another process claimed it first
+
+    items = []
+    now = time.monotonic()
+    for line in lines:
+        try:
+            item = json.loads(line)
+        except ValueError:
+            continue
+        item.update(api_key=None, due=now)
+        items.append(item)
+    return items
+
+
+atexit.register(flush_usage, EXIT_FLUSH_SECONDS)
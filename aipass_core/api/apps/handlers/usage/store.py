@@ -0,0 +1,498 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: store.py - Usage Store Handler
+# Date: 2026-10-18
+# Version: 1.1.0
+# Category: api/handlers/usage
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): cache_rollup table - response cache hits/misses/saved latency per caller
+#   - v1.0.0 (2026-10-18): Initial handler - SQLite usage store with rollup tables
+# =============================================
+
+"""
+Usage Store Handler
+
+SQLite store for API usage (api_json/usage.db):
+- generations: one row per generation, indexed by timestamp
+- daily_rollup / caller_rollup / caller_model_rollup: totals maintained by
+  insert triggers, so aggregation queries read a handful of rows no matter
+  how much history there is
+- Retention is an indexed DELETE on generations; rollups keep their totals
+  (same as the old JSON cleanup, which dropped generations but kept totals)
+- cache_rollup: response cache hits, misses, coalesced calls and saved
+  upstream latency per caller
+
+On first open, the legacy usage_tracker_data.json totals and the earlier
+usage_log.jsonl records are imported once.
+
+Functions: record_usage(), get_caller_rollup(), get_session_totals(),
+get_daily_rollup(), get_model_rollup(), record_cache_stats(),
+get_cache_rollup(), delete_generations_before(), delete_daily_before(),
+count_generations(), count_daily_before()
+"""
+
+# AIPASS_ROOT setup
+import sys
+from pathlib import Path
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+# Standard library imports
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional
+
+# =============================================
+# MODULE CONSTANTS
+# =============================================
+
+MODULE_NAME = "store"
+API_JSON_DIR = AIPASS_ROOT / "api" / "api_json"
+USAGE_DB_FILE = "usage.db"
+LEGACY_DATA_FILE = "usage_tracker_data.json"
+LEGACY_LOG_FILE = "usage_log.jsonl"
+
+# Seconds a writer waits for another process' transaction
+BUSY_TIMEOUT = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (
+    generation_id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    caller TEXT NOT NULL,
+    model TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total_cost REAL NOT NULL DEFAULT 0,
+    tokens_prompt INTEGER NOT NULL DEFAULT 0,
+    tokens_completion INTEGER NOT NULL DEFAULT 0,
+    generation_time INTEGER,
+    latency INTEGER,
+    provider_name TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_generations_timestamp ON generations(timestamp);
+
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    day TEXT PRIMARY KEY,
+    requests INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0,
+    tokens INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS caller_rollup (
+    caller TEXT PRIMARY KEY,
+    requests INTEGER NOT NULL DEFAULT 0,
+    total_cost REAL NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    last_request TEXT
+);
+
+CREATE TABLE IF NOT EXISTS caller_model_rollup (
+    caller TEXT NOT NULL,
+    model TEXT NOT NULL,
+    requests INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (caller, model)
+);
+
+CREATE TABLE IF NOT EXISTS cache_rollup (
+    caller TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0,
+    coalesced INTEGER NOT NULL DEFAULT 0,
+    saved_ms REAL NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+-- Only fresh successful generations count; imported legacy rows are
+-- already included in the imported rollups (status 'legacy')
+CREATE TRIGGER IF NOT EXISTS generations_rollup AFTER INSERT ON generations
+WHEN NEW.status = 'ok'
+BEGIN
+    INSERT INTO daily_rollup (day, requests, cost, tokens)
+    VALUES (substr(NEW.timestamp, 1, 10), 1, NEW.total_cost, NEW.tokens_prompt + NEW.tokens_completion)
+    ON CONFLICT(day) DO UPDATE SET
+        requests = requests + 1,
+        cost = cost + excluded.cost,
+        tokens = tokens + excluded.tokens;
+
+    INSERT INTO caller_rollup (caller, requests, total_cost, total_tokens, last_request)
+    VALUES (NEW.caller, 1, NEW.total_cost, NEW.tokens_prompt + NEW.tokens_completion, NEW.timestamp)
+    ON CONFLICT(caller) DO UPDATE SET
+        requests = requests + 1,
+        total_cost = total_cost + excluded.total_cost,
+        total_tokens = total_tokens + excluded.total_tokens,
+        last_request = max(coalesce(last_request, ''), excluded.last_request);
+
+    INSERT INTO caller_model_rollup (caller, model, requests)
+    VALUES (NEW.caller, NEW.model, 1)
+    ON CONFLICT(caller, model) DO UPDATE SET requests = requests + 1;
+END;
+"""
+
+_initialized = set()
+_init_lock = threading.Lock()
+
+
+# =============================================
+# CONNECTION
+# =============================================
+
+def _db_path(db_path: Optional[Path] = None) -> Path:
+    """Resolve the database path at call time (API_JSON_DIR may be repointed)"""
+    return Path(db_path) if db_path else API_JSON_DIR / USAGE_DB_FILE
+
+
+def connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """
+    Open the usage store, creating the schema and importing legacy data once
+
+    Args:
+        db_path: Database file (default: API_JSON_DIR / USAGE_DB_FILE)
+
+    Returns:
+        sqlite3 connection (caller closes it)
+    """
+    path = _db_path(db_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=BUSY_TIMEOUT)
+    conn.row_factory = sqlite3.Row
+
+    key = str(path.resolve())
+    if key not in _initialized:
+        with _init_lock:
+            if key not in _initialized:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(SCHEMA)
+                _import_legacy(conn, path.parent)
+                _initialized.add(key)
+    return conn
+
+
+# =============================================
+# WRITES
+# =============================================
+
+def _row(record: Dict[str, Any]) -> tuple:
+    """generations row for a usage record (see tracking.append_usage_records)"""
+    metrics = record.get("usage_data") or {}
+    return (
+        record["generation_id"],
+        record["timestamp"],
+        record.get("caller", "unknown"),
+        record.get("model", "unknown"),
+        record.get("status", "ok"),
+        float(metrics.get("total_cost", 0)),
+        int(metrics.get("tokens_prompt", 0)),
+        int(metrics.get("tokens_completion", 0)),
+        metrics.get("generation_time"),
+        metrics.get("latency"),
+        metrics.get("provider_name"),
+        record.get("error")
+    )
+
+
+def _insert(conn: sqlite3.Connection, records: Iterable[Dict[str, Any]]) -> int:
+    """Insert records (duplicate generation ids ignored); returns generations inserted"""
+    # rowcount excludes the trigger's rollup writes
+    return conn.executemany(
+        "INSERT OR IGNORE INTO generations (generation_id, timestamp, caller, model, status, total_cost, "
+        "tokens_prompt, tokens_completion, generation_time, latency, provider_name, error) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (_row(record) for record in records)
+    ).rowcount
+
+
+def record_usage(records: List[Dict[str, Any]], db_path: Optional[Path] = None) -> int:
+    """
+    Store usage records in one transaction; rollups update via trigger
+
+    Args:
+        records: Dicts with timestamp, generation_id, caller, model, status,
+            usage_data (metrics, when ok), error (when failed)
+        db_path: Database file (default: API_JSON_DIR / USAGE_DB_FILE)
+
+    Returns:
+        Number of generations stored (already-stored ids are skipped)
+    """
+    conn = connect(db_path)
+    try:
+        with conn:
+            return _insert(conn, records)
+    finally:
+        conn.close()
+
+
+def record_cache_stats(counts: Dict[str, Dict[str, float]], db_path: Optional[Path] = None) -> None:
+    """
+    Add response cache counters to cache_rollup in one transaction
+
+    Args:
+        counts: {caller: {"hits", "misses", "coalesced", "saved_ms"}}
+        db_path: Database file (default: API_JSON_DIR / USAGE_DB_FILE)
+    """
+    conn = connect(db_path)
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO cache_rollup (caller, hits, misses, coalesced, saved_ms) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(caller) DO UPDATE SET hits = hits + excluded.hits, "
+                "misses = misses + excluded.misses, coalesced = coalesced + excluded.coalesced, "
+                "saved_ms = saved_ms + excluded.saved_ms",
+                [(caller, c.get("hits", 0), c.get("misses", 0), c.get("coalesced", 0), c.get("saved_ms", 0.0))
+                 for caller, c in counts.items()])
+    finally:
+        conn.close()
+
+
+# =============================================
+# ROLLUP QUERIES
+# =============================================
+
+def get_caller_rollup(caller: str, db_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Totals for one caller
+
+    Returns:
+        Dict with requests, total_cost, total_tokens, models_used, last_request; {} if unknown
+    """
+    conn = connect(db_path)
+    try:
+        row = conn.execute("SELECT * FROM caller_rollup WHERE caller = ?", (caller,)).fetchone()
+        if not row:
+            return {}
+        models = conn.execute(
+            "SELECT model, requests FROM caller_model_rollup WHERE caller = ?", (caller,)).fetchall()
+        return {
+            "requests": row["requests"],
+            "total_cost": row["total_cost"],
+            "total_tokens": row["total_tokens"],
+            "models_used": {m["model"]: m["requests"] for m in models},
+            "last_request": row["last_request"]
+        }
+    finally:
+        conn.close()
+
+
+def get_session_totals(db_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    All-time totals (the old current_session block)
+
+    Returns:
+        Dict with start_time, total_requests, total_cost, total_tokens; {} if nothing recorded
+    """
+    conn = connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT count(*) AS callers, coalesce(sum(requests), 0) AS requests, "
+            "coalesce(sum(total_cost), 0.0) AS cost, coalesce(sum(total_tokens), 0) AS tokens "
+            "FROM caller_rollup").fetchone()
+        if not row["callers"]:
+            return {}
+        start = conn.execute("SELECT value FROM meta WHERE key = 'start_time'").fetchone()
+        return {
+            "start_time": start["value"] if start else None,
+            "total_requests": row["requests"],
+            "total_cost": row["cost"],
+            "total_tokens": row["tokens"]
+        }
+    finally:
+        conn.close()
+
+
+def get_daily_rollup(day: str, db_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Totals for one day (YYYY-MM-DD)
+
+    Returns:
+        Dict with requests, cost, tokens; {} if no usage that day
+    """
+    conn = connect(db_path)
+    try:
+        row = conn.execute("SELECT requests, cost, tokens FROM daily_rollup WHERE day = ?", (day,)).fetchone()
+        return dict(row) if row else {}
+    finally:
+        conn.close()
+
+
+def get_model_rollup(caller: Optional[str] = None, db_path: Optional[Path] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Requests per model, for one caller or all callers
+
+    Returns:
+        Dict of {model_name: {"requests": count}}
+    """
+    conn = connect(db_path)
+    try:
+        if caller:
+            rows = conn.execute(
+                "SELECT model, requests FROM caller_model_rollup WHERE caller = ?", (caller,)).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT model, sum(requests) AS requests FROM caller_model_rollup GROUP BY model").fetchall()
+        return {row["model"]: {"requests": row["requests"]} for row in rows}
+    finally:
+        conn.close()
+
+
+def get_cache_rollup(caller: Optional[str] = None, db_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Response cache counters for one caller or all callers
+
+    Returns:
+        Dict with hits, misses, coalesced, saved_ms (zeros if nothing recorded)
+    """
+    conn = connect(db_path)
+    try:
+        query = ("SELECT coalesce(sum(hits), 0) AS hits, coalesce(sum(misses), 0) AS misses, "
+                 "coalesce(sum(coalesced), 0) AS coalesced, coalesce(sum(saved_ms), 0.0) AS saved_ms "
+                 "FROM cache_rollup")
+        if caller:
+            return dict(conn.execute(query + " WHERE caller = ?", (caller,)).fetchone())
+        return dict(conn.execute(query).fetchone())
+    finally:
+        conn.close()
+
+
+# =============================================
+# RETENTION
+# =============================================
+
+def delete_generations_before(cutoff: str, db_path: Optional[Path] = None) -> int:
+    """
+    Delete generation rows older than cutoff (indexed by timestamp; rollups kept)
+
+    Args:
+        cutoff: ISO timestamp
+
+    Returns:
+        Number of generations deleted
+    """
+    conn = connect(db_path)
+    try:
+        with conn:
+            return conn.execute("DELETE FROM generations WHERE timestamp < ?", (cutoff,)).rowcount
+    finally:
+        conn.close()
+
+
+def delete_daily_before(day: str, db_path: Optional[Path] = None) -> int:
+    """
+    Delete daily rollups before day (YYYY-MM-DD)
+
+    Returns:
+        Number of days deleted
+    """
+    conn = connect(db_path)
+    try:
+        with conn:
+            return conn.execute("DELETE FROM daily_rollup WHERE day < ?", (day,)).rowcount
+    finally:
+        conn.close()
+
+
+def count_generations(before: Optional[str] = None, db_path: Optional[Path] = None) -> int:
+    """Number of generation rows (older than `before`, if given)"""
+    conn = connect(db_path)
+    try:
+        if before:
+            return conn.execute("SELECT count(*) FROM generations WHERE timestamp < ?", (before,)).fetchone()[0]
+        return conn.execute("SELECT count(*) FROM generations").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def count_daily_before(day: Optional[str] = None, db_path: Optional[Path] = None) -> int:
+    """Number of daily rollups (before `day`, if given)"""
+    conn = connect(db_path)
+    try:
+        if day:
+            return conn.execute("SELECT count(*) FROM daily_rollup WHERE day < ?", (day,)).fetchone()[0]
+        return conn.execute("SELECT count(*) FROM daily_rollup").fetchone()[0]
+    finally:
+        conn.close()
+
+
+# =============================================
+# LEGACY IMPORT
+# =============================================
+
+def _import_legacy(conn: sqlite3.Connection, json_dir: Path) -> None:
+    """Import usage_tracker_data.json totals and usage_log.jsonl records once"""
+    log_path = json_dir / LEGACY_LOG_FILE
+
+    # IMMEDIATE: a second process opening the store waits instead of importing twice
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('start_time', ?)",
+                     (datetime.now().isoformat(),))
+
+        done = conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_json_imported'").fetchone()
+        data_path = json_dir / LEGACY_DATA_FILE
+        if not done and data_path.exists():
+            try:
+                with open(data_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f).get("data", {})
+            except Exception:
+                data = {}  # Unreadable legacy file - nothing to import
+            _import_legacy_totals(conn, data)
+            conn.execute("INSERT INTO meta (key, value) VALUES ('legacy_json_imported', ?)",
+                         (datetime.now().isoformat(),))
+
+        if log_path.exists():
+            records = []
+            with open(log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+            _insert(conn, records)  # Duplicate ids ignored if another process got here first
+
+    try:
+        os.replace(log_path, log_path.with_name(LEGACY_LOG_FILE + ".imported"))
+    except OSError:
+        pass  # No log, or already moved by another process
+
+
+def _import_legacy_totals(conn: sqlite3.Connection, data: Dict[str, Any]) -> None:
+    """Copy legacy aggregate blocks into the rollups (generations as 'legacy' rows)"""
+    start = data.get("current_session", {}).get("start_time")
+    if start:
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'start_time'", (start,))
+
+    for day, totals in data.get("daily_totals", {}).items():
+        conn.execute(
+            "INSERT INTO daily_rollup (day, requests, cost, tokens) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(day) DO UPDATE SET requests = requests + excluded.requests, "
+            "cost = cost + excluded.cost, tokens = tokens + excluded.tokens",
+            (day, totals.get("requests", 0), totals.get("cost", 0.0), totals.get("tokens", 0)))
+
+    for caller, totals in data.get("usage_by_caller", {}).items():
+        conn.execute(
+            "INSERT INTO caller_rollup (caller, requests, total_cost, total_tokens, last_request) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT(caller) DO UPDATE SET "
+            "requests = requests + excluded.requests, total_cost = total_cost + excluded.total_cost, "
+            "total_tokens = total_tokens + excluded.total_tokens",
+            (caller, totals.get("requests", 0), totals.get("total_cost", 0.0),
+             totals.get("total_tokens", 0), totals.get("last_request")))
+        for model, count in totals.get("models_used", {}).items():
+            conn.execute(
+                "INSERT INTO caller_model_rollup (caller, model, requests) VALUES (?, ?, ?) "
+                "ON CONFLICT(caller, model) DO UPDATE SET requests = requests + excluded.requests",
+                (caller, model, count))
+
+    _insert(conn, (
+        {**entry, "generation_id": gen_id, "status": "legacy"}
+        for gen_id, entry in data.get("generation_tracking", {}).items()
+        if entry.get("timestamp")
+    ))
@@ -4,10 +4,14 @@
 # META DATA HEADER
 # Name: tracking.py - Usage Tracking Handler
 # Date: 2025-11-16
-# Version: 1.0.0
+# Version: 1.3.1
 # Category: api/handlers/usage
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.3.1 (2026-10-18): Store write failures logged and returned so the collector retries the batch
+#   - v1.3.0 (2026-10-18): append_cache_stats() - response cache counters into the usage store
+#   - v1.2.0 (2026-10-18): Usage records stored in the SQLite usage store (store.py)
+#   - v1.1.0 (2026-10-18): Append-only usage log replaces JSON rewrite; optional shared HTTP session
 #   - v1.0.0 (2025-11-16): Extracted tracking logic from archive
 # =============================================
 
@@ -17,9 +21,12 @@
 Business logic for tracking API usage from OpenRouter:
 - Query OpenRouter /generation endpoint for real metrics
 - Retrieve cost, tokens (prompt + completion), latency data
-- Store generation tracking data with newest-first ordering
+- Store generation records in the usage store (store.py - SQLite with rollups)
 - Handle HTTP requests with proper error handling
 
+get_response() does not call track_usage() - it queues generations on the
+background collector (collector.py), which uses the functions here.
+
 Extracted from: /home/aipass/aipass_core/api/apps/archive.temp/api_usage.py
 Functions: track_usage(), _get_generation_metrics(), _store_usage_data()
 """
@@ -32,23 +39,28 @@
 
 # Standard library imports
 import json
+import logging
 import requests
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from api.apps.handlers.usage import store
 
 # =============================================
 # MODULE CONSTANTS
 # =============================================
 
 MODULE_NAME = "tracking"
-DATA_FILE = "usage_tracker_data.json"  # Standard 3-file pattern
+DATA_FILE = "usage_tracker_data.json"  # Standard 3-file pattern (legacy totals, imported by store.py)
 API_JSON_DIR = AIPASS_ROOT / "api" / "api_json"
 
 # OpenRouter API configuration
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 GENERATION_ENDPOINT = f"{OPENROUTER_BASE_URL}/generation"
 
+logger = logging.getLogger("usage_tracking")
+
 # Default configuration values
 DEFAULT_GENERATION_CHECK_DELAY = 2  # seconds to wait before querying metrics
 
@@ -64,7 +76,10 @@ def track_usage(generation_id: str, caller: str, model: str = "unknown", api_key
     This is the main entry point for usage tracking. It:
     1. Waits for OpenRouter to process the generation
     2. Queries the /generation endpoint for real metrics
-    3. Stores the usage data with newest-first ordering
+    3. Stores the usage record in the usage store
+
+    Blocks for DEFAULT_GENERATION_CHECK_DELAY - request paths use
+    collector.enqueue_usage() instead.
 
     Args:
         generation_id: OpenRouter generation ID from API response
@@ -116,7 +131,7 @@ def track_usage(generation_id: str, caller: str, model: str = "unknown", api_key
         return {"success": False, "error": str(e)}
 
 
-def get_generation_metrics(generation_id: str, api_key: str) -> Optional[Dict[str, Any]]:
+def get_generation_metrics(generation_id: str, api_key: str, session: Optional[requests.Session] = None) -> Optional[Dict[str, Any]]:
     """
     Query OpenRouter /generation endpoint for real usage metrics
 
@@ -126,6 +141,7 @@ def get_generation_metrics(generation_id: str, api_key: str) -> Optional[Dict[st
     Args:
         generation_id: OpenRouter generation ID
         api_key: OpenRouter API key for authentication
+        session: Optional requests session to reuse connections across lookups
 
     Returns:
         Dict with metrics:
@@ -146,7 +162,7 @@ def get_generation_metrics(generation_id: str, api_key: str) -> Optional[Dict[st
         }
 
         # Query the generation endpoint
-        response = requests.get(
+        response = (session or requests).get(
             f"{GENERATION_ENDPOINT}?id={generation_id}",
             headers=headers,
             timeout=30
@@ -198,13 +214,7 @@ def get_generation_metrics(generation_id: str, api_key: str) -> Optional[Dict[st
 
 def store_usage_data(caller: str, model: str, generation_id: str, metrics: Dict[str, Any]) -> bool:
     """
-    Store usage data with aggregation and newest-first ordering
-
-    Updates:
-    - current_session: Total requests, cost, tokens
-    - usage_by_caller: Per-caller statistics and model tracking
-    - daily_totals: Daily aggregated statistics
-    - generation_tracking: Individual generation details (newest first)
+    Store usage data for one generation in the usage store
 
     Args:
         caller: Module name that made the call
@@ -215,99 +225,55 @@ def store_usage_data(caller: str, model: str, generation_id: str, metrics: Dict[
     Returns:
         True if successfully stored, False on error
     """
-    try:
-        # Ensure API JSON directory exists
-        API_JSON_DIR.mkdir(parents=True, exist_ok=True)
-        data_path = API_JSON_DIR / DATA_FILE
+    return append_usage_records([{
+        "timestamp": datetime.now().isoformat(),
+        "generation_id": generation_id,
+        "caller": caller,
+        "model": model,
+        "status": "ok",
+        "usage_data": metrics
+    }])
 
-        # Load current data or create initial structure
-        if data_path.exists():
-            with open(data_path, 'r', encoding='utf-8') as f:
-                data_wrapper = json.load(f)
-            current_data = data_wrapper.get("data", {})
-        else:
-            current_data = {
-                "current_session": {
-                    "start_time": datetime.now().isoformat(),
-                    "total_requests": 0,
-                    "total_cost": 0.0,
-                    "total_tokens": 0
-                },
-                "usage_by_caller": {},
-                "daily_totals": {},
-                "monthly_totals": {},
-                "generation_tracking": {}
-            }
 
-        # Calculate total tokens
-        total_tokens = metrics["tokens_prompt"] + metrics["tokens_completion"]
-
-        # Update session totals
-        current_data["current_session"]["total_requests"] += 1
-        current_data["current_session"]["total_cost"] += metrics["total_cost"]
-        current_data["current_session"]["total_tokens"] += total_tokens
-
-        # Update per-caller tracking
-        if caller not in current_data["usage_by_caller"]:
-            current_data["usage_by_caller"][caller] = {
-                "requests": 0,
-                "total_cost": 0.0,
-                "total_tokens": 0,
-                "models_used": {},
-                "last_request": None
-            }
+def append_usage_records(records: List[Dict[str, Any]]) -> bool:
+    """
+    Store generation records in the usage store in a single transaction
 
-        caller_data = current_data["usage_by_caller"][caller]
-        caller_data["requests"] += 1
-        caller_data["total_cost"] += metrics["total_cost"]
-        caller_data["total_tokens"] += total_tokens
-        caller_data["last_request"] = datetime.now().isoformat()
-
-        # Track models used by caller
-        if model not in caller_data["models_used"]:
-            caller_data["models_used"][model] = 0
-        caller_data["models_used"][model] += 1
-
-        # Update daily totals
-        today = datetime.now().date().isoformat()
-        if today not in current_data["daily_totals"]:
-            current_data["daily_totals"][today] = {
-                "requests": 0,
-                "cost": 0.0,
-                "tokens": 0
-            }
+    Record format:
+        timestamp, generation_id, caller, model, status ("ok" | "failed"),
+        usage_data (metrics, when ok), error (when failed)
 
-        current_data["daily_totals"][today]["requests"] += 1
-        current_data["daily_totals"][today]["cost"] += metrics["total_cost"]
-        current_data["daily_totals"][today]["tokens"] += total_tokens
+    Args:
+        records: Records to store
 
-        # Store generation details with newest-first ordering
-        new_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "caller": caller,
-            "model": model,
-            "usage_data": metrics
-        }
+    Returns:
+        True if successfully stored, False on error (the caller keeps the records)
+    """
+    try:
+        store.record_usage(records)
+        return True
 
-        # Create new dict with new entry first, then existing entries
-        current_tracking = current_data["generation_tracking"]
-        current_data["generation_tracking"] = {generation_id: new_entry, **current_tracking}
+    except Exception as e:
+        logger.warning("Usage store write failed (%d records): %s", len(records), e)
+        return False
 
-        # Save updated data with proper wrapper structure
-        data_wrapper = {
-            "module_name": "api_usage",
-            "timestamp": datetime.now().isoformat(),
-            "data": current_data
-        }
 
-        with open(data_path, 'w', encoding='utf-8') as f:
-            json.dump(data_wrapper, f, indent=2, ensure_ascii=False)
+def append_cache_stats(counts: Dict[str, Dict[str, float]]) -> bool:
+    """
+    Add response cache counters to the usage store
+
+    Args:
+        counts: {caller: {"hits", "misses", "coalesced", "saved_ms"}}
 
-        # Stored usage data for caller
+    Returns:
+        True if successfully stored, False on error (the caller keeps the counters)
+    """
+    try:
+        store.record_cache_stats(counts)
         return True
 
     except Exception as e:
-        # Failed to store usage data
+        logger.warning("Usage store cache stats write failed (%d callers): %s", len(counts), e)
         return False
 
 
@@ -317,7 +283,7 @@ def store_usage_data(caller: str, model: str, generation_id: str, metrics: Dict[
 
 def load_usage_data() -> Dict[str, Any]:
     """
-    Load current usage data from JSON file
+    Load legacy usage totals from the JSON file (written before the usage log)
 
     Returns:
         Dict with usage data or empty dict if file doesn't exist
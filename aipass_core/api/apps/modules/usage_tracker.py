@@ -4,11 +4,13 @@
 # META DATA HEADER
 # Name: usage_tracker.py - Usage Tracking Module
 # Date: 2025-11-15
-# Version: 1.0.0
+# Version: 1.2.0
 # Category: api/modules
 # CODE STANDARDS: Seed v1.0.0
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): stats and caller-usage show response cache hit rate
+#   - v1.1.0 (2026-10-18): cleanup runs against the SQLite usage store
 #   - v1.0.0 (2025-11-15): Initial module - orchestrates usage tracking
 # =============================================
 
@@ -31,7 +33,7 @@
 from prax.apps.modules.logger import system_logger as logger
 from cli.apps.modules import console, header, success, error, warning, section
 from api.apps.handlers.json import json_handler
-from api.apps.handlers.usage import tracking, aggregation, cleanup
+from api.apps.handlers.usage import tracking, aggregation, cleanup, store
 
 
 def print_introspection():
@@ -47,6 +49,7 @@ def print_introspection():
     console.print("  • api.apps.handlers.usage.tracking")
     console.print("  • api.apps.handlers.usage.aggregation")
     console.print("  • api.apps.handlers.usage.cleanup")
+    console.print("  • api.apps.handlers.usage.store")
     console.print("  • api.apps.handlers.json.json_handler")
     console.print()
 
@@ -186,6 +189,8 @@ def show_stats():
     else:
         warning("No usage data available")
 
+    print_cache_summary()
+
 
 def show_session():
     """Orchestrate session summary workflow"""
@@ -224,6 +229,20 @@ def show_caller_usage(args: List[str]):
     else:
         warning(f"No usage data found for caller: {caller}")
 
+    print_cache_summary(caller)
+
+
+def print_cache_summary(caller: str | None = None):
+    """Show response cache effectiveness (only when the cache has been used)"""
+    cache = aggregation.get_cache_summary(caller)
+    if not cache:
+        return
+
+    console.print()
+    console.print(f"  Response Cache: {cache['hit_rate']:.0%} served from cache "
+                  f"({cache['hits']} hits, {cache['coalesced']} coalesced, {cache['misses']} misses)")
+    console.print(f"  Latency Saved: {cache['saved_seconds']:.1f}s")
+
 
 def cleanup_data(args: List[str]):
     """Orchestrate cleanup workflow"""
@@ -232,9 +251,8 @@ def cleanup_data(args: List[str]):
     header(f"Cleanup Old Data (retain {days} days)")
     console.print()
 
-    # Call handler for cleanup
-    API_JSON_DIR = AIPASS_ROOT / "api" / "api_json"
-    data_path = API_JSON_DIR / "usage_tracker_data.json"
+    # Call handler for cleanup (indexed delete on the usage store)
+    data_path = store.API_JSON_DIR / store.USAGE_DB_FILE
     if cleanup.cleanup_old_data(data_path, days):
         success(f"Cleaned up data older than {days} days")
 
@@ -0,0 +1,194 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_caller_detection.py - Caller identification and provisioning cache tests
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: api/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial tests - context/env/stack resolution, provision cache, microbenchmarks
+#
+# CODE STANDARDS:
+#   - Pure pytest with monkeypatch/tmp_path fixtures
+# =============================================
+
+"""
+Caller Detection Test Suite
+
+Covers:
+- Resolution order: caller_context() > AIPASS_CALLER > stack (caller.py)
+- Memoized code-object detection
+- Per-process provisioning cache (provision.py)
+- Per-request overhead before/after
+"""
+
+import inspect
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Infrastructure
+# ---------------------------------------------------------------------------
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+from api.apps.handlers.openrouter import caller, provision
+
+
+# =============================================
+# HELPERS
+# =============================================
+
+def _probe_from(path: Path):
+    """A function whose code object claims to live at `path` and asks for the caller"""
+    namespace = {"get_caller_info": caller.get_caller_info}
+    exec(compile("def probe():\n    return get_caller_info()\n", str(path), "exec"), namespace)
+    return namespace["probe"]
+
+
+def _stack_scan():
+    """The previous implementation: inspect.stack() and path detectors on every call"""
+    for frame_info in inspect.stack()[1:]:
+        info = caller._detect_from_path(Path(frame_info.filename))
+        if info:
+            return info
+    return None
+
+
+def _per_call(func, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats
+
+
+@pytest.fixture(autouse=True)
+def no_env_caller(monkeypatch):
+    monkeypatch.delenv(caller.CALLER_ENV_VAR, raising=False)
+
+
+# =============================================
+# RESOLUTION
+# =============================================
+
+class TestResolution:
+    """Context beats environment beats stack"""
+
+    def test_stack_detection(self, tmp_path):
+        probe = _probe_from(tmp_path / "flow" / "apps" / "handlers" / "plan.py")
+        info = probe()
+        assert info["caller_name"] == "plan"
+        assert info["category"] == "flow"
+        assert info["json_folder"] == tmp_path / "flow" / "flow_json"
+        assert info["detection_method"] == "stack"
+
+        info["caller_name"] = "mutated"
+        assert probe()["caller_name"] == "plan"
+
+    def test_unknown_stack(self):
+        assert caller.get_caller_info() is None
+
+    def test_environment(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(caller.CALLER_ENV_VAR, "flow")
+        info = _probe_from(tmp_path / "prax" / "apps" / "x.py")()
+        assert info["caller_name"] == "flow"
+        assert info["category"] == "flow"
+        assert info["detection_method"] == "environment"
+        assert caller.validate_caller_info(info)
+
+    def test_context_wins_and_resets(self, monkeypatch):
+        monkeypatch.setenv(caller.CALLER_ENV_VAR, "flow")
+        with caller.caller_context("prax_monitor"):
+            info = caller.get_caller_info()
+            assert info["caller_name"] == "prax_monitor"
+            assert info["json_folder"] == AIPASS_ROOT / "prax" / "prax_json"
+            assert info["detection_method"] == "context"
+        assert caller.get_caller_info()["caller_name"] == "flow"
+
+
+# =============================================
+# PROVISIONING CACHE
+# =============================================
+
+class TestProvisionCache:
+    """Config files are read once per process"""
+
+    @pytest.fixture
+    def caller_folder(self, tmp_path, monkeypatch):
+        folder = tmp_path / "flow_json"
+        monkeypatch.setattr(provision, "detect_caller_from_stack", lambda: ("flow_test", folder))
+        provision.clear_provision_cache()
+        yield folder
+        provision.clear_provision_cache()
+
+    def test_config_cached(self, caller_folder, monkeypatch):
+        created = provision.ensure_caller_config()
+        assert (caller_folder / "openrouter_skill_config.json").exists()
+
+        reads = []
+        real_read = provision.read_json
+        monkeypatch.setattr(provision, "read_json", lambda path: reads.append(path) or real_read(path))
+        for _ in range(5):
+            assert provision.ensure_caller_config() == created
+        assert reads == []
+
+        provision.ensure_caller_config()["config"]["ai_model"] = "mutated"
+        assert provision.ensure_caller_config()["config"]["ai_model"] == ""
+
+        provision.clear_provision_cache()
+        provision.ensure_caller_config()
+        assert len(reads) == 1
+
+    def test_name_fallback_folder(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(provision, "detect_caller_from_stack", lambda: (None, None))
+        monkeypatch.setattr(provision, "get_json_folder_path", lambda name: tmp_path / f"{name}_json")
+        provision.clear_provision_cache()
+        assert provision.ensure_caller_config("flow_named")
+        assert (tmp_path / "flow_named_json" / "openrouter_skill_config.json").exists()
+        provision.clear_provision_cache()
+
+
+# =============================================
+# MICROBENCHMARKS
+# =============================================
+
+class TestOverhead:
+    """Per-request identification cost before/after"""
+
+    def test_caller_overhead(self, tmp_path, monkeypatch):
+        probe = _probe_from(tmp_path / "flow" / "apps" / "handlers" / "plan.py")
+        scan_probe = _probe_from(tmp_path / "flow" / "apps" / "handlers" / "plan.py")
+        scan_probe.__globals__["get_caller_info"] = _stack_scan
+
+        before = _per_call(scan_probe, 200)
+        stack = _per_call(probe, 20000)
+        with caller.caller_context("flow_plan"):
+            context = _per_call(caller.get_caller_info, 20000)
+        monkeypatch.setenv(caller.CALLER_ENV_VAR, "flow")
+        environment = _per_call(caller.get_caller_info, 20000)
+
+        print(f"\nget_caller_info: inspect.stack {before * 1e6:.0f} us, memoized stack {stack * 1e6:.1f} us, "
+              f"context {context * 1e6:.1f} us, environment {environment * 1e6:.1f} us")
+        assert stack * 20 < before
+
+    def test_provision_overhead(self, tmp_path, monkeypatch):
+        folder = tmp_path / "flow_json"
+        monkeypatch.setattr(provision, "detect_caller_from_stack", lambda: ("flow_test", folder))
+        provision.clear_provision_cache()
+        provision.ensure_caller_config()
+
+        def uncached():
+            provision.clear_provision_cache()
+            provision.ensure_caller_config()
+
+        before = _per_call(uncached, 500)
+        after = _per_call(provision.ensure_caller_config, 5000)
+        provision.clear_provision_cache()
+
+        print(f"\nensure_caller_config: disk check {before * 1e6:.0f} us, cached {after * 1e6:.1f} us")
+        assert after < before
@@ -0,0 +1,350 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_direct_chat_pipeline.py - Direct chat update pipeline tests
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: api/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial tests - concurrent conversations, backpressure, checkpoints, throughput
+#
+# CODE STANDARDS:
+#   - Pure pytest with monkeypatch fixtures
+#   - Local fake Bot API server - no real Telegram connections
+#   - No real tmux sessions
+# =============================================
+
+"""
+Direct Chat Pipeline Test Suite
+
+Covers:
+- Per-conversation workers: a slow branch does not block other chats (direct_chat.py)
+- Ordering within one conversation
+- Busy notice when a conversation's queue is full
+- Fetch pause while too many updates are unfinished
+- Batched offset checkpoints that never skip unfinished updates
+- Throughput and latency vs the sequential poll loop
+"""
+
+import asyncio
+import json
+import logging
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Infrastructure
+# ---------------------------------------------------------------------------
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+from api.apps.handlers.telegram import direct_chat
+
+TOKEN = "test-token"
+BRANCH = "assistant"
+logger = logging.getLogger("test_direct_chat_pipeline")
+
+
+# =============================================
+# FAKE BOT API
+# =============================================
+
+@pytest.fixture
+def bot_api(monkeypatch):
+    """Local getUpdates/sendMessage server with long-poll and offset confirmation"""
+    state = {"updates": [], "sent": [], "polls": 0, "next_id": 1000, "pushed_at": {}}
+    cond = threading.Condition()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            if url.path.endswith("/getUpdates"):
+                offset = int(query.get("offset", 0))
+                deadline = time.monotonic() + float(query.get("timeout", 0))
+                with cond:
+                    state["polls"] += 1
+                    state["updates"] = [u for u in state["updates"] if u["update_id"] >= offset]
+                    while not state["updates"] and time.monotonic() < deadline:
+                        cond.wait(deadline - time.monotonic())
+                    result = list(state["updates"])
+                self._reply({"ok": True, "result": result})
+            else:
+                self._reply({"ok": False, "description": "not found"})
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with cond:
+                state["sent"].append(body)
+            self._reply({"ok": True, "result": {}})
+
+        def _reply(self, payload):
+            data = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    def push(chat_id, text):
+        with cond:
+            update_id = state["next_id"]
+            state["next_id"] += 1
+            state["updates"].append({"update_id": update_id, "message": {
+                "message_id": update_id, "text": text, "chat": {"id": int(chat_id)}}})
+            state["pushed_at"][update_id] = time.perf_counter()
+            cond.notify_all()
+        return update_id
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(direct_chat, "TELEGRAM_API_BASE", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(direct_chat, "POLL_TIMEOUT", 0.2)
+    state["push"] = push
+    yield state
+    server.shutdown()
+
+
+class PipelineRunner:
+    """Runs run_update_pipeline in a background thread against the fake server"""
+
+    def __init__(self, handle, **options):
+        self.state = {"running": True}
+        self.checkpoints = []
+        self.result = None
+        options.setdefault("route", lambda update: direct_chat.route_key(update, BRANCH))
+        self.thread = threading.Thread(target=self._run, args=(handle, options), daemon=True)
+        self.thread.start()
+
+    def _run(self, handle, options):
+        self.result = asyncio.run(direct_chat.run_update_pipeline(
+            fetch=lambda offset: direct_chat.poll_updates(TOKEN, offset, logger),
+            handle=handle,
+            offset=0,
+            checkpoint=self.checkpoints.append,
+            state=self.state,
+            logger=logger,
+            **options,
+        ))
+
+    @property
+    def stats(self):
+        return self.state.get("pipeline_stats", {})
+
+    def wait_for(self, predicate, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            assert time.monotonic() < deadline, "timed out"
+            time.sleep(0.01)
+
+    def stop(self):
+        self.state["running"] = False
+        self.thread.join(timeout=10)
+        assert not self.thread.is_alive()
+        return self.result
+
+
+def _chat_of(update):
+    return str(update["message"]["chat"]["id"])
+
+
+# =============================================
+# CONCURRENCY
+# =============================================
+
+class TestConversations:
+    """Independent conversations proceed concurrently, each in order"""
+
+    def test_slow_branch_does_not_block_others(self, bot_api):
+        done = []
+
+        def handle(update):
+            if _chat_of(update) == "1":
+                time.sleep(0.5)
+            done.append((_chat_of(update), update["message"]["text"], time.perf_counter()))
+
+        runner = PipelineRunner(handle)
+        start = time.perf_counter()
+        for i in range(3):
+            bot_api["push"](1, f"slow {i}")
+        bot_api["push"](2, "fast a")
+        bot_api["push"](3, "fast b")
+        runner.wait_for(lambda: len(done) == 5)
+        runner.stop()
+
+        fast = [t for chat, _, t in done if chat != "1"]
+        assert max(fast) - start < 0.5
+        assert [text for chat, text, _ in done if chat == "1"] == ["slow 0", "slow 1", "slow 2"]
+
+    def test_handler_errors_do_not_stop_worker(self, bot_api):
+        done = []
+
+        def handle(update):
+            if update["message"]["text"] == "boom":
+                raise RuntimeError("boom")
+            done.append(update["message"]["text"])
+
+        runner = PipelineRunner(handle)
+        bot_api["push"](1, "boom")
+        bot_api["push"](1, "after")
+        runner.wait_for(lambda: done == ["after"])
+        runner.stop()
+        assert runner.stats["errors"] == 1
+
+    def test_idle_workers_exit(self, bot_api):
+        runner = PipelineRunner(lambda update: None, idle_timeout=0.1)
+        bot_api["push"](1, "hi")
+        runner.wait_for(lambda: runner.stats.get("processed") == 1)
+        time.sleep(0.3)
+        assert runner.stop() == bot_api["next_id"]
+
+
+# =============================================
+# BACKPRESSURE
+# =============================================
+
+class TestBackpressure:
+    """Busy conversations are told so; fetching pauses when too much is unfinished"""
+
+    def test_busy_conversation_notice(self, bot_api):
+        release = threading.Event()
+
+        def notify_busy(update):
+            direct_chat.send_telegram_message(TOKEN, _chat_of(update), direct_chat.BUSY_MESSAGE, logger)
+
+        runner = PipelineRunner(lambda update: release.wait(5), queue_size=1, notify_busy=notify_busy)
+        for i in range(4):
+            bot_api["push"](1, f"msg {i}")
+        runner.wait_for(lambda: len(bot_api["sent"]) == 2)
+        release.set()
+        runner.wait_for(lambda: runner.stats.get("processed") == 2)
+        runner.stop()
+
+        assert runner.stats["busy"] == 2
+        assert all(m["text"] == direct_chat.BUSY_MESSAGE for m in bot_api["sent"])
+
+    def test_fetch_pauses_at_max_in_flight(self, bot_api):
+        release = threading.Event()
+        runner = PipelineRunner(lambda update: release.wait(5), max_in_flight=3)
+        for chat in range(3):
+            bot_api["push"](chat + 1, "hold")
+        runner.wait_for(lambda: runner.stats.get("fetched") == 3)
+
+        polls = bot_api["polls"]
+        time.sleep(0.6)
+        assert bot_api["polls"] == polls
+
+        release.set()
+        runner.wait_for(lambda: bot_api["polls"] > polls)
+        runner.stop()
+
+
+# =============================================
+# OFFSET CHECKPOINTS
+# =============================================
+
+class TestCheckpoints:
+    """Checkpoints are batched and never pass an unfinished update"""
+
+    def test_batched_checkpoints(self, bot_api):
+        runner = PipelineRunner(lambda update: None, checkpoint_every=10, checkpoint_interval=60)
+        for i in range(30):
+            bot_api["push"](i % 5 + 1, f"msg {i}")
+        runner.wait_for(lambda: runner.stats.get("processed") == 30)
+        final = runner.stop()
+
+        assert final == bot_api["next_id"]
+        assert runner.checkpoints[-1] == final
+        assert len(runner.checkpoints) <= 4
+        assert runner.checkpoints == sorted(runner.checkpoints)
+
+    def test_checkpoint_holds_at_unfinished_update(self, bot_api):
+        release = threading.Event()
+
+        def handle(update):
+            if _chat_of(update) == "1":
+                release.wait(5)
+
+        runner = PipelineRunner(handle, checkpoint_every=1)
+        blocked = bot_api["push"](1, "slow")
+        for i in range(5):
+            bot_api["push"](2, f"fast {i}")
+        runner.wait_for(lambda: runner.stats.get("processed") == 5)
+
+        assert runner.checkpoints and max(runner.checkpoints) <= blocked
+        release.set()
+        assert runner.stop() == bot_api["next_id"]
+
+
+# =============================================
+# BENCHMARK
+# =============================================
+
+class TestThroughput:
+    """Concurrent chats vs the previous fetch-then-handle-each loop"""
+
+    CHATS = 10
+    PER_CHAT = 8  # fits one WORKER_QUEUE_SIZE burst per chat
+    HANDLE_SECONDS = 0.02
+
+    def _push_all(self, bot_api):
+        for i in range(self.PER_CHAT):
+            for chat in range(self.CHATS):
+                bot_api["push"](chat + 1, f"msg {i}")
+
+    @staticmethod
+    def _latencies(bot_api, done):
+        latencies = sorted(t - bot_api["pushed_at"][uid] for uid, t in done.items())
+        return latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95)]
+
+    def test_throughput_and_latency(self, bot_api):
+        total = self.CHATS * self.PER_CHAT
+
+        # Previous loop: each update handled before the next is looked at
+        done = {}
+        self._push_all(bot_api)
+        start = time.perf_counter()
+        offset = 0
+        while len(done) < total:
+            for update in direct_chat.poll_updates(TOKEN, offset, logger):
+                time.sleep(self.HANDLE_SECONDS)
+                done[update["update_id"]] = time.perf_counter()
+                offset = update["update_id"] + 1
+        sequential = time.perf_counter() - start
+        seq_p50, seq_p95 = self._latencies(bot_api, done)
+        direct_chat.poll_updates(TOKEN, offset, logger)  # confirm the last batch
+
+        # Pipeline
+        done = {}
+
+        def handle(update):
+            time.sleep(self.HANDLE_SECONDS)
+            done[update["update_id"]] = time.perf_counter()
+
+        runner = PipelineRunner(handle)
+        runner.wait_for(lambda: runner.stats.get("fetched") is not None)
+        start = time.perf_counter()
+        self._push_all(bot_api)
+        runner.wait_for(lambda: len(done) == total)
+        concurrent = time.perf_counter() - start
+        runner.stop()
+        p50, p95 = self._latencies(bot_api, done)
+
+        print(f"\n{self.CHATS} chats x {self.PER_CHAT} messages ({self.HANDLE_SECONDS * 1000:.0f} ms each): "
+              f"sequential {total / sequential:.0f} updates/s (p50 {seq_p50 * 1000:.0f} ms, "
+              f"p95 {seq_p95 * 1000:.0f} ms), pipeline {total / concurrent:.0f} updates/s "
+              f"(p50 {p50 * 1000:.0f} ms, p95 {p95 * 1000:.0f} ms)")
+        assert concurrent * 3 < sequential
+        assert p95 < seq_p95
@@ -0,0 +1,234 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_model_catalog.py - OpenRouter model catalog cache tests
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: api/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial tests - disk cache, TTL revalidation, indexes, lookup benchmark
+#
+# CODE STANDARDS:
+#   - Pure pytest with monkeypatch/tmp_path fixtures
+#   - Local stub /models endpoint - no real OpenRouter connections
+# =============================================
+
+"""
+Model Catalog Test Suite
+
+Covers:
+- Persistent catalog file shared across processes (models.py)
+- Stale-while-revalidate with conditional (ETag) refresh
+- Id index and free/pricing buckets vs filter_by_pricing()
+- Lookup latency against the fetch-and-scan path
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Infrastructure
+# ---------------------------------------------------------------------------
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+from api.apps.handlers.openrouter import models
+
+MODEL_COUNT = 2000
+
+
+def _catalog():
+    catalog = []
+    for i in range(MODEL_COUNT):
+        if i % 20 == 0:
+            pricing = {"prompt": "0", "completion": "0"}
+        else:
+            pricing = {"prompt": f"{i * 1e-8:.8f}", "completion": f"{i * 2e-8:.8f}"}
+        catalog.append({"id": f"vendor{i % 40}/model-{i}", "name": f"Model {i}",
+                        "context_length": 8192, "pricing": pricing})
+    catalog.append({"id": "broken/pricing", "pricing": {"prompt": "n/a", "completion": "0"}})
+    return catalog
+
+
+# =============================================
+# FIXTURES
+# =============================================
+
+@pytest.fixture
+def models_server():
+    """Stub /models endpoint with ETag support; `delay` simulates network latency"""
+    body = json.dumps({"data": _catalog()}).encode()
+    state = {"hits": 0, "not_modified": 0, "delay": 0.0, "etag": '"v1"'}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state["hits"] += 1
+            time.sleep(state["delay"])
+            if self.headers.get("If-None-Match") == state["etag"]:
+                state["not_modified"] += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", state["etag"])
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["url"] = f"http://127.0.0.1:{server.server_address[1]}/models"
+    yield state
+    server.shutdown()
+
+
+@pytest.fixture
+def catalog_env(tmp_path, monkeypatch, models_server):
+    """Point the catalog at tmp_path and the stub server"""
+    monkeypatch.setattr(models, "API_JSON_DIR", tmp_path)
+    monkeypatch.setattr(models, "OPENROUTER_API_URL", models_server["url"])
+    monkeypatch.setattr(models, "get_api_key", lambda provider: "key")
+    models.clear_catalog_cache()
+    yield models_server
+    models.clear_catalog_cache()
+
+
+def _age_catalog(tmp_path, seconds):
+    """Backdate the cached catalog (memory and disk) by `seconds`"""
+    path = tmp_path / models.CATALOG_FILE
+    data = json.loads(path.read_text())
+    data["fetched_at"] -= seconds
+    path.write_text(json.dumps(data))
+    models.clear_catalog_cache()
+
+
+def _wait_idle(timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while models.get_catalog_info().get("refreshing") and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+# =============================================
+# CACHE
+# =============================================
+
+class TestCatalogCache:
+    """One fetch serves every lookup; new processes start from the disk copy"""
+
+    def test_single_fetch_for_all_lookups(self, catalog_env, tmp_path):
+        assert len(models.get_available_models()) == MODEL_COUNT + 1
+        assert models.get_model_by_id("vendor3/model-3")["name"] == "Model 3"
+        assert models.get_model_by_id("missing/model") is None
+        assert models.get_free_models()
+        assert catalog_env["hits"] == 1
+        assert (tmp_path / models.CATALOG_FILE).exists()
+
+    def test_new_process_reads_disk_copy(self, catalog_env):
+        models.get_available_models()
+        models.clear_catalog_cache()
+
+        assert models.get_model_by_id("vendor1/model-1")
+        assert catalog_env["hits"] == 1
+
+    def test_stale_copy_served_while_revalidating(self, catalog_env, tmp_path):
+        models.get_available_models()
+        _age_catalog(tmp_path, models.CATALOG_TTL_SECONDS + 60)
+        catalog_env["delay"] = 0.5
+
+        start = time.perf_counter()
+        assert models.get_model_by_id("vendor1/model-1")
+        assert time.perf_counter() - start < 0.2
+
+        _wait_idle()
+        assert catalog_env["not_modified"] == 1
+        info = models.get_catalog_info()
+        assert info["fresh"] and info["models"] == MODEL_COUNT + 1
+
+    def test_changed_catalog_replaces_stale_copy(self, catalog_env, tmp_path):
+        models.get_available_models()
+        _age_catalog(tmp_path, models.CATALOG_TTL_SECONDS + 60)
+        catalog_env["etag"] = '"v2"'
+
+        models.get_free_models()
+        _wait_idle()
+        assert catalog_env["not_modified"] == 0
+        assert catalog_env["hits"] == 2
+        assert json.loads((tmp_path / models.CATALOG_FILE).read_text())["etag"] == '"v2"'
+
+    def test_expired_copy_blocks_for_fetch(self, catalog_env, tmp_path):
+        models.get_available_models()
+        _age_catalog(tmp_path, models.CATALOG_MAX_STALE_SECONDS + 60)
+
+        assert models.get_catalog_info()["fresh"] is False
+        models.get_model_by_id("vendor1/model-1")
+        assert catalog_env["hits"] == 2
+        assert models.get_catalog_info()["fresh"] is True
+
+    def test_expired_copy_used_when_fetch_fails(self, catalog_env, tmp_path, monkeypatch):
+        models.get_available_models()
+        _age_catalog(tmp_path, models.CATALOG_MAX_STALE_SECONDS + 60)
+        monkeypatch.setattr(models, "OPENROUTER_API_URL", "http://127.0.0.1:9/models")
+
+        assert models.get_model_by_id("vendor1/model-1")
+
+
+# =============================================
+# INDEXES
+# =============================================
+
+class TestBuckets:
+    """Precomputed buckets match filter_by_pricing() over the full list"""
+
+    def test_free_bucket(self, catalog_env):
+        all_models = models.get_available_models()
+        assert models.get_free_models() == models.filter_by_pricing(all_models, 0.0)
+
+    @pytest.mark.parametrize("max_cost", [0.0, 1e-6, 5e-6, 1.0])
+    def test_max_cost_bucket(self, catalog_env, max_cost):
+        all_models = models.get_available_models()
+        expected = models.filter_by_pricing(all_models, max_cost)
+        result = models.get_models_by_max_cost(max_cost)
+        assert sorted(m["id"] for m in result) == sorted(m["id"] for m in expected)
+
+
+# =============================================
+# BENCHMARK
+# =============================================
+
+class TestLookupLatency:
+    """Indexed lookups vs fetching and scanning the catalog per call"""
+
+    def test_lookup_benchmark(self, catalog_env):
+        ids = [f"vendor{i % 40}/model-{i}" for i in range(0, MODEL_COUNT, 97)]
+
+        start = time.perf_counter()
+        for model_id in ids:
+            fetched = models.fetch_models_from_api("key")
+            assert next(m for m in fetched if m["id"] == model_id)
+        scan = (time.perf_counter() - start) / len(ids)
+
+        models.get_model_by_id(ids[0])
+        hits_before = catalog_env["hits"]
+        repeats = 1000
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for model_id in ids:
+                assert models.get_model_by_id(model_id)
+        cached = (time.perf_counter() - start) / (repeats * len(ids))
+
+        assert catalog_env["hits"] == hits_before
+        print(f"\nget_model_by_id over {MODEL_COUNT} models: fetch+scan {scan * 1000:.2f} ms, "
+              f"cached index {cached * 1e6:.2f} us")
+        assert cached * 100 < scan
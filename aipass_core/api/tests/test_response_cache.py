@@ -0,0 +1,239 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_response_cache.py - get_response() response cache tests
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: api/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial tests - opt-in, limits, single-flight, usage reporting
+#
+# CODE STANDARDS:
+#   - Pure pytest with monkeypatch/tmp_path fixtures
+#   - Fake OpenAI client - no real OpenRouter connections
+# =============================================
+
+"""
+Response Cache Test Suite
+
+Covers:
+- Opt-in per call and per caller config (client.py, response_cache.py)
+- Key over model, messages and request parameters
+- Per-caller TTL and LRU size limit
+- Single-flight coalescing of concurrent identical requests
+- Hit rate and saved latency in the usage store (collector.py, aggregation.py)
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Infrastructure
+# ---------------------------------------------------------------------------
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+from api.apps.handlers.openrouter import client as or_client
+from api.apps.handlers.openrouter import response_cache
+from api.apps.handlers.usage import aggregation, collector, store, tracking
+
+UPSTREAM_DELAY = 0.2
+
+
+# =============================================
+# FIXTURES
+# =============================================
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch):
+    """Fake OpenRouter client; counts calls, sleeps UPSTREAM_DELAY, can be told to fail"""
+    state = {"calls": 0, "fail": False}
+    lock = threading.Lock()
+
+    def create(**params):
+        with lock:
+            state["calls"] += 1
+            call = state["calls"]
+        time.sleep(UPSTREAM_DELAY)
+        if state["fail"]:
+            raise RuntimeError("upstream down")
+        content = f"answer {call} to {params['messages'][0]['content']}"
+        return SimpleNamespace(
+            id=f"gen-{call}", model=params["model"],
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")]
+        )
+
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(or_client, "get_api_key", lambda provider: "key")
+    monkeypatch.setattr(or_client, "get_cached_client", lambda api_key: fake)
+    monkeypatch.setattr(or_client, "make_api_request",
+                        lambda c, messages, model, retries=0, **kw: _call(c, messages, model, **kw))
+    monkeypatch.setattr(or_client, "enqueue_usage", lambda *args, **kwargs: None)
+    monkeypatch.setattr(response_cache, "API_JSON_DIR", tmp_path)
+    monkeypatch.setattr(store, "API_JSON_DIR", tmp_path)
+    monkeypatch.setattr(tracking, "API_JSON_DIR", tmp_path)
+    yield state
+    collector.flush_usage(timeout=10, spill=False)
+
+
+def _call(client, messages, model, **kwargs):
+    try:
+        return client.chat.completions.create(model=model, messages=messages, **kwargs)
+    except Exception:
+        return None
+
+
+def _configure(tmp_path, block):
+    """Write a response_cache block to api_config.json"""
+    path = tmp_path / response_cache.CONFIG_FILE
+    path.write_text(json.dumps({"config": {"response_cache": block}}))
+    # Same-second rewrites keep the mtime; force a reload
+    response_cache._settings["mtime"] = None
+
+
+def _get(prompt="summarize plan", caller="flow", **kwargs):
+    return or_client.get_response(prompt, caller=caller, model="test/model", **kwargs)
+
+
+# =============================================
+# OPT-IN AND KEYS
+# =============================================
+
+class TestOptIn:
+    """Nothing is cached unless the call or the caller's config asks for it"""
+
+    def test_off_by_default(self, upstream):
+        assert _get()["content"] != _get()["content"]
+        assert upstream["calls"] == 2
+
+    def test_cache_flag(self, upstream):
+        first = _get(cache=True)
+        second = _get(cache=True)
+        assert upstream["calls"] == 1
+        assert second["content"] == first["content"]
+        assert second["cached"] is True
+        assert "cached" not in first
+
+    def test_caller_config_enables(self, upstream, tmp_path):
+        _configure(tmp_path, {"callers": {"flow_plan_summarizer": {"enabled": True}}})
+        _get(caller="flow_plan_summarizer")
+        assert _get(caller="flow_plan_summarizer")["cached"] is True
+        _get(caller="flow_plan_summarizer", cache=False)
+        _get(caller="other")
+        _get(caller="other")
+        assert upstream["calls"] == 4
+
+    def test_key_covers_parameters(self, upstream):
+        _get(cache=True, temperature=0)
+        _get(cache=True, temperature=0.7)
+        _get(cache=True, temperature=0, max_tokens=100)
+        _get("other prompt", cache=True, temperature=0)
+        assert upstream["calls"] == 4
+        assert _get(cache=True, temperature=0)["cached"] is True
+
+    def test_failures_not_cached(self, upstream):
+        upstream["fail"] = True
+        assert _get(cache=True) is None
+        upstream["fail"] = False
+        assert "cached" not in _get(cache=True)
+        assert upstream["calls"] == 2
+
+
+# =============================================
+# LIMITS
+# =============================================
+
+class TestLimits:
+    """Per-caller TTL and size limits"""
+
+    def test_ttl_expiry(self, upstream, tmp_path):
+        _configure(tmp_path, {"callers": {"flow": {"ttl_seconds": 0.3}}})
+        _get(cache=True)
+        assert _get(cache=True)["cached"] is True
+        time.sleep(0.35)
+        assert "cached" not in _get(cache=True)
+        assert upstream["calls"] == 2
+
+    def test_lru_eviction_per_caller(self, upstream, tmp_path, monkeypatch):
+        monkeypatch.setattr(response_cache, "LRU_TOUCH_SECONDS", 0)
+        _configure(tmp_path, {"default": {"max_entries": 2}, "callers": {"nexus": {"max_entries": 10}}})
+        _get("a", cache=True)
+        _get("b", cache=True)
+        _get("a", cache=True)  # a is now most recently used
+        _get("c", cache=True)  # evicts b
+        for prompt in "abc":
+            _get(prompt, caller="nexus", cache=True)
+
+        assert response_cache.get_response_cache_info() == {"flow": 2, "nexus": 3}
+        calls = upstream["calls"]
+        assert _get("a", cache=True)["cached"] is True
+        assert "cached" not in _get("b", cache=True)
+        assert upstream["calls"] == calls + 1
+
+
+# =============================================
+# SINGLE-FLIGHT
+# =============================================
+
+class TestSingleFlight:
+    """Concurrent identical requests share one upstream call"""
+
+    def test_concurrent_requests_coalesce(self, upstream):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(_get(cache=True))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert upstream["calls"] == 1
+        assert len({r["content"] for r in results}) == 1
+
+
+# =============================================
+# USAGE REPORTING
+# =============================================
+
+class TestUsageReporting:
+    """Hit rate and saved latency land in the usage store"""
+
+    def test_cache_summary(self, upstream):
+        _get(cache=True)
+        for _ in range(3):
+            _get(cache=True)
+        threads = [threading.Thread(target=_get, args=("fresh",), kwargs={"cache": True}) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert collector.flush_usage(timeout=10)
+
+        summary = aggregation.get_cache_summary("flow")
+        assert summary["misses"] == 2
+        assert summary["hits"] + summary["coalesced"] == 6
+        assert summary["hit_rate"] == pytest.approx(6 / 8)
+        assert summary["saved_seconds"] >= 5 * UPSTREAM_DELAY
+        assert aggregation.get_cache_summary("nobody") == {}
+
+    def test_hit_latency(self, upstream):
+        start = time.perf_counter()
+        _get(cache=True)
+        miss = time.perf_counter() - start
+
+        repeats = 200
+        start = time.perf_counter()
+        for _ in range(repeats):
+            _get(cache=True)
+        hit = (time.perf_counter() - start) / repeats
+
+        print(f"\nget_response: upstream {miss * 1000:.1f} ms, cache hit {hit * 1000:.2f} ms")
+        assert upstream["calls"] == 1
+        assert hit * 20 < miss
@@ -0,0 +1,262 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_transcript_tail.py - Claude transcript tail tracker tests
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: api/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial tests - append-only reads, rotation/truncation, 100 MB pickup benchmark
+#
+# CODE STANDARDS:
+#   - Pure pytest with monkeypatch/tmp_path fixtures
+#   - No real Claude sessions or Telegram connections
+# =============================================
+
+"""
+Transcript Tail Test Suite
+
+Covers:
+- Position tracking per branch session (transcript_tail.py)
+- Partial trailing records left for the next read
+- Truncation and rotation
+- Reply assembly from new records only
+- Response pickup latency on a 100 MB transcript
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Infrastructure
+# ---------------------------------------------------------------------------
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+from api.apps.handlers.telegram import transcript_tail as tail
+
+BRANCH = "dev_central"
+SESSION = "abc-123"
+
+
+def _user(text):
+    return json.dumps({"type": "user", "message": {"content": [{"type": "text", "text": text}]}}) + "\n"
+
+
+def _assistant(*texts):
+    blocks = [{"type": "text", "text": t} for t in texts]
+    return json.dumps({"type": "assistant", "message": {"content": blocks}}) + "\n"
+
+
+def _tool_result():
+    return json.dumps({"type": "user", "message": {"content": [
+        {"type": "tool_result", "tool_use_id": "t1", "content": "ok"}]}}) + "\n"
+
+
+# =============================================
+# FIXTURES
+# =============================================
+
+@pytest.fixture
+def transcript(tmp_path, monkeypatch):
+    """Empty transcript under a tmp projects dir; state file in tmp_path"""
+    monkeypatch.setattr(tail, "CLAUDE_PROJECTS_DIR", tmp_path / "projects")
+    monkeypatch.setattr(tail, "TAIL_STATE_FILE", tmp_path / "tail.json")
+    branch_path = tmp_path / "branch"
+    path = tail.get_transcript_path(branch_path, SESSION)
+    path.parent.mkdir(parents=True)
+    path.write_text("")
+    return branch_path, path
+
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+# =============================================
+# POSITION TRACKING
+# =============================================
+
+class TestPosition:
+    """Positions advance over appended bytes only"""
+
+    def test_missing_transcript(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tail, "CLAUDE_PROJECTS_DIR", tmp_path / "projects")
+        monkeypatch.setattr(tail, "TAIL_STATE_FILE", tmp_path / "tail.json")
+        position = tail.mark_position(BRANCH, tmp_path / "branch", SESSION)
+        assert position["offset"] == 0 and position["lines"] == 0
+        assert tail.pick_up_reply(BRANCH, tmp_path / "branch", SESSION) is None
+
+    def test_mark_counts_lines(self, transcript):
+        branch_path, path = transcript
+        _append(path, _user("one") + _assistant("two") + _user("three"))
+
+        position = tail.mark_position(BRANCH, branch_path, SESSION)
+        assert position["lines"] == 3
+        assert position["offset"] == path.stat().st_size
+        assert position["inode"] == path.stat().st_ino
+        assert tail.get_position(BRANCH, SESSION) == position
+
+        _append(path, _assistant("four"))
+        assert tail.mark_position(BRANCH, branch_path, SESSION)["lines"] == 4
+
+    def test_partial_record_left_for_next_read(self, transcript):
+        branch_path, path = transcript
+        record = _assistant("finished answer")
+        _append(path, _user("question") + record[:20])
+
+        position = tail.mark_position(BRANCH, branch_path, SESSION)
+        assert position["lines"] == 1
+        assert tail.pick_up_reply(BRANCH, branch_path, SESSION) is None
+
+        _append(path, record[20:])
+        assert tail.pick_up_reply(BRANCH, branch_path, SESSION) == "finished answer"
+        assert tail.get_position(BRANCH, SESSION)["lines"] == 2
+
+    def test_clear_position(self, transcript):
+        branch_path, path = transcript
+        tail.mark_position(BRANCH, branch_path, SESSION)
+        assert tail.clear_position(BRANCH, SESSION) is True
+        assert tail.get_position(BRANCH, SESSION) is None
+        assert tail.clear_position(BRANCH, SESSION) is False
+
+
+# =============================================
+# REPLY PICKUP
+# =============================================
+
+class TestReply:
+    """Replies are assembled from records appended after the mark"""
+
+    def test_reply_after_mark(self, transcript):
+        branch_path, path = transcript
+        _append(path, _user("old") + _assistant("old reply"))
+        tail.mark_position(BRANCH, branch_path, SESSION)
+
+        _append(path, _user("new"))
+        assert tail.pick_up_reply(BRANCH, branch_path, SESSION) is None
+        _append(path, _assistant("Part 1") + _tool_result() + _assistant("Part 2"))
+        assert tail.pick_up_reply(BRANCH, branch_path, SESSION) == "Part 1\nPart 2"
+
+    def test_reply_accumulates_across_pickups(self, transcript):
+        branch_path, path = transcript
+        tail.mark_position(BRANCH, branch_path, SESSION)
+        _append(path, _user("q") + _assistant("first"))
+        assert tail.pick_up_reply(BRANCH, branch_path, SESSION) == "first"
+        _append(path, _assistant("second"))
+        assert tail.pick_up_reply(BRANCH, branch_path, SESSION) == "first\nsecond"
+
+    def test_new_prompt_resets_reply(self, transcript):
+        branch_path, path = transcript
+        tail.mark_position(BRANCH, branch_path, SESSION)
+        _append(path, _user("a") + _assistant("reply a") + _user("b") + _assistant("reply b"))
+        assert tail.pick_up_reply(BRANCH, branch_path, SESSION) == "reply b"
+
+    def test_malformed_lines_skipped(self, transcript):
+        branch_path, path = transcript
+        tail.mark_position(BRANCH, branch_path, SESSION)
+        _append(path, _user("q") + "{not json\n\n" + _assistant("answer"))
+        assert tail.pick_up_reply(BRANCH, branch_path, SESSION) == "answer"
+
+
+# =============================================
+# TRUNCATION AND ROTATION
+# =============================================
+
+class TestRotation:
+    """A replaced or shortened transcript restarts from the top"""
+
+    def test_truncation(self, transcript):
+        branch_path, path = transcript
+        _append(path, _user("long history") * 50)
+        tail.mark_position(BRANCH, branch_path, SESSION)
+
+        path.write_text(_user("q") + _assistant("after truncate"))
+        assert tail.pick_up_reply(BRANCH, branch_path, SESSION) == "after truncate"
+        assert tail.get_position(BRANCH, SESSION)["lines"] == 2
+
+    def test_rotation(self, transcript):
+        branch_path, path = transcript
+        _append(path, _user("q") + _assistant("old file"))
+        tail.mark_position(BRANCH, branch_path, SESSION)
+        old_inode = path.stat().st_ino
+
+        # Replace with a longer file under a new inode
+        rotated = path.with_suffix(".new")
+        rotated.write_text(_user("q") * 10 + _assistant("new file") + _user("x") * 10 + _assistant("latest"))
+        os.replace(rotated, path)
+        assert path.stat().st_ino != old_inode
+
+        assert tail.pick_up_reply(BRANCH, branch_path, SESSION) == "latest"
+        position = tail.get_position(BRANCH, SESSION)
+        assert position["inode"] == path.stat().st_ino
+        assert position["lines"] == 22
+
+
+# =============================================
+# BENCHMARK
+# =============================================
+
+class TestPickupLatency:
+    """Pickup on a 100 MB transcript vs re-reading the whole file"""
+
+    TARGET_BYTES = 100 * 1024 * 1024
+
+    @staticmethod
+    def _full_read_pickup(path):
+        """The previous approach: count every line, then re-read and parse past that line"""
+        text = path.read_text(encoding="utf-8").strip()
+        lines = text.split("\n") if text else []
+        reply = []
+        for line in lines:
+            record = json.loads(line)
+            if record.get("type") == "user":
+                reply = []
+            elif record.get("type") == "assistant":
+                reply.extend(b["text"] for b in record["message"]["content"] if b.get("type") == "text")
+        return len(lines), "\n".join(reply)
+
+    def test_pickup_benchmark(self, transcript):
+        branch_path, path = transcript
+        filler = _user("x" * 900) + _assistant("y" * 900)
+        block = filler * 1000
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(self.TARGET_BYTES // len(block) + 1):
+                f.write(block)
+
+        start = time.perf_counter()
+        first_mark = tail.mark_position(BRANCH, branch_path, SESSION)
+        first_seen = time.perf_counter() - start
+        assert first_mark["offset"] >= self.TARGET_BYTES
+
+        _append(path, _user("status?") + _assistant("all green"))
+        start = time.perf_counter()
+        full_lines, full_reply = self._full_read_pickup(path)
+        full = time.perf_counter() - start
+        assert full_reply == "all green"
+
+        start = time.perf_counter()
+        reply = tail.pick_up_reply(BRANCH, branch_path, SESSION)
+        tailed = time.perf_counter() - start
+        assert reply == "all green"
+        assert tail.get_position(BRANCH, SESSION)["lines"] == full_lines
+
+        _append(path, _user("next") + _assistant("done"))
+        start = time.perf_counter()
+        tail.mark_position(BRANCH, branch_path, SESSION)
+        remark = time.perf_counter() - start
+
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(f"\n{size_mb:.0f} MB transcript: full read+parse {full * 1000:.0f} ms, "
+              f"first mark (line count) {first_seen * 1000:.0f} ms, "
+              f"tail pickup {tailed * 1000:.2f} ms, tail mark {remark * 1000:.2f} ms")
+        assert tailed * 50 < full
+        assert remark * 50 < full
@@ -0,0 +1,266 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_usage_collector.py - Background usage collector tests
+# Date: 2026-10-18
+# Version: 1.1.1
+# Category: api/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.1.1 (2026-10-18): Rejected usage store writes retried and spilled
+#   - v1.1.0 (2026-10-18): Records read back from the SQLite usage store
+#   - v1.0.0 (2026-10-18): Initial tests - collector batching, retries, spill, get_response latency
+#
+# CODE STANDARDS:
+#   - Pure pytest with monkeypatch/tmp_path fixtures
+#   - Local fake /generation endpoint - no real OpenRouter connections
+# =============================================
+
+"""
+Usage Collector Test Suite
+
+Covers:
+- Background metric lookup and usage store writes (collector.py)
+- Retry of generations whose metrics are not ready yet
+- Retry and spill of batches the usage store rejects
+- Pending file spill and claim across processes
+- get_response() latency with tracking off the caller path (client.py)
+- Aggregation over collected usage and imported legacy totals (aggregation.py)
+"""
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Infrastructure
+# ---------------------------------------------------------------------------
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+from api.apps.handlers.usage import aggregation, collector, store, tracking
+from api.apps.handlers.openrouter import client as or_client
+
+CHECK_DELAY = 0.3
+
+
+# =============================================
+# FIXTURES
+# =============================================
+
+@pytest.fixture
+def generation_server():
+    """Fake OpenRouter /generation endpoint; ids listed in `not_ready` 404 that many times"""
+    state = {"hits": {}, "not_ready": {}}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            gen_id = parse_qs(urlparse(self.path).query)["id"][0]
+            state["hits"][gen_id] = state["hits"].get(gen_id, 0) + 1
+            if state["not_ready"].get(gen_id, 0) > 0:
+                state["not_ready"][gen_id] -= 1
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = json.dumps({"data": {
+                "total_cost": 0.001, "tokens_prompt": 10, "tokens_completion": 5,
+                "generation_time": 120, "latency": 300, "provider_name": "fake"
+            }}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["url"] = f"http://127.0.0.1:{server.server_address[1]}/generation"
+    yield state
+    server.shutdown()
+
+
+@pytest.fixture
+def usage_env(tmp_path, monkeypatch, generation_server):
+    """Point tracking at tmp_path and the fake endpoint, with short delays"""
+    monkeypatch.setattr(tracking, "API_JSON_DIR", tmp_path)
+    monkeypatch.setattr(store, "API_JSON_DIR", tmp_path)
+    monkeypatch.setattr(tracking, "GENERATION_ENDPOINT", generation_server["url"])
+    monkeypatch.setattr(tracking, "DEFAULT_GENERATION_CHECK_DELAY", CHECK_DELAY)
+    monkeypatch.setattr(collector, "RETRY_DELAYS", (0.1, 0.1))
+    yield generation_server
+    collector.flush_usage(timeout=10, spill=False)
+
+
+def _stored(tmp_path):
+    conn = store.connect(tmp_path / store.USAGE_DB_FILE)
+    try:
+        return [dict(row) for row in conn.execute("SELECT * FROM generations")]
+    finally:
+        conn.close()
+
+
+# =============================================
+# COLLECTOR
+# =============================================
+
+class TestCollector:
+    """enqueue_usage() returns at once; the worker records metrics later"""
+
+    def test_enqueue_returns_immediately_and_records(self, usage_env, tmp_path):
+        start = time.perf_counter()
+        for i in range(5):
+            collector.enqueue_usage(f"gen-{i}", "flow", "test/model", api_key="key")
+        assert time.perf_counter() - start < 0.05
+
+        assert collector.flush_usage(timeout=10)
+        records = _stored(tmp_path)
+        assert sorted(r["generation_id"] for r in records) == [f"gen-{i}" for i in range(5)]
+        assert all(r["status"] == "ok" and r["tokens_prompt"] == 10 for r in records)
+
+    def test_not_ready_generation_is_retried(self, usage_env, tmp_path):
+        usage_env["not_ready"]["gen-late"] = 2
+        collector.enqueue_usage("gen-late", "flow", "test/model", api_key="key")
+        assert collector.flush_usage(timeout=10)
+
+        assert usage_env["hits"]["gen-late"] == 3
+        assert _stored(tmp_path)[0]["status"] == "ok"
+
+    def test_gives_up_after_retries(self, usage_env, tmp_path):
+        usage_env["not_ready"]["gen-gone"] = 99
+        collector.enqueue_usage("gen-gone", "flow", "test/model", api_key="key")
+        assert collector.flush_usage(timeout=10)
+
+        assert usage_env["hits"]["gen-gone"] == 1 + len(collector.RETRY_DELAYS)
+        record = _stored(tmp_path)[0]
+        assert record["status"] == "failed"
+        assert record["tokens_prompt"] == 0
+        assert record["error"]
+
+    def test_rejected_store_write_is_retried(self, usage_env, tmp_path, monkeypatch):
+        monkeypatch.setattr(collector, "STORE_RETRY_DELAY", 0.1)
+        record_usage, record_cache_stats = store.record_usage, store.record_cache_stats
+        failures = {"usage": 1, "cache": 1}
+
+        def flaky(kind, write):
+            def wrapper(*args):
+                if failures[kind]:
+                    failures[kind] -= 1
+                    raise sqlite3.OperationalError("database is locked")
+                return write(*args)
+            return wrapper
+
+        monkeypatch.setattr(store, "record_usage", flaky("usage", record_usage))
+        monkeypatch.setattr(store, "record_cache_stats", flaky("cache", record_cache_stats))
+        errors = collector.get_collector_stats()["store_errors"]
+        collector.enqueue_usage("gen-locked", "flow", "test/model", api_key="key")
+        collector.record_cache_event("flow", "hit", saved_ms=5.0)
+        assert collector.flush_usage(timeout=10)
+
+        assert [r["generation_id"] for r in _stored(tmp_path)] == ["gen-locked"]
+        assert store.get_cache_rollup("flow")["hits"] == 1
+        assert collector.get_collector_stats()["store_errors"] == errors + 2
+
+    def test_rejected_batch_spilled_at_exit(self, usage_env, tmp_path, monkeypatch):
+        monkeypatch.setattr(collector, "STORE_RETRY_DELAY", 60)
+
+        def locked(records):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(store, "record_usage", locked)
+        errors = collector.get_collector_stats()["store_errors"]
+        collector.enqueue_usage("gen-unstored", "flow", "test/model", api_key="key")
+        deadline = time.monotonic() + 10
+        while collector.get_collector_stats()["store_errors"] == errors and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert collector.flush_usage(timeout=0) is False
+        assert "gen-unstored" in (tmp_path / collector.PENDING_FILE).read_text()
+
+    def test_spill_and_claim_pending(self, usage_env, tmp_path, monkeypatch):
+        monkeypatch.setattr(tracking, "DEFAULT_GENERATION_CHECK_DELAY", 60)
+        collector.enqueue_usage("gen-spill", "flow", "test/model", api_key="secret")
+        assert collector.flush_usage(timeout=0) is False
+
+        pending = (tmp_path / collector.PENDING_FILE).read_text()
+        assert "gen-spill" in pending
+        assert "secret" not in pending
+
+        claimed = collector._claim_pending()
+        assert [item["generation_id"] for item in claimed] == ["gen-spill"]
+        assert not (tmp_path / collector.PENDING_FILE).exists()
+
+
+# =============================================
+# CALLER PATH
+# =============================================
+
+class TestGetResponseLatency:
+    """get_response() no longer waits DEFAULT_GENERATION_CHECK_DELAY"""
+
+    @pytest.fixture
+    def fake_client(self, monkeypatch):
+        response = SimpleNamespace(
+            id="gen-call", model="test/model",
+            choices=[SimpleNamespace(message=SimpleNamespace(content="hi"), finish_reason="stop")]
+        )
+        fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kw: response)))
+        monkeypatch.setattr(or_client, "get_api_key", lambda provider: "key")
+        monkeypatch.setattr(or_client, "get_cached_client", lambda api_key: fake)
+
+    def test_caller_latency_drops_by_check_delay(self, usage_env, tmp_path, fake_client):
+        start = time.perf_counter()
+        result = or_client.get_response("hello", caller="flow", model="test/model")
+        queued = time.perf_counter() - start
+        assert result["content"] == "hi"
+
+        start = time.perf_counter()
+        assert tracking.track_usage("gen-sync", "flow", "test/model", api_key="key")["success"]
+        inline = time.perf_counter() - start
+
+        assert queued < CHECK_DELAY / 3
+        assert inline >= CHECK_DELAY
+        print(f"\nget_response with queued tracking: {queued * 1000:.1f} ms; "
+              f"inline track_usage: {inline * 1000:.1f} ms")
+
+        assert collector.flush_usage(timeout=10)
+        assert {r["generation_id"] for r in _stored(tmp_path)} == {"gen-call", "gen-sync"}
+
+
+# =============================================
+# AGGREGATION
+# =============================================
+
+class TestAggregationOverLog:
+    """Totals include collected usage on top of imported legacy JSON"""
+
+    def test_log_and_legacy_totals(self, usage_env, tmp_path):
+        legacy = {"data": {
+            "current_session": {"start_time": "2026-01-01T00:00:00", "total_requests": 1,
+                                "total_cost": 0.5, "total_tokens": 100},
+            "usage_by_caller": {"flow": {"requests": 1, "total_cost": 0.5, "total_tokens": 100,
+                                         "models_used": {"old/model": 1}, "last_request": None}},
+            "daily_totals": {}, "generation_tracking": {}
+        }}
+        (tmp_path / tracking.DATA_FILE).write_text(json.dumps(legacy))
+        collector.enqueue_usage("gen-a", "flow", "test/model", api_key="key")
+        collector.enqueue_usage("gen-b", "nexus", "test/model", api_key="key")
+        assert collector.flush_usage(timeout=10)
+
+        assert aggregation.get_session_summary()["total_requests"] == 3
+        flow = aggregation.get_caller_usage("flow")
+        assert flow["requests"] == 2
+        assert flow["total_tokens"] == 115
+        assert aggregation.get_model_breakdown() == {"old/model": {"requests": 1}, "test/model": {"requests": 2}}
+        assert aggregation.get_daily_usage()["requests"] == 2
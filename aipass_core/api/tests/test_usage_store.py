@@ -0,0 +1,206 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_usage_store.py - SQLite usage store tests
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: api/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial tests - rollups, retention, legacy import, query scaling
+#
+# CODE STANDARDS:
+#   - Pure pytest with monkeypatch/tmp_path fixtures
+#   - No real OpenRouter connections
+# =============================================
+
+"""
+Usage Store Test Suite
+
+Covers:
+- Trigger-maintained rollups (store.py)
+- Indexed retention deletes (cleanup.py)
+- One-time import of legacy JSON totals and usage_log.jsonl
+- Aggregation query time flat as history grows (aggregation.py)
+"""
+
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Infrastructure
+# ---------------------------------------------------------------------------
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+from api.apps.handlers.usage import aggregation, cleanup, store
+
+
+# =============================================
+# HELPERS
+# =============================================
+
+def _record(gen_id, caller="flow", model="test/model", timestamp=None, status="ok", tokens=10, cost=0.001):
+    record = {
+        "timestamp": timestamp or datetime.now().isoformat(),
+        "generation_id": gen_id,
+        "caller": caller,
+        "model": model,
+        "status": status
+    }
+    if status == "ok":
+        record["usage_data"] = {"total_cost": cost, "tokens_prompt": tokens, "tokens_completion": 5,
+                                "generation_time": 100, "latency": 200, "provider_name": "fake"}
+    else:
+        record["error"] = "Failed to retrieve generation metrics"
+    return record
+
+
+@pytest.fixture
+def usage_dir(tmp_path, monkeypatch):
+    """Point the usage store at tmp_path"""
+    monkeypatch.setattr(store, "API_JSON_DIR", tmp_path)
+    return tmp_path
+
+
+# =============================================
+# ROLLUPS
+# =============================================
+
+class TestRollups:
+    """Inserts maintain per-day/per-caller/per-model totals"""
+
+    def test_rollups_follow_inserts(self, usage_dir):
+        assert store.record_usage([
+            _record("g1", caller="flow", model="a"),
+            _record("g2", caller="flow", model="b"),
+            _record("g3", caller="nexus", model="a"),
+            _record("g4", caller="nexus", status="failed"),
+        ]) == 4
+
+        flow = aggregation.get_caller_usage("flow")
+        assert flow["requests"] == 2
+        assert flow["total_tokens"] == 30
+        assert flow["models_used"] == {"a": 1, "b": 1}
+
+        session = aggregation.get_session_summary()
+        assert session["total_requests"] == 3
+        assert session["total_cost"] == pytest.approx(0.003)
+        assert aggregation.get_daily_usage()["requests"] == 3
+        assert aggregation.get_model_breakdown() == {"a": {"requests": 2}, "b": {"requests": 1}}
+        assert aggregation.get_model_breakdown("nexus") == {"a": {"requests": 1}}
+
+    def test_duplicate_generation_counted_once(self, usage_dir):
+        assert store.record_usage([_record("g1")]) == 1
+        assert store.record_usage([_record("g1"), _record("g2")]) == 1
+        assert aggregation.get_caller_usage("flow")["requests"] == 2
+
+    def test_empty_store(self, usage_dir):
+        assert aggregation.get_session_summary() == {}
+        assert aggregation.get_caller_usage("flow") == {}
+        assert aggregation.get_daily_usage() == {}
+
+
+# =============================================
+# RETENTION
+# =============================================
+
+class TestRetention:
+    """Old generations are deleted; caller totals survive"""
+
+    def test_cleanup_old_data_keeps_rollups(self, usage_dir):
+        old = (datetime.now() - timedelta(days=45)).isoformat()
+        store.record_usage([_record("old", timestamp=old), _record("new")])
+
+        assert cleanup.get_cleanup_stats()["cleanable_generations"] == 1
+        assert cleanup.cleanup_old_data(None, 30) == 1
+        assert store.count_generations() == 1
+        assert aggregation.get_caller_usage("flow")["requests"] == 2
+
+    def test_cleanup_daily_totals(self, usage_dir):
+        old = (datetime.now() - timedelta(days=120)).isoformat()
+        store.record_usage([_record("old", timestamp=old), _record("new")])
+
+        assert cleanup.cleanup_daily_totals(None, 90) == 1
+        assert aggregation.get_daily_usage(old[:10]) == {}
+        assert aggregation.get_daily_usage()["requests"] == 1
+
+
+# =============================================
+# LEGACY IMPORT
+# =============================================
+
+class TestLegacyImport:
+    """usage_tracker_data.json and usage_log.jsonl are imported once"""
+
+    def test_import_json_and_log(self, usage_dir):
+        today = datetime.now().date().isoformat()
+        legacy = {"data": {
+            "current_session": {"start_time": "2026-01-01T00:00:00", "total_requests": 2,
+                                "total_cost": 0.5, "total_tokens": 100},
+            "usage_by_caller": {"flow": {"requests": 2, "total_cost": 0.5, "total_tokens": 100,
+                                         "models_used": {"old/model": 2}, "last_request": "2026-01-02T00:00:00"}},
+            "daily_totals": {today: {"requests": 2, "cost": 0.5, "tokens": 100}},
+            "generation_tracking": {"legacy-1": {"timestamp": f"{today}T01:00:00", "caller": "flow",
+                                                 "model": "old/model", "usage_data": {}}}
+        }}
+        (usage_dir / store.LEGACY_DATA_FILE).write_text(json.dumps(legacy))
+        (usage_dir / store.LEGACY_LOG_FILE).write_text(json.dumps(_record("log-1", model="test/model")) + "\n")
+
+        session = aggregation.get_session_summary()
+        assert session["start_time"] == "2026-01-01T00:00:00"
+        assert session["total_requests"] == 3
+        assert aggregation.get_caller_usage("flow")["models_used"] == {"old/model": 2, "test/model": 1}
+        assert aggregation.get_daily_usage()["requests"] == 3
+        assert store.count_generations() == 2
+        assert not (usage_dir / store.LEGACY_LOG_FILE).exists()
+
+        # A fresh process opening the store does not import again
+        store._initialized.clear()
+        assert aggregation.get_session_summary()["total_requests"] == 3
+
+
+# =============================================
+# SCALING
+# =============================================
+
+class TestQueryScaling:
+    """Aggregation reads rollups - query time independent of history size"""
+
+    @staticmethod
+    def _fill(count, start):
+        base = datetime(2026, 1, 1)
+        records = [
+            _record(f"g{start + i}", caller=f"caller{i % 20}", model=f"model{i % 8}",
+                    timestamp=(base + timedelta(minutes=i)).isoformat())
+            for i in range(count)
+        ]
+        store.record_usage(records)
+
+    @staticmethod
+    def _query_time(repeats=200):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            aggregation.get_caller_usage("caller3")
+            aggregation.get_session_summary()
+            aggregation.get_daily_usage("2026-01-02")
+            aggregation.get_model_breakdown()
+        return (time.perf_counter() - start) / repeats
+
+    def test_query_time_flat(self, usage_dir):
+        self._fill(1_000, 0)
+        small = self._query_time()
+        self._fill(199_000, 1_000)
+        large = self._query_time()
+
+        assert store.count_generations() == 200_000
+        assert aggregation.get_session_summary()["total_requests"] == 200_000
+        print(f"\n4 aggregation queries: {small * 1000:.2f} ms at 1k generations, "
+              f"{large * 1000:.2f} ms at 200k")
+        assert large < small * 3
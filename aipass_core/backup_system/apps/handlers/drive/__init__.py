@@ -0,0 +1 @@
+"""Drive Handlers - Manifest diffing, folder tree cache, journaled tracker and uploads for Drive sync"""
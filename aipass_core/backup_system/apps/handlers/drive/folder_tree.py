@@ -0,0 +1,176 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: folder_tree.py - Cached Google Drive folder tree
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: handlers
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation
+#     * One paginated listing pass loads every app-visible folder
+#     * Path resolution and creation served from the in-memory index
+#
+# CODE STANDARDS:
+#   - Follow seed 3-layer architecture
+#   - Handlers must be independent and transportable
+#   - No cross-handler imports except within same domain
+# =============================================
+
+"""
+Drive Folder Tree - Resolve nested backup folders without per-file lookups
+
+The old sync resolved every file's folder with one files().list per path
+segment. With the drive.file scope the app only sees folders it created, so
+the whole tree fits in a single paginated listing. This handler loads it once,
+indexes (parent_id, name) -> folder_id, and only talks to the API again when
+a folder genuinely has to be created.
+"""
+
+# =============================================
+# IMPORTS
+# =============================================
+
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Infrastructure import pattern
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+# =============================================
+# CONSTANTS
+# =============================================
+
+FOLDER_MIME = 'application/vnd.google-apps.folder'
+LIST_PAGE_SIZE = 1000
+
+# =============================================
+# FOLDER TREE
+# =============================================
+
+
+def _default_execute(request):
+    """Execute a Google API request without retries."""
+    return request.execute()
+
+
+class DriveFolderTree:
+    """In-memory index of the app's Drive folders.
+
+    Attributes:
+        api_calls (int): Number of Drive API requests issued by this tree
+        created (List[str]): Folder paths created during this run
+    """
+
+    def __init__(self, service, execute: Optional[Callable] = None, root_name: str = 'AIPass Backups'):
+        self.service = service
+        self.execute = execute or _default_execute
+        self.root_name = root_name
+        self.api_calls = 0
+        self.created: List[str] = []
+        self._children: Dict[Tuple[str, str], str] = {}
+        self._path_cache: Dict[str, str] = {}
+        self._root_id: Optional[str] = None
+        self._loaded = False
+
+    def load(self) -> int:
+        """List every non-trashed folder once and build the lookup index.
+
+        Returns:
+            Number of folders indexed
+        """
+        self._children.clear()
+        self._path_cache.clear()
+        orphans = []
+        page_token = None
+
+        while True:
+            self.api_calls += 1
+            results = self.execute(self.service.files().list(
+                q=f"mimeType='{FOLDER_MIME}' and trashed=false",
+                fields="nextPageToken, files(id, name, parents)",
+                pageSize=LIST_PAGE_SIZE,
+                pageToken=page_token
+            ))
+            for folder in results.get('files', []):
+                parents = folder.get('parents') or []
+                if parents:
+                    # First writer wins, matching the old folders[0] behaviour
+                    self._children.setdefault((parents[0], folder['name']), folder['id'])
+                if folder['name'] == self.root_name:
+                    orphans.append((folder['id'], parents))
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+        # The backup root is the root-named folder whose parent we don't own
+        known_ids = set(self._children.values())
+        for folder_id, parents in orphans:
+            if not parents or parents[0] not in known_ids:
+                self._root_id = folder_id
+                break
+
+        self._loaded = True
+        return len(self._children)
+
+    def _create(self, name: str, parent_id: Optional[str]) -> str:
+        """Create a folder and register it in the index."""
+        metadata: Dict[str, Any] = {'name': name, 'mimeType': FOLDER_MIME}
+        if parent_id:
+            metadata['parents'] = [parent_id]
+        self.api_calls += 1
+        folder = self.execute(self.service.files().create(body=metadata, fields='id'))
+        folder_id = folder.get('id')
+        if parent_id:
+            self._children[(parent_id, name)] = folder_id
+        return folder_id
+
+    def root_id(self) -> str:
+        """Return the backup root folder id, creating it if missing."""
+        if not self._loaded:
+            self.load()
+        if not self._root_id:
+            self._root_id = self._create(self.root_name, None)
+            self.created.append(self.root_name)
+        return self._root_id
+
+    def ensure_path(self, folder_path: str) -> str:
+        """Resolve 'project/a/b' below the backup root, creating gaps.
+
+        Args:
+            folder_path: Forward-slash path relative to the backup root
+
+        Returns:
+            Drive folder id of the deepest segment
+        """
+        cached = self._path_cache.get(folder_path)
+        if cached:
+            return cached
+
+        current_id = self.root_id()
+        walked = []
+        for part in folder_path.split('/'):
+            if not part or part == '.':
+                continue
+            walked.append(part)
+            sub_path = '/'.join(walked)
+            hit = self._path_cache.get(sub_path)
+            if hit:
+                current_id = hit
+                continue
+            child_id = self._children.get((current_id, part))
+            if not child_id:
+                child_id = self._create(part, current_id)
+                self.created.append(sub_path)
+            self._path_cache[sub_path] = child_id
+            current_id = child_id
+
+        self._path_cache[folder_path] = current_id
+        return current_id
+
+    def cached_paths(self) -> Dict[str, str]:
+        """Return resolved path -> id map (for persisting cached_folders)."""
+        return dict(self._path_cache)
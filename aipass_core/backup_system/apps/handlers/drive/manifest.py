@@ -0,0 +1,114 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: manifest.py - Local backup manifest and tracker diffing
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: handlers
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation
+#     * Single os.scandir walk builds the whole local manifest
+#     * Diff against file tracker yields upload/unchanged/deleted sets
+#
+# CODE STANDARDS:
+#   - Follow seed 3-layer architecture
+#   - Handlers must be independent and transportable
+#   - No cross-handler imports except within same domain
+# =============================================
+
+"""
+Local Manifest - One-pass snapshot of a backup directory
+
+Builds {relative_key: {size, mtime}} for every syncable file with a single
+directory walk (one stat per file), then diffs it against the Drive file
+tracker so the sync module never re-stats files during planning.
+"""
+
+# =============================================
+# IMPORTS
+# =============================================
+
+import sys
+import os
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+# Infrastructure import pattern
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+# =============================================
+# MANIFEST OPERATIONS
+# =============================================
+
+def build_local_manifest(backup_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Scan backup directory once and record size/mtime per file.
+
+    Hidden files (leading '.') are skipped, matching the previous rglob scan.
+    Keys are forward-slash relative paths, the same keys the file tracker uses.
+
+    Args:
+        backup_dir: Root of the backup tree to sync
+
+    Returns:
+        Dict mapping relative key -> {"size": int, "mtime": float}
+    """
+    manifest: Dict[str, Dict[str, Any]] = {}
+    stack = [(str(backup_dir), "")]
+
+    while stack:
+        dir_path, prefix = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                key = f"{prefix}{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, f"{key}/"))
+                    elif entry.is_file() and not entry.name.startswith('.'):
+                        st = entry.stat()
+                        manifest[key] = {"size": st.st_size, "mtime": st.st_mtime}
+                except OSError:
+                    continue
+
+    return manifest
+
+
+def diff_manifest(manifest: Dict[str, Dict[str, Any]],
+                  tracker: Dict[str, Dict[str, Any]],
+                  force: bool = False) -> Tuple[List[str], List[str], List[str]]:
+    """Compare local manifest against tracker entries.
+
+    Args:
+        manifest: Output of build_local_manifest()
+        tracker: File tracker (key -> local_size/local_mtime/drive_id)
+        force: Treat every local file as changed
+
+    Returns:
+        Tuple of (to_upload, unchanged, deleted) key lists, sorted
+    """
+    to_upload = []
+    unchanged = []
+
+    for key, info in manifest.items():
+        tracked = tracker.get(key)
+        if (force or not tracked
+                or info["size"] != tracked.get("local_size", 0)
+                or info["mtime"] != tracked.get("local_mtime", 0)):
+            to_upload.append(key)
+        else:
+            unchanged.append(key)
+
+    deleted = [key for key in tracker if key not in manifest]
+
+    return sorted(to_upload), sorted(unchanged), sorted(deleted)
+
+
+def folder_of(key: str) -> str:
+    """Return the parent folder part of a manifest key ('' for top level)."""
+    return key.rsplit('/', 1)[0] if '/' in key else ""
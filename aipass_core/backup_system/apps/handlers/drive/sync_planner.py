@@ -0,0 +1,215 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: sync_planner.py - Plan and execute Drive sync from a local manifest
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: handlers
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation
+#     * plan_sync(): manifest diff + one folder listing + batched file lookup
+#     * execute_plan(): parallel uploads recorded into the journaled tracker
+#
+# CODE STANDARDS:
+#   - Follow seed 3-layer architecture
+#   - Handlers must be independent and transportable
+#   - No cross-handler imports except within same domain
+# =============================================
+
+"""
+Drive Sync Planner - Decide everything up front, then upload
+
+Planning costs a fixed number of API calls regardless of file count:
+one paginated folder listing, one create per missing folder, and one grouped
+metadata listing per PARENTS_PER_QUERY untracked folders. Uploads then cost
+one request per small file (or one per chunk for large files).
+"""
+
+# =============================================
+# IMPORTS
+# =============================================
+
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Infrastructure import pattern
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+from handlers.drive.manifest import build_local_manifest, diff_manifest, folder_of
+from handlers.drive.folder_tree import DriveFolderTree
+from handlers.drive.uploader import list_existing_files, upload_file, DEFAULT_CHUNK_SIZE
+from handlers.drive.sync_tracker import JournaledTracker
+
+# =============================================
+# DATA MODELS
+# =============================================
+
+
+class UploadTask:
+    """One file the plan decided to upload."""
+
+    def __init__(self, key: str, path: Path, size: int, mtime: float,
+                 folder_id: str, existing_id: Optional[str] = None):
+        self.key = key
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.folder_id = folder_id
+        self.existing_id = existing_id
+
+
+class SyncPlan:
+    """Result of plan_sync()
+
+    Attributes:
+        tasks (List[UploadTask]): Files to upload, in key order
+        unchanged (List[str]): Keys skipped because the tracker matches
+        deleted (List[str]): Tracker keys with no local file anymore
+        total_files (int): Files in the local manifest
+        api_calls (int): Drive requests spent on planning
+        folders_created (List[str]): Drive folder paths created while planning
+    """
+
+    def __init__(self):
+        self.tasks: List[UploadTask] = []
+        self.unchanged: List[str] = []
+        self.deleted: List[str] = []
+        self.total_files = 0
+        self.api_calls = 0
+        self.folders_created: List[str] = []
+
+# =============================================
+# PLANNING
+# =============================================
+
+
+def plan_sync(service, backup_dir: Path, project_name: str, tracker: Dict[str, Dict[str, Any]],
+              force: bool = False, execute: Optional[Callable] = None,
+              folder_tree: Optional[DriveFolderTree] = None) -> SyncPlan:
+    """Build the upload plan for backup_dir.
+
+    Args:
+        service: Drive v3 service
+        backup_dir: Local backup root
+        project_name: Project folder under 'AIPass Backups'
+        tracker: Current tracker entries (key -> local_size/local_mtime/drive_id)
+        force: Upload every file regardless of tracker state
+        execute: Request executor (retrying wrapper)
+        folder_tree: Pre-loaded tree to reuse across syncs
+
+    Returns:
+        SyncPlan describing uploads, skips and deletions
+    """
+    plan = SyncPlan()
+    manifest = build_local_manifest(backup_dir)
+    to_upload, plan.unchanged, plan.deleted = diff_manifest(manifest, tracker, force)
+    plan.total_files = len(manifest)
+
+    if not to_upload:
+        return plan
+
+    tree = folder_tree or DriveFolderTree(service, execute)
+    calls_before = tree.api_calls
+    created_before = len(tree.created)
+
+    # Resolve each distinct folder exactly once
+    folder_ids: Dict[str, str] = {}
+    for key in to_upload:
+        rel_folder = folder_of(key)
+        if rel_folder not in folder_ids:
+            drive_path = f"{project_name}/{rel_folder}" if rel_folder else project_name
+            folder_ids[rel_folder] = tree.ensure_path(drive_path)
+
+    plan.api_calls += tree.api_calls - calls_before
+    plan.folders_created = tree.created[created_before:]
+
+    # Files we have no drive_id for may still exist remotely - look them up in bulk
+    lookup_folders = {
+        folder_ids[folder_of(key)] for key in to_upload
+        if not (tracker.get(key) or {}).get("drive_id")
+    }
+    existing: Dict = {}
+    if lookup_folders:
+        existing, calls = list_existing_files(service, lookup_folders, execute)
+        plan.api_calls += calls
+
+    for key in to_upload:
+        folder_id = folder_ids[folder_of(key)]
+        existing_id = (tracker.get(key) or {}).get("drive_id")
+        if not existing_id:
+            meta = existing.get((folder_id, key.rsplit('/', 1)[-1]))
+            existing_id = meta.get('id') if meta else None
+        info = manifest[key]
+        plan.tasks.append(UploadTask(key, backup_dir / key, info["size"], info["mtime"],
+                                     folder_id, existing_id))
+
+    return plan
+
+# =============================================
+# EXECUTION
+# =============================================
+
+
+def execute_plan(plan: SyncPlan, get_service: Callable[[], Any], tracker: JournaledTracker,
+                 note: str = "", max_workers: int = 3, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 execute: Optional[Callable] = None, media_factory: Optional[Callable] = None,
+                 on_result: Optional[Callable[[UploadTask, bool, Optional[Exception]], None]] = None) -> Dict[str, int]:
+    """Upload every task in the plan and journal each success.
+
+    Args:
+        plan: Output of plan_sync()
+        get_service: Returns the Drive service to use on the calling thread
+        tracker: Journaled tracker receiving one record per upload
+        note: Appended to the Drive description
+        max_workers: Parallel upload threads
+        chunk_size: Resumable chunk size for large files
+        execute: Request executor (retrying wrapper)
+        media_factory: MediaFileUpload override (tests)
+        on_result: Callback(task, success, error) invoked from the main thread
+
+    Returns:
+        Dict with uploaded, failed, bytes and api_calls counts
+    """
+    description = f'AIPass backup - {note}' if note else 'AIPass backup'
+    stats = {"uploaded": 0, "failed": 0, "bytes": 0, "api_calls": 0}
+
+    def _upload(task: UploadTask):
+        drive_id, calls = upload_file(
+            get_service(), task.path, task.folder_id, task.existing_id,
+            description=description, size=task.size, chunk_size=chunk_size,
+            execute=execute, media_factory=media_factory
+        )
+        return drive_id, calls
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(_upload, task): task for task in plan.tasks}
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                drive_id, calls = future.result()
+            except Exception as e:
+                stats["failed"] += 1
+                if on_result:
+                    on_result(task, False, e)
+                continue
+            stats["uploaded"] += 1
+            stats["bytes"] += task.size
+            stats["api_calls"] += calls
+            tracker.record(task.key, {
+                "local_size": task.size,
+                "local_mtime": task.mtime,
+                "drive_id": drive_id,
+                "drive_size": task.size,
+                "last_sync": datetime.now().isoformat()
+            })
+            if on_result:
+                on_result(task, True, None)
+
+    tracker.flush()
+    return stats
@@ -0,0 +1,150 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: sync_tracker.py - Journaled Drive file tracker
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: handlers
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation
+#     * Append-only JSONL journal flushed every N records or T seconds
+#     * Replay on load, compaction back into the data JSON snapshot
+#
+# CODE STANDARDS:
+#   - Follow seed 3-layer architecture
+#   - Handlers must be independent and transportable
+#   - No cross-handler imports except within same domain
+# =============================================
+
+"""
+Journaled File Tracker - Incremental progress for Drive sync
+
+The tracker used to be persisted by rewriting the whole data JSON every 50
+uploads, so a crash lost up to 49 uploads and each save cost O(tracked files).
+Now each upload appends one small JSONL record; the snapshot in the data JSON
+is only rewritten once per sync (compact). Loading replays the journal on top
+of the snapshot, so an interrupted sync resumes where it stopped.
+"""
+
+# =============================================
+# IMPORTS
+# =============================================
+
+import sys
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Infrastructure import pattern
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+# =============================================
+# TRACKER
+# =============================================
+
+
+class JournaledTracker:
+    """File tracker dict backed by snapshot + append-only journal.
+
+    Attributes:
+        entries (Dict): Live tracker state (key -> tracker entry)
+        flushes (int): Number of journal flushes performed
+    """
+
+    def __init__(self, journal_path: Path, snapshot: Optional[Dict[str, Dict[str, Any]]] = None,
+                 flush_every: int = 25, flush_interval: float = 5.0):
+        self.journal_path = Path(journal_path)
+        self.entries: Dict[str, Dict[str, Any]] = dict(snapshot or {})
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.flushes = 0
+        self._pending: List[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def replay(self) -> int:
+        """Apply journal records left over from an interrupted run.
+
+        Returns:
+            Number of records replayed
+        """
+        if not self.journal_path.exists():
+            return 0
+        replayed = 0
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from a crash mid-write
+                    continue
+                key = record.get("key")
+                if not key:
+                    continue
+                if record.get("deleted"):
+                    self.entries.pop(key, None)
+                else:
+                    self.entries[key] = record.get("entry", {})
+                replayed += 1
+        return replayed
+
+    def record(self, key: str, entry: Dict[str, Any]):
+        """Set a tracker entry and queue it for the journal."""
+        with self._lock:
+            self.entries[key] = entry
+            self._pending.append(json.dumps({"key": key, "entry": entry}))
+            self._maybe_flush()
+
+    def remove(self, key: str):
+        """Drop a tracker entry and queue a tombstone for the journal."""
+        with self._lock:
+            if self.entries.pop(key, None) is not None:
+                self._pending.append(json.dumps({"key": key, "deleted": True}))
+                self._maybe_flush()
+
+    def _maybe_flush(self):
+        """Flush when enough records or time have accumulated (lock held)."""
+        if (len(self._pending) >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Append pending records and fsync (lock held)."""
+        if not self._pending:
+            return
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write("\n".join(self._pending) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._pending.clear()
+        self._last_flush = time.monotonic()
+        self.flushes += 1
+
+    def flush(self):
+        """Force pending records to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def compact(self, save_snapshot: Callable[[Dict[str, Dict[str, Any]]], None]):
+        """Persist the full tracker via save_snapshot, then clear the journal.
+
+        Args:
+            save_snapshot: Callback that durably stores the tracker dict
+        """
+        with self._lock:
+            self._flush_locked()
+            save_snapshot(dict(self.entries))
+            try:
+                self.journal_path.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,172 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: uploader.py - Batched metadata lookup and chunked Drive uploads
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: handlers
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation
+#     * Existing-file lookup batched across folders with OR'd parent queries
+#     * Small files use one simple upload, large files stream resumable chunks
+#
+# CODE STANDARDS:
+#   - Follow seed 3-layer architecture
+#   - Handlers must be independent and transportable
+#   - No cross-handler imports except within same domain
+# =============================================
+
+"""
+Drive Uploader - Metadata batching and upload strategy
+
+- list_existing_files(): one files().list per group of folders instead of one
+  per untracked file, so first syncs of many small files don't pay a lookup each
+- upload_file(): simple (single request) upload below SMALL_FILE_LIMIT,
+  resumable upload streamed in fixed-size chunks above it
+"""
+
+# =============================================
+# IMPORTS
+# =============================================
+
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# Infrastructure import pattern
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+try:
+    from googleapiclient.http import MediaFileUpload
+except ImportError:
+    MediaFileUpload = None
+
+# =============================================
+# CONSTANTS
+# =============================================
+
+FOLDER_MIME = 'application/vnd.google-apps.folder'
+SMALL_FILE_LIMIT = 5 * 1024 * 1024      # Drive's simple-upload ceiling
+DEFAULT_CHUNK_SIZE = 10 * 1024 * 1024   # Must be a multiple of 256 KiB
+PARENTS_PER_QUERY = 25                  # Keeps q= well under the URL limit
+LIST_PAGE_SIZE = 1000
+
+# =============================================
+# METADATA LOOKUP
+# =============================================
+
+
+def _default_execute(request):
+    """Execute a Google API request without retries."""
+    return request.execute()
+
+
+def list_existing_files(service, folder_ids: Iterable[str],
+                        execute: Optional[Callable] = None) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], int]:
+    """Fetch file metadata for many folders with grouped list queries.
+
+    Args:
+        service: Drive v3 service
+        folder_ids: Folder ids whose direct children should be listed
+        execute: Request executor (e.g. retrying wrapper), defaults to .execute()
+
+    Returns:
+        Tuple of ({(folder_id, name): file_meta}, api_call_count)
+    """
+    execute = execute or _default_execute
+    ids = sorted(set(folder_ids))
+    found: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    calls = 0
+
+    for start in range(0, len(ids), PARENTS_PER_QUERY):
+        group = ids[start:start + PARENTS_PER_QUERY]
+        parents_q = " or ".join(f"'{fid}' in parents" for fid in group)
+        wanted = set(group)
+        page_token = None
+        while True:
+            calls += 1
+            results = execute(service.files().list(
+                q=f"({parents_q}) and mimeType!='{FOLDER_MIME}' and trashed=false",
+                fields="nextPageToken, files(id, name, size, parents)",
+                pageSize=LIST_PAGE_SIZE,
+                pageToken=page_token
+            ))
+            for meta in results.get('files', []):
+                for parent in meta.get('parents') or []:
+                    if parent in wanted:
+                        found.setdefault((parent, meta['name']), meta)
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+    return found, calls
+
+# =============================================
+# UPLOAD
+# =============================================
+
+
+def _make_media(local_file: Path, resumable: bool, chunk_size: int):
+    """Build a MediaFileUpload for the chosen strategy."""
+    if MediaFileUpload is None:
+        raise RuntimeError("googleapiclient is not installed")
+    if resumable:
+        return MediaFileUpload(str(local_file), resumable=True, chunksize=chunk_size)
+    return MediaFileUpload(str(local_file), resumable=False)
+
+
+def upload_file(service, local_file: Path, folder_id: str, existing_id: Optional[str] = None,
+                description: str = 'AIPass backup', size: Optional[int] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE, execute: Optional[Callable] = None,
+                media_factory: Optional[Callable] = None) -> Tuple[str, int]:
+    """Create or update one file in Drive.
+
+    Args:
+        service: Drive v3 service
+        local_file: File to upload
+        folder_id: Parent folder (used for creates only)
+        existing_id: Drive id to update in place, if known
+        description: Drive description field
+        size: Known file size (skips a stat when the manifest has it)
+        chunk_size: Resumable chunk size for large files
+        execute: Request executor for single-shot requests
+        media_factory: Override for MediaFileUpload(path, resumable, chunk_size)
+
+    Returns:
+        Tuple of (drive_file_id, api_call_count)
+    """
+    execute = execute or _default_execute
+    media_factory = media_factory or _make_media
+    if size is None:
+        size = local_file.stat().st_size
+    resumable = size > SMALL_FILE_LIMIT
+    media = media_factory(local_file, resumable, chunk_size)
+
+    if existing_id:
+        request = service.files().update(
+            fileId=existing_id,
+            body={'name': local_file.name, 'description': description},
+            media_body=media,
+            fields='id'
+        )
+    else:
+        request = service.files().create(
+            body={'name': local_file.name, 'parents': [folder_id], 'description': description},
+            media_body=media,
+            fields='id'
+        )
+
+    if not resumable:
+        response = execute(request)
+        return response.get('id') or existing_id, 1
+
+    # Stream the file chunk by chunk; next_chunk retries transient errors itself
+    calls = 0
+    response = None
+    while response is None:
+        calls += 1
+        _status, response = request.next_chunk(num_retries=3)
+    return response.get('id') or existing_id, calls
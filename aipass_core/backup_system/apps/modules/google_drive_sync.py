@@ -4,15 +4,15 @@
 # META DATA HEADER
 # Name: google_drive_sync.py - Google Drive Integration for AIPass Backup System
 # Date: 2025-10-30
-# Version: 2.3.2
+# Version: 2.4.1
 # Category: backup_system
 #
 # CHANGELOG (Max 5 entries - remove oldest when adding new):
+#   - v2.4.1 (2026-10-18): Removed legacy per-file upload path (upload_backup_file, local tracker helpers)
+#   - v2.4.0 (2026-10-18): Sync planner - one-pass manifest, cached folder tree, batched lookups, journaled tracker
 #   - v2.3.2 (2026-02-10): Fixed deepcopy RuntimeError in save_data during concurrent uploads
 #   - v2.3.1 (2026-02-10): Cross-process file locking + retry in load_log/save_log for race condition fix
 #   - v2.2.0 (2026-02-10): Fixed SSL concurrency bug - per-thread credentials, retry with backoff, folder cache lock
-#   - v2.1.0 (2025-10-30): Enhanced UI with colors, storage quota display, folder creation messages
-#   - v2.0.0 (2025-09-03): Upgraded to AIPass standards with 3-file JSON, logging, sections
 # =============================================
 
 """
@@ -24,8 +24,10 @@
 Features:
 - OAuth2 authentication with token persistence
 - Nested folder structure preservation
-- Size-based change detection
-- Update instead of duplicate uploads
+- Size-based change detection from a one-pass local manifest
+- Whole folder tree resolved in one listing, existing files looked up in batches
+- Update instead of duplicate uploads (simple upload for small files, chunked for large)
+- Journaled file tracker so interrupted syncs resume without re-uploading
 - 3-file JSON standard compliance
 """
 
@@ -39,7 +41,10 @@
 AIPASS_ROOT = Path.home() / "aipass_core"
 BACKUP_SYSTEM_ROOT = AIPASS_ROOT / "backup_system"
 sys.path.insert(0, str(AIPASS_ROOT))  # To ecosystem root
+sys.path.insert(0, str(Path(__file__).parent.parent))  # apps/ for handler imports
 from prax.apps.modules.logger import system_logger as logger
+from handlers.drive.sync_planner import plan_sync, execute_plan
+from handlers.drive.sync_tracker import JournaledTracker
 
 # Standard imports
 import copy
@@ -50,14 +55,12 @@
 import tempfile
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Tuple
 
 # Google API imports
 try:
     from googleapiclient.discovery import build
-    from googleapiclient.http import MediaFileUpload
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
@@ -82,6 +85,7 @@
 CONFIG_FILE = JSON_DIR / f"{MODULE_NAME}_config.json"
 DATA_FILE = JSON_DIR / f"{MODULE_NAME}_data.json"
 LOG_FILE = JSON_DIR / f"{MODULE_NAME}_log.json"
+TRACKER_JOURNAL = JSON_DIR / f"{MODULE_NAME}_tracker.jsonl"
 _log_lock = threading.Lock()
 
 
@@ -595,154 +599,6 @@ def get_or_create_nested_folder(self, parent_folder_id: str, folder_path: str) -
             logger.error(f"Error creating nested folder '{folder_path}': {e}")
             return parent_folder_id  # Fallback to parent folder
     
-    def upload_backup_file(self, local_file: Path, project_name: str, note: str = "", backup_root: Optional[Path] = None) -> bool:
-        """Upload a backup file to the appropriate project folder with nested structure"""
-        if not self.drive_service:
-            print("Error: Not authenticated with Drive")
-            logger.error("Not authenticated with Drive")
-            return False
-            
-        project_folder_id = self.get_or_create_project_folder(project_name)
-        if not project_folder_id:
-            return False
-            
-        try:
-            # Calculate relative path from backup root to maintain folder structure
-            if backup_root and backup_root in local_file.parents:
-                relative_path = local_file.relative_to(backup_root)
-                folder_path = str(relative_path.parent) if relative_path.parent != Path('.') else ""
-                # Convert Windows paths to forward slashes for consistency
-                folder_path = folder_path.replace('\\', '/')
-            else:
-                folder_path = ""
-            
-            # Get or create the nested folder structure
-            target_folder_id = self.get_or_create_nested_folder(project_folder_id, folder_path)
-            if not target_folder_id:
-                print(f"Error: Could not create target folder for {local_file.name}")
-                logger.error(f"Could not create target folder for {local_file.name}")
-                return False
-            
-            file_metadata = {
-                'name': local_file.name,
-                'parents': [target_folder_id],
-                'description': f'AIPass backup - {note}' if note else 'AIPass backup'
-            }
-            
-            media = MediaFileUpload(str(local_file), resumable=True)
-            
-            # Get file tracker info to avoid API calls when possible
-            if backup_root and backup_root in local_file.parents:
-                relative_path = local_file.relative_to(backup_root)
-                file_key = str(relative_path).replace('\\', '/')
-            else:
-                file_key = local_file.name
-            
-            existing_file = None
-            tracked_file = self.file_tracker.get(file_key)
-            
-            # Use cached drive_id if file is tracked, otherwise find it
-            if tracked_file and tracked_file.get("drive_id"):
-                # File is tracked, use cached drive_id
-                existing_file = {"id": tracked_file["drive_id"]}
-                logger.info(f"Using cached drive_id for {local_file.name}")
-            else:
-                # File not tracked or no drive_id, need API call to find it
-                existing_file = self._find_existing_file(local_file.name, target_folder_id)
-            
-            # For files called by new sync system, we already know they need upload
-            # Skip the size comparison check to avoid redundant work
-            
-            if existing_file:
-                # Update existing file - don't include parents field for updates
-                update_metadata = {
-                    'name': local_file.name,
-                    'description': f'AIPass backup - {note}' if note else 'AIPass backup'
-                }
-                file = self._api_call_with_retry(self.drive_service.files().update(
-                    fileId=existing_file['id'],
-                    body=update_metadata,
-                    media_body=media
-                ))
-                action = "Updated"
-            else:
-                # Create new file
-                file = self._api_call_with_retry(self.drive_service.files().create(
-                    body=file_metadata,
-                    media_body=media,
-                    fields='id'
-                ))
-                action = "Uploaded"
-            
-            print(f"{action} {local_file.name} to Drive ({project_name})")
-            
-            # Update file tracker with new drive_id
-            drive_file_id = file.get('id') if 'file' in locals() else (existing_file.get('id') if existing_file else None)
-            if drive_file_id and backup_root:
-                self._update_file_tracker(local_file, backup_root, drive_file_id)
-            
-            # Update statistics (ensure statistics exists first)
-            if "statistics" not in self.data:
-                self.data["statistics"] = {
-                    "total_uploads": 0,
-                    "successful_uploads": 0,
-                    "failed_uploads": 0,
-                    "total_bytes_uploaded": 0
-                }
-            self.data["statistics"]["total_uploads"] += 1
-            self.data["statistics"]["successful_uploads"] += 1
-            self.data["statistics"]["total_bytes_uploaded"] += local_file.stat().st_size
-            # Stats saved to disk in batches by sync_backup_files(), not per-file
-            
-            # Log operation
-            log_operation(f"upload_file", {
-                "message": f"{action} {local_file.name} to {project_name}",
-                "file_size": local_file.stat().st_size,
-                "project": project_name
-            }, success=True)
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error uploading {local_file.name}: {e}")
-            logger.error(f"Error uploading {local_file.name}: {e}")
-            
-            # Update failure statistics (ensure statistics exists first)
-            if "statistics" not in self.data:
-                self.data["statistics"] = {
-                    "total_uploads": 0,
-                    "successful_uploads": 0,
-                    "failed_uploads": 0,
-                    "total_bytes_uploaded": 0
-                }
-            self.data["statistics"]["total_uploads"] += 1
-            self.data["statistics"]["failed_uploads"] += 1
-            save_data(self.data)
-            
-            # Log failure
-            log_operation("upload_file", {
-                "message": f"Failed to upload {local_file.name}",
-                "error_details": {"exception_type": type(e).__name__, "stack_trace": str(e)}
-            }, success=False)
-            return False
-    
-    def _find_existing_file(self, filename: str, parent_folder_id: str) -> Optional[Dict[str, Any]]:
-        """Find existing file in Drive folder with metadata"""
-        try:
-            if not self.drive_service:
-                return None
-            results = self._api_call_with_retry(self.drive_service.files().list(
-                q=f"name='{filename}' and '{parent_folder_id}' in parents and trashed=false",
-                fields="files(id, name, size, modifiedTime, md5Checksum)"
-            ))
-            
-            files = results.get('files', [])
-            return files[0] if files else None
-            
-        except Exception as e:
-            logger.warning(f"Could not check for existing file: {e}")
-            return None
-    
     def _load_file_tracker(self) -> Dict[str, Dict[str, Any]]:
         """Load file tracker from data JSON"""
         return self.data.get("runtime_state", {}).get("file_tracker", {})
@@ -796,111 +652,20 @@ def _api_call_with_retry(self, request, max_retries: int = 3):
                     continue
                 raise
 
-    def _check_file_needs_upload_local(self, local_file: Path, backup_root: Path) -> bool:
-        """Check if file needs upload using local tracker (no API calls)"""
-        try:
-            # Calculate relative path for tracking
-            if backup_root and backup_root in local_file.parents:
-                relative_path = local_file.relative_to(backup_root)
-                file_key = str(relative_path).replace('\\', '/')
-            else:
-                file_key = local_file.name
-            
-            # Get current file stats
-            current_size = local_file.stat().st_size
-            current_mtime = local_file.stat().st_mtime
-            
-            # Check if file is in tracker
-            if file_key not in self.file_tracker:
-                logger.info(f"New file detected: {file_key}")
-                return True  # New file, needs upload
-            
-            tracked_file = self.file_tracker[file_key]
-            
-            # Compare local file stats with tracker
-            if (current_size != tracked_file.get("local_size", 0) or 
-                current_mtime != tracked_file.get("local_mtime", 0)):
-                logger.info(f"Changed file detected: {file_key}")
-                return True  # File changed, needs upload
-            
-            # File unchanged according to tracker
-            logger.info(f"Skipping unchanged file: {file_key}")
-            return False
-            
-        except Exception as e:
-            logger.warning(f"Error checking file tracker for {local_file.name}: {e}")
-            return True  # On error, assume file needs upload
-    
-    def _update_file_tracker(self, local_file: Path, backup_root: Path, drive_file_id: str):
-        """Update file tracker after successful upload"""
-        try:
-            # Calculate relative path for tracking
-            if backup_root and backup_root in local_file.parents:
-                relative_path = local_file.relative_to(backup_root)
-                file_key = str(relative_path).replace('\\', '/')
-            else:
-                file_key = local_file.name
-            
-            # Get current file stats
-            current_size = local_file.stat().st_size
-            current_mtime = local_file.stat().st_mtime
-            
-            # Update tracker
-            self.file_tracker[file_key] = {
-                "local_size": current_size,
-                "local_mtime": current_mtime,
-                "drive_id": drive_file_id,
-                "drive_size": current_size,
-                "last_sync": datetime.now().isoformat()
-            }
-            
-            # Tracker updated in-memory; disk save is batched by sync_backup_files()
-            logger.info(f"Updated file tracker for: {file_key}")
-            
-        except Exception as e:
-            logger.warning(f"Error updating file tracker for {local_file.name}: {e}")
-    
-    def _clean_file_tracker(self, existing_files: set):
-        """Remove tracker entries for files that no longer exist"""
-        try:
-            keys_to_remove = []
-            for file_key in self.file_tracker.keys():
-                if file_key not in existing_files:
-                    keys_to_remove.append(file_key)
-            
-            for key in keys_to_remove:
-                del self.file_tracker[key]
-                logger.info(f"Removed deleted file from tracker: {key}")
-            
-            if keys_to_remove:
-                self._save_file_tracker()
-                
-        except Exception as e:
-            logger.warning(f"Error cleaning file tracker: {e}")
-    
-    def _file_needs_upload(self, local_file: Path, drive_file: Optional[Dict[str, Any]]) -> bool:
-        """Check if a file needs to be uploaded based on size comparison"""
-        if not drive_file:
-            return True  # File doesn't exist in Drive, needs upload
-        
-        try:
-            local_size = local_file.stat().st_size
-            drive_size = int(drive_file.get('size', 0))
-            
-            # If sizes are different, file has changed
-            if local_size != drive_size:
-                return True
-            
-            # If sizes are same, assume file is unchanged (for now)
-            # TODO: Could add MD5 comparison for small files for better accuracy
-            return False
-            
-        except Exception as e:
-            logger.warning(f"Error comparing file {local_file.name}: {e}")
-            return True  # Upload on error to be safe
-    
+    def _get_worker_service(self):
+        """Return this thread's Drive service, building it on first use"""
+        # Each thread gets its own Drive service with isolated SSL connections
+        if not hasattr(self._thread_local, 'service'):
+            self._thread_local.service = self._build_thread_service()
+        return self._thread_local.service
+
+    def _save_tracker_snapshot(self, entries: Dict[str, Dict[str, Any]]):
+        """Compaction callback - persist the full tracker into the data JSON"""
+        self.file_tracker = entries
+        self._save_file_tracker()
+
     def sync_backup_files(self, backup_dir: Path, project_name: str, note: str = "", force_sync: bool = False) -> bool:
-        """Sync backup files to Drive using local-first change detection"""
+        """Sync backup files to Drive using a local manifest and a pre-resolved upload plan"""
         if not backup_dir.exists():
             print(f"\033[91m✗ Error: Backup directory not found: {backup_dir}\033[0m")
             logger.error(f"Backup directory not found: {backup_dir}")
@@ -909,99 +674,96 @@ def sync_backup_files(self, backup_dir: Path, project_name: str, note: str = "",
         print(f"\033[94m[SYNC]\033[0m Starting local-first change detection...")
         logger.info(f"Starting Drive sync for {project_name}, force_sync={force_sync}")
 
-        # Load file tracker
-        self.file_tracker = self._load_file_tracker()
-
-        # Phase 1: Scan all files and determine which need upload (LOCAL ONLY - NO API CALLS)
-        files_to_upload = []
-        skipped_count = 0
-        total_count = 0
-        existing_files = set()
-
-        print("\033[96m━━━ Phase 1: Local File Scan ━━━\033[0m")
-        for backup_file in backup_dir.rglob("*"):
-            if backup_file.is_file() and not backup_file.name.startswith('.'):
-                total_count += 1
-
-                # Track existing files for cleanup
-                if backup_dir in backup_file.parents:
-                    relative_path = backup_file.relative_to(backup_dir)
-                    file_key = str(relative_path).replace('\\', '/')
-                    existing_files.add(file_key)
-
-                # Check if file needs upload (local check only)
-                if force_sync or self._check_file_needs_upload_local(backup_file, backup_dir):
-                    files_to_upload.append(backup_file)
-                else:
-                    skipped_count += 1
+        # Load file tracker: data JSON snapshot plus any journal left by an interrupted run
+        tracker = JournaledTracker(TRACKER_JOURNAL, self._load_file_tracker())
+        replayed = tracker.replay()
+        if replayed:
+            print(f"  → Resumed {replayed} tracker updates from interrupted sync")
+            logger.info(f"Replayed {replayed} tracker journal records")
 
-        # Clean tracker of deleted files
-        self._clean_file_tracker(existing_files)
+        # Phase 1: Build manifest, resolve folders, look up existing files (bounded API calls)
+        print("\033[96m━━━ Phase 1: Manifest & Plan ━━━\033[0m")
+        try:
+            plan = plan_sync(self.drive_service, backup_dir, project_name, tracker.entries,
+                             force=force_sync, execute=self._api_call_with_retry)
+        except Exception as e:
+            print(f"\033[91m✗ Error planning sync: {e}\033[0m")
+            logger.error(f"Error planning sync: {e}")
+            log_operation("sync_backup", {
+                "message": f"Failed to plan sync for {project_name}",
+                "error_details": {"exception_type": type(e).__name__, "stack_trace": str(e)}
+            }, success=False)
+            return False
+
+        for key in plan.deleted:
+            tracker.remove(key)
+            logger.info(f"Removed deleted file from tracker: {key}")
+        for folder_path in plan.folders_created:
+            print(f"\033[96m  📁 Created folder in Drive: {folder_path}\033[0m")
 
-        upload_count = len(files_to_upload)
+        upload_count = len(plan.tasks)
+        skipped_count = len(plan.unchanged)
+        total_count = plan.total_files
         print(f"\033[92m✓ Phase 1 complete\033[0m")
         print(f"  → {upload_count} files need upload")
         print(f"  → {skipped_count} files unchanged")
         print(f"  → {total_count} total files scanned")
-        logger.info(f"Scan complete: {upload_count} to upload, {skipped_count} skipped, {total_count} total")
+        print(f"  → {plan.api_calls} Drive API calls for planning")
+        logger.info(f"Plan complete: {upload_count} to upload, {skipped_count} skipped, "
+                    f"{total_count} total, {plan.api_calls} planning API calls")
 
-        # Phase 2: Upload only the files that need it (WITH API CALLS)
+        # Phase 2: Upload only the files that need it
         success_count = 0
-        completed_count = 0
-
-        BATCH_SAVE_INTERVAL = 50  # Save tracker to disk every N uploads
+        upload_calls = 0
         MAX_WORKERS = 3  # Parallel upload threads (kept low to avoid SSL contention)
-        tracker_lock = threading.Lock()
+        chunk_mb = self.config.get("config", {}).get("api_settings", {}).get("chunk_size_mb", 10)
 
         if upload_count > 0:
             print(f"\033[96m━━━ Phase 2: Upload Changes ({MAX_WORKERS} parallel) ━━━\033[0m")
+            completed = [0]
 
-            # Pre-create project folder before threads start (avoid duplicate creation)
-            self.get_or_create_project_folder(project_name)
+            def _on_result(task, ok, err):
+                completed[0] += 1
+                if ok:
+                    print(f"\033[93m↑\033[0m [{completed[0]}/{upload_count}] {task.path.name}")
+                else:
+                    print(f"\033[91m✗\033[0m [{completed[0]}/{upload_count}] {task.path.name}: {err}")
+                    logger.error(f"Error uploading {task.key}: {err}")
 
-            def _upload_one(backup_file):
-                """Upload a single file using a thread-local Drive service"""
-                # Each thread gets its own Drive service with isolated SSL connections
-                if not hasattr(self._thread_local, 'service'):
-                    self._thread_local.service = self._build_thread_service()
-                result = self.upload_backup_file(backup_file, project_name, note, backup_dir)
-                return (backup_file, result)
-
-            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                futures = {executor.submit(_upload_one, f): f for f in files_to_upload}
-                for future in as_completed(futures):
-                    backup_file, result = future.result()
-                    with tracker_lock:
-                        completed_count += 1
-                        if result:
-                            success_count += 1
-                        print(f"\033[93m↑\033[0m [{completed_count}/{upload_count}] {backup_file.name}")
-                        # Batch save: persist tracker and stats every N files
-                        if completed_count % BATCH_SAVE_INTERVAL == 0:
-                            self._save_file_tracker()
-                            save_data(self.data)
-                            logger.info(f"Batch save at {completed_count}/{upload_count}")
-
-            # Final save after all uploads complete
-            self._save_file_tracker()
-            save_data(self.data)
+            stats = execute_plan(plan, self._get_worker_service, tracker, note=note,
+                                 max_workers=MAX_WORKERS, chunk_size=int(chunk_mb) * 1024 * 1024,
+                                 execute=self._api_call_with_retry, on_result=_on_result)
+            success_count = stats["uploaded"]
+            upload_calls = stats["api_calls"]
+
+            # Update statistics (ensure statistics exists first)
+            statistics = self.data.setdefault("statistics", {})
+            for field in ("total_uploads", "successful_uploads", "failed_uploads", "total_bytes_uploaded"):
+                statistics.setdefault(field, 0)
+            statistics["total_uploads"] += upload_count
+            statistics["successful_uploads"] += success_count
+            statistics["failed_uploads"] += stats["failed"]
+            statistics["total_bytes_uploaded"] += stats["bytes"]
         else:
             print(f"\033[96m━━━ Phase 2: Upload Changes ━━━\033[0m")
             print("\033[92m✓ No files to upload - all files are up to date!\033[0m")
-        
+
+        # Fold the journal back into the data JSON snapshot (one full write per sync)
+        self.data.setdefault("runtime_state", {})["last_sync"] = datetime.now().isoformat()
+        tracker.compact(self._save_tracker_snapshot)
+
         # Count skipped files as successful
         total_success = success_count + skipped_count
-        
-        # Update last sync time
-        self.data["runtime_state"]["last_sync"] = datetime.now().isoformat()
-        save_data(self.data)
-        
+        total_calls = plan.api_calls + upload_calls
+        calls_per_file = (total_calls / upload_count) if upload_count else 0.0
+
         # Log sync operation
         log_operation("sync_backup", {
-            "message": f"Synced {total_success}/{total_count} files for {project_name} ({upload_count} uploaded, {skipped_count} skipped)",
+            "message": f"Synced {total_success}/{total_count} files for {project_name} ({upload_count} uploaded, {skipped_count} skipped, {total_calls} API calls)",
             "uploaded_count": success_count,
             "skipped_count": skipped_count,
             "total_count": total_count,
+            "api_calls": total_calls,
             "project": project_name,
             "force_sync": force_sync
         }, success=(total_success == total_count))
@@ -1017,8 +779,9 @@ def _upload_one(backup_file):
 
         print(f"  \033[92m↑\033[0m {success_count} files uploaded")
         print(f"  \033[90m→\033[0m {skipped_count} files unchanged")
+        print(f"  \033[90m→\033[0m {total_calls} API calls ({calls_per_file:.2f} per uploaded file)")
         print("="*70)
-        
+
         return total_success == total_count
 
 def get_status() -> Dict[str, Any]:
@@ -1039,6 +802,9 @@ def clear_file_tracker():
     """Clear the file tracker cache for fresh sync"""
     try:
         data = load_data()
+        # Drop any pending journal too, otherwise the next sync would replay it
+        if TRACKER_JOURNAL.exists():
+            TRACKER_JOURNAL.unlink()
         if "runtime_state" in data and "file_tracker" in data["runtime_state"]:
             tracker_count = len(data["runtime_state"]["file_tracker"])
             data["runtime_state"]["file_tracker"] = {}
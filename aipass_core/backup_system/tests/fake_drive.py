@@ -0,0 +1,126 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: fake_drive.py - In-process fake of the Drive v3 files() API
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: backup_system/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation - list/create/update + chunked uploads
+#
+# CODE STANDARDS:
+#   - Test helper only, never imported by apps/
+# =============================================
+
+"""In-process fake Drive service that counts every request it serves"""
+
+import re
+from pathlib import Path
+
+FOLDER_MIME = 'application/vnd.google-apps.folder'
+
+
+class FakeMedia:
+    """Stand-in for MediaFileUpload (records the chosen upload strategy)"""
+
+    def __init__(self, local_file: Path, resumable: bool, chunk_size: int):
+        self.path = Path(local_file)
+        self.size = self.path.stat().st_size
+        self.resumable = resumable
+        self.chunk_size = chunk_size
+
+
+class FakeRequest:
+    """Deferred request - work happens on execute()/next_chunk()"""
+
+    def __init__(self, drive, fn, media=None):
+        self.drive = drive
+        self.fn = fn
+        self.media = media
+        self._sent = 0
+
+    def execute(self):
+        self.drive.calls += 1
+        return self.fn()
+
+    def next_chunk(self, num_retries=0):
+        self.drive.calls += 1
+        self._sent += self.media.chunk_size
+        if self._sent < self.media.size:
+            return {"progress": self._sent}, None
+        return None, self.fn()
+
+
+class FakeFiles:
+    def __init__(self, drive):
+        self.drive = drive
+
+    def list(self, q="", fields="", pageSize=100, pageToken=None, **_):
+        def run():
+            parents = set(re.findall(r"'([^']+)' in parents", q))
+            folders_only = f"mimeType='{FOLDER_MIME}'" in q
+            no_folders = f"mimeType!='{FOLDER_MIME}'" in q
+            hits = []
+            for meta in self.drive.items.values():
+                is_folder = meta["mimeType"] == FOLDER_MIME
+                if folders_only and not is_folder:
+                    continue
+                if no_folders and is_folder:
+                    continue
+                if parents and not parents.intersection(meta.get("parents", [])):
+                    continue
+                hits.append(dict(meta))
+            start = int(pageToken or 0)
+            page = hits[start:start + pageSize]
+            result = {"files": page}
+            if start + pageSize < len(hits):
+                result["nextPageToken"] = str(start + pageSize)
+            return result
+        return FakeRequest(self.drive, run)
+
+    def create(self, body, media_body=None, fields="id", **_):
+        def run():
+            self.drive.next_id += 1
+            file_id = f"id{self.drive.next_id}"
+            self.drive.items[file_id] = {
+                "id": file_id,
+                "name": body["name"],
+                "mimeType": body.get("mimeType", "application/octet-stream"),
+                "parents": list(body.get("parents", [])),
+                "size": str(media_body.size) if media_body else None,
+            }
+            if media_body:
+                self.drive.uploads.append((file_id, media_body))
+            return {"id": file_id}
+        return FakeRequest(self.drive, run, media_body)
+
+    def update(self, fileId, body=None, media_body=None, fields="id", **_):
+        def run():
+            meta = self.drive.items[fileId]
+            meta.update({k: v for k, v in (body or {}).items() if k != "parents"})
+            if media_body:
+                meta["size"] = str(media_body.size)
+                self.drive.uploads.append((fileId, media_body))
+            return {"id": fileId}
+        return FakeRequest(self.drive, run, media_body)
+
+    def get(self, fileId, fields="id", **_):
+        return FakeRequest(self.drive, lambda: {"id": self.drive.items[fileId]["id"]})
+
+
+class FakeDriveService:
+    """Minimal Drive v3 service: files().list/create/update/get"""
+
+    def __init__(self):
+        self.items = {}
+        self.next_id = 0
+        self.calls = 0
+        self.uploads = []
+
+    def files(self):
+        return FakeFiles(self)
+
+    def file_names(self):
+        return sorted(m["name"] for m in self.items.values() if m["mimeType"] != FOLDER_MIME)
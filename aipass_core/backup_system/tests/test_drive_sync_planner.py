@@ -0,0 +1,200 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_drive_sync_planner.py - Drive sync planner tests against a fake Drive
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: backup_system/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation
+#
+# CODE STANDARDS:
+#   - Runs fully offline against tests/fake_drive.py
+# =============================================
+
+"""Tests for handlers/drive - manifest diffing, folder tree, journaled tracker, API call budget."""
+
+import os
+import sys
+from pathlib import Path
+
+# Add apps directory to path so 'handlers' package resolves
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from handlers.drive.manifest import build_local_manifest, diff_manifest
+from handlers.drive.folder_tree import DriveFolderTree
+from handlers.drive.sync_planner import plan_sync, execute_plan
+from handlers.drive.sync_tracker import JournaledTracker
+from fake_drive import FakeDriveService, FakeMedia
+
+
+def _make_tree(root: Path, dirs: int = 4, files_per_dir: int = 5) -> None:
+    for d in range(dirs):
+        sub = root / f"dir{d}" / "nested"
+        sub.mkdir(parents=True)
+        for f in range(files_per_dir):
+            (sub / f"file{f}.txt").write_text(f"{d}-{f}")
+    (root / "top.txt").write_text("top")
+    (root / ".hidden").write_text("skip me")
+
+
+def _sync(drive, backup_dir, tracker, force=False, chunk_size=256 * 1024):
+    plan = plan_sync(drive, backup_dir, "AIPass", tracker.entries, force=force)
+    for key in plan.deleted:
+        tracker.remove(key)
+    stats = execute_plan(plan, lambda: drive, tracker, max_workers=2,
+                         chunk_size=chunk_size, media_factory=FakeMedia)
+    return plan, stats
+
+
+class TestManifest:
+    """build_local_manifest / diff_manifest"""
+
+    def test_skips_hidden_and_uses_forward_slash_keys(self, temp_test_dir):
+        _make_tree(temp_test_dir, dirs=1, files_per_dir=2)
+        manifest = build_local_manifest(temp_test_dir)
+        assert sorted(manifest) == ["dir0/nested/file0.txt", "dir0/nested/file1.txt", "top.txt"]
+
+    def test_diff_detects_new_changed_deleted(self, temp_test_dir):
+        _make_tree(temp_test_dir, dirs=1, files_per_dir=2)
+        manifest = build_local_manifest(temp_test_dir)
+        info = manifest["top.txt"]
+        tracker = {
+            "top.txt": {"local_size": info["size"], "local_mtime": info["mtime"]},
+            "dir0/nested/file0.txt": {"local_size": -1, "local_mtime": 0},
+            "gone.txt": {"local_size": 1, "local_mtime": 1},
+        }
+        to_upload, unchanged, deleted = diff_manifest(manifest, tracker)
+        assert to_upload == ["dir0/nested/file0.txt", "dir0/nested/file1.txt"]
+        assert unchanged == ["top.txt"]
+        assert deleted == ["gone.txt"]
+
+
+class TestFolderTree:
+    """DriveFolderTree"""
+
+    def test_reuses_existing_folders_after_single_listing(self):
+        drive = FakeDriveService()
+        first = DriveFolderTree(drive)
+        leaf = first.ensure_path("AIPass/a/b")
+        second = DriveFolderTree(drive)
+        drive.calls = 0
+        assert second.ensure_path("AIPass/a/b") == leaf
+        assert second.ensure_path("AIPass/a") != leaf
+        assert drive.calls == 1
+        assert second.created == []
+
+
+class TestSyncPlanner:
+    """plan_sync + execute_plan end to end"""
+
+    def test_first_sync_uploads_everything_once(self, temp_test_dir):
+        backup = temp_test_dir / "backup"
+        _make_tree(backup)
+        drive = FakeDriveService()
+        tracker = JournaledTracker(temp_test_dir / "journal.jsonl")
+
+        plan, stats = _sync(drive, backup, tracker)
+
+        assert stats["uploaded"] == 21 and stats["failed"] == 0
+        assert drive.file_names().count("file0.txt") == 4
+        assert "dir2/nested/file3.txt" in tracker.entries
+
+    def test_unchanged_resync_makes_no_api_calls(self, temp_test_dir):
+        backup = temp_test_dir / "backup"
+        _make_tree(backup)
+        drive = FakeDriveService()
+        tracker = JournaledTracker(temp_test_dir / "journal.jsonl")
+        _sync(drive, backup, tracker)
+
+        drive.calls = 0
+        plan, stats = _sync(drive, backup, tracker)
+        assert plan.tasks == [] and len(plan.unchanged) == 21
+        assert drive.calls == 0
+
+    def test_untracked_remote_file_is_updated_not_duplicated(self, temp_test_dir):
+        backup = temp_test_dir / "backup"
+        _make_tree(backup, dirs=2, files_per_dir=3)
+        drive = FakeDriveService()
+        _sync(drive, backup, JournaledTracker(temp_test_dir / "a.jsonl"))
+        before = len(drive.items)
+
+        # Lost tracker - batched lookup must find the existing Drive files
+        plan, _ = _sync(drive, backup, JournaledTracker(temp_test_dir / "b.jsonl"))
+        assert all(task.existing_id for task in plan.tasks)
+        assert len(drive.items) == before
+
+    def test_large_file_streams_in_chunks(self, temp_test_dir):
+        backup = temp_test_dir / "backup"
+        backup.mkdir()
+        big = backup / "big.bin"
+        with open(big, "wb") as f:
+            f.truncate(6 * 1024 * 1024)
+        drive = FakeDriveService()
+        tracker = JournaledTracker(temp_test_dir / "journal.jsonl")
+
+        _plan, stats = _sync(drive, backup, tracker, chunk_size=1024 * 1024)
+        _file_id, media = drive.uploads[0]
+        assert media.resumable
+        assert stats["api_calls"] == 6
+
+    def test_deleted_files_are_dropped_from_tracker(self, temp_test_dir):
+        backup = temp_test_dir / "backup"
+        _make_tree(backup, dirs=1, files_per_dir=2)
+        drive = FakeDriveService()
+        tracker = JournaledTracker(temp_test_dir / "journal.jsonl")
+        _sync(drive, backup, tracker)
+
+        os.remove(backup / "top.txt")
+        plan, _ = _sync(drive, backup, tracker)
+        assert plan.deleted == ["top.txt"]
+        assert "top.txt" not in tracker.entries
+
+
+class TestJournaledTracker:
+    """Incremental flush, replay and compaction"""
+
+    def test_replay_resumes_interrupted_run(self, temp_test_dir):
+        journal = temp_test_dir / "journal.jsonl"
+        tracker = JournaledTracker(journal, flush_every=2)
+        for i in range(5):
+            tracker.record(f"f{i}", {"local_size": i})
+        # Simulated crash: f4 never flushed, plus a torn line
+        with open(journal, "a") as f:
+            f.write('{"key": "torn"')
+
+        resumed = JournaledTracker(journal)
+        assert resumed.replay() == 4
+        assert sorted(resumed.entries) == ["f0", "f1", "f2", "f3"]
+
+    def test_compact_saves_snapshot_and_clears_journal(self, temp_test_dir):
+        journal = temp_test_dir / "journal.jsonl"
+        saved = {}
+        tracker = JournaledTracker(journal, {"old": {}}, flush_every=1)
+        tracker.record("new", {"local_size": 1})
+        tracker.remove("old")
+        tracker.compact(saved.update)
+        assert saved == {"new": {"local_size": 1}}
+        assert not journal.exists()
+
+
+class TestApiCallBudget:
+    """Benchmark: Drive API calls per synced file"""
+
+    def test_calls_per_file_first_sync(self, temp_test_dir):
+        backup = temp_test_dir / "backup"
+        _make_tree(backup, dirs=20, files_per_dir=10)
+        drive = FakeDriveService()
+        tracker = JournaledTracker(temp_test_dir / "journal.jsonl")
+
+        plan, stats = _sync(drive, backup, tracker)
+        per_file = drive.calls / stats["uploaded"]
+        print(f"\n  planner: {drive.calls} calls for {stats['uploaded']} files "
+              f"({per_file:.2f}/file, planning {plan.api_calls})")
+
+        # Legacy path: >= 3 calls per file (folder get + existence list + upload)
+        # plus one list/create per path segment on cache misses
+        assert per_file < 1.3
@@ -4,15 +4,16 @@
 # META DATA HEADER
 # Name: cortex.py - Cortex Main Orchestrator
 # Date: 2025-11-15
-# Version: 2.2.0
+# Version: 2.4.0
 # Category: cortex
 # Commands: create, update, delete, regenerate, --list, --help
 #
 # CHANGELOG (Max 5 entries):
+#   - v2.4.0 (2026-10-18): --verify for regenerate-template-registry (full template manifest rehash)
+#   - v2.3.0 (2026-10-18): --jobs N for update-branch --all
 #   - v2.2.0 (2025-11-15): Added drone compliance (Commands line in help)
 #   - v2.1.0 (2025-11-04): Renamed from branch_operations to cortex
 #   - v2.0.0 (2025-11-03): Restructured with modular architecture
-#   - v1.0.0 (2025-10-29): Initial version
 #
 # CODE STANDARDS:
 #   - Error handling: Use error handler system (apps/handlers/error/)
@@ -249,6 +250,8 @@ def main():
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
     parser.add_argument('--all', dest='all_branches', action='store_true', help='Apply to all branches')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without applying')
+    parser.add_argument('--jobs', '-j', type=int, default=0, help='Worker processes for update-branch --all (0 = one per CPU)')
+    parser.add_argument('--verify', action='store_true', help='Rehash every template file (regenerate-template-registry)')
     parser.add_argument('--template', default=None, help='Template name: branch, business_branch (for create-branch)')
     parser.add_argument('--role', default=None, help='Branch role (for create-branch)')
     parser.add_argument('--traits', default=None, help='Branch traits (for create-branch)')
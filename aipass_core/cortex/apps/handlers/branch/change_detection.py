@@ -4,11 +4,12 @@
 # ===================AIPASS====================
 # META DATA HEADER
 # Name: change_detection.py - Branch Change Detection Handler
-# Date: 2025-11-09
-# Version: 1.0.0
+# Date: 2026-10-18
+# Version: 1.1.0
 # Category: cortex/handlers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Optional TemplateManifest - listing and ignore checks without rglob/reloading ignores
 #   - v1.0.0 (2025-11-09): Phase 1 - Handler infrastructure created
 #
 # CODE STANDARDS:
@@ -23,11 +24,14 @@
 - Addition detection
 - Update detection
 - Pruned file detection
+
+Both entry points accept a TemplateManifest (handlers/registry/manifest.py);
+with one, the template is not walked and .registry_ignore.json is not reloaded.
 """
 
 # Standard library imports
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Optional
 import sys
 
 # INFRASTRUCTURE IMPORT PATTERN
@@ -44,13 +48,14 @@
 # TEMPLATE VALIDATION
 # =============================================================================
 
-def detect_unregistered_items(template_dir: Path, template_registry: Dict) -> Dict:
+def detect_unregistered_items(template_dir: Path, template_registry: Dict, manifest: Optional[Any] = None) -> Dict:
     """
     Detect files/directories in template that aren't registered in .template_registry.json
 
     Args:
         template_dir: Path to template directory
         template_registry: Template registry dict
+        manifest: TemplateManifest for template_dir - its listing replaces the rglob walk
 
     Returns:
         Dict with:
@@ -72,6 +77,12 @@ def detect_unregistered_items(template_dir: Path, template_registry: Dict) -> Di
     for dir_info in template_registry.get("directories", {}).values():
         registered_dirs.add(dir_info.get("path", dir_info.get("current_name")))
 
+    if manifest is not None:
+        # Manifest walk already skipped ignored items
+        unregistered["unregistered_files"] = [p for p in manifest.files if p not in registered_files]
+        unregistered["unregistered_dirs"] = [p for p in manifest.directories if p not in registered_dirs]
+        return unregistered
+
     # Load ignore patterns
     ignore_data = load_ignore_patterns(template_dir)
     ignore_files = ignore_data.get("ignore_files", [])
@@ -107,7 +118,8 @@ def detect_changes(
     branch_dir: Path,
     branch_name: str,
     old_branch_tracking: Dict | None = None,
-    trace: bool = False
+    trace: bool = False,
+    manifest: Optional[Any] = None
 ) -> Dict:
     """
     Detect changes between template and branch using ID tracking
@@ -119,6 +131,7 @@ def detect_changes(
         branch_name: Branch name
         old_branch_tracking: OLD branch tracking (before PHASE 0 sync) for rename detection
         trace: Enable trace output
+        manifest: TemplateManifest - memoized ignore checks shared across branches
 
     Returns:
         Dict with:
@@ -134,10 +147,16 @@ def detect_changes(
         "updates": []
     }
 
-    # Load ignore patterns from template
-    ignore_data = load_ignore_patterns(TEMPLATE_DIR)
-    ignore_files = ignore_data.get("ignore_files", [])
-    ignore_patterns = ignore_data.get("ignore_patterns", [])
+    if manifest is not None:
+        is_ignored = manifest.is_ignored
+    else:
+        # Load ignore patterns from template
+        ignore_data = load_ignore_patterns(TEMPLATE_DIR)
+        ignore_files = ignore_data.get("ignore_files", [])
+        ignore_patterns = ignore_data.get("ignore_patterns", [])
+
+        def is_ignored(rel_path: str) -> bool:
+            return should_ignore(TEMPLATE_DIR / rel_path, TEMPLATE_DIR, ignore_files, ignore_patterns)
 
     if trace:
         pass  # Trace/debug output removed - handlers should not display output
@@ -149,8 +168,7 @@ def detect_changes(
             template_name = file_info["current_name"]
 
             # Check if file should be ignored
-            template_file_path = TEMPLATE_DIR / template_name
-            if should_ignore(template_file_path, TEMPLATE_DIR, ignore_files, ignore_patterns):
+            if is_ignored(template_name):
                 continue  # Skip ignored files
 
             # Handle placeholder substitution
@@ -173,20 +191,18 @@ def detect_changes(
     # Map template IDs to current names (filter out ignored files)
     for file_id, file_info in template_registry.get("files", {}).items():
         template_name = file_info["current_name"]
-        template_file_path = TEMPLATE_DIR / template_name
 
         # Skip ignored files
-        if should_ignore(template_file_path, TEMPLATE_DIR, ignore_files, ignore_patterns):
+        if is_ignored(template_name):
             continue
 
         template_ids[file_id] = template_name
 
     for dir_id, dir_info in template_registry.get("directories", {}).items():
         dir_name = dir_info["current_name"]
-        template_dir_path = TEMPLATE_DIR / dir_name
 
         # Skip ignored directories
-        if should_ignore(template_dir_path, TEMPLATE_DIR, ignore_files, ignore_patterns):
+        if is_ignored(dir_name):
             continue
 
         template_ids[dir_id] = dir_name
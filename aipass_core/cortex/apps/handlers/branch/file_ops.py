@@ -5,10 +5,12 @@
 # META DATA HEADER
 # Name: file_ops.py - File Operations Handler
 # Date: 2025-11-04
-# Version: 1.0.0
+# Version: 1.2.0
 # Category: cortex/handlers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): copy_template_contents substitutes and validates placeholders in one pass, optional placeholder_index
+#   - v1.1.0 (2026-10-18): create_backup hardlinks files unchanged since the previous backup; copy_template_file takes pre-read template texts
 #   - v1.0.0 (2025-11-04): Extracted from branch_lib, file operation functions
 #
 # CODE STANDARDS:
@@ -27,8 +29,10 @@
 """
 
 # Standard library imports
+import os
 import shutil
 import json
+from fnmatch import fnmatch
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Iterable, Any
@@ -39,7 +43,7 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 
 # Internal handler imports
-from cortex.apps.handlers.branch.placeholders import replace_placeholders, validate_no_placeholders
+from cortex.apps.handlers.branch.placeholders import replace_placeholders, validate_no_placeholders, get_engine
 from cortex.apps.handlers.registry.ignore import load_ignore_patterns, should_ignore
 
 
@@ -534,7 +538,8 @@ def copy_template_contents(
     branch_name: str,
     exclude_patterns: List[str],
     file_renames: Dict[str, str],
-    allowed_placeholders: set | None = None
+    allowed_placeholders: set | None = None,
+    placeholder_index: Optional[Dict[str, List[Dict[str, Any]]]] = None
 ) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
     """
     Copy template contents to target directory
@@ -547,6 +552,9 @@ def copy_template_contents(
         exclude_patterns: List of patterns to exclude
         file_renames: Dict mapping template names to rename patterns
         allowed_placeholders: Set of placeholders that don't need to be replaced yet
+        placeholder_index: If given, filled with every placeholder left in each
+            copied text file (allowed ones included), keyed by the file's final
+            relative path - lets later checks skip re-reading the tree
 
     Returns:
         Tuple of (copied items list, skipped items list, validation errors list)
@@ -558,6 +566,10 @@ def copy_template_contents(
     copied = []
     skipped = []
     validation_errors = []
+    allowed = set(allowed_placeholders or [])
+
+    # One compiled engine for every file: substitutes and reports leftovers in a single scan
+    engine = get_engine(replacements)
 
     # Walk template directory recursively including hidden files
     def walk_all(directory):
@@ -617,13 +629,13 @@ def walk_all(directory):
                 with open(item, 'r', encoding='utf-8') as f:
                     content = f.read()
 
-                # Replace placeholders
-                content = replace_placeholders(content, replacements)
+                # Replace placeholders - leftovers are reported by the same pass
+                content, leftovers = engine.substitute(content)
+                if placeholder_index is not None:
+                    placeholder_index[str(renamed_path or rel_path)] = leftovers
+                unreplaced = [p for p in leftovers if p['placeholder'] not in allowed]
 
-                # Validate all placeholders were replaced
-                is_valid, unreplaced = validate_no_placeholders(content, str(rel_path), allowed_placeholders)
-
-                if not is_valid:
+                if unreplaced:
                     # Collect error for summary reporting (don't print immediately)
                     validation_errors.append({
                         'file': str(rel_path),
@@ -646,20 +658,62 @@ def walk_all(directory):
 # UPDATE OPERATIONS
 # =============================================================================
 
-def create_backup(branch_dir: Path) -> Tuple[Optional[Path], str]:
+def _linking_copy(previous_dir: Path, backup_dir: Path, counts: Dict[str, int]):
+    """
+    Build a copy function that hardlinks files unchanged since the previous backup
+
+    A file whose size and mtime match its copy in the previous backup is linked
+    to that copy (same inode, no data written); everything else is copied. Links
+    only ever point into backup generations, never at live branch files, so a
+    branch writing to its own files in place cannot alter the backup.
+
+    Args:
+        previous_dir: Previous backup generation (may not exist)
+        backup_dir: Backup being written
+        counts: Dict updated with 'linked' / 'copied' totals
+
+    Returns:
+        copy_function for shutil.copytree / direct use
+    """
+    def copy_function(src, dst):
+        src_path = Path(src)
+        dst_path = Path(dst)
+        try:
+            previous = previous_dir / dst_path.relative_to(backup_dir)
+            src_stat = src_path.stat()
+            prev_stat = previous.stat()
+            if (prev_stat.st_size == src_stat.st_size
+                    and prev_stat.st_mtime_ns == src_stat.st_mtime_ns):
+                os.link(previous, dst_path)
+                counts['linked'] += 1
+                return str(dst_path)
+        except (OSError, ValueError):
+            pass  # No previous copy, or links unsupported here - copy instead
+        shutil.copy2(src_path, dst_path)
+        counts['copied'] += 1
+        return str(dst_path)
+
+    return copy_function
+
+
+def create_backup(branch_dir: Path, backup_ignore: Optional[Dict[str, Any]] = None) -> Tuple[Optional[Path], str]:
     """
     Create full backup of branch directory before modifications
 
     Uses single 'latest' backup that gets overwritten each time.
     Loads ignore patterns from .backup_ignore.json if available.
+    Files unchanged since the previous backup are hardlinked to it instead of
+    copied, so repeat backups only write what changed.
 
     Args:
         branch_dir: Path to branch directory
+        backup_ignore: Pre-loaded .backup_ignore.json (skips reading it again)
 
     Returns:
         Tuple of (backup directory path or None, status message)
     """
     backup_dir = branch_dir / ".backup" / "latest"
+    previous_dir = branch_dir / ".backup" / "previous"
 
     # Load backup ignore patterns from template - REQUIRED, no defaults
     AIPASS_ROOT = Path.home() / "aipass_core"
@@ -670,33 +724,34 @@ def create_backup(branch_dir: Path) -> Tuple[Optional[Path], str]:
     ignore_dirs = {".backup", "backups"}
     ignore_patterns_list = []
 
-    # Load patterns from template - required
-    if not template_ignore_file.exists():
-        error_msg = (
-            f"ERROR: Backup ignore configuration missing!\n"
-            f"  Required file: {template_ignore_file}\n"
-            f"  Please create .backup_ignore.json in the template with ignore_directories and ignore_patterns.\n"
-            f"  Without this config, backup could copy massive directories (like .venv, node_modules, etc.)"
-        )
-        return (None, error_msg)
+    if backup_ignore is None:
+        # Load patterns from template - required
+        if not template_ignore_file.exists():
+            error_msg = (
+                f"ERROR: Backup ignore configuration missing!\n"
+                f"  Required file: {template_ignore_file}\n"
+                f"  Please create .backup_ignore.json in the template with ignore_directories and ignore_patterns.\n"
+                f"  Without this config, backup could copy massive directories (like .venv, node_modules, etc.)"
+            )
+            return (None, error_msg)
 
-    try:
-        with open(template_ignore_file, 'r', encoding='utf-8') as f:
-            backup_ignore = json.load(f)
-            ignore_dirs.update(backup_ignore.get("ignore_directories", []))
-            ignore_patterns_list = backup_ignore.get("ignore_patterns", [])
-    except Exception as e:
-        error_msg = (
-            f"ERROR: Failed to load backup ignore config!\n"
-            f"  File: {template_ignore_file}\n"
-            f"  Error: {e}\n"
-            f"  Fix the JSON syntax and try again."
-        )
-        return (None, error_msg)
+        try:
+            with open(template_ignore_file, 'r', encoding='utf-8') as f:
+                backup_ignore = json.load(f)
+        except Exception as e:
+            error_msg = (
+                f"ERROR: Failed to load backup ignore config!\n"
+                f"  File: {template_ignore_file}\n"
+                f"  Error: {e}\n"
+                f"  Fix the JSON syntax and try again."
+            )
+            return (None, error_msg)
+
+    ignore_dirs.update(backup_ignore.get("ignore_directories", []))
+    ignore_patterns_list = backup_ignore.get("ignore_patterns", [])
 
     def ignore_patterns(directory, contents):
         """Ignore backup dirs, large dependency dirs, and pattern matches"""
-        from fnmatch import fnmatch
         ignored = []
         for name in contents:
             # Check if directory name matches ignore list
@@ -709,44 +764,41 @@ def ignore_patterns(directory, contents):
         return ignored
 
     try:
-        # Remove old backup if exists
+        # Keep the old backup as link source until the new one is complete
+        if previous_dir.exists():
+            shutil.rmtree(previous_dir)
         if backup_dir.exists():
-            shutil.rmtree(backup_dir)
+            backup_dir.rename(previous_dir)
 
         backup_dir.mkdir(parents=True, exist_ok=True)
-
-        # Count items for progress
-        items = list(branch_dir.iterdir())
-        total_items = len([i for i in items if i.name not in [".backup", "backups"]])
-        processed = 0
-        skipped = 0
+        counts = {'linked': 0, 'copied': 0}
+        copy_function = _linking_copy(previous_dir, backup_dir, counts)
 
         # Copy all files except .backup and backups directories
-        for item in items:
+        for item in branch_dir.iterdir():
             # Skip .backup directory and backups directory
             if item.name in [".backup", "backups"]:
                 continue
 
             # Check if this item will be ignored (directory or file pattern match)
             if item.name in ignore_dirs:
-                skipped += 1
                 continue
 
             # Check if file matches any ignore patterns
-            from fnmatch import fnmatch
             if any(fnmatch(item.name, pattern) for pattern in ignore_patterns_list):
-                skipped += 1
                 continue
 
             if item.is_file():
-                processed += 1
-                shutil.copy2(item, backup_dir / item.name)
+                copy_function(item, backup_dir / item.name)
             elif item.is_dir():
-                processed += 1
                 # Use ignore function to skip .backup and backups at all levels
-                shutil.copytree(item, backup_dir / item.name, ignore=ignore_patterns, dirs_exist_ok=True)
+                shutil.copytree(item, backup_dir / item.name, ignore=ignore_patterns,
+                                copy_function=copy_function, dirs_exist_ok=True)
 
-        return (backup_dir, f"Backup created at {backup_dir}")
+        if previous_dir.exists():
+            shutil.rmtree(previous_dir)
+
+        return (backup_dir, f"Backup created at {backup_dir} ({counts['copied']} copied, {counts['linked']} linked)")
 
     except Exception as e:
         return (None, f"Backup creation failed: {e}")
@@ -849,7 +901,9 @@ def copy_template_file(
     registry: Dict[str, Any],
     branch_name: str,
     file_renames: Optional[Dict[str, str]] = None,
-    force_overwrite: bool = False
+    force_overwrite: bool = False,
+    template_texts: Optional[Dict[str, str]] = None,
+    replacements: Optional[Dict[str, str]] = None
 ) -> Tuple[str, str]:
     """
     Copy a new file from template to branch using path from registry
@@ -863,6 +917,8 @@ def copy_template_file(
         branch_name: Branch name for placeholder substitution
         file_renames: Optional dict mapping template names to rename patterns
         force_overwrite: If True, overwrite existing files (default: False)
+        template_texts: Pre-read template texts by registry path (TemplateSnapshot.texts)
+        replacements: Pre-built placeholder replacements for this branch
 
     Returns:
         Tuple of (status, message) where status is:
@@ -957,15 +1013,18 @@ def copy_template_file(
                     replace_placeholders
                 )
 
-                with open(source, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = template_texts.get(source_path) if template_texts and file_info else None
+                if content is None:
+                    with open(source, 'r', encoding='utf-8') as f:
+                        content = f.read()
 
-                # Build replacements dict
-                # Use minimal defaults if metadata not available
-                repo = "aipass_core"  # Default repo
-                profile = "AIPass Core Infrastructure"  # Default profile
+                if replacements is None:
+                    # Build replacements dict
+                    # Use minimal defaults if metadata not available
+                    repo = "aipass_core"  # Default repo
+                    profile = "AIPass Core Infrastructure"  # Default profile
 
-                replacements = build_replacements_dict(branch_name, branch_dir, repo, profile)
+                    replacements = build_replacements_dict(branch_name, branch_dir, repo, profile)
 
                 # Replace placeholders
                 content = replace_placeholders(content, replacements)
@@ -5,10 +5,11 @@
 # META DATA HEADER
 # Name: placeholders.py - Placeholder Replacement Handler
 # Date: 2025-11-04
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: cortex/handlers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): PlaceholderEngine - one compiled alternation, single pass, reports unreplaced in the same scan, text and JSON trees
 #   - v1.0.0 (2025-11-04): Extracted from branch_lib, placeholder replacement functions
 #
 # CODE STANDARDS:
@@ -19,6 +20,7 @@
 Placeholder Replacement Handler
 
 Functions for handling template placeholders:
+- Single-pass substitution engine (text and JSON trees)
 - Placeholder replacement in strings
 - Placeholder validation
 - Replacements dictionary building
@@ -27,7 +29,6 @@
 
 # Standard library imports
 import re
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Iterable, Any
@@ -38,6 +39,187 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 
 
+# =============================================================================
+# SUBSTITUTION ENGINE
+# =============================================================================
+
+# Any double-brace token - what validate_no_placeholders() looks for
+PLACEHOLDER_PATTERN = re.compile(r'\{\{([^}]+)\}\}')
+
+# Compiled engines by replacements content (replace_placeholders is called per file)
+_ENGINE_CACHE: Dict[Tuple[Tuple[str, str], ...], "PlaceholderEngine"] = {}
+_ENGINE_CACHE_MAX = 32
+
+
+def _line_context(lines: List[str], line_num: int) -> str:
+    """±2 lines around line_num (1-based), numbered - same format as validate_no_placeholders"""
+    start_line = max(0, line_num - 3)
+    end_line = min(len(lines), line_num + 2)
+    return '\n'.join(f"  {start_line + i + 1:4d}: {l[:100]}"
+                     for i, l in enumerate(lines[start_line:end_line]))
+
+
+class PlaceholderEngine:
+    """
+    Single-pass placeholder substitution
+
+    One compiled regex - an alternation of every replacement key, falling back
+    to any other double-brace token - replaces all known placeholders in one
+    scan and reports the unknown ones found by that same scan, so no second
+    read is needed to validate the output.
+
+    Values are inserted verbatim and never rescanned. If a value itself holds
+    a placeholder (AUTO_GENERATED_TREE -> TREE_PLACEHOLDER), that placeholder
+    is reported at the spot where the value was inserted.
+
+    Report entries match validate_no_placeholders(): placeholder, line_number,
+    line_content, context (line numbers refer to the substituted output).
+    JSON entries carry json_path in place of line information.
+    """
+
+    def __init__(self, replacements: Dict[str, str], allowed_placeholders: Optional[Iterable[str]] = None):
+        self.replacements = {key: str(value) for key, value in replacements.items()}
+        self.allowed = frozenset(allowed_placeholders or ())
+
+        # Longest keys first so no key shadows a longer one sharing its prefix
+        keys = sorted(self.replacements, key=len, reverse=True)
+        known = '|'.join(re.escape(key) for key in keys) if keys else '(?!)'
+        self.pattern = re.compile(r'\{\{(?:(' + known + r')\}\}|([^{}\n]+)\}\})')
+
+        # Extra output lines per inserted value (line numbers refer to the output)
+        self._multiline = {key: value.count('\n') for key, value in self.replacements.items() if '\n' in value}
+
+        # Placeholders carried in by replacement values
+        self._introduced = {
+            key: [m.group(1) for m in PLACEHOLDER_PATTERN.finditer(value)]
+            for key, value in self.replacements.items() if '{{' in value
+        }
+
+    # ---------- text ----------
+
+    def substitute(self, content: str) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Replace every known placeholder in one pass
+
+        Args:
+            content: Text with placeholders
+
+        Returns:
+            (substituted text, unreplaced placeholder details - allowed ones excluded)
+        """
+        if '{{' not in content:
+            return content, []
+
+        found: List[Tuple[str, int]] = []  # (placeholder, input offset)
+        table = self.replacements
+
+        def replace(match):
+            key = match[1]
+            if key is not None:
+                return table[key]
+            found.append((match[2], match.start()))
+            return match[0]
+
+        output = self.pattern.sub(replace, content)
+
+        # Placeholders carried in by inserted values
+        for key, introduced in self._introduced.items():
+            needle = '{{' + key + '}}'
+            pos = content.find(needle)
+            while pos != -1:
+                found.extend((name, pos) for name in introduced)
+                pos = content.find(needle, pos + len(needle))
+
+        found = [(name, pos) for name, pos in found if name not in self.allowed]
+        if not found:
+            return output, []
+        found.sort(key=lambda item: item[1])
+        return output, self._details(content, output, found)
+
+    def _details(self, content: str, output: str, found: List[Tuple[str, int]]) -> List[Dict[str, Any]]:
+        """Line number/context for leftovers (error path only - offsets mapped to output lines)"""
+        lines = output.split('\n')
+        details = []
+        line_num, last = 1, 0
+        for name, pos in found:
+            # Input lines so far, plus lines added by multi-line values inserted before pos
+            line_num += content.count('\n', last, pos)
+            if self._multiline:
+                line_num += sum(self._multiline[m[1]] for m in self.pattern.finditer(content, last, pos)
+                                if m[1] in self._multiline)
+            last = pos
+            line = lines[line_num - 1] if 0 < line_num <= len(lines) else ''
+            details.append({
+                'placeholder': name,
+                'line_number': line_num,
+                'line_content': line.strip()[:100],
+                'context': _line_context(lines, line_num)
+            })
+        return details
+
+    # ---------- JSON trees ----------
+
+    def substitute_data(self, data: Any, path: str = "") -> Tuple[Any, List[Dict[str, Any]]]:
+        """
+        Replace placeholders in every string (keys included) of a JSON-compatible tree
+
+        Args:
+            data: Dict/list/scalar tree (not modified)
+            path: Path prefix for reported entries
+
+        Returns:
+            (new tree, unreplaced placeholder details with json_path)
+        """
+        details: List[Dict[str, Any]] = []
+        return self._walk(data, path, details), details
+
+    def _walk(self, data: Any, path: str, details: List[Dict[str, Any]]) -> Any:
+        if isinstance(data, str):
+            if '{{' not in data:
+                return data
+            output, found = self.substitute(data)
+            for entry in found:
+                details.append({
+                    'placeholder': entry['placeholder'],
+                    'json_path': path or '$',
+                    'line_number': 0,
+                    'line_content': output[:100],
+                    'context': f"  {path or '$'}: {output[:100]}"
+                })
+            return output
+        if isinstance(data, dict):
+            result = {}
+            for key, value in data.items():
+                new_key = self._walk(key, f"{path}.{key}" if path else key, details) if isinstance(key, str) else key
+                result[new_key] = self._walk(value, f"{path}.{key}" if path else str(key), details)
+            return result
+        if isinstance(data, list):
+            return [self._walk(item, f"{path}[{i}]", details) for i, item in enumerate(data)]
+        return data
+
+
+def get_engine(replacements: Dict[str, str], allowed_placeholders: Optional[Iterable[str]] = None) -> PlaceholderEngine:
+    """
+    Compiled engine for a replacements dict, reused across calls with the same content
+
+    Args:
+        replacements: Placeholder name -> value
+        allowed_placeholders: Placeholders that may legitimately remain
+
+    Returns:
+        PlaceholderEngine
+    """
+    key = (tuple(sorted((k, str(v)) for k, v in replacements.items())),
+           tuple(sorted(allowed_placeholders or ())))
+    engine = _ENGINE_CACHE.get(key)
+    if engine is None:
+        if len(_ENGINE_CACHE) >= _ENGINE_CACHE_MAX:
+            _ENGINE_CACHE.clear()
+        engine = PlaceholderEngine(replacements, allowed_placeholders)
+        _ENGINE_CACHE[key] = engine
+    return engine
+
+
 # =============================================================================
 # PLACEHOLDER REPLACEMENT
 # =============================================================================
@@ -55,11 +237,7 @@ def replace_placeholders(content: str, replacements: Dict[str, str]) -> str:
     Returns:
         Content with placeholders replaced
     """
-    for placeholder, value in replacements.items():
-        # Build pattern with double braces
-        pattern = "{{" + placeholder + "}}"
-        content = content.replace(pattern, value)
-    return content
+    return get_engine(replacements).substitute(content)[0]
 
 
 def validate_no_placeholders(
@@ -116,7 +294,8 @@ def validate_no_placeholders(
 def detect_unreplaced_placeholders(
     target_dir: Path,
     branch_name: str,
-    allowed_placeholders: Optional[Iterable[str]] = None
+    allowed_placeholders: Optional[Iterable[str]] = None,
+    scanned: Optional[Dict[str, List[Dict[str, Any]]]] = None
 ) -> List[Tuple[Path, List[Dict[str, Any]]]]:
     """
     Scan standard branch memory files for unreplaced template placeholders.
@@ -125,6 +304,9 @@ def detect_unreplaced_placeholders(
         target_dir: Path to branch directory
         branch_name: Branch name (used to build expected filenames)
         allowed_placeholders: Placeholders that may legitimately remain
+        scanned: Placeholders already found while copying, by final relative
+                 path (copy_template_contents placeholder_index) - those files
+                 are not read again
 
     Returns:
         List of tuples (Path to file, list of placeholders found)
@@ -137,9 +319,16 @@ def detect_unreplaced_placeholders(
         target_dir / f"{branchname_upper}.ai_mail.json",
         target_dir / f"{branchname_upper}.id.json",
     ]
+    allowed = set(allowed_placeholders or [])
 
     issues: List[Tuple[Path, List[Dict[str, Any]]]] = []
     for file_path in expected_files:
+        if scanned is not None and file_path.name in scanned:
+            placeholders = [p for p in scanned[file_path.name] if p['placeholder'] not in allowed]
+            if placeholders:
+                issues.append((file_path, placeholders))
+            continue
+
         if not file_path.exists() or not file_path.is_file():
             continue
 
@@ -209,11 +398,11 @@ def apply_placeholder_replacements_to_dict(
     Raises:
         ValueError: If replacement results in invalid JSON structure
     """
-    serialized = json.dumps(data, indent=2, ensure_ascii=False)
-    serialized = replace_placeholders(serialized, replacements)
+    # Strings are substituted in place - values never pass through JSON
+    # serialization, so quotes/backslashes in them cannot corrupt the tree
     try:
-        return json.loads(serialized)
-    except json.JSONDecodeError as exc:
+        return get_engine(replacements).substitute_data(data)[0]
+    except (TypeError, RecursionError) as exc:
         raise ValueError(f"Invalid JSON after placeholder replacement: {exc}") from exc
 
 
@@ -0,0 +1,175 @@
+#!/home/aipass/.venv/bin/python3
+# -*- coding: utf-8 -*-
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: template_snapshot.py - Template Snapshot Handler
+# Date: 2026-10-18
+# Version: 1.1.0
+# Category: cortex/handlers
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Hashes, listing and ignores come from the persisted TemplateManifest
+#   - v1.0.0 (2026-10-18): Initial implementation - template-side update work loaded once per run
+#
+# CODE STANDARDS:
+#   - Error handling: Use error handler system (apps/handlers/error/)
+# =============================================
+
+"""
+Template Snapshot Handler
+
+Everything an update reads from the branch template, loaded once:
+- .template_registry.json, its filesystem validation and unregistered items
+- .migrations.json, .registry_ignore.json and .backup_ignore.json
+- Content hash of every registered template file (from the TemplateManifest,
+  so only files whose stat changed since the last run are rehashed)
+- Raw text of every registered text file, parsed JSON templates
+
+A batch update builds one snapshot and hands it to every branch (and every
+worker process) instead of re-reading and re-hashing the template per branch.
+Placeholder expansion stays per branch - its values depend on the branch name.
+"""
+
+# Standard library imports
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# INFRASTRUCTURE IMPORT PATTERN
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+TEMPLATE_DIR = AIPASS_ROOT / "cortex" / "templates" / "branch_template"
+
+from cortex.apps.handlers.registry.meta_ops import (
+    load_template_registry,
+    validate_template_registry,
+    calculate_file_hash
+)
+from cortex.apps.handlers.registry.manifest import TemplateManifest
+from cortex.apps.handlers.branch.change_detection import detect_unregistered_items
+from cortex.apps.handlers.json.ops import load_migrations
+
+
+# JSON templates merged into every branch: (branch file pattern, template file)
+JSON_FILE_MAP = [
+    ("{BRANCHNAME}.json", "PROJECT.json"),
+    ("{BRANCHNAME}.local.json", "LOCAL.json"),
+    ("{BRANCHNAME}.observations.json", "OBSERVATIONS.json"),
+    ("{BRANCHNAME}.ai_mail.json", "AI_MAIL.json"),
+    ("{BRANCHNAME}.id.json", "BRANCH.ID.json"),
+    ("README.json", "README.json"),
+]
+
+
+class TemplateSnapshot:
+    """Read-only view of the branch template shared by every branch in a run
+
+    Attributes:
+        template_dir: Template directory the snapshot was taken from
+        manifest: Refreshed TemplateManifest (None if the registry could not be loaded)
+        registry: Loaded .template_registry.json (None if missing/invalid)
+        registry_error: Load error message, if any
+        mismatches: validate_template_registry() output
+        unregistered: detect_unregistered_items() output
+        stale_hashes: Registry entries whose recorded content_hash no longer matches the file
+        migrations: Loaded .migrations.json (or None)
+        ignore_data: Loaded .registry_ignore.json
+        backup_ignore: Loaded .backup_ignore.json (or None if missing/invalid)
+        file_hashes: Registry path -> content hash (same format as calculate_file_hash)
+        texts: Registry path -> file text (binary files absent)
+        json_templates: Template JSON filename -> parsed dict
+    """
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR):
+        self.template_dir = Path(template_dir)
+        self.manifest: Optional[TemplateManifest] = None
+        self.registry: Optional[Dict] = None
+        self.registry_error: Optional[str] = None
+        self.mismatches: List[Dict] = []
+        self.unregistered: Dict[str, List[str]] = {"unregistered_files": [], "unregistered_dirs": []}
+        self.stale_hashes: List[str] = []
+        self.migrations: Optional[Dict[str, Any]] = None
+        self.ignore_data: Dict[str, List[str]] = {"ignore_files": [], "ignore_patterns": []}
+        self.backup_ignore: Optional[Dict[str, Any]] = None
+        self.file_hashes: Dict[str, str] = {}
+        self.texts: Dict[str, str] = {}
+        self.json_templates: Dict[str, Dict] = {}
+
+    @classmethod
+    def load(cls, template_dir: Path = TEMPLATE_DIR, manifest_path: Optional[Path] = None,
+             verify: Optional[bool] = None) -> "TemplateSnapshot":
+        """
+        Read the template once
+
+        Args:
+            template_dir: Template directory
+            manifest_path: TemplateManifest location (default manifest.MANIFEST_FILE)
+            verify: Forwarded to TemplateManifest.load (None = periodic full-hash verify)
+
+        Returns:
+            Populated snapshot (check .registry - None means the registry could not be loaded)
+        """
+        snapshot = cls(template_dir)
+        snapshot.registry, snapshot.registry_error = load_template_registry()
+        if not snapshot.registry:
+            return snapshot
+
+        manifest = TemplateManifest.load(snapshot.template_dir, manifest_path, verify=verify)
+        snapshot.manifest = manifest
+        snapshot.mismatches = validate_template_registry(snapshot.registry, snapshot.template_dir)
+        snapshot.unregistered = detect_unregistered_items(snapshot.template_dir, snapshot.registry, manifest=manifest)
+        snapshot.migrations = load_migrations(snapshot.template_dir)
+        snapshot.ignore_data = manifest.ignore_data
+
+        backup_ignore_file = snapshot.template_dir / ".backup_ignore.json"
+        if backup_ignore_file.exists():
+            try:
+                with open(backup_ignore_file, 'r', encoding='utf-8') as f:
+                    snapshot.backup_ignore = json.load(f)
+            except Exception:
+                snapshot.backup_ignore = None  # create_backup reports the error
+
+        # Read every registered file once - hashes from the manifest
+        for file_info in snapshot.registry.get("files", {}).values():
+            rel_path = file_info.get("path", file_info.get("current_name"))
+            if not rel_path or rel_path in snapshot.file_hashes:
+                continue
+            file_path = snapshot.template_dir / rel_path
+            if not file_path.is_file():
+                continue
+
+            content_hash = manifest.hash(rel_path)
+            if content_hash is None:
+                content_hash, _ = calculate_file_hash(file_path)  # Registered but ignored
+            snapshot.file_hashes[rel_path] = content_hash
+            recorded = file_info.get("content_hash")
+            if recorded and content_hash and recorded != content_hash:
+                snapshot.stale_hashes.append(rel_path)
+
+            try:
+                snapshot.texts[rel_path] = file_path.read_text(encoding='utf-8')
+            except (UnicodeDecodeError, OSError):
+                pass  # Binary - copied byte for byte
+
+        for _, template_file in JSON_FILE_MAP:
+            template_path = snapshot.template_dir / template_file
+            if not template_path.exists():
+                continue
+            try:
+                with open(template_path, 'r', encoding='utf-8') as f:
+                    snapshot.json_templates[template_file] = json.load(f)
+            except Exception:
+                pass  # update_branch_file re-reads and reports it
+
+        return snapshot
+
+    def text(self, rel_path: str) -> Optional[str]:
+        """Template file text by registry path (None for binary/unknown files)"""
+        return self.texts.get(rel_path)
+
+    def json_template(self, template_file: str) -> Optional[Dict]:
+        """Parsed JSON template by template filename (None if absent)"""
+        return self.json_templates.get(template_file)
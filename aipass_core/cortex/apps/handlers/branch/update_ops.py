@@ -0,0 +1,459 @@
+#!/home/aipass/.venv/bin/python3
+# -*- coding: utf-8 -*-
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: update_ops.py - Branch Update Operations Handler
+# Date: 2026-10-18
+# Version: 1.1.1
+# Category: cortex/handlers
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.1.1 (2026-10-18): Pool workers receive the template snapshot once via an initializer, tasks carry only the plan
+#   - v1.1.0 (2026-10-18): Change detection uses the snapshot's TemplateManifest for ignore checks
+#   - v1.0.0 (2026-10-18): Initial implementation - read-only plan, apply, process-pool batch apply
+#
+# CODE STANDARDS:
+#   - Error handling: Use error handler system (apps/handlers/error/)
+#   - No display - results carry messages for the module to print
+# =============================================
+
+"""
+Branch Update Operations Handler
+
+A branch update in two steps:
+- plan_branch_update(): registry sync, reconciliation and change detection
+  done in memory - nothing on disk is touched, so a plan doubles as the
+  dry-run diff
+- apply_branch_update(): saves the planned metadata, backs up, executes
+  renames/additions/updates/pruning, merges JSON files, regenerates
+  .branch_meta.json and verifies the result
+
+Both take a TemplateSnapshot so template files are read and hashed once
+per run, however many branches are updated.
+
+apply_branches() runs many applies across a process pool. Branches are
+independent directories, so each is one task; results come back in input
+order and are handed to on_branch_done as they finish. The snapshot is
+handed to each worker once by the pool initializer - tasks carry only the
+branch plan.
+"""
+
+# Standard library imports
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# INFRASTRUCTURE IMPORT PATTERN
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+from cortex.apps.handlers.branch.metadata import get_branch_name
+from cortex.apps.handlers.branch.file_ops import (
+    create_backup,
+    execute_rename,
+    copy_template_file,
+    archive_pruned_file
+)
+from cortex.apps.handlers.branch.reconcile import (
+    reconcile_branch_state,
+    update_branch_meta_from_reconciliation
+)
+from cortex.apps.handlers.registry.meta_ops import (
+    load_branch_meta,
+    save_branch_meta,
+    generate_branch_meta_for_existing_branch,
+    FILE_RENAMES
+)
+from cortex.apps.handlers.registry.sync_ops import (
+    needs_synchronization,
+    synchronize_registry,
+    preserve_tracking_snapshot
+)
+from cortex.apps.handlers.json.ops import update_branch_file, prepare_json_backup_dir
+from cortex.apps.handlers.branch.placeholders import (
+    build_replacements_dict,
+    apply_placeholder_replacements_to_dict
+)
+from cortex.apps.handlers.branch.change_detection import detect_changes
+from cortex.apps.handlers.branch.template_snapshot import TemplateSnapshot, JSON_FILE_MAP
+
+BranchDoneFunc = Callable[[Dict, int, int], None]
+
+
+# =============================================================================
+# PLAN
+# =============================================================================
+
+def plan_branch_update(target_dir: Path, snapshot: TemplateSnapshot, trace: bool = False) -> Dict[str, Any]:
+    """
+    Work out what an update would do, without writing anything
+
+    Args:
+        target_dir: Branch directory
+        snapshot: Template snapshot for this run
+        trace: Forwarded to reconciliation/change detection
+
+    Returns:
+        Plan dict:
+            target_dir, branch_name, branch_upper
+            branch_meta: Metadata after in-memory sync/reconciliation
+            meta_changed: True if branch_meta differs from what is on disk
+            sync_reason: Why the registry structure was resynced (or None)
+            reconciliation: Missing/untracked/mismatch counts (or None)
+            changes: detect_changes() output
+            total_changes: Renames + additions + updates + pruned
+            error: Set when the branch cannot be planned
+    """
+    target_dir = Path(target_dir).resolve()
+    branch_name = get_branch_name(target_dir)
+    plan: Dict[str, Any] = {
+        'target_dir': target_dir,
+        'branch_name': branch_name,
+        'branch_upper': branch_name.upper().replace("-", "_"),
+        'branch_meta': None,
+        'meta_changed': False,
+        'sync_reason': None,
+        'reconciliation': None,
+        'changes': {"renames": [], "additions": [], "updates": [], "pruned": []},
+        'total_changes': 0,
+        'error': None
+    }
+    template_registry = snapshot.registry
+    if not template_registry:
+        plan['error'] = "Could not load .template_registry.json"
+        return plan
+
+    branch_meta, _ = load_branch_meta(target_dir)
+
+    # Registry sync - old tracking kept for rename detection
+    old_branch_tracking = preserve_tracking_snapshot(branch_meta)
+    needs_sync, sync_reason = needs_synchronization(branch_meta, template_registry)
+    if needs_sync:
+        branch_meta = synchronize_registry(branch_meta, template_registry, target_dir, trace=trace)
+        plan['sync_reason'] = sync_reason
+        plan['meta_changed'] = True
+
+    if branch_meta is None:
+        # Branch predates ID tracking
+        branch_meta = generate_branch_meta_for_existing_branch(target_dir, branch_name, template_registry)
+        if branch_meta is None:
+            plan['error'] = "Could not generate branch metadata"
+            return plan
+        plan['meta_changed'] = True
+
+    # Pre-flight reconciliation against the filesystem
+    reconciliation = reconcile_branch_state(target_dir, branch_meta, trace=trace, fast_mode=True)
+    if reconciliation['needs_update']:
+        plan['reconciliation'] = {
+            'missing_files': len(reconciliation['missing_files']),
+            'untracked_files': len(reconciliation['untracked_files']),
+            'hash_mismatches': len(reconciliation['hash_mismatches'])
+        }
+        branch_meta, _ = update_branch_meta_from_reconciliation(branch_meta, reconciliation, trace=trace)
+        plan['meta_changed'] = True
+
+    changes = detect_changes(
+        template_registry,
+        branch_meta,
+        target_dir,
+        branch_name,
+        old_branch_tracking=old_branch_tracking,
+        trace=trace,
+        manifest=snapshot.manifest
+    )
+    plan['branch_meta'] = branch_meta
+    plan['changes'] = changes
+    plan['total_changes'] = sum(len(changes[key]) for key in ("renames", "additions", "updates", "pruned"))
+    return plan
+
+
+def save_planned_meta(plan: Dict[str, Any]) -> Optional[str]:
+    """
+    Persist metadata corrected during planning (registry sync, reconciliation)
+
+    Args:
+        plan: plan_branch_update() output
+
+    Returns:
+        Error message, or None
+    """
+    if not plan['meta_changed'] or not plan['branch_meta']:
+        return None
+    success, error = save_branch_meta(plan['target_dir'], plan['branch_meta'])
+    if success:
+        plan['meta_changed'] = False
+        return None
+    return error or "Metadata save failed"
+
+
+# =============================================================================
+# APPLY
+# =============================================================================
+
+def apply_branch_update(plan: Dict[str, Any], snapshot: TemplateSnapshot, no_backup: bool = False) -> Dict[str, Any]:
+    """
+    Execute a plan
+
+    Args:
+        plan: plan_branch_update() output
+        snapshot: Template snapshot the plan was made against
+        no_backup: Skip the pre-update backup
+
+    Returns:
+        Result dict: branch, success, success_count, skip_count, error_count,
+        backup_dir, missing_files, tracked, messages (lines for display),
+        timings ({'backup': s, 'apply': s})
+    """
+    start = time.perf_counter()
+    target_dir = plan['target_dir']
+    branch_name = plan['branch_name']
+    branchname_upper = plan['branch_upper']
+    changes = plan['changes']
+    template_registry = snapshot.registry or {}
+    messages: List[str] = []
+    result: Dict[str, Any] = {
+        'branch': branchname_upper,
+        'success': False,
+        'success_count': 0,
+        'skip_count': 0,
+        'error_count': 0,
+        'backup_dir': None,
+        'missing_files': [],
+        'tracked': 0,
+        'messages': messages,
+        'timings': {'backup': 0.0, 'apply': 0.0}
+    }
+
+    if plan['error']:
+        messages.append(f"ERROR: {plan['error']}")
+        result['error_count'] = 1
+        return result
+
+    error = save_planned_meta(plan)
+    if error:
+        messages.append(f"  WARNING: {error}")
+
+    if plan['total_changes'] == 0:
+        result['success'] = True
+        result['timings']['apply'] = time.perf_counter() - start
+        return result
+
+    # Backup before any modification
+    if not no_backup:
+        backup_start = time.perf_counter()
+        backup_dir, backup_msg = create_backup(target_dir, backup_ignore=snapshot.backup_ignore)
+        result['timings']['backup'] = time.perf_counter() - backup_start
+        if not backup_dir:
+            messages.append("ERROR: Backup creation failed - aborting update")
+            messages.append(f"  {backup_msg}")
+            result['error_count'] = 1
+            result['timings']['apply'] = time.perf_counter() - start
+            return result
+        result['backup_dir'] = str(backup_dir)
+        messages.append(backup_msg)
+    else:
+        messages.append("⚠️  Skipping backup (--no-backup flag)")
+
+    success_count = 0
+    skip_count = 0
+    error_count = 0
+
+    # Placeholder values built once per branch, shared by every file copied
+    file_replacements = build_replacements_dict(branch_name, target_dir, "aipass_core", "AIPass Core Infrastructure")
+
+    for old_name, new_name, file_id in changes["renames"]:
+        renamed, _ = execute_rename(target_dir, old_name, new_name, file_id)
+        if renamed:
+            success_count += 1
+        else:
+            error_count += 1
+            messages.append(f"  ❌ Failed: {old_name} -> {new_name}")
+
+    for filename, file_id in changes["additions"]:
+        status, msg = copy_template_file(
+            snapshot.template_dir, target_dir, filename, file_id, template_registry, branch_name,
+            FILE_RENAMES, template_texts=snapshot.texts, replacements=file_replacements
+        )
+        if status == "added":
+            success_count += 1
+        elif status == "skipped":
+            skip_count += 1
+        else:
+            error_count += 1
+            messages.append(f"  ❌ Failed to add {filename}: {msg or 'Addition failed'}")
+
+    for filename, file_id, _old_hash, _new_hash in changes["updates"]:
+        status, msg = copy_template_file(
+            snapshot.template_dir, target_dir, filename, file_id, template_registry, branch_name,
+            FILE_RENAMES, force_overwrite=True, template_texts=snapshot.texts, replacements=file_replacements
+        )
+        if status in ("updated", "added"):
+            success_count += 1
+        elif status in ("protected", "skipped"):
+            skip_count += 1  # Python files are protected - expected
+        else:
+            error_count += 1
+            messages.append(f"  ❌ Failed to update {filename}: {msg or 'Update failed'}")
+
+    for filename, file_id in changes["pruned"]:
+        archived, _ = archive_pruned_file(target_dir, filename, file_id, AIPASS_ROOT)
+        if archived:
+            success_count += 1
+
+    # Deep-merge JSON files from the template
+    json_replacements = build_replacements_dict(
+        branch_name=branch_name,
+        target_dir=target_dir,
+        repo="unknown",
+        profile="unknown"
+    )
+    timestamp = datetime.now().strftime("%Y%m%d")
+    json_backup_dir = prepare_json_backup_dir(target_dir)
+
+    for branch_pattern, template_file in JSON_FILE_MAP:
+        branch_file = branch_pattern.format(BRANCHNAME=branchname_upper)
+        template_file_path = snapshot.template_dir / template_file
+        template_data = snapshot.json_template(template_file)
+        if template_data is None and not template_file_path.exists():
+            continue
+
+        merged, _summary = update_branch_file(
+            branch_file=target_dir / branch_file,
+            template_file=template_file_path,
+            backup_dir=json_backup_dir,
+            timestamp=timestamp,
+            file_label=branch_file,
+            replacements=json_replacements,
+            apply_placeholders_func=apply_placeholder_replacements_to_dict,
+            migrations=snapshot.migrations,
+            template_data=template_data
+        )
+        if merged:
+            success_count += 1
+        else:
+            error_count += 1
+            messages.append(f"  ❌ Failed to update {branch_file}: JSON merge/update failed")
+
+    # Regenerate .branch_meta.json from the updated tree
+    branch_meta = plan['branch_meta']
+    updated_meta = generate_branch_meta_for_existing_branch(target_dir, branch_name, template_registry)
+    if updated_meta:
+        if branch_meta.get("branch_created", "unknown") != "unknown":
+            updated_meta["branch_created"] = branch_meta["branch_created"]
+        branch_meta = updated_meta
+    else:
+        branch_meta["last_updated"] = datetime.now().date().isoformat()
+
+    saved, _ = save_branch_meta(target_dir, branch_meta)
+    if saved:
+        result['tracked'] = len(branch_meta.get('file_tracking', {}))
+        messages.append(f"  Metadata updated ({result['tracked']} files tracked)")
+    else:
+        messages.append("  WARNING: Metadata save failed")
+
+    # Post-flight verification
+    verification = reconcile_branch_state(target_dir, branch_meta, fast_mode=True)
+    result['missing_files'] = [list(entry) for entry in verification['missing_files']]
+    error_count += len(verification['missing_files'])
+
+    result.update({
+        'success': error_count == 0,
+        'success_count': success_count,
+        'skip_count': skip_count,
+        'error_count': error_count
+    })
+    result['timings']['apply'] = time.perf_counter() - start
+    return result
+
+
+# =============================================================================
+# BATCH APPLY
+# =============================================================================
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """
+    Normalize a --jobs value
+
+    Args:
+        jobs: Requested workers (0 or None = one per CPU)
+
+    Returns:
+        Worker count >= 1
+    """
+    if not jobs or jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
+
+
+# Set in each pool worker by _init_worker()
+_worker_snapshot: Optional[TemplateSnapshot] = None
+
+
+def _init_worker(snapshot: TemplateSnapshot) -> None:
+    """Pool initializer - keep the run's template snapshot for every task in this worker"""
+    global _worker_snapshot
+    _worker_snapshot = snapshot
+
+
+def _pooled_apply_task(plan: Dict[str, Any], no_backup: bool) -> Dict[str, Any]:
+    """Worker entry point for pooled applies (snapshot from _init_worker)"""
+    return _apply_task(plan, _worker_snapshot, no_backup)  # type: ignore[arg-type]
+
+
+def _apply_task(plan: Dict[str, Any], snapshot: TemplateSnapshot, no_backup: bool) -> Dict[str, Any]:
+    """Worker entry point - an exception becomes a failed result, not a dead pool"""
+    try:
+        return apply_branch_update(plan, snapshot, no_backup=no_backup)
+    except Exception as e:
+        return {
+            'branch': plan['branch_upper'], 'success': False, 'success_count': 0, 'skip_count': 0,
+            'error_count': 1, 'backup_dir': None, 'missing_files': [], 'tracked': 0,
+            'messages': [f"ERROR: {e}"], 'timings': {'backup': 0.0, 'apply': 0.0}
+        }
+
+
+def apply_branches(plans: List[Dict[str, Any]], snapshot: TemplateSnapshot, no_backup: bool = False,
+                   jobs: int = 1, on_branch_done: Optional[BranchDoneFunc] = None) -> List[Dict[str, Any]]:
+    """
+    Apply many plans, one process per branch at a time
+
+    Args:
+        plans: plan_branch_update() outputs
+        snapshot: Template snapshot shared by every plan
+        no_backup: Skip pre-update backups
+        jobs: Worker processes (1 = in-process)
+        on_branch_done: Called as on_branch_done(result, completed, total) per branch
+
+    Returns:
+        Results in plans order
+    """
+    total = len(plans)
+    results: List[Optional[Dict[str, Any]]] = [None] * total
+    completed = 0
+
+    if jobs <= 1 or total <= 1:
+        for index, plan in enumerate(plans):
+            results[index] = _apply_task(plan, snapshot, no_backup)
+            completed += 1
+            if on_branch_done:
+                on_branch_done(results[index], completed, total)
+        return results  # type: ignore[return-value]
+
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=min(jobs, total), mp_context=context,
+                             initializer=_init_worker, initargs=(snapshot,)) as pool:
+        futures = {pool.submit(_pooled_apply_task, plan, no_backup): index for index, plan in enumerate(plans)}
+        for future in as_completed(futures):
+            index = futures[future]
+            results[index] = future.result()
+            completed += 1
+            if on_branch_done:
+                on_branch_done(results[index], completed, total)
+
+    return results  # type: ignore[return-value]
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: json_ops.py - JSON Operations Handler
 # Date: 2025-11-04
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: cortex/handlers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): update_branch_file accepts a pre-parsed template
 #   - v1.0.0 (2025-11-04): JSON operations for branch updates
 #
 # CODE STANDARDS:
@@ -24,6 +25,7 @@
 - Field counting for change reporting
 """
 
+import copy
 import json
 import shutil
 from pathlib import Path
@@ -616,7 +618,8 @@ def update_branch_file(
     file_label: str,
     replacements: Dict[str, str],
     apply_placeholders_func,
-    migrations: Optional[Dict[str, Any]] = None
+    migrations: Optional[Dict[str, Any]] = None,
+    template_data: Optional[Dict[str, Any]] = None
 ) -> Tuple[bool, Dict[str, Any]]:
     """
     Update single branch JSON file from template with optional migrations
@@ -630,13 +633,17 @@ def update_branch_file(
         replacements: Placeholder replacements
         apply_placeholders_func: Function to apply placeholders
         migrations: Optional migrations dict from .migrations.json
+        template_data: Pre-parsed template (shared across branches - copied, never mutated)
 
     Returns:
         (success, change_summary_dict)
     """
     # Load existing and template
     existing, _ = load_json(branch_file)
-    template, _ = load_json(template_file)
+    if template_data is not None:
+        template = copy.deepcopy(template_data)
+    else:
+        template, _ = load_json(template_file)
 
     if template is None:
         return True, {"action": "skipped_template_missing"}
@@ -0,0 +1,268 @@
+#!/home/aipass/.venv/bin/python3
+# -*- coding: utf-8 -*-
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: manifest.py - Template Manifest Handler
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: cortex/handlers
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation - persisted stat/hash manifest of the branch template
+#
+# CODE STANDARDS:
+#   - Error handling: Use error handler system (apps/handlers/error/)
+# =============================================
+
+"""
+Template Manifest Handler
+
+Persisted manifest of the branch template: relative path -> size, mtime_ns, sha256.
+- One scandir walk per load, ignored directories pruned instead of descended
+- Files are rehashed only when their size/mtime_ns changed (or were racy)
+- Full-hash verify mode, forced or automatic every VERIFY_INTERVAL_DAYS
+
+Registry regeneration, template snapshots and change detection read hashes,
+the file/directory listing and ignore decisions from here instead of
+rglob-ing and rehashing the template on every run.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# INFRASTRUCTURE IMPORT PATTERN
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+TEMPLATE_DIR = AIPASS_ROOT / "cortex" / "templates" / "branch_template"
+MANIFEST_FILE = AIPASS_ROOT / "cortex" / "cortex_json" / "template_manifest.json"
+
+# Full rehash at least this often, even when every stat matches
+VERIFY_INTERVAL_DAYS = 7
+
+MANIFEST_VERSION = 1
+
+from cortex.apps.handlers.registry.ignore import load_ignore_patterns, should_ignore
+
+
+def _sha256(path: str) -> str:
+    """Full SHA-256 hex digest of a file (chunked read)"""
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class TemplateManifest:
+    """Stat-validated content hashes for every non-ignored template file
+
+    Attributes:
+        template_dir: Template directory the manifest describes
+        manifest_path: Where the manifest is persisted
+        files: Relative path -> {"size", "mtime_ns", "sha256"}
+        directories: Relative paths of non-ignored directories
+        ignore_data: .registry_ignore.json patterns used for the walk
+        last_verified: ISO timestamp of the last full-hash verify (or None)
+        stats: Last refresh counters - reused, hashed, removed, verified, mismatches
+    """
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR, manifest_path: Optional[Path] = None):
+        self.template_dir = Path(template_dir)
+        self.manifest_path = Path(manifest_path or MANIFEST_FILE)
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.directories: List[str] = []
+        self.ignore_data: Dict[str, List[str]] = {"ignore_files": [], "ignore_patterns": []}
+        self.last_verified: Optional[str] = None
+        self.scanned_ns = 0
+        self.stats: Dict[str, Any] = {"reused": 0, "hashed": 0, "removed": 0, "verified": False, "mismatches": []}
+        self._ignored: Dict[str, bool] = {}
+
+    @classmethod
+    def load(cls, template_dir: Path = TEMPLATE_DIR, manifest_path: Optional[Path] = None,
+             verify: Optional[bool] = None) -> "TemplateManifest":
+        """
+        Load the persisted manifest, refresh it against the filesystem and save it
+
+        Args:
+            template_dir: Template directory
+            manifest_path: Manifest file location (default MANIFEST_FILE)
+            verify: True = rehash everything, False = never, None = when the last
+                verify is older than VERIFY_INTERVAL_DAYS
+
+        Returns:
+            Refreshed manifest (see .stats for what the refresh did)
+        """
+        manifest = cls(template_dir, manifest_path)
+        manifest._read()
+        if verify is None:
+            verify = manifest.verify_due()
+        manifest.refresh(verify=verify)
+        manifest.save()
+        return manifest
+
+    def _read(self) -> None:
+        """Load persisted entries (ignored if missing, corrupt or for another template)"""
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            return  # Rebuilt from scratch on refresh
+        metadata = data.get("metadata", {})
+        if metadata.get("version") != MANIFEST_VERSION or metadata.get("template_dir") != str(self.template_dir):
+            return
+        self.files = data.get("files", {})
+        self.directories = data.get("directories", [])
+        self.last_verified = metadata.get("last_verified")
+        self.scanned_ns = metadata.get("scanned_ns", 0)
+
+    def verify_due(self) -> bool:
+        """True if no full-hash verify has run within VERIFY_INTERVAL_DAYS"""
+        if not self.last_verified:
+            return True
+        try:
+            last = datetime.fromisoformat(self.last_verified)
+        except ValueError:
+            return True
+        return datetime.now() - last >= timedelta(days=VERIFY_INTERVAL_DAYS)
+
+    def refresh(self, verify: bool = False) -> Dict[str, Any]:
+        """
+        Walk the template and rehash only files whose stat changed
+
+        An entry whose mtime_ns is not older than the previous walk is "racy" - it
+        may have been written again within the same timestamp tick after it was
+        hashed - so it is rehashed regardless.
+
+        Args:
+            verify: Rehash every file and record entries whose stat matched but
+                content did not (stats['mismatches'])
+
+        Returns:
+            self.stats
+        """
+        previous = self.files
+        racy_from = self.scanned_ns
+        self.scanned_ns = time.time_ns()
+        self.ignore_data = load_ignore_patterns(self.template_dir)
+        self._ignored = {}
+        self.files = {}
+        self.directories = []
+        stats: Dict[str, Any] = {"reused": 0, "hashed": 0, "removed": 0, "verified": verify, "mismatches": []}
+
+        ignore_files = self.ignore_data.get("ignore_files", [])
+        ignore_patterns = self.ignore_data.get("ignore_patterns", [])
+
+        pending = [""]
+        while pending:
+            rel_dir = pending.pop()
+            try:
+                with os.scandir(self.template_dir / rel_dir) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                is_dir = entry.is_dir()
+                entry_path = Path(entry.path)
+
+                if should_ignore(entry_path, self.template_dir, ignore_files, ignore_patterns):
+                    self._ignored[rel_path] = True
+                    # Children are ignored too unless only the exact name is listed
+                    if is_dir and not (
+                        any(fnmatch(entry.name, p) for p in ignore_patterns)
+                        or should_ignore(entry_path, self.template_dir, [], [])
+                    ):
+                        pending.append(rel_path)
+                    continue
+
+                if is_dir:
+                    self.directories.append(rel_path)
+                    pending.append(rel_path)
+                    continue
+                if not entry.is_file():
+                    continue
+
+                st = entry.stat()
+                old = previous.get(rel_path)
+                unchanged = (
+                    old is not None
+                    and old.get("size") == st.st_size
+                    and old.get("mtime_ns") == st.st_mtime_ns
+                    and old.get("mtime_ns", 0) < racy_from
+                    and old.get("sha256")
+                )
+                if unchanged and not verify:
+                    self.files[rel_path] = old
+                    stats["reused"] += 1
+                    continue
+
+                try:
+                    digest = _sha256(entry.path)
+                except OSError:
+                    continue  # Unreadable - absent from the manifest, retried next run
+                stats["hashed"] += 1
+                if unchanged and digest != old.get("sha256"):
+                    stats["mismatches"].append(rel_path)
+                self.files[rel_path] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+
+        self.directories.sort()
+        stats["removed"] = len(set(previous) - set(self.files))
+        if verify:
+            self.last_verified = datetime.now().isoformat(timespec='seconds')
+        self.stats = stats
+        return stats
+
+    def save(self) -> Optional[str]:
+        """
+        Persist the manifest (atomic replace)
+
+        Returns:
+            Error message, or None
+        """
+        data = {
+            "metadata": {
+                "version": MANIFEST_VERSION,
+                "template_dir": str(self.template_dir),
+                "scanned_ns": self.scanned_ns,
+                "last_verified": self.last_verified
+            },
+            "files": self.files,
+            "directories": self.directories
+        }
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.manifest_path)
+            return None
+        except Exception as e:
+            return f"Error saving {self.manifest_path.name}: {e}"
+
+    def hash(self, rel_path: str) -> Optional[str]:
+        """Content hash in calculate_file_hash format (12 chars), None if not in the manifest"""
+        entry = self.files.get(rel_path)
+        return entry["sha256"][:12] if entry else None
+
+    def is_ignored(self, rel_path: str) -> bool:
+        """should_ignore() for a template-relative path, memoized across branches"""
+        if rel_path not in self._ignored:
+            self._ignored[rel_path] = should_ignore(
+                self.template_dir / rel_path,
+                self.template_dir,
+                self.ignore_data.get("ignore_files", []),
+                self.ignore_data.get("ignore_patterns", [])
+            )
+        return self._ignored[rel_path]
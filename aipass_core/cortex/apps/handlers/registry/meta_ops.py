@@ -4,11 +4,12 @@
 # ===================AIPASS====================
 # META DATA HEADER
 # Name: meta_ops.py - Metadata Operations Handler
-# Date: 2025-11-04
-# Version: 1.0.0
+# Date: 2026-10-18
+# Version: 1.1.0
 # Category: cortex/handlers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): heal_branch_meta takes template hashes from a TemplateManifest
 #   - v1.0.0 (2025-11-04): Metadata operations for branch updates
 #
 # CODE STANDARDS:
@@ -28,7 +29,7 @@
 import hashlib
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, Tuple, List
+from typing import Any, Dict, Optional, Tuple, List
 import sys
 
 # =============================================================================
@@ -162,6 +163,28 @@ def calculate_file_hash(file_path: Path) -> Tuple[str, Optional[str]]:
         return ("", f"Could not hash {file_path.name}: {e}")
 
 
+def _hash_to_template_id(template_registry: Dict, manifest: Optional[Any] = None) -> Dict[str, str]:
+    """
+    Build content hash -> template file ID lookup
+
+    Args:
+        template_registry: Template registry dict
+        manifest: TemplateManifest - current hashes win over (possibly stale) registry ones
+
+    Returns:
+        Dict of hash -> file ID
+    """
+    hash_to_template_id = {}
+    for file_id, file_info in template_registry.get("files", {}).items():
+        content_hash = None
+        if manifest is not None:
+            content_hash = manifest.hash(file_info.get("path", file_info.get("current_name", "")))
+        content_hash = content_hash or file_info.get("content_hash")
+        if content_hash:
+            hash_to_template_id[content_hash] = file_id
+    return hash_to_template_id
+
+
 # =============================================================================
 # TEMPLATE REGISTRY OPERATIONS
 # =============================================================================
@@ -217,7 +240,8 @@ def heal_branch_meta(
     branch_dir: Path,
     branch_meta: Optional[Dict],
     template_registry: Dict,
-    template_version: str
+    template_version: str,
+    manifest: Optional[Any] = None
 ) -> Tuple[Optional[Dict], List[str]]:
     """
     Auto-heal branch metadata if format is outdated or missing
@@ -232,6 +256,7 @@ def heal_branch_meta(
         branch_meta: Loaded metadata (or None if missing)
         template_registry: Template registry for regeneration
         template_version: Current template version
+        manifest: TemplateManifest - current template hashes without rehashing
 
     Returns:
         Tuple of (healed metadata dict or None, list of change messages)
@@ -261,10 +286,7 @@ def heal_branch_meta(
         changes.append("Old branch_meta format detected - auto-healing")
 
         # Build hash→template_id lookup for ID remapping
-        hash_to_template_id = {}
-        for file_id, file_info in template_registry.get("files", {}).items():
-            if file_info.get("content_hash"):
-                hash_to_template_id[file_info["content_hash"]] = file_id
+        hash_to_template_id = _hash_to_template_id(template_registry, manifest)
 
         # Old format: {"filename.py": "f001"}
         # New format: {"f001": {"current_name": "filename.py", "content_hash": "abc123"}}
@@ -311,10 +333,7 @@ def heal_branch_meta(
     # Format is already correct - but check if IDs need remapping (silent check)
 
     # Build hash→template_id lookup
-    hash_to_template_id = {}
-    for file_id, file_info in template_registry.get("files", {}).items():
-        if file_info.get("content_hash"):
-            hash_to_template_id[file_info["content_hash"]] = file_id
+    hash_to_template_id = _hash_to_template_id(template_registry, manifest)
 
     # Check each tracked file for ID reassignment
     remapped_tracking = {}
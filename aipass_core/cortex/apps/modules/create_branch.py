@@ -4,11 +4,12 @@
 # META DATA HEADER
 # Name: create_branch.py - Create New AIPass Branch
 # Date: 2025-11-15
-# Version: 1.1.0
+# Version: 1.2.0
 # Category: cortex
 # Commands: create, create-branch, new, --help
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): Placeholder validation reuses the copy pass results instead of re-reading memory files
 #   - v1.1.0 (2025-11-15): Added drone compliance (Commands line in help)
 #   - v1.0.0 (2025-11-04): Clean implementation - pure branch creation, no infrastructure
 #
@@ -269,8 +270,10 @@ def create_branch(target_dir: Path, overrides: Optional[dict] = None, template_n
             "KEY_CAPABILITIES", "BASIC_USAGE", "COMMON_WORKFLOWS", "EXAMPLES",
             "DEPENDS_ON", "INTEGRATES_WITH", "PROVIDES_TO",
         }
+        placeholder_index = {}
         copied, skipped, validation_errors = copy_template_contents(
-            template_dir, target_dir, replacements, branch_name, EXCLUDE_PATTERNS, file_renames, allowed_placeholders
+            template_dir, target_dir, replacements, branch_name, EXCLUDE_PATTERNS, file_renames, allowed_placeholders,
+            placeholder_index=placeholder_index
         )
 
         # Show validation errors if any
@@ -318,10 +321,12 @@ def create_branch(target_dir: Path, overrides: Optional[dict] = None, template_n
             "KEY_CAPABILITIES", "BASIC_USAGE", "COMMON_WORKFLOWS", "EXAMPLES",
             "DEPENDS_ON", "INTEGRATES_WITH", "PROVIDES_TO",
         }
+        # Files copied above were already scanned during substitution - not re-read
         placeholder_issues = detect_unreplaced_placeholders(
             target_dir,
             branch_name,
-            allowed_placeholders=allowed_placeholders
+            allowed_placeholders=allowed_placeholders,
+            scanned=placeholder_index
         )
 
         if placeholder_issues:
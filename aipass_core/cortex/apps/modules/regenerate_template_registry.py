@@ -4,11 +4,12 @@
 # META DATA HEADER
 # Name: regenerate_template_registry.py - Regenerate Template Registry
 # Date: 2025-11-15
-# Version: 1.1.0
+# Version: 1.2.0
 # Category: cortex
-# Commands: regenerate, --help
+# Commands: regenerate, --verify, --help
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): Scan via TemplateManifest - only changed files rehashed, --verify for full hash
 #   - v1.1.0 (2025-11-15): Added drone compliance (Commands line in help)
 #   - v1.0.0 (2025-11-04): Initial implementation
 #
@@ -21,12 +22,12 @@
 
 Quick script to regenerate .template_registry.json after template changes.
 PRESERVES IDs for existing files - only assigns new IDs to new files
+Content hashes come from the TemplateManifest: unchanged files are not rehashed
 """
 
 import sys
 from pathlib import Path
 import json
-import hashlib
 from datetime import datetime
 
 AIPASS_ROOT = Path.home() / "aipass_core"
@@ -36,42 +37,12 @@
 from prax.apps.modules.logger import system_logger as logger
 from cli.apps.modules import console
 
-from cortex.apps.handlers.registry.ignore import load_ignore_patterns, should_ignore
+from cortex.apps.handlers.registry.manifest import TemplateManifest
 
 TEMPLATE_DIR = AIPASS_ROOT / "cortex" / "templates" / "branch_template"
 REGISTRY_FILE = TEMPLATE_DIR / ".template_registry.json"
 
 
-def calculate_file_hash(file_path: Path) -> str:
-    """
-    Calculate SHA-256 hash of file content
-
-    Args:
-        file_path: Path to file
-
-    Returns:
-        Hex string of file hash (first 12 characters for readability)
-    """
-    if not file_path.is_file():
-        return ""
-
-    try:
-        sha256 = hashlib.sha256()
-        # DIRECT OPERATION JUSTIFIED: Binary read required for hash calculation
-        # Handlers (reconcile.py, meta_ops.py) also use direct binary reads for hashing
-        # No abstracted handler exists for this low-level infrastructure operation
-        with open(file_path, 'rb') as f:
-            # Read in chunks for large files
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256.update(chunk)
-        # Return first 12 chars of hash (enough for uniqueness)
-        return sha256.hexdigest()[:12]
-    except Exception as e:
-        logger.error(f"File hash calculation failed for {file_path.name}: {e}")
-        console.print(f"WARNING: Could not hash {file_path.name}: {e}")
-        return ""
-
-
 def load_existing_registry():
     """Load existing registry to preserve IDs"""
     if not REGISTRY_FILE.exists():
@@ -88,17 +59,21 @@ def load_existing_registry():
         return None
 
 
-def scan_template_directory():
+def scan_template_directory(verify=None):
     """
     Scan template directory and build registry from filesystem
 
     PRESERVES IDs for existing files by matching on path
     Only assigns new IDs to genuinely new files
+
+    Args:
+        verify: Forwarded to TemplateManifest.load - True rehashes every file
     """
-    # Load ignore patterns
-    ignore_patterns = load_ignore_patterns(TEMPLATE_DIR)
-    ignore_files = ignore_patterns.get("ignore_files", [])
-    ignore_globs = ignore_patterns.get("ignore_patterns", [])
+    # Refresh manifest - ignored items already skipped, unchanged files not rehashed
+    manifest = TemplateManifest.load(TEMPLATE_DIR, verify=verify)
+    if manifest.stats["mismatches"]:
+        logger.warning(f"Template manifest verify: stale entries {manifest.stats['mismatches']}")
+        console.print(f"WARNING: {len(manifest.stats['mismatches'])} manifest entries had stale hashes (now corrected)")
 
     # Load existing registry to preserve IDs
     existing_registry = load_existing_registry()
@@ -136,17 +111,14 @@ def scan_template_directory():
     file_counter = 1
     dir_counter = 1
 
-    # Walk template directory
-    for item in TEMPLATE_DIR.rglob("*"):
-        # Apply ignore patterns
-        if should_ignore(item, TEMPLATE_DIR, ignore_files, ignore_globs):
-            continue
+    # Walk template directory (manifest listing)
+    items = [(path, False) for path in manifest.files] + [(path, True) for path in manifest.directories]
+    for relative_path, is_dir in sorted(items):
+        item = TEMPLATE_DIR / relative_path
 
-        relative_path = str(item.relative_to(TEMPLATE_DIR))
-
-        if item.is_file():
-            # Calculate content hash
-            content_hash = calculate_file_hash(item)
+        if not is_dir:
+            # Content hash from manifest
+            content_hash = manifest.hash(relative_path)
 
             # HYBRID ID MATCHING (Hash+Path priority system)
             # Priority 1: Match by content hash (file unchanged)
@@ -175,7 +147,7 @@ def scan_template_directory():
                 "has_branch_placeholder": "{{BRANCH}}" in item.name or "{{BRANCHNAME}}" in item.name
             }
 
-        elif item.is_dir():
+        else:
             # DIRECTORY ID MATCHING (Path+Name priority system)
             # Priority 1: Match by exact path (directory at same location)
             if relative_path in existing_dirs_by_path:
@@ -228,12 +200,17 @@ def scan_template_directory():
     return {"files": files, "directories": directories}
 
 
-def regenerate_registry():
-    """Regenerate .template_registry.json from current filesystem state"""
+def regenerate_registry(verify=None):
+    """
+    Regenerate .template_registry.json from current filesystem state
+
+    Args:
+        verify: True = full-hash the template manifest, None = periodic verify
+    """
     console.print(f"Scanning template directory: {TEMPLATE_DIR}")
 
     # Scan filesystem
-    scanned = scan_template_directory()
+    scanned = scan_template_directory(verify=verify)
 
     # Build new registry
     registry = {
@@ -281,9 +258,9 @@ def handle_command(args) -> bool:
     if not hasattr(args, 'command') or args.command != 'regenerate-template-registry':
         return False
 
-    # Execute registry regeneration (no arguments needed)
+    # Execute registry regeneration
     try:
-        return regenerate_registry()
+        return regenerate_registry(verify=True if getattr(args, 'verify', False) else None)
     except Exception as e:
         logger.error(f"Registry regeneration failed: {e}")
         console.print(f"ERROR: {e}")
@@ -304,8 +281,12 @@ def print_help():
     console.print("Regenerates .template_registry.json after template changes.")
     console.print()
     console.print("USAGE:")
-    console.print("  python3 regenerate_template_registry.py")
+    console.print("  python3 regenerate_template_registry.py [--verify]")
     console.print("  cortex regenerate")
+    console.print("  cortex regenerate-template-registry --verify")
+    console.print()
+    console.print("OPTIONS:")
+    console.print("  --verify    Rehash every template file instead of trusting the manifest")
     console.print()
     console.print("EXAMPLE:")
     console.print("  python3 regenerate_template_registry.py")
@@ -314,6 +295,8 @@ def print_help():
     console.print("  - Scans template directory for all files and directories")
     console.print("  - Preserves IDs for existing files (only assigns new IDs to new files)")
     console.print("  - Calculates content hashes for change detection")
+    console.print("    (template manifest: only files whose size/mtime changed are rehashed,")
+    console.print("     full rehash with --verify or automatically every 7 days)")
     console.print("  - Saves registry to .template_registry.json")
     console.print()
     console.print("WHEN TO USE:")
@@ -327,7 +310,7 @@ def print_help():
     console.print()
     console.print("="*70)
     console.print()
-    console.print("Commands: regenerate, --help")
+    console.print("Commands: regenerate, --verify, --help")
     console.print()
 
 
@@ -338,7 +321,7 @@ def print_help():
         sys.exit(0)
 
     try:
-        regenerate_registry()
+        regenerate_registry(verify=True if '--verify' in sys.argv else None)
         sys.exit(0)
     except Exception as e:
         logger.error(f"Registry regeneration failed: {e}")
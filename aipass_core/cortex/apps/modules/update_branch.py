@@ -4,11 +4,13 @@
 # META DATA HEADER
 # Name: update_branch.py - Update AIPass Branch
 # Date: 2025-11-15
-# Version: 1.1.0
+# Version: 1.2.1
 # Category: cortex
 # Commands: update, update-branch, --help
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.1 (2026-10-18): Removed unused List import
+#   - v1.2.0 (2026-10-18): Plan-then-apply updates - shared template snapshot, --all applies across a process pool (--jobs N), per-phase timings
 #   - v1.1.0 (2025-11-15): Added drone compliance (Commands line in help)
 #   - v1.0.0 (2025-11-04): Refactored implementation - ID-based tracking with handlers
 #
@@ -24,14 +26,15 @@
 - Deep merge template structure + existing values
 - Safe rename operations
 - Automatic archival of pruned files
-- Full backup before modifications
-- Batch update all branches
+- Full backup before modifications (hardlinked to the previous backup where unchanged)
+- Batch update all branches: template read once, read-only plan phase with
+  diff summary, apply phase across a process pool, per-phase timings
 """
 
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 # INFRASTRUCTURE IMPORT PATTERN
 AIPASS_ROOT = Path.home() / "aipass_core"
@@ -111,6 +114,16 @@
         preserve_tracking_snapshot
     )
 
+    from cortex.apps.handlers.branch.template_snapshot import TemplateSnapshot
+
+    from cortex.apps.handlers.branch.update_ops import (
+        plan_branch_update,
+        save_planned_meta,
+        apply_branch_update,
+        apply_branches,
+        resolve_jobs
+    )
+
     # NOTE: error.formatters and result_types removed - using direct console output
     # from cortex.apps.handlers.error.formatters import (
     #     display_validation_summary,
@@ -163,6 +176,12 @@
     needs_synchronization = None  # type: ignore
     synchronize_registry = None  # type: ignore
     preserve_tracking_snapshot = None  # type: ignore
+    TemplateSnapshot = None  # type: ignore
+    plan_branch_update = None  # type: ignore
+    save_planned_meta = None  # type: ignore
+    apply_branch_update = None  # type: ignore
+    apply_branches = None  # type: ignore
+    resolve_jobs = None  # type: ignore
     json_handler = None  # type: ignore
     logger.error(f"Handler import failed: {e}")
     HANDLERS_AVAILABLE = False
@@ -184,100 +203,23 @@ def ensure_valid_registry(func):  # type: ignore
 
 
 # =============================================================================
-# MAIN UPDATE LOGIC
+# DISPLAY HELPERS
 # =============================================================================
 
-@ensure_valid_registry
-def update_branch(target_dir: Path, dry_run: bool = False, no_backup: bool = False, trace: bool = False) -> bool:
-    """
-    Update branch from template using ID-based file tracking
-
-    Args:
-        target_dir: Path to branch directory
-        dry_run: If True, preview only (no changes)
-        no_backup: If True, skip backup creation (faster updates)
-
-    Strategy:
-        1. Load .template_registry.json and .branch_meta.json
-        2. Detect changes (renames, additions, pruned files)
-        3. Create backup before any modifications
-        4. Show preview of changes
-        5. Ask for confirmation (unless dry_run)
-        6. Execute changes (renames, additions, archival)
-        7. Update JSON files with deep merge
-        8. Update .branch_meta.json
-
-    Args:
-        target_dir: Path to branch directory
-        dry_run: If True, show preview without executing
-
-    Returns:
-        True if successful, False otherwise
-    """
-    if not HANDLERS_AVAILABLE:
-        console.print(f"[update_branch] Handlers unavailable: {HANDLER_ERROR}")
-        return False
-
-    # Validate path
-    target_dir = target_dir.resolve()
-
-    if not target_dir.exists():
-        console.print(f"ERROR: Branch directory does not exist: {target_dir}")
-        return False
-
-    if not target_dir.is_dir():
-        console.print(f"ERROR: Path is not a directory: {target_dir}")
-        return False
-
-    # Sync BRANCH_REGISTRY.json with filesystem reality (scan for .id.json files)
-    if not dry_run:
-        sync_results = sync_branch_registry()
-        if sync_results["removed"] or sync_results["added"]:
-            console.print(f"🔄 Registry sync complete:")
-            if sync_results["removed"]:
-                console.print(f"   Removed {len(sync_results['removed'])} stale entries: {', '.join(sync_results['removed'])}")
-            if sync_results["added"]:
-                console.print(f"   Added {len(sync_results['added'])} new branches: {', '.join(sync_results['added'])}")
-
-    # Get branch info
-    branch_name = get_branch_name(target_dir)
-    branchname_upper = branch_name.upper().replace("-", "_")
-
-    console.print(f"\n{'='*70}")
-    console.print(f"UPDATE BRANCH - {branchname_upper}")
-    console.print(f"{'='*70}")
-    console.print(f"Path: {target_dir}")
-    if dry_run:
-        console.print("Mode: DRY RUN (preview only)")
-    if trace:
-        console.print("Mode: TRACE (detailed decision logging)")
-    console.print()
-
-    # Log operation start
-    if not dry_run:
-        json_handler.log_operation(
-            'branch_update_started',
-            {'branch': branchname_upper, 'path': str(target_dir)},
-            'update_branch'
-        )
-
-    # Load template registry
-    template_registry, error = load_template_registry()
-    if not template_registry:
-        console.print(f"ERROR: Could not load .template_registry.json")
-        if error:
-            console.print(f"  {error}")
-        return False
-
-    # Validate registry against filesystem
-    registry_mismatches = validate_template_registry(template_registry, TEMPLATE_DIR)
-    if registry_mismatches:
+def _print_template_warnings(snapshot: "TemplateSnapshot") -> None:
+    """Show template registry problems (once per run)"""
+    if snapshot.mismatches:
         console.print("\n⚠️  WARNING: Template registry validation errors detected")
-        for error in registry_mismatches:
+        for error in snapshot.mismatches:
             console.print(f"  - {error}")
 
-    # Detect unregistered items in template
-    unregistered_items = detect_unregistered_items(TEMPLATE_DIR, template_registry)
+    if snapshot.stale_hashes:
+        console.print("\n⚠️  WARNING: Template files changed since .template_registry.json was generated")
+        for rel_path in sorted(snapshot.stale_hashes):
+            console.print(f"  - {rel_path}")
+        console.print(f"  Run: python3 {AIPASS_ROOT}/cortex/apps/modules/regenerate_template_registry.py")
+
+    unregistered_items = snapshot.unregistered
     if unregistered_items["unregistered_files"] or unregistered_items["unregistered_dirs"]:
         console.print("\n" + "="*70)
         console.print("⚠️  WARNING: UNREGISTERED TEMPLATE ITEMS DETECTED")
@@ -304,413 +246,270 @@ def update_branch(target_dir: Path, dry_run: bool = False, no_backup: bool = Fal
         console.print("="*70)
         console.print()
 
-    # Load migrations (optional - may not exist)
-    migrations = load_migrations(TEMPLATE_DIR)
-
-    # Load branch metadata (may not exist for old branches)
-    branch_meta_result: Tuple[Optional[Dict], Optional[str]] = load_branch_meta(target_dir)
-    branch_meta: Optional[Dict] = branch_meta_result[0]
-    error: Optional[str] = branch_meta_result[1]
-    # Note: branch_meta can be None for old branches - this is OK
 
-    # =========================================================================
-    # PHASE 0: REGISTRY SYNC - Replace outdated branch registry with template
-    # =========================================================================
-    # This MUST happen first - can't trust outdated registry for any operations
-    # Self-healing: Replace old structure/IDs with current template structure
-
-    if trace:
-        console.print(f"\n{'='*70}")
-        console.print("PHASE 0: REGISTRY STRUCTURE SYNC")
-        console.print(f"{'='*70}")
+def _print_changes(changes: Dict, indent: str = "  ") -> None:
+    """List renames/additions/updates/pruned files of one plan"""
+    for old, new, _fid in changes["renames"]:
+        console.print(f"{indent}{old} → {new}")
+    for fname, _fid in changes["additions"]:
+        console.print(f"{indent}+ {fname}")
+    for fname, _fid, _oh, _nh in changes["updates"]:
+        console.print(f"{indent}↻ {fname}")
+    for fname, _fid in changes["pruned"]:
+        console.print(f"{indent}- {fname}")
 
-    # Save old registry BEFORE syncing for rename detection
-    old_branch_tracking = preserve_tracking_snapshot(branch_meta)
 
-    # Check if sync needed
-    needs_sync, sync_reason = needs_synchronization(branch_meta, template_registry)
+def _change_counts(changes: Dict) -> str:
+    """One-line count summary of a plan's changes"""
+    return (f"{len(changes['renames'])} renames, {len(changes['additions'])} additions, "
+            f"{len(changes['updates'])} updates, {len(changes['pruned'])} pruned")
 
-    if needs_sync:
-        console.print(f"\n🔧 REGISTRY SYNC REQUIRED: {sync_reason}")
-        console.print(f"   Replacing branch registry with current template structure...")
 
-        # Synchronize registry (returns updated branch_meta dict)
-        branch_meta = synchronize_registry(branch_meta, template_registry, target_dir, trace=trace)
-
-        # Save synchronized registry
-        save_branch_meta(target_dir, branch_meta)
-
-        console.print(f"   ✅ Registry synchronized: {len(branch_meta['file_tracking'])} entries from template")
-        console.print(f"   Registry now matches template structure (IDs, paths, names)")
+def _print_plan(plan: Dict, trace: bool = False) -> None:
+    """Show what a single-branch plan found (sync, reconciliation, changes)"""
+    if plan['sync_reason']:
+        console.print(f"\n🔧 REGISTRY SYNC REQUIRED: {plan['sync_reason']}")
+        console.print(f"   Branch registry will be replaced with current template structure")
     elif trace:
         console.print(f"   ✅ Registry structure current - no sync needed")
 
-    # PHASE: Pre-flight reconciliation - sync branch_meta with filesystem reality
-    if trace:
-        console.print(f"\n{'='*70}")
-        console.print("PHASE: PRE-FLIGHT RECONCILIATION")
-        console.print(f"{'='*70}")
-
-    # Ensure branch_meta is not None before reconciliation
-    if branch_meta is None:
-        # Generate metadata for branches that predate ID tracking
-        if trace:
-            console.print("   Branch has no metadata - generating from template...")
-        branch_meta = generate_branch_meta_for_existing_branch(
-            target_dir,
-            branch_name,
-            template_registry
-        )
-        if branch_meta is None:
-            console.print("ERROR: Could not generate branch metadata")
-            return False
-        save_branch_meta(target_dir, branch_meta)
-        if trace:
-            console.print(f"   ✅ Metadata generated and saved")
-
-    reconciliation = reconcile_branch_state(target_dir, branch_meta, trace=trace, fast_mode=True)
-
-    if reconciliation['needs_update']:
-        if trace or reconciliation['missing_files']:
-            console.print(f"\n📋 Reconciliation found discrepancies:")
-            console.print(f"   Missing files (tracked but deleted): {len(reconciliation['missing_files'])}")
-            console.print(f"   Untracked files (added manually): {len(reconciliation['untracked_files'])}")
-            console.print(f"   Hash mismatches (modified): {len(reconciliation['hash_mismatches'])}")
-
-        # Update branch_meta to reflect current reality
-        update_result: Tuple[Dict, List] = update_branch_meta_from_reconciliation(branch_meta, reconciliation, trace=trace)
-        branch_meta = update_result[0]
-
-        # Save corrected branch_meta
-        save_branch_meta(target_dir, branch_meta)
-
-        if trace:
-            console.print(f"✅ branch_meta synchronized with filesystem")
-
-    # Detect changes (use old_branch_tracking for rename detection)
-    changes = detect_changes(
-        template_registry,
-        branch_meta,
-        target_dir,
-        branch_name,
-        old_branch_tracking=old_branch_tracking,  # Pass old registry for rename detection
-        trace=trace
-    )
-
-    renames = changes["renames"]
-    additions = changes["additions"]
-    updates = changes["updates"]
-    pruned = changes["pruned"]
-
-    total_changes = len(renames) + len(additions) + len(updates) + len(pruned)
+    reconciliation = plan['reconciliation']
+    if reconciliation and (trace or reconciliation['missing_files']):
+        console.print(f"\n📋 Reconciliation found discrepancies:")
+        console.print(f"   Missing files (tracked but deleted): {reconciliation['missing_files']}")
+        console.print(f"   Untracked files (added manually): {reconciliation['untracked_files']}")
+        console.print(f"   Hash mismatches (modified): {reconciliation['hash_mismatches']}")
 
-    if total_changes == 0:
-        console.print("\nNo changes detected - branch is up to date!")
-        return True
+    if plan['total_changes'] == 0:
+        return
 
-    # Show preview
+    changes = plan['changes']
     console.print(f"\n{'='*70}")
     console.print("DETECTED CHANGES")
     console.print(f"{'='*70}")
-    if renames:
-        console.print(f"\nRenames ({len(renames)}):")
-        for old, new, fid in renames:
+    if changes["renames"]:
+        console.print(f"\nRenames ({len(changes['renames'])}):")
+        for old, new, _fid in changes["renames"]:
             console.print(f"  {old} → {new}")
-    if additions:
-        console.print(f"\nAdditions ({len(additions)}):")
-        for fname, fid in additions:
+    if changes["additions"]:
+        console.print(f"\nAdditions ({len(changes['additions'])}):")
+        for fname, _fid in changes["additions"]:
             console.print(f"  + {fname}")
-    if updates:
-        console.print(f"\nUpdates ({len(updates)}):")
-        for fname, fid, oh, nh in updates:
+    if changes["updates"]:
+        console.print(f"\nUpdates ({len(changes['updates'])}):")
+        for fname, _fid, _oh, _nh in changes["updates"]:
             console.print(f"  ↻ {fname}")
-    if pruned:
-        console.print(f"\nPruned ({len(pruned)}):")
-        for fname, fid in pruned:
+    if changes["pruned"]:
+        console.print(f"\nPruned ({len(changes['pruned'])}):")
+        for fname, _fid in changes["pruned"]:
             console.print(f"  - {fname}")
 
-    # Dry run mode - stop here
-    if dry_run:
-        console.print("\nDRY RUN MODE - No changes executed")
-        return True
 
-    # Ask for confirmation
-    console.print(f"\n{'='*70}")
-    if not Confirm.ask("Execute these changes?", default=False):
-        console.print("Update cancelled by user")
-        return False
+def _print_result(plan: Dict, result: Dict) -> None:
+    """Show the outcome of apply_branch_update() for one branch"""
+    for message in result['messages']:
+        console.print(message)
 
-    # Create backup (unless --no-backup flag)
-    backup_dir = None
-    if not no_backup:
-        console.print("\nCreating backup...")
-        backup_dir = create_backup(target_dir)
-        if not backup_dir:
-            console.print("ERROR: Backup creation failed - aborting update")
-            return False
-        console.print(f"Backup created: {backup_dir}")
-    else:
-        console.print("\n⚠️  Skipping backup (--no-backup flag)")
+    if result['missing_files']:
+        console.print(f"\n{'='*70}")
+        console.print(f"❌ POST-FLIGHT VERIFICATION FAILED")
+        console.print(f"{'='*70}")
+        console.print(f"Missing files after update (should exist but don't):\n")
+        for idx, (file_id, path, name) in enumerate(result['missing_files'], 1):
+            console.print(f"{idx}. ❌ Missing: {name}")
+            console.print(f"   Path: {path}")
+            console.print(f"   ID: {file_id}")
+        console.print(f"\n{'='*70}")
 
-    # Execute changes
     console.print(f"\n{'='*70}")
-    console.print("EXECUTING CHANGES")
+    console.print("UPDATE SUMMARY")
     console.print(f"{'='*70}")
+    console.print(f"Successful: {result['success_count']}")
+    console.print(f"Skipped: {result['skip_count']}")
+    console.print(f"Errors: {result['error_count']}")
+    if result['backup_dir']:
+        console.print(f"Backup: {result['backup_dir']}")
+    console.print()
+    console.print(f"Changes: {_change_counts(plan['changes'])}")
 
-    success_count = 0
-    skip_count = 0
-    error_count = 0
-
-    # Execute renames first
-    if renames:
-        console.print(f"\nExecuting {len(renames)} rename(s)...")
-        for old_name, new_name, file_id in renames:
-            if execute_rename(target_dir, old_name, new_name, file_id):
-                success_count += 1
-            else:
-                error_count += 1
-                console.print(f"  ❌ Failed: {old_name} -> {new_name}")
-
-    # Execute additions
-    if additions:
-        console.print(f"\nAdding {len(additions)} new file(s)...")
-        for filename, file_id in additions:
-            result, msg = copy_template_file(
-                TEMPLATE_DIR,
-                target_dir,
-                filename,
-                file_id,
-                template_registry,
-                branch_name,
-                FILE_RENAMES
-            )
-            if result == "added":
-                success_count += 1
-            elif result == "skipped":
-                skip_count += 1
-            else:  # error
-                error_count += 1
-                error_reason = msg if msg else "Addition failed"
-                console.print(f"  ❌ Failed to add {filename}: {error_reason}")
-
-    # Execute updates (content changed)
-    if updates:
-        console.print(f"\nUpdating {len(updates)} file(s) with content changes...")
-        for filename, file_id, old_hash, new_hash in updates:
-            result, msg = copy_template_file(
-                TEMPLATE_DIR,
-                target_dir,
-                filename,
-                file_id,
-                template_registry,
-                branch_name,
-                FILE_RENAMES,
-                force_overwrite=True  # Force overwrite for content changes
-            )
-            if result == "updated":
-                success_count += 1
-            elif result == "added":
-                # File was added (shouldn't happen in updates, but handle it)
-                success_count += 1
-            elif result == "protected":
-                skip_count += 1
-                # Python files are protected - this is expected behavior
-            elif result == "skipped":
-                skip_count += 1
-            else:  # error
-                error_count += 1
-                error_reason = msg if msg else "Update failed"
-                console.print(f"  ❌ Failed to update {filename}: {error_reason}")
-
-    # Archive pruned files
-    if pruned:
-        console.print(f"\nArchiving {len(pruned)} pruned file(s)...")
-        for filename, file_id in pruned:
-            result = archive_pruned_file(target_dir, filename, file_id, AIPASS_ROOT)
-            if result:
-                success_count += 1
-            # Note: Skip count for files not found (already deleted or never existed)
-
-    # Update JSON files with deep merge (only if changes were made)
-    if not renames and not additions and not updates and not pruned:
-        # No changes - skip JSON updates
-        pass
+    if result['success']:
+        console.print("\n✅ Update completed successfully!")
     else:
-        # Changes detected - update JSON files to merge template updates
-
-        # Build replacements dict
-        replacements = build_replacements_dict(
-            branch_name=branch_name,
-            target_dir=target_dir,
-            repo="unknown",
-            profile="unknown"
-        )
+        console.print("\n❌ Update completed with errors")
 
-        # Prepare JSON backup directory using handler
-        timestamp = datetime.now().strftime("%Y%m%d")
-        json_backup_dir = prepare_json_backup_dir(target_dir)
-
-        # List of JSON files to update (from template)
-        json_files_to_update = [
-            (f"{branchname_upper}.json", "PROJECT.json"),
-            (f"{branchname_upper}.local.json", "LOCAL.json"),
-            (f"{branchname_upper}.observations.json", "OBSERVATIONS.json"),
-            (f"{branchname_upper}.ai_mail.json", "AI_MAIL.json"),
-            (f"{branchname_upper}.id.json", "BRANCH.ID.json"),
-            ("README.json", "README.json"),
-        ]
-
-        for branch_file, template_file in json_files_to_update:
-            branch_file_path = target_dir / branch_file
-            template_file_path = TEMPLATE_DIR / template_file
-
-            # Skip if template doesn't exist
-            if not template_file_path.exists():
-                continue
-
-            success, error_msg = update_branch_file(
-                branch_file=branch_file_path,
-                template_file=template_file_path,
-                backup_dir=json_backup_dir,
-                timestamp=timestamp,
-                file_label=branch_file,
-                replacements=replacements,
-                apply_placeholders_func=apply_placeholder_replacements_to_dict,
-                migrations=migrations
-            )
-
-            if success:
-                success_count += 1
-            else:
-                error_count += 1
-                reason = error_msg if error_msg else "JSON merge/update failed"
-                console.print(f"  ❌ Failed to update {branch_file}: {reason}")
-
-    # Update/Create .branch_meta.json (silent)
-
-    if branch_meta:
-        # Existing metadata - regenerate file tracking and update timestamp
-        updated_meta = generate_branch_meta_for_existing_branch(
-            target_dir,
-            branch_name,
-            template_registry
-        )
-        if updated_meta:
-            # Preserve branch_created if it exists
-            if "branch_created" in branch_meta and branch_meta["branch_created"] != "unknown":
-                updated_meta["branch_created"] = branch_meta["branch_created"]
-            branch_meta = updated_meta
-        else:
-            # Fallback: just update timestamp
-            branch_meta["last_updated"] = datetime.now().date().isoformat()
+
+def _log_result(plan: Dict, result: Dict) -> None:
+    """Record a finished branch update in the operation log and counters"""
+    changes = plan['changes']
+    json_handler.log_operation(
+        'branch_update_completed',
+        {
+            'branch': plan['branch_upper'],
+            'success': result['success'],
+            'changes': {
+                'renames': len(changes['renames']),
+                'additions': len(changes['additions']),
+                'pruned': len(changes['pruned'])
+            },
+            'results': {
+                'success_count': result['success_count'],
+                'skip_count': result['skip_count'],
+                'error_count': result['error_count']
+            }
+        },
+        'update_branch'
+    )
+
+    if result['success']:
+        json_handler.increment_counter('update_branch', 'branches_updated')
+        json_handler.increment_counter('update_branch', 'operations_successful')
     else:
-        # No metadata exists - create it for old branch
-        console.print("  Branch predates ID tracking - generating metadata...")
-        branch_meta = generate_branch_meta_for_existing_branch(
-            target_dir,
-            branch_name,
-            template_registry
-        )
-        if not branch_meta:
-            console.print("  WARNING: Metadata generation failed")
+        json_handler.increment_counter('update_branch', 'operations_failed')
 
-    # Save metadata
-    if branch_meta:
-        if save_branch_meta(target_dir, branch_meta):
-            console.print(f"  Metadata updated ({len(branch_meta.get('file_tracking', {}))} files tracked)")
-        else:
-            console.print(f"  WARNING: Metadata save failed")
 
-    # PHASE: Post-flight verification - check all expected files actually exist
-    if trace:
-        console.print(f"\n{'='*70}")
-        console.print("PHASE: POST-FLIGHT VERIFICATION")
-        console.print(f"{'='*70}")
+def _print_registry_sync() -> None:
+    """Sync BRANCH_REGISTRY.json with filesystem reality (scan for .id.json files)"""
+    sync_results = sync_branch_registry()
+    if sync_results["removed"] or sync_results["added"]:
+        console.print(f"🔄 Registry sync complete:")
+        if sync_results["removed"]:
+            console.print(f"   Removed {len(sync_results['removed'])} stale entries: {', '.join(sync_results['removed'])}")
+        if sync_results["added"]:
+            console.print(f"   Added {len(sync_results['added'])} new branches: {', '.join(sync_results['added'])}")
+
+
+# =============================================================================
+# MAIN UPDATE LOGIC
+# =============================================================================
+
+@ensure_valid_registry
+def update_branch(target_dir: Path, dry_run: bool = False, no_backup: bool = False, trace: bool = False,
+                  snapshot: Optional["TemplateSnapshot"] = None) -> bool:
+    """
+    Update branch from template using ID-based file tracking
+
+    Strategy:
+        1. Load template snapshot (registry, ignore/migration config, file contents)
+        2. Plan in memory: registry sync, reconciliation, change detection
+        3. Show preview of changes
+        4. Ask for confirmation (unless dry_run - which stops after the preview)
+        5. Apply: backup, renames, additions, updates, archival, JSON deep merge
+        6. Regenerate .branch_meta.json and verify
+
+    Args:
+        target_dir: Path to branch directory
+        dry_run: If True, show preview without executing (nothing is written)
+        no_backup: If True, skip backup creation (faster updates)
+        trace: Enable detailed decision logging
+        snapshot: Template snapshot to reuse (loaded when omitted)
 
-    # At this point, branch_meta must exist (either loaded, generated, or synchronized)
-    if branch_meta is None:
-        console.print("ERROR: Branch metadata is None - cannot verify")
+    Returns:
+        True if successful, False otherwise
+    """
+    if not HANDLERS_AVAILABLE:
+        console.print(f"[update_branch] Handlers unavailable: {HANDLER_ERROR}")
         return False
 
-    verification = reconcile_branch_state(target_dir, branch_meta, trace=trace, fast_mode=True)
+    # Validate path
+    target_dir = target_dir.resolve()
 
-    if verification['missing_files']:
-        console.print(f"\n{'='*70}")
-        console.print(f"❌ POST-FLIGHT VERIFICATION FAILED")
-        console.print(f"{'='*70}")
-        console.print(f"Missing files after update (should exist but don't):\n")
+    if not target_dir.exists():
+        console.print(f"ERROR: Branch directory does not exist: {target_dir}")
+        return False
 
-        for idx, (file_id, path, name) in enumerate(verification['missing_files'], 1):
-            console.print(f"{idx}. ❌ Missing: {name}")
-            console.print(f"   Path: {path}")
-            console.print(f"   ID: {file_id}")
+    if not target_dir.is_dir():
+        console.print(f"ERROR: Path is not a directory: {target_dir}")
+        return False
 
-        console.print(f"\n{'='*70}")
-        error_count += len(verification['missing_files'])
+    if not dry_run:
+        _print_registry_sync()
 
-    elif trace:
-        console.print(f"✅ All expected files verified present")
+    # Get branch info
+    branch_name = get_branch_name(target_dir)
+    branchname_upper = branch_name.upper().replace("-", "_")
 
-    # Summary
     console.print(f"\n{'='*70}")
-    console.print("UPDATE SUMMARY")
+    console.print(f"UPDATE BRANCH - {branchname_upper}")
     console.print(f"{'='*70}")
-    console.print(f"Successful: {success_count}")
-    console.print(f"Skipped: {skip_count}")
-    console.print(f"Errors: {error_count}")
-    if backup_dir:
-        console.print(f"Backup: {backup_dir}")
+    console.print(f"Path: {target_dir}")
+    if dry_run:
+        console.print("Mode: DRY RUN (preview only)")
+    if trace:
+        console.print("Mode: TRACE (detailed decision logging)")
     console.print()
-    console.print(f"Changes: {len(renames)} renames, {len(additions)} additions, {len(updates)} updates, {len(pruned)} pruned")
-
-    success = error_count == 0
-    if success:
-        console.print("\n✅ Update completed successfully!")
-    else:
-        console.print("\n❌ Update completed with errors")
 
-    # Log operation completion and update stats
+    # Log operation start
     if not dry_run:
         json_handler.log_operation(
-            'branch_update_completed',
-            {
-                'branch': branchname_upper,
-                'success': success,
-                'changes': {
-                    'renames': len(renames),
-                    'additions': len(additions),
-                    'pruned': len(pruned)
-                },
-                'results': {
-                    'success_count': success_count,
-                    'skip_count': skip_count,
-                    'error_count': error_count
-                }
-            },
+            'branch_update_started',
+            {'branch': branchname_upper, 'path': str(target_dir)},
             'update_branch'
         )
 
-        # Update data metrics
-        if success:
-            json_handler.increment_counter('update_branch', 'branches_updated')
-            json_handler.increment_counter('update_branch', 'operations_successful')
-        else:
-            json_handler.increment_counter('update_branch', 'operations_failed')
+    if snapshot is None:
+        snapshot = TemplateSnapshot.load(TEMPLATE_DIR)
+        if not snapshot.registry:
+            console.print(f"ERROR: Could not load .template_registry.json")
+            if snapshot.registry_error:
+                console.print(f"  {snapshot.registry_error}")
+            return False
+        _print_template_warnings(snapshot)
+
+    plan = plan_branch_update(target_dir, snapshot, trace=trace)
+    if plan['error']:
+        console.print(f"ERROR: {plan['error']}")
+        return False
+
+    _print_plan(plan, trace=trace)
+
+    if plan['total_changes'] == 0:
+        if not dry_run:
+            error = save_planned_meta(plan)
+            if error:
+                console.print(f"  WARNING: {error}")
+        console.print("\nNo changes detected - branch is up to date!")
+        return True
 
-    return success
+    # Dry run mode - stop here
+    if dry_run:
+        console.print("\nDRY RUN MODE - No changes executed")
+        return True
+
+    # Ask for confirmation
+    console.print(f"\n{'='*70}")
+    if not Confirm.ask("Execute these changes?", default=False):
+        console.print("Update cancelled by user")
+        return False
+
+    console.print(f"\n{'='*70}")
+    console.print("EXECUTING CHANGES")
+    console.print(f"{'='*70}")
+
+    result = apply_branch_update(plan, snapshot, no_backup=no_backup)
+    _print_result(plan, result)
+    _log_result(plan, result)
+
+    return result['success']
 
 
 # =============================================================================
 # BATCH OPERATIONS
 # =============================================================================
 
-def update_all_branches(dry_run: bool = False, no_backup: bool = False) -> Tuple[int, int]:
+def update_all_branches(dry_run: bool = False, no_backup: bool = False, jobs: int = 0) -> Tuple[int, int]:
     """
     Update all branches from BRANCH_REGISTRY.json
 
+    Phases (each timed and reported):
+        registry  - sync BRANCH_REGISTRY.json with the filesystem
+        template  - load the template snapshot once for every branch
+        plan      - read-only change detection per branch, printed as a diff summary
+        apply     - backup + changes per branch across a process pool
+
     Args:
-        dry_run: If True, preview only
+        dry_run: If True, stop after the plan phase (nothing is written)
         no_backup: If True, skip backup creation (faster updates)
+        jobs: Worker processes for the apply phase (0 = one per CPU, 1 = serial)
 
     Returns:
         Tuple of (success_count, total_count)
@@ -719,14 +518,21 @@ def update_all_branches(dry_run: bool = False, no_backup: bool = False) -> Tuple
         console.print(f"[update_all_branches] Handlers unavailable: {HANDLER_ERROR}")
         return (0, 0)
 
-    # Load branch registry
+    run_start = time.perf_counter()
+    timings: Dict[str, float] = {}
+
+    phase_start = time.perf_counter()
+    if not dry_run:
+        _print_registry_sync()
     registry = load_registry()
+    timings['registry'] = time.perf_counter() - phase_start
     if not registry:
         console.print("ERROR: Could not load BRANCH_REGISTRY.json")
         return (0, 0)
 
     branches = registry.get("branches", [])
     total_branches = len(branches)
+    jobs = resolve_jobs(jobs)
 
     console.print(f"\n{'='*70}")
     console.print(f"BATCH UPDATE - {total_branches} branches")
@@ -742,37 +548,113 @@ def update_all_branches(dry_run: bool = False, no_backup: bool = False) -> Tuple
             'update_branch'
         )
 
+    # PHASE: template snapshot - read and hash the template once
+    phase_start = time.perf_counter()
+    snapshot = TemplateSnapshot.load(TEMPLATE_DIR)
+    timings['template'] = time.perf_counter() - phase_start
+    if not snapshot.registry:
+        console.print(f"ERROR: Could not load .template_registry.json")
+        if snapshot.registry_error:
+            console.print(f"  {snapshot.registry_error}")
+        return (0, total_branches)
+    _print_template_warnings(snapshot)
+
     success_count = 0
     failed_branches = []
 
-    for i, branch_info in enumerate(branches, 1):
+    # PHASE: plan - read-only, every branch
+    phase_start = time.perf_counter()
+    plans = []
+    for branch_info in branches:
         branch_path = Path(branch_info["path"])
         branch_name = branch_info["name"]
 
-        console.print(f"\n[{i}/{total_branches}] {branch_name}")
-        console.print(f"Path: {branch_path}")
-        console.print("-" * 70)
-
         # Skip backup directories
         if "/backups/" in str(branch_path) or str(branch_path).endswith("/backups"):
-            console.print(f"INFO: Skipping backup directory")
             continue
 
         if not branch_path.exists():
-            console.print(f"WARNING: Branch directory not found - skipping")
             failed_branches.append((branch_name, "Directory not found"))
             continue
 
         try:
-            success = update_branch(branch_path, dry_run=dry_run, no_backup=no_backup)
-            if success:
-                success_count += 1
-            else:
-                failed_branches.append((branch_name, "Update failed"))
+            plan = plan_branch_update(branch_path, snapshot)
         except Exception as e:
-            logger.error(f"Batch update failed for {branch_name}: {e}")
-            console.print(f"ERROR: {e}")
+            logger.error(f"Batch update planning failed for {branch_name}: {e}")
             failed_branches.append((branch_name, str(e)))
+            continue
+
+        if plan['error']:
+            failed_branches.append((branch_name, plan['error']))
+            continue
+        plans.append(plan)
+    timings['plan'] = time.perf_counter() - phase_start
+
+    # Diff summary
+    pending = [plan for plan in plans if plan['total_changes']]
+    console.print(f"\n{'='*70}")
+    console.print("PLAN - DIFF SUMMARY")
+    console.print(f"{'='*70}")
+    for plan in plans:
+        if plan['total_changes']:
+            console.print(f"\n{plan['branch_upper']}: {_change_counts(plan['changes'])}")
+            _print_changes(plan['changes'], indent="    ")
+        else:
+            console.print(f"\n{plan['branch_upper']}: up to date")
+    for branch_name, reason in failed_branches:
+        console.print(f"\n{branch_name}: skipped - {reason}")
+    console.print(f"\n{len(pending)} of {len(plans)} branches have changes")
+
+    proceed = bool(pending) and not dry_run
+    if dry_run:
+        console.print("\nDRY RUN MODE - No changes executed")
+    elif pending:
+        console.print(f"\n{'='*70}")
+        if not Confirm.ask(f"Apply changes to {len(pending)} branch(es)?", default=False):
+            console.print("Update cancelled by user")
+            proceed = False
+            failed_branches.extend((plan['branch_upper'], "Update cancelled") for plan in pending)
+
+    # Branches without template changes only need their corrected metadata saved
+    if not dry_run:
+        for plan in plans:
+            if not plan['total_changes']:
+                error = save_planned_meta(plan)
+                if error:
+                    failed_branches.append((plan['branch_upper'], error))
+                else:
+                    success_count += 1
+
+    # PHASE: apply - one branch per worker
+    phase_start = time.perf_counter()
+    backup_seconds = 0.0
+    if proceed:
+        workers = min(jobs, len(pending))
+        console.print(f"\nApplying {len(pending)} branch(es) with {workers} worker(s)...")
+
+        def on_branch_done(result: Dict, done: int, total: int) -> None:
+            status = "✅" if result['success'] else "❌"
+            console.print(f"[dim][{done}/{total}] {status} {result['branch']}[/dim]")
+
+        results = apply_branches(pending, snapshot, no_backup=no_backup, jobs=jobs,
+                                 on_branch_done=on_branch_done)
+
+        for plan, result in zip(pending, results):
+            backup_seconds += result['timings']['backup']
+            if not result['success']:
+                console.print(f"\n{result['branch']}:")
+                for message in result['messages']:
+                    console.print(message)
+                if result['missing_files']:
+                    console.print(f"  ❌ {len(result['missing_files'])} file(s) missing after update")
+            _log_result(plan, result)
+            if result['success']:
+                success_count += 1
+            else:
+                failed_branches.append((plan['branch_upper'], "Update failed"))
+    elif dry_run:
+        success_count = len(plans)
+    timings['apply'] = time.perf_counter() - phase_start
 
     # Summary
     console.print(f"\n{'='*70}")
@@ -786,6 +668,14 @@ def update_all_branches(dry_run: bool = False, no_backup: bool = False) -> Tuple
         for branch_name, reason in failed_branches:
             console.print(f"  - {branch_name}: {reason}")
 
+    console.print("\nPhase timings:")
+    console.print(f"  Registry sync:     {timings['registry'] * 1000:8.0f} ms")
+    console.print(f"  Template snapshot: {timings['template'] * 1000:8.0f} ms")
+    console.print(f"  Plan:              {timings['plan'] * 1000:8.0f} ms ({len(plans)} branches)")
+    console.print(f"  Apply:             {timings['apply'] * 1000:8.0f} ms "
+                  f"({len(pending) if proceed else 0} branches, backups {backup_seconds * 1000:.0f} ms)")
+    console.print(f"  Total:             {(time.perf_counter() - run_start) * 1000:8.0f} ms")
+
     # Log batch operation completion
     if not dry_run:
         json_handler.log_operation(
@@ -794,7 +684,8 @@ def update_all_branches(dry_run: bool = False, no_backup: bool = False) -> Tuple
                 'total': total_branches,
                 'successful': success_count,
                 'failed': len(failed_branches),
-                'failed_branches': [name for name, _ in failed_branches]
+                'failed_branches': [name for name, _ in failed_branches],
+                'timings_ms': {phase: round(secs * 1000) for phase, secs in timings.items()}
             },
             'update_branch'
         )
@@ -838,7 +729,8 @@ def handle_command(args) -> bool:
     # Check for batch update flag
     if hasattr(args, 'all_branches') and args.all_branches:
         dry_run = getattr(args, 'dry_run', False)
-        success_count, total_count = update_all_branches(dry_run=dry_run)
+        jobs = getattr(args, 'jobs', 0) or 0
+        success_count, total_count = update_all_branches(dry_run=dry_run, jobs=jobs)
         return success_count == total_count
 
     # Single branch update
@@ -869,7 +761,7 @@ def print_help():
     console.print()
     console.print("USAGE:")
     console.print("  python3 update_branch.py <target_directory> [--dry-run] [--no-backup] [--trace]")
-    console.print("  python3 update_branch.py --all [--dry-run] [--no-backup]")
+    console.print("  python3 update_branch.py --all [--dry-run] [--no-backup] [--jobs N]")
     console.print("  cortex update <target_directory>")
     console.print("  cortex update-branch <target_directory>")
     console.print()
@@ -877,19 +769,26 @@ def print_help():
     console.print("  python3 update_branch.py /home/aipass/aipass_core/my_branch")
     console.print("  python3 update_branch.py /home/aipass/aipass_core/my_branch --dry-run")
     console.print("  python3 update_branch.py --all")
+    console.print("  python3 update_branch.py --all --dry-run      # plan only: per-branch diff summary")
+    console.print("  python3 update_branch.py --all --jobs 4")
     console.print()
     console.print("WHAT IT DOES:")
     console.print("  - Detects changes between template and branch (renames, additions, updates)")
     console.print("  - Creates backup before modifications (unless --no-backup)")
+    console.print("    Files unchanged since the previous backup are hardlinked, not copied")
     console.print("  - Executes file renames, additions, and updates")
     console.print("  - Updates JSON files with deep merge")
     console.print("  - Archives pruned files")
+    console.print("  - --all: reads the template once, plans every branch (read-only),")
+    console.print("    shows a diff summary, asks once, then applies in parallel and")
+    console.print("    reports per-phase timings")
     console.print()
     console.print("FLAGS:")
     console.print("  --dry-run     Preview changes without executing")
     console.print("  --no-backup   Skip backup creation (faster)")
     console.print("  --trace       Enable detailed decision logging")
     console.print("  --all         Update all branches in registry")
+    console.print("  --jobs N      Worker processes for --all (default: one per CPU, 1 = serial)")
     console.print()
     console.print("REQUIREMENTS:")
     console.print("  - Target directory must exist")
@@ -920,13 +819,30 @@ def print_help():
     no_backup = '--no-backup' in args
     trace = '--trace' in args
 
+    # --jobs N / -j N / --jobs=N (apply-phase workers for --all, 0 = one per CPU)
+    jobs = 0
+    remaining = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ['--jobs', '-j'] or arg.startswith('--jobs='):
+            value = arg.split('=', 1)[1] if '=' in arg else (args[i + 1] if i + 1 < len(args) else '')
+            if not value.isdigit():
+                console.print(f"--jobs expects a number, got '{value}'")
+                sys.exit(1)
+            jobs = int(value)
+            i += 1 if '=' in arg else 2
+            continue
+        remaining.append(arg)
+        i += 1
+
     # Remove flags from args
-    args = [a for a in args if a not in ['--dry-run', '--all', '--no-backup', '--trace']]
+    args = [a for a in remaining if a not in ['--dry-run', '--all', '--no-backup', '--trace']]
 
     # Check if we have command to execute
     if batch_mode:
         # Batch update all branches
-        success_count, total_count = update_all_branches(dry_run=dry_run, no_backup=no_backup)
+        success_count, total_count = update_all_branches(dry_run=dry_run, no_backup=no_backup, jobs=jobs)
         sys.exit(0 if success_count == total_count else 1)
     elif args:
         # Single branch update
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the single-pass PlaceholderEngine in handlers/branch/placeholders.py
+
+Tests parity with per-placeholder str.replace, same-pass leftover reporting,
+JSON tree substitution and copy_template_contents' placeholder index.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+# Directory containing the cortex package on path so 'cortex.apps...' resolves
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from cortex.apps.handlers.branch.file_ops import copy_template_contents
+from cortex.apps.handlers.branch.placeholders import (
+    PlaceholderEngine,
+    apply_placeholder_replacements_to_dict,
+    build_replacements_dict,
+    detect_unreplaced_placeholders,
+    replace_placeholders,
+    validate_no_placeholders
+)
+
+SAMPLE = """# {{BRANCHNAME}} README
+Path: {{CWD}}
+Date: {{DATE}} ({{branchname}}) {{BRANCH}}_json
+Email: {{EMAIL}}
+
+{{AUTO_GENERATED_COMMANDS}}
+Unknown: {{NOT_A_KEY}}
+Tree:
+{{AUTO_GENERATED_TREE}}
+"""
+
+
+def _sequential(content, replacements):
+    """Previous implementation - one str.replace pass per placeholder"""
+    for placeholder, value in replacements.items():
+        content = content.replace("{{" + placeholder + "}}", value)
+    return content
+
+
+def _replacements(tmp):
+    return build_replacements_dict("my-branch", tmp / "my-branch", "aipass_core", "Workshop")
+
+
+# =============================================================================
+# TEXT
+# =============================================================================
+
+class TestTextSubstitution:
+    """One scan replaces and reports"""
+
+    def test_matches_sequential_replace(self, temp_test_dir):
+        replacements = _replacements(temp_test_dir)
+        assert replace_placeholders(SAMPLE, replacements) == _sequential(SAMPLE, replacements)
+
+    def test_reports_like_validate_no_placeholders(self, temp_test_dir):
+        replacements = _replacements(temp_test_dir)
+        allowed = {"AUTO_GENERATED_COMMANDS"}
+        output, leftovers = PlaceholderEngine(replacements, allowed).substitute(SAMPLE)
+        _, expected = validate_no_placeholders(output, "README.md", allowed)
+        assert leftovers == expected
+        assert [p['placeholder'] for p in leftovers] == ["NOT_A_KEY", "TREE_PLACEHOLDER"]
+
+    def test_line_numbers_follow_multiline_values(self):
+        engine = PlaceholderEngine({"BLOCK": "a\nb\nc"})
+        output, leftovers = engine.substitute("{{BLOCK}}\n{{MISSING}}\n")
+        assert leftovers[0]['line_number'] == 4
+        assert output.split("\n")[3] == "{{MISSING}}"
+
+    def test_longest_key_wins(self):
+        engine = PlaceholderEngine({"BRANCH": "x", "BRANCHNAME": "y"})
+        assert engine.substitute("{{BRANCH}}{{BRANCHNAME}}{{{BRANCH}}}")[0] == "xy{x}"
+
+    def test_values_are_not_rescanned(self):
+        engine = PlaceholderEngine({"A": "{{B}}", "B": "b"})
+        output, leftovers = engine.substitute("{{A}}")
+        assert output == "{{B}}"
+        assert [p['placeholder'] for p in leftovers] == ["B"]
+
+
+# =============================================================================
+# JSON
+# =============================================================================
+
+class TestJsonSubstitution:
+    """Trees are walked in place, never serialized"""
+
+    def test_walks_keys_values_and_lists(self):
+        data = {"{{NAME}}_key": ["{{NAME}}", 3, {"deep": "{{GONE}}"}], "n": None}
+        engine = PlaceholderEngine({"NAME": "alpha"})
+        result, leftovers = engine.substitute_data(data)
+        assert result == {"alpha_key": ["alpha", 3, {"deep": "{{GONE}}"}], "n": None}
+        assert leftovers[0]['json_path'] == "{{NAME}}_key[2].deep"
+        assert data["{{NAME}}_key"][0] == "{{NAME}}"
+
+    def test_quotes_in_values_stay_valid(self):
+        result = apply_placeholder_replacements_to_dict({"purpose": "{{PURPOSE}}"}, {"PURPOSE": 'say "hi"\\n'})
+        assert result == {"purpose": 'say "hi"\\n'}
+
+
+# =============================================================================
+# BRANCH CREATION
+# =============================================================================
+
+class TestCopyIndex:
+    """Placeholders found while copying are reused by the memory-file check"""
+
+    def test_memory_files_not_reread(self, temp_test_dir, monkeypatch):
+        template = temp_test_dir / "template"
+        target = temp_test_dir / "my-branch"
+        template.mkdir()
+        target.mkdir()
+        (template / "PROJECT.json").write_text(json.dumps({"name": "{{BRANCHNAME}}", "todo": "{{LEFT}}"}))
+        (template / "README.md").write_text(SAMPLE)
+
+        index = {}
+        copied, _, errors = copy_template_contents(
+            template, target, _replacements(temp_test_dir), "my-branch", [],
+            {"PROJECT.json": "{BRANCHNAME}.json"}, {"AUTO_GENERATED_COMMANDS", "TREE_PLACEHOLDER", "LEFT", "NOT_A_KEY"},
+            placeholder_index=index
+        )
+        assert not errors
+        assert [p['placeholder'] for p in index["MY_BRANCH.json"]] == ["LEFT"]
+
+        (target / "PROJECT.json").rename(target / "MY_BRANCH.json")
+        monkeypatch.setattr(Path, "read_text", lambda *a, **k: (_ for _ in ()).throw(AssertionError("re-read")))
+        issues = detect_unreplaced_placeholders(target, "my-branch", allowed_placeholders=set(), scanned=index)
+        assert [(p.name, [d['placeholder'] for d in found]) for p, found in issues] == [("MY_BRANCH.json", ["LEFT"])]
+
+
+class TestSubstitutionBenchmark:
+    """Benchmark: 500 template-sized files, per-key replace + validate vs single pass"""
+
+    def test_single_pass_vs_sequential(self, temp_test_dir):
+        replacements = _replacements(temp_test_dir)
+        allowed = {"AUTO_GENERATED_COMMANDS", "TREE_PLACEHOLDER", "NOT_A_KEY"}
+        files = [SAMPLE * 20] * 500
+
+        start = time.perf_counter()
+        for content in files:
+            validate_no_placeholders(_sequential(content, replacements), "f", allowed)
+        sequential = time.perf_counter() - start
+
+        engine = PlaceholderEngine(replacements, allowed)
+        start = time.perf_counter()
+        for content in files:
+            engine.substitute(content)
+        single = time.perf_counter() - start
+
+        print(f"\n  500 files: replace+validate {sequential * 1000:.0f} ms, single pass {single * 1000:.0f} ms")
+        assert single < sequential
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Unit tests for handlers/registry/manifest.py
+
+Tests stat-validated rehashing, periodic/forced full-hash verify, ignored
+directory pruning and manifest-backed unregistered item detection.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Directory containing the cortex package on path so 'cortex.apps...' resolves
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from cortex.apps.handlers.branch.change_detection import detect_unregistered_items
+from cortex.apps.handlers.registry import manifest as manifest_module
+from cortex.apps.handlers.registry.manifest import TemplateManifest
+
+
+@pytest.fixture
+def template(temp_test_dir):
+    """Template with a nested file, an ignored cache dir and an ignore file"""
+    template_dir = temp_test_dir / "branch_template"
+    (template_dir / "apps" / "__pycache__").mkdir(parents=True)
+    (template_dir / "README.md").write_text("# readme\n")
+    (template_dir / "apps" / "main.py").write_text("print('hi')\n")
+    (template_dir / "apps" / "__pycache__" / "main.pyc").write_bytes(b"\x00")
+    (template_dir / ".registry_ignore.json").write_text(
+        json.dumps({"ignore_files": [".registry_ignore.json"], "ignore_patterns": ["__pycache__"]})
+    )
+    return template_dir
+
+
+def _load(template_dir, verify=None):
+    return TemplateManifest.load(template_dir, template_dir.parent / "manifest.json", verify=verify)
+
+
+# =============================================================================
+# REFRESH
+# =============================================================================
+
+class TestRefresh:
+    """Only files whose stat changed are rehashed"""
+
+    def test_first_load_hashes_and_prunes(self, template):
+        manifest = _load(template)
+        assert sorted(manifest.files) == ["README.md", "apps/main.py"]
+        assert manifest.directories == ["apps"]
+        assert manifest.hash("README.md") == hashlib.sha256(b"# readme\n").hexdigest()[:12]
+        assert manifest.stats["hashed"] == 2
+
+    def test_unchanged_template_is_not_rehashed(self, template):
+        _load(template)
+        manifest = _load(template)
+        assert manifest.stats == {"reused": 2, "hashed": 0, "removed": 0, "verified": False, "mismatches": []}
+
+    def test_edit_add_remove(self, template):
+        _load(template)
+        (template / "README.md").write_text("# readme, longer\n")
+        (template / "apps" / "main.py").unlink()
+        (template / "NEW.md").write_text("new\n")
+        manifest = _load(template)
+        assert manifest.stats["hashed"] == 2
+        assert manifest.stats["removed"] == 1
+        assert manifest.hash("README.md") == hashlib.sha256(b"# readme, longer\n").hexdigest()[:12]
+        assert manifest.hash("apps/main.py") is None
+
+    def test_racy_entries_are_rehashed(self, template):
+        first = _load(template)
+        readme = template / "README.md"
+        # Same size, mtime inside the previous walk - could hide a same-tick rewrite
+        readme.write_text("# README\n")
+        os.utime(readme, ns=(first.scanned_ns, first.scanned_ns))
+        second = _load(template)
+        assert second.hash("README.md") == hashlib.sha256(b"# README\n").hexdigest()[:12]
+
+
+# =============================================================================
+# VERIFY
+# =============================================================================
+
+class TestVerify:
+    """Full-hash mode catches edits that kept size and mtime"""
+
+    def test_forced_verify_reports_and_fixes_stale_entry(self, template):
+        _load(template)
+        readme = template / "README.md"
+        stat = readme.stat()
+        readme.write_text("# README\n")
+        os.utime(readme, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert _load(template, verify=False).hash("README.md") == hashlib.sha256(b"# readme\n").hexdigest()[:12]
+        manifest = _load(template, verify=True)
+        assert manifest.stats["mismatches"] == ["README.md"]
+        assert manifest.hash("README.md") == hashlib.sha256(b"# README\n").hexdigest()[:12]
+
+    def test_verify_runs_when_interval_elapsed(self, template, monkeypatch):
+        assert _load(template).stats["verified"]
+        assert not _load(template).stats["verified"]
+        monkeypatch.setattr(manifest_module, "VERIFY_INTERVAL_DAYS", 0)
+        assert _load(template).stats["verified"]
+
+
+# =============================================================================
+# CONSUMERS
+# =============================================================================
+
+class TestConsumers:
+    """Manifest listing and ignores match the rglob/should_ignore path"""
+
+    def test_unregistered_items_match_rglob(self, template):
+        registry = {"files": {"f001": {"current_name": "README.md", "path": "README.md"}}, "directories": {}}
+        manifest = _load(template)
+        from_manifest = detect_unregistered_items(template, registry, manifest=manifest)
+        from_walk = detect_unregistered_items(template, registry)
+        assert sorted(from_manifest["unregistered_files"]) == sorted(from_walk["unregistered_files"]) == ["apps/main.py"]
+        assert from_manifest["unregistered_dirs"] == from_walk["unregistered_dirs"] == ["apps"]
+
+    def test_is_ignored(self, template):
+        manifest = _load(template)
+        assert manifest.is_ignored("apps/__pycache__/main.pyc")
+        assert manifest.is_ignored(".registry_ignore.json")
+        assert not manifest.is_ignored("README.md")
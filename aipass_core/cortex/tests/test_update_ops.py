@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Unit tests for handlers/branch/update_ops.py and template_snapshot.py
+
+Tests the read-only plan phase, serial/pool apply parity and hardlinked backups.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Directory containing the cortex package on path so 'cortex.apps...' resolves
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from cortex.apps.handlers.branch import change_detection
+from cortex.apps.handlers.branch.file_ops import create_backup
+from cortex.apps.handlers.branch.template_snapshot import TemplateSnapshot
+from cortex.apps.handlers.branch.update_ops import apply_branches, plan_branch_update
+from cortex.apps.handlers.registry import manifest, meta_ops
+
+NO_IGNORES = {"ignore_directories": [], "ignore_patterns": []}
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+def _tree(root: Path) -> dict:
+    """Relative path -> (mtime_ns, bytes) for every file under root"""
+    return {
+        str(p.relative_to(root)): (p.stat().st_mtime_ns, p.read_bytes())
+        for p in sorted(root.rglob("*")) if p.is_file()
+    }
+
+
+@pytest.fixture
+def template(temp_test_dir, monkeypatch):
+    """Template with README.md (placeholder, changed since branches were made) and notes.md (new)"""
+    template_dir = temp_test_dir / "branch_template"
+    template_dir.mkdir()
+    (template_dir / "README.md").write_text("# {{BRANCHNAME}} v2\n")
+    (template_dir / "notes.md").write_text("notes\n")
+    (template_dir / ".backup_ignore.json").write_text(json.dumps(NO_IGNORES))
+    registry = {
+        "metadata": {"version": "2.0.0"},
+        "files": {
+            "f001": {"current_name": "README.md", "path": "README.md", "content_hash": _hash("# {{BRANCHNAME}} v2\n")},
+            "f002": {"current_name": "notes.md", "path": "notes.md", "content_hash": _hash("notes\n")},
+        },
+        "directories": {}
+    }
+    (template_dir / ".template_registry.json").write_text(json.dumps(registry))
+    monkeypatch.setattr(meta_ops, "TEMPLATE_DIR", template_dir)
+    monkeypatch.setattr(change_detection, "TEMPLATE_DIR", template_dir)
+    monkeypatch.setattr(manifest, "MANIFEST_FILE", temp_test_dir / "template_manifest.json")
+    return template_dir
+
+
+def _make_branch(parent: Path, name: str) -> Path:
+    """Branch tracking an old README.md, without notes.md"""
+    branch = parent / name
+    branch.mkdir()
+    (branch / "README.md").write_text("# old\n")
+    meta = {
+        "template_version": "1.0.0",
+        "file_tracking": {"f001": {"current_name": "README.md", "path": "README.md", "content_hash": _hash("# old\n")}}
+    }
+    (branch / ".branch_meta.json").write_text(json.dumps(meta))
+    return branch
+
+
+# =============================================================================
+# SNAPSHOT
+# =============================================================================
+
+class TestTemplateSnapshot:
+    """Template read and hashed once"""
+
+    def test_loads_texts_and_hashes(self, template):
+        snapshot = TemplateSnapshot.load(template)
+        assert snapshot.text("README.md") == "# {{BRANCHNAME}} v2\n"
+        assert snapshot.file_hashes["notes.md"] == _hash("notes\n")
+        assert snapshot.backup_ignore == NO_IGNORES
+        assert snapshot.stale_hashes == []
+
+    def test_reports_stale_registry_hashes(self, template):
+        (template / "notes.md").write_text("edited\n")
+        assert TemplateSnapshot.load(template).stale_hashes == ["notes.md"]
+
+
+# =============================================================================
+# PLAN / APPLY
+# =============================================================================
+
+class TestPlanApply:
+    """Plans are read-only; pooled applies match serial ones"""
+
+    def test_plan_writes_nothing(self, temp_test_dir, template):
+        branch = _make_branch(temp_test_dir, "alpha")
+        before = _tree(branch)
+        plan = plan_branch_update(branch, TemplateSnapshot.load(template))
+
+        assert _tree(branch) == before
+        assert plan['changes']['additions'] == [("notes.md", "f002")]
+        assert [u[0] for u in plan['changes']['updates']] == ["README.md"]
+        assert plan['total_changes'] == 2
+
+    def test_pool_matches_serial(self, temp_test_dir, template):
+        snapshot = TemplateSnapshot.load(template)
+        serial_dir = temp_test_dir / "serial"
+        pool_dir = temp_test_dir / "pool"
+        serial_dir.mkdir()
+        pool_dir.mkdir()
+        names = ["alpha", "beta", "gamma"]
+        serial_plans = [plan_branch_update(_make_branch(serial_dir, n), snapshot) for n in names]
+        pool_plans = [plan_branch_update(_make_branch(pool_dir, n), snapshot) for n in names]
+
+        seen = []
+        serial = apply_branches(serial_plans, snapshot, jobs=1)
+        pooled = apply_branches(pool_plans, snapshot, jobs=3,
+                                on_branch_done=lambda r, done, total: seen.append(done))
+
+        assert [r['branch'] for r in pooled] == ["ALPHA", "BETA", "GAMMA"]
+        assert sorted(seen) == [1, 2, 3]
+        for s_result, p_result, name in zip(serial, pooled, names):
+            assert s_result['success'] and p_result['success']
+            assert (pool_dir / name / "README.md").read_text() == f"# {name.upper()} v2\n"
+            assert (pool_dir / name / "notes.md").read_text() == (serial_dir / name / "notes.md").read_text()
+            assert (pool_dir / name / ".backup" / "latest" / "README.md").read_text() == "# old\n"
+
+    def test_pool_tasks_do_not_ship_snapshot(self, temp_test_dir, template, monkeypatch):
+        """Workers get the snapshot from the pool initializer - tasks never pickle it"""
+        snapshot = TemplateSnapshot.load(template)
+        plans = [plan_branch_update(_make_branch(temp_test_dir, n), snapshot) for n in ("alpha", "beta")]
+
+        def no_pickle(self, protocol):
+            raise AssertionError("template snapshot pickled into a task")
+        monkeypatch.setattr(TemplateSnapshot, "__reduce_ex__", no_pickle)
+
+        results = apply_branches(plans, snapshot, jobs=2)
+        assert [r['success'] for r in results] == [True, True]
+
+
+# =============================================================================
+# BACKUPS
+# =============================================================================
+
+class TestHardlinkBackup:
+    """Unchanged files are linked to the previous backup, never to live files"""
+
+    def test_repeat_backup_links_unchanged_files(self, temp_test_dir):
+        branch = _make_branch(temp_test_dir, "alpha")
+        (branch / "docs").mkdir()
+        (branch / "docs" / "guide.md").write_text("guide\n")
+
+        first_dir, first_msg = create_backup(branch, backup_ignore=NO_IGNORES)
+        assert "0 linked" in first_msg
+        second_dir, second_msg = create_backup(branch, backup_ignore=NO_IGNORES)
+        assert "0 copied" in second_msg
+        assert not (branch / ".backup" / "previous").exists()
+
+        live = branch / "docs" / "guide.md"
+        backup = second_dir / "docs" / "guide.md"
+        assert os.stat(live).st_ino != os.stat(backup).st_ino
+
+        # In-place write to the live file leaves the backup alone
+        with open(live, "w") as f:
+            f.write("changed\n")
+        assert backup.read_text() == "guide\n"
+        _, third_msg = create_backup(branch, backup_ignore=NO_IGNORES)
+        assert "1 copied" in third_msg
+        assert (second_dir / "docs" / "guide.md").read_text() == "changed\n"
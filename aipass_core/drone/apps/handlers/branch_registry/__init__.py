@@ -2,8 +2,12 @@
 # META DATA HEADER
 # Name: __init__.py - Branch Registry Handlers Package
 # Date: 2025-11-29
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: drone/handlers/branch_registry
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Export registry cache API
+#   - v1.0.0 (2025-11-29): Initial package
 # =============================================
 
 """
@@ -23,6 +27,13 @@
     list_systems,
     get_registry_metadata,
 )
+from .cache import (
+    RegistrySnapshot,
+    get_snapshot,
+    load_registry,
+    invalidate_registry_cache,
+    get_cache_stats,
+)
 
 __all__ = [
     "get_all_branches",
@@ -33,4 +44,9 @@
     "list_branch_emails",
     "list_systems",
     "get_registry_metadata",
+    "RegistrySnapshot",
+    "get_snapshot",
+    "load_registry",
+    "invalidate_registry_cache",
+    "get_cache_stats",
 ]
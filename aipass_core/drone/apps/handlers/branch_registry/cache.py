@@ -0,0 +1,241 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: cache.py - Branch Registry Cache Handler
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: drone/handlers/branch_registry
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial - parse-once registry cache with lookup maps and pickle sidecar
+#
+# CODE STANDARDS:
+#   - Handler pattern - pure implementation, no CLI
+#   - Independent, transportable unit
+# =============================================
+
+"""
+Branch Registry Cache Handler - Parse BRANCH_REGISTRY.json once per change.
+
+The registry is re-read only when its (st_mtime_ns, st_size) signature
+changes; every other call is one stat(). Each parse produces a snapshot with
+lookup maps by name, email and path so lookups are dict hits instead of
+scans.
+
+Cold starts (a new process per drone command) can skip JSON decoding via a
+pickle sidecar in drone_json/, written after each parse and trusted only when
+its stored signature matches the live registry file.
+
+Snapshots are shared - callers must treat them as read-only, or ask
+load_registry(copy=True) for a private deep copy.
+"""
+
+import copy as _copy
+import json
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+AIPASS_HOME = Path.home()
+AIPASS_ROOT = AIPASS_HOME / "aipass_core"
+REGISTRY_PATH = AIPASS_HOME / "BRANCH_REGISTRY.json"
+SIDECAR_PATH = AIPASS_ROOT / "drone" / "drone_json" / "branch_registry_cache.pickle"
+SIDECAR_FORMAT = 1
+
+EMPTY_REGISTRY: Dict[str, Any] = {"branches": [], "metadata": {}}
+
+Signature = Tuple[int, int]
+
+# =============================================================================
+# SNAPSHOT
+# =============================================================================
+
+class RegistrySnapshot:
+    """One parsed registry version with precomputed lookup maps.
+
+    Attributes:
+        data: Raw registry dict (read-only)
+        signature: (st_mtime_ns, st_size) it was parsed from, None if missing
+        branches: data["branches"]
+        by_name: lowercase name -> branch
+        by_email: lowercase email ("@flow") -> branch
+        by_path: path string as registered -> branch
+    """
+
+    def __init__(self, data: Dict[str, Any], signature: Optional[Signature]):
+        self.data = data
+        self.signature = signature
+        self.branches: List[Dict] = data.get("branches", []) or []
+        self.by_name: Dict[str, Dict] = {}
+        self.by_email: Dict[str, Dict] = {}
+        self.by_path: Dict[str, Dict] = {}
+        self._aliases: Dict[str, List[Dict]] = {}
+        self._by_resolved: Optional[Dict[str, Dict]] = None
+
+        # First registration wins, matching the old linear scans
+        for branch in self.branches:
+            name = (branch.get("name") or "").lower()
+            email = (branch.get("email") or "").lower()
+            path = branch.get("path")
+            if name:
+                self.by_name.setdefault(name, branch)
+            if email:
+                self.by_email.setdefault(email, branch)
+            if path:
+                self.by_path.setdefault(path, branch)
+            for key in {name, email, email.lstrip("@")} - {""}:
+                self._aliases.setdefault(key, []).append(branch)
+
+    def find(self, key: str) -> List[Dict]:
+        """Branches whose name or email matches key, in registry order.
+
+        Accepts "flow", "@flow" or "FLOW".
+        """
+        return self._aliases.get(key.lower(), [])
+
+    def by_resolved_path(self) -> Dict[str, Dict]:
+        """Map of Path.resolve()'d branch paths -> branch (computed once per snapshot)."""
+        if self._by_resolved is None:
+            resolved: Dict[str, Dict] = {}
+            for branch in self.branches:
+                path = branch.get("path", "")
+                resolved.setdefault(str(Path(path).resolve()), branch)
+            self._by_resolved = resolved
+        return self._by_resolved
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class BranchRegistryCache:
+    """Signature-validated cache of one registry file.
+
+    Args:
+        registry_path: BRANCH_REGISTRY.json location
+        sidecar_path: Optional pickle sidecar for fast cold loads (None disables)
+    """
+
+    def __init__(self, registry_path: Path = REGISTRY_PATH, sidecar_path: Optional[Path] = None):
+        self.registry_path = Path(registry_path)
+        self.sidecar_path = Path(sidecar_path) if sidecar_path else None
+        self._snapshot: Optional[RegistrySnapshot] = None
+        self._lock = threading.Lock()
+        self.stats = {"parses": 0, "sidecar_loads": 0, "hits": 0}
+
+    def _signature(self) -> Optional[Signature]:
+        try:
+            st = os.stat(self.registry_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def snapshot(self) -> RegistrySnapshot:
+        """Current snapshot, re-parsed only if the file signature changed."""
+        signature = self._signature()
+        with self._lock:
+            current = self._snapshot
+            if current is not None and current.signature == signature:
+                self.stats["hits"] += 1
+                return current
+
+            if signature is None:
+                self._snapshot = RegistrySnapshot(_copy.deepcopy(EMPTY_REGISTRY), None)
+                return self._snapshot
+
+            data = self._load_sidecar(signature)
+            if data is None:
+                data = self._parse()
+                if data is None:
+                    # Unreadable - don't pin the bad signature so the next call retries
+                    return RegistrySnapshot(_copy.deepcopy(EMPTY_REGISTRY), None)
+                self._write_sidecar(signature, data)
+
+            self._snapshot = RegistrySnapshot(data, signature)
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the in-process snapshot (e.g. after this process rewrote the file)."""
+        with self._lock:
+            self._snapshot = None
+
+    # ---------- private ----------
+
+    def _parse(self) -> Optional[Dict[str, Any]]:
+        self.stats["parses"] += 1
+        try:
+            data = json.loads(self.registry_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _load_sidecar(self, signature: Signature) -> Optional[Dict[str, Any]]:
+        if self.sidecar_path is None:
+            return None
+        try:
+            with open(self.sidecar_path, "rb") as f:
+                payload = pickle.load(f)
+        except Exception:
+            return None
+        if (not isinstance(payload, dict)
+                or payload.get("format") != SIDECAR_FORMAT
+                or payload.get("source") != str(self.registry_path)
+                or tuple(payload.get("signature") or ()) != signature):
+            return None
+        self.stats["sidecar_loads"] += 1
+        return payload.get("data")
+
+    def _write_sidecar(self, signature: Signature, data: Dict[str, Any]) -> None:
+        if self.sidecar_path is None:
+            return
+        try:
+            self.sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=str(self.sidecar_path.parent))
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"format": SIDECAR_FORMAT, "source": str(self.registry_path),
+                             "signature": signature, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.sidecar_path)
+        except Exception:
+            # Sidecar is an optimization only
+            pass
+
+# =============================================================================
+# PROCESS-WIDE CACHE
+# =============================================================================
+
+_default_cache = BranchRegistryCache(REGISTRY_PATH, SIDECAR_PATH)
+
+
+def get_snapshot() -> RegistrySnapshot:
+    """Current registry snapshot for this process."""
+    return _default_cache.snapshot()
+
+
+def load_registry(copy: bool = False) -> Dict[str, Any]:
+    """Parsed BRANCH_REGISTRY.json.
+
+    Args:
+        copy: Return a private deep copy the caller may mutate
+
+    Returns:
+        Registry dict ({"branches": [], "metadata": {}} if missing/unreadable)
+    """
+    data = get_snapshot().data
+    return _copy.deepcopy(data) if copy else data
+
+
+def invalidate_registry_cache() -> None:
+    """Force the next access to re-validate from disk."""
+    _default_cache.invalidate()
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Parse/sidecar/hit counters for this process."""
+    return dict(_default_cache.stats)
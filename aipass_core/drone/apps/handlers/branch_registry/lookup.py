@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: lookup.py - Branch Registry Lookup Handler
 # Date: 2025-11-29
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: drone/handlers/branch_registry
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Lookups served from cached snapshot maps (no per-call JSON parse)
 #   - v1.0.0 (2025-11-29): Initial - branch registry lookups
 #
 # CODE STANDARDS:
@@ -19,11 +20,13 @@
 Branch Registry Lookup Handler - Implementation for branch metadata lookups.
 
 Pure functions - no CLI output, no external dependencies.
+Registry access goes through cache.py (parse once, validate by mtime/size).
 """
 
 from pathlib import Path
 from typing import Dict, List, Optional
-import json
+
+from .cache import get_snapshot, load_registry as _cached_registry
 
 # =============================================================================
 # CONSTANTS
@@ -44,8 +47,7 @@ def get_all_branches() -> List[Dict]:
     Returns:
         List of branch dicts with name, path, email, etc.
     """
-    registry = _load_registry()
-    return registry.get("branches", [])
+    return get_snapshot().branches
 
 
 def get_branch_by_email(email: str) -> Optional[Dict]:
@@ -62,10 +64,7 @@ def get_branch_by_email(email: str) -> Optional[Dict]:
     if not email.startswith("@"):
         email = f"@{email}"
 
-    for branch in get_all_branches():
-        if branch.get("email", "").lower() == email:
-            return branch
-    return None
+    return get_snapshot().by_email.get(email)
 
 
 def get_branch_by_name(name: str) -> Optional[Dict]:
@@ -78,11 +77,7 @@ def get_branch_by_name(name: str) -> Optional[Dict]:
     Returns:
         Branch dict or None if not found
     """
-    name = name.lower()
-    for branch in get_all_branches():
-        if branch.get("name", "").lower() == name:
-            return branch
-    return None
+    return get_snapshot().by_name.get(name.lower())
 
 
 def get_branch_by_path(path: Path) -> Optional[Dict]:
@@ -95,11 +90,7 @@ def get_branch_by_path(path: Path) -> Optional[Dict]:
     Returns:
         Branch dict or None if not found
     """
-    path_str = str(path)
-    for branch in get_all_branches():
-        if branch.get("path") == path_str:
-            return branch
-    return None
+    return get_snapshot().by_path.get(str(path))
 
 
 def list_branch_names() -> List[str]:
@@ -149,8 +140,7 @@ def get_registry_metadata() -> Dict:
     Returns:
         Metadata dict
     """
-    registry = _load_registry()
-    return registry.get("metadata", {})
+    return get_snapshot().data.get("metadata", {})
 
 
 # =============================================================================
@@ -158,13 +148,8 @@ def get_registry_metadata() -> Dict:
 # =============================================================================
 
 def _load_registry() -> dict:
-    """Load BRANCH_REGISTRY.json."""
-    if REGISTRY_PATH.exists():
-        try:
-            return json.loads(REGISTRY_PATH.read_text())
-        except (json.JSONDecodeError, IOError):
-            return {"branches": [], "metadata": {}}
-    return {"branches": [], "metadata": {}}
+    """Load BRANCH_REGISTRY.json (cached)."""
+    return _cached_registry()
 
 
 def _find_module_path(branch_path: str) -> Optional[str]:
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: module_scanning.py - Module Scanning Handler
 # Date: 2025-11-13
-# Version: 2.0.0
+# Version: 2.1.0
 # Category: drone/handlers/discovery
 #
 # CHANGELOG:
+#   - v2.1.0 (2026-10-18): @branch lookup reads cached branch registry
 #   - v2.0.0 (2025-11-13): BEAST MIGRATION - Extracted from drone_discovery.py (2,289 lines)
 #   - v1.0.0 (2025-10-16): Original implementation in monolithic file
 # =============================================
@@ -394,10 +395,9 @@ def resolve_scan_path(path_arg: str) -> Path:
     if "/" not in path_after_at:
         # Simple branch name (not a path) - check registry
         try:
-            import json
-            registry_path = ECOSYSTEM_ROOT / "BRANCH_REGISTRY.json"
-            if registry_path.exists():
-                registry_data = json.loads(registry_path.read_text())
+            from drone.apps.handlers.branch_registry.cache import load_registry
+            registry_data = load_registry()
+            if registry_data.get("branches"):
                 branch_name = path_after_at.lower()
                 for branch in registry_data.get("branches", []):
                     # Match by name, email, or aliases
@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: system_operations.py - System Operations Handler
 # Date: 2025-11-13
-# Version: 2.0.0
+# Version: 2.2.0
 # Category: drone/handlers/discovery
 #
 # CHANGELOG:
+#   - v2.2.0 (2026-10-18): Branch commands run with AIPASS_CALLER set to the branch name
+#   - v2.1.0 (2026-10-18): Caller detection via cached branch registry snapshot
 #   - v2.0.0 (2025-11-13): BEAST MIGRATION - Extracted from drone_discovery.py (2,289 lines)
 #   - v1.0.0 (2025-10-16): Original implementation in monolithic file
 # =============================================
@@ -52,6 +54,8 @@
 from cli.apps.modules import console
 from rich.panel import Panel
 
+from drone.apps.handlers.branch_registry.cache import get_snapshot
+
 # Same-package imports allowed
 from .command_parsing import load_system_registry, save_system_registry, get_next_global_id, increment_global_id
 from .module_scanning import scan_module
@@ -63,7 +67,6 @@
 MODULE_NAME = "system_operations"
 DRONE_ROOT = AIPASS_ROOT / "drone"
 ECOSYSTEM_ROOT = Path.home()
-BRANCH_REGISTRY_PATH = Path.home() / "BRANCH_REGISTRY.json"
 
 # =============================================
 # CALLER DETECTION (for Mission Control visibility)
@@ -79,12 +82,9 @@ def _detect_caller_branch() -> str:
         current = cwd.resolve()
         for _ in range(10):
             if list(current.glob("*.id.json")):
-                if BRANCH_REGISTRY_PATH.exists():
-                    with open(BRANCH_REGISTRY_PATH, 'r') as f:
-                        registry = json.load(f)
-                    for branch in registry.get("branches", []):
-                        if Path(branch["path"]).resolve() == current:
-                            return branch.get("name", "UNKNOWN")
+                branch = get_snapshot().by_resolved_path().get(str(current))
+                if branch is not None:
+                    return branch.get("name", "UNKNOWN")
                 return current.name.upper()
             parent = current.parent
             if parent == current:
@@ -880,6 +880,7 @@ def run_branch_module(module_path: Path, module_args: List[str], timeout: int |
         # Long-running daemon process (no timeout)
         run_branch_module(module_path, ["watcher", "start"], timeout=None)
     """
+    import os
     import subprocess
 
     # If it's a directory, look for the main entry point
@@ -964,13 +965,18 @@ def run_branch_module(module_path: Path, module_args: List[str], timeout: int |
     else:
         python_cmd = 'python3'
 
+    # Identify the branch to the API once per process (no per-request stack detection)
+    branch_name = entry_point.parent.parent.name if entry_point.parent.name == 'apps' else entry_point.parent.name
+    env = {**os.environ, "AIPASS_CALLER": branch_name}
+
     # Run the module - stdout streams to terminal, stderr captured for inspection
     try:
         result = subprocess.run(
             [python_cmd, str(entry_point)] + module_args,
             timeout=timeout,
             stderr=subprocess.PIPE,
-            text=True
+            text=True,
+            env=env
         )
 
         # Check stderr for environment/import failures
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: resolver.py - Path Resolution Handler
 # Date: 2025-11-29
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: drone/handlers/paths
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Registry reads via shared branch_registry cache and lookup maps
 #   - v1.0.0 (2025-11-29): Initial - path resolution implementation
 #
 # CODE STANDARDS:
@@ -24,7 +25,6 @@
 import sys
 from pathlib import Path
 from typing import Union, Optional
-import json
 
 # =============================================================================
 # INFRASTRUCTURE SETUP
@@ -36,6 +36,8 @@
 
 AIPASS_HOME = Path.home()
 
+from drone.apps.handlers.branch_registry.cache import get_snapshot, load_registry
+
 # Special reserved targets
 RESERVED_TARGETS = {
     "@": AIPASS_HOME,
@@ -99,18 +101,11 @@ def get_branch_path(branch_name: str) -> Path:
     """
     branch_name = branch_name.lower()
 
-    registry = _load_branch_registry()
-
-    for branch in registry.get("branches", []):
-        if branch.get("name", "").lower() == branch_name:
-            path = Path(branch["path"])
-            if path.exists():
-                return path
-        email = branch.get("email", "").lower()
-        if email == f"@{branch_name}" or email == branch_name:
-            path = Path(branch["path"])
-            if path.exists():
-                return path
+    # Name/email aliases precomputed per registry version (registry order kept)
+    for branch in get_snapshot().find(branch_name):
+        path = Path(branch["path"])
+        if path.exists():
+            return path
 
     # Fallback: standard locations
     standard_paths = [
@@ -147,13 +142,10 @@ def normalize_branch_arg(arg: str) -> str:
 
     if arg.startswith("/"):
         # Use registry to find branch by path - no guessing
-        registry = _load_branch_registry()
         path = Path(arg).resolve()
-
-        for branch in registry.get("branches", []):
-            branch_path = Path(branch.get("path", "")).resolve()
-            if path == branch_path:
-                return branch.get("name", "").upper()
+        branch = get_snapshot().by_resolved_path().get(str(path))
+        if branch is not None:
+            return branch.get("name", "").upper()
 
         # No match found - fail with clear error
         raise ValueError(f"Path '{arg}' does not match any registered branch. Check BRANCH_REGISTRY.json")
@@ -211,14 +203,8 @@ def branch_exists(branch_name: str) -> bool:
 # =============================================================================
 
 def _load_branch_registry() -> dict:
-    """Load BRANCH_REGISTRY.json from AIPASS_HOME."""
-    registry_path = AIPASS_HOME / "BRANCH_REGISTRY.json"
-    if registry_path.exists():
-        try:
-            return json.loads(registry_path.read_text())
-        except (json.JSONDecodeError, IOError):
-            return {"branches": []}
-    return {"branches": []}
+    """Load BRANCH_REGISTRY.json from AIPASS_HOME (cached, read-only)."""
+    return load_registry()
 
 
 # =============================================================================
@@ -2,10 +2,11 @@
 # META DATA HEADER
 # Name: __init__.py - Drone Modules Package
 # Date: 2025-11-29
-# Version: 2.0.0
+# Version: 2.1.0
 # Category: drone/modules
 #
 # CHANGELOG (Max 5 entries):
+#   - v2.1.0 (2026-10-18): Export cached registry access
 #   - v2.0.0 (2025-11-29): Added service layer exports (paths, branch_registry)
 #   - v1.0.0 (2025-11-11): Initial package
 # =============================================
@@ -52,6 +53,10 @@
     list_branch_emails,
     list_systems,
     get_registry_metadata,
+    get_snapshot,
+    load_registry,
+    invalidate_registry_cache,
+    get_cache_stats,
 )
 
 # =============================================================================
@@ -78,4 +83,8 @@
     "list_branch_emails",
     "list_systems",
     "get_registry_metadata",
+    "get_snapshot",
+    "load_registry",
+    "invalidate_registry_cache",
+    "get_cache_stats",
 ]
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: activated_commands.py - Activated Commands Orchestrator Module
 # Date: 2025-11-29
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: drone/modules
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Caller detection via cached branch registry snapshot
 #   - v1.0.0 (2025-11-29): Initial creation - handles activated custom commands
 #
 # CODE STANDARDS:
@@ -60,15 +61,13 @@
     run_branch_module,
 )
 from drone.apps.handlers.routing import preprocess_args
-
-import json
+from drone.apps.handlers.branch_registry import get_snapshot
 
 # =============================================
 # CONSTANTS
 # =============================================
 
 MODULE_NAME = "activated_commands"
-BRANCH_REGISTRY_PATH = Path.home() / "BRANCH_REGISTRY.json"
 
 # =============================================
 # CALLER DETECTION (for Mission Control visibility)
@@ -88,12 +87,9 @@ def _detect_caller_branch() -> str:
         for _ in range(10):
             if list(current.glob("*.id.json")):
                 # Found branch root - look up in registry
-                if BRANCH_REGISTRY_PATH.exists():
-                    with open(BRANCH_REGISTRY_PATH, 'r') as f:
-                        registry = json.load(f)
-                    for branch in registry.get("branches", []):
-                        if Path(branch["path"]).resolve() == current:
-                            return branch.get("name", "UNKNOWN")
+                branch = get_snapshot().by_resolved_path().get(str(current))
+                if branch is not None:
+                    return branch.get("name", "UNKNOWN")
                 return current.name.upper()
 
             parent = current.parent
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: branch_registry.py - Drone Branch Registry Services (Module API)
 # Date: 2025-11-29
-# Version: 2.0.0
+# Version: 2.1.0
 # Category: drone/modules/services
 #
 # CHANGELOG (Max 5 entries):
+#   - v2.1.0 (2026-10-18): Export cached registry access (load_registry, get_snapshot, cache stats)
 #   - v2.0.0 (2025-11-29): Refactored to thin API layer (imports from handlers)
 #   - v1.0.0 (2025-11-29): Initial service layer - pure functions, no CLI
 #
@@ -28,6 +29,9 @@
 
     branches = get_all_branches()
     flow = get_branch_by_email("@flow")
+
+    # Whole registry, parsed once per file change (treat as read-only)
+    registry = load_registry()
 """
 
 # INFRASTRUCTURE IMPORT PATTERN
@@ -53,6 +57,10 @@
     list_branch_emails,
     list_systems,
     get_registry_metadata,
+    get_snapshot,
+    load_registry,
+    invalidate_registry_cache,
+    get_cache_stats,
 )
 
 __all__ = [
@@ -64,5 +72,9 @@
     "list_branch_emails",
     "list_systems",
     "get_registry_metadata",
+    "get_snapshot",
+    "load_registry",
+    "invalidate_registry_cache",
+    "get_cache_stats",
     "logger",
 ]
@@ -0,0 +1,136 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_branch_registry_cache.py - Branch registry cache tests
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: drone/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation
+#
+# CODE STANDARDS:
+#   - Uses a temporary BRANCH_REGISTRY.json, never the live one
+# =============================================
+
+"""Tests for handlers/branch_registry/cache.py - signature validation, lookup maps, sidecar, parse counts."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# aipass_core on path so 'drone.apps...' resolves
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from drone.apps.handlers.branch_registry import cache as registry_cache
+from drone.apps.handlers.branch_registry import lookup
+from drone.apps.handlers.paths import resolver
+
+
+def _write_registry(path: Path, root: Path, names=("FLOW", "SEED", "DRONE")) -> None:
+    branches = []
+    for name in names:
+        branch_dir = root / name.lower()
+        branch_dir.mkdir(parents=True, exist_ok=True)
+        branches.append({"name": name, "path": str(branch_dir), "email": f"@{name.lower()}"})
+    path.write_text(json.dumps({"branches": branches, "metadata": {"version": "1"}}))
+
+
+@pytest.fixture
+def registry(temp_test_dir, monkeypatch):
+    """Point the process-wide cache at a temporary registry (no sidecar)."""
+    path = temp_test_dir / "BRANCH_REGISTRY.json"
+    _write_registry(path, temp_test_dir)
+    cache = registry_cache.BranchRegistryCache(path)
+    monkeypatch.setattr(registry_cache, "_default_cache", cache)
+    return path, cache
+
+
+class TestSnapshot:
+    """Parse-once behaviour and lookup maps"""
+
+    def test_repeated_access_parses_once(self, registry):
+        _path, cache = registry
+        for _ in range(10):
+            registry_cache.load_registry()
+        assert cache.stats["parses"] == 1
+        assert cache.stats["hits"] == 9
+
+    def test_change_in_size_or_mtime_reparses(self, registry, temp_test_dir):
+        path, cache = registry
+        registry_cache.get_snapshot()
+        _write_registry(path, temp_test_dir, names=("FLOW", "SEED", "DRONE", "CORTEX"))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert len(registry_cache.get_snapshot().branches) == 4
+        assert cache.stats["parses"] == 2
+
+    def test_lookup_maps(self, registry):
+        assert lookup.get_branch_by_email("flow")["name"] == "FLOW"
+        assert lookup.get_branch_by_name("Seed")["name"] == "SEED"
+        assert [b["name"] for b in registry_cache.get_snapshot().find("@drone")] == ["DRONE"]
+        assert lookup.get_registry_metadata() == {"version": "1"}
+
+    def test_missing_registry_is_empty(self, temp_test_dir, monkeypatch):
+        cache = registry_cache.BranchRegistryCache(temp_test_dir / "missing.json")
+        monkeypatch.setattr(registry_cache, "_default_cache", cache)
+        assert registry_cache.load_registry() == {"branches": [], "metadata": {}}
+
+    def test_copy_is_private(self, registry):
+        private = registry_cache.load_registry(copy=True)
+        private["branches"].clear()
+        assert len(registry_cache.load_registry()["branches"]) == 3
+
+
+class TestSidecar:
+    """Pickle sidecar for cold loads"""
+
+    def test_cold_load_uses_sidecar(self, temp_test_dir):
+        path = temp_test_dir / "BRANCH_REGISTRY.json"
+        sidecar = temp_test_dir / "cache.pickle"
+        _write_registry(path, temp_test_dir)
+
+        warm = registry_cache.BranchRegistryCache(path, sidecar)
+        warm.snapshot()
+        assert sidecar.exists()
+
+        cold = registry_cache.BranchRegistryCache(path, sidecar)
+        assert len(cold.snapshot().branches) == 3
+        assert cold.stats == {"parses": 0, "sidecar_loads": 1, "hits": 0}
+
+    def test_stale_sidecar_is_ignored(self, temp_test_dir):
+        path = temp_test_dir / "BRANCH_REGISTRY.json"
+        sidecar = temp_test_dir / "cache.pickle"
+        _write_registry(path, temp_test_dir)
+        registry_cache.BranchRegistryCache(path, sidecar).snapshot()
+
+        _write_registry(path, temp_test_dir, names=("FLOW",))
+        cold = registry_cache.BranchRegistryCache(path, sidecar)
+        assert len(cold.snapshot().branches) == 1
+        assert cold.stats["parses"] == 1
+
+
+class TestParseBenchmark:
+    """Benchmark: registry parses for one simulated drone command"""
+
+    def test_parses_per_command(self, registry, temp_test_dir):
+        _path, cache = registry
+
+        # Lookups a typical `drone @flow ...` invocation performs: caller
+        # detection, @ resolution, module path discovery, system listing
+        resolver.normalize_branch_arg(str(temp_test_dir / "flow"))
+        resolver.resolve("@flow")
+        resolver.get_branch_path("seed")
+        resolver.resolve("@all")
+        lookup.list_systems()
+        lookup.get_branch_by_email("@drone")
+
+        reads = cache.stats["parses"] + cache.stats["hits"]
+        print(f"\n  registry reads: {reads} (legacy: one JSON parse each), parses now: {cache.stats['parses']}")
+
+        assert reads > 5
+        assert cache.stats["parses"] == 1
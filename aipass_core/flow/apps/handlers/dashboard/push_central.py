@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: push_central.py
 # Date: 2025-11-21
-# Version: 1.1.0
+# Version: 1.2.0
 # Category: flow/handlers/dashboard
 #
 # CHANGELOG:
+#   - v1.2.0 (2026-10-18): Location-indexed plan lookup and counter statistics via registry_store
 #   - v1.1.0 (2025-11-21): Integrated aggregate_central for self-healing
 #   - v1.0.0 (2025-11-21): Initial creation - push Flow's plans to central aggregation
 # =============================================
@@ -19,7 +20,7 @@
 This handler follows the 3-tier logging standard (no Prax imports, no logging).
 
 Features:
-- Reads flow_registry.json to get Flow's plans
+- Reads Flow's plans from the registry store's location index
 - Extracts only plans where location='flow' (Flow's own plans)
 - Updates branches.flow section in PLANS.central.json
 - Preserves all other branch sections
@@ -45,6 +46,7 @@
 
 # Module imports
 from flow.apps.modules.aggregate_central import aggregate_central
+from flow.apps.handlers.registry.registry_store import get_store
 
 # =============================================
 # CONFIGURATION
@@ -53,6 +55,7 @@
 MODULE_NAME = "push_central"
 FLOW_JSON_DIR = FLOW_ROOT / "flow_json"
 REGISTRY_FILE = FLOW_JSON_DIR / "flow_registry.json"
+FLOW_LOCATION = "/home/aipass/aipass_core/flow"
 AI_CENTRAL_DIR = Path.home() / "aipass_os" / "AI_CENTRAL"
 CENTRAL_FILE = AI_CENTRAL_DIR / "PLANS.central.json"
 
@@ -61,17 +64,13 @@
 # =============================================
 
 def _load_registry() -> Dict[str, Any]:
-    """Load flow_registry.json
+    """Load Flow's own plans via the registry location index
 
     Returns:
-        Registry dict or empty structure if file doesn't exist
+        Registry-shaped dict holding only plans located in Flow
     """
-    if not REGISTRY_FILE.exists():
-        return {"plans": {}, "next_number": 1}
-
     try:
-        with open(REGISTRY_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return {"plans": get_store().plans_by_location(FLOW_LOCATION)}
     except Exception:
         return {"plans": {}, "next_number": 1}
 
@@ -92,7 +91,7 @@ def _extract_flow_plans(registry: Dict[str, Any]) -> tuple[List[Dict], List[Dict
     for plan_num, plan_data in plans.items():
         # Only include plans where location is 'flow' (Flow's own plans)
         location = plan_data.get("location", "")
-        if location != "/home/aipass/aipass_core/flow":
+        if location != FLOW_LOCATION:
             continue
 
         # Build plan entry
@@ -188,7 +187,7 @@ def push_to_plans_central() -> bool:
     """Push Flow's plan data to AI_CENTRAL/PLANS.central.json
 
     Algorithm:
-    1. Read flow_registry.json
+    1. Read Flow's plans from the registry store (location index)
     2. Extract only plans where location='flow' (Flow's own plans)
     3. Format for central structure with branch metadata
     4. Read existing PLANS.central.json if exists
@@ -221,9 +220,7 @@ def push_to_plans_central() -> bool:
             "recently_closed": recently_closed,
             "statistics": {
                 "active_count": len(active_plans),
-                "total_closed": len([p for p in registry.get("plans", {}).values()
-                                    if p.get("location") == "/home/aipass/aipass_core/flow"
-                                    and p.get("status") == "closed"])
+                "total_closed": get_store().count_by_status(FLOW_LOCATION).get("closed", 0)
             }
         }
 
@@ -5,10 +5,12 @@
 # META DATA HEADER
 # Name: update_local.py
 # Date: 2025-11-21
-# Version: 1.0.0
+# Version: 1.2.0
 # Category: flow/handlers/dashboard
 #
 # CHANGELOG:
+#   - v1.2.0 (2026-10-18): flow_plans written through devpulse's dashboard section store
+#   - v1.1.0 (2026-10-18): Reads Flow's plans through registry_store location query
 #   - v1.0.0 (2025-11-21): Initial creation - updates DASHBOARD.local.json
 # =============================================
 
@@ -34,10 +36,10 @@
 2. Extract Flow's plans only (location='flow')
 3. Partition into active (status='open') and recently_closed (status='closed', last 5)
 4. Calculate statistics (active_count, total_closed, next_number)
-5. Read existing DASHBOARD.local.json if exists
-6. Update ONLY the 'flow_plans' section
-7. Preserve ALL other sections (other branches manage their own)
-8. Write back to DASHBOARD.local.json
+5. Submit ONLY the 'flow_plans' section to devpulse's dashboard section store
+6. The store preserves ALL other sections, skips the write if flow_plans is
+   unchanged, and replaces the file atomically under the dashboard lock
+7. Fallback when devpulse is not importable: read, merge and write directly
 
 Structure:
 {
@@ -84,6 +86,9 @@
 AIPASS_ROOT = Path.home() / "aipass_core"
 FLOW_ROOT = AIPASS_ROOT / "flow"
 sys.path.append(str(AIPASS_ROOT))
+sys.path.append(str(Path.home()))  # For devpulse dashboard module
+
+from flow.apps.handlers.registry.registry_store import get_store
 
 # =============================================
 # CONFIGURATION
@@ -98,16 +103,17 @@
 
 def _read_registry() -> Optional[Dict[str, Any]]:
     """
-    Read flow_registry.json.
+    Read Flow's plans from the registry store.
+
+    Only rows whose location contains 'flow' are decoded; the
+    partitioning below still applies the same filter.
 
     Returns:
         Registry dict or None if error
     """
     try:
-        if not REGISTRY_FILE.exists():
-            return None
-        with open(REGISTRY_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        store = get_store()
+        return {"plans": store.plans_location_contains("flow"), "next_number": store.next_number}
     except Exception:
         return None
 
@@ -265,6 +271,7 @@ def update_dashboard_local() -> bool:
     2. Extracts Flow's plans (location='flow')
     3. Partitions into active and closed
     4. Updates ONLY the 'flow_plans' section of DASHBOARD.local.json
+       (via the dashboard section store - unchanged plans skip the write)
     5. Preserves all other sections (other branches manage their own)
 
     Returns:
@@ -286,6 +293,20 @@ def update_dashboard_local() -> bool:
     # Calculate statistics
     statistics = _calculate_statistics(active, closed, registry)
 
+    flow_plans = {
+        "active": active,
+        "recently_closed": closed[-5:] if len(closed) > 0 else [],  # Last 5
+        "statistics": statistics
+    }
+
+    # Shared section store: serialized with other dashboard writers, no-op if unchanged
+    try:
+        from aipass_os.dev_central.devpulse.apps.modules.dashboard import update_sections
+    except ImportError:
+        pass  # devpulse not importable - read-modify-write directly
+    else:
+        return update_sections(FLOW_ROOT, root_sections={"flow_plans": flow_plans})
+
     # Read existing dashboard (to preserve other sections)
     existing = _read_existing_dashboard()
 
@@ -0,0 +1,6 @@
+"""
+Flow Handlers - LLM
+
+Shared scheduler for flow's AI calls: rate limiting, bounded concurrency,
+durable job queue and content-hash result cache.
+"""
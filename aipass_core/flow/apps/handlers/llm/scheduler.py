@@ -0,0 +1,377 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: scheduler.py - Shared LLM Job Scheduler Handler
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: flow/handlers/llm
+#
+# CHANGELOG:
+#   - v1.0.0 (2026-10-18): Initial implementation - token bucket, worker pool, durable queue, hash cache
+#
+# CODE STANDARDS:
+#   - 3-tier compliant: NO Prax imports, NO logging
+#   - Raises exceptions for errors (module logs them)
+# =============================================
+
+"""
+LLM Job Scheduler Handler
+
+Shared scheduler for flow's AI calls (plan summaries, memory bank TRL analysis).
+Replaces the old "sleep API_DELAY_SECONDS, stop on first 429" loops.
+
+Pieces:
+- TokenBucket: request rate limiter with adaptive backoff (halve on 429, creep back on success)
+- JobQueue: durable JSON queue - jobs stay on disk until they succeed, so an
+  interrupted run resumes them next time
+- ResultCache: results keyed by content hash - unchanged input never calls the API
+- LLMScheduler: bounded worker pool tying the three together
+
+Total wall time for N jobs is then roughly max(N / rate, N * latency / workers)
+instead of N * (latency + delay).
+"""
+
+import sys
+from pathlib import Path
+
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+# =============================================
+# CONSTANTS
+# =============================================
+
+FLOW_JSON_DIR = AIPASS_ROOT / "flow" / "flow_json"
+DEFAULT_SCHEDULER_SETTINGS = {
+    "max_workers": 4,
+    "requests_per_minute": 20,
+    "burst": 3,
+    "max_attempts": 4,
+    "cache_max_entries": 500
+}
+RATE_LIMIT_MARKERS = ("429", "rate limit", "too many requests")
+
+# =============================================
+# ERRORS
+# =============================================
+
+class RateLimitError(Exception):
+    """Upstream rejected the request for rate reasons - job is retried later"""
+
+    def __init__(self, message: str = "rate limited", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def is_rate_limit_error(error: Any) -> bool:
+    """Check exception or error text for rate limit markers"""
+    text = str(error).lower()
+    return any(marker in text for marker in RATE_LIMIT_MARKERS)
+
+
+def content_hash(*parts: str) -> str:
+    """Stable SHA-256 over the given string parts"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8', errors='replace'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _atomic_json_write(path: Path, data: Any) -> None:
+    """Write JSON via temp file + rename"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_json(path: Path, default: Any) -> Any:
+    """Load JSON file, returning default when missing or corrupt"""
+    if not path.exists():
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return default
+
+# =============================================
+# RATE LIMITER
+# =============================================
+
+class TokenBucket:
+    """Token bucket with multiplicative decrease on 429 and additive recovery
+
+    Args:
+        rate: Tokens per second at full speed
+        burst: Bucket capacity
+        min_rate: Floor the rate never drops below after backoff
+        clock/sleep: Injectable for tests
+    """
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.clock = clock
+        self.sleep = sleep
+        self.blocked_until = 0.0
+        self.backoffs = 0
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self.clock()
+                if now < self.blocked_until:
+                    delay = self.blocked_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    delay = (1 - self.tokens) / self.rate
+            self.sleep(delay)
+            waited += delay
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """Back off after a 429: halve rate, drain bucket, pause everyone"""
+        with self._lock:
+            now = self.clock()
+            self.backoffs += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = 0.0
+            self._last = now
+            pause = retry_after if retry_after else 1.0 / self.rate
+            self.blocked_until = max(self.blocked_until, now + pause)
+
+    def reward(self) -> None:
+        """Recover rate gradually after a success"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+# =============================================
+# DURABLE QUEUE & CACHE
+# =============================================
+
+class JobQueue:
+    """Pending jobs persisted to disk until completion
+
+    File format: {"jobs": {job_id: {"key", "payload", "attempts", "enqueued_at"}}}
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.jobs: Dict[str, Dict[str, Any]] = _load_json(self.path, {}).get("jobs", {})
+
+    def _save(self) -> None:
+        if self.jobs:
+            _atomic_json_write(self.path, {"jobs": self.jobs})
+        elif self.path.exists():
+            self.path.unlink()
+
+    def put(self, job_id: str, key: str, payload: Dict[str, Any], save: bool = True) -> None:
+        """Enqueue (or refresh) a job, keeping its attempt count if already pending"""
+        with self._lock:
+            existing = self.jobs.get(job_id)
+            self.jobs[job_id] = {
+                "key": key,
+                "payload": payload,
+                "attempts": existing.get("attempts", 0) if existing and existing.get("key") == key else 0,
+                "enqueued_at": datetime.now(timezone.utc).isoformat()
+            }
+            if save:
+                self._save()
+
+    def bump(self, job_id: str) -> int:
+        """Record a failed attempt, returning the new count"""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return 0
+            job["attempts"] = job.get("attempts", 0) + 1
+            self._save()
+            return job["attempts"]
+
+    def save(self) -> None:
+        """Persist the queue (after a batch of put(save=False))"""
+        with self._lock:
+            self._save()
+
+    def done(self, job_id: str) -> None:
+        """Remove a finished job"""
+        with self._lock:
+            if self.jobs.pop(job_id, None) is not None:
+                self._save()
+
+    def pending(self) -> List[str]:
+        """Job ids still on the queue (resumed ones included)"""
+        with self._lock:
+            return list(self.jobs.keys())
+
+
+class ResultCache:
+    """Content-hash keyed result store, oldest entries evicted past max_entries"""
+
+    def __init__(self, path: Path, max_entries: int = 500):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = _load_json(self.path, {})
+        self._dirty = False
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self.entries.get(key)
+            return entry.get("result") if entry else None
+
+    def put(self, key: str, result: Any) -> None:
+        with self._lock:
+            self.entries.pop(key, None)
+            self.entries[key] = {"result": result, "stored_at": datetime.now(timezone.utc).isoformat()}
+            while len(self.entries) > self.max_entries:
+                self.entries.pop(next(iter(self.entries)))
+            self._dirty = True
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._dirty:
+                _atomic_json_write(self.path, self.entries)
+                self._dirty = False
+
+# =============================================
+# SCHEDULER
+# =============================================
+
+class LLMScheduler:
+    """Bounded-concurrency, rate-limited runner for LLM jobs
+
+    Args:
+        name: Namespace for queue/cache files (e.g. "summary", "mbank")
+        worker: Callable(payload) -> result. Raise RateLimitError (or an
+            exception whose text mentions 429/rate limit) to be retried.
+        settings: Overrides for DEFAULT_SCHEDULER_SETTINGS
+        state_dir: Where llm_queue_<name>.json / llm_cache_<name>.json live
+        bucket: Pre-built TokenBucket (tests)
+    """
+
+    def __init__(self, name: str, worker: Callable[[Dict[str, Any]], Any],
+                 settings: Optional[Dict[str, Any]] = None, state_dir: Path = FLOW_JSON_DIR,
+                 bucket: Optional[TokenBucket] = None):
+        self.name = name
+        self.worker = worker
+        self.settings = {**DEFAULT_SCHEDULER_SETTINGS, **(settings or {})}
+        self.queue = JobQueue(Path(state_dir) / f"llm_queue_{name}.json")
+        self.cache = ResultCache(Path(state_dir) / f"llm_cache_{name}.json",
+                                 self.settings["cache_max_entries"])
+        self.bucket = bucket or TokenBucket(self.settings["requests_per_minute"] / 60.0,
+                                            self.settings["burst"])
+        self.stats = {"submitted": 0, "cache_hits": 0, "api_calls": 0,
+                      "rate_limited": 0, "failed": 0, "resumed": 0}
+        self._submitted: set = set()
+        self._stats_lock = threading.Lock()
+
+    def submit(self, job_id: str, key: str, payload: Dict[str, Any]) -> Optional[Any]:
+        """Queue a job unless its content hash is already cached
+
+        Returns:
+            Cached result on hit (job is not queued), else None
+        """
+        self.stats["submitted"] += 1
+        self._submitted.add(job_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            self.queue.done(job_id)
+            return cached
+        self.queue.put(job_id, key, payload, save=False)
+        return None
+
+    def _run_one(self, job_id: str) -> Dict[str, Any]:
+        job = self.queue.jobs.get(job_id)
+        if not job:
+            return {"ok": False, "error": "job vanished"}
+        max_attempts = self.settings["max_attempts"]
+
+        while True:
+            self.bucket.acquire()
+            with self._stats_lock:
+                self.stats["api_calls"] += 1
+            try:
+                result = self.worker(job["payload"])
+            except Exception as e:
+                attempts = self.queue.bump(job_id)
+                if isinstance(e, RateLimitError) or is_rate_limit_error(e):
+                    with self._stats_lock:
+                        self.stats["rate_limited"] += 1
+                    self.bucket.penalize(getattr(e, "retry_after", None))
+                    if attempts < max_attempts:
+                        continue
+                    # Leave it queued - next run resumes it
+                    return {"ok": False, "error": str(e), "rate_limited": True}
+                with self._stats_lock:
+                    self.stats["failed"] += 1
+                if attempts >= max_attempts:
+                    self.queue.done(job_id)
+                return {"ok": False, "error": str(e)}
+
+            self.bucket.reward()
+            self.cache.put(job["key"], result)
+            self.queue.done(job_id)
+            return {"ok": True, "result": result}
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """Run every pending job through the worker pool
+
+        Jobs left on disk by an interrupted run are included; their results
+        land in the cache even if the caller no longer asks for them.
+
+        Returns:
+            {job_id: {"ok": bool, "result": Any} | {"ok": False, "error": str}}
+        """
+        # Everything is on disk before the first API call
+        self.queue.save()
+        job_ids = self.queue.pending()
+        self.stats["resumed"] = len([j for j in job_ids if j not in self._submitted])
+        results: Dict[str, Dict[str, Any]] = {}
+
+        if job_ids:
+            workers = max(1, min(self.settings["max_workers"], len(job_ids)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {job_id: executor.submit(self._run_one, job_id) for job_id in job_ids}
+                for job_id, future in futures.items():
+                    results[job_id] = future.result()
+
+        self.cache.flush()
+        return results
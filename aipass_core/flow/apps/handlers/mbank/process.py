@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: process.py - Memory Bank Processing Handler
 # Date: 2025-11-25
-# Version: 1.5.0
+# Version: 1.6.0
 # Category: flow/handlers/mbank
 #
 # CHANGELOG:
+#   - v1.6.0 (2026-10-18): Concurrent TRL analysis via shared LLM scheduler, sequential apply stage
 #   - v1.5.0 (2026-02-15): Fixed template detection - markers matched old template (pre-Dec 2025), all 3 template types covered
 #   - v1.4.0 (2026-02-14): Sequential processing with backoff - stop on 429, delay between API calls
 #   - v1.3.0 (2025-11-25): Restructured config - separated TRL mapping to flow_mbank_registry.json
@@ -46,12 +47,12 @@
 # Standard imports
 import json
 import re
-import time
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 
 # Import OpenRouter API via module layer (cross-branch access)
 from api.apps.modules.openrouter_client import get_response
+from flow.apps.handlers.llm.scheduler import LLMScheduler, content_hash
 
 # =============================================
 # CONSTANTS
@@ -61,7 +62,6 @@
 FLOW_JSON_DIR = FLOW_ROOT / "flow_json"
 MEMORY_BANK_PATH = Path.home() / "MEMORY_BANK" / "plans"
 PROCESSED_PLANS_DIR = AIPASS_ROOT / "backup_system" / "processed_plans"
-API_DELAY_SECONDS = 3  # Delay between sequential API calls to avoid rate limits
 REGISTRY_FILE = FLOW_JSON_DIR / "flow_registry.json"
 CONFIG_FILE = FLOW_JSON_DIR / "flow_mbank_config.json"
 TRL_REGISTRY_FILE = FLOW_JSON_DIR / "flow_mbank_registry.json"
@@ -679,12 +679,88 @@ def verify_and_heal_orphaned_plans() -> Dict[str, Any]:
 # MAIN PROCESSING
 # =============================================
 
+def _analysis_worker(payload: Dict[str, Any]) -> Dict[str, str]:
+    """Scheduler worker: TRL analysis for one plan file"""
+    return analyze_plan_content(Path(payload["path"]))
+
+
+def _apply_analysis(plan: Dict[str, Any], analysis: Dict[str, str]) -> Dict[str, Any]:
+    """Create memory entry, archive plan and update registry for one analysed plan
+
+    Runs sequentially - file moves and registry writes are not thread-safe.
+
+    Returns:
+        Per-plan result dict (status: fully_processed | memory_created_cleanup_failed | error)
+    """
+    plan_path = plan["path"]
+    plan_num = plan["number"]
+
+    # Generate correlation ID for tracking
+    correlation_id = f"FPLAN-{plan_num}-{datetime.now().strftime('%H%M%S')}"
+
+    # Phase 2: Create memory entry
+    memory_file = create_memory_entry(plan_path, analysis)
+
+    if not memory_file:
+        return {
+            "plan": f"FPLAN-{plan_num}",
+            "status": "error",
+            "error": "Failed to create memory entry",
+            "correlation_id": correlation_id
+        }
+
+    # Update registry - memory created
+    registry = load_flow_registry()
+    if plan_num in registry.get("plans", {}):
+        registry["plans"][plan_num]["memory_created"] = True
+        registry["plans"][plan_num]["memory_created_date"] = datetime.now(timezone.utc).isoformat()
+        registry["plans"][plan_num]["memory_file"] = str(memory_file)
+        save_flow_registry(registry)
+
+    # Phase 3: Archive plan to backup
+    cleanup_success = archive_plan(plan_path)
+
+    # Update registry with final status
+    registry = load_flow_registry()
+    if plan_num in registry.get("plans", {}):
+        registry["plans"][plan_num]["cleanup_completed"] = cleanup_success
+        registry["plans"][plan_num]["cleanup_date"] = datetime.now(timezone.utc).isoformat()
+
+        # Only mark as fully processed if BOTH phases succeeded
+        if cleanup_success:
+            registry["plans"][plan_num]["processed"] = True
+            registry["plans"][plan_num]["processed_date"] = datetime.now(timezone.utc).isoformat()
+
+        save_flow_registry(registry)
+
+    if cleanup_success:
+        # FULL SUCCESS
+        return {
+            "plan": f"FPLAN-{plan_num}",
+            "memory_file": str(memory_file),
+            "status": "fully_processed",
+            "correlation_id": correlation_id
+        }
+
+    # PARTIAL SUCCESS
+    return {
+        "plan": f"FPLAN-{plan_num}",
+        "memory_file": str(memory_file),
+        "status": "memory_created_cleanup_failed",
+        "error": "Memory bank entry created but failed to move plan to backup folder",
+        "correlation_id": correlation_id
+    }
+
+
 def process_closed_plans() -> Dict[str, Any]:
     """Main function to process all closed plans
 
-    Two-phase processing:
-        Phase 1: Create memory entry (always attempted)
-        Phase 2: Archive plan file (only if phase 1 succeeds)
+    Two-stage processing:
+        Stage 1: TRL analysis for every plan, run concurrently through the
+                 shared LLM scheduler (rate limited, content-hash cached,
+                 rate-limited jobs stay queued for the next run)
+        Stage 2: Per plan, sequentially - create memory entry, then archive
+                 plan file (only if memory entry succeeds)
 
     AUTO-HEAL: Cleans up old -TEMP files from MEMORY_BANK after processing
 
@@ -696,6 +772,7 @@ def process_closed_plans() -> Dict[str, Any]:
             - results: list of per-plan results
             - error: str (if success=False)
             - cleanup: dict (TEMP file cleanup results)
+            - stats: dict (scheduler counters)
     """
     try:
         # Get closed plans from registry (includes auto-heal)
@@ -716,107 +793,75 @@ def process_closed_plans() -> Dict[str, Any]:
         error_count = 0
         results = []
 
-        # Process each closed plan sequentially with delay between API calls
-        rate_limited = False
-        for i, plan in enumerate(closed_plans):
-            # Stop processing if we hit a rate limit - try again later
-            if rate_limited:
+        # Stage 1: queue analysis jobs - prompt inputs are hashed so a retry
+        # after a failed archive step doesn't pay for the same analysis twice
+        scheduler = LLMScheduler(
+            "mbank",
+            _analysis_worker,
+            settings=load_config().get("config", {}).get("scheduler_settings", {})
+        )
+        model = get_ai_model() or ""
+        trl_mapping = json.dumps(load_trl_registry().get("trl_mapping", {}), sort_keys=True)
+        analyses: Dict[str, Dict[str, str]] = {}
+
+        for plan in closed_plans:
+            plan_num = plan["number"]
+            try:
+                content = Path(plan["path"]).read_text(encoding='utf-8')
+                key = content_hash(model, trl_mapping, str(plan["path"]), content)
+                hit = scheduler.submit(plan_num, key, {"path": str(plan["path"])})
+                if hit is not None:
+                    analyses[plan_num] = hit
+            except Exception as e:
+                error_count += 1
                 results.append({
-                    "plan": f"FPLAN-{plan.get('number', 'unknown')}",
-                    "status": "skipped",
-                    "error": "Skipped due to API rate limit on previous plan"
+                    "plan": f"FPLAN-{plan_num}",
+                    "status": "error",
+                    "error": str(e)
                 })
-                continue
 
-            # Add delay between API calls (not before the first one)
-            if i > 0:
-                time.sleep(API_DELAY_SECONDS)
+        outcomes = scheduler.run()
 
-            try:
-                plan_path = plan["path"]
-                plan_num = plan["number"]
-
-                # Generate correlation ID for tracking
-                correlation_id = f"FPLAN-{plan_num}-{datetime.now().strftime('%H%M%S')}"
-
-                # Phase 1: Analyze content
-                analysis = analyze_plan_content(plan_path)
-
-                # Phase 2: Create memory entry
-                memory_file = create_memory_entry(plan_path, analysis)
-
-                if memory_file:
-                    # Update registry - memory created
-                    registry = load_flow_registry()
-                    if plan_num in registry.get("plans", {}):
-                        registry["plans"][plan_num]["memory_created"] = True
-                        registry["plans"][plan_num]["memory_created_date"] = datetime.now(timezone.utc).isoformat()
-                        registry["plans"][plan_num]["memory_file"] = str(memory_file)
-                        save_flow_registry(registry)
-
-                    # Phase 3: Archive plan to backup
-                    cleanup_success = archive_plan(plan_path)
-
-                    # Update registry with final status
-                    registry = load_flow_registry()
-                    if plan_num in registry.get("plans", {}):
-                        registry["plans"][plan_num]["cleanup_completed"] = cleanup_success
-                        registry["plans"][plan_num]["cleanup_date"] = datetime.now(timezone.utc).isoformat()
-
-                        # Only mark as fully processed if BOTH phases succeeded
-                        if cleanup_success:
-                            registry["plans"][plan_num]["processed"] = True
-                            registry["plans"][plan_num]["processed_date"] = datetime.now(timezone.utc).isoformat()
-
-                        save_flow_registry(registry)
-
-                    if cleanup_success:
-                        # FULL SUCCESS
-                        processed_count += 1
+        # Stage 2: apply results in registry order
+        for plan in closed_plans:
+            plan_num = plan.get("number", "unknown")
+            analysis = analyses.get(plan_num)
+            outcome = outcomes.get(plan_num)
+
+            if analysis is None:
+                if not outcome:
+                    continue  # Already reported as a read error above
+                if not outcome.get("ok"):
+                    error_count += 1
+                    if outcome.get("rate_limited"):
                         results.append({
                             "plan": f"FPLAN-{plan_num}",
-                            "memory_file": str(memory_file),
-                            "status": "fully_processed",
-                            "correlation_id": correlation_id
+                            "status": "rate_limited",
+                            "error": f"API rate limit hit - queued for next run: {outcome.get('error')}"
                         })
                     else:
-                        # PARTIAL SUCCESS
-                        error_count += 1
                         results.append({
                             "plan": f"FPLAN-{plan_num}",
-                            "memory_file": str(memory_file),
-                            "status": "memory_created_cleanup_failed",
-                            "error": "Memory bank entry created but failed to move plan to backup folder",
-                            "correlation_id": correlation_id
+                            "status": "error",
+                            "error": outcome.get("error")
                         })
-                else:
-                    error_count += 1
-                    results.append({
-                        "plan": f"FPLAN-{plan_num}",
-                        "status": "error",
-                        "error": "Failed to create memory entry",
-                        "correlation_id": correlation_id
-                    })
+                    continue
+                analysis = outcome["result"]
 
+            try:
+                result = _apply_analysis(plan, analysis)
             except Exception as e:
+                result = {
+                    "plan": f"FPLAN-{plan_num}",
+                    "status": "error",
+                    "error": str(e)
+                }
+
+            if result["status"] == "fully_processed":
+                processed_count += 1
+            else:
                 error_count += 1
-                plan_num = plan.get('number', 'unknown')
-                error_str = str(e)
-
-                # Detect rate limit (429) - stop processing remaining plans
-                if "429" in error_str or "rate limit" in error_str.lower() or "too many requests" in error_str.lower():
-                    rate_limited = True
-                    results.append({
-                        "plan": f"FPLAN-{plan_num}",
-                        "status": "rate_limited",
-                        "error": f"API rate limit hit - stopping batch: {error_str}"
-                    })
-                else:
-                    results.append({
-                        "plan": f"FPLAN-{plan_num}",
-                        "status": "error",
-                        "error": error_str
-                    })
+            results.append(result)
 
         # AUTO-HEAL: Clean up old -TEMP files from MEMORY_BANK
         cleanup_result = cleanup_temp_files()
@@ -826,7 +871,8 @@ def process_closed_plans() -> Dict[str, Any]:
             "processed": processed_count,
             "errors": error_count,
             "results": results,
-            "cleanup": cleanup_result
+            "cleanup": cleanup_result,
+            "stats": scheduler.stats
         }
 
     except Exception as e:
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: load_registry.py
 # Date: 2025-11-07
-# Version: 1.1.0
+# Version: 1.2.0
 # Category: flow/handlers/registry
 #
 # CHANGELOG:
+#   - v1.2.0 (2026-10-18): Backed by indexed registry_store (JSON re-imported only when changed)
 #   - v1.1.0 (2025-11-21): Removed Prax logging per 3-tier standard
 #   - v1.0.0 (2025-11-07): Extracted from flow_registry_monitor.py
 # =============================================
@@ -15,10 +16,11 @@
 """
 Load Registry Handler
 
-Loads the Flow PLAN registry from JSON file with error handling.
+Loads the Flow PLAN registry with error handling.
 
 Features:
-- Loads flow_registry.json
+- Reads from the indexed registry store (flow_registry.db)
+- Picks up external edits to flow_registry.json by mtime
 - Returns default structure if file missing
 - Graceful error handling
 - Reusable across Flow modules
@@ -28,7 +30,6 @@
     registry = load_registry()
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Dict, Any
@@ -38,6 +39,8 @@
 FLOW_ROOT = AIPASS_ROOT / "flow"
 sys.path.append(str(AIPASS_ROOT))
 
+from flow.apps.handlers.registry.registry_store import get_store
+
 # =============================================
 # CONFIGURATION
 # =============================================
@@ -60,11 +63,7 @@ def load_registry() -> Dict[str, Any]:
 
     Returns default structure if file doesn't exist or on error.
     """
-    if not REGISTRY_FILE.exists():
-        return {"plans": {}, "next_number": 1}
-
     try:
-        with open(REGISTRY_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return get_store().to_registry()
     except Exception:
         return {"plans": {}, "next_number": 1}
@@ -0,0 +1,467 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: registry_store.py
+# Date: 2026-10-18
+# Version: 1.1.0
+# Category: flow/handlers/registry
+#
+# CHANGELOG:
+#   - v1.1.0 (2026-10-18): Single-row writes mark the JSON snapshot dirty - debounced/at-exit flush instead of a full export per event
+#   - v1.0.0 (2026-10-18): Initial implementation - indexed SQLite registry with counter statistics
+# =============================================
+
+"""
+Registry Store Handler
+
+Indexed backend for the Flow PLAN registry.
+
+The registry used to be a single JSON file parsed and rewritten in full for
+every create/close/list. The store keeps one row per plan in SQLite
+(flow_json/flow_registry.db) with indexes on status and location (the
+owning branch directory); plan number is the primary key. Per-(location,
+status) counts are maintained by SQL triggers, so statistics never scan rows.
+
+flow_registry.json stays the on-disk contract for other readers (dashboards,
+trigger, aggregate_central). Single-row writes only mark the snapshot
+dirty; it is rewritten once per batch by flush() - debounced for long-running
+callers (the watchdog monitor) and at process exit. The store re-imports the
+JSON when something else rewrote it (detected by mtime_ns + size).
+
+Features:
+- Single-row upsert/patch/delete
+- Lookups by number, status, location without loading the registry
+- Statistics served from maintained counters
+- File event application (created/deleted/moved) for the watchdog monitor
+
+Usage:
+    from flow.apps.handlers.registry.registry_store import get_store
+    store = get_store()
+    open_plans = store.plans_by_status("open")
+    stats = store.count_by_status()
+"""
+
+import atexit
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+
+# INFRASTRUCTURE IMPORT PATTERN
+AIPASS_ROOT = Path.home() / "aipass_core"
+FLOW_ROOT = AIPASS_ROOT / "flow"
+sys.path.append(str(AIPASS_ROOT))
+
+# =============================================
+# CONFIGURATION
+# =============================================
+
+MODULE_NAME = "registry_store"
+FLOW_JSON_DIR = FLOW_ROOT / "flow_json"
+REGISTRY_FILE = FLOW_JSON_DIR / "flow_registry.json"
+STORE_FILE = FLOW_JSON_DIR / "flow_registry.db"
+ECOSYSTEM_ROOT = Path("/home/aipass")
+PLAN_NUMBER_PATTERN = re.compile(r'FPLAN-(\d{4})\.md$')
+EXPORT_DEBOUNCE_SECONDS = 2.0  # JSON snapshot rewritten at most this long after the last write
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    number TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    file_path TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_plans_status ON plans(status);
+CREATE INDEX IF NOT EXISTS idx_plans_location ON plans(location);
+CREATE INDEX IF NOT EXISTS idx_plans_file_path ON plans(file_path);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS counters (
+    location TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (location, status)
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_plans_insert AFTER INSERT ON plans BEGIN
+    INSERT INTO counters(location, status, count) VALUES (NEW.location, NEW.status, 1)
+        ON CONFLICT(location, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_plans_delete AFTER DELETE ON plans BEGIN
+    UPDATE counters SET count = count - 1 WHERE location = OLD.location AND status = OLD.status;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_plans_update AFTER UPDATE OF status, location ON plans BEGIN
+    UPDATE counters SET count = count - 1 WHERE location = OLD.location AND status = OLD.status;
+    INSERT INTO counters(location, status, count) VALUES (NEW.location, NEW.status, 1)
+        ON CONFLICT(location, status) DO UPDATE SET count = count + 1;
+END;
+"""
+
+# =============================================
+# STORE
+# =============================================
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _file_signature(path: Path) -> Optional[str]:
+    """(mtime_ns, size) of a file as a string, None if missing"""
+    try:
+        st = path.stat()
+        return f"{st.st_mtime_ns}:{st.st_size}"
+    except OSError:
+        return None
+
+
+class RegistryStore:
+    """SQLite-backed, indexed PLAN registry
+
+    Args:
+        db_path: SQLite database file
+        json_path: flow_registry.json snapshot kept in sync for other readers
+        export_delay: Seconds after a write before the snapshot is flushed
+            automatically (None = only on flush())
+    """
+
+    def __init__(self, db_path: Path = STORE_FILE, json_path: Path = REGISTRY_FILE,
+                 export_delay: Optional[float] = EXPORT_DEBOUNCE_SECONDS):
+        self.db_path = Path(db_path)
+        self.json_path = Path(json_path)
+        self.export_delay = export_delay
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self.exports = 0
+        self._conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self.sync_from_json()
+
+    # ---------- meta ----------
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: Any) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)", (key, str(value)))
+
+    @property
+    def next_number(self) -> int:
+        with self._lock:
+            value = self._get_meta("next_number")
+        return int(value) if value else 1
+
+    def set_next_number(self, value: int) -> None:
+        with self._lock, self._conn:
+            self._set_meta("next_number", int(value))
+        self._mark_dirty()
+
+    # ---------- JSON bridge ----------
+
+    def sync_from_json(self) -> bool:
+        """Re-import flow_registry.json if another process rewrote it
+
+        While writes are waiting for a flush the import does not prune rows
+        missing from the file, so plans added here are not lost.
+
+        Returns:
+            True if rows were re-imported
+        """
+        signature = _file_signature(self.json_path)
+        with self._lock:
+            if signature is None or signature == self._get_meta("json_signature"):
+                return False
+        try:
+            with open(self.json_path, 'r', encoding='utf-8') as f:
+                registry = json.load(f)
+        except Exception:
+            return False
+        with self._lock:
+            self.apply_registry(registry, export=False, prune=not self._dirty)
+            with self._conn:
+                self._set_meta("json_signature", signature)
+        return True
+
+    def _mark_dirty(self) -> None:
+        """Snapshot is behind the store - schedule a debounced flush"""
+        with self._lock:
+            self._dirty = True
+            if self.export_delay is None or self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(self.export_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    @property
+    def dirty(self) -> bool:
+        """True if writes are waiting to be exported to the JSON snapshot"""
+        return self._dirty
+
+    def flush(self) -> bool:
+        """Export the JSON snapshot if writes are pending (once per batch/command)"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return True
+        return self.export_json()
+
+    def export_json(self) -> bool:
+        """Write flow_registry.json from the store (atomic temp + rename)"""
+        try:
+            with self._lock:
+                # Snapshot and clear under the lock - a write racing the file write re-marks dirty
+                registry = self.to_registry()
+                self._dirty = False
+            registry["last_updated"] = _now()
+            self.json_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=str(self.json_path.parent))
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(registry, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.json_path)
+            with self._lock, self._conn:
+                self._set_meta("json_signature", _file_signature(self.json_path))
+            self.exports += 1
+            return True
+        except Exception:
+            self._dirty = True
+            return False
+
+    def to_registry(self) -> Dict[str, Any]:
+        """Full registry dict in the legacy flow_registry.json shape"""
+        with self._lock:
+            rows = self._conn.execute("SELECT number, data FROM plans ORDER BY number").fetchall()
+            last_updated = self._get_meta("last_updated")
+        registry: Dict[str, Any] = {
+            "plans": {row["number"]: json.loads(row["data"]) for row in rows},
+            "next_number": self.next_number
+        }
+        if last_updated:
+            registry["last_updated"] = last_updated
+        return registry
+
+    def apply_registry(self, registry: Dict[str, Any], export: bool = True, prune: bool = True) -> int:
+        """Diff a full registry dict against the store and apply only changed rows
+
+        Lets legacy load/modify/save callers keep working while the store
+        does row-level writes.
+
+        Args:
+            registry: Full registry dict (flow_registry.json shape)
+            export: Export the JSON snapshot right away if anything changed
+            prune: Delete stored plans missing from registry
+
+        Returns:
+            Number of rows inserted, updated or deleted
+        """
+        plans = registry.get("plans", {}) or {}
+        changed = 0
+        with self._lock, self._conn:
+            existing = {row["number"]: row["data"] for row in
+                        self._conn.execute("SELECT number, data FROM plans").fetchall()}
+            for number, info in plans.items():
+                encoded = json.dumps(info, sort_keys=True, ensure_ascii=False)
+                if existing.get(number) != encoded:
+                    self._upsert_row(number, info, encoded)
+                    changed += 1
+            for number in (existing.keys() - plans.keys() if prune else ()):
+                self._conn.execute("DELETE FROM plans WHERE number = ?", (number,))
+                changed += 1
+            if "next_number" in registry and str(registry["next_number"]) != self._get_meta("next_number"):
+                self._set_meta("next_number", int(registry["next_number"]))
+                changed += 1
+            if registry.get("last_updated"):
+                self._set_meta("last_updated", registry["last_updated"])
+        if changed and export:
+            self.export_json()
+        return changed
+
+    # ---------- single-row writes ----------
+
+    def _upsert_row(self, number: str, info: Dict[str, Any], encoded: Optional[str] = None) -> None:
+        self._conn.execute(
+            "INSERT INTO plans(number, status, location, file_path, data) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(number) DO UPDATE SET status = excluded.status, location = excluded.location, "
+            "file_path = excluded.file_path, data = excluded.data",
+            (number, info.get("status", ""), info.get("location", ""), info.get("file_path", ""),
+             encoded or json.dumps(info, sort_keys=True, ensure_ascii=False))
+        )
+
+    def upsert_plan(self, number: str, info: Dict[str, Any]) -> None:
+        """Insert or replace one plan row"""
+        with self._lock, self._conn:
+            self._upsert_row(number, info)
+            if int(number) >= self.next_number:
+                self._set_meta("next_number", int(number) + 1)
+        self._mark_dirty()
+
+    def patch_plan(self, number: str, fields: Dict[str, Any]) -> bool:
+        """Update selected fields of one plan. Returns False if plan unknown."""
+        with self._lock, self._conn:
+            info = self.get_plan(number)
+            if info is None:
+                return False
+            info.update(fields)
+            self._upsert_row(number, info)
+        self._mark_dirty()
+        return True
+
+    def delete_plan(self, number: str) -> bool:
+        """Remove one plan row. Returns False if plan unknown."""
+        with self._lock, self._conn:
+            deleted = self._conn.execute("DELETE FROM plans WHERE number = ?", (number,)).rowcount > 0
+        if deleted:
+            self._mark_dirty()
+        return deleted
+
+    # ---------- indexed reads ----------
+
+    def get_plan(self, number: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM plans WHERE number = ?", (number,)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def _select(self, where: str, params: tuple) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT number, data FROM plans WHERE {where} ORDER BY number", params
+            ).fetchall()
+        return {row["number"]: json.loads(row["data"]) for row in rows}
+
+    def plans_by_status(self, status: str) -> Dict[str, Dict[str, Any]]:
+        return self._select("status = ?", (status,))
+
+    def plans_by_location(self, location: str) -> Dict[str, Dict[str, Any]]:
+        return self._select("location = ?", (location,))
+
+    def plans_location_contains(self, fragment: str) -> Dict[str, Dict[str, Any]]:
+        """Plans whose location contains fragment (case-insensitive)"""
+        escaped = fragment.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self._select("location LIKE ? ESCAPE '\\'", (f"%{escaped}%",))
+
+    def plan_by_file(self, file_path: str) -> Optional[str]:
+        """Plan number registered at file_path, if any"""
+        with self._lock:
+            row = self._conn.execute("SELECT number FROM plans WHERE file_path = ?", (file_path,)).fetchone()
+        return row["number"] if row else None
+
+    def file_paths(self) -> Dict[str, str]:
+        """number -> file_path for every plan (no JSON decoding)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT number, file_path FROM plans").fetchall()
+        return {row["number"]: row["file_path"] for row in rows}
+
+    def count_by_status(self, location: Optional[str] = None) -> Dict[str, int]:
+        """Maintained counters: {status: count}, optionally for one location"""
+        with self._lock:
+            if location is None:
+                rows = self._conn.execute(
+                    "SELECT status, SUM(count) AS n FROM counters GROUP BY status").fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT status, count AS n FROM counters WHERE location = ?", (location,)).fetchall()
+        return {row["status"]: int(row["n"]) for row in rows if row["n"]}
+
+    # ---------- file events ----------
+
+    def apply_file_event(self, event: str, path: str, dest_path: Optional[str] = None) -> Optional[str]:
+        """Apply one watchdog/scan event as a single-row update
+
+        Mirrors trigger's plan_file handlers:
+        - created: add open plan (closed plans only get their location refreshed)
+        - deleted: closed/processed plans are marked archived, open plans removed
+        - moved: location fields updated, all other metadata preserved
+          (unknown plans are registered as created)
+
+        Returns:
+            Plan number touched, or None if nothing changed
+        """
+        target = Path(dest_path if event == "moved" else path)
+        match = PLAN_NUMBER_PATTERN.search(target.name)
+        if not match:
+            return None
+        number = match.group(1)
+        existing = self.get_plan(number)
+        now = _now()
+
+        def _location_fields(file_path: Path) -> Dict[str, Any]:
+            try:
+                relative = str(file_path.parent.relative_to(ECOSYSTEM_ROOT))
+            except ValueError:
+                relative = str(file_path.parent)
+            return {"location": str(file_path.parent), "relative_path": relative,
+                    "file_path": str(file_path), "last_updated": now}
+
+        if event == "created":
+            if existing is None:
+                info = {"created": now, "subject": "Auto-detected PLAN", "status": "open"}
+                info.update(_location_fields(target))
+                self.upsert_plan(number, info)
+                return number
+            if existing.get("status") == "closed":
+                self.patch_plan(number, _location_fields(target))
+                return number
+            return None
+
+        if event == "deleted":
+            if existing is None:
+                return None
+            if existing.get("status") == "closed" or existing.get("processed"):
+                self.patch_plan(number, {"archived": True, "archived_date": now, "last_updated": now})
+            else:
+                self.delete_plan(number)
+            return number
+
+        if event == "moved":
+            if existing is None:
+                # Moved in from an unwatched location - register it
+                return self.apply_file_event("created", str(target))
+            self.patch_plan(number, _location_fields(target))
+            return number
+
+        return None
+
+    def close(self) -> None:
+        """Flush pending writes to the JSON snapshot, then close the database"""
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+# =============================================
+# PROCESS-WIDE INSTANCE
+# =============================================
+
+_store: Optional[RegistryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> RegistryStore:
+    """Return the process-wide store, re-syncing if the JSON changed underneath"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = RegistryStore()
+            atexit.register(_store.flush)
+        else:
+            _store.sync_from_json()
+        return _store
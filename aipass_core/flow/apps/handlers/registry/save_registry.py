@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: save_registry.py
 # Date: 2025-11-07
-# Version: 1.1.0
+# Version: 1.2.0
 # Category: flow/handlers/registry
 #
 # CHANGELOG:
+#   - v1.2.0 (2026-10-18): Row-level diff into registry_store, JSON snapshot exported atomically
 #   - v1.1.0 (2025-11-21): Removed Prax logging per 3-tier standard
 #   - v1.0.0 (2025-11-07): Extracted from flow_registry_monitor.py
 # =============================================
@@ -15,10 +16,11 @@
 """
 Save Registry Handler
 
-Saves the Flow PLAN registry to JSON file with automatic timestamp updates.
+Saves the Flow PLAN registry with automatic timestamp updates.
 
 Features:
-- Saves flow_registry.json
+- Writes only changed plan rows to the indexed store (flow_registry.db)
+- Exports flow_registry.json atomically for other readers
 - Auto-updates last_updated timestamp
 - Creates directory if missing
 - Graceful error handling
@@ -30,7 +32,6 @@
     save_registry(registry)
 """
 
-import json
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
@@ -41,6 +42,8 @@
 FLOW_ROOT = AIPASS_ROOT / "flow"
 sys.path.append(str(AIPASS_ROOT))
 
+from flow.apps.handlers.registry.registry_store import get_store
+
 # =============================================
 # CONFIGURATION
 # =============================================
@@ -63,13 +66,13 @@ def save_registry(registry: Dict[str, Any]) -> bool:
         True if save successful, False on error
 
     Automatically updates the last_updated timestamp before saving.
-    Creates the flow_json directory if it doesn't exist.
+    Only plans whose content changed are rewritten in the store.
     """
     try:
-        FLOW_JSON_DIR.mkdir(parents=True, exist_ok=True)
         registry["last_updated"] = datetime.now(timezone.utc).isoformat()
-        with open(REGISTRY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(registry, f, indent=2, ensure_ascii=False)
+        store = get_store()
+        if store.apply_registry(registry, export=False) or not REGISTRY_FILE.exists():
+            return store.export_json()
         return True
     except Exception:
         return False
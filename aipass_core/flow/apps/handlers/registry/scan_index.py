@@ -0,0 +1,171 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: scan_index.py
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: flow/handlers/registry
+#
+# CHANGELOG:
+#   - v1.0.0 (2026-10-18): Initial implementation - mtime-cached incremental PLAN file scan
+# =============================================
+
+"""
+Scan Index Handler
+
+Incremental discovery of FPLAN-*.md files for the registry heal scan.
+
+A directory's mtime changes whenever an entry is added, removed or renamed
+directly inside it. The index remembers, per directory, its mtime_ns, its
+(non-ignored) subdirectories and the PLAN files it held. On the next scan a
+directory is only stat()ed; it is re-listed only when its mtime changed.
+Unchanged subtrees are still descended (a nested change does not bubble up),
+but each visit costs one stat instead of a full listing.
+
+Pruning keeps the monitor's substring semantics (a directory is skipped if
+any ignore entry is a substring of its name), with decisions memoized per name.
+
+Usage:
+    from flow.apps.handlers.registry.scan_index import ScanIndex
+    index = ScanIndex(cache_file, ignore_folders)
+    result = index.scan(Path("/home/aipass"))
+    index.save()
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List, Iterable
+
+# INFRASTRUCTURE IMPORT PATTERN
+AIPASS_ROOT = Path.home() / "aipass_core"
+FLOW_ROOT = AIPASS_ROOT / "flow"
+sys.path.append(str(AIPASS_ROOT))
+
+# =============================================
+# CONFIGURATION
+# =============================================
+
+MODULE_NAME = "scan_index"
+FLOW_JSON_DIR = FLOW_ROOT / "flow_json"
+SCAN_CACHE_FILE = FLOW_JSON_DIR / "registry_scan_cache.json"
+PLAN_PATTERN = re.compile(r'^FPLAN-\d{4}\.md$')
+CACHE_VERSION = 1
+
+# =============================================
+# HANDLER CLASS
+# =============================================
+
+class ScanIndex:
+    """Directory mtime cache for incremental PLAN file scans
+
+    Args:
+        cache_file: JSON file persisting the directory index between runs
+        ignore_folders: Names pruned from the walk (substring match)
+    """
+
+    def __init__(self, cache_file: Path = SCAN_CACHE_FILE, ignore_folders: Iterable[str] = ()):
+        self.cache_file = Path(cache_file)
+        self.ignore_folders = tuple(ignore_folders)
+        self._ignored: Dict[str, bool] = {}
+        self._dirs: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            return
+        if data.get("version") == CACHE_VERSION and data.get("ignore") == sorted(self.ignore_folders):
+            self._dirs = data.get("dirs", {})
+
+    def save(self) -> bool:
+        """Persist the index (atomic temp + rename)"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"version": CACHE_VERSION, "ignore": sorted(self.ignore_folders), "dirs": self._dirs}
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=str(self.cache_file.parent))
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_file)
+            return True
+        except Exception:
+            return False
+
+    def _is_ignored(self, name: str) -> bool:
+        decision = self._ignored.get(name)
+        if decision is None:
+            decision = any(ignored in name for ignored in self.ignore_folders)
+            self._ignored[name] = decision
+        return decision
+
+    def _list_dir(self, path: str, errors: List[str]) -> Dict[str, List[str]]:
+        subdirs: List[str] = []
+        plans: List[str] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not self._is_ignored(entry.name):
+                                subdirs.append(entry.name)
+                        elif PLAN_PATTERN.match(entry.name):
+                            plans.append(entry.name)
+                    except OSError:
+                        continue
+        except PermissionError:
+            pass
+        except OSError as e:
+            errors.append(f"{path}: {e}")
+        subdirs.sort()
+        plans.sort()
+        return {"subdirs": subdirs, "plans": plans}
+
+    def scan(self, root: Path) -> Dict[str, Any]:
+        """Walk root, re-listing only directories whose mtime changed
+
+        Returns:
+            Dict containing:
+            - plan_files: List of PLAN file paths in walk order
+            - dirs_visited: Directories stat()ed
+            - dirs_listed: Directories whose contents were re-read
+            - errors: Non-permission errors encountered
+        """
+        seen: Dict[str, Dict[str, Any]] = {}
+        plan_files: List[Path] = []
+        errors: List[str] = []
+        listed = 0
+        stack = [str(root)]
+
+        while stack:
+            path = stack.pop()
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+
+            cached = self._dirs.get(path)
+            if cached is None or cached.get("mtime_ns") != mtime_ns:
+                cached = self._list_dir(path, errors)
+                cached["mtime_ns"] = mtime_ns
+                listed += 1
+            seen[path] = cached
+
+            plan_files.extend(Path(path) / name for name in cached["plans"])
+            # Reverse so the stack pops subdirectories in sorted order
+            stack.extend(os.path.join(path, name) for name in reversed(cached["subdirs"]))
+
+        # Directories no longer reachable drop out of the index
+        self._dirs = seen
+
+        return {
+            "plan_files": plan_files,
+            "dirs_visited": len(seen),
+            "dirs_listed": listed,
+            "errors": errors
+        }
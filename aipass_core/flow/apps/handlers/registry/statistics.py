@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: statistics.py
 # Date: 2025-11-07
-# Version: 1.0.0
+# Version: 1.1.1
 # Category: flow/handlers/registry
 #
 # CHANGELOG:
+#   - v1.1.1 (2026-10-18): registry_store import moved to module level
+#   - v1.1.0 (2026-10-18): Added get_store_statistics() served from maintained counters
 #   - v1.0.0 (2025-11-07): Extracted from flow_registry_monitor.py
 # =============================================
 
@@ -20,6 +22,7 @@
 - Counts total plans
 - Counts plans by status (open, closed, etc.)
 - Provides timestamp metadata
+- get_store_statistics() reads counters without loading plans
 - Reusable across Flow modules
 
 Usage:
@@ -34,12 +37,14 @@
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # INFRASTRUCTURE IMPORT PATTERN
 AIPASS_ROOT = Path.home() / "aipass_core"
 sys.path.append(str(AIPASS_ROOT))
 
+from flow.apps.handlers.registry.registry_store import get_store
+
 # =============================================
 # HANDLER FUNCTION
 # =============================================
@@ -72,3 +77,23 @@ def get_registry_statistics(registry: Dict[str, Any]) -> Dict[str, Any]:
         "other_plans": other_count,
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
+
+
+def get_store_statistics(location: Optional[str] = None) -> Dict[str, Any]:
+    """Registry statistics from the store's maintained counters
+
+    Same shape as get_registry_statistics() but O(statuses) instead of
+    O(plans). Optionally restricted to one location (branch directory).
+    """
+    counts = get_store().count_by_status(location)
+    total = sum(counts.values())
+    open_count = counts.get("open", 0)
+    closed_count = counts.get("closed", 0)
+
+    return {
+        "total_plans": total,
+        "open_plans": open_count,
+        "closed_plans": closed_count,
+        "other_plans": total - open_count - closed_count,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
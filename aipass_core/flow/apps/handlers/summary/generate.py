@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: generate.py - Plan Summary Generation Handler
 # Date: 2025-11-21
-# Version: 1.2.0
+# Version: 1.3.0
 # Category: flow/handlers/summary
 #
 # CHANGELOG:
+#   - v1.3.0 (2026-10-18): Concurrent generation via shared LLM scheduler - rate limited, resumable, content-hash cached
 #   - v1.2.0 (2026-02-14): Fix content extraction to handle all template types (master, proposal, default)
 #   - v1.1.0 (2026-02-14): Sequential processing with backoff - delay between API calls, stop on rate limit
 #   - v1.0.0 (2025-11-21): Extracted from archive_temp/flow_plan_summarizer.py
@@ -30,7 +31,6 @@
 from pathlib import Path
 import sys
 import json
-import time
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
@@ -44,6 +44,13 @@
 except ImportError:
     API_AVAILABLE = False
 
+from flow.apps.handlers.llm.scheduler import (
+    LLMScheduler,
+    RateLimitError,
+    content_hash,
+    is_rate_limit_error
+)
+
 # =============================================
 # CONSTANTS
 # =============================================
@@ -52,10 +59,12 @@
 FLOW_JSON_DIR = FLOW_ROOT / "flow_json"
 REGISTRY_FILE = FLOW_JSON_DIR / "flow_registry.json"
 SUMMARIES_FILE = FLOW_JSON_DIR / "plan_summaries.json"
-API_DELAY_SECONDS = 3  # Delay between sequential API calls to avoid rate limits
 CONFIG_FILE = FLOW_JSON_DIR / "flow_plan_summarizer_config.json"
 SHARED_API_CONFIG = FLOW_ROOT / "apps" / "handlers" / "json_templates" / "custom" / "api_config.json"
 
+# Error prefixes of failed summaries (never cached, retried next run)
+SUMMARY_ERROR_MARKERS = ["ERROR:", "CONNECTION ERROR", "RESPONSE ERROR", "INVALID KEY", "API NOT AVAILABLE"]
+
 # Template detection markers (matches flow_plan.py auto-delete logic)
 # Covers default, master, and proposal template placeholders
 TEMPLATE_INDICATORS = [
@@ -124,6 +133,11 @@ def load_config() -> Dict[str, Any]:
             },
             "summary_settings": {
                 "hide_empty_plans": True
+            },
+            "scheduler_settings": {
+                "max_workers": 4,
+                "requests_per_minute": 20,
+                "burst": 3
             }
         }
     }
@@ -515,6 +529,37 @@ def needs_summary_update(plan_info: Dict, cached_summary: Optional[Dict]) -> boo
 
     return False
 
+# =============================================
+# SCHEDULER WORKER
+# =============================================
+
+def _summary_worker(payload: Dict[str, Any]) -> str:
+    """
+    Scheduler worker: one AI summary call.
+
+    Converts generate_ai_summary()'s error strings into exceptions so the
+    scheduler retries rate limits and never caches failures.
+    """
+    summary = generate_ai_summary(payload["content"], payload["plan_num"])
+    if any(error in summary for error in SUMMARY_ERROR_MARKERS):
+        if is_rate_limit_error(summary):
+            raise RateLimitError(summary)
+        raise Exception(summary)
+    return summary
+
+
+def _summary_record(plan_info: Dict, summary: str) -> Dict[str, Any]:
+    """Build the cached summary record for a plan"""
+    return {
+        "summary": summary,
+        "status": plan_info.get("status", "unknown"),
+        "location": plan_info.get("relative_path", "unknown"),
+        "subject": plan_info.get("subject", ""),
+        "file_path": plan_info.get("file_path", ""),
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "is_empty": "Empty plan" in summary or "Inactive" in summary
+    }
+
 # =============================================
 # MAIN ENTRY POINT
 # =============================================
@@ -523,6 +568,12 @@ def generate_summaries() -> Dict[str, Any]:
     """
     Main entry point: Generate summaries for all plans.
 
+    Plans whose file or registry entry changed are queued on the shared LLM
+    scheduler. Extracted content is hashed with the model name, so a plan
+    that was touched but not meaningfully edited reuses its cached summary
+    without an API call. Remaining jobs run concurrently under the
+    scheduler's rate limit; rate-limited jobs stay queued for the next run.
+
     Returns:
         Status dict with format:
         {
@@ -537,7 +588,8 @@ def generate_summaries() -> Dict[str, Any]:
                     'generated_at': str (ISO 8601),
                     'is_empty': bool
                 }
-            }
+            },
+            'stats': {submitted, cache_hits, api_calls, rate_limited, failed, resumed}
         }
 
         OR on error:
@@ -551,8 +603,15 @@ def generate_summaries() -> Dict[str, Any]:
         cached_summaries = load_summaries()
         updated_summaries = {}
 
-        api_call_count = 0
-        rate_limited = False
+        config = load_config()
+        scheduler = LLMScheduler(
+            "summary",
+            _summary_worker,
+            settings=config.get("config", {}).get("scheduler_settings", {})
+        )
+        model = load_shared_api_config() or ""
+        pending: Dict[str, Dict] = {}
+
         for plan_num, plan_info in registry.get("plans", {}).items():
             try:
                 # Check if summary needs update
@@ -561,24 +620,13 @@ def generate_summaries() -> Dict[str, Any]:
                     # Use cached summary but ensure file_path is current from registry
                     if cached is None:
                         # Defensive: if cache unexpectedly missing, initialize minimal record
-                        cached = {
-                            "summary": "",
-                            "status": plan_info.get("status", "unknown"),
-                            "location": plan_info.get("relative_path", "unknown"),
-                            "subject": plan_info.get("subject", ""),
-                            "file_path": plan_info.get("file_path", ""),
-                            "generated_at": datetime.now(timezone.utc).isoformat(),
-                            "is_empty": False
-                        }
+                        cached = _summary_record(plan_info, "")
+                        cached["is_empty"] = False
                     else:
                         cached['file_path'] = plan_info.get("file_path", "")
                     updated_summaries[plan_num] = cached
                     continue
 
-                # Stop processing if we hit a rate limit - try again later
-                if rate_limited:
-                    continue
-
                 # Read plan file
                 plan_path = Path(plan_info["file_path"])
                 if not plan_path.exists():
@@ -590,53 +638,41 @@ def generate_summaries() -> Dict[str, Any]:
 
                 # Check if this is an empty template BEFORE calling AI (save API calls)
                 if is_template_file(plan_path):
-                    # Skip AI call for empty templates - use fixed summary
-                    summary = "Empty plan template - no content added"
-                else:
-                    # Add delay between API calls (not before the first one)
-                    if api_call_count > 0:
-                        time.sleep(API_DELAY_SECONDS)
-
-                    # Extract content
-                    content = extract_content_from_plan(plan_path)
-
-                    # Generate summary with AI
-                    summary = generate_ai_summary(content, plan_num)
-                    api_call_count += 1
-
-                # Check if summary generation failed
-                if any(error in summary for error in ["ERROR:", "CONNECTION ERROR", "RESPONSE ERROR", "INVALID KEY", "API NOT AVAILABLE"]):
-                    # Detect rate limit - stop processing remaining plans
-                    if "429" in summary or "rate limit" in summary.lower():
-                        rate_limited = True
-                    # Don't cache failed summaries - let them retry next time
+                    updated_summaries[plan_num] = _summary_record(plan_info, "Empty plan template - no content added")
                     continue
 
-                # Store successful summary with metadata
-                updated_summaries[plan_num] = {
-                    "summary": summary,
-                    "status": plan_info.get("status", "unknown"),
-                    "location": plan_info.get("relative_path", "unknown"),
-                    "subject": plan_info.get("subject", ""),
-                    "file_path": plan_info.get("file_path", ""),
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
-                    "is_empty": "Empty plan" in summary or "Inactive" in summary
-                }
+                content = extract_content_from_plan(plan_path)
+                if "Empty plan template" in content:
+                    updated_summaries[plan_num] = _summary_record(plan_info, generate_ai_summary(content, plan_num))
+                    continue
 
-            except Exception as e:
-                # Detect rate limit in exceptions - stop processing
-                error_str = str(e)
-                if "429" in error_str or "rate limit" in error_str.lower():
-                    rate_limited = True
+                # Same content + same model = same summary, no API call
+                hit = scheduler.submit(plan_num, content_hash(model, content),
+                                       {"plan_num": plan_num, "content": content})
+                if hit is not None:
+                    updated_summaries[plan_num] = _summary_record(plan_info, hit)
+                else:
+                    pending[plan_num] = plan_info
+
+            except Exception:
                 # Skip individual plan failures, continue with others
                 continue
 
+        # Concurrent, rate-limited generation of everything still missing
+        results = scheduler.run()
+        for plan_num, plan_info in pending.items():
+            outcome = results.get(plan_num)
+            # Failed summaries aren't cached - they retry next time
+            if outcome and outcome.get("ok"):
+                updated_summaries[plan_num] = _summary_record(plan_info, outcome["result"])
+
         # Save updated summaries
         save_summaries(updated_summaries)
 
         return {
             'success': True,
-            'data': updated_summaries
+            'data': updated_summaries,
+            'stats': scheduler.stats
         }
 
     except Exception as e:
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: list_plans.py - PLAN listing module with filtering
 # Date: 2025-11-21
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: flow/modules
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Indexed status lookup and counter statistics from registry_store
 #   - v1.0.0 (2025-11-21): Initial implementation, handler-based architecture
 #
 # CODE STANDARDS:
@@ -22,8 +23,8 @@
 
 Workflow:
     1. Parse arguments → command_parser handler
-    2. Load registry → registry handlers
-    3. Get statistics → registry handlers
+    2. Get statistics → registry counters
+    3. Fetch plans by status → registry index
     4. Filter plans by status
     5. Format and display results
 
@@ -58,8 +59,8 @@
 from cli.apps.modules import console
 
 # Registry handlers
-from flow.apps.handlers.registry.load_registry import load_registry
-from flow.apps.handlers.registry.statistics import get_registry_statistics
+from flow.apps.handlers.registry.registry_store import get_store
+from flow.apps.handlers.registry.statistics import get_store_statistics
 
 # Plan display handler
 from flow.apps.handlers.plan.display import (
@@ -89,7 +90,7 @@ def print_introspection():
 
     # List handlers this module actually imports/uses
     console.print("  [cyan]handlers/registry/[/cyan]")
-    console.print("    [dim]- load_registry.py[/dim]")
+    console.print("    [dim]- registry_store.py[/dim]")
     console.print("    [dim]- statistics.py[/dim]")
     console.print()
     console.print("  [cyan]handlers/plan/[/cyan]")
@@ -140,8 +141,8 @@ def list_plans(filter_type: str = "open") -> bool:
     Orchestrate plan listing workflow (thin orchestrator)
 
     Delegates all business logic to handlers:
-    - Registry loading: load_registry handler
-    - Statistics: get_registry_statistics handler
+    - Registry lookup: registry_store handler (status index)
+    - Statistics: get_store_statistics handler (maintained counters)
     - Display: format functions above
 
     Args:
@@ -151,33 +152,35 @@ def list_plans(filter_type: str = "open") -> bool:
         True if successful, False otherwise
     """
     try:
-        # STEP 1: Load registry (handler)
-        registry = load_registry()
+        # STEP 1: Get statistics from counters (handler)
+        stats = get_store_statistics()
 
-        # STEP 2: Get plans
-        plans = registry.get("plans", {})
-
-        if not plans:
+        if not stats["total_plans"]:
             console.print("[yellow]No plans found in registry[/yellow]")
             logger.info(f"[{MODULE_NAME}] No plans in registry")
             return True  # Not an error, just empty
 
-        # STEP 3: Determine filter
+        # STEP 2: Determine filter and fetch only matching plans (status index)
+        store = get_store()
         if filter_type == "all":
             filter_status = None
+            plans = store.to_registry()["plans"]
         else:
             filter_status = filter_type  # "open" or "closed"
+            plans = store.plans_by_status(filter_status)
 
-        # STEP 4: Format and display plans
-        formatted_list = format_plans_list(plans, filter_status)
+        # STEP 3: Format and display plans
+        if plans:
+            formatted_list = format_plans_list(plans, filter_status)
+        else:
+            formatted_list = f"[dim]No {filter_status} plans found[/dim]"
         console.print(formatted_list)
 
-        # STEP 5: Get and display statistics
-        stats = get_registry_statistics(registry)
+        # STEP 4: Display statistics
         summary = format_statistics_summary(stats)
         console.print(summary)
 
-        # STEP 6: Log success
+        # STEP 5: Log success
         logger.info(f"[{MODULE_NAME}] Listed plans (filter: {filter_type})")
 
         return True
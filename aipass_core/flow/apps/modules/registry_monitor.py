@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: registry_monitor.py - Registry auto-healing and file watching module
 # Date: 2025-11-21
-# Version: 2.0.0
+# Version: 2.1.1
 # Category: flow/modules
 #
 # CHANGELOG (Max 5 entries):
+#   - v2.1.1 (2026-10-18): Heal scan flushes the registry JSON snapshot once per scan
+#   - v2.1.0 (2026-10-18): Single-row registry_store updates per event, mtime-incremental heal scan
 #   - v2.0.0 (2026-01-20): Migrated to Trigger event system - fires events, doesn't handle
 #   - v1.0.0 (2025-11-21): Initial port from archive_temp with Python watchdog integration
 #
@@ -28,6 +30,10 @@
 - Trigger handlers in trigger/apps/handlers/events/plan_file.py update the registry
 - Decoupled: Flow fires events, Trigger handles reactions
 
+Registry (v2.1):
+- Each event is also applied to the indexed registry_store as a single-row update
+- Heal scan uses ScanIndex: only directories whose mtime changed are re-listed
+
 Features:
 - Real-time file watching via Python watchdog
 - Auto-detect file create/move/delete events
@@ -49,7 +55,6 @@
 
 import sys
 import re
-import os
 import time
 import threading
 from pathlib import Path
@@ -74,8 +79,9 @@
 from cli.apps.modules import console
 
 # Registry handlers
-from flow.apps.handlers.registry.load_registry import load_registry
-from flow.apps.handlers.registry.save_registry import save_registry
+from flow.apps.handlers.registry.registry_store import get_store
+from flow.apps.handlers.registry.scan_index import ScanIndex
+from flow.apps.handlers.registry.statistics import get_store_statistics
 
 # =============================================
 # CONFIGURATION
@@ -198,7 +204,8 @@ def _schedule_fire_moved(self, src_path: Path, dest_path: Path):
         timer.start()
 
     def _fire_plan_file_created(self, file_path: Path):
-        """Fire plan_file_created event - Trigger handles registry update"""
+        """Apply plan_file_created to the registry store, then fire trigger event"""
+        _apply_to_store('created', str(file_path))
         try:
             from trigger.apps.modules.core import trigger
             trigger.fire('plan_file_created', path=str(file_path))
@@ -206,7 +213,8 @@ def _fire_plan_file_created(self, file_path: Path):
             logger.warning(f"[{MODULE_NAME}] Trigger not available - plan_file_created event not fired for {file_path.name}")
 
     def _fire_plan_file_deleted(self, file_path: Path):
-        """Fire plan_file_deleted event - Trigger handles registry update"""
+        """Apply plan_file_deleted to the registry store, then fire trigger event"""
+        _apply_to_store('deleted', str(file_path))
         try:
             from trigger.apps.modules.core import trigger
             trigger.fire('plan_file_deleted', path=str(file_path))
@@ -214,7 +222,8 @@ def _fire_plan_file_deleted(self, file_path: Path):
             logger.warning(f"[{MODULE_NAME}] Trigger not available - plan_file_deleted event not fired for {file_path.name}")
 
     def _fire_plan_file_moved(self, src_path: Path, dest_path: Path):
-        """Fire plan_file_moved event - Trigger handles registry update"""
+        """Apply plan_file_moved to the registry store, then fire trigger event"""
+        _apply_to_store('moved', str(src_path), str(dest_path))
         try:
             from trigger.apps.modules.core import trigger
             trigger.fire('plan_file_moved', src_path=str(src_path), dest_path=str(dest_path))
@@ -226,6 +235,15 @@ def _fire_plan_file_moved(self, src_path: Path, dest_path: Path):
 # SCAN AND HEAL FUNCTION
 # =============================================
 
+def _apply_to_store(event: str, path: str, dest_path: Optional[str] = None) -> Optional[str]:
+    """Apply a file event to the registry store as a single-row update"""
+    try:
+        return get_store().apply_file_event(event, path, dest_path)
+    except Exception as e:
+        logger.error(f"[{MODULE_NAME}] Registry store update failed ({event} {path}): {e}")
+        return None
+
+
 def _fire_event(event_name: str, **kwargs) -> bool:
     """
     Fire a trigger event (internal helper)
@@ -256,10 +274,10 @@ def scan_plan_files() -> Dict[str, Any]:
     - Location mismatches (plan_file_moved)
     - Duplicate plan numbers are auto-renumbered on filesystem, then fire plan_file_created
 
-    Architecture (v2.0):
-    - This function DETECTS changes and FIRES events
-    - Trigger handlers in plan_file.py HANDLE the registry updates
-    - Flow never touches registry directly during scan
+    Architecture (v2.1):
+    - ScanIndex re-lists only directories whose mtime changed since the last scan
+    - Differences are applied to registry_store as single-row updates
+    - Events are still fired so Trigger handlers can react
 
     Returns:
         Dict with scan results and event stats
@@ -270,32 +288,24 @@ def scan_plan_files() -> Dict[str, Any]:
     plan_files: Dict[str, Path] = {}
     duplicates: Dict[str, List[Path]] = {}
 
-    def handle_walk_error(error):
-        """Handle permission errors during os.walk"""
-        if not isinstance(error, PermissionError):
-            logger.warning(f"[{MODULE_NAME}] Error during scan: {error}")
-
-    # Use os.walk() with error handling
-    for root, dirs, files in os.walk(str(ECOSYSTEM_ROOT), topdown=True, onerror=handle_walk_error):
-        # Skip ignored directories (modify dirs in-place to prevent descent)
-        dirs[:] = [d for d in dirs if not any(ignored in d for ignored in IGNORE_FOLDERS)]
-
-        # Check for PLAN files in this directory
-        for filename in files:
-            if PLAN_PATTERN.match(filename):
-                file_path = Path(root) / filename
-                match = re.search(r'FPLAN-(\d{4})\.md$', filename)
-                if match:
-                    plan_number = match.group(1)
-
-                    # Duplicate detection
-                    if plan_number in plan_files:
-                        if plan_number not in duplicates:
-                            duplicates[plan_number] = [plan_files[plan_number]]
-                        duplicates[plan_number].append(file_path)
-                        logger.warning(f"[{MODULE_NAME}] Duplicate FPLAN-{plan_number} found: {file_path}")
-                    else:
-                        plan_files[plan_number] = file_path
+    index = ScanIndex(ignore_folders=IGNORE_FOLDERS)
+    walk = index.scan(ECOSYSTEM_ROOT)
+    for error in walk["errors"]:
+        logger.warning(f"[{MODULE_NAME}] Error during scan: {error}")
+
+    for file_path in walk["plan_files"]:
+        match = re.search(r'FPLAN-(\d{4})\.md$', file_path.name)
+        if match:
+            plan_number = match.group(1)
+
+            # Duplicate detection
+            if plan_number in plan_files:
+                if plan_number not in duplicates:
+                    duplicates[plan_number] = [plan_files[plan_number]]
+                duplicates[plan_number].append(file_path)
+                logger.warning(f"[{MODULE_NAME}] Duplicate FPLAN-{plan_number} found: {file_path}")
+            else:
+                plan_files[plan_number] = file_path
 
     # Auto-renumber duplicates (keep first, renumber rest)
     renumbered: List[Dict[str, str]] = []
@@ -331,47 +341,54 @@ def handle_walk_error(error):
                 except Exception as e:
                     logger.error(f"[{MODULE_NAME}] Failed to renumber {old_name}: {e}")
 
-    # Load current registry to compare (read-only - we don't modify it here)
-    registry = load_registry()
-    plans = registry.get("plans", {})
+    # Renames changed directory mtimes - persist the index after renumbering
+    index.save()
+
+    # Compare against indexed file paths (no plan bodies decoded)
+    store = get_store()
+    known_paths = store.file_paths()
+    archived = {number for number, info in store.plans_by_status("closed").items() if info.get("archived")}
 
     # Track events fired
     added: List[str] = []
     updated: List[str] = []
     removed: List[str] = []
 
-    # Fire events for missing files (not in registry)
+    # Missing files (not in registry)
     for plan_number, file_path in plan_files.items():
-        if plan_number not in plans:
-            # File exists but not in registry - fire created event
-            if _fire_event('plan_file_created', path=str(file_path)):
-                added.append(plan_number)
-                logger.info(f"[{MODULE_NAME}] Fired plan_file_created for FPLAN-{plan_number}")
+        if plan_number not in known_paths:
+            # File exists but not in registry - created
+            _apply_to_store('created', str(file_path))
+            _fire_event('plan_file_created', path=str(file_path))
+            added.append(plan_number)
+            logger.info(f"[{MODULE_NAME}] Registered FPLAN-{plan_number}")
         else:
             # Check if location changed (file moved)
-            current_path = plans[plan_number].get("file_path", "")
+            current_path = known_paths[plan_number]
             if current_path != str(file_path):
-                # Fire moved event
-                if _fire_event('plan_file_moved', src_path=current_path, dest_path=str(file_path)):
-                    updated.append(plan_number)
-                    logger.info(f"[{MODULE_NAME}] Fired plan_file_moved for FPLAN-{plan_number}")
-
-    # Fire events for orphaned registry entries (in registry but file doesn't exist)
-    for plan_number in list(plans.keys()):
-        if plan_number not in plan_files:
-            # Registry entry but no file - fire deleted event
-            file_path = plans[plan_number].get("file_path", f"FPLAN-{plan_number}.md")
-            if _fire_event('plan_file_deleted', path=file_path):
-                removed.append(plan_number)
-                logger.info(f"[{MODULE_NAME}] Fired plan_file_deleted for FPLAN-{plan_number}")
+                _apply_to_store('moved', current_path, str(file_path))
+                _fire_event('plan_file_moved', src_path=current_path, dest_path=str(file_path))
+                updated.append(plan_number)
+                logger.info(f"[{MODULE_NAME}] Relocated FPLAN-{plan_number}")
+
+    # Orphaned registry entries (in registry but file doesn't exist)
+    for plan_number, current_path in known_paths.items():
+        if plan_number not in plan_files and plan_number not in archived:
+            file_path = current_path or f"FPLAN-{plan_number}.md"
+            _apply_to_store('deleted', file_path)
+            _fire_event('plan_file_deleted', path=file_path)
+            removed.append(plan_number)
+            logger.info(f"[{MODULE_NAME}] Orphaned FPLAN-{plan_number} resolved")
+
+    # One JSON snapshot export for the whole scan
+    store.flush()
 
     # Log event results
     if added or updated or removed or renumbered:
+        logger.info(f"[{MODULE_NAME}] Scan listed {walk['dirs_listed']}/{walk['dirs_visited']} directories")
         logger.info(f"[{MODULE_NAME}] Events fired - Created: {len(added)}, Moved: {len(updated)}, Deleted: {len(removed)}, Renumbered: {len(renumbered)}")
 
-    # Reload registry to get updated count (after handlers processed events)
-    registry = load_registry()
-    total_plans = len(registry.get("plans", {}))
+    total_plans = get_store_statistics()["total_plans"]
 
     logger.info(f"[{MODULE_NAME}] Scan complete - {total_plans} PLAN files in registry")
 
@@ -381,7 +398,9 @@ def handle_walk_error(error):
         "updated": updated,
         "removed": removed,
         "renumbered": renumbered,
-        "healing_performed": len(added) + len(updated) + len(removed) + len(renumbered) > 0
+        "healing_performed": len(added) + len(updated) + len(removed) + len(renumbered) > 0,
+        "dirs_visited": walk["dirs_visited"],
+        "dirs_listed": walk["dirs_listed"]
     }
 
 
@@ -436,20 +455,18 @@ def get_status() -> Dict[str, Any]:
     """Get monitoring status"""
     global _observer
 
-    registry = load_registry()
-    total_plans = len(registry.get("plans", {}))
-    open_plans = sum(1 for p in registry.get("plans", {}).values() if p.get("status") == "open")
+    stats = get_store_statistics()
 
     with _observer_lock:
         is_running = _observer and _observer.is_alive()
 
     return {
         "module": MODULE_NAME,
-        "version": "2.0.0",
+        "version": "2.1.0",
         "monitoring_active": is_running,
         "watch_location": str(ECOSYSTEM_ROOT),
-        "total_plans": total_plans,
-        "open_plans": open_plans,
+        "total_plans": stats["total_plans"],
+        "open_plans": stats["open_plans"],
         "ignore_folders": len(IGNORE_FOLDERS)
     }
 
@@ -500,6 +517,7 @@ def handle_command(command: str, args: List[str]) -> bool:
         console.print(f"  • Updated: {len(result['updated'])}")
         console.print(f"  • Removed: {len(result['removed'])}")
         console.print(f"  • Renumbered: {len(result['renumbered'])}")
+        console.print(f"  • Directories re-listed: {result['dirs_listed']}/{result['dirs_visited']}")
 
         if result['healing_performed']:
             console.print(f"\n[yellow]Registry healed - {len(result['added']) + len(result['updated']) + len(result['removed'])} changes[/yellow]")
@@ -602,8 +620,9 @@ def print_introspection():
     console.print()
 
     console.print("[yellow]Connected Handlers:[/yellow]")
-    console.print("  • [cyan]handlers/registry/load_registry.py[/cyan]")
-    console.print("  • [cyan]handlers/registry/save_registry.py[/cyan]")
+    console.print("  • [cyan]handlers/registry/registry_store.py[/cyan]")
+    console.print("  • [cyan]handlers/registry/scan_index.py[/cyan]")
+    console.print("  • [cyan]handlers/registry/statistics.py[/cyan]")
     console.print()
 
     console.print("[dim]Run 'python3 registry_monitor.py --help' for detailed usage[/dim]")
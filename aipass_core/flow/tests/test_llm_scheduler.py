@@ -0,0 +1,214 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: tests/test_llm_scheduler.py
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: flow/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial tests - token bucket pacing, concurrency cap, retry/backoff, errors
+#
+# CODE STANDARDS:
+#   - Injected clock/sleep - no real waiting on the rate limiter
+#   - No real API calls
+# =============================================
+
+"""Tests for the shared LLM job scheduler (handlers/llm/scheduler.py)"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+from flow.apps.handlers.llm import scheduler
+from flow.apps.handlers.llm.scheduler import LLMScheduler, RateLimitError, TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only moves when sleep() is called"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+def _bucket(clock, rate=1.0, burst=1, **kwargs):
+    return TokenBucket(rate, burst, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def _scheduler(tmp_path, worker, clock, **settings):
+    bucket = _bucket(clock, rate=settings.pop("rate", 100.0), burst=settings.pop("burst", 100))
+    return LLMScheduler("test", worker, settings=settings, state_dir=tmp_path, bucket=bucket)
+
+
+# =============================================
+# TOKEN BUCKET
+# =============================================
+
+def test_bucket_burst_then_paced():
+    """Burst tokens are immediate, later acquires wait 1/rate each"""
+    clock = FakeClock()
+    bucket = _bucket(clock, rate=2.0, burst=2)
+
+    waits = [bucket.acquire() for _ in range(5)]
+    assert waits == [0.0, 0.0, 0.5, 0.5, 0.5]
+    assert clock.now == 1.5
+
+
+def test_bucket_refills_over_time():
+    """Idle time refills up to the burst size, never beyond"""
+    clock = FakeClock()
+    bucket = _bucket(clock, rate=1.0, burst=3)
+    for _ in range(3):
+        bucket.acquire()
+
+    clock.now += 10.0
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == 1.0
+
+
+def test_penalize_backs_off_and_reward_recovers():
+    """429 halves the rate (down to min_rate) and pauses; successes creep back"""
+    clock = FakeClock()
+    bucket = _bucket(clock, rate=4.0, burst=4, min_rate=1.0)
+
+    bucket.penalize(retry_after=3.0)
+    assert bucket.rate == 2.0 and bucket.tokens == 0.0
+    assert bucket.acquire() == 3.0  # blocked for retry_after, then a full token is due
+
+    bucket.penalize()
+    bucket.penalize()
+    bucket.penalize()
+    assert bucket.rate == 1.0
+    assert bucket.backoffs == 4
+
+    for _ in range(20):
+        bucket.reward()
+    assert bucket.rate == 4.0
+
+
+def test_rate_limit_detection():
+    assert scheduler.is_rate_limit_error(Exception("HTTP 429 from upstream"))
+    assert scheduler.is_rate_limit_error("Too Many Requests")
+    assert not scheduler.is_rate_limit_error(ValueError("bad model"))
+
+
+# =============================================
+# SCHEDULER
+# =============================================
+
+def test_concurrency_capped_at_max_workers(tmp_path):
+    """No more than max_workers jobs run the worker at once"""
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def worker(payload):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return payload["n"] * 2
+
+    sched = _scheduler(tmp_path, worker, FakeClock(), max_workers=3)
+    for n in range(9):
+        sched.submit(f"job{n}", f"key{n}", {"n": n})
+    results = sched.run()
+
+    assert peak[0] == 3
+    assert {job: r["result"] for job, r in results.items()} == {f"job{n}": n * 2 for n in range(9)}
+    assert sched.queue.pending() == []
+
+
+def test_rate_limited_job_retried_with_backoff(tmp_path):
+    """429s penalize the bucket and retry the same job until it succeeds"""
+    clock = FakeClock()
+    calls = []
+
+    def worker(payload):
+        calls.append(clock.now)
+        if len(calls) < 3:
+            raise RateLimitError(retry_after=2.0)
+        return "summary"
+
+    sched = _scheduler(tmp_path, worker, clock, max_workers=1)
+    sched.submit("plan1", "k1", {"text": "plan"})
+    results = sched.run()
+
+    assert results["plan1"] == {"ok": True, "result": "summary"}
+    assert sched.stats["rate_limited"] == 2 and sched.stats["api_calls"] == 3
+    assert sched.bucket.backoffs == 2
+    assert calls[1] - calls[0] >= 2.0 and calls[2] - calls[1] >= 2.0
+
+
+def test_rate_limit_exhausted_job_resumes_next_run(tmp_path):
+    """A job still rate limited after max_attempts stays queued on disk"""
+    clock = FakeClock()
+
+    def worker(payload):
+        raise Exception("429 rate limit exceeded")
+
+    sched = _scheduler(tmp_path, worker, clock, max_workers=1, max_attempts=2)
+    sched.submit("plan1", "k1", {"text": "plan"})
+    result = sched.run()["plan1"]
+    assert result["ok"] is False and result["rate_limited"] is True
+    assert sched.stats["api_calls"] == 2
+
+    resumed = _scheduler(tmp_path, lambda payload: "later", FakeClock(), max_workers=1)
+    assert resumed.run()["plan1"] == {"ok": True, "result": "later"}
+    assert resumed.stats["resumed"] == 1
+    assert not (tmp_path / "llm_queue_test.json").exists()
+
+
+def test_worker_errors_returned_not_retried(tmp_path):
+    """Non-rate errors come back per job; other jobs still complete"""
+    def worker(payload):
+        if payload["n"] == 1:
+            raise ValueError("model not found")
+        return "ok"
+
+    sched = _scheduler(tmp_path, worker, FakeClock(), max_workers=2, max_attempts=2)
+    for n in range(3):
+        sched.submit(f"job{n}", f"key{n}", {"n": n})
+    results = sched.run()
+
+    assert results["job1"] == {"ok": False, "error": "model not found"}
+    assert results["job0"]["ok"] and results["job2"]["ok"]
+    assert sched.stats["failed"] == 1 and sched.stats["api_calls"] == 3
+    assert sched.queue.pending() == ["job1"]  # kept for one more attempt
+
+    sched.run()
+    assert sched.queue.pending() == []  # dropped after max_attempts
+
+
+def test_cached_result_skips_api(tmp_path):
+    """Unchanged content hash is answered from the cache across runs"""
+    calls = []
+
+    def worker(payload):
+        calls.append(payload)
+        return "cached summary"
+
+    sched = _scheduler(tmp_path, worker, FakeClock())
+    assert sched.submit("plan1", "hash-a", {"text": "a"}) is None
+    sched.run()
+
+    again = _scheduler(tmp_path, worker, FakeClock())
+    assert again.submit("plan1", "hash-a", {"text": "a"}) == "cached summary"
+    assert again.run() == {}
+    assert len(calls) == 1 and again.stats["cache_hits"] == 1
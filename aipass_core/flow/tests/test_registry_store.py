@@ -0,0 +1,240 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: tests/test_registry_store.py
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: flow/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial tests - row round trip, counters, JSON export/flush, scan index
+#
+# CODE STANDARDS:
+#   - Temporary store/JSON/index paths - never touches flow_json/
+# =============================================
+
+"""Tests for the indexed registry store and incremental scan index (handlers/registry)"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+
+from flow.apps.handlers.registry.registry_store import RegistryStore
+from flow.apps.handlers.registry.scan_index import ScanIndex
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store without the debounce timer - flushes are explicit"""
+    s = RegistryStore(tmp_path / "flow_registry.db", tmp_path / "flow_registry.json", export_delay=None)
+    yield s
+    s.close()
+
+
+def _plan(status="open", location="/home/aipass/flow", **extra):
+    info = {"subject": "Test plan", "status": status, "location": location,
+            "file_path": f"{location}/FPLAN-0001.md"}
+    info.update(extra)
+    return info
+
+
+def _read_json(store):
+    with open(store.json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# =============================================
+# SINGLE-ROW WRITES
+# =============================================
+
+def test_upsert_patch_delete_round_trip(store):
+    store.upsert_plan("0001", _plan())
+    store.upsert_plan("0002", _plan(status="closed"))
+    assert store.get_plan("0001")["subject"] == "Test plan"
+    assert store.next_number == 3
+
+    assert store.patch_plan("0001", {"status": "closed", "subject": "Renamed"}) is True
+    assert store.get_plan("0001") == _plan(status="closed", subject="Renamed")
+    assert store.patch_plan("0099", {"status": "closed"}) is False
+
+    assert store.delete_plan("0002") is True
+    assert store.delete_plan("0002") is False
+    assert store.get_plan("0002") is None
+    assert list(store.plans_by_status("closed")) == ["0001"]
+
+
+def test_counters_follow_writes(store):
+    store.upsert_plan("0001", _plan())
+    store.upsert_plan("0002", _plan())
+    store.upsert_plan("0003", _plan(location="/home/aipass/seed"))
+    assert store.count_by_status() == {"open": 3}
+    assert store.count_by_status("/home/aipass/seed") == {"open": 1}
+
+    store.patch_plan("0001", {"status": "closed"})
+    store.delete_plan("0003")
+    assert store.count_by_status() == {"open": 1, "closed": 1}
+    assert store.count_by_status("/home/aipass/seed") == {}
+
+
+# =============================================
+# JSON SNAPSHOT
+# =============================================
+
+def test_writes_deferred_until_flush(store):
+    """Single-row writes mark the snapshot dirty; one flush exports the batch"""
+    for n in range(1, 6):
+        store.upsert_plan(f"{n:04d}", _plan())
+    store.patch_plan("0001", {"status": "closed"})
+    store.delete_plan("0005")
+    assert store.dirty and store.exports == 0
+    assert not store.json_path.exists()
+
+    assert store.flush() is True
+    assert store.exports == 1 and not store.dirty
+    registry = _read_json(store)
+    assert sorted(registry["plans"]) == ["0001", "0002", "0003", "0004"]
+    assert registry["plans"]["0001"]["status"] == "closed"
+    assert registry["next_number"] == 6
+
+    assert store.flush() is True
+    assert store.exports == 1  # nothing pending - no rewrite
+
+
+def test_debounced_flush(tmp_path):
+    s = RegistryStore(tmp_path / "r.db", tmp_path / "r.json", export_delay=0.05)
+    try:
+        for n in range(1, 11):
+            s.upsert_plan(f"{n:04d}", _plan())
+        deadline = time.monotonic() + 5
+        while s.dirty and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert s.exports == 1
+        assert len(_read_json(s)["plans"]) == 10
+    finally:
+        s.close()
+
+
+def test_close_flushes_pending_writes(tmp_path):
+    s = RegistryStore(tmp_path / "r.db", tmp_path / "r.json", export_delay=None)
+    s.upsert_plan("0001", _plan())
+    s.close()
+    assert list(json.loads((tmp_path / "r.json").read_text())["plans"]) == ["0001"]
+
+
+def test_external_json_rewrite_reimported(store):
+    store.upsert_plan("0001", _plan())
+    store.upsert_plan("0002", _plan())
+    store.flush()
+
+    registry = _read_json(store)
+    registry["plans"]["0001"]["status"] = "closed"
+    del registry["plans"]["0002"]
+    store.json_path.write_text(json.dumps(registry))
+    os.utime(store.json_path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+
+    assert store.sync_from_json() is True
+    assert store.get_plan("0001")["status"] == "closed"
+    assert store.get_plan("0002") is None
+    assert store.sync_from_json() is False
+
+
+def test_reimport_keeps_unflushed_plans(store):
+    """An external rewrite seen before a flush does not drop plans added here"""
+    store.upsert_plan("0001", _plan())
+    store.flush()
+    store.upsert_plan("0002", _plan())
+
+    registry = _read_json(store)
+    registry["plans"]["0001"]["subject"] = "Edited elsewhere"
+    store.json_path.write_text(json.dumps(registry))
+    os.utime(store.json_path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+
+    assert store.sync_from_json() is True
+    assert store.get_plan("0001")["subject"] == "Edited elsewhere"
+    assert store.get_plan("0002") is not None
+    store.flush()
+    assert sorted(_read_json(store)["plans"]) == ["0001", "0002"]
+
+
+def test_apply_registry_only_changed_rows(store):
+    store.apply_registry({"plans": {"0001": _plan(), "0002": _plan()}, "next_number": 3})
+    assert store.exports == 1
+
+    registry = store.to_registry()
+    registry["plans"]["0002"]["status"] = "closed"
+    assert store.apply_registry(registry) == 1
+    assert store.apply_registry(registry) == 0
+    assert store.exports == 2
+
+
+# =============================================
+# FILE EVENTS
+# =============================================
+
+def test_file_events(store, tmp_path):
+    plan = tmp_path / "branch" / "FPLAN-0007.md"
+    assert store.apply_file_event("created", str(plan)) == "0007"
+    assert store.get_plan("0007")["status"] == "open"
+    assert store.plan_by_file(str(plan)) == "0007"
+
+    moved = tmp_path / "other" / "FPLAN-0007.md"
+    assert store.apply_file_event("moved", str(plan), str(moved)) == "0007"
+    assert store.get_plan("0007")["location"] == str(moved.parent)
+
+    assert store.apply_file_event("deleted", str(moved)) == "0007"
+    assert store.get_plan("0007") is None
+    assert store.apply_file_event("created", str(tmp_path / "notes.md")) is None
+    assert store.exports == 0 and store.dirty
+
+
+# =============================================
+# SCAN INDEX
+# =============================================
+
+def _touch_dir(path: Path, offset_ns: int = 1_000_000) -> None:
+    """Bump a directory mtime (filesystems with coarse timestamps)"""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + offset_ns))
+
+
+def test_scan_index_relists_only_changed_dirs(tmp_path):
+    root = tmp_path / "eco"
+    for branch in ("flow", "seed", "node_modules"):
+        (root / branch).mkdir(parents=True)
+    (root / "flow" / "FPLAN-0001.md").write_text("plan")
+    (root / "seed" / "FPLAN-0002.md").write_text("plan")
+    (root / "node_modules" / "FPLAN-0003.md").write_text("ignored")
+    cache = tmp_path / "scan_index.json"
+
+    first = ScanIndex(cache, ignore_folders=["node_modules"]).scan(root)
+    assert sorted(p.name for p in first["plan_files"]) == ["FPLAN-0001.md", "FPLAN-0002.md"]
+    assert first["dirs_listed"] == first["dirs_visited"] == 3
+
+    index = ScanIndex(cache, ignore_folders=["node_modules"])
+    index.scan(root)
+    assert index.save() is True
+
+    (root / "seed" / "FPLAN-0004.md").write_text("plan")
+    _touch_dir(root / "seed")
+    rescan = ScanIndex(cache, ignore_folders=["node_modules"]).scan(root)
+    assert rescan["dirs_listed"] == 1
+    assert sorted(p.name for p in rescan["plan_files"]) == ["FPLAN-0001.md", "FPLAN-0002.md", "FPLAN-0004.md"]
+
+
+def test_scan_index_ignore_change_invalidates_cache(tmp_path):
+    root = tmp_path / "eco"
+    (root / "flow").mkdir(parents=True)
+    cache = tmp_path / "scan_index.json"
+    index = ScanIndex(cache, ignore_folders=["node_modules"])
+    index.scan(root)
+    index.save()
+
+    assert ScanIndex(cache, ignore_folders=[".git"]).scan(root)["dirs_listed"] == 2
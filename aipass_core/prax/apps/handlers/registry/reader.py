@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: reader.py - Branch Registry Reader Handler
 # Date: 2025-11-15
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: aipass/handlers/registry
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): read_registry() uses drone's cached registry snapshot
 #   - v0.1.0 (2025-11-15): Initial version - read branch registry
 #
 # CODE STANDARDS:
@@ -22,7 +23,6 @@
 Used by branch watcher to discover which branches to monitor.
 """
 
-import json
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -52,17 +52,14 @@ def read_registry() -> List[Dict[str, Any]] | None:
         List of branch dictionaries, or None on error
     """
     try:
-        if not BRANCH_REGISTRY_PATH.exists():
-            return None
+        # Shared cache - parsed once per registry change (drone imports prax, so import lazily)
+        from drone.apps.modules.branch_registry import get_snapshot
 
-        with open(BRANCH_REGISTRY_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        snapshot = get_snapshot()
+        if snapshot.signature is None:
+            return None  # Missing or unreadable
+        return list(snapshot.branches)
 
-        branches = data.get('branches', [])
-        return branches
-
-    except json.JSONDecodeError:
-        return None
     except Exception:
         return None
 
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: bulletin_created.py - Bulletin Created Event Handler
 # Date: 2026-01-31
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: trigger/handlers/events
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Branch list via injected cached registry loader
 #   - v1.0.0 (2026-01-31): Created - Phase 3 migration (FPLAN-0280)
 #
 # CODE STANDARDS:
@@ -36,7 +37,7 @@
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 AIPASS_ROOT = Path.home() / "aipass_core"
 AIPASS_HOME = Path.home()
@@ -47,6 +48,15 @@
 BRANCH_REGISTRY = AIPASS_HOME / "BRANCH_REGISTRY.json"
 BULLETINS_PATH = AIPASS_HOME / "aipass_os" / "AI_CENTRAL" / "BULLETINS.central.json"
 
+# Registry loader callback (set by registry layer - drone's cached BRANCH_REGISTRY)
+_load_registry: Optional[Callable[[], Dict[str, Any]]] = None
+
+
+def set_registry_loader(loader: Callable[[], Dict[str, Any]]) -> None:
+    """Set the function used to read BRANCH_REGISTRY.json (avoids handler importing modules)."""
+    global _load_registry
+    _load_registry = loader
+
 
 def _load_branch_registry() -> List[Dict]:
     """
@@ -57,6 +67,8 @@ def _load_branch_registry() -> List[Dict]:
         Empty list on any error.
     """
     try:
+        if _load_registry is not None:
+            return _load_registry().get("branches", [])
         if not BRANCH_REGISTRY.exists():
             return []
         data = json.loads(BRANCH_REGISTRY.read_text())
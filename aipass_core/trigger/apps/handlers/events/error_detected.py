@@ -4,15 +4,15 @@
 # META DATA HEADER
 # Name: error_detected.py - Error Detected Event Handler
 # Date: 2026-02-14
-# Version: 2.1.0
+# Version: 2.2.0
 # Category: trigger/handlers/events
 #
 # CHANGELOG (Max 5 entries):
+#   - v2.2.0 (2026-10-18): Registered emails via injected cached registry loader
 #   - v2.1.0 (2026-02-14): Dispatch threshold - count >= 2 required (skip first occurrence)
 #   - v2.0.0 (2026-02-13): Medic v2 Phase 3 - Circuit breaker + per-fingerprint backoff dispatch
 #   - v1.3.0 (2026-02-12): Medic Phase 2 - per-branch mute/unmute check
 #   - v1.2.0 (2026-02-12): Medic toggle - check medic_enabled before dispatching
-#   - v1.1.1 (2026-02-10): Add Seed standards reminder to error dispatch template
 #
 # CODE STANDARDS:
 #   - Follows AIPass Seed standards
@@ -69,6 +69,9 @@
 # Email send callback (set by module layer, avoids handler importing from modules)
 _send_email: Optional[Callable[..., bool]] = None
 
+# Registry loader callback (set by registry layer - drone's cached BRANCH_REGISTRY)
+_load_registry: Optional[Callable[[], Dict[str, Any]]] = None
+
 # Try to import error_registry for Medic v2 circuit breaker + per-fingerprint backoff
 try:
     from trigger.apps.handlers.error_registry import (
@@ -143,6 +146,20 @@ def set_send_email_callback(callback: Callable[..., bool]) -> None:
     _send_email = callback
 
 
+def set_registry_loader(loader: Callable[[], Dict[str, Any]]) -> None:
+    """
+    Set the function used to read BRANCH_REGISTRY.json.
+
+    Wired by the registry layer to drone's shared cache so the registry is
+    parsed once per change instead of once per event.
+
+    Args:
+        loader: Zero-arg callable returning the registry dict
+    """
+    global _load_registry
+    _load_registry = loader
+
+
 def _get_registered_emails() -> set:
     """
     Read registered branch emails from BRANCH_REGISTRY.json.
@@ -151,6 +168,8 @@ def _get_registered_emails() -> set:
         Set of registered email addresses (e.g., {'@flow', '@drone'})
     """
     try:
+        if _load_registry is not None:
+            return {b["email"] for b in _load_registry().get("branches", [])}
         if BRANCH_REGISTRY_FILE.exists():
             data = json.loads(BRANCH_REGISTRY_FILE.read_text(encoding='utf-8'))
             return {b["email"] for b in data.get("branches", [])}
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: registry.py - Event Handler Registry
 # Date: 2025-12-04
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: trigger/handlers/events
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): Wire drone's cached branch registry into registry-reading handlers
 #   - v0.1.0 (2025-12-04): Created event handler registry
 #
 # CODE STANDARDS:
@@ -46,7 +47,16 @@ def setup_handlers():
     except ImportError:
         pass  # ai_mail not available - error notifications won't send
     from .warning_logged import handle_warning_logged
-    from .bulletin_created import handle_bulletin_created
+    from .bulletin_created import handle_bulletin_created, set_registry_loader as set_bulletin_registry_loader
+    from .error_detected import set_registry_loader as set_error_registry_loader
+
+    # Shared BRANCH_REGISTRY cache (parsed once per file change, not once per event)
+    try:
+        from drone.apps.modules.branch_registry import load_registry
+        set_bulletin_registry_loader(load_registry)
+        set_error_registry_loader(load_registry)
+    except ImportError:
+        pass  # drone not available - handlers read the file directly
     from .memory_threshold_exceeded import handle_memory_threshold_exceeded
     from .memory_template_updated import handle_memory_template_updated
 
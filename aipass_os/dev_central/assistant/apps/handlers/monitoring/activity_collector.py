@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: activity_collector.py - Branch Activity Data Collector
 # Date: 2026-01-30
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: assistant/handlers/monitoring
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): load_branch_registry() prefers drone's cached registry
 #   - v0.1.0 (2026-01-30): Initial implementation - FPLAN-0266 Phase 1
 #
 # CODE STANDARDS:
@@ -45,6 +46,13 @@ def load_branch_registry() -> Dict[str, Any]:
         Dict containing registry data with 'metadata' and 'branches' keys.
         Returns empty dict with empty branches list on error.
     """
+    try:
+        # Shared cache - parsed once per registry change; private copy for the caller
+        from drone.apps.modules.branch_registry import load_registry
+        return load_registry(copy=True)
+    except ImportError:
+        pass  # drone not importable - read the registry directly
+
     if not BRANCH_REGISTRY_PATH.exists():
         return {"metadata": {}, "branches": []}
 
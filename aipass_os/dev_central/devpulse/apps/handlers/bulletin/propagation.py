@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: propagation.py - Bulletin Propagation Handler
 # Date: 2025-11-24
-# Version: 0.1.0
+# Version: 0.3.0
 # Category: aipass/handlers/bulletin
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.3.0 (2026-10-18): bulletin_board section written through the dashboard section store
+#   - v0.2.0 (2026-10-18): Branch list from drone's cached BRANCH_REGISTRY snapshot
 #   - v0.1.0 (2025-11-24): Initial handler - bulletin propagation to branches
 #
 # CODE STANDARDS:
@@ -23,7 +25,6 @@
 Pure functions with proper error handling.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
@@ -32,7 +33,8 @@
 from .storage import load_bulletins
 
 # Cross-handler imports for shared utilities
-from ..dashboard.operations import create_fresh_dashboard, save_dashboard
+from ..dashboard.operations import create_fresh_dashboard
+from ..dashboard.section_store import get_section_store
 
 # Infrastructure
 AIPASS_ROOT = Path.home()
@@ -49,56 +51,15 @@ def _load_branch_registry() -> List[Dict]:
         List of branch dicts with name, path, status
 
     Raises:
-        FileNotFoundError: If registry doesn't exist
-        json.JSONDecodeError: If registry is malformed
+        FileNotFoundError: If registry doesn't exist or is malformed
     """
-    if not BRANCH_REGISTRY.exists():
-        raise FileNotFoundError(f"Branch registry not found: {BRANCH_REGISTRY}")
-
-    data = json.loads(BRANCH_REGISTRY.read_text())
-    return data.get("branches", [])
-
-
-def _load_dashboard(branch_path: Path) -> Dict:
-    """
-    Load existing dashboard or create new if missing.
-
-    Preserves other services' sections (ai_mail, flow, etc).
-    Only bulletin_board section will be updated by propagation.
-
-    Args:
-        branch_path: Path to branch root
-
-    Returns:
-        Dashboard data dict (existing or new)
-    """
-    dashboard_path = branch_path / "DASHBOARD.local.json"
-
-    if dashboard_path.exists():
-        try:
-            content = dashboard_path.read_text().strip()
-            if not content:
-                return create_fresh_dashboard(branch_path)
-            data = json.loads(content)
-            # Ensure sections dict exists
-            if "sections" not in data:
-                data["sections"] = {}
-            # Ensure bulletin_board section exists (we'll update it)
-            if "bulletin_board" not in data["sections"]:
-                data["sections"]["bulletin_board"] = {
-                    "managed_by": "aipass",
-                    "active_bulletins": [],
-                    "pending_ack": []
-                }
-            return data
-        except json.JSONDecodeError:
-            # Invalid JSON - create fresh
-            pass
-
-    # No dashboard or invalid - create fresh
-    return create_fresh_dashboard(branch_path)
-
+    # Shared cache: parsed once per registry change
+    from drone.apps.modules.branch_registry import get_snapshot
 
+    snapshot = get_snapshot()
+    if snapshot.signature is None:
+        raise FileNotFoundError(f"Branch registry not found or unreadable: {BRANCH_REGISTRY}")
+    return snapshot.branches
 
 
 def _filter_active_bulletins(bulletins: List[Dict]) -> List[Dict]:
@@ -170,21 +131,16 @@ def propagate_to_branches() -> Dict:
             continue
 
         try:
-            # Load dashboard
-            dashboard = _load_dashboard(branch_path)
-
-            # Update bulletin_board section ONLY
-            if "sections" not in dashboard:
-                dashboard["sections"] = {}
-
-            dashboard["sections"]["bulletin_board"] = {
-                "managed_by": "aipass",
-                "active_bulletins": active_bulletins,
-                "pending_ack": []
-            }
-
-            # Save dashboard using dashboard handler
-            save_dashboard(branch_path, dashboard)
+            # Update bulletin_board section ONLY (skipped if already current)
+            get_section_store().write_sections(
+                branch_path,
+                {"bulletin_board": {
+                    "managed_by": "aipass",
+                    "active_bulletins": active_bulletins,
+                    "pending_ack": []
+                }},
+                base_func=create_fresh_dashboard
+            )
             branches_updated += 1
 
         except Exception as e:
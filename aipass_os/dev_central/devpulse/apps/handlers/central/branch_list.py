@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: branch_list.py - Branch Registry Handler
 # Date: 2025-11-24
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: aipass/handlers/central
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): Registry read through drone's cached snapshot (_load_registry)
 #   - v0.1.0 (2025-11-24): Initial handler - branch list operations
 #
 # CODE STANDARDS:
@@ -26,7 +27,7 @@
 """
 
 import sys
-import json
+import copy
 from pathlib import Path
 from typing import List, Dict
 
@@ -39,6 +40,28 @@
 BRANCH_REGISTRY = AIPASS_ROOT / "BRANCH_REGISTRY.json"
 
 
+def _load_registry() -> Dict:
+    """
+    Registry data from drone's shared cache (parsed once per registry change)
+
+    Returns:
+        Registry dict (shared - do not mutate)
+
+    Raises:
+        FileNotFoundError: If BRANCH_REGISTRY.json missing
+        ValueError: If the registry is not valid JSON or not a dictionary
+    """
+    if not BRANCH_REGISTRY.exists():
+        raise FileNotFoundError(f"Branch registry missing: {BRANCH_REGISTRY}")
+
+    from drone.apps.modules.branch_registry import get_snapshot
+
+    snapshot = get_snapshot()
+    if snapshot.signature is None:
+        raise ValueError(f"Invalid JSON in branch registry: {BRANCH_REGISTRY}")
+    return snapshot.data
+
+
 def get_branch_list() -> List[str]:
     """
     Get list of registered branches
@@ -53,13 +76,7 @@ def get_branch_list() -> List[str]:
         ValueError: If registry structure invalid
     """
     try:
-        if not BRANCH_REGISTRY.exists():
-            raise FileNotFoundError(f"Branch registry missing: {BRANCH_REGISTRY}")
-
-        data = json.loads(BRANCH_REGISTRY.read_text())
-
-        if not isinstance(data, dict):
-            raise ValueError("Branch registry is not a dictionary")
+        data = _load_registry()
 
         branches = data.get("branches", [])
 
@@ -79,9 +96,6 @@ def get_branch_list() -> List[str]:
     except FileNotFoundError:
         raise
 
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in branch registry: {e}") from e
-
     except ValueError:
         raise
 
@@ -103,22 +117,12 @@ def get_branch_registry() -> Dict:
         ValueError: If registry structure invalid
     """
     try:
-        if not BRANCH_REGISTRY.exists():
-            raise FileNotFoundError(f"Branch registry missing: {BRANCH_REGISTRY}")
-
-        data = json.loads(BRANCH_REGISTRY.read_text())
-
-        if not isinstance(data, dict):
-            raise ValueError("Branch registry is not a dictionary")
-
-        return data
+        # Private copy - the cached snapshot is shared
+        return copy.deepcopy(_load_registry())
 
     except FileNotFoundError:
         raise
 
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in branch registry: {e}") from e
-
     except ValueError:
         raise
 
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: sync.py - Branch Sync Handler
 # Date: 2025-11-24
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: aipass/handlers/central
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): Registry read through branch_list._load_registry (drone's cached snapshot)
 #   - v0.1.0 (2025-11-24): Initial handler - README sync operations
 #
 # CODE STANDARDS:
@@ -31,6 +32,9 @@
 from datetime import datetime
 import os
 
+# Same-package imports allowed
+from .branch_list import _load_registry
+
 # Infrastructure
 AIPASS_ROOT = Path.home()
 
@@ -56,11 +60,8 @@ def sync_readmes() -> Dict:
     """
     try:
         # Load branch registry
-        registry_path = AIPASS_ROOT / "BRANCH_REGISTRY.json"
-        if not registry_path.exists():
-            raise FileNotFoundError(f"Branch registry not found: {registry_path}")
-
-        registry_data = json.loads(registry_path.read_text(encoding='utf-8'))
+        # Shared cache via branch_list (raises FileNotFoundError / ValueError)
+        registry_data = _load_registry()
 
         branches = registry_data.get("branches", [])
         if not branches:
@@ -171,11 +172,8 @@ def sync_notepads() -> Dict:
     """
     try:
         # Load branch registry
-        registry_path = AIPASS_ROOT / "BRANCH_REGISTRY.json"
-        if not registry_path.exists():
-            raise FileNotFoundError(f"Branch registry not found: {registry_path}")
-
-        registry_data = json.loads(registry_path.read_text(encoding='utf-8'))
+        # Shared cache via branch_list (raises FileNotFoundError / ValueError)
+        registry_data = _load_registry()
 
         branches = registry_data.get("branches", [])
         if not branches:
@@ -2,6 +2,7 @@
 
 from .operations import load_dashboard, save_dashboard, update_section, get_dashboard_path
 from .status import calculate_quick_status, get_branch_paths
+from .section_store import DashboardSectionStore, get_section_store
 
 __all__ = [
     'load_dashboard',
@@ -10,4 +11,6 @@
     'get_dashboard_path',
     'calculate_quick_status',
     'get_branch_paths',
+    'DashboardSectionStore',
+    'get_section_store',
 ]
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: operations.py - Dashboard Operations Handler
 # Date: 2026-02-03
-# Version: 0.2.0
+# Version: 0.3.0
 # Category: handlers/dashboard
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.3.0 (2026-10-18): save_dashboard locked + atomic, update_section via section store
 #   - v0.2.0 (2026-02-03): Fix empty file handling - treat empty JSON as new dashboard
 #   - v0.1.0 (2025-11-24): Initial handler - dashboard load/save/update operations
 #
@@ -24,6 +25,7 @@
 All business logic for dashboard file operations.
 """
 
+import copy
 import json
 import sys
 from datetime import datetime
@@ -33,6 +35,8 @@
 AIPASS_ROOT = Path.home() / "aipass_core"
 sys.path.insert(0, str(AIPASS_ROOT))
 
+from .section_store import DASHBOARD_FILENAME, atomic_write_json, dashboard_lock, get_section_store
+
 
 def get_dashboard_path(branch_path: Path) -> Path:
     """
@@ -44,7 +48,7 @@ def get_dashboard_path(branch_path: Path) -> Path:
     Returns:
         Path to dashboard file
     """
-    return branch_path / "DASHBOARD.local.json"
+    return branch_path / DASHBOARD_FILENAME
 
 
 def load_dashboard(branch_path: Path, template: Dict) -> Dict:
@@ -88,7 +92,10 @@ def load_dashboard(branch_path: Path, template: Dict) -> Dict:
 
 def save_dashboard(branch_path: Path, data: Dict) -> bool:
     """
-    Save branch dashboard
+    Save a whole branch dashboard (locked, temp file + rename)
+
+    Prefer update_section / the section store for single sections - this
+    replaces every section on disk.
 
     Args:
         branch_path: Path to branch root
@@ -101,8 +108,8 @@ def save_dashboard(branch_path: Path, data: Dict) -> bool:
         OSError: If file write fails
     """
     data["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-    dashboard_path = get_dashboard_path(branch_path)
-    dashboard_path.write_text(json.dumps(data, indent=2))
+    with dashboard_lock(branch_path):
+        atomic_write_json(get_dashboard_path(branch_path), data)
     return True
 
 
@@ -198,6 +205,10 @@ def update_section(
     """
     Update a specific section in branch dashboard
 
+    Goes through the section store: other sections are preserved, and the
+    file is not rewritten when the section matches what is already on disk
+    (last_sync then keeps the date of the last real change).
+
     Args:
         branch_path: Path to branch root
         section_name: Section to update (flow, ai_mail, etc)
@@ -211,16 +222,16 @@ def update_section(
     Raises:
         Exception: If load or save fails
     """
-    dashboard = load_dashboard(branch_path, template)
-
-    # Update only the specified section
-    if "sections" not in dashboard:
-        dashboard["sections"] = {}
+    def _base(path: Path) -> Dict:
+        # Missing/corrupted file - template-based dashboard (template itself untouched)
+        return copy.deepcopy(load_dashboard(path, template))
 
     section_data["last_sync"] = datetime.now().strftime("%Y-%m-%d")
-    dashboard["sections"][section_name] = section_data
-
-    # Recalculate quick status
-    dashboard["quick_status"] = calculate_status_func(dashboard["sections"])
 
-    return save_dashboard(branch_path, dashboard)
+    # Merged with any queued updates; skipped entirely if the section is unchanged
+    return get_section_store().write_sections(
+        branch_path,
+        {section_name: section_data},
+        quick_status_func=calculate_status_func,
+        base_func=_base
+    )
@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: refresh.py - Dashboard Refresh Handler
 # Date: 2025-11-27
-# Version: 0.1.0
+# Version: 0.3.0
 # Category: aipass/handlers/dashboard
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.3.0 (2026-10-18): Sections written through the section store - unchanged dashboards skip the write
+#   - v0.2.0 (2026-10-18): Branch paths from drone's cached BRANCH_REGISTRY snapshot
 #   - v0.1.0 (2025-11-27): Initial handler - refresh dashboards from centrals
 #
 # CODE STANDARDS:
@@ -21,15 +23,19 @@
 
 Reads all .central.json files and writes to branch dashboards.
 AIPASS owns all dashboards - services only maintain their central files.
+
+Sections go through the section store, so a branch whose sections match
+what is already on disk is not rewritten, and sections owned by other
+writers (commons_activity, flow_plans) survive a refresh.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
 # Same-package imports allowed
-from .operations import create_fresh_dashboard, save_dashboard
+from .operations import create_fresh_dashboard
+from .section_store import get_section_store
 
 # Cross-handler imports for central reader
 from ..central.reader import read_all_centrals
@@ -49,11 +55,13 @@ def _load_branch_paths() -> List[Path]:
     Raises:
         FileNotFoundError: If registry doesn't exist
     """
-    if not BRANCH_REGISTRY.exists():
-        raise FileNotFoundError(f"Branch registry not found: {BRANCH_REGISTRY}")
+    # Shared cache: parsed once per registry change across every refresh
+    from drone.apps.modules.branch_registry import get_snapshot
 
-    data = json.loads(BRANCH_REGISTRY.read_text())
-    branches = data.get("branches", [])
+    snapshot = get_snapshot()
+    if snapshot.signature is None:
+        raise FileNotFoundError(f"Branch registry not found or unreadable: {BRANCH_REGISTRY}")
+    branches = snapshot.branches
 
     paths = []
     for branch in branches:
@@ -207,6 +215,27 @@ def _calculate_quick_status(sections: Dict) -> Dict:
     }
 
 
+def _build_sections(centrals: Dict, branch_path: Path, branch_name: str) -> Dict:
+    """All centrally-derived sections for one branch (order: bulletin, mail, memory, devpulse, flow at bottom)"""
+    return {
+        "bulletin_board": _extract_bulletin_section(centrals),
+        "ai_mail": _extract_ai_mail_section(centrals, branch_name),
+        "memory_bank": _extract_memory_bank_section(centrals, branch_path),
+        "devpulse": _extract_devpulse_section(centrals, branch_name),
+        "flow": _extract_flow_section(centrals, branch_name),
+    }
+
+
+def _write_branch_sections(branch_path: Path, sections: Dict) -> None:
+    """Submit one branch's sections as a single store write (raises on failure)"""
+    get_section_store().write_sections(
+        branch_path,
+        sections,
+        quick_status_func=_calculate_quick_status,
+        base_func=create_fresh_dashboard
+    )
+
+
 def refresh_all_dashboards() -> Dict:
     """
     Refresh all branch dashboards from central files.
@@ -215,7 +244,8 @@ def refresh_all_dashboards() -> Dict:
     then writes to all branch DASHBOARD.local.json files.
 
     Returns:
-        Dict with status, branches_updated, branches_failed, errors
+        Dict with status, branches_updated, branches_failed, errors,
+        branches_unchanged (dashboards left untouched) and store_stats
     """
     errors = []
     branches_updated = 0
@@ -235,26 +265,14 @@ def refresh_all_dashboards() -> Dict:
             "errors": [str(e)]
         }
 
+    skipped_before = get_section_store().get_stats()["writes_skipped"]
+
     # Update each branch
     for branch_path in branch_paths:
         branch_name = branch_path.name.upper()
 
         try:
-            # Create fresh dashboard
-            dashboard = create_fresh_dashboard(branch_path)
-
-            # Populate sections from centrals (order: bulletin, mail, memory, devpulse, flow at bottom)
-            dashboard["sections"]["bulletin_board"] = _extract_bulletin_section(centrals)
-            dashboard["sections"]["ai_mail"] = _extract_ai_mail_section(centrals, branch_name)
-            dashboard["sections"]["memory_bank"] = _extract_memory_bank_section(centrals, branch_path)
-            dashboard["sections"]["devpulse"] = _extract_devpulse_section(centrals, branch_name)
-            dashboard["sections"]["flow"] = _extract_flow_section(centrals, branch_name)
-
-            # Calculate quick status
-            dashboard["quick_status"] = _calculate_quick_status(dashboard["sections"])
-
-            # Save
-            save_dashboard(branch_path, dashboard)
+            _write_branch_sections(branch_path, _build_sections(centrals, branch_path, branch_name))
             branches_updated += 1
 
         except Exception as e:
@@ -273,7 +291,9 @@ def refresh_all_dashboards() -> Dict:
         "status": status,
         "branches_updated": branches_updated,
         "branches_failed": branches_failed,
-        "errors": errors
+        "branches_unchanged": get_section_store().get_stats()["writes_skipped"] - skipped_before,
+        "errors": errors,
+        "store_stats": get_section_store().get_stats()
     }
 
 
@@ -291,17 +311,7 @@ def refresh_single_dashboard(branch_path: Path) -> Dict:
     branch_name = branch_path.name.upper()
 
     try:
-        dashboard = create_fresh_dashboard(branch_path)
-
-        dashboard["sections"]["bulletin_board"] = _extract_bulletin_section(centrals)
-        dashboard["sections"]["ai_mail"] = _extract_ai_mail_section(centrals, branch_name)
-        dashboard["sections"]["memory_bank"] = _extract_memory_bank_section(centrals, branch_path)
-        dashboard["sections"]["devpulse"] = _extract_devpulse_section(centrals, branch_name)
-        dashboard["sections"]["flow"] = _extract_flow_section(centrals, branch_name)
-
-        dashboard["quick_status"] = _calculate_quick_status(dashboard["sections"])
-
-        save_dashboard(branch_path, dashboard)
+        _write_branch_sections(branch_path, _build_sections(centrals, branch_path, branch_name))
 
         return {"status": "success", "branch": branch_name}
 
@@ -0,0 +1,324 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: section_store.py - Dashboard Section Store Handler
+# Date: 2026-10-18
+# Version: 1.0.1
+# Category: handlers/dashboard
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.1 (2026-10-18): Removed unused coalesce() block - batch with submit() + flush()
+#   - v1.0.0 (2026-10-18): Initial handler - coalescing section writes, locked atomic saves, write counters
+#
+# CODE STANDARDS:
+#   - Pure business logic - no CLI imports
+#   - Raises exceptions, caller handles logging
+#   - Type hints on all functions
+# =============================================
+
+"""
+Dashboard Section Store Handler
+
+Single write path for DASHBOARD.local.json. Writers submit
+(branch, section, payload) updates; pending updates for the same branch are
+merged and applied in one read-modify-write:
+
+- Later payloads for the same section replace earlier ones (coalesced)
+- A section whose payload matches what is on disk (ignoring sync
+  timestamps) is left alone
+- If nothing changed the file is not rewritten at all
+- Otherwise the file is rewritten via temp file + rename while holding an
+  fcntl lock on .dashboard.lock next to it, so concurrent writers from
+  other processes cannot interleave or leave a truncated file
+
+write_sections() flushes its branch immediately. Callers batching several
+updates queue them with submit() and apply them with one flush().
+
+Usage:
+    store = get_section_store()
+    store.write_sections(branch_path, {"ai_mail": {...}})
+
+    store.submit(branch_path, "ai_mail", {...})
+    store.submit(branch_path, "ai_mail", {...})  # replaces the first
+    store.flush()
+"""
+
+import copy
+import fcntl
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+DASHBOARD_FILENAME = "DASHBOARD.local.json"
+LOCK_FILENAME = ".dashboard.lock"
+
+# Stamped on every save - never a reason to rewrite on their own
+VOLATILE_KEYS = frozenset({"last_sync", "last_updated"})
+
+QuickStatusFunc = Callable[[Dict], Dict]
+BaseFunc = Callable[[Path], Dict]
+
+
+# =============================================
+# FILE PRIMITIVES
+# =============================================
+
+@contextmanager
+def dashboard_lock(branch_path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a branch dashboard.
+
+    The lock lives in a separate .dashboard.lock file because the
+    dashboard itself is replaced by rename on every write.
+
+    Args:
+        branch_path: Path to branch root
+
+    Raises:
+        OSError: If the lock file cannot be opened
+    """
+    with open(branch_path / LOCK_FILENAME, 'w', encoding='utf-8') as lock_fd:
+        fcntl.flock(lock_fd.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_fd.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write_json(path: Path, data: Dict) -> None:
+    """
+    Write JSON via temp file + rename so readers never see a partial file.
+
+    Raises:
+        OSError: If the write or rename fails
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read_dashboard(path: Path) -> Optional[Dict]:
+    """Parsed dashboard, or None if missing, empty or corrupted."""
+    try:
+        content = path.read_text(encoding='utf-8').strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not content:
+        return None
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _default_base(branch_path: Path) -> Dict:
+    return {
+        "branch": branch_path.name.upper(),
+        "last_updated": "",
+        "quick_status": {"action_required": False},
+        "sections": {}
+    }
+
+
+def _comparable(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: v for k, v in value.items() if k not in VOLATILE_KEYS}
+    return value
+
+
+# =============================================
+# SECTION STORE
+# =============================================
+
+class DashboardSectionStore:
+    """Coalescing queue plus single writer for branch dashboards
+
+    Counters (get_stats):
+        submitted: Section updates handed to the store
+        coalesced: Updates replaced by a newer one before they were applied
+        sections_unchanged: Updates that matched the file already on disk
+        writes: Dashboard files actually rewritten
+        writes_skipped: Flushes where nothing changed, so no write happened
+        writes_saved: submitted - writes (each update used to be its own write)
+        failures: Flushes that raised
+    """
+
+    def __init__(self):
+        self._pending: Dict[Path, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._stats = {
+            "submitted": 0,
+            "coalesced": 0,
+            "sections_unchanged": 0,
+            "writes": 0,
+            "writes_skipped": 0,
+            "failures": 0,
+        }
+
+    # ---------- queue ----------
+
+    def submit(self, branch_path: Path, section: str, payload: Dict, root: bool = False,
+               quick_status_func: Optional[QuickStatusFunc] = None,
+               base_func: Optional[BaseFunc] = None) -> None:
+        """
+        Queue one section update (applied on the next flush).
+
+        Args:
+            branch_path: Path to branch root
+            section: Section name
+            payload: Full replacement for the section
+            root: Store at the dashboard top level instead of under "sections"
+            quick_status_func: Recomputes quick_status from sections after a change
+            base_func: Builds the dashboard when the file is missing or corrupted
+        """
+        key = ("root:" if root else "sections:") + section
+        with self._lock:
+            entry = self._pending.setdefault(
+                Path(branch_path), {"updates": {}, "quick_status_func": None, "base_func": None}
+            )
+            if key in entry["updates"]:
+                self._stats["coalesced"] += 1
+            entry["updates"][key] = copy.deepcopy(payload)
+            if quick_status_func is not None:
+                entry["quick_status_func"] = quick_status_func
+            if base_func is not None:
+                entry["base_func"] = base_func
+            self._stats["submitted"] += 1
+
+    def write_sections(self, branch_path: Path, sections: Dict[str, Dict],
+                       root_sections: Optional[Dict[str, Dict]] = None,
+                       quick_status_func: Optional[QuickStatusFunc] = None,
+                       base_func: Optional[BaseFunc] = None) -> bool:
+        """
+        Submit several sections for one branch and flush that branch.
+
+        Returns:
+            True if the dashboard was written or already up to date
+
+        Raises:
+            OSError: If the locked write fails
+        """
+        with self._lock:
+            for name, payload in sections.items():
+                self.submit(branch_path, name, payload, quick_status_func=quick_status_func,
+                            base_func=base_func)
+            for name, payload in (root_sections or {}).items():
+                self.submit(branch_path, name, payload, root=True,
+                            quick_status_func=quick_status_func, base_func=base_func)
+            result = self.flush(branch_path)
+        if result["errors"]:
+            raise OSError(result["errors"][0])
+        return True
+
+    # ---------- writer ----------
+
+    def flush(self, branch_path: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Apply pending updates (all branches, or just one).
+
+        Returns:
+            Dict with written, skipped and errors
+        """
+        with self._lock:
+            if branch_path is None:
+                batch = self._pending
+                self._pending = {}
+            else:
+                entry = self._pending.pop(Path(branch_path), None)
+                batch = {Path(branch_path): entry} if entry else {}
+
+            written = 0
+            skipped = 0
+            errors: List[str] = []
+            for path, entry in batch.items():
+                try:
+                    if self._apply(path, entry):
+                        written += 1
+                    else:
+                        skipped += 1
+                except Exception as e:
+                    self._stats["failures"] += 1
+                    errors.append(f"{path.name}: {e}")
+
+            return {"written": written, "skipped": skipped, "errors": errors}
+
+    def _apply(self, branch_path: Path, entry: Dict[str, Any]) -> bool:
+        """Merge one branch's updates under the file lock; False if nothing changed."""
+        dashboard_path = branch_path / DASHBOARD_FILENAME
+        with dashboard_lock(branch_path):
+            current = _read_dashboard(dashboard_path)
+            changed = current is None
+            if current is None:
+                current = (entry["base_func"] or _default_base)(branch_path)
+            sections = current.get("sections")
+            if not isinstance(sections, dict):
+                sections = current["sections"] = {}
+                changed = True
+
+            sections_changed = False
+            for key, payload in entry["updates"].items():
+                scope, name = key.split(":", 1)
+                target = sections if scope == "sections" else current
+                if name in target and _comparable(target[name]) == _comparable(payload):
+                    self._stats["sections_unchanged"] += 1
+                    continue
+                target[name] = payload
+                changed = True
+                sections_changed = sections_changed or scope == "sections"
+
+            quick_status_func = entry["quick_status_func"]
+            if quick_status_func is not None and sections_changed:
+                quick_status = quick_status_func(sections)
+                if current.get("quick_status") != quick_status:
+                    current["quick_status"] = quick_status
+
+            if not changed:
+                self._stats["writes_skipped"] += 1
+                return False
+
+            current["last_updated"] = datetime.now().strftime("%Y-%m-%d")
+            atomic_write_json(dashboard_path, current)
+            self._stats["writes"] += 1
+            return True
+
+    # ---------- counters ----------
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counter snapshot including writes_saved."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["writes_saved"] = max(stats["submitted"] - stats["writes"] - stats["failures"], 0)
+        return stats
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+# =============================================
+# PROCESS-WIDE STORE
+# =============================================
+
+_store = DashboardSectionStore()
+
+
+def get_section_store() -> DashboardSectionStore:
+    """Shared section store for this process."""
+    return _store
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: status.py - Dashboard Status Calculation Handler
 # Date: 2025-11-24
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: handlers/dashboard
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): Branch paths from drone's cached BRANCH_REGISTRY snapshot
 #   - v0.1.0 (2025-11-24): Initial handler - status calculation and branch paths
 #
 # CODE STANDARDS:
@@ -23,7 +24,6 @@
 All business logic for dashboard status operations.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, List
 
@@ -80,10 +80,15 @@ def get_branch_paths() -> List[Path]:
 
     Raises:
         FileNotFoundError: If branch registry doesn't exist
-        json.JSONDecodeError: If registry is corrupted
+        ValueError: If registry is corrupted
     """
     if not BRANCH_REGISTRY.exists():
         raise FileNotFoundError(f"Branch registry not found: {BRANCH_REGISTRY}")
 
-    data = json.loads(BRANCH_REGISTRY.read_text())
-    return [Path(b.get("path", "")) for b in data.get("branches", [])]
+    # Shared cache: parsed once per registry change
+    from drone.apps.modules.branch_registry import get_snapshot
+
+    snapshot = get_snapshot()
+    if snapshot.signature is None:
+        raise ValueError(f"Branch registry is corrupted: {BRANCH_REGISTRY}")
+    return [Path(b.get("path", "")) for b in snapshot.branches]
@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: dashboard.py - Dashboard Section Utilities
 # Date: 2025-11-24
-# Version: 0.1.1
+# Version: 0.2.1
 # Category: aipass/central
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.1 (2026-10-18): Dropped unused coalesce_updates()
+#   - v0.2.0 (2026-10-18): Section store API - update_sections, coalesce_updates, write counters
 #   - v0.1.1 (2025-11-24): Standards fixes - logger, CLI service, handle_command
 #   - v0.1.0 (2025-11-24): Initial structure - dashboard utilities
 #
@@ -22,13 +24,17 @@
 Provides utilities for services to update their sections in branch
 DASHBOARD.local.json files. Each service manages only its own section.
 
+All writes go through one section store: updates are merged per branch,
+unchanged sections skip the write, and files are replaced atomically
+under a per-branch lock.
+
 Run directly or via: python3 apps/modules/dashboard.py
 """
 
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 AIPASS_ROOT = Path.home() / "aipass_core"
 sys.path.insert(0, str(AIPASS_ROOT))
@@ -44,7 +50,8 @@
     update_section as handler_update_section,
     get_dashboard_path,
     calculate_quick_status,
-    get_branch_paths
+    get_branch_paths,
+    get_section_store
 )
 
 # Import refresh handler - exposed as public API
@@ -130,6 +137,38 @@ def update_section(
         return False
 
 
+def update_sections(
+    branch_path: Path,
+    sections: Optional[Dict[str, Dict]] = None,
+    root_sections: Optional[Dict[str, Dict]] = None
+) -> bool:
+    """
+    Update several sections of one branch dashboard in a single write
+
+    Unlike update_section, payloads are stored as given (no last_sync
+    stamp, quick_status untouched) - for services that own sections
+    outside the template (commons_activity, flow_plans).
+
+    Args:
+        branch_path: Path to branch root
+        sections: Section name -> payload, stored under "sections"
+        root_sections: Key -> payload, stored at the dashboard top level
+
+    Returns:
+        True if written or already up to date
+    """
+    try:
+        return get_section_store().write_sections(branch_path, sections or {}, root_sections)
+    except Exception as e:
+        logger.error(f"Failed to update dashboard sections for {branch_path.name}: {e}")
+        return False
+
+
+def get_write_stats() -> Dict[str, int]:
+    """Section store counters for this process (submitted, coalesced, writes, writes_saved, ...)"""
+    return get_section_store().get_stats()
+
+
 # ============================================
 # CLI INTERFACE
 # ============================================
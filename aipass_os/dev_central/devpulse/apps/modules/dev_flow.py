@@ -4,20 +4,20 @@
 # META DATA HEADER
 # Name: dev_flow.py - Plan management module (thin orchestrator)
 # Date: 2025-12-02
-# Version: 4.0.0
+# Version: 4.0.1
 # Category: Module
 #
 # CHANGELOG (Max 5 entries):
+#   - v4.0.1 (2026-10-18): @ resolution via drone's cached registry (get_branch_by_name)
 #   - v4.0.0 (2026-02-19): Multi-type (DPLAN/BPLAN), --type flag, @ branch resolution
 #   - v3.0.0 (2026-02-18): Tags, filters, registry, dashboard per FPLAN-0355
 #   - v2.0.0 (2025-12-02): Refactored to thin orchestrator - all logic in handlers
-#   - v1.0.0 (2025-12-02): Initial version - plan create/list/status commands
 #
 # CONNECTS:
 #   - handlers/plan/ (all plan handlers)
 #   - registry.py (plan tracking)
 #   - dashboard.py (DASHBOARD.local.json + DEVPULSE.central.json push)
-#   - BRANCH_REGISTRY.json (@ resolution)
+#   - BRANCH_REGISTRY.json (@ resolution, via drone.apps.modules.branch_registry)
 #
 # CODE STANDARDS:
 #   - Modules orchestrate, handlers implement (3-tier architecture)
@@ -36,7 +36,6 @@
 
 # INFRASTRUCTURE IMPORT PATTERN
 import sys
-import json
 from pathlib import Path
 from typing import List, Optional
 
@@ -47,6 +46,7 @@
 # Infrastructure imports (module does the logging)
 from prax.apps.modules.logger import system_logger as logger
 from cli.apps.modules import console, header, success, error
+from drone.apps.modules.branch_registry import get_branch_by_name
 
 # Handler imports
 from aipass_os.dev_central.devpulse.apps.handlers.plan.create import create_plan
@@ -91,19 +91,16 @@ def resolve_branch_target(branch_ref: str) -> Optional[Path]:
         return None
 
     try:
-        with open(BRANCH_REGISTRY_PATH, "r", encoding="utf-8") as f:
-            registry = json.load(f)
-
-        for branch in registry.get("branches", []):
-            if branch.get("name", "").upper() == name:
-                branch_path = Path(branch["path"])
-                if branch_path.exists():
-                    return branch_path
-                else:
-                    logger.warning(f"[dev_flow] Branch path does not exist: {branch_path}")
-                    return None
-
-        logger.warning(f"[dev_flow] Branch '{name}' not found in registry")
+        # Shared cache - name map built once per registry change
+        branch = get_branch_by_name(name)
+        if branch is None:
+            logger.warning(f"[dev_flow] Branch '{name}' not found in registry")
+            return None
+
+        branch_path = Path(branch["path"])
+        if branch_path.exists():
+            return branch_path
+        logger.warning(f"[dev_flow] Branch path does not exist: {branch_path}")
         return None
 
     except Exception as e:
@@ -0,0 +1,174 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: tests/test_section_store.py
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: devpulse/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial tests - coalescing, skipped writes, counters, cross-writer locking
+#
+# CODE STANDARDS:
+#   - Temporary branch directories only - never touches real dashboards
+# =============================================
+
+"""Tests for the dashboard section store (handlers/dashboard/section_store.py)"""
+
+import fcntl
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path.home()))
+
+from aipass_os.dev_central.devpulse.apps.handlers.dashboard.section_store import (
+    DASHBOARD_FILENAME,
+    LOCK_FILENAME,
+    DashboardSectionStore,
+    dashboard_lock,
+)
+
+
+@pytest.fixture
+def branch(tmp_path):
+    path = tmp_path / "flow"
+    path.mkdir()
+    return path
+
+
+def _read(branch_path: Path) -> dict:
+    return json.loads((branch_path / DASHBOARD_FILENAME).read_text(encoding='utf-8'))
+
+
+def _quick_status(sections: dict) -> dict:
+    return {"action_required": sections.get("ai_mail", {}).get("new", 0) > 0}
+
+
+# =============================================
+# COALESCING
+# =============================================
+
+def test_submitted_updates_coalesce_into_one_write(branch):
+    store = DashboardSectionStore()
+    store.submit(branch, "ai_mail", {"new": 1})
+    store.submit(branch, "ai_mail", {"new": 2})
+    store.submit(branch, "ai_mail", {"new": 3})
+    store.submit(branch, "flow_plans", {"open": 4}, root=True)
+    assert not (branch / DASHBOARD_FILENAME).exists()
+
+    assert store.flush() == {"written": 1, "skipped": 0, "errors": []}
+    dashboard = _read(branch)
+    assert dashboard["sections"]["ai_mail"] == {"new": 3}
+    assert dashboard["flow_plans"] == {"open": 4}
+    assert dashboard["branch"] == "FLOW"
+
+    stats = store.get_stats()
+    assert stats["submitted"] == 4 and stats["coalesced"] == 2
+    assert stats["writes"] == 1 and stats["writes_saved"] == 3
+
+
+def test_flush_one_branch_leaves_others_pending(tmp_path):
+    store = DashboardSectionStore()
+    first, second = tmp_path / "flow", tmp_path / "seed"
+    first.mkdir()
+    second.mkdir()
+    store.submit(first, "ai_mail", {"new": 1})
+    store.submit(second, "ai_mail", {"new": 2})
+
+    assert store.flush(first)["written"] == 1
+    assert not (second / DASHBOARD_FILENAME).exists()
+    assert store.flush()["written"] == 1
+    assert _read(second)["sections"]["ai_mail"] == {"new": 2}
+
+
+# =============================================
+# SKIPPED WRITES AND COUNTERS
+# =============================================
+
+def test_unchanged_sections_skip_the_write(branch):
+    store = DashboardSectionStore()
+    assert store.write_sections(branch, {"ai_mail": {"new": 0, "last_sync": "10:00"}}) is True
+    mtime = (branch / DASHBOARD_FILENAME).stat().st_mtime_ns
+
+    # Only the volatile sync stamp differs - nothing to write
+    assert store.write_sections(branch, {"ai_mail": {"new": 0, "last_sync": "10:05"}}) is True
+    assert (branch / DASHBOARD_FILENAME).stat().st_mtime_ns == mtime
+
+    stats = store.get_stats()
+    assert stats["writes"] == 1
+    assert stats["writes_skipped"] == 1
+    assert stats["sections_unchanged"] == 1
+
+
+def test_quick_status_recomputed_on_change(branch):
+    store = DashboardSectionStore()
+    store.write_sections(branch, {"ai_mail": {"new": 0}}, quick_status_func=_quick_status)
+    assert _read(branch)["quick_status"] == {"action_required": False}
+
+    store.write_sections(branch, {"ai_mail": {"new": 2}}, quick_status_func=_quick_status)
+    assert _read(branch)["quick_status"] == {"action_required": True}
+
+
+def test_corrupted_dashboard_rebuilt_from_base(branch):
+    (branch / DASHBOARD_FILENAME).write_text("{not json", encoding='utf-8')
+    store = DashboardSectionStore()
+    store.write_sections(branch, {"ai_mail": {"new": 1}},
+                         base_func=lambda path: {"branch": "CUSTOM", "sections": {}})
+    dashboard = _read(branch)
+    assert dashboard["branch"] == "CUSTOM"
+    assert dashboard["sections"] == {"ai_mail": {"new": 1}}
+
+
+def test_failed_write_counted_and_raised(tmp_path):
+    store = DashboardSectionStore()
+    with pytest.raises(OSError):
+        store.write_sections(tmp_path / "missing", {"ai_mail": {"new": 1}})
+    assert store.get_stats()["failures"] == 1
+
+    store.reset_stats()
+    assert all(value == 0 for value in store.get_stats().values())
+
+
+# =============================================
+# LOCKING
+# =============================================
+
+def test_lock_excludes_other_writers(branch):
+    with dashboard_lock(branch):
+        with open(branch / LOCK_FILENAME, 'w', encoding='utf-8') as other:
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(other.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    with open(branch / LOCK_FILENAME, 'w', encoding='utf-8') as other:
+        fcntl.flock(other.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        fcntl.flock(other.fileno(), fcntl.LOCK_UN)
+
+
+def test_concurrent_writers_lose_no_sections(branch):
+    """Independent stores (as in separate processes) writing different sections"""
+    writers, rounds = 8, 15
+    errors = []
+
+    def write(n: int) -> None:
+        store = DashboardSectionStore()
+        try:
+            for i in range(rounds):
+                store.write_sections(branch, {f"service_{n}": {"round": i}})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    sections = _read(branch)["sections"]
+    assert sections == {f"service_{n}": {"round": rounds - 1} for n in range(writers)}
+    assert not [p for p in branch.iterdir() if p.name.endswith(".tmp")]
@@ -4,6 +4,7 @@
 
 from seed.apps.handlers.audit.discovery import discover_branches
 from seed.apps.handlers.audit.branch_audit import audit_branch
+from seed.apps.handlers.audit.parallel_audit import audit_branches, resolve_jobs
 from seed.apps.handlers.audit.bypass_audit import audit_bypasses
 from seed.apps.handlers.audit.display import (
     print_branch_summary,
@@ -14,6 +15,8 @@
 __all__ = [
     'discover_branches',
     'audit_branch',
+    'audit_branches',
+    'resolve_jobs',
     'audit_bypasses',
     'print_branch_summary',
     'print_system_summary',
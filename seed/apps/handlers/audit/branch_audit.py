@@ -4,11 +4,15 @@
 # META DATA HEADER
 # Name: branch_audit.py - Branch Audit Handler
 # Date: 2025-11-29
-# Version: 1.0.0
+# Version: 1.5.0
 # Category: seed/handlers/audit
 #
 # CHANGELOG (Max 5 entries):
-#   - v1.0.0 (2025-11-29): Extracted from standards_audit.py module
+#   - v1.5.0 (2026-10-18): check_branch_files() stage helper; assemble without diagnostics while pyright is still running
+#   - v1.4.1 (2026-10-18): Diagnostics that failed to run score type_check as a failed check
+#   - v1.4.0 (2026-10-18): Accepts precomputed diagnostics (multi-branch audits batch pyright)
+#   - v1.3.0 (2026-10-18): Persistent ResultCache - unchanged files reuse stored checker results
+#   - v1.2.0 (2026-10-18): Split into plan/check/assemble stages so per-file checks can run in worker processes
 #
 # CODE STANDARDS:
 #   - Implementation handler for branch auditing
@@ -19,11 +23,31 @@
 Branch Audit Handler
 
 Audits a single branch for standards compliance.
+
+All checkers receive SourceUnits from one per-audit SourceCache, so each
+file is read and parsed once no matter how many checkers look at it.
+
+An audit runs in three stages:
+    plan_branch()      - which files get which checkers (fixed order)
+    run_file_checks()  - every checker for one file (picklable in and out)
+    assemble_branch()  - fold per-file results into scores and violations
+
+Diagnostics (pyright) are folded in at the assemble stage. Assembling with
+diagnostics_result=None gives the checker scores alone (no type_check
+score yet), which multi-branch audits report while pyright is still running.
+
+audit_branch() runs them serially; parallel_audit runs the middle stage in
+a process pool and assembles with the same function, so scores and
+violation ordering do not depend on where the checks ran.
+
+With a ResultCache, checks whose file, checker source and bypass rules are
+unchanged since the last audit are served from seed_json/audit_cache.db
+and only the rest reach stage 2.
 """
 
 import sys
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 # =============================================================================
 # INFRASTRUCTURE SETUP
@@ -52,24 +76,54 @@
 from seed.apps.handlers.standards import log_level_check
 from seed.apps.handlers.standards import diagnostics_check
 from seed.apps.handlers.config import ignore_handler
+from seed.apps.handlers.standards.source_unit import SourceCache
+from seed.apps.handlers.standards.result_cache import ResultCache
 
 
 # =============================================================================
-# PUBLIC API
+# CHECKER TABLES
 # =============================================================================
 
-def audit_branch(branch: Dict[str, str], bypass_rules: list) -> Dict:
+# Run on the branch entry file (order = score order in the report)
+CHECKERS = {
+    'imports': imports_check,
+    'architecture': architecture_check,
+    'naming': naming_check,
+    'cli': cli_check,
+    'handlers': handlers_check,
+    'modules': modules_check,
+    'documentation': documentation_check,
+    'json_structure': json_structure_check,
+    'testing': testing_check,
+    'error_handling': error_handling_check,
+    'encapsulation': encapsulation_check,
+    'trigger': trigger_check,
+    'log_level': log_level_check
+}
+
+# Re-run on ALL apps/ files (audit = comprehensive)
+ALL_FILES_CHECKERS = ('cli', 'encapsulation', 'error_handling', 'trigger', 'log_level')
+
+
+class CheckerFailed(Exception):
+    """A checker raised while checking a file (message is the original error)"""
+
+
+# =============================================================================
+# STAGE 1 - PLAN
+# =============================================================================
+
+def plan_branch(branch: Dict[str, str]) -> Dict:
     """
-    Audit a branch - checks ALL Python files (audit = comprehensive by definition)
+    Decide which files a branch audit looks at
 
     Args:
         branch: Dict with 'name', 'path', 'entry_file'
-        bypass_rules: List of bypass rules for this branch
 
     Returns:
-        Dict with audit results and scores
+        Dict with branch, entry_file, apps_files ([{'file', 'name'}]) and
+        module_files (apps/modules/*.py paths)
     """
-    file_path = branch['entry_file']
     branch_path = Path(branch['path'])
 
     # Audit checks ALL Python files in apps/ (not just entry point)
@@ -93,29 +147,173 @@ def audit_branch(branch: Dict[str, str], bypass_rules: list) -> Dict:
                 'name': py_file.name
             })
 
-    # Run all checkers
-    checkers = {
-        'imports': imports_check,
-        'architecture': architecture_check,
-        'naming': naming_check,
-        'cli': cli_check,
-        'handlers': handlers_check,
-        'modules': modules_check,
-        'documentation': documentation_check,
-        'json_structure': json_structure_check,
-        'testing': testing_check,
-        'error_handling': error_handling_check,
-        'encapsulation': encapsulation_check,
-        'trigger': trigger_check,
-        'log_level': log_level_check
+    module_files = []
+    modules_dir = branch_path / 'apps' / 'modules'
+    if modules_dir.exists():
+        for py_file in modules_dir.glob('*.py'):
+            if py_file.name == '__init__.py':
+                continue
+            module_files.append(str(py_file))
+
+    return {
+        'branch': branch,
+        'entry_file': branch['entry_file'],
+        'apps_files': all_file_results,
+        'module_files': module_files
     }
 
+
+def file_tasks(plan: Dict) -> List[Tuple[str, Tuple[str, ...]]]:
+    """
+    One (file, checker names) task per distinct file in a plan
+
+    A file picked up by several stages (entry file, apps/, modules/) is one
+    task, so its source is read and parsed once wherever the task runs.
+
+    Returns:
+        Tasks in plan order
+    """
+    tasks: Dict[str, List[str]] = {}
+
+    def add(path: str, names) -> None:
+        wanted = tasks.setdefault(path, [])
+        for name in names:
+            if name not in wanted:
+                wanted.append(name)
+
+    add(plan['entry_file'], CHECKERS)
+    for file_info in plan['apps_files']:
+        add(file_info['file'], ALL_FILES_CHECKERS)
+        # Only check json_handler.py files for configuration issues
+        if 'json_handler' in file_info['name']:
+            add(file_info['file'], ('json_structure',))
+    for module_file in plan['module_files']:
+        add(module_file, ('modules',))
+
+    return [(path, tuple(names)) for path, names in tasks.items()]
+
+
+# =============================================================================
+# STAGE 2 - CHECK
+# =============================================================================
+
+def run_file_checks(file_path: str, checker_names: Tuple[str, ...], bypass_rules: list,
+                    source_cache: Optional[SourceCache] = None) -> Dict[str, Dict]:
+    """
+    Run the named checkers on one file
+
+    Args:
+        file_path: File to check
+        checker_names: Keys of CHECKERS
+        bypass_rules: Bypass rules for the file's branch
+        source_cache: Shared cache (serial audits); a private one is used otherwise
+
+    Returns:
+        Dict with 'results' ({name: checker result}) and 'errors'
+        ({name: message} for checkers that raised)
+    """
+    cache = source_cache if source_cache is not None else SourceCache()
+    unit = cache.get(file_path)
+
+    results = {}
+    errors = {}
+    for name in checker_names:
+        try:
+            results[name] = CHECKERS[name].check_source(unit, bypass_rules=bypass_rules)
+        except Exception as e:
+            errors[name] = str(e)
+
+    return {'results': results, 'errors': errors}
+
+
+def lookup_cached(result_cache: Optional[ResultCache], file_path: str, checker_names: Tuple[str, ...],
+                  bypass_rules: list) -> Tuple[Dict[str, Dict], Tuple[str, ...]]:
+    """
+    Split a file task into cached results and checkers still to run
+
+    Returns:
+        (cached results by name, checker names to run)
+    """
+    if result_cache is None:
+        return {}, checker_names
+    return result_cache.lookup(file_path, {name: CHECKERS[name] for name in checker_names}, bypass_rules)
+
+
+def merge_cached(result_cache: Optional[ResultCache], file_path: str, outcome: Dict,
+                 cached: Dict[str, Dict], bypass_rules: list) -> Dict:
+    """Store fresh run_file_checks() results and fold the cached ones back in"""
+    if result_cache is not None:
+        fresh = outcome['results']
+        result_cache.store(file_path, fresh, {name: CHECKERS[name] for name in fresh}, bypass_rules)
+    outcome['results'].update(cached)
+    return outcome
+
+
+def check_branch_files(plan: Dict, bypass_rules: list,
+                       result_cache: Optional[ResultCache] = None) -> Tuple[Dict[str, Dict], Dict[str, int]]:
+    """
+    Run every planned check in-process, serving unchanged files from the cache
+
+    Args:
+        plan: From plan_branch()
+        bypass_rules: List of bypass rules for this branch
+        result_cache: Persistent result cache (None = check everything)
+
+    Returns:
+        ({file path: run_file_checks() output}, SourceCache stats)
+    """
+    # One SourceUnit per file for the whole audit (text, lines, AST, registry)
+    source_cache = SourceCache()
+
+    checked = {}
+    for file_path, names in file_tasks(plan):
+        cached, missing = lookup_cached(result_cache, file_path, names, bypass_rules)
+        outcome = run_file_checks(file_path, missing, bypass_rules, source_cache)
+        checked[file_path] = merge_cached(result_cache, file_path, outcome, cached, bypass_rules)
+    if result_cache is not None:
+        result_cache.flush()
+
+    return checked, source_cache.get_stats()
+
+
+def _checked(checked: Dict[str, Dict], file_path: str, name: str) -> Dict:
+    """Stored result for (file, checker) - raises CheckerFailed if the checker raised"""
+    outcome = checked[file_path]
+    if name in outcome['errors']:
+        raise CheckerFailed(outcome['errors'][name])
+    return outcome['results'][name]
+
+
+# =============================================================================
+# STAGE 3 - ASSEMBLE
+# =============================================================================
+
+def assemble_branch(plan: Dict, checked: Dict[str, Dict], diagnostics_result: Optional[Dict],
+                    source_stats: Optional[Dict[str, int]] = None) -> Dict:
+    """
+    Fold per-file checker results into a branch audit result
+
+    Args:
+        plan: From plan_branch()
+        checked: {file path: run_file_checks() output} for every file_tasks() task
+        diagnostics_result: diagnostics_check.check_branch() output
+            (None = not run yet: no type_check score, type_errors None)
+        source_stats: SourceCache stats to report (summed across workers)
+
+    Returns:
+        Dict with audit results and scores
+    """
+    branch = plan['branch']
+    file_path = plan['entry_file']
+    branch_path = Path(branch['path'])
+    all_file_results = plan['apps_files']
+
     results = {}
     scores = {}
 
-    for name, checker in checkers.items():
+    for name in CHECKERS:
         try:
-            result = checker.check_module(file_path, bypass_rules=bypass_rules)
+            result = _checked(checked, file_path, name)
             results[name] = result
             scores[name] = result.get('score', 0)
         except Exception as e:
@@ -135,7 +333,7 @@ def audit_branch(branch: Dict[str, str], bypass_rules: list) -> Dict:
     if all_file_results:
         for file_info in all_file_results:
             try:
-                cli_result = cli_check.check_module(file_info['file'], bypass_rules=bypass_rules)
+                cli_result = _checked(checked, file_info['file'], 'cli')
                 cli_scores.append(cli_result.get('score', 0))
                 if not cli_result.get('passed', True):
                     # Found a violation
@@ -158,34 +356,31 @@ def audit_branch(branch: Dict[str, str], bypass_rules: list) -> Dict:
     # Check MODULES standard on ALL files in apps/modules/ (thin orchestration + business logic)
     modules_violations = []
     modules_scores = []
-    modules_dir = Path(branch['path']) / 'apps' / 'modules'
-    if modules_dir.exists():
-        for py_file in modules_dir.glob('*.py'):
-            if py_file.name == '__init__.py':
-                continue
-            try:
-                modules_result = modules_check.check_module(str(py_file), bypass_rules=bypass_rules)
-                modules_scores.append(modules_result.get('score', 0))
-                # Check for thin orchestration AND business logic violations
-                for check in modules_result.get('checks', []):
-                    # Capture thin orchestration violations
-                    if check['name'] == 'Thin orchestration' and not check['passed']:
-                        modules_violations.append({
-                            'file': py_file.name,
-                            'path': str(py_file),
-                            'score': modules_result.get('score', 0),
-                            'message': check.get('message', 'Unknown')
-                        })
-                    # Capture business logic violations
-                    elif check['name'] == 'No business logic' and not check['passed']:
-                        modules_violations.append({
-                            'file': py_file.name,
-                            'path': str(py_file),
-                            'score': modules_result.get('score', 0),
-                            'message': check.get('message', 'Unknown')
-                        })
-            except Exception:
-                pass
+    for module_file in plan['module_files']:
+        py_file = Path(module_file)
+        try:
+            modules_result = _checked(checked, module_file, 'modules')
+            modules_scores.append(modules_result.get('score', 0))
+            # Check for thin orchestration AND business logic violations
+            for check in modules_result.get('checks', []):
+                # Capture thin orchestration violations
+                if check['name'] == 'Thin orchestration' and not check['passed']:
+                    modules_violations.append({
+                        'file': py_file.name,
+                        'path': str(py_file),
+                        'score': modules_result.get('score', 0),
+                        'message': check.get('message', 'Unknown')
+                    })
+                # Capture business logic violations
+                elif check['name'] == 'No business logic' and not check['passed']:
+                    modules_violations.append({
+                        'file': py_file.name,
+                        'path': str(py_file),
+                        'score': modules_result.get('score', 0),
+                        'message': check.get('message', 'Unknown')
+                    })
+        except Exception:
+            pass
 
     # Update modules score to reflect ALL module files
     if modules_scores:
@@ -199,7 +394,7 @@ def audit_branch(branch: Dict[str, str], bypass_rules: list) -> Dict:
     if all_file_results:
         for file_info in all_file_results:
             try:
-                encap_result = encapsulation_check.check_module(file_info['file'], bypass_rules=bypass_rules)
+                encap_result = _checked(checked, file_info['file'], 'encapsulation')
                 encapsulation_scores.append(encap_result.get('score', 0))
                 if not encap_result.get('passed', True):
                     failed_checks = [c for c in encap_result.get('checks', []) if not c.get('passed', False)]
@@ -223,7 +418,7 @@ def audit_branch(branch: Dict[str, str], bypass_rules: list) -> Dict:
     if all_file_results:
         for file_info in all_file_results:
             try:
-                eh_result = error_handling_check.check_module(file_info['file'], bypass_rules=bypass_rules)
+                eh_result = _checked(checked, file_info['file'], 'error_handling')
                 eh_score = eh_result.get('score', 0)
                 # Only count if checks were actually run (not skipped entry points)
                 if eh_result.get('checks', []):
@@ -251,7 +446,7 @@ def audit_branch(branch: Dict[str, str], bypass_rules: list) -> Dict:
     if all_file_results:
         for file_info in all_file_results:
             try:
-                trig_result = trigger_check.check_module(file_info['file'], bypass_rules=bypass_rules)
+                trig_result = _checked(checked, file_info['file'], 'trigger')
                 trig_score = trig_result.get('score', 0)
                 if trig_result.get('checks', []):
                     trigger_scores.append(trig_score)
@@ -278,7 +473,7 @@ def audit_branch(branch: Dict[str, str], bypass_rules: list) -> Dict:
     if all_file_results:
         for file_info in all_file_results:
             try:
-                ll_result = log_level_check.check_module(file_info['file'], bypass_rules=bypass_rules)
+                ll_result = _checked(checked, file_info['file'], 'log_level')
                 ll_score = ll_result.get('score', 0)
                 if ll_result.get('checks', []):
                     log_level_scores.append(ll_score)
@@ -312,7 +507,7 @@ def audit_branch(branch: Dict[str, str], bypass_rules: list) -> Dict:
             if 'json_handler' not in file_info['name']:
                 continue
             try:
-                json_result = json_structure_check.check_module(file_path, bypass_rules=bypass_rules)
+                json_result = _checked(checked, file_path, 'json_structure')
                 json_score = json_result.get('score', 0)
                 checks = json_result.get('checks', [])
                 if checks and not any('skipped' in c.get('message', '').lower() for c in checks):
@@ -334,13 +529,19 @@ def audit_branch(branch: Dict[str, str], bypass_rules: list) -> Dict:
         scores['json_structure'] = int(sum(json_structure_scores) / len(json_structure_scores))
         avg_score = int(sum(scores.values()) / len(scores)) if scores else 0
 
-    # Run TYPE ERROR diagnostics on the branch (pyright)
-    diagnostics_result = diagnostics_check.check_branch(str(branch_path))
-    type_errors = diagnostics_result.get('total_errors', 0)
-    type_error_files = diagnostics_result.get('results', [])
-
-    # Type check score: binary - 100% if 0 errors, 0% if any errors
-    scores['type_check'] = 100 if type_errors == 0 else 0
+    # TYPE ERROR diagnostics on the branch (pyright)
+    type_errors = None
+    type_error_files = []
+    if diagnostics_result is not None:
+        type_errors = diagnostics_result.get('total_errors', 0)
+        type_error_files = diagnostics_result.get('results', [])
+
+        # Type check score: binary - 100% if 0 errors, 0% if any errors
+        scores['type_check'] = 100 if type_errors == 0 else 0
+        if diagnostics_result.get('failed'):
+            # Diagnostics never ran (task died) - a failed check, not a clean branch
+            results['type_check'] = {'passed': False, 'score': 0, 'error': diagnostics_result.get('error', '')}
+            scores['type_check'] = 0
     avg_score = int(sum(scores.values()) / len(scores)) if scores else 0
 
     # Check for deprecated DOCUMENTS/ directory (should be docs/)
@@ -370,5 +571,35 @@ def audit_branch(branch: Dict[str, str], bypass_rules: list) -> Dict:
         'deprecated_patterns': deprecated_patterns,
         'files_checked': len(all_file_results),
         'type_errors': type_errors,
-        'type_error_files': type_error_files
+        'type_error_files': type_error_files,
+        'source_cache': source_stats or {}
     }
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def audit_branch(branch: Dict[str, str], bypass_rules: list,
+                 result_cache: Optional[ResultCache] = None,
+                 diagnostics_result: Optional[Dict] = None) -> Dict:
+    """
+    Audit a branch - checks ALL Python files (audit = comprehensive by definition)
+
+    Args:
+        branch: Dict with 'name', 'path', 'entry_file'
+        bypass_rules: List of bypass rules for this branch
+        result_cache: Persistent result cache (None = check everything)
+        diagnostics_result: check_branch() output if already computed
+
+    Returns:
+        Dict with audit results and scores
+    """
+    plan = plan_branch(branch)
+    checked, source_stats = check_branch_files(plan, bypass_rules, result_cache)
+
+    # Run TYPE ERROR diagnostics on the branch (pyright)
+    if diagnostics_result is None:
+        diagnostics_result = diagnostics_check.check_branch(str(branch['path']))
+
+    return assemble_branch(plan, checked, diagnostics_result, source_stats)
@@ -0,0 +1,279 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: parallel_audit.py - Parallel Audit Handler
+# Date: 2026-10-18
+# Version: 1.3.0
+# Category: seed/handlers/audit
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.3.0 (2026-10-18): Branches reported when their own checks finish - type_check folded in once pyright returns
+#   - v1.2.1 (2026-10-18): A failed worker task is recorded as failed checks for its files/branches instead of aborting the audit
+#   - v1.2.0 (2026-10-18): One batched pyright run for all branches instead of one per branch
+#   - v1.1.0 (2026-10-18): Cache lookups in the parent - only uncached checks are shipped to workers
+#
+# CODE STANDARDS:
+#   - Implementation handler for audit scheduling
+#   - No display - progress goes to the caller's callback
+# =============================================
+
+"""
+Parallel Audit Handler
+
+Runs a multi-branch audit across a process pool.
+
+Work units are chunks of (branch, file) tasks - every checker planned for
+a file runs in the same task so the file is parsed once, and files are
+shipped FILES_PER_TASK at a time to keep pickling/IPC overhead below the
+cost of the checks - plus ONE pyright diagnostics task covering every
+branch (diagnostics_check.check_branches).
+
+Results are folded with branch_audit.assemble_branch() in plan order, so
+scores, violation lists and the returned branch order match a serial audit
+exactly.
+
+A branch is handed to on_branch_done as soon as its own file checks
+finish, without waiting for the all-branch pyright run: if diagnostics are
+still running the reported result has the checker scores only (no
+'type_check' in scores, type_errors None). Returned results are assembled
+once diagnostics are in, always in input order. A task that dies in
+the pool (worker crash, unpicklable result) does not abort the audit: its
+checks are recorded as failed with the error, exactly like a checker that
+raised.
+
+With a ResultCache, lookups and stores happen in the parent only: workers
+receive just the checks that missed, and a file whose checks all hit never
+leaves the parent process.
+
+Usage:
+    results = audit_branches(branches, bypass_rules_map, jobs=8,
+                             on_branch_done=lambda result, done, total: ...)
+"""
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# =============================================================================
+# INFRASTRUCTURE SETUP
+# =============================================================================
+
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+sys.path.insert(0, str(Path.home()))
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from seed.apps.handlers.audit.branch_audit import (
+    plan_branch,
+    file_tasks,
+    run_file_checks,
+    check_branch_files,
+    assemble_branch,
+    lookup_cached,
+    merge_cached
+)
+from seed.apps.handlers.standards import diagnostics_check
+from seed.apps.handlers.standards.source_unit import SourceCache
+from seed.apps.handlers.standards.result_cache import ResultCache
+
+BranchDoneFunc = Callable[[Dict, int, int], None]
+
+STAT_KEYS = ('units', 'hits', 'reads', 'parses')
+
+# Files per pool task (one file per task spends more time in IPC than checking)
+FILES_PER_TASK = 8
+
+
+# =============================================================================
+# WORKER TASKS
+# =============================================================================
+
+def _files_task(tasks: List[tuple], bypass_rules: list) -> Dict:
+    """Worker: all planned checkers for a chunk of files, plus read/parse counters"""
+    cache = SourceCache()
+    checked = {
+        file_path: run_file_checks(file_path, names, bypass_rules, cache)
+        for file_path, names in tasks
+    }
+    return {'checked': checked, 'stats': cache.get_stats()}
+
+
+def _diagnostics_task(branch_paths: List[str]) -> Dict[str, Dict]:
+    """Worker: pyright diagnostics for all branches in one run"""
+    return diagnostics_check.check_branches(branch_paths)
+
+
+def _failed_diagnostics(error: str) -> Dict:
+    """check_branch()-shaped result for a diagnostics task that did not complete"""
+    return {
+        'total_files': 0,
+        'files_with_errors': 0,
+        'total_errors': 0,
+        'total_warnings': 0,
+        'results': [],
+        'error': error,
+        'failed': True
+    }
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """
+    Normalize a --jobs value
+
+    Args:
+        jobs: Requested workers (0 or None = one per CPU)
+
+    Returns:
+        Worker count >= 1
+    """
+    if not jobs or jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def audit_branches(branches: List[Dict[str, str]], bypass_rules_map: Dict[str, list],
+                   jobs: int = 1, on_branch_done: Optional[BranchDoneFunc] = None,
+                   result_cache: Optional[ResultCache] = None) -> List[Dict]:
+    """
+    Audit several branches, serially or across a process pool
+
+    Args:
+        branches: Branch dicts from discover_branches()
+        bypass_rules_map: {branch name: bypass rules}
+        jobs: Worker processes (1 = in-process serial audit)
+        on_branch_done: Called as (result, completed, total) when a branch's checks finish
+            (result has no type_check score if pyright is still running)
+        result_cache: Persistent result cache (None = check everything)
+
+    Returns:
+        audit_branch() results in the same order as branches
+    """
+    total = len(branches)
+
+    branch_paths = [str(branch['path']) for branch in branches]
+
+    plans = [plan_branch(branch) for branch in branches]
+
+    if jobs <= 1 or total == 0:
+        checked_branches = []
+        for index, plan in enumerate(plans):
+            checked, source_stats = check_branch_files(
+                plan, bypass_rules_map.get(plan['branch']['name'], []), result_cache)
+            checked_branches.append((checked, source_stats))
+            if on_branch_done:
+                on_branch_done(assemble_branch(plan, checked, None, source_stats), index + 1, total)
+        diagnostics_map = diagnostics_check.check_branches(branch_paths) if branches else {}
+        return [
+            assemble_branch(plan, checked, diagnostics_map[branch_path], source_stats)
+            for plan, (checked, source_stats), branch_path in zip(plans, checked_branches, branch_paths)
+        ]
+
+    pending = [0] * total
+    checked: List[Dict[str, Dict]] = [{} for _ in branches]
+    stats = [{key: 0 for key in STAT_KEYS} for _ in branches]
+    diagnostics: List[Optional[Dict]] = [None] * total
+    results: List[Optional[Dict]] = [None] * total
+    completed = 0
+
+    # Cache lookups up front, then close the connection so no worker inherits it
+    to_run: List[List[tuple]] = [[] for _ in branches]
+    for index, plan in enumerate(plans):
+        bypass_rules = bypass_rules_map.get(plan['branch']['name'], [])
+        for file_path, names in file_tasks(plan):
+            cached, missing = lookup_cached(result_cache, file_path, names, bypass_rules)
+            checked[index][file_path] = {'results': cached, 'errors': {}}
+            if missing:
+                to_run[index].append((file_path, missing))
+    if result_cache is not None:
+        result_cache.release()
+
+    # fork: workers inherit loaded checkers and sys.path (no re-import per worker)
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        futures = {}
+
+        # pyright is the long pole - one run for every branch, started first.
+        # It is not counted in any branch's pending tasks: branches report on their own checks
+        future = pool.submit(_diagnostics_task, branch_paths)
+        futures[future] = (None, 'diagnostics', None)
+
+        for index, plan in enumerate(plans):
+            bypass_rules = bypass_rules_map.get(plan['branch']['name'], [])
+            tasks = to_run[index]
+            for start in range(0, len(tasks), FILES_PER_TASK):
+                chunk_tasks = tasks[start:start + FILES_PER_TASK]
+                future = pool.submit(_files_task, chunk_tasks, bypass_rules)
+                futures[future] = (index, 'files', chunk_tasks)
+                pending[index] += 1
+
+        def report(index: int) -> None:
+            nonlocal completed
+            if result_cache is not None:
+                result_cache.flush()
+            result = assemble_branch(plans[index], checked[index], diagnostics[index], stats[index])
+            if diagnostics[index] is not None:
+                results[index] = result
+            completed += 1
+            if on_branch_done:
+                on_branch_done(result, completed, total)
+
+        def finish(index: int) -> None:
+            pending[index] -= 1
+            if not pending[index]:
+                report(index)
+
+        # Branches served entirely from the cache have nothing left to wait for
+        for index in range(total):
+            if not pending[index]:
+                report(index)
+
+        for future in as_completed(futures):
+            index, kind, chunk_tasks = futures[future]
+            if kind == 'diagnostics':
+                try:
+                    diagnostics_map = future.result()
+                except Exception as e:
+                    diagnostics_map = {path: _failed_diagnostics(f"Diagnostics task failed: {e}")
+                                       for path in branch_paths}
+                for branch_index, branch_path in enumerate(branch_paths):
+                    diagnostics[branch_index] = diagnostics_map[branch_path]
+                    if not pending[branch_index]:
+                        # Already reported - fold type_check into the returned result
+                        results[branch_index] = assemble_branch(plans[branch_index], checked[branch_index],
+                                                                diagnostics[branch_index], stats[branch_index])
+            else:
+                try:
+                    chunk = future.result()
+                except Exception as e:
+                    # Every check shipped in this chunk failed - keep the cached ones
+                    error = f"Audit task failed: {e}"
+                    for file_path, names in chunk_tasks:
+                        checked[index][file_path]['errors'] = {name: error for name in names}
+                    finish(index)
+                    continue
+                bypass_rules = bypass_rules_map.get(plans[index]['branch']['name'], [])
+                for file_path, outcome in chunk['checked'].items():
+                    cached = checked[index][file_path]['results']
+                    checked[index][file_path] = merge_cached(result_cache, file_path, outcome,
+                                                             cached, bypass_rules)
+                for key in STAT_KEYS:
+                    stats[index][key] += chunk['stats'].get(key, 0)
+                finish(index)
+
+    unfinished = [branches[index]['name'] for index, result in enumerate(results) if result is None]
+    if unfinished:
+        raise RuntimeError(f"Audit did not complete for: {', '.join(unfinished)}")
+    return results
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: __init__.py - Diagnostics Handlers Package
 # Date: 2025-11-29
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: seed/handlers/diagnostics
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): Exports run_all_diagnostics and PyrightEngine
 #   - v0.1.0 (2025-11-29): Initial implementation - exports discovery and runner
 #
 # CODE STANDARDS:
@@ -20,12 +21,17 @@
 Exports:
     - discover_branches: Discover all branches from registry
     - run_branch_diagnostics: Run diagnostics on a single branch
+    - run_all_diagnostics: Run diagnostics on many branches (one pyright run)
+    - PyrightEngine: Batched, cached pyright diagnostics
 """
 
 from seed.apps.handlers.diagnostics.discovery import discover_branches
-from seed.apps.handlers.diagnostics.runner import run_branch_diagnostics
+from seed.apps.handlers.diagnostics.runner import run_branch_diagnostics, run_all_diagnostics
+from seed.apps.handlers.diagnostics.pyright_engine import PyrightEngine
 
 __all__ = [
     'discover_branches',
     'run_branch_diagnostics',
+    'run_all_diagnostics',
+    'PyrightEngine',
 ]
@@ -0,0 +1,411 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: pyright_engine.py - Batched Pyright Diagnostics Engine
+# Date: 2026-10-18
+# Version: 0.1.0
+# Category: seed/handlers/diagnostics
+#
+# CHANGELOG (Max 5 entries):
+#   - v0.1.0 (2026-10-18): Initial implementation - one pyright run per request, per-file results cached by hash + dependency mtimes
+#
+# CODE STANDARDS:
+#   - Handlers implement, modules orchestrate
+#   - Cache failures disable the cache, never the diagnostics
+# =============================================
+
+"""
+Batched Pyright Diagnostics Engine
+
+Every pyright process boots Node and re-analyzes the shared imports, so
+running it per file or per directory multiplies the same work. The engine
+takes the full list of files a command needs, answers what it can from the
+cache and runs ONE pyright invocation over the rest (split only if the
+command line would get too long), then maps diagnostics back per file.
+
+Per-file results live in seed_json/diagnostics_cache.db, keyed by:
+
+    content_hash - sha1 of the file (reused while mtime/size are unchanged)
+    deps_key     - sha1 of (path, mtime_ns) for every local module the file
+                   imports directly, so editing an imported module re-checks
+                   its importers
+
+Results are never cached when pyright fails (missing, timeout, bad output).
+
+Usage:
+    engine = PyrightEngine()
+    per_file = engine.check_files(["/home/aipass/seed/apps/seed.py", ...])
+    engine.close()
+"""
+
+import ast
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Infrastructure
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+sys.path.insert(0, str(Path.home()))
+
+CACHE_DB_PATH = Path.home() / "seed" / "seed_json" / "diagnostics_cache.db"
+SCHEMA_VERSION = "1"
+
+PYRIGHT_COMMAND = ['python3', '-m', 'pyright', '--outputjson']
+PYRIGHT_TIMEOUT = 600
+
+# Keep each invocation's argv well under ARG_MAX
+MAX_ARGV_CHARS = 100_000
+
+# Roots absolute imports resolve against (plus the file's own branch root)
+IMPORT_ROOTS = (Path.home(), AIPASS_ROOT)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    deps TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    path TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    deps_key TEXT NOT NULL,
+    result TEXT NOT NULL
+);
+"""
+
+
+# =============================================
+# DEPENDENCIES
+# =============================================
+
+def _branch_root(path: Path) -> Optional[Path]:
+    """Directory holding the file's apps/ package ('from apps.x import y' resolves there)"""
+    for parent in path.parents:
+        if parent.name == 'apps':
+            return parent.parent
+    return None
+
+
+def _module_file(root: Path, dotted: str) -> Optional[Path]:
+    if not dotted:
+        return None
+    base = root.joinpath(*dotted.split('.'))
+    for candidate in (base.with_suffix('.py'), base / '__init__.py'):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def resolve_dependencies(file_path: str, source: str) -> List[str]:
+    """
+    Local module files a source file imports directly
+
+    Third-party and stdlib imports are not tracked (they do not change
+    between audits the way branch code does).
+
+    Returns:
+        Sorted, de-duplicated file paths
+    """
+    try:
+        tree = ast.parse(source, filename=file_path)
+    except (SyntaxError, ValueError):
+        return []
+
+    path = Path(file_path)
+    roots = list(IMPORT_ROOTS)
+    branch_root = _branch_root(path)
+    if branch_root is not None:
+        roots.append(branch_root)
+
+    found = set()
+
+    def add_absolute(dotted: str) -> None:
+        for root in roots:
+            target = _module_file(root, dotted)
+            if target is not None:
+                found.add(str(target))
+                return
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                add_absolute(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                package = path.parent
+                for _ in range(node.level - 1):
+                    package = package.parent
+                module = node.module or ''
+                target = _module_file(package, module) if module else None
+                if target is not None:
+                    found.add(str(target))
+                base = package.joinpath(*module.split('.')) if module else package
+                for alias in node.names:
+                    sub = _module_file(base, alias.name)
+                    if sub is not None:
+                        found.add(str(sub))
+            else:
+                add_absolute(node.module or '')
+                for alias in node.names:
+                    add_absolute(f"{node.module}.{alias.name}")
+
+    found.discard(str(path))
+    return sorted(found)
+
+
+def _deps_key(deps: List[str]) -> str:
+    stamps = []
+    for dep in deps:
+        try:
+            stamps.append((dep, os.stat(dep).st_mtime_ns))
+        except OSError:
+            stamps.append((dep, None))
+    return hashlib.sha1(json.dumps(stamps).encode('utf-8')).hexdigest()
+
+
+# =============================================
+# PYRIGHT
+# =============================================
+
+def _empty_result(file_path: str) -> Dict:
+    return {'file': file_path, 'errors': 0, 'warnings': 0, 'diagnostics': []}
+
+
+def _chunks(files: List[str]) -> List[List[str]]:
+    chunks: List[List[str]] = [[]]
+    size = 0
+    for file_path in files:
+        if chunks[-1] and size + len(file_path) + 1 > MAX_ARGV_CHARS:
+            chunks.append([])
+            size = 0
+        chunks[-1].append(file_path)
+        size += len(file_path) + 1
+    return chunks if chunks[0] else []
+
+
+def run_pyright(files: List[str], timeout: int = PYRIGHT_TIMEOUT) -> Tuple[Dict[str, Dict], Optional[str], int]:
+    """
+    Run pyright over many files and split its diagnostics per file
+
+    Args:
+        files: Python files to analyze (diagnostics are reported for these only)
+        timeout: Seconds per invocation
+
+    Returns:
+        (results by requested path, error message or None, pyright invocations)
+    """
+    results = {file_path: _empty_result(file_path) for file_path in files}
+    by_resolved = {str(Path(file_path).resolve()): file_path for file_path in files}
+    runs = 0
+
+    for chunk in _chunks(files):
+        runs += 1
+        try:
+            completed = subprocess.run(
+                PYRIGHT_COMMAND + chunk,
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            return {}, 'Pyright timed out', runs
+        except Exception as e:
+            return {}, str(e), runs
+
+        try:
+            output = json.loads(completed.stdout)
+        except json.JSONDecodeError:
+            return {}, f'Failed to parse pyright output: {completed.stderr or completed.stdout}', runs
+
+        for diag in output.get('generalDiagnostics', []):
+            reported = diag.get('file', '')
+            file_path = by_resolved.get(str(Path(reported).resolve())) if reported else None
+            if file_path is None:
+                continue
+
+            entry = results[file_path]
+            severity = diag.get('severity', 'error')
+            if severity == 'error':
+                entry['errors'] += 1
+            elif severity == 'warning':
+                entry['warnings'] += 1
+
+            entry['diagnostics'].append({
+                'line': diag.get('range', {}).get('start', {}).get('line', 0) + 1,
+                'severity': severity,
+                'message': diag.get('message', 'Unknown error'),
+                'rule': diag.get('rule', '')
+            })
+
+    return results, None, runs
+
+
+# =============================================
+# ENGINE
+# =============================================
+
+class PyrightEngine:
+    """Cached, batched pyright diagnostics
+
+    Counters (get_stats):
+        cached: Files answered from the cache
+        analyzed: Files sent to pyright
+        pyright_runs: pyright processes started
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, enabled: bool = True):
+        self.db_path = Path(db_path) if db_path else CACHE_DB_PATH
+        self.enabled = enabled
+        self.error: Optional[str] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self.stats = {'cached': 0, 'analyzed': 0, 'pyright_runs': 0}
+
+    # ---------- connection ----------
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if not self.enabled:
+            return None
+        if self._conn is None:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.db_path), timeout=10)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA)
+                row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+                if row is None or row[0] != SCHEMA_VERSION:
+                    conn.execute("DELETE FROM results")
+                    conn.execute("DELETE FROM files")
+                    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)",
+                                 (SCHEMA_VERSION,))
+                    conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                self._disable(e)
+        return self._conn
+
+    def _disable(self, error: Exception) -> None:
+        """Turn the cache off for this run (diagnostics carry on uncached)"""
+        self.enabled = False
+        self.error = str(error)
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def close(self) -> None:
+        """Commit and close"""
+        if self._conn is not None:
+            try:
+                self._conn.commit()
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    # ---------- keys ----------
+
+    def _file_key(self, conn: sqlite3.Connection, file_path: str) -> Optional[Tuple[str, str]]:
+        """(content_hash, deps_key) for a file, re-reading it only if mtime/size moved"""
+        try:
+            st = os.stat(file_path)
+            row = conn.execute(
+                "SELECT mtime_ns, size, content_hash, deps FROM files WHERE path = ?", (file_path,)
+            ).fetchone()
+            if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+                content_hash, deps = row[2], json.loads(row[3])
+            else:
+                with open(file_path, 'rb') as f:
+                    data = f.read()
+                content_hash = hashlib.sha1(data).hexdigest()
+                deps = resolve_dependencies(file_path, data.decode('utf-8', errors='replace'))
+                conn.execute(
+                    "INSERT OR REPLACE INTO files (path, mtime_ns, size, content_hash, deps) VALUES (?, ?, ?, ?, ?)",
+                    (file_path, st.st_mtime_ns, st.st_size, content_hash, json.dumps(deps))
+                )
+        except OSError:
+            return None
+        return content_hash, _deps_key(deps)
+
+    # ---------- public ----------
+
+    def check_files(self, files: List[str], timeout: int = PYRIGHT_TIMEOUT) -> Tuple[Dict[str, Dict], Optional[str]]:
+        """
+        Diagnostics for many files - cache first, one pyright run for the rest
+
+        Args:
+            files: Python files to check
+            timeout: Seconds per pyright invocation
+
+        Returns:
+            (results by path in input order, error message or None). On error
+            only the cached files have results.
+        """
+        files = list(dict.fromkeys(str(f) for f in files))
+        results: Dict[str, Dict] = {}
+        keys: Dict[str, Tuple[str, str]] = {}
+        missing: List[str] = []
+
+        conn = self._connect()
+        for file_path in files:
+            key = None
+            if conn is not None:
+                try:
+                    key = self._file_key(conn, file_path)
+                    row = conn.execute(
+                        "SELECT content_hash, deps_key, result FROM results WHERE path = ?", (file_path,)
+                    ).fetchone() if key else None
+                except sqlite3.Error as e:
+                    self._disable(e)
+                    conn, key, row = None, None, None
+                if key and row and (row[0], row[1]) == key:
+                    results[file_path] = json.loads(row[2])
+                    self.stats['cached'] += 1
+                    continue
+            if key:
+                keys[file_path] = key
+            missing.append(file_path)
+
+        error = None
+        if missing:
+            fresh, error, runs = run_pyright(missing, timeout)
+            self.stats['analyzed'] += len(missing)
+            self.stats['pyright_runs'] += runs
+            if error is None:
+                results.update(fresh)
+                conn = self._connect()
+                if conn is not None:
+                    try:
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO results (path, content_hash, deps_key, result) VALUES (?, ?, ?, ?)",
+                            [(f, keys[f][0], keys[f][1], json.dumps(fresh[f])) for f in missing if f in keys]
+                        )
+                    except sqlite3.Error as e:
+                        self._disable(e)
+
+        if self._conn is not None:
+            try:
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._disable(e)
+
+        return {f: results[f] for f in files if f in results}, error
+
+    def get_stats(self) -> Dict:
+        """Counter snapshot plus enabled flag and any cache error"""
+        return {**self.stats, 'enabled': self.enabled, 'error': self.error}
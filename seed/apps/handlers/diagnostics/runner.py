@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: runner.py - Branch Diagnostics Runner Handler
 # Date: 2025-11-29
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: seed/handlers/diagnostics
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): run_all_diagnostics - every branch in one batched pyright run
 #   - v0.1.0 (2025-11-29): Initial implementation - run diagnostics on branches
 #
 # CODE STANDARDS:
@@ -17,12 +18,13 @@
 """
 Branch Diagnostics Runner Handler
 
-Runs diagnostics checks on individual branches.
+Runs diagnostics checks on individual branches, or on many branches at
+once through a single batched pyright run.
 """
 
 import sys
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 # Infrastructure
 AIPASS_ROOT = Path.home() / "aipass_core"
@@ -51,3 +53,28 @@ def run_branch_diagnostics(branch: Dict) -> Dict:
     result['path'] = branch_path
 
     return result
+
+
+def run_all_diagnostics(branches: List[Dict]) -> List[Dict]:
+    """
+    Run diagnostics on many branches with one pyright invocation
+
+    Args:
+        branches: Dicts with 'name', 'path'
+
+    Returns:
+        List of diagnostics results in the same order as branches
+    """
+    from seed.apps.handlers.standards.diagnostics_check import check_branches
+
+    by_path = check_branches([branch.get('path', '') for branch in branches])
+
+    results = []
+    for branch in branches:
+        branch_path = branch.get('path', '')
+        result = dict(by_path[branch_path])
+        result['branch'] = branch.get('name', 'UNKNOWN')
+        result['path'] = branch_path
+        results.append(result)
+
+    return results
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: architecture_check.py - Architecture Standards Checker Handler
 # Date: 2025-11-21
-# Version: 0.3.0
+# Version: 0.4.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.4.0 (2026-10-18): check_source(SourceUnit) interface - shared parse-once source, check_module kept as shim
 #   - v0.3.0 (2025-11-21): Template registry as source of truth - all branches measured against template
 #   - v0.2.0 (2025-11-21): Added template baseline verification - checks branch structure compliance
 #   - v0.1.0 (2025-11-15): Initial implementation - architecture standards checking
@@ -34,6 +35,8 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 sys.path.insert(0, str(Path.home()))
 
+from seed.apps.handlers.standards.source_unit import SourceUnit
+
 # Import from sibling handler package
 SEED_ROOT = Path.home() / "seed"
 sys.path.insert(0, str(SEED_ROOT))
@@ -62,12 +65,12 @@ def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_r
     return False
 
 
-def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+def check_source(unit: SourceUnit, bypass_rules: list | None = None) -> Dict:
     """
     Check if module follows architecture standards
 
     Args:
-        module_path: Path to Python module to check
+        unit: SourceUnit for the file to check (see source_unit.py)
         bypass_rules: Optional list of bypass rules for this file
 
     Returns:
@@ -85,7 +88,8 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
     """
     checks = []
-    path = Path(module_path)
+    module_path = unit.module_path
+    path = unit.path
 
     # Check if entire standard is bypassed for this file
     if is_bypassed(module_path, 'architecture', bypass_rules=bypass_rules):
@@ -97,7 +101,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Validate file exists
-    if not path.exists():
+    if not unit.exists:
         return {
             'passed': False,
             'checks': [{'name': 'File exists', 'passed': False, 'message': f'File not found: {module_path}'}],
@@ -106,18 +110,16 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Read file
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-    except Exception as e:
+    if unit.read_error is not None:
         return {
             'passed': False,
-            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {e}'}],
+            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {unit.read_error}'}],
             'score': 0,
             'standard': 'ARCHITECTURE'
         }
 
+    lines = unit.lines
+
     # Determine file location and type
     is_entry_point = path.name.endswith('.py') and 'apps/' in module_path and path.parent.name == 'apps'
     is_module = 'apps/modules/' in module_path
@@ -166,6 +168,11 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     }
 
 
+def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+    """Path-based entry point (reads the file fresh) - see check_source"""
+    return check_source(SourceUnit.load(module_path), bypass_rules=bypass_rules)
+
+
 def check_layer_location(module_path: str, is_entry_point: bool, is_module: bool, is_handler: bool) -> Dict:
     """
     Check if file is in correct architectural layer
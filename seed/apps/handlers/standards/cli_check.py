@@ -4,15 +4,15 @@
 # META DATA HEADER
 # Name: cli_check.py - CLI Standards Checker Handler
 # Date: 2025-11-22
-# Version: 0.5.0
+# Version: 0.6.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.6.0 (2026-10-18): check_source(SourceUnit) interface - shared parse-once source, check_module kept as shim
 #   - v0.5.0 (2025-12-04): Fixed single-line docstring bug - """text""" no longer breaks detection
 #   - v0.4.0 (2025-11-28): Added if __name__ == '__main__' block exclusion (fixes 100% false positives)
 #   - v0.3.0 (2025-11-22): Added CLI branch exemption - CLI uses internal imports (it's the implementation)
 #   - v0.2.0 (2025-11-21): Fixed path detection bug - now handles both absolute and relative paths
-#   - v0.1.0 (2025-11-15): Initial implementation - CLI standards checking
 #
 # CODE STANDARDS:
 #   - Handler implements checking logic, module orchestrates
@@ -35,6 +35,8 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 sys.path.insert(0, str(Path.home()))
 
+from seed.apps.handlers.standards.source_unit import SourceUnit
+
 
 def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_rules: list | None = None) -> bool:
     """Check if a violation should be bypassed"""
@@ -58,12 +60,12 @@ def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_r
     return False
 
 
-def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+def check_source(unit: SourceUnit, bypass_rules: list | None = None) -> Dict:
     """
     Check if module follows CLI standards
 
     Args:
-        module_path: Path to Python module to check
+        unit: SourceUnit for the file to check (see source_unit.py)
         bypass_rules: Optional list of bypass rules for specific violations
 
     Returns:
@@ -81,7 +83,8 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
     """
     checks = []
-    path = Path(module_path)
+    module_path = unit.module_path
+    path = unit.path
 
     # Check if entire standard is bypassed for this file
     if is_bypassed(module_path, 'cli', bypass_rules=bypass_rules):
@@ -93,7 +96,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Validate file exists
-    if not path.exists():
+    if not unit.exists:
         return {
             'passed': False,
             'checks': [{'name': 'File exists', 'passed': False, 'message': f'File not found: {module_path}'}],
@@ -102,18 +105,17 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Read file
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-    except Exception as e:
+    if unit.read_error is not None:
         return {
             'passed': False,
-            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {e}'}],
+            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {unit.read_error}'}],
             'score': 0,
             'standard': 'CLI'
         }
 
+    content = unit.text
+    lines = unit.lines
+
     # Determine file type (handle both absolute and relative paths)
     is_handler = 'handlers/' in module_path
     is_module = 'modules/' in module_path
@@ -164,6 +166,11 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     }
 
 
+def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+    """Path-based entry point (reads the file fresh) - see check_source"""
+    return check_source(SourceUnit.load(module_path), bypass_rules=bypass_rules)
+
+
 def check_handler_separation(content: str) -> Dict:
     """
     Check that handlers don't have console output
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: diagnostics_check.py - Type Error Diagnostics Checker
 # Date: 2025-11-28
-# Version: 0.2.0
+# Version: 0.3.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.3.0 (2026-10-18): Batched pyright engine - one run per request, cached per file, check_branches()
 #   - v0.2.0 (2025-11-28): Added Rich console output, Prax logger
 #   - v0.1.0 (2025-11-28): Initial implementation - pyright integration
 #
@@ -20,13 +21,17 @@
 
 Uses pyright to detect type errors, undefined variables, and other
 static analysis issues that would show as Pylance errors in VS Code.
+
+All entry points go through the batched PyrightEngine: files are answered
+from the diagnostics cache where possible and the rest share a single
+pyright invocation. check_branches() covers a whole system scan with one
+run instead of one per branch.
 """
 
 import sys
-import subprocess
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from rich.console import Console
 
@@ -41,6 +46,9 @@
 # Import ignore patterns from config handler (same branch)
 from seed.apps.handlers.config.ignore_handler import get_audit_ignore_patterns
 
+# Batched, cached pyright runs (same branch)
+from seed.apps.handlers.diagnostics.pyright_engine import PyrightEngine
+
 
 def should_ignore_file(file_path: str, ignore_patterns: List[str]) -> bool:
     """Check if file should be ignored based on audit patterns"""
@@ -50,12 +58,13 @@ def should_ignore_file(file_path: str, ignore_patterns: List[str]) -> bool:
     return False
 
 
-def check_file(file_path: str) -> Dict:
+def check_file(file_path: str, engine: Optional[PyrightEngine] = None) -> Dict:
     """
     Run pyright on a single file and return diagnostics
 
     Args:
         file_path: Path to Python file to check
+        engine: Shared engine (a private one is opened and closed otherwise)
 
     Returns:
         dict: {
@@ -85,78 +94,65 @@ def check_file(file_path: str) -> Dict:
             'skipped': 'Not a Python file'
         }
 
+    own_engine = engine is None
+    engine = engine or PyrightEngine()
     try:
-        # Run pyright with JSON output
-        result = subprocess.run(
-            ['python3', '-m', 'pyright', '--outputjson', str(path)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        # Parse JSON output
-        try:
-            output = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            # Pyright may output text on error
-            return {
-                'file': str(file_path),
-                'errors': 0,
-                'warnings': 0,
-                'diagnostics': [],
-                'error': f'Failed to parse pyright output: {result.stderr or result.stdout}'
-            }
-
-        diagnostics = []
-        errors = 0
-        warnings = 0
-
-        for diag in output.get('generalDiagnostics', []):
-            severity = diag.get('severity', 'error')
-            if severity == 'error':
-                errors += 1
-            elif severity == 'warning':
-                warnings += 1
-
-            diagnostics.append({
-                'line': diag.get('range', {}).get('start', {}).get('line', 0) + 1,
-                'severity': severity,
-                'message': diag.get('message', 'Unknown error'),
-                'rule': diag.get('rule', '')
-            })
+        results, error = engine.check_files([str(file_path)], timeout=30)
+    finally:
+        if own_engine:
+            engine.close()
 
-        return {
-            'file': str(file_path),
-            'errors': errors,
-            'warnings': warnings,
-            'diagnostics': diagnostics
-        }
-
-    except subprocess.TimeoutExpired:
+    if error:
         return {
             'file': str(file_path),
             'errors': 0,
             'warnings': 0,
             'diagnostics': [],
-            'error': 'Pyright timed out'
+            'error': error
         }
-    except Exception as e:
+    return results[str(file_path)]
+
+
+def _collect_files(directory: Path, pattern: str, ignore_patterns: List[str]) -> List[str]:
+    """Python files under a directory, minus audit-ignored paths"""
+    return sorted(
+        str(p) for p in directory.glob(pattern)
+        if p.is_file() and p.suffix == '.py' and not should_ignore_file(str(p), ignore_patterns)
+    )
+
+
+def _summarize(files: List[str], per_file: Dict[str, Dict], error: Optional[str]) -> Dict:
+    """Per-file engine results -> check_directory() summary shape"""
+    if error:
         return {
-            'file': str(file_path),
-            'errors': 0,
-            'warnings': 0,
-            'diagnostics': [],
-            'error': str(e)
+            'total_files': 0,
+            'files_with_errors': 0,
+            'total_errors': 0,
+            'total_warnings': 0,
+            'results': [],
+            'error': error
         }
 
+    # Only files pyright had something to say about (as before)
+    results = [per_file[f] for f in files if f in per_file and per_file[f]['diagnostics']]
+    return {
+        'total_files': len(files),
+        'files_with_errors': len([r for r in results if r['errors'] > 0]),
+        'total_errors': sum(r['errors'] for r in results),
+        'total_warnings': sum(r['warnings'] for r in results),
+        'results': sorted(results, key=lambda x: x['errors'], reverse=True)
+    }
+
 
-def check_directory(directory: str, pattern: str = "**/*.py") -> Dict:
+def check_directory(directory: str, pattern: str = "**/*.py",
+                    engine: Optional[PyrightEngine] = None) -> Dict:
     """
     Run pyright on all Python files in a directory
 
     Args:
         directory: Directory to scan
         pattern: Glob pattern for files (default: all .py files)
+        engine: Shared engine (a private one is opened and closed otherwise)
 
     Returns:
         dict: {
@@ -179,99 +175,26 @@ def check_directory(directory: str, pattern: str = "**/*.py") -> Dict:
             'error': f'Directory not found: {directory}'
         }
 
-    # Run pyright on entire directory for efficiency
-    try:
-        result = subprocess.run(
-            ['python3', '-m', 'pyright', '--outputjson', str(path)],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minutes for full directory
-        )
-
-        try:
-            output = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            return {
-                'total_files': 0,
-                'files_with_errors': 0,
-                'total_errors': 0,
-                'total_warnings': 0,
-                'results': [],
-                'error': f'Failed to parse pyright output'
-            }
-
-        # Get ignore patterns
-        ignore_patterns = get_audit_ignore_patterns()
-
-        # Group diagnostics by file (filtering ignored files)
-        file_diagnostics = {}
-
-        for diag in output.get('generalDiagnostics', []):
-            file_path = diag.get('file', 'unknown')
-
-            # Skip files matching ignore patterns
-            if should_ignore_file(file_path, ignore_patterns):
-                continue
-            if file_path not in file_diagnostics:
-                file_diagnostics[file_path] = {
-                    'file': file_path,
-                    'errors': 0,
-                    'warnings': 0,
-                    'diagnostics': []
-                }
-
-            severity = diag.get('severity', 'error')
-            if severity == 'error':
-                file_diagnostics[file_path]['errors'] += 1
-            elif severity == 'warning':
-                file_diagnostics[file_path]['warnings'] += 1
-
-            file_diagnostics[file_path]['diagnostics'].append({
-                'line': diag.get('range', {}).get('start', {}).get('line', 0) + 1,
-                'severity': severity,
-                'message': diag.get('message', 'Unknown error'),
-                'rule': diag.get('rule', '')
-            })
-
-        results = list(file_diagnostics.values())
-        total_errors = sum(r['errors'] for r in results)
-        total_warnings = sum(r['warnings'] for r in results)
-        files_with_errors = len([r for r in results if r['errors'] > 0])
+    files = _collect_files(path, pattern, get_audit_ignore_patterns())
 
-        return {
-            'total_files': output.get('summary', {}).get('filesAnalyzed', 0),
-            'files_with_errors': files_with_errors,
-            'total_errors': total_errors,
-            'total_warnings': total_warnings,
-            'results': sorted(results, key=lambda x: x['errors'], reverse=True)
-        }
+    own_engine = engine is None
+    engine = engine or PyrightEngine()
+    try:
+        per_file, error = engine.check_files(files)
+    finally:
+        if own_engine:
+            engine.close()
 
-    except subprocess.TimeoutExpired:
-        return {
-            'total_files': 0,
-            'files_with_errors': 0,
-            'total_errors': 0,
-            'total_warnings': 0,
-            'results': [],
-            'error': 'Pyright timed out (directory too large?)'
-        }
-    except Exception as e:
-        return {
-            'total_files': 0,
-            'files_with_errors': 0,
-            'total_errors': 0,
-            'total_warnings': 0,
-            'results': [],
-            'error': str(e)
-        }
+    return _summarize(files, per_file, error)
 
 
-def check_branch(branch_path: str) -> Dict:
+def check_branch(branch_path: str, engine: Optional[PyrightEngine] = None) -> Dict:
     """
     Run diagnostics on a branch's apps/ directory
 
     Args:
         branch_path: Path to branch root (e.g., /home/aipass/seed)
+        engine: Shared engine (a private one is opened and closed otherwise)
 
     Returns:
         Same format as check_directory
@@ -288,7 +211,45 @@ def check_branch(branch_path: str) -> Dict:
             'error': f'No apps/ directory found in {branch_path}'
         }
 
-    return check_directory(str(apps_path))
+    return check_directory(str(apps_path), engine=engine)
+
+
+def check_branches(branch_paths: List[str], engine: Optional[PyrightEngine] = None) -> Dict[str, Dict]:
+    """
+    Diagnostics for many branches with a single pyright run
+
+    Args:
+        branch_paths: Branch roots
+        engine: Shared engine (a private one is opened and closed otherwise)
+
+    Returns:
+        {branch_path: check_branch()-shaped result}
+    """
+    ignore_patterns = get_audit_ignore_patterns()
+    branch_files: Dict[str, List[str]] = {}
+    results: Dict[str, Dict] = {}
+
+    for branch_path in branch_paths:
+        apps_path = Path(branch_path) / "apps"
+        if apps_path.exists():
+            branch_files[branch_path] = _collect_files(apps_path, "**/*.py", ignore_patterns)
+        else:
+            results[branch_path] = check_branch(branch_path)
+
+    all_files = [f for files in branch_files.values() for f in files]
+
+    own_engine = engine is None
+    engine = engine or PyrightEngine()
+    try:
+        per_file, error = engine.check_files(all_files)
+    finally:
+        if own_engine:
+            engine.close()
+
+    for branch_path, files in branch_files.items():
+        results[branch_path] = _summarize(files, per_file, error)
+
+    return {branch_path: results[branch_path] for branch_path in branch_paths}
 
 
 def format_summary(results: Dict) -> str:
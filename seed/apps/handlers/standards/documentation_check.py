@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: documentation_check.py - Documentation Standards Checker Handler
 # Date: 2025-11-15
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): check_source(SourceUnit) interface - shared parse-once source, check_module kept as shim
 #   - v0.1.0 (2025-11-15): Initial implementation - documentation standards checking
 #
 # CODE STANDARDS:
@@ -31,6 +32,8 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 sys.path.insert(0, str(Path.home()))
 
+from seed.apps.handlers.standards.source_unit import SourceUnit
+
 
 def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_rules: list | None = None) -> bool:
     """Check if a violation should be bypassed"""
@@ -54,12 +57,12 @@ def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_r
     return False
 
 
-def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+def check_source(unit: SourceUnit, bypass_rules: list | None = None) -> Dict:
     """
     Check if module follows documentation standards
 
     Args:
-        module_path: Path to Python module to check
+        unit: SourceUnit for the file to check (see source_unit.py)
 
     Returns:
         dict: {
@@ -76,7 +79,8 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
     """
     checks = []
-    path = Path(module_path)
+    module_path = unit.module_path
+    path = unit.path
 
     # Check if entire standard is bypassed for this file
     if is_bypassed(module_path, 'documentation', bypass_rules=bypass_rules):
@@ -88,7 +92,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Validate file exists
-    if not path.exists():
+    if not unit.exists:
         return {
             'passed': False,
             'checks': [{'name': 'File exists', 'passed': False, 'message': f'File not found: {module_path}'}],
@@ -97,18 +101,17 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Read file
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-    except Exception as e:
+    if unit.read_error is not None:
         return {
             'passed': False,
-            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {e}'}],
+            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {unit.read_error}'}],
             'score': 0,
             'standard': 'DOCUMENTATION'
         }
 
+    content = unit.text
+    lines = unit.lines
+
     # Skip __init__.py files (different documentation standards)
     if path.name == '__init__.py':
         return {
@@ -151,6 +154,11 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     }
 
 
+def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+    """Path-based entry point (reads the file fresh) - see check_source"""
+    return check_source(SourceUnit.load(module_path), bypass_rules=bypass_rules)
+
+
 def check_shebang(lines: List[str], module_path: str = "") -> Dict:
     """
     Check for correct shebang line
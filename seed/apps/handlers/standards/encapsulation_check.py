@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: encapsulation_check.py - Handler Encapsulation Standards Checker
 # Date: 2025-11-28
-# Version: 0.1.1
+# Version: 0.2.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): check_source(SourceUnit) interface, registry via shared cached loader
 #   - v0.1.0 (2025-11-28): Initial implementation - cross-handler import detection
 #
 # CODE STANDARDS:
@@ -24,10 +25,11 @@
 """
 
 import re
-import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from seed.apps.handlers.standards.source_unit import SourceUnit, registry_branches
+
 # Infrastructure
 AIPASS_ROOT = Path.home() / "aipass_core"
 SEED_ROOT = Path.home() / "seed"
@@ -58,25 +60,23 @@ def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_r
     return False
 
 
-def get_branch_from_path(file_path: str) -> Optional[Dict]:
-    """Detect which branch a file belongs to"""
-    try:
-        if not BRANCH_REGISTRY_PATH.exists():
-            return None
+def get_branch_from_path(file_path: str, branches: Optional[List[Dict]] = None) -> Optional[Dict]:
+    """Detect which branch a file belongs to
 
-        with open(BRANCH_REGISTRY_PATH, 'r', encoding='utf-8') as f:
-            registry = json.load(f)
+    Args:
+        file_path: File to locate
+        branches: Registry branches, longest path first (loaded if omitted)
+    """
+    try:
+        if branches is None:
+            branches = registry_branches()
 
-        if not registry:
+        if not branches:
             return None
 
         file_path = str(Path(file_path).resolve())
 
-        # Sort branches by path length (longest first) to match most specific
-        branches = sorted(registry.get('branches', []),
-                         key=lambda b: len(b.get('path', '')),
-                         reverse=True)
-
+        # Branches are sorted by path length (longest first) to match most specific
         for branch in branches:
             branch_path = branch.get('path', '')
             if file_path.startswith(branch_path + '/') or file_path == branch_path:
@@ -149,12 +149,12 @@ def get_file_handler_package(file_path: str) -> Optional[str]:
     return None
 
 
-def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+def check_source(unit: SourceUnit, bypass_rules: list | None = None) -> Dict:
     """
     Check if file respects handler encapsulation
 
     Args:
-        module_path: Path to Python file to check
+        unit: SourceUnit for the file to check (see source_unit.py)
         bypass_rules: Optional list of bypass rules to apply
 
     Returns:
@@ -166,7 +166,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
     """
     checks = []
-    path = Path(module_path)
+    module_path = unit.module_path
 
     # Check if entire standard is bypassed
     if is_bypassed(module_path, 'encapsulation', bypass_rules=bypass_rules):
@@ -178,7 +178,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Validate file exists
-    if not path.exists():
+    if not unit.exists:
         return {
             'passed': False,
             'checks': [{'name': 'File exists', 'passed': False, 'message': f'File not found: {module_path}'}],
@@ -187,20 +187,18 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Read file
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-    except Exception as e:
+    if unit.read_error is not None:
         return {
             'passed': False,
-            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {e}'}],
+            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {unit.read_error}'}],
             'score': 0,
             'standard': 'ENCAPSULATION'
         }
 
+    lines = unit.lines
+
     # Detect this file's context
-    file_branch = get_branch_from_path(module_path)
+    file_branch = get_branch_from_path(module_path, unit.registry_branches())
     file_branch_name = file_branch.get('name', '').lower() if file_branch else None
     file_handler_package = get_file_handler_package(module_path)
     is_handler_file = file_handler_package is not None
@@ -247,6 +245,11 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     }
 
 
+def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+    """Path-based entry point (reads the file fresh) - see check_source"""
+    return check_source(SourceUnit.load(module_path), bypass_rules=bypass_rules)
+
+
 def check_cross_branch_imports(lines: List[str], module_path: str,
                                 file_branch: Optional[str], bypass_rules: list | None = None) -> Dict:
     """
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: error_handling_check.py - Error Handling Standards Checker Handler
 # Date: 2025-11-21
-# Version: 1.1.0
+# Version: 1.2.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): check_source(SourceUnit) interface - shared parse-once source, check_module kept as shim
 #   - v1.1.0 (2026-01-31): Added ERROR vs WARNING usage check - detects user input validation in logger.error()
 #   - v1.0.0 (2025-11-21): Initial implementation - 3-tier logging validation
 #
@@ -32,6 +33,8 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 sys.path.insert(0, str(Path.home()))
 
+from seed.apps.handlers.standards.source_unit import SourceUnit
+
 
 def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_rules: list | None = None) -> bool:
     """Check if a violation should be bypassed"""
@@ -55,12 +58,12 @@ def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_r
     return False
 
 
-def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+def check_source(unit: SourceUnit, bypass_rules: list | None = None) -> Dict:
     """
     Check if module follows 3-tier error handling standards
 
     Args:
-        module_path: Path to Python module to check
+        unit: SourceUnit for the file to check (see source_unit.py)
         bypass_rules: Optional list of bypass rules to skip certain checks
 
     Returns:
@@ -78,7 +81,8 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
     """
     checks = []
-    path = Path(module_path)
+    module_path = unit.module_path
+    path = unit.path
 
     # Check if entire standard is bypassed for this file
     if is_bypassed(module_path, 'error_handling', bypass_rules=bypass_rules):
@@ -90,7 +94,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Validate file exists
-    if not path.exists():
+    if not unit.exists:
         return {
             'passed': False,
             'checks': [{'name': 'File exists', 'passed': False, 'message': f'File not found: {module_path}'}],
@@ -99,18 +103,17 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Read file
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-    except Exception as e:
+    if unit.read_error is not None:
         return {
             'passed': False,
-            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {e}'}],
+            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {unit.read_error}'}],
             'score': 0,
             'standard': 'ERROR_HANDLING'
         }
 
+    content = unit.text
+    lines = unit.lines
+
     # Determine file type
     is_handler = '/handlers/' in module_path
     is_module = '/modules/' in module_path
@@ -174,6 +177,11 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     }
 
 
+def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+    """Path-based entry point (reads the file fresh) - see check_source"""
+    return check_source(SourceUnit.load(module_path), bypass_rules=bypass_rules)
+
+
 def check_module_has_prax(content: str, file_path: str, bypass_rules: list | None = None) -> Dict:
     """
     Check that modules import Prax logger
@@ -4,15 +4,15 @@
 # META DATA HEADER
 # Name: imports_check.py - Imports Standards Checker Handler
 # Date: 2025-11-15
-# Version: 0.5.0
+# Version: 0.6.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.6.0 (2026-10-18): check_source(SourceUnit) interface - shared parse-once source, check_module kept as shim
 #   - v0.5.0 (2025-11-15): Fixed docstring filtering bug - prevents false negatives from import examples in docstrings
 #   - v0.4.0 (2025-11-15): Fixed handler independence to allow service imports (prax, cli)
 #   - v0.3.0 (2025-11-15): Added proper infrastructure - AIPASS_ROOT, sys.path, Prax logger, JSON tracking
 #   - v0.2.0 (2025-11-15): Fixed critical bugs - false positives, handler independence check, Prax conditional
-#   - v0.1.0 (2025-11-15): Initial implementation - imports standards checking
 #
 # CODE STANDARDS:
 #   - Handler implements checking logic, module orchestrates
@@ -40,6 +40,8 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 sys.path.insert(0, str(Path.home()))
 
+from seed.apps.handlers.standards.source_unit import SourceUnit
+
 
 def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_rules: list | None = None) -> bool:
     """Check if a violation should be bypassed"""
@@ -63,12 +65,12 @@ def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_r
     return False
 
 
-def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+def check_source(unit: SourceUnit, bypass_rules: list | None = None) -> Dict:
     """
     Check if module follows import standards
 
     Args:
-        module_path: Path to Python module to check
+        unit: SourceUnit for the file to check (see source_unit.py)
         bypass_rules: Optional list of bypass rules to skip certain violations
 
     Returns:
@@ -86,7 +88,8 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
     """
     checks = []
-    path = Path(module_path)
+    module_path = unit.module_path
+    path = unit.path
 
     # Check if entire standard is bypassed for this file
     if is_bypassed(module_path, 'imports', bypass_rules=bypass_rules):
@@ -98,7 +101,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Validate file exists
-    if not path.exists():
+    if not unit.exists:
         return {
             'passed': False,
             'checks': [{'name': 'File exists', 'passed': False, 'message': f'File not found: {module_path}'}],
@@ -107,18 +110,16 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Read file
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-    except Exception as e:
+    if unit.read_error is not None:
         return {
             'passed': False,
-            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {e}'}],
+            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {unit.read_error}'}],
             'score': 0,
             'standard': 'IMPORTS'
         }
 
+    lines = unit.lines
+
     # Filter out docstrings to prevent false positives from import examples
     filtered_lines = filter_docstrings(lines)
 
@@ -175,6 +176,11 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     }
 
 
+def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+    """Path-based entry point (reads the file fresh) - see check_source"""
+    return check_source(SourceUnit.load(module_path), bypass_rules=bypass_rules)
+
+
 def filter_docstrings(lines: List[str]) -> List[str]:
     """
     Filter out docstrings from lines to prevent false positives.
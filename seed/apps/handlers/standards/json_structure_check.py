@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: json_structure_check.py - JSON Structure Standards Checker Handler
 # Date: 2025-11-21
-# Version: 0.3.0
+# Version: 0.4.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.4.0 (2026-10-18): check_source(SourceUnit) interface, shared AST and cached registry loader
 #   - v0.3.0 (2025-11-21): Complete rewrite - validates actual implementation (handler config, JSON files existence, paths)
 #   - v0.2.0 (2025-11-15): Fixed false positives using AST parsing instead of string search
 #   - v0.1.0 (2025-11-15): Initial implementation - JSON structure standards checking
@@ -35,7 +36,6 @@
 import sys
 import re
 import ast
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -44,6 +44,8 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 sys.path.insert(0, str(Path.home()))
 
+from seed.apps.handlers.standards.source_unit import SourceUnit, registry_branches
+
 
 def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_rules: list | None = None) -> bool:
     """Check if a violation should be bypassed"""
@@ -67,7 +69,7 @@ def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_r
     return False
 
 
-def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+def check_source(unit: SourceUnit, bypass_rules: list | None = None) -> Dict:
     """
     Check if module follows JSON structure standards
 
@@ -77,7 +79,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     3. Direct JSON operations: Should use json_handler
 
     Args:
-        module_path: Path to Python module to check
+        unit: SourceUnit for the file to check (see source_unit.py)
         bypass_rules: Optional list of bypass rules to skip specific violations
 
     Returns:
@@ -89,10 +91,11 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
     """
     checks = []
-    path = Path(module_path)
+    module_path = unit.module_path
+    path = unit.path
 
     # Validate file exists
-    if not path.exists():
+    if not unit.exists:
         return {
             'passed': False,
             'checks': [{'name': 'File exists', 'passed': False, 'message': f'File not found: {module_path}'}],
@@ -101,17 +104,16 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Read file
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
+    if unit.read_error is not None:
         return {
             'passed': False,
-            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {e}'}],
+            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {unit.read_error}'}],
             'score': 0,
             'standard': 'JSON STRUCTURE'
         }
 
+    content = unit.text
+
     # Determine what type of file this is
     if 'json_handler' in path.name and path.parent.name == 'json':
         # This is a json_handler.py file - check configuration
@@ -121,7 +123,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         checks = check_module_json_files(path, content, bypass_rules)
     else:
         # Other files - check for direct JSON operations
-        json_check = check_json_handler_usage(content, module_path, bypass_rules)
+        json_check = check_json_handler_usage(content, module_path, bypass_rules, tree=unit.tree)
         if json_check:
             checks.append(json_check)
 
@@ -148,18 +150,16 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     }
 
 
+def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+    """Path-based entry point (reads the file fresh) - see check_source"""
+    return check_source(SourceUnit.load(module_path), bypass_rules=bypass_rules)
+
+
 def get_branch_path(branch_name: str) -> Optional[str]:
     """Get actual branch path from BRANCH_REGISTRY.json"""
-    registry_path = Path.home() / "BRANCH_REGISTRY.json"
-    if registry_path.exists():
-        try:
-            with open(registry_path, 'r', encoding='utf-8') as f:
-                registry = json.load(f)
-            for branch in registry.get('branches', []):
-                if branch.get('name', '').lower() == branch_name.lower():
-                    return branch.get('path', '')
-        except (json.JSONDecodeError, IOError):
-            pass
+    for branch in registry_branches():
+        if branch.get('name', '').lower() == branch_name.lower():
+            return branch.get('path', '')
     return None
 
 
@@ -352,14 +352,18 @@ def check_module_json_files(module_path: Path, content: str, bypass_rules: list
     return checks
 
 
-def check_json_handler_usage(content: str, file_path: str, bypass_rules: list | None = None) -> Optional[Dict]:
+def check_json_handler_usage(content: str, file_path: str, bypass_rules: list | None = None,
+                             tree: Optional[ast.Module] = None) -> Optional[Dict]:
     """
     Check that modules use json_handler for JSON operations (not direct json.load/dump)
+
+    tree: Already-parsed AST of content (parsed here if omitted)
     """
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
-        return None
+    if tree is None:
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            return None
 
     has_json_import = False
     has_json_operations = False
@@ -414,24 +418,11 @@ def detect_branch(file_path: Path) -> Optional[str]:
     """
     file_path_str = str(file_path)
 
-    # Try BRANCH_REGISTRY.json first (source of truth)
-    registry_path = Path.home() / "BRANCH_REGISTRY.json"
-    if registry_path.exists():
-        try:
-            with open(registry_path, 'r', encoding='utf-8') as f:
-                registry = json.load(f)
-            # Sort by path length (longest first) to match most specific path
-            branches = sorted(
-                registry.get('branches', []),
-                key=lambda b: len(b.get('path', '')),
-                reverse=True
-            )
-            for branch in branches:
-                branch_path = branch.get('path', '')
-                if branch_path and file_path_str.startswith(branch_path):
-                    return branch.get('name', '').lower()
-        except (json.JSONDecodeError, IOError):
-            pass  # Fall through to heuristics
+    # Try BRANCH_REGISTRY.json first (source of truth), longest path first
+    for branch in registry_branches():
+        branch_path = branch.get('path', '')
+        if branch_path and file_path_str.startswith(branch_path):
+            return branch.get('name', '').lower()
 
     # Fallback: path-based heuristics
     path_parts = file_path.parts
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: log_level_check.py - Log Level Hygiene Standards Checker Handler
 # Date: 2026-02-13
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): check_source(SourceUnit) interface - shared parse-once source, check_module kept as shim
 #   - v1.0.0 (2026-02-13): Initial implementation - log level correctness validation
 #
 # CODE STANDARDS:
@@ -38,6 +39,8 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 sys.path.insert(0, str(Path.home()))
 
+from seed.apps.handlers.standards.source_unit import SourceUnit
+
 
 def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_rules: list | None = None) -> bool:
     """Check if a violation should be bypassed"""
@@ -58,12 +61,12 @@ def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_r
     return False
 
 
-def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+def check_source(unit: SourceUnit, bypass_rules: list | None = None) -> Dict:
     """
     Check if module follows log level hygiene standards
 
     Args:
-        module_path: Path to Python module to check
+        unit: SourceUnit for the file to check (see source_unit.py)
         bypass_rules: Optional list of bypass rules to skip certain checks
 
     Returns:
@@ -75,7 +78,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
     """
     checks = []
-    path = Path(module_path)
+    module_path = unit.module_path
 
     if is_bypassed(module_path, 'log_level', bypass_rules=bypass_rules):
         return {
@@ -85,7 +88,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
             'standard': 'LOG_LEVEL'
         }
 
-    if not path.exists():
+    if not unit.exists:
         return {
             'passed': False,
             'checks': [{'name': 'File exists', 'passed': False, 'message': f'File not found: {module_path}'}],
@@ -93,18 +96,17 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
             'standard': 'LOG_LEVEL'
         }
 
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-    except Exception as e:
+    if unit.read_error is not None:
         return {
             'passed': False,
-            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {e}'}],
+            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {unit.read_error}'}],
             'score': 0,
             'standard': 'LOG_LEVEL'
         }
 
+    content = unit.text
+    lines = unit.lines
+
     # Only check files that use logger
     has_logger = re.search(r'\blogger\.(error|warning|info|debug)\s*\(', content)
     if not has_logger:
@@ -138,6 +140,11 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     }
 
 
+def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+    """Path-based entry point (reads the file fresh) - see check_source"""
+    return check_source(SourceUnit.load(module_path), bypass_rules=bypass_rules)
+
+
 def _get_non_code_lines(lines: List[str]) -> set:
     """
     Build a set of line numbers that are inside docstrings or comments.
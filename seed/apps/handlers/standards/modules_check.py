@@ -4,15 +4,15 @@
 # META DATA HEADER
 # Name: modules_check.py - Modules Standards Checker Handler
 # Date: 2025-11-25
-# Version: 0.4.0
+# Version: 0.5.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.5.0 (2026-10-18): check_source(SourceUnit) interface, AST checks reuse the unit's parse
 #   - v0.4.0 (2025-11-28): Skip function-local vars in business logic check (fixes 67% false positives)
 #   - v0.3.1 (2025-11-25): Improved business logic detection - skips code refs (Name, Call, Attribute)
 #   - v0.3.0 (2025-11-25): Added business logic detection - flags hardcoded lists/dicts (hybrid line scan + AST)
 #   - v0.2.0 (2025-11-21): Fixed docstring detection bug - handles epilog strings in argparse correctly
-#   - v0.1.0 (2025-11-15): Initial implementation - module standards checking
 #
 # CODE STANDARDS:
 #   - Handler implements checking logic, module orchestrates
@@ -36,6 +36,8 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 sys.path.insert(0, str(Path.home()))
 
+from seed.apps.handlers.standards.source_unit import SourceUnit
+
 
 def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_rules: list | None = None) -> bool:
     """Check if a violation should be bypassed"""
@@ -59,12 +61,12 @@ def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_r
     return False
 
 
-def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+def check_source(unit: SourceUnit, bypass_rules: list | None = None) -> Dict:
     """
     Check if module follows module standards
 
     Args:
-        module_path: Path to Python module to check
+        unit: SourceUnit for the file to check (see source_unit.py)
         bypass_rules: Optional list of bypass rules to skip specific violations
 
     Returns:
@@ -82,7 +84,8 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
     """
     checks = []
-    path = Path(module_path)
+    module_path = unit.module_path
+    path = unit.path
 
     # Check if entire standard is bypassed for this file
     if is_bypassed(module_path, 'modules', bypass_rules=bypass_rules):
@@ -94,7 +97,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Validate file exists
-    if not path.exists():
+    if not unit.exists:
         return {
             'passed': False,
             'checks': [{'name': 'File exists', 'passed': False, 'message': f'File not found: {module_path}'}],
@@ -103,18 +106,17 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Read file
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-    except Exception as e:
+    if unit.read_error is not None:
         return {
             'passed': False,
-            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {e}'}],
+            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {unit.read_error}'}],
             'score': 0,
             'standard': 'MODULES'
         }
 
+    content = unit.text
+    lines = unit.lines
+
     # Only check files in modules/ directory
     is_module = 'apps/modules/' in module_path
     if not is_module:
@@ -141,12 +143,12 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         checks.append(file_ops_check)
 
     # Check 4: No business logic (hardcoded data)
-    business_logic_check = check_no_business_logic(content, lines, module_path)
+    business_logic_check = check_no_business_logic(content, lines, module_path, tree=unit.tree)
     if business_logic_check:
         checks.append(business_logic_check)
 
     # Check 5: Thin orchestration (no implementation functions)
-    orchestration_check = check_thin_orchestration(content, module_path, bypass_rules)
+    orchestration_check = check_thin_orchestration(content, module_path, bypass_rules, tree=unit.tree)
     if orchestration_check:
         checks.append(orchestration_check)
 
@@ -166,6 +168,11 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     }
 
 
+def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+    """Path-based entry point (reads the file fresh) - see check_source"""
+    return check_source(SourceUnit.load(module_path), bypass_rules=bypass_rules)
+
+
 def check_handle_command(content: str) -> Optional[Dict]:
     """
     Check for handle_command pattern (drone routing standard)
@@ -345,7 +352,8 @@ def check_no_direct_file_ops(content: str, lines: List[str]) -> Optional[Dict]:
     }
 
 
-def check_no_business_logic(content: str, lines: List[str], module_path: str) -> Optional[Dict]:
+def check_no_business_logic(content: str, lines: List[str], module_path: str,
+                            tree: Optional[ast.Module] = None) -> Optional[Dict]:
     """
     Check that module doesn't contain hardcoded business logic data
 
@@ -354,6 +362,7 @@ def check_no_business_logic(content: str, lines: List[str], module_path: str) ->
 
     Only flags MODULE-LEVEL hardcoded data (function-local is OK for display/temp data).
     Skips: ALL_CAPS constants, empty structures, code references, function-local vars.
+    tree: Already-parsed AST of content (parsed here if omitted)
     """
     # Phase 1: Quick line scan for candidates (module-level only = no leading whitespace)
     # Only match assignments at column 0 (module level)
@@ -390,7 +399,8 @@ def check_no_business_logic(content: str, lines: List[str], module_path: str) ->
     violations = []
 
     try:
-        tree = ast.parse(content, filename=module_path)
+        if tree is None:
+            tree = ast.parse(content, filename=module_path)
 
         # Only check module-level assignments (tree.body), not function-local
         for node in tree.body:
@@ -474,7 +484,8 @@ def check_no_business_logic(content: str, lines: List[str], module_path: str) ->
     }
 
 
-def check_thin_orchestration(content: str, module_path: str, bypass_rules: list | None = None) -> Optional[Dict]:
+def check_thin_orchestration(content: str, module_path: str, bypass_rules: list | None = None,
+                             tree: Optional[ast.Module] = None) -> Optional[Dict]:
     """
     Check that module is a thin orchestrator (delegates to handlers).
 
@@ -485,6 +496,7 @@ def check_thin_orchestration(content: str, module_path: str, bypass_rules: list
     - main() - standalone entry point
 
     Any other functions indicate implementation logic that belongs in handlers.
+    tree: Already-parsed AST of content (parsed here if omitted)
     """
     # Standard allowed functions in modules
     ALLOWED_FUNCTIONS = {
@@ -503,10 +515,11 @@ def check_thin_orchestration(content: str, module_path: str, bypass_rules: list
             'message': 'Bypassed - thin orchestration check skipped'
         }
 
-    try:
-        tree = ast.parse(content, filename=module_path)
-    except SyntaxError:
-        return None
+    if tree is None:
+        try:
+            tree = ast.parse(content, filename=module_path)
+        except SyntaxError:
+            return None
 
     # Find all top-level function definitions
     non_standard_functions = []
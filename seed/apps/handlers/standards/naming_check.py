@@ -4,15 +4,15 @@
 # META DATA HEADER
 # Name: naming_check.py - Naming Standards Checker Handler
 # Date: 2025-11-22
-# Version: 0.5.0
+# Version: 0.6.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.6.0 (2026-10-18): check_source(SourceUnit) interface - shared parse-once source, check_module kept as shim
 #   - v0.5.0 (2025-11-22): Fixed false positive - logger = system_logger pattern now recognized
 #   - v0.4.0 (2025-11-22): Fixed false positive - imports (logger, console) no longer flagged as constants
 #   - v0.3.0 (2025-11-21): Fixed multi-line string tracking bug - prevents epilog strings from confusing scope
 #   - v0.2.0 (2025-11-21): Fixed scope tracking bug - if __name__ blocks now treated as function scope
-#   - v0.1.0 (2025-11-15): Initial implementation - naming standards checking
 #
 # CODE STANDARDS:
 #   - Handler implements checking logic, module orchestrates
@@ -35,6 +35,8 @@
 sys.path.insert(0, str(AIPASS_ROOT))
 sys.path.insert(0, str(Path.home()))  # Seed-specific: enables `from seed.apps.handlers...` imports
 
+from seed.apps.handlers.standards.source_unit import SourceUnit
+
 
 def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_rules: list | None = None) -> bool:
     """Check if a violation should be bypassed"""
@@ -58,12 +60,12 @@ def is_bypassed(file_path: str, standard: str, line: int | None = None, bypass_r
     return False
 
 
-def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+def check_source(unit: SourceUnit, bypass_rules: list | None = None) -> Dict:
     """
     Check if module follows naming standards
 
     Args:
-        module_path: Path to Python module to check
+        unit: SourceUnit for the file to check (see source_unit.py)
         bypass_rules: Optional list of bypass rules to skip certain violations
 
     Returns:
@@ -81,7 +83,8 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
     """
     checks = []
-    path = Path(module_path)
+    module_path = unit.module_path
+    path = unit.path
 
     # Check if entire standard is bypassed for this file
     if is_bypassed(module_path, 'naming', bypass_rules=bypass_rules):
@@ -93,7 +96,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Validate file exists
-    if not path.exists():
+    if not unit.exists:
         return {
             'passed': False,
             'checks': [{'name': 'File exists', 'passed': False, 'message': f'File not found: {module_path}'}],
@@ -102,18 +105,16 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
 
     # Read file
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-    except Exception as e:
+    if unit.read_error is not None:
         return {
             'passed': False,
-            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {e}'}],
+            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {unit.read_error}'}],
             'score': 0,
             'standard': 'NAMING'
         }
 
+    content = unit.text
+
     # Check 1: File naming (snake_case, no redundant prefixes)
     file_naming_check = check_file_naming(module_path, path)
     checks.append(file_naming_check)
@@ -149,6 +150,11 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     }
 
 
+def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+    """Path-based entry point (reads the file fresh) - see check_source"""
+    return check_source(SourceUnit.load(module_path), bypass_rules=bypass_rules)
+
+
 def check_file_naming(module_path: str, path: Path) -> Dict:
     """
     Check file naming conventions
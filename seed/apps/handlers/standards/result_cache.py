@@ -0,0 +1,328 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: result_cache.py - Persistent Checker Result Cache
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: seed/standards/checkers
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation - content-hash keyed per-file checker results in SQLite
+#
+# CODE STANDARDS:
+#   - Handler implements caching logic, module orchestrates
+#   - Cache failures disable the cache, never the audit
+# =============================================
+
+"""
+Persistent Checker Result Cache
+
+Stores every (file, checker) result from audits and checklists in
+seed_json/audit_cache.db. A stored result is reused only while all of
+these still match:
+
+    content_hash  - sha1 of the file bytes
+    checker_hash  - sha1 of the checker's *_check.py plus source_unit.py
+    bypass_hash   - sha1 of the branch bypass rules
+    context_hash  - sha1 of the BRANCH_REGISTRY branch list (encapsulation
+                    and branch detection depend on it)
+
+so editing a file, a checker or a bypass rule re-runs exactly the affected
+checks. File hashes are remembered by (mtime_ns, size): an untouched file
+is not even re-read.
+
+Checkers that look beyond the file itself (architecture inspects the branch
+tree, json_structure inspects the branch's json directory) are never cached.
+
+Usage:
+    cache = ResultCache()
+    cached, missing = cache.lookup(path, {'cli': cli_check}, bypass_rules)
+    ...run the missing checkers...
+    cache.store(path, fresh_results, {'cli': cli_check}, bypass_rules)
+    cache.flush()
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Infrastructure
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+sys.path.insert(0, str(Path.home()))
+
+from seed.apps.handlers.standards.source_unit import SourceUnit, registry_branches
+
+CACHE_DB_PATH = Path.home() / "seed" / "seed_json" / "audit_cache.db"
+SCHEMA_VERSION = "1"
+
+# Results depend on more than the file's bytes - always recomputed
+UNCACHED_CHECKERS = frozenset({'architecture', 'json_structure'})
+
+SOURCE_UNIT_PATH = Path(sys.modules[SourceUnit.__module__].__file__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    path TEXT NOT NULL,
+    checker TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    checker_hash TEXT NOT NULL,
+    bypass_hash TEXT NOT NULL,
+    context_hash TEXT NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (path, checker)
+);
+"""
+
+_checker_hashes: Dict[str, str] = {}
+
+
+def _sha1(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def checker_hash(checker: Any) -> str:
+    """
+    Hash of a checker's source (its *_check.py plus the shared source_unit.py)
+
+    Computed once per process - the code that runs is the code loaded at
+    startup, so that is what results are filed under.
+    """
+    path = str(checker.__file__)
+    if path not in _checker_hashes:
+        _checker_hashes[path] = _sha1(Path(path).read_bytes() + SOURCE_UNIT_PATH.read_bytes())
+    return _checker_hashes[path]
+
+
+def bypass_hash(bypass_rules: Optional[list]) -> str:
+    """Hash of a branch's bypass rules (order-insensitive keys)"""
+    return _sha1(json.dumps(bypass_rules or [], sort_keys=True, default=str).encode('utf-8'))
+
+
+def context_hash() -> str:
+    """Hash of the registry branch list (name + path) checkers resolve against"""
+    branches = [(b.get('name', ''), b.get('path', '')) for b in registry_branches()]
+    return _sha1(json.dumps(branches).encode('utf-8'))
+
+
+class ResultCache:
+    """Persistent per-(file, checker) result cache
+
+    Counters (get_stats):
+        hits: Checker results served from the cache
+        misses: Checker results that had to be computed
+        stored: Results written back
+        hashed: Files read to (re)compute their content hash
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, enabled: bool = True):
+        self.db_path = Path(db_path) if db_path else CACHE_DB_PATH
+        self.enabled = enabled
+        self.error: Optional[str] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._hashes: Dict[str, Optional[str]] = {}
+        self._context: Optional[str] = None
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'hashed': 0}
+
+    # ---------- connection ----------
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if not self.enabled:
+            return None
+        if self._conn is None:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.db_path), timeout=10)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA)
+                row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+                if row is None or row[0] != SCHEMA_VERSION:
+                    conn.execute("DELETE FROM results")
+                    conn.execute("DELETE FROM files")
+                    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)",
+                                 (SCHEMA_VERSION,))
+                    conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                self._disable(e)
+        return self._conn
+
+    def _disable(self, error: Exception) -> None:
+        """Turn the cache off for this run (audit carries on uncached)"""
+        self.enabled = False
+        self.error = str(error)
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def flush(self) -> None:
+        """Commit pending writes"""
+        if self._conn is not None:
+            try:
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    def release(self) -> None:
+        """Commit and close (reopened on next use) - call before forking workers"""
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ---------- keys ----------
+
+    def content_hash(self, file_path: str) -> Optional[str]:
+        """sha1 of the file, reusing the stored hash while mtime/size are unchanged"""
+        if file_path in self._hashes:
+            return self._hashes[file_path]
+
+        digest = None
+        conn = self._connect()
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            st = None
+        if conn is not None and st is not None:
+            try:
+                row = conn.execute(
+                    "SELECT mtime_ns, size, content_hash FROM files WHERE path = ?", (file_path,)
+                ).fetchone()
+                if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+                    digest = row[2]
+                else:
+                    with open(file_path, 'rb') as f:
+                        digest = _sha1(f.read())
+                    self.stats['hashed'] += 1
+                    conn.execute(
+                        "INSERT OR REPLACE INTO files (path, mtime_ns, size, content_hash) VALUES (?, ?, ?, ?)",
+                        (file_path, st.st_mtime_ns, st.st_size, digest)
+                    )
+            except OSError:
+                digest = None
+            except sqlite3.Error as e:
+                self._disable(e)
+                digest = None
+
+        self._hashes[file_path] = digest
+        return digest
+
+    def _context_hash(self) -> str:
+        if self._context is None:
+            self._context = context_hash()
+        return self._context
+
+    # ---------- lookup / store ----------
+
+    def lookup(self, file_path: str, checkers: Dict[str, Any],
+               bypass_rules: Optional[list]) -> Tuple[Dict[str, Dict], Tuple[str, ...]]:
+        """
+        Cached results for one file
+
+        Args:
+            file_path: File being checked
+            checkers: {checker name: checker module} wanted for the file
+            bypass_rules: Bypass rules for the file's branch
+
+        Returns:
+            (cached results by name, names still to run - in checkers order)
+        """
+        names = tuple(checkers)
+        content = self.content_hash(file_path) if self.enabled else None
+        conn = self._connect() if content else None
+        if conn is None:
+            self.stats['misses'] += len(names)
+            return {}, names
+
+        try:
+            rows = {
+                row[0]: row[1:]
+                for row in conn.execute(
+                    "SELECT checker, content_hash, checker_hash, bypass_hash, context_hash, result "
+                    "FROM results WHERE path = ?", (file_path,)
+                )
+            }
+        except sqlite3.Error as e:
+            self._disable(e)
+            self.stats['misses'] += len(names)
+            return {}, names
+
+        rules = bypass_hash(bypass_rules)
+        context = self._context_hash()
+        cached: Dict[str, Dict] = {}
+        missing = []
+        for name in names:
+            row = rows.get(name)
+            if (name not in UNCACHED_CHECKERS and row is not None
+                    and row[:4] == (content, checker_hash(checkers[name]), rules, context)):
+                cached[name] = json.loads(row[4])
+            else:
+                missing.append(name)
+
+        self.stats['hits'] += len(cached)
+        self.stats['misses'] += len(missing)
+        return cached, tuple(missing)
+
+    def store(self, file_path: str, results: Dict[str, Dict], checkers: Dict[str, Any],
+              bypass_rules: Optional[list]) -> None:
+        """File freshly computed results (uncacheable checkers and odd payloads are skipped)"""
+        content = self.content_hash(file_path) if self.enabled else None
+        conn = self._connect() if content else None
+        if conn is None:
+            return
+
+        rules = bypass_hash(bypass_rules)
+        context = self._context_hash()
+        rows = []
+        for name, result in results.items():
+            if name in UNCACHED_CHECKERS or name not in checkers:
+                continue
+            try:
+                payload = json.dumps(result)
+            except (TypeError, ValueError):
+                continue  # not JSON-safe - recompute next time
+            rows.append((file_path, name, content, checker_hash(checkers[name]), rules, context, payload))
+
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO results "
+                "(path, checker, content_hash, checker_hash, bypass_hash, context_hash, result) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self.stats['stored'] += len(rows)
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def check(self, unit: SourceUnit, name: str, checker: Any, bypass_rules: Optional[list]) -> Dict:
+        """Single checker through the cache (what the checklist uses)"""
+        cached, missing = self.lookup(unit.module_path, {name: checker}, bypass_rules)
+        if not missing:
+            return cached[name]
+        result = checker.check_source(unit, bypass_rules=bypass_rules)
+        self.store(unit.module_path, {name: result}, {name: checker}, bypass_rules)
+        return result
+
+    # ---------- counters ----------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counter snapshot plus enabled flag and any error that disabled the cache"""
+        return {**self.stats, 'enabled': self.enabled, 'error': self.error}
@@ -0,0 +1,212 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: source_unit.py - Shared Source Cache for Standards Checkers
+# Date: 2026-10-18
+# Version: 1.0.1
+# Category: seed/standards/checkers
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.1 (2026-10-18): Removed token stream and import table views - no checker used them
+#   - v1.0.0 (2026-10-18): Initial implementation - parse-once SourceUnit, per-audit SourceCache, cached registry
+#
+# CODE STANDARDS:
+#   - Handler implements checking logic, module orchestrates
+# =============================================
+
+"""
+Shared Source Cache for Standards Checkers
+
+A SourceUnit is one Python file read once and parsed on demand: text,
+lines and AST are each built at most once and shared by every checker
+that looks at the file.
+
+Checker interface:
+    check_source(unit: SourceUnit, bypass_rules=None) -> Dict
+    check_module(module_path, bypass_rules=None) -> Dict   # shim, fresh unit
+
+Per audit, a SourceCache hands out one SourceUnit per path, so the 13
+checkers in branch_audit share a single read/parse per file. The cache
+also memoizes the BRANCH_REGISTRY.json branch list (longest path first)
+used for branch detection.
+
+Usage:
+    cache = SourceCache()
+    unit = cache.get("/home/aipass/aipass_core/flow/apps/flow.py")
+    imports_check.check_source(unit, bypass_rules=rules)
+"""
+
+import ast
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Infrastructure
+AIPASS_ROOT = Path.home() / "aipass_core"
+sys.path.insert(0, str(AIPASS_ROOT))
+sys.path.insert(0, str(Path.home()))
+
+BRANCH_REGISTRY_PATH = Path.home() / "BRANCH_REGISTRY.json"
+
+
+class SourceUnit:
+    """One Python file - read once, parsed lazily
+
+    Attributes:
+        module_path: Path string as given by the caller (used in messages)
+        path: Path object
+    """
+
+    def __init__(self, module_path: str, cache: Optional["SourceCache"] = None):
+        self.module_path = str(module_path)
+        self.path = Path(module_path)
+        self.cache = cache
+        self._exists: Optional[bool] = None
+        self._loaded = False
+        self._text = ''
+        self._lines: List[str] = []
+        self._read_error: Optional[Exception] = None
+        self._tree: Optional[ast.Module] = None
+        self._parsed = False
+        self._syntax_error: Optional[SyntaxError] = None
+
+    @classmethod
+    def load(cls, module_path: str) -> "SourceUnit":
+        """Fresh, uncached unit (what check_module shims use)"""
+        return cls(module_path)
+
+    # ---------- file ----------
+
+    @property
+    def exists(self) -> bool:
+        if self._exists is None:
+            self._exists = self.path.exists()
+        return self._exists
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._text = f.read()
+            self._lines = self._text.split('\n')
+        except Exception as e:
+            self._read_error = e
+
+    @property
+    def read_error(self) -> Optional[Exception]:
+        """Exception raised while reading, or None"""
+        self._load()
+        return self._read_error
+
+    @property
+    def text(self) -> str:
+        self._load()
+        return self._text
+
+    @property
+    def lines(self) -> List[str]:
+        """text.split('\\n') - same shape every checker used before"""
+        self._load()
+        return self._lines
+
+    # ---------- parsed views ----------
+
+    @property
+    def tree(self) -> Optional[ast.Module]:
+        """Parsed AST, or None if the file does not parse"""
+        if not self._parsed:
+            self._parsed = True
+            try:
+                self._tree = ast.parse(self.text, filename=self.module_path)
+            except SyntaxError as e:
+                self._syntax_error = e
+            except ValueError as e:
+                # Null bytes in source
+                self._syntax_error = SyntaxError(str(e))
+        return self._tree
+
+    @property
+    def syntax_error(self) -> Optional[SyntaxError]:
+        self.tree
+        return self._syntax_error
+
+    def registry_branches(self) -> List[Dict]:
+        """Registry branches (longest path first) - read once per audit when cached"""
+        if self.cache is not None:
+            return self.cache.registry_branches()
+        return registry_branches()
+
+
+class SourceCache:
+    """Per-audit cache: one SourceUnit per path, one registry read
+
+    Not meant to outlive an audit run - files are not re-validated.
+    """
+
+    def __init__(self):
+        self._units: Dict[str, SourceUnit] = {}
+        self._branches: Optional[List[Dict]] = None
+        self.stats = {'units': 0, 'hits': 0}
+
+    def get(self, module_path: str) -> SourceUnit:
+        """Shared unit for a path (created on first request)"""
+        key = str(module_path)
+        unit = self._units.get(key)
+        if unit is None:
+            unit = SourceUnit(key, cache=self)
+            self._units[key] = unit
+            self.stats['units'] += 1
+        else:
+            self.stats['hits'] += 1
+        return unit
+
+    def registry_branches(self) -> List[Dict]:
+        """Registry branches, longest path first (read once per audit)"""
+        if self._branches is None:
+            self._branches = registry_branches()
+        return self._branches
+
+    def get_stats(self) -> Dict[str, int]:
+        """Units created, cache hits, files read and files parsed"""
+        units = self._units.values()
+        return {
+            **self.stats,
+            'reads': sum(1 for u in units if u._loaded),
+            'parses': sum(1 for u in units if u._parsed)
+        }
+
+
+def registry_branches() -> List[Dict]:
+    """
+    BRANCH_REGISTRY.json branches sorted by path length (longest first)
+
+    Uses drone's signature-cached registry when importable, so repeated
+    calls in one process cost a stat() rather than a JSON parse.
+
+    Returns:
+        List of branch dicts ([] if the registry is missing or unreadable)
+    """
+    try:
+        from drone.apps.modules import load_registry
+        registry = load_registry()
+    except Exception:
+        registry = None  # drone not importable - read the file directly
+
+    if registry is None:
+        if not BRANCH_REGISTRY_PATH.exists():
+            return []
+        try:
+            with open(BRANCH_REGISTRY_PATH, 'r', encoding='utf-8') as f:
+                registry = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return []
+
+    if not registry:
+        return []
+    return sorted(registry.get('branches', []),
+                  key=lambda b: len(b.get('path', '')),
+                  reverse=True)
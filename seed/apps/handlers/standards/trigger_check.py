@@ -4,15 +4,15 @@
 # META DATA HEADER
 # Name: trigger_check.py - Trigger Standards Checker Handler
 # Date: 2025-12-04
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: seed/standards/checkers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): check_source(SourceUnit) interface - shared parse-once source, check_module kept as shim
 #   - v1.0.0 (2025-12-04): Added inline filesystem ops: .unlink(), .rename() detection
 #   - v0.9.0 (2025-12-04): Added repair/recovery/cleanup/backup/system lifecycle patterns
 #   - v0.8.0 (2025-12-04): Added line numbers to violation messages for navigation
 #   - v0.7.0 (2025-12-04): Added central patterns: update_central, write_central_*
-#   - v0.6.0 (2025-12-04): Added registry patterns: save/add/remove/sync_registry
 #
 # CODE STANDARDS:
 #   - Handler implements checking logic, module orchestrates
@@ -36,9 +36,10 @@
 """
 
 import re
-from pathlib import Path
 from typing import Dict, List, Optional
 
+from seed.apps.handlers.standards.source_unit import SourceUnit
+
 # Valid bypass categories for trigger standard
 BYPASS_CATEGORIES = {
     'handler_layer': 'Function in handlers/ layer (orchestrator fires instead)',
@@ -98,12 +99,12 @@ def is_trigger_handler(file_path: str) -> bool:
     return 'trigger' in file_path and 'handlers/events' in file_path
 
 
-def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+def check_source(unit: SourceUnit, bypass_rules: list | None = None) -> Dict:
     """
     Check if module follows Trigger standards
 
     Args:
-        module_path: Path to Python module to check
+        unit: SourceUnit for the file to check (see source_unit.py)
         bypass_rules: Optional list of bypass rules for specific violations
 
     Returns:
@@ -115,7 +116,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
         }
     """
     checks = []
-    path = Path(module_path)
+    module_path = unit.module_path
 
     # Check if entire standard is bypassed
     bypassed, category, reason = is_bypassed(module_path, 'trigger', bypass_rules=bypass_rules)
@@ -132,7 +133,7 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
             'standard': 'TRIGGER'
         }
 
-    if not path.exists():
+    if not unit.exists:
         return {
             'passed': False,
             'checks': [{'name': 'File exists', 'passed': False, 'message': f'File not found: {module_path}'}],
@@ -140,18 +141,17 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
             'standard': 'TRIGGER'
         }
 
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-    except Exception as e:
+    if unit.read_error is not None:
         return {
             'passed': False,
-            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {e}'}],
+            'checks': [{'name': 'File readable', 'passed': False, 'message': f'Error reading file: {unit.read_error}'}],
             'score': 0,
             'standard': 'TRIGGER'
         }
 
+    content = unit.text
+    lines = unit.lines
+
     is_handler = is_trigger_handler(module_path)
 
     # Check 1: For trigger handlers - no logger imports
@@ -213,6 +213,11 @@ def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
     }
 
 
+def check_module(module_path: str, bypass_rules: list | None = None) -> Dict:
+    """Path-based entry point (reads the file fresh) - see check_source"""
+    return check_source(SourceUnit.load(module_path), bypass_rules=bypass_rules)
+
+
 def check_no_logger_imports(_content: str, lines: List[str], _module_path: str) -> Dict:
     """
     Check that trigger handlers don't import Prax logger
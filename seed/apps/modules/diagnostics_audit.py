@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: diagnostics_audit.py - System-wide Type Error Diagnostics
 # Date: 2025-11-28
-# Version: 0.1.0
+# Version: 0.2.0
 # Category: seed/modules
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.2.0 (2026-10-18): One batched pyright run for all branches, unchanged files served from cache
 #   - v0.1.0 (2025-11-28): Initial implementation - pyright system scan
 #
 # CODE STANDARDS:
@@ -49,7 +50,7 @@
 from drone.apps.modules import normalize_branch_arg
 
 # Diagnostics handlers
-from seed.apps.handlers.diagnostics import discover_branches, run_branch_diagnostics
+from seed.apps.handlers.diagnostics import discover_branches, run_all_diagnostics
 
 
 def print_branch_diagnostics(result: Dict):
@@ -178,14 +179,8 @@ def handle_command(command: str, args: List[str]) -> bool:
 
         console.print(f"[dim]Found {len(branches)} branches to scan...[/dim]")
 
-        # Run diagnostics on all branches
-        all_results = []
-        for branch in branches:
-            console.print(f"[dim]Scanning {branch['name']}...[/dim]", end="\r")
-            result = run_branch_diagnostics(branch)
-            all_results.append(result)
-
-        console.print(" " * 50, end="\r")  # Clear progress
+        # Run diagnostics on all branches (one pyright run, cached files skipped)
+        all_results = run_all_diagnostics(branches)
 
         # Print results
         for result in all_results:
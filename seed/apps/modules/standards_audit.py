@@ -4,15 +4,15 @@
 # META DATA HEADER
 # Name: standards_audit.py - Branch-wide Standards Audit Module
 # Date: 2025-11-29
-# Version: 0.5.0
+# Version: 0.7.1
 # Category: seed/standards
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.7.1 (2026-10-18): Streamed branch lines note when the type check is still running
+#   - v0.7.0 (2026-10-18): Incremental audit - persistent result cache, --no-cache forces a full run
+#   - v0.6.0 (2026-10-18): --jobs N - process-parallel audit, branch results streamed as they finish
 #   - v0.5.0 (2025-11-29): Refactored to thin orchestrator - extracted implementation to handlers
 #   - v0.4.0 (2025-11-25): Simplified - audit now always checks ALL files with full details (no flags needed)
-#   - v0.3.0 (2025-11-25): Added --full flag to check ALL Python files (not just entry points)
-#   - v0.2.0 (2025-11-21): Now uses BRANCH_REGISTRY.json as source of truth (finds all 19 branches)
-#   - v0.1.0 (2025-11-16): Initial implementation - system-wide branch compliance audit
 #
 # CODE STANDARDS:
 #   - Thin orchestrator - delegates to handlers
@@ -58,13 +58,17 @@
 # Audit handlers (implementation)
 from seed.apps.handlers.audit import (
     discover_branches,
-    audit_branch,
+    audit_branches,
+    resolve_jobs,
     audit_bypasses,
     print_branch_summary,
     print_system_summary,
     print_bypass_audit
 )
 
+# Persistent checker result cache (incremental audits)
+from seed.apps.handlers.standards.result_cache import ResultCache
+
 # Bypass system - import from checklist
 from seed.apps.modules.standards_checklist import load_bypass_rules
 
@@ -93,11 +97,21 @@ def handle_command(command: str, args: List[str]) -> bool:
     # Parse arguments
     specific_branch = None
     show_bypasses = False
+    use_cache = True
+    jobs = 1
 
-    for arg in args:
+    for i, arg in enumerate(args):
         if arg in ['--show-bypasses', '--bypasses', '-b']:
             show_bypasses = True
-        elif not arg.startswith('-'):
+        elif arg == '--no-cache':
+            use_cache = False
+        elif arg in ['--jobs', '-j'] or arg.startswith('--jobs='):
+            value = arg.split('=', 1)[1] if '=' in arg else (args[i + 1] if i + 1 < len(args) else '')
+            if not value.isdigit():
+                console.print(f"[red]--jobs expects a number, got '{value}'[/red]")
+                return True
+            jobs = resolve_jobs(int(value))
+        elif not arg.startswith('-') and not (i > 0 and args[i - 1] in ['--jobs', '-j']):
             specific_branch = normalize_branch_arg(arg)
 
     # Handle --show-bypasses mode
@@ -119,7 +133,7 @@ def handle_command(command: str, args: List[str]) -> bool:
     # Log audit start
     json_handler.log_operation(
         "standards_audit_started",
-        {"specific_branch": specific_branch}
+        {"specific_branch": specific_branch, "jobs": jobs, "cache": use_cache}
     )
 
     # Discover branches
@@ -135,21 +149,33 @@ def handle_command(command: str, args: List[str]) -> bool:
             console.print(f"[red]Branch '{specific_branch}' not found[/red]")
             return True
 
-    console.print(f"[dim]Discovered {len(branches)} branches to audit...[/dim]")
-
-    # Audit all branches (always full - checks all files)
-    audit_results = []
-    for branch in branches:
-        console.print(f"[dim]Auditing {branch['name']}...[/dim]", end="\r")
-
-        # Load bypass rules for this branch
-        branch_path = Path(branch['path'])
-        bypass_rules = load_bypass_rules(str(branch_path))
+    workers = f", {jobs} workers" if jobs > 1 else ""
+    console.print(f"[dim]Discovered {len(branches)} branches to audit{workers}...[/dim]")
 
-        result = audit_branch(branch, bypass_rules)
-        audit_results.append(result)
+    # Load bypass rules for each branch
+    bypass_rules_map = {
+        branch['name']: load_bypass_rules(str(Path(branch['path'])))
+        for branch in branches
+    }
 
-    console.print(" " * 50, end="\r")  # Clear progress line
+    # Stream each branch as its checks finish (completion order with --jobs)
+    def on_branch_done(result, completed, total):
+        pending = "" if 'type_check' in result['scores'] else " (type check pending)"
+        console.print(
+            f"[dim]  [{completed}/{total}] {result['branch']['name']:20} {result['average']:3}%{pending}[/dim]"
+        )
+
+    # Audit all branches (always full - checks all files), results in discovery order
+    result_cache = ResultCache(enabled=use_cache)
+    audit_results = audit_branches(branches, bypass_rules_map, jobs=jobs, on_branch_done=on_branch_done,
+                                   result_cache=result_cache)
+    result_cache.release()
+
+    cache_stats = result_cache.get_stats()
+    if use_cache:
+        cache_note = f" - cache disabled: {cache_stats['error']}" if cache_stats['error'] else ""
+        console.print(f"[dim]Checker results: {cache_stats['hits']} cached, "
+                      f"{cache_stats['misses']} checked{cache_note}[/dim]")
 
     # Calculate system-wide averages for each standard
     standard_scores = defaultdict(list)
@@ -177,7 +203,9 @@ def handle_command(command: str, args: List[str]) -> bool:
         "standards_audit_completed",
         {
             "branches_audited": len(audit_results),
-            "average_compliance": int(sum(r['average'] for r in audit_results) / len(audit_results)) if audit_results else 0
+            "average_compliance": int(sum(r['average'] for r in audit_results) / len(audit_results)) if audit_results else 0,
+            "cache_hits": cache_stats['hits'],
+            "cache_misses": cache_stats['misses']
         }
     )
 
@@ -198,6 +226,8 @@ def print_help():
     console.print("  [cyan]audit [branch][/cyan]           - Full audit of specific branch")
     console.print("  [cyan]audit --show-bypasses[/cyan]    - Show all bypassed files and their current state")
     console.print("  [cyan]audit [branch] -b[/cyan]        - Show bypasses for specific branch")
+    console.print("  [cyan]audit --jobs N[/cyan]           - Run checks in N worker processes (0 = one per CPU)")
+    console.print("  [cyan]audit --no-cache[/cyan]         - Re-run every checker (ignore cached results)")
     console.print()
 
     console.print("[yellow]USAGE:[/yellow]")
@@ -217,6 +247,9 @@ def print_help():
     console.print("  [dim]# Full audit of specific branch[/dim]")
     console.print("  python3 seed.py audit cortex")
     console.print()
+    console.print("  [dim]# Full system audit on 8 worker processes (same scores and order)[/dim]")
+    console.print("  python3 seed.py audit --jobs 8")
+    console.print()
 
     console.print("[yellow]REFERENCE:[/yellow]")
     console.print("  Scans all AIPass branches and generates compliance dashboard.")
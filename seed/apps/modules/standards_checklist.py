@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: standards_checklist.py - Standards Checklist Module
 # Date: 2025-11-12
-# Version: 0.1.0
+# Version: 0.3.0
 # Category: seed/standards
 #
 # CHANGELOG (Max 5 entries):
+#   - v0.3.0 (2026-10-18): Checker results served from the persistent result cache (--no-cache to bypass)
+#   - v0.2.0 (2026-10-18): Checkers share one SourceUnit per checklist run
 #   - v0.1.0 (2025-11-12): Initial standards checklist module - framework only
 #
 # CODE STANDARDS:
@@ -62,6 +64,8 @@
 from seed.apps.handlers.standards import encapsulation_check
 from seed.apps.handlers.standards import trigger_check
 from seed.apps.handlers.standards import log_level_check
+from seed.apps.handlers.standards.source_unit import SourceUnit
+from seed.apps.handlers.standards.result_cache import ResultCache
 
 # =============================================================================
 # BYPASS SYSTEM - .seed/ config per branch
@@ -249,6 +253,7 @@ def print_help():
     console.print("[yellow]USAGE:[/yellow]")
     console.print("  [dim]# Via drone[/dim]")
     console.print("  drone @seed checklist <module_path>")
+    console.print("  drone @seed checklist <module_path> --no-cache   [dim]# re-run every checker[/dim]")
     console.print()
     console.print("  [dim]# Standalone[/dim]")
     console.print("  python3 /home/aipass/seed/apps/modules/standards_checklist.py <module_path>")
@@ -441,6 +446,9 @@ def print_checklist(args: List[str]):
 
     MODULE_NAME = "standards_checklist"
 
+    use_cache = "--no-cache" not in args
+    args = [arg for arg in args if arg != "--no-cache"]
+
     # Parse file path from args
     if len(args) == 0:
         # No file path provided - show usage
@@ -507,10 +515,16 @@ def print_checklist(args: List[str]):
     console.print()
     console.print()
 
+    # One read/parse of the file shared by every checker below
+    source = SourceUnit.load(file_path)
+
+    # Unchanged file + checker + bypass rules = stored result, no re-check
+    result_cache = ResultCache(enabled=use_cache)
+
     # Run imports check
     logger.info(f"[{MODULE_NAME}] Running IMPORTS standard check on {file_path}")
     console.print("[bold cyan]IMPORTS STANDARD:[/bold cyan]")
-    imports_result = imports_check.check_module(file_path, bypass_rules=bypass_rules)
+    imports_result = result_cache.check(source, 'imports', imports_check, bypass_rules)
 
     # Display results
     for check in imports_result['checks']:
@@ -529,7 +543,7 @@ def print_checklist(args: List[str]):
     # Run architecture check
     logger.info(f"[{MODULE_NAME}] Running ARCHITECTURE standard check on {file_path}")
     console.print("[bold cyan]ARCHITECTURE STANDARD:[/bold cyan]")
-    architecture_result = architecture_check.check_module(file_path, bypass_rules=bypass_rules)
+    architecture_result = result_cache.check(source, 'architecture', architecture_check, bypass_rules)
 
     # Display results
     for check in architecture_result['checks']:
@@ -548,7 +562,7 @@ def print_checklist(args: List[str]):
     # Run naming check
     logger.info(f"[{MODULE_NAME}] Running NAMING standard check on {file_path}")
     console.print("[bold cyan]NAMING STANDARD:[/bold cyan]")
-    naming_result = naming_check.check_module(file_path, bypass_rules=bypass_rules)
+    naming_result = result_cache.check(source, 'naming', naming_check, bypass_rules)
 
     # Display results
     for check in naming_result['checks']:
@@ -567,7 +581,7 @@ def print_checklist(args: List[str]):
     # Run CLI check
     logger.info(f"[{MODULE_NAME}] Running CLI standard check on {file_path}")
     console.print("[bold cyan]CLI STANDARD:[/bold cyan]")
-    cli_result = cli_check.check_module(file_path, bypass_rules=bypass_rules)
+    cli_result = result_cache.check(source, 'cli', cli_check, bypass_rules)
 
     # Display results
     for check in cli_result['checks']:
@@ -586,7 +600,7 @@ def print_checklist(args: List[str]):
     # Run HANDLERS check
     logger.info(f"[{MODULE_NAME}] Running HANDLERS standard check on {file_path}")
     console.print("[bold cyan]HANDLERS STANDARD:[/bold cyan]")
-    handlers_result = handlers_check.check_module(file_path, bypass_rules=bypass_rules)
+    handlers_result = result_cache.check(source, 'handlers', handlers_check, bypass_rules)
 
     # Display results
     for check in handlers_result['checks']:
@@ -605,7 +619,7 @@ def print_checklist(args: List[str]):
     # Run modules check
     logger.info(f"[{MODULE_NAME}] Running MODULES standard check on {file_path}")
     console.print("[bold cyan]MODULES STANDARD:[/bold cyan]")
-    modules_result = modules_check.check_module(file_path, bypass_rules=bypass_rules)
+    modules_result = result_cache.check(source, 'modules', modules_check, bypass_rules)
 
     # Display results
     for check in modules_result['checks']:
@@ -624,7 +638,7 @@ def print_checklist(args: List[str]):
     # Run documentation check
     logger.info(f"[{MODULE_NAME}] Running DOCUMENTATION standard check on {file_path}")
     console.print("[bold cyan]DOCUMENTATION STANDARD:[/bold cyan]")
-    documentation_result = documentation_check.check_module(file_path, bypass_rules=bypass_rules)
+    documentation_result = result_cache.check(source, 'documentation', documentation_check, bypass_rules)
 
     # Display results
     for check in documentation_result['checks']:
@@ -643,7 +657,7 @@ def print_checklist(args: List[str]):
     # Run JSON structure check
     logger.info(f"[{MODULE_NAME}] Running JSON_STRUCTURE standard check on {file_path}")
     console.print("[bold cyan]JSON STRUCTURE STANDARD:[/bold cyan]")
-    json_structure_result = json_structure_check.check_module(file_path, bypass_rules=bypass_rules)
+    json_structure_result = result_cache.check(source, 'json_structure', json_structure_check, bypass_rules)
 
     # Display results
     for check in json_structure_result['checks']:
@@ -662,7 +676,7 @@ def print_checklist(args: List[str]):
     # Run testing check
     logger.info(f"[{MODULE_NAME}] Running TESTING standard check on {file_path}")
     console.print("[bold cyan]TESTING STANDARD:[/bold cyan]")
-    testing_result = testing_check.check_module(file_path, bypass_rules=bypass_rules)
+    testing_result = result_cache.check(source, 'testing', testing_check, bypass_rules)
 
     # Display results
     for check in testing_result['checks']:
@@ -681,7 +695,7 @@ def print_checklist(args: List[str]):
     # Run error handling check
     logger.info(f"[{MODULE_NAME}] Running ERROR_HANDLING standard check on {file_path}")
     console.print("[bold cyan]ERROR HANDLING STANDARD:[/bold cyan]")
-    error_handling_result = error_handling_check.check_module(file_path, bypass_rules=bypass_rules)
+    error_handling_result = result_cache.check(source, 'error_handling', error_handling_check, bypass_rules)
 
     # Display results
     for check in error_handling_result['checks']:
@@ -700,7 +714,7 @@ def print_checklist(args: List[str]):
     # Run encapsulation check
     logger.info(f"[{MODULE_NAME}] Running ENCAPSULATION standard check on {file_path}")
     console.print("[bold cyan]ENCAPSULATION STANDARD:[/bold cyan]")
-    encapsulation_result = encapsulation_check.check_module(file_path, bypass_rules=bypass_rules)
+    encapsulation_result = result_cache.check(source, 'encapsulation', encapsulation_check, bypass_rules)
 
     # Display results
     for check in encapsulation_result['checks']:
@@ -719,7 +733,7 @@ def print_checklist(args: List[str]):
     # Run trigger check
     logger.info(f"[{MODULE_NAME}] Running TRIGGER standard check on {file_path}")
     console.print("[bold cyan]TRIGGER STANDARD:[/bold cyan]")
-    trigger_result = trigger_check.check_module(file_path, bypass_rules=bypass_rules)
+    trigger_result = result_cache.check(source, 'trigger', trigger_check, bypass_rules)
 
     # Display results
     for check in trigger_result['checks']:
@@ -738,7 +752,7 @@ def print_checklist(args: List[str]):
     # Run log level check
     logger.info(f"[{MODULE_NAME}] Running LOG_LEVEL standard check on {file_path}")
     console.print("[bold cyan]LOG LEVEL STANDARD:[/bold cyan]")
-    log_level_result = log_level_check.check_module(file_path, bypass_rules=bypass_rules)
+    log_level_result = result_cache.check(source, 'log_level', log_level_check, bypass_rules)
 
     # Display results
     for check in log_level_result['checks']:
@@ -761,6 +775,7 @@ def print_checklist(args: List[str]):
     console.print("─" * 70)
     console.print()
     logger.info(f"[{MODULE_NAME}] Standards check complete: {avg_score}% average compliance")
+    result_cache.release()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,161 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_parallel_audit.py - Parallel audit tests
+# Date: 2026-10-18
+# Version: 1.2.0
+# Category: seed/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): Branches stream before the batched pyright run finishes
+#   - v1.1.0 (2026-10-18): Failed worker tasks recorded as failed checks
+#   - v1.0.0 (2026-10-18): Initial implementation
+#
+# CODE STANDARDS:
+#   - Audits the branches shipped next to seed, never writes to them
+#   - pyright diagnostics stubbed per test (its run time is not what is measured)
+# =============================================
+
+"""Tests for handlers/audit/parallel_audit.py - serial/pool parity, streaming, 1-8 worker scaling."""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Directory containing the seed package on path so 'seed.apps...' resolves
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from seed.apps.handlers.audit import parallel_audit
+from seed.apps.handlers.audit.branch_audit import audit_branch, file_tasks, plan_branch
+from seed.apps.handlers.standards import diagnostics_check
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _branches():
+    candidates = [ROOT / "seed"]
+    if (ROOT / "aipass_core").is_dir():
+        candidates += sorted((ROOT / "aipass_core").iterdir())
+    return [
+        {'name': d.name.upper(), 'path': str(d), 'entry_file': str(d / 'apps' / f'{d.name}.py')}
+        for d in candidates if (d / 'apps').is_dir()
+    ]
+
+
+def _without_stats(results):
+    return [{k: v for k, v in r.items() if k != 'source_cache'} for r in results]
+
+
+def _exploding_files_task(tasks, bypass_rules):
+    raise MemoryError("worker killed")
+
+
+def _exploding_diagnostics(branch_paths, engine=None):
+    raise RuntimeError("pyright crashed")
+
+
+@pytest.fixture(autouse=True)
+def no_pyright(monkeypatch):
+    monkeypatch.setattr(diagnostics_check, "check_branch",
+                        lambda branch_path, engine=None: {'total_errors': 0, 'results': []})
+    monkeypatch.setattr(diagnostics_check, "check_branches",
+                        lambda branch_paths, engine=None: {
+                            path: {'total_errors': 0, 'results': []} for path in branch_paths
+                        })
+
+
+class TestPlan:
+    """Planning merges stages into one task per file"""
+
+    def test_one_task_per_file(self):
+        plan = plan_branch(_branches()[0])
+        paths = [path for path, _ in file_tasks(plan)]
+        assert len(paths) == len(set(paths))
+        assert paths[0] == plan['entry_file']
+
+
+class TestParity:
+    """Pool results must match the serial audit exactly"""
+
+    def test_jobs_match_serial(self):
+        branches = _branches()
+        serial = [audit_branch(branch, []) for branch in branches]
+        pooled = parallel_audit.audit_branches(branches, {}, jobs=3)
+        assert [r['branch']['name'] for r in pooled] == [b['name'] for b in branches]
+        assert _without_stats(pooled) == _without_stats(serial)
+
+    def test_streams_every_branch(self):
+        branches = _branches()
+        seen = []
+        parallel_audit.audit_branches(branches, {}, jobs=2,
+                                      on_branch_done=lambda r, done, total: seen.append((done, total)))
+        assert seen == [(i, len(branches)) for i in range(1, len(branches) + 1)]
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_streams_before_diagnostics(self, monkeypatch, tmp_path, jobs):
+        """on_branch_done fires on each branch's own checks; pyright only completes the returned results"""
+        def slow_diagnostics(branch_paths, engine=None):
+            # Runs in a worker with jobs > 1 - wait (bounded) for the parent to report every branch
+            deadline = time.monotonic() + 10
+            while len(list(tmp_path.iterdir())) < len(branch_paths):
+                if time.monotonic() > deadline:
+                    raise TimeoutError("branches not reported while diagnostics were running")
+                time.sleep(0.01)
+            return {path: {'total_errors': 0, 'results': []} for path in branch_paths}
+
+        def on_branch_done(result, done, total):
+            seen.append(result)
+            (tmp_path / result['branch']['name']).touch()
+
+        monkeypatch.setattr(diagnostics_check, "check_branches", slow_diagnostics)
+        branches = _branches()[:3]
+        seen = []
+
+        results = parallel_audit.audit_branches(branches, {}, jobs=jobs, on_branch_done=on_branch_done)
+        assert len(seen) == len(branches)
+        assert all('type_check' not in r['scores'] and r['type_errors'] is None for r in seen)
+        assert [r['scores']['type_check'] for r in results] == [100] * len(branches)
+        assert all(r['type_errors'] == 0 for r in results)
+
+    def test_failed_tasks_recorded_not_raised(self, monkeypatch):
+        """A chunk or diagnostics task that dies fails its checks, the audit carries on"""
+        monkeypatch.setattr(parallel_audit, "_files_task", _exploding_files_task)
+        monkeypatch.setattr(diagnostics_check, "check_branches", _exploding_diagnostics)
+        branches = _branches()[:2]
+
+        results = parallel_audit.audit_branches(branches, {}, jobs=2)
+        assert [r['branch']['name'] for r in results] == [b['name'] for b in branches]
+        for result in results:
+            assert result['results']['imports'] == {
+                'passed': False, 'score': 0, 'error': 'Audit task failed: worker killed'
+            }
+            assert result['scores']['imports'] == 0
+            assert result['results']['type_check']['error'] == 'Diagnostics task failed: pyright crashed'
+            assert result['scores']['type_check'] == 0
+
+    def test_resolve_jobs(self):
+        assert parallel_audit.resolve_jobs(4) == 4
+        assert parallel_audit.resolve_jobs(0) >= 1
+
+
+class TestScaling:
+    """Benchmark: wall time for 1, 2, 4 and 8 workers"""
+
+    def test_scaling_1_to_8_workers(self):
+        branches = _branches()
+        timings = {}
+        baseline = None
+        for jobs in (1, 2, 4, 8):
+            start = time.perf_counter()
+            results = parallel_audit.audit_branches(branches, {}, jobs=jobs)
+            timings[jobs] = time.perf_counter() - start
+            if baseline is None:
+                baseline = _without_stats(results)
+            assert _without_stats(results) == baseline
+
+        line = ", ".join(f"{jobs}w {secs * 1000:.0f} ms ({timings[1] / secs:.1f}x)"
+                         for jobs, secs in timings.items())
+        print(f"\n  {len(branches)} branches: {line}")
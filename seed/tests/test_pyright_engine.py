@@ -0,0 +1,140 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_pyright_engine.py - Batched pyright engine tests
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: seed/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation
+#
+# CODE STANDARDS:
+#   - A fake pyright (records each invocation) stands in for the real one
+#   - Cache database and sample branches live in a temp dir
+# =============================================
+
+"""Tests for handlers/diagnostics/pyright_engine.py - one run per request, per-file mapping, cache keys."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Directory containing the seed package on path so 'seed.apps...' resolves
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from seed.apps.handlers.diagnostics import pyright_engine
+from seed.apps.handlers.diagnostics.pyright_engine import PyrightEngine, resolve_dependencies
+from seed.apps.handlers.standards import diagnostics_check
+
+# Emits one error per line containing BAD in each file it is given
+FAKE_PYRIGHT = '''
+import json, sys
+args = [a for a in sys.argv[1:] if a != "--outputjson"]
+with open(sys.argv[0] + ".calls", "a") as log:
+    log.write(json.dumps(args) + "\\n")
+diags = []
+for path in args:
+    for number, line in enumerate(open(path).read().splitlines()):
+        if "BAD" in line:
+            diags.append({"file": path, "severity": "error", "message": "bad line",
+                          "range": {"start": {"line": number}}, "rule": "fake"})
+print(json.dumps({"generalDiagnostics": diags, "summary": {"filesAnalyzed": len(args)}}))
+'''
+
+
+@pytest.fixture
+def fake_pyright(temp_test_dir, monkeypatch):
+    script = temp_test_dir / "fake_pyright.py"
+    script.write_text(FAKE_PYRIGHT)
+    monkeypatch.setattr(pyright_engine, "PYRIGHT_COMMAND", [sys.executable, str(script), "--outputjson"])
+
+    def calls():
+        log = Path(str(script) + ".calls")
+        return [json.loads(line) for line in log.read_text().splitlines()] if log.exists() else []
+    return calls
+
+
+@pytest.fixture
+def branches(temp_test_dir):
+    """Two branches: alpha (one bad file importing a helper) and beta"""
+    alpha = temp_test_dir / "alpha" / "apps" / "handlers"
+    beta = temp_test_dir / "beta" / "apps"
+    alpha.mkdir(parents=True)
+    beta.mkdir(parents=True)
+    (alpha / "__init__.py").write_text("")
+    (alpha / "helper.py").write_text("VALUE = 1\n")
+    (alpha / "main.py").write_text("from .helper import VALUE\nx = VALUE  # BAD\n")
+    (beta / "beta.py").write_text("print('ok')\n")
+    return [str(temp_test_dir / "alpha"), str(temp_test_dir / "beta")]
+
+
+class TestBatching:
+    """Many files, one pyright process"""
+
+    def test_system_scan_is_one_run(self, temp_test_dir, fake_pyright, branches):
+        engine = PyrightEngine(temp_test_dir / "diag.db")
+        results = diagnostics_check.check_branches(branches, engine=engine)
+        engine.close()
+
+        assert len(fake_pyright()) == 1
+        assert results[branches[0]]['total_errors'] == 1
+        assert results[branches[0]]['results'][0]['file'].endswith("main.py")
+        assert results[branches[0]]['results'][0]['diagnostics'][0]['line'] == 2
+        assert results[branches[1]]['total_errors'] == 0
+
+    def test_failure_is_reported_not_cached(self, temp_test_dir, monkeypatch, branches):
+        monkeypatch.setattr(pyright_engine, "PYRIGHT_COMMAND", [sys.executable, "-c", "print('not json')"])
+        engine = PyrightEngine(temp_test_dir / "diag.db")
+        result = diagnostics_check.check_branch(branches[1], engine=engine)
+        assert 'error' in result
+        assert engine.check_files([str(Path(branches[1]) / "apps" / "beta.py")])[1] is not None
+
+
+class TestCache:
+    """Unchanged files skip pyright; edits re-check the file and its importers"""
+
+    def _scan(self, db, branches):
+        engine = PyrightEngine(db)
+        results = diagnostics_check.check_branches(branches, engine=engine)
+        engine.close()
+        return results, engine.get_stats()
+
+    def test_unchanged_scan_runs_nothing(self, temp_test_dir, fake_pyright, branches):
+        db = temp_test_dir / "diag.db"
+        first, _ = self._scan(db, branches)
+        second, stats = self._scan(db, branches)
+        assert second == first
+        assert stats['pyright_runs'] == 0
+        assert len(fake_pyright()) == 1
+
+    def test_edit_rechecks_only_that_file(self, temp_test_dir, fake_pyright, branches):
+        db = temp_test_dir / "diag.db"
+        self._scan(db, branches)
+        beta = Path(branches[1]) / "apps" / "beta.py"
+        beta.write_text("print('ok')  # BAD now\n")
+        results, _ = self._scan(db, branches)
+        assert fake_pyright()[-1] == [str(beta)]
+        assert results[branches[1]]['total_errors'] == 1
+
+    def test_dependency_edit_rechecks_importer(self, temp_test_dir, fake_pyright, branches):
+        db = temp_test_dir / "diag.db"
+        self._scan(db, branches)
+        helper = Path(branches[0]) / "apps" / "handlers" / "helper.py"
+        helper.write_text("VALUE = 2\n")
+        self._scan(db, branches)
+        assert sorted(Path(p).name for p in fake_pyright()[-1]) == ["helper.py", "main.py"]
+
+
+class TestDependencies:
+    """Local import resolution"""
+
+    def test_relative_and_branch_imports(self, branches):
+        main = Path(branches[0]) / "apps" / "handlers" / "main.py"
+        deps = resolve_dependencies(str(main), "from .helper import VALUE\nfrom apps.handlers import helper\nimport os\n")
+        assert str(main.parent / "helper.py") in deps
+        assert str(main.parent / "__init__.py") in deps
+        assert not any(d.endswith("os.py") for d in deps)
@@ -0,0 +1,169 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_result_cache.py - Persistent checker result cache tests
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: seed/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation
+#
+# CODE STANDARDS:
+#   - Cache database lives in a temp dir, audited branches are never written
+#   - pyright diagnostics stubbed per test (not part of the cache)
+# =============================================
+
+"""Tests for handlers/standards/result_cache.py - invalidation keys, audit parity, no-change re-audit benchmark."""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Directory containing the seed package on path so 'seed.apps...' resolves
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from seed.apps.handlers.audit import parallel_audit
+from seed.apps.handlers.audit.branch_audit import audit_branch
+from seed.apps.handlers.standards import (
+    architecture_check, cli_check, diagnostics_check, result_cache as result_cache_module
+)
+from seed.apps.handlers.standards.result_cache import UNCACHED_CHECKERS, ResultCache
+from seed.apps.handlers.standards.source_unit import SourceUnit
+
+ROOT = Path(__file__).resolve().parents[2]
+
+SAMPLE = '"""Sample"""\n\nimport sys\n\n\ndef run():\n    print("hi")\n'
+
+
+def _branches():
+    candidates = [ROOT / "seed"]
+    if (ROOT / "aipass_core").is_dir():
+        candidates += sorted((ROOT / "aipass_core").iterdir())
+    return [
+        {'name': d.name.upper(), 'path': str(d), 'entry_file': str(d / 'apps' / f'{d.name}.py')}
+        for d in candidates if (d / 'apps').is_dir()
+    ]
+
+
+def _without_stats(results):
+    return [{k: v for k, v in r.items() if k != 'source_cache'} for r in results]
+
+
+@pytest.fixture(autouse=True)
+def no_pyright(monkeypatch):
+    monkeypatch.setattr(diagnostics_check, "check_branch",
+                        lambda branch_path, engine=None: {'total_errors': 0, 'results': []})
+    monkeypatch.setattr(diagnostics_check, "check_branches",
+                        lambda branch_paths, engine=None: {
+                            path: {'total_errors': 0, 'results': []} for path in branch_paths
+                        })
+
+
+@pytest.fixture
+def sample(temp_test_dir):
+    path = temp_test_dir / "sample.py"
+    path.write_text(SAMPLE)
+    return path
+
+
+class TestInvalidation:
+    """A stored result is reused only while every key part matches"""
+
+    def _prime(self, db, path, rules=None):
+        cache = ResultCache(db)
+        cache.check(SourceUnit(str(path)), 'cli', cli_check, rules)
+        cache.release()
+
+    def _lookup(self, db, path, rules=None):
+        cache = ResultCache(db)
+        cached, missing = cache.lookup(str(path), {'cli': cli_check}, rules)
+        cache.release()
+        return cached, missing
+
+    def test_unchanged_file_hits(self, temp_test_dir, sample):
+        db = temp_test_dir / "cache.db"
+        self._prime(db, sample)
+        cached, missing = self._lookup(db, sample)
+        assert missing == ()
+        assert cached['cli'] == cli_check.check_source(SourceUnit(str(sample)))
+
+    def test_content_change_misses(self, temp_test_dir, sample):
+        db = temp_test_dir / "cache.db"
+        self._prime(db, sample)
+        sample.write_text(SAMPLE + "\n# edited\n")
+        assert self._lookup(db, sample)[1] == ('cli',)
+
+    def test_bypass_change_misses(self, temp_test_dir, sample):
+        db = temp_test_dir / "cache.db"
+        self._prime(db, sample, rules=[])
+        rules = [{'file': str(sample), 'standard': 'cli'}]
+        assert self._lookup(db, sample, rules)[1] == ('cli',)
+
+    def test_checker_source_change_misses(self, temp_test_dir, sample, monkeypatch):
+        db = temp_test_dir / "cache.db"
+        self._prime(db, sample)
+        monkeypatch.setitem(result_cache_module._checker_hashes, str(cli_check.__file__), "edited")
+        assert self._lookup(db, sample)[1] == ('cli',)
+
+    def test_context_dependent_checkers_never_cached(self, temp_test_dir, sample):
+        assert 'architecture' in UNCACHED_CHECKERS
+        db = temp_test_dir / "cache.db"
+        cache = ResultCache(db)
+        cache.check(SourceUnit(str(sample)), 'architecture', architecture_check, [])
+        assert cache.get_stats()['stored'] == 0
+        assert cache.lookup(str(sample), {'architecture': architecture_check}, [])[1] == ('architecture',)
+
+    def test_disabled_cache_checks_everything(self, temp_test_dir, sample):
+        db = temp_test_dir / "cache.db"
+        self._prime(db, sample)
+        cache = ResultCache(db, enabled=False)
+        assert cache.lookup(str(sample), {'cli': cli_check}, [])[1] == ('cli',)
+
+
+class TestAuditParity:
+    """Cached audits report exactly what a full audit reports"""
+
+    def test_serial_and_pool_match_uncached(self, temp_test_dir):
+        branches = _branches()
+        db = temp_test_dir / "cache.db"
+        full = [audit_branch(branch, []) for branch in branches]
+
+        cold = parallel_audit.audit_branches(branches, {}, jobs=1, result_cache=ResultCache(db))
+        warm_cache = ResultCache(db)
+        warm = parallel_audit.audit_branches(branches, {}, jobs=2, result_cache=warm_cache)
+
+        assert _without_stats(cold) == _without_stats(full)
+        assert _without_stats(warm) == _without_stats(full)
+        stats = warm_cache.get_stats()
+        assert stats['hits'] > 0
+        assert stats['hashed'] == 0
+
+
+class TestReauditBenchmark:
+    """Benchmark: whole-tree audit, full vs no-change re-audit"""
+
+    def test_no_change_reaudit(self, temp_test_dir):
+        branches = _branches()
+        db = temp_test_dir / "cache.db"
+
+        start = time.perf_counter()
+        parallel_audit.audit_branches(branches, {}, result_cache=ResultCache(db))
+        cold = time.perf_counter() - start
+
+        cache = ResultCache(db)
+        start = time.perf_counter()
+        parallel_audit.audit_branches(branches, {}, result_cache=cache)
+        warm = time.perf_counter() - start
+        cache.release()
+
+        stats = cache.get_stats()
+        print(f"\n  {len(branches)} branches: full {cold * 1000:.0f} ms, "
+              f"no-change re-audit {warm * 1000:.0f} ms "
+              f"({stats['hits']} cached, {stats['misses']} checked)")
+
+        assert warm < 1.0
+        assert stats['hits'] > stats['misses']
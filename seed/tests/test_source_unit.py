@@ -0,0 +1,112 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_source_unit.py - Shared source cache tests
+# Date: 2026-10-18
+# Version: 1.0.0
+# Category: seed/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.0 (2026-10-18): Initial implementation
+#
+# CODE STANDARDS:
+#   - Runs checkers against seed's own apps/ tree, never writes to it
+# =============================================
+
+"""Tests for handlers/standards/source_unit.py - parse-once units, shim parity, audit benchmark."""
+
+import sys
+import time
+from pathlib import Path
+
+# Directory containing the seed package on path so 'seed.apps...' resolves
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from seed.apps.handlers.standards.source_unit import SourceCache, SourceUnit
+from seed.apps.handlers.standards import (
+    architecture_check, cli_check, documentation_check, encapsulation_check,
+    error_handling_check, handlers_check, imports_check, json_structure_check,
+    log_level_check, modules_check, naming_check, testing_check, trigger_check,
+)
+
+SEED_APPS = Path(__file__).resolve().parents[1] / "apps"
+
+CHECKERS = [
+    imports_check, architecture_check, naming_check, cli_check, handlers_check,
+    modules_check, documentation_check, json_structure_check, testing_check,
+    error_handling_check, encapsulation_check, trigger_check, log_level_check,
+]
+
+
+def _apps_files():
+    return sorted(str(p) for p in SEED_APPS.rglob("*.py") if p.name != "__init__.py")
+
+
+class TestSourceUnit:
+    """Lazy read/parse behaviour"""
+
+    def test_views_built_once(self, temp_test_dir):
+        path = temp_test_dir / "sample.py"
+        path.write_text("import os\nfrom pathlib import Path\n\ndef run():\n    import json\n")
+        unit = SourceUnit(str(path))
+        assert unit.lines == unit.text.split("\n")
+        assert unit.tree is unit.tree
+
+    def test_syntax_error_has_no_tree(self, temp_test_dir):
+        path = temp_test_dir / "broken.py"
+        path.write_text("def broken(:\n")
+        unit = SourceUnit(str(path))
+        assert unit.tree is None
+        assert isinstance(unit.syntax_error, SyntaxError)
+
+    def test_missing_file_result_unchanged(self, temp_test_dir):
+        missing = str(temp_test_dir / "missing.py")
+        result = imports_check.check_source(SourceUnit(missing))
+        assert result["score"] == 0
+        assert result["checks"][0]["message"] == f"File not found: {missing}"
+
+    def test_cache_shares_units(self):
+        cache = SourceCache()
+        path = _apps_files()[0]
+        assert cache.get(path) is cache.get(path)
+        assert cache.get_stats()["units"] == 1
+
+
+class TestShimParity:
+    """check_module(path) must match check_source(unit) for every checker"""
+
+    def test_all_checkers_match(self):
+        cache = SourceCache()
+        for path in _apps_files():
+            for checker in CHECKERS:
+                assert checker.check_module(path, bypass_rules=[]) == \
+                    checker.check_source(cache.get(path), bypass_rules=[]), (checker.__name__, path)
+
+
+class TestAuditBenchmark:
+    """Benchmark: all checkers over seed/apps, per-checker reads vs shared units"""
+
+    def test_shared_units_read_each_file_once(self):
+        files = _apps_files()
+
+        start = time.perf_counter()
+        for path in files:
+            for checker in CHECKERS:
+                checker.check_module(path, bypass_rules=[])
+        legacy = time.perf_counter() - start
+
+        cache = SourceCache()
+        start = time.perf_counter()
+        for path in files:
+            for checker in CHECKERS:
+                checker.check_source(cache.get(path), bypass_rules=[])
+        shared = time.perf_counter() - start
+
+        stats = cache.get_stats()
+        print(f"\n  {len(files)} files x {len(CHECKERS)} checkers: "
+              f"legacy {legacy * 1000:.0f} ms, shared {shared * 1000:.0f} ms, "
+              f"file reads {len(files) * len(CHECKERS)} -> {stats['reads']}")
+
+        assert stats["units"] == len(files)
+        assert stats["reads"] <= len(files)
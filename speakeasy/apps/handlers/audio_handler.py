@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: audio_handler.py - Audio capture and VAD handler
 # Date: 2026-02-11
-# Version: 1.0.0
+# Version: 1.2.0
 # Category: speakeasy/handlers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): VAD segmenter - on_segment hands off pause-delimited audio while recording
+#   - v1.1.0 (2026-10-18): Preallocated int16 capture buffer - frame views, no per-sample objects
 #   - v1.0.0 (2026-02-11): Initial implementation
 #
 # CODE STANDARDS:
@@ -20,15 +22,213 @@
 
 Provides pure functions for audio recording with WebRTC VAD.
 Based on whisper-writer/src/result_thread.py patterns.
+
+Captured samples go straight from the sounddevice callback into a
+preallocated int16 buffer (grown by doubling). VAD/energy checks read
+frame views of it and the recording is returned as a view, not a copy.
+
+With on_segment, record_audio also cuts the recording at speech pauses and
+hands each completed segment (a view) to the caller while recording goes on.
 """
 
 import time
 import numpy as np
 import sounddevice as sd
 import webrtcvad
-from collections import deque
 from threading import Event
 
+# Initial capture buffer size - grown by doubling past this
+CAPTURE_BUFFER_SECONDS = 30
+
+# Streaming segmentation: pause that ends a segment, hard cap, leading silence kept
+SEGMENT_PAUSE_MS = 450
+SEGMENT_MAX_MS = 15000
+SEGMENT_PAD_MS = 200
+
+
+def create_capture_buffer(sample_rate=16000, seconds=CAPTURE_BUFFER_SECONDS):
+    """
+    Create a growable int16 capture buffer.
+
+    Single producer (audio callback) / single consumer (record loop):
+    append_samples() writes the samples before publishing the new size,
+    so a reader never sees unwritten data.
+
+    Args:
+        sample_rate: Audio sample rate in Hz (default: 16000)
+        seconds: Initial capacity in seconds (default: CAPTURE_BUFFER_SECONDS)
+
+    Returns:
+        dict: Buffer state with keys:
+            - data: numpy int16 backing array
+            - size: Samples written
+            - read: Samples consumed by next_frame()
+            - start: First sample of the recording (see discard_captured)
+    """
+    capacity = max(1, int(sample_rate * seconds))
+    return {
+        'data': np.empty(capacity, dtype=np.int16),
+        'size': 0,
+        'read': 0,
+        'start': 0
+    }
+
+
+def append_samples(buffer, samples):
+    """
+    Copy a block of samples into the capture buffer, growing it if full.
+
+    Args:
+        buffer: Capture buffer from create_capture_buffer()
+        samples: 1-D int16 array (e.g. indata[:, 0] from the stream callback)
+    """
+    size = buffer['size']
+    end = size + len(samples)
+    data = buffer['data']
+    if end > len(data):
+        grown = np.empty(max(end, 2 * len(data)), dtype=np.int16)
+        grown[:size] = data[:size]
+        buffer['data'] = data = grown
+    data[size:end] = samples
+    buffer['size'] = end
+
+
+def next_frame(buffer, frame_size):
+    """
+    Take the next unread frame as a view into the buffer.
+
+    Args:
+        buffer: Capture buffer from create_capture_buffer()
+        frame_size: Samples per frame
+
+    Returns:
+        numpy.ndarray: int16 view of frame_size samples, or None if not yet captured
+    """
+    read = buffer['read']
+    if buffer['size'] - read < frame_size:
+        return None
+    buffer['read'] = read + frame_size
+    return buffer['data'][read:read + frame_size]
+
+
+def discard_captured(buffer):
+    """
+    Drop everything captured so far (e.g. stale data at stream start).
+
+    Moves the read/start markers instead of clearing, so it is safe while
+    the callback is still appending.
+
+    Args:
+        buffer: Capture buffer from create_capture_buffer()
+    """
+    size = buffer['size']
+    buffer['read'] = size
+    buffer['start'] = size
+
+
+def captured_audio(buffer):
+    """
+    Return the recording as a contiguous int16 view (no copy).
+
+    Args:
+        buffer: Capture buffer from create_capture_buffer()
+
+    Returns:
+        numpy.ndarray: int16 samples from start to the last appended sample
+    """
+    return buffer['data'][buffer['start']:buffer['size']]
+
+
+def create_segmenter(sample_rate=16000, start=0, pause_ms=SEGMENT_PAUSE_MS,
+                     max_ms=SEGMENT_MAX_MS, pad_ms=SEGMENT_PAD_MS):
+    """
+    Create VAD segmentation state for streaming transcription.
+
+    Args:
+        sample_rate: Audio sample rate in Hz (default: 16000)
+        start: Buffer index the first segment starts at
+        pause_ms: Silence after speech that completes a segment
+        max_ms: Segment length that forces a cut without a pause
+        pad_ms: Silence kept in front of the first speech frame
+
+    Returns:
+        dict: Segmenter state (start, speech, silent_ms, emitted and limits)
+    """
+    return {
+        'start': start,
+        'speech': False,
+        'silent_ms': 0,
+        'emitted': 0,
+        'pause_ms': pause_ms,
+        'max_samples': int(sample_rate * max_ms / 1000),
+        'pad_samples': int(sample_rate * pad_ms / 1000)
+    }
+
+
+def segment_step(segmenter, speech, frame_end, frame_ms=30):
+    """
+    Advance the segmenter by one frame.
+
+    Args:
+        segmenter: State from create_segmenter()
+        speech: VAD result for the frame
+        frame_end: Buffer index just past the frame
+        frame_ms: Frame duration in ms (default: 30)
+
+    Returns:
+        tuple: (start, end) buffer indices of a completed segment, or None
+    """
+    if speech:
+        segmenter['speech'] = True
+        segmenter['silent_ms'] = 0
+    else:
+        segmenter['silent_ms'] += frame_ms
+        if not segmenter['speech']:
+            # No speech yet - slide the start, keeping pad_samples of lead-in
+            segmenter['start'] = max(segmenter['start'], frame_end - segmenter['pad_samples'])
+            return None
+
+    start = segmenter['start']
+    if segmenter['silent_ms'] >= segmenter['pause_ms'] or frame_end - start >= segmenter['max_samples']:
+        segmenter['start'] = frame_end
+        segmenter['speech'] = False
+        segmenter['silent_ms'] = 0
+        segmenter['emitted'] += 1
+        return (start, frame_end)
+    return None
+
+
+def segment_tail(segmenter, end):
+    """
+    Bounds of the final, unfinished segment.
+
+    Args:
+        segmenter: State from create_segmenter()
+        end: Buffer index of the last captured sample
+
+    Returns:
+        tuple: (start, end), or None when the tail is silence after earlier
+        segments (or empty)
+    """
+    start = segmenter['start']
+    if end <= start or (not segmenter['speech'] and segmenter['emitted']):
+        return None
+    return (start, end)
+
+
+def frame_energy(frame):
+    """
+    RMS energy of an int16 frame.
+
+    Args:
+        frame: numpy int16 array
+
+    Returns:
+        float: Root mean square sample value
+    """
+    samples = frame.astype(np.float32)
+    return float(np.sqrt(np.dot(samples, samples) / len(samples)))
+
 
 def create_audio_stream(sample_rate=16000, device=None):
     """
@@ -76,7 +276,7 @@ def is_speech(frame, vad, sample_rate=16000):
 def record_audio(sample_rate=16000, silence_duration=900, vad_aggressiveness=2,
                  min_duration=100, device=None, initial_skip_ms=150,
                  energy_threshold=0, stop_event=None,
-                 recording_mode="press_to_toggle"):
+                 recording_mode="press_to_toggle", on_segment=None):
     """
     Record audio with mode-dependent stop behavior.
 
@@ -86,6 +286,10 @@ def record_audio(sample_rate=16000, silence_duration=900, vad_aggressiveness=2,
         - voice_activity_detection / continuous: Uses WebRTC VAD to auto-stop
           after detecting speech followed by silence.
 
+    Streaming (any mode): with on_segment, every pause-delimited segment is
+    passed as on_segment(audio, final) while recording continues; the last
+    call after the stream closes has final=True.
+
     Args:
         sample_rate: Audio sample rate in Hz (default: 16000)
         silence_duration: Duration of silence in ms to stop recording (default: 900)
@@ -96,9 +300,12 @@ def record_audio(sample_rate=16000, silence_duration=900, vad_aggressiveness=2,
         energy_threshold: Energy threshold for noise gating (default: 0=disabled)
         stop_event: threading.Event to signal recording should stop (default: None)
         recording_mode: Recording mode (default: "press_to_toggle")
+        on_segment: Callback(audio, final) for streaming transcription; audio is
+            an int16 view of the capture buffer (default: None)
 
     Returns:
-        numpy.ndarray: int16 audio data, or None if recording too short
+        numpy.ndarray: int16 audio data (view of the capture buffer), or None
+        if recording too short
     """
     frame_duration_ms = 30  # 30ms frame duration for WebRTC VAD
     frame_size = int(sample_rate * (frame_duration_ms / 1000.0))
@@ -108,16 +315,18 @@ def record_audio(sample_rate=16000, silence_duration=900, vad_aggressiveness=2,
     initial_frames_to_skip = int((initial_skip_ms / 1000.0) * sample_rate / frame_size)
 
     # Create VAD only for modes that use it (matches old WhisperWriter behavior)
+    # or when streaming segments are requested
     vad = None
     speech_detected = False
     silent_frame_count = 0
-    if recording_mode in ('voice_activity_detection', 'continuous'):
+    auto_stop = recording_mode in ('voice_activity_detection', 'continuous')
+    if auto_stop or on_segment:
         vad_aggressiveness = max(0, min(3, vad_aggressiveness))
         vad = webrtcvad.Vad(vad_aggressiveness)
+    segmenter = None
 
-    # Audio buffer and recording storage
-    audio_buffer = deque(maxlen=frame_size)
-    recording = []
+    # Capture buffer - whole recording, VAD reads frame views of it
+    buffer = create_capture_buffer(sample_rate)
 
     # Event for signaling data ready
     data_ready = Event()
@@ -126,7 +335,7 @@ def audio_callback(indata, frames, time_info, status):
         """Callback for audio stream - called for each audio block."""
         if status:
             pass
-        audio_buffer.extend(indata[:, 0])
+        append_samples(buffer, indata[:, 0])
         data_ready.set()
 
     # Record audio
@@ -135,55 +344,72 @@ def audio_callback(indata, frames, time_info, status):
                         callback=audio_callback):
         # Clear any stale data from previous recording session
         time.sleep(0.05)
-        audio_buffer.clear()
+        discard_captured(buffer)
         data_ready.clear()
+        if on_segment:
+            segmenter = create_segmenter(sample_rate, start=buffer['start'])
 
-        while True:
+        stop = False
+        while not stop:
             if stop_event and stop_event.is_set():
                 break
             data_ready.wait(timeout=0.1)
             data_ready.clear()
 
-            if len(audio_buffer) < frame_size:
-                continue
+            # Every complete frame since the last wakeup
+            while True:
+                frame = next_frame(buffer, frame_size)
+                if frame is None:
+                    break
 
-            # Extract frame
-            frame = np.array(list(audio_buffer), dtype=np.int16)
-            audio_buffer.clear()
-            recording.extend(frame)
+                # Skip initial frames to avoid activation key sound
+                if initial_frames_to_skip > 0:
+                    initial_frames_to_skip -= 1
+                    continue
 
-            # Skip initial frames to avoid activation key sound
-            if initial_frames_to_skip > 0:
-                initial_frames_to_skip -= 1
-                continue
+                if not vad:
+                    continue  # press_to_toggle/hold_to_record: nothing to inspect
 
-            # VAD auto-stop only for vad/continuous modes
-            if vad:
                 passes_energy_check = True
                 if energy_threshold > 0:
-                    frame_energy = np.sqrt(np.mean(frame.astype(np.float32) ** 2))
-                    passes_energy_check = frame_energy >= energy_threshold
-
-                if passes_energy_check:
-                    if vad.is_speech(frame.tobytes(), sample_rate):
-                        silent_frame_count = 0
-                        if not speech_detected:
-                            speech_detected = True
-                    else:
-                        silent_frame_count += 1
+                    passes_energy_check = frame_energy(frame) >= energy_threshold
+                speech = passes_energy_check and vad.is_speech(frame.tobytes(), sample_rate)
+
+                # Streaming - hand off each completed segment
+                if segmenter:
+                    bounds = segment_step(segmenter, speech, buffer['read'], frame_duration_ms)
+                    if bounds:
+                        on_segment(buffer['data'][bounds[0]:bounds[1]], False)
+
+                # VAD auto-stop only for vad/continuous modes
+                if not auto_stop:
+                    continue
+
+                if speech:
+                    silent_frame_count = 0
+                    if not speech_detected:
+                        speech_detected = True
                 else:
                     silent_frame_count += 1
 
                 if speech_detected and silent_frame_count > silence_frames:
+                    stop = True
                     break
             # For press_to_toggle/hold_to_record: loop continues until stop_event
 
-    # Convert to numpy array
-    audio_data = np.array(recording, dtype=np.int16)
+    # Stream closed - no more appends, hand off a view
+    audio_data = captured_audio(buffer)
     duration = len(audio_data) / sample_rate
 
+    too_short = (duration * 1000) < min_duration
+
+    if segmenter:
+        bounds = None if too_short else segment_tail(segmenter, buffer['size'])
+        tail = buffer['data'][bounds[0]:bounds[1]] if bounds else buffer['data'][:0]
+        on_segment(tail, True)
+
     # Check minimum duration
-    if (duration * 1000) < min_duration:
+    if too_short:
         return None
 
     return audio_data
@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: config_handler.py - Configuration management handler
 # Date: 2026-02-11
-# Version: 1.0.0
+# Version: 1.2.0
 # Category: speakeasy/handlers
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): model.idle_unload_minutes option
+#   - v1.1.0 (2026-10-18): recording.streaming option
 #   - v1.0.0 (2026-02-11): Initial implementation
 #
 # CODE STANDARDS:
@@ -48,6 +50,7 @@ def get_default_config() -> Dict[str, Any]:
             'language': 'en',
             'temperature': 0.0,
             'vad_filter': True,
+            'idle_unload_minutes': 0,
         },
         'recording': {
             'activation_key': 'ctrl+space',
@@ -56,6 +59,7 @@ def get_default_config() -> Dict[str, Any]:
             'silence_duration': 900,
             'min_duration': 100,
             'vad_aggressiveness': 2,
+            'streaming': False,
         },
         'input': {
             'method': 'pynput',
@@ -210,6 +214,12 @@ def validate_config(config: Dict[str, Any]) -> Tuple[bool, List[str]]:
             if not isinstance(temp, (int, float)) or temp < 0.0 or temp > 1.0:
                 errors.append(f"Invalid temperature: {temp} (must be 0.0-1.0)")
 
+        # Idle unload must be non-negative (0 = keep loaded)
+        if 'idle_unload_minutes' in model:
+            idle = model['idle_unload_minutes']
+            if isinstance(idle, bool) or not isinstance(idle, (int, float)) or idle < 0:
+                errors.append(f"Invalid idle_unload_minutes: {idle} (must be non-negative number)")
+
     # Validate recording section
     if 'recording' in config:
         recording = config['recording']
@@ -238,6 +248,10 @@ def validate_config(config: Dict[str, Any]) -> Tuple[bool, List[str]]:
             if not isinstance(vad, int) or vad < 0 or vad > 3:
                 errors.append(f"Invalid vad_aggressiveness: {vad} (must be 0-3)")
 
+        # Streaming must be a boolean
+        if 'streaming' in recording and not isinstance(recording['streaming'], bool):
+            errors.append(f"Invalid streaming: {recording['streaming']} (must be true or false)")
+
     # Validate input section
     if 'input' in config:
         input_cfg = config['input']
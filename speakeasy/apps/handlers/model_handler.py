@@ -0,0 +1,392 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: model_handler.py - Whisper model lifecycle handler
+# Date: 2026-10-18
+# Version: 1.0.1
+# Category: speakeasy/handlers
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.0.1 (2026-10-18): Returning to the loaded model cancels a pending swap; benchmark transcribe required
+#   - v1.0.0 (2026-10-18): Initial implementation - background preload, hot swap, idle unload, stats
+#
+# CODE STANDARDS:
+#   - Handlers implement logic, modules orchestrate
+#   - Pure functions, no classes, no Prax imports
+# =============================================
+
+"""
+Whisper model lifecycle handler.
+
+Keeps one warm model behind a manager (a plain state dict):
+- preload_model() loads on a background thread and returns immediately
+- A config change loads the new model in the background while the old one
+  keeps serving, then swaps it in
+- Idle unload after a configurable period frees the model's RAM; the next
+  acquire_model() reloads it
+- Load time, real-time factor and process memory are tracked and can be
+  written to a status file for `speakeasy status`
+
+The loader is passed in (transcription_handler.create_whisper_model in the
+app) so this handler has no cross-handler imports.
+"""
+
+import gc
+import json
+import os
+import resource
+import threading
+import time
+from pathlib import Path
+
+# Running service writes here; `speakeasy status` reads it
+MODEL_STATUS_FILE = Path.home() / "speakeasy" / "speakeasy_json" / "model_status.json"
+
+# How often the service checks idleness and refreshes the status file
+IDLE_CHECK_SECONDS = 5
+
+
+def current_rss_mb():
+    """
+    Resident memory of this process in MB.
+
+    Returns:
+        float: Current RSS (/proc), or peak RSS where /proc is unavailable
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def model_key(model_cfg):
+    """
+    Identity of a model configuration - a change means a reload.
+
+    Args:
+        model_cfg: config['model'] dict
+
+    Returns:
+        tuple: (name, device, compute_type)
+    """
+    return (
+        model_cfg.get('name', 'base.en'),
+        model_cfg.get('device', 'auto'),
+        model_cfg.get('compute_type', 'default')
+    )
+
+
+def create_model_manager(loader, idle_unload_seconds=0):
+    """
+    Create a model manager.
+
+    Args:
+        loader: Callable(model_name=, device=, compute_type=) returning a model
+        idle_unload_seconds: Unload after this long unused (0 = never)
+
+    Returns:
+        dict: Manager state for the functions below
+    """
+    return {
+        'loader': loader,
+        'lock': threading.Condition(),
+        'model': None,
+        'key': None,
+        'loading_key': None,
+        'error': None,
+        'last_used': time.monotonic(),
+        'idle_unload_seconds': idle_unload_seconds,
+        'stats': {
+            'load_seconds': None,
+            'model_mb': None,
+            'loads': 0,
+            'unloads': 0,
+            'inferences': 0,
+            'audio_seconds': 0.0,
+            'inference_seconds': 0.0,
+            'rtf_last': None
+        }
+    }
+
+
+def _load(manager, key):
+    """Background load; swaps the result in unless a newer request superseded it."""
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    try:
+        model = manager['loader'](model_name=key[0], device=key[1], compute_type=key[2])
+        error = None
+    except Exception as e:
+        model, error = None, e
+    load_seconds = time.perf_counter() - start
+
+    with manager['lock']:
+        if manager['loading_key'] != key:
+            return  # Superseded by a later preload
+        manager['loading_key'] = None
+        if error is not None:
+            manager['error'] = error
+        else:
+            manager['model'] = model  # Previous model (if any) released here
+            manager['key'] = key
+            manager['error'] = None
+            manager['last_used'] = time.monotonic()
+            stats = manager['stats']
+            stats['load_seconds'] = load_seconds
+            stats['model_mb'] = max(0.0, current_rss_mb() - rss_before)
+            stats['loads'] += 1
+        manager['lock'].notify_all()
+    gc.collect()
+
+
+def preload_model(manager, model_cfg):
+    """
+    Start loading a model in the background (returns immediately).
+
+    No-op if the same configuration is already loaded or loading. While a
+    different model loads, the current one keeps serving acquire_model().
+    Switching back to the loaded configuration cancels a pending load, so
+    the superseded model is discarded instead of swapped in.
+
+    Args:
+        manager: State from create_model_manager()
+        model_cfg: config['model'] dict
+
+    Returns:
+        bool: True if a load was started
+    """
+    key = model_key(model_cfg)
+    with manager['lock']:
+        if manager['key'] == key and manager['model'] is not None:
+            manager['loading_key'] = None  # _load() drops a superseded result
+            return False
+        if manager['loading_key'] == key:
+            return False
+        manager['loading_key'] = key
+        manager['error'] = None
+    threading.Thread(target=_load, args=(manager, key), name="model-preload", daemon=True).start()
+    return True
+
+
+def acquire_model(manager, model_cfg, timeout=None):
+    """
+    Get a ready model, waiting for (or starting) a load only if none is loaded.
+
+    Args:
+        manager: State from create_model_manager()
+        model_cfg: config['model'] dict (used to reload after idle unload)
+        timeout: Seconds to wait for a load (None = no limit)
+
+    Returns:
+        Model instance
+
+    Raises:
+        Exception: The load error, if loading failed
+        TimeoutError: If no model became ready within timeout
+    """
+    with manager['lock']:
+        if manager['model'] is None and manager['loading_key'] is None:
+            manager['loading_key'] = model_key(model_cfg)
+            manager['error'] = None
+            threading.Thread(target=_load, args=(manager, manager['loading_key']),
+                             name="model-preload", daemon=True).start()
+        ready = manager['lock'].wait_for(
+            lambda: manager['model'] is not None or manager['error'] is not None, timeout)
+        if manager['model'] is None:
+            if manager['error'] is not None:
+                raise manager['error']
+            if not ready:
+                raise TimeoutError("Whisper model did not load in time")
+        manager['last_used'] = time.monotonic()
+        return manager['model']
+
+
+def record_inference(manager, audio_seconds, elapsed_seconds):
+    """
+    Record one transcription for real-time factor stats.
+
+    Args:
+        manager: State from create_model_manager()
+        audio_seconds: Duration of the transcribed audio
+        elapsed_seconds: Wall time spent transcribing
+    """
+    with manager['lock']:
+        stats = manager['stats']
+        stats['inferences'] += 1
+        stats['audio_seconds'] += audio_seconds
+        stats['inference_seconds'] += elapsed_seconds
+        if audio_seconds > 0:
+            stats['rtf_last'] = elapsed_seconds / audio_seconds
+        manager['last_used'] = time.monotonic()
+
+
+def unload_if_idle(manager, now=None):
+    """
+    Drop the model if unused for idle_unload_seconds.
+
+    Args:
+        manager: State from create_model_manager()
+        now: time.monotonic() value (default: now)
+
+    Returns:
+        bool: True if the model was unloaded
+    """
+    limit = manager['idle_unload_seconds']
+    now = time.monotonic() if now is None else now
+    with manager['lock']:
+        if not limit or manager['model'] is None or manager['loading_key'] is not None:
+            return False
+        if now - manager['last_used'] < limit:
+            return False
+        manager['model'] = None
+        manager['stats']['unloads'] += 1
+    gc.collect()
+    return True
+
+
+def unload_model(manager):
+    """
+    Release the model now (shutdown); acquire_model() would reload it.
+
+    Args:
+        manager: State from create_model_manager()
+    """
+    with manager['lock']:
+        manager['model'] = None
+    gc.collect()
+
+
+def model_status(manager):
+    """
+    Snapshot of the model lifecycle for display.
+
+    Args:
+        manager: State from create_model_manager()
+
+    Returns:
+        dict: state (ready/loading/unloaded/error), model, loading, error,
+        load_seconds, model_mb, rss_mb, rtf_last, rtf_mean, inferences,
+        loads, unloads, idle_seconds
+    """
+    with manager['lock']:
+        stats = dict(manager['stats'])
+        if manager['model'] is not None:
+            state = 'ready'
+        elif manager['loading_key'] is not None:
+            state = 'loading'
+        elif manager['error'] is not None:
+            state = 'error'
+        else:
+            state = 'unloaded'
+        key = manager['key']
+        loading_key = manager['loading_key']
+        error = manager['error']
+        idle = time.monotonic() - manager['last_used']
+
+    rtf_mean = None
+    if stats['audio_seconds'] > 0:
+        rtf_mean = stats['inference_seconds'] / stats['audio_seconds']
+    return {
+        'state': state,
+        'model': '/'.join(key) if key else None,
+        'loading': '/'.join(loading_key) if loading_key else None,
+        'error': str(error) if error is not None else None,
+        'load_seconds': stats['load_seconds'],
+        'model_mb': stats['model_mb'],
+        'rss_mb': current_rss_mb(),
+        'rtf_last': stats['rtf_last'],
+        'rtf_mean': rtf_mean,
+        'inferences': stats['inferences'],
+        'loads': stats['loads'],
+        'unloads': stats['unloads'],
+        'idle_seconds': idle
+    }
+
+
+def save_model_status(manager, path=None):
+    """
+    Write model_status() for `speakeasy status` (atomic replace).
+
+    Args:
+        manager: State from create_model_manager()
+        path: Status file (default: MODEL_STATUS_FILE)
+
+    Returns:
+        bool: True if written
+    """
+    path = Path(path or MODEL_STATUS_FILE)
+    status = model_status(manager)
+    status['pid'] = os.getpid()
+    status['updated'] = time.time()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(status, f, indent=2)
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        return False
+
+
+def load_model_status(path=None):
+    """
+    Read the status file written by the running service.
+
+    Args:
+        path: Status file (default: MODEL_STATUS_FILE)
+
+    Returns:
+        dict: Saved status, or None if missing/unreadable
+    """
+    path = Path(path or MODEL_STATUS_FILE)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def benchmark_model(loader, model_cfg, audio_data, transcribe, sample_rate=16000, runs=3):
+    """
+    Measure load time, memory and real-time factor for one configuration.
+
+    Args:
+        loader: Model loader (see create_model_manager)
+        model_cfg: config['model'] dict (name/device/compute_type)
+        audio_data: numpy int16 audio to transcribe
+        transcribe: Callable(audio_data, model) -> str
+        sample_rate: Audio sample rate in Hz
+        runs: Timed transcriptions after one warm-up
+
+    Returns:
+        dict: model, load_seconds, model_mb, rtf (best of runs), rtf_mean
+    """
+    key = model_key(model_cfg)
+    gc.collect()
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    model = loader(model_name=key[0], device=key[1], compute_type=key[2])
+    load_seconds = time.perf_counter() - start
+    model_mb = max(0.0, current_rss_mb() - rss_before)
+
+    audio_seconds = len(audio_data) / sample_rate
+    transcribe(audio_data, model)  # Warm-up
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        transcribe(audio_data, model)
+        timings.append(time.perf_counter() - start)
+
+    del model
+    gc.collect()
+    return {
+        'model': '/'.join(key),
+        'load_seconds': load_seconds,
+        'model_mb': model_mb,
+        'rtf': min(timings) / audio_seconds,
+        'rtf_mean': sum(timings) / len(timings) / audio_seconds
+    }
@@ -4,11 +4,14 @@
 # META DATA HEADER
 # Name: transcription_handler.py - Whisper transcription handler
 # Date: 2026-02-11
-# Version: 1.0.0
+# Version: 1.4.0
 # Category: speakeasy/handlers
 #
 # CHANGELOG (Max 5 entries):
-#   - v1.0.0 (2026-02-11): Initial implementation
+#   - v1.4.0 (2026-10-18): Segment transcriber can acquire its model on the worker thread (segments buffer meanwhile)
+#   - v1.3.0 (2026-10-18): Segment transcriber tracks audio/inference seconds for RTF stats
+#   - v1.2.0 (2026-10-18): Background segment transcriber for streaming mode, optional per-call gc
+#   - v1.1.0 (2026-10-18): Single float32 allocation when normalizing captured audio
 #
 # CODE STANDARDS:
 #   - Handlers implement logic, modules orchestrate
@@ -20,12 +23,25 @@
 
 Provides pure functions for audio transcription and post-processing.
 Based on whisper-writer/src/transcription.py patterns.
+
+Streaming mode: a segment transcriber runs transcribe_audio on a background
+thread for each segment submitted while recording continues, prompting each
+segment with the tail of the text so far.
 """
 
 import gc
+import queue
+import threading
+import time
 import numpy as np
 from faster_whisper import WhisperModel
 
+# faster-whisper takes raw arrays as 16 kHz mono
+WHISPER_SAMPLE_RATE = 16000
+
+# Characters of already-transcribed text passed as prompt context to the next segment
+PROMPT_CONTEXT_CHARS = 200
+
 
 def create_whisper_model(model_name="base.en", device="auto", compute_type="default"):
     """
@@ -82,7 +98,7 @@ def create_whisper_model(model_name="base.en", device="auto", compute_type="defa
 
 def transcribe_audio(audio_data, model, language="en", temperature=0.0,
                      vad_filter=True, initial_prompt=None,
-                     condition_on_previous_text=True):
+                     condition_on_previous_text=True, collect_garbage=True):
     """
     Transcribe audio data using a faster-whisper model.
 
@@ -94,6 +110,7 @@ def transcribe_audio(audio_data, model, language="en", temperature=0.0,
         vad_filter: Enable VAD filtering to remove silence
         initial_prompt: Optional prompt to guide transcription style
         condition_on_previous_text: Use previous text as context
+        collect_garbage: Run gc.collect() afterwards (streaming defers it to the end)
 
     Returns:
         str: Transcribed text
@@ -106,8 +123,9 @@ def transcribe_audio(audio_data, model, language="en", temperature=0.0,
         - Includes garbage collection to mitigate Whisper memory leak
         - VAD filter helps improve accuracy by removing silence
     """
-    # Convert int16 to float32 normalized to [-1.0, 1.0]
-    audio_data_float = audio_data.astype(np.float32) / 32768.0
+    # Convert int16 to float32 normalized to [-1.0, 1.0] (scaled in place - one allocation)
+    audio_data_float = audio_data.astype(np.float32)
+    audio_data_float *= 1.0 / 32768.0
 
     # Transcribe
     segments, info = model.transcribe(
@@ -124,11 +142,154 @@ def transcribe_audio(audio_data, model, language="en", temperature=0.0,
 
     # Force garbage collection to mitigate Whisper memory leak
     # See: https://github.com/openai/whisper/discussions/605
-    gc.collect()
+    if collect_garbage:
+        gc.collect()
+
+    return result
+
 
+def stitch_segments(texts):
+    """
+    Join segment texts, adding a space where neither side has one.
+
+    Args:
+        texts: Segment texts in order
+
+    Returns:
+        str: Stitched text
+    """
+    result = ''
+    for text in texts:
+        if result and text and not result[-1].isspace() and not text[0].isspace():
+            result += ' '
+        result += text
     return result
 
 
+def segment_prompt(initial_prompt, texts):
+    """
+    Build the prompt for the next streaming segment.
+
+    Args:
+        initial_prompt: Configured prompt (or None)
+        texts: Segment texts transcribed so far
+
+    Returns:
+        str: initial_prompt followed by the last PROMPT_CONTEXT_CHARS of text,
+        or None if both are empty
+    """
+    context = stitch_segments(texts).strip()[-PROMPT_CONTEXT_CHARS:]
+    prompt = ' '.join(part for part in (initial_prompt, context) if part)
+    return prompt or None
+
+
+def start_segment_transcriber(model=None, language="en", temperature=0.0,
+                              vad_filter=True, initial_prompt=None, on_text=None,
+                              load_model=None):
+    """
+    Start a background thread that transcribes submitted segments in order.
+
+    Args:
+        model: WhisperModel instance created by create_whisper_model()
+        language: Language code (e.g., "en", "es", "fr")
+        temperature: Sampling temperature (0.0 = deterministic)
+        vad_filter: Enable VAD filtering to remove silence
+        initial_prompt: Optional prompt to guide transcription style
+        on_text: Callback(segment_text) on the worker thread as each segment
+            completes - for committing partial results early (default: None)
+        load_model: Callable() -> model, used instead of model. Called on the
+            worker thread, so recording can start while the model loads;
+            segments submitted meanwhile wait in the queue
+
+    Returns:
+        dict: Transcriber state for submit_segment()/finish_segment_transcriber();
+        'audio_seconds'/'inference_seconds' accumulate per transcribed segment
+    """
+    transcriber = {
+        'queue': queue.Queue(),
+        'texts': [],
+        'error': None,
+        'thread': None,
+        'audio_seconds': 0.0,
+        'inference_seconds': 0.0
+    }
+
+    def worker():
+        current = model
+        if load_model is not None:
+            try:
+                current = load_model()
+            except Exception as e:
+                transcriber['error'] = e
+        while True:
+            audio_data = transcriber['queue'].get()
+            if audio_data is None:
+                return
+            if transcriber['error'] is not None:
+                continue  # Drain after a failure
+            try:
+                start = time.perf_counter()
+                text = transcribe_audio(
+                    audio_data, current,
+                    language=language,
+                    temperature=temperature,
+                    vad_filter=vad_filter,
+                    initial_prompt=segment_prompt(initial_prompt, transcriber['texts']),
+                    collect_garbage=False
+                )
+                transcriber['inference_seconds'] += time.perf_counter() - start
+                transcriber['audio_seconds'] += len(audio_data) / WHISPER_SAMPLE_RATE
+                transcriber['texts'].append(text)
+                if on_text and text.strip():
+                    on_text(text)
+            except Exception as e:
+                transcriber['error'] = e
+
+    transcriber['thread'] = threading.Thread(target=worker, name="segment-transcriber", daemon=True)
+    transcriber['thread'].start()
+    return transcriber
+
+
+def submit_segment(transcriber, audio_data):
+    """
+    Queue a segment for transcription (returns immediately).
+
+    Args:
+        transcriber: State from start_segment_transcriber()
+        audio_data: numpy int16 array (empty segments are skipped)
+    """
+    if audio_data is not None and len(audio_data):
+        transcriber['queue'].put(audio_data)
+
+
+def finish_segment_transcriber(transcriber, timeout=None):
+    """
+    Wait for queued segments and return the stitched text.
+
+    Args:
+        transcriber: State from start_segment_transcriber()
+        timeout: Seconds to wait for the worker (None = until done)
+
+    Returns:
+        str: Stitched segment texts
+
+    Raises:
+        Exception: The first transcription error, if any
+        TimeoutError: If the worker is still busy after timeout
+    """
+    transcriber['queue'].put(None)
+    transcriber['thread'].join(timeout)
+    if transcriber['thread'].is_alive():
+        raise TimeoutError("Segment transcription did not finish in time")
+
+    # Deferred from the per-segment calls
+    gc.collect()
+
+    if transcriber['error'] is not None:
+        raise transcriber['error']
+    return stitch_segments(transcriber['texts'])
+
+
 def post_process_text(text, remove_trailing_period=False,
                       add_trailing_space=True, remove_capitalization=False):
     """
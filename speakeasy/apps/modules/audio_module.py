@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: audio_module.py - Audio recording and transcription orchestration
 # Date: 2026-02-11
-# Version: 1.1.0
+# Version: 1.3.0
 # Category: speakeasy/modules
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.3.0 (2026-10-18): benchmark-model command - CPU int8 vs float32 load time, RTF, memory
+#   - v1.2.0 (2026-10-18): streaming option - segments transcribed while recording
 #   - v1.1.0 (2026-02-11): Fixed imports, thin orchestration, model caching
 #   - v1.0.0 (2026-02-11): Initial implementation
 #
@@ -25,8 +27,11 @@
 
 import sys
 import time
+import wave
 from pathlib import Path
 
+import numpy as np
+
 AIPASS_ROOT = Path.home() / "aipass_core"
 sys.path.insert(0, str(AIPASS_ROOT))
 
@@ -36,16 +41,34 @@
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from handlers import audio_handler
 from handlers import transcription_handler
+from handlers import model_handler
 
 # Module-level model cache
 WHISPER_MODEL = None
 
+# Compute types compared by benchmark-model (CPU)
+BENCHMARK_COMPUTE_TYPES = ("int8", "float32")
+
+
+def _benchmark_audio(config):
+    """16 kHz int16 audio for benchmark-model: audio_file (mono WAV) or synthetic noise"""
+    audio_file = config.get('audio_file')
+    if audio_file:
+        with wave.open(str(audio_file), 'rb') as wav:
+            if wav.getframerate() != 16000 or wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+                raise ValueError(f"{audio_file}: need 16 kHz mono 16-bit WAV")
+            return np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+    logger.warning("No audio_file given - benchmarking on synthetic noise (RTF only comparable between runs)")
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(16000 * config.get('duration', 10)) * 1000).astype(np.int16)
+
 
 def handle_command(command, args) -> bool:
     """Command handler for auto-discovery by speakeasy.py.
 
     Args:
-        command: Command string ("record", "transcribe", "test-audio")
+        command: Command string ("record", "transcribe", "test-audio", "benchmark-model")
         args: Dictionary of arguments
 
     Returns:
@@ -57,6 +80,33 @@ def handle_command(command, args) -> bool:
         config = args or {}
         sample_rate = config.get('sample_rate', 16000)
 
+        if WHISPER_MODEL is None:
+            model_name = config.get('model_name', 'base.en')
+            logger.info(f"Creating Whisper model: {model_name}")
+            WHISPER_MODEL = transcription_handler.create_whisper_model(
+                model_name=model_name,
+                device=config.get('model_device', 'auto'),
+                compute_type=config.get('compute_type', 'default')
+            )
+            logger.info("Whisper model ready")
+
+        # Streaming: segments transcribed on a worker while recording continues
+        transcriber = None
+        on_segment = None
+        if config.get('streaming', False):
+            transcriber = transcription_handler.start_segment_transcriber(
+                WHISPER_MODEL,
+                language=config.get('language', 'en'),
+                temperature=config.get('temperature', 0.0),
+                vad_filter=config.get('vad_filter', True),
+                initial_prompt=config.get('initial_prompt', None),
+                on_text=lambda text: logger.info(f"Partial: '{text.strip()}'")
+            )
+
+            def submit(audio, final):
+                transcription_handler.submit_segment(transcriber, audio)
+            on_segment = submit
+
         logger.info("Recording audio...")
         start_time = time.time()
         audio_data = audio_handler.record_audio(
@@ -64,36 +114,32 @@ def handle_command(command, args) -> bool:
             silence_duration=config.get('silence_duration', 900),
             vad_aggressiveness=config.get('vad_aggressiveness', 2),
             min_duration=config.get('min_duration', 100),
-            device=config.get('device', None)
+            device=config.get('device', None),
+            on_segment=on_segment
         )
 
         if audio_data is None:
+            if transcriber:
+                transcription_handler.finish_segment_transcriber(transcriber)
             logger.warning("Recording discarded (too short)")
             return True
 
         duration = len(audio_data) / sample_rate
         logger.info(f"Recording complete: {duration:.2f}s audio, {time.time() - start_time:.2f}s elapsed")
 
-        if WHISPER_MODEL is None:
-            model_name = config.get('model_name', 'base.en')
-            logger.info(f"Creating Whisper model: {model_name}")
-            WHISPER_MODEL = transcription_handler.create_whisper_model(
-                model_name=model_name,
-                device=config.get('model_device', 'auto'),
-                compute_type=config.get('compute_type', 'default')
-            )
-            logger.info("Whisper model ready")
-
         logger.info("Transcribing...")
         start_time = time.time()
-        transcription = transcription_handler.transcribe_audio(
-            audio_data=audio_data,
-            model=WHISPER_MODEL,
-            language=config.get('language', 'en'),
-            temperature=config.get('temperature', 0.0),
-            vad_filter=config.get('vad_filter', True),
-            initial_prompt=config.get('initial_prompt', None)
-        )
+        if transcriber:
+            transcription = transcription_handler.finish_segment_transcriber(transcriber)
+        else:
+            transcription = transcription_handler.transcribe_audio(
+                audio_data=audio_data,
+                model=WHISPER_MODEL,
+                language=config.get('language', 'en'),
+                temperature=config.get('temperature', 0.0),
+                vad_filter=config.get('vad_filter', True),
+                initial_prompt=config.get('initial_prompt', None)
+            )
         logger.info(f"Transcription complete in {time.time() - start_time:.2f}s: '{transcription.strip()}'")
 
         transcription_handler.post_process_text(
@@ -111,5 +157,30 @@ def handle_command(command, args) -> bool:
         logger.info(f"Test complete - Max amplitude: {result.get('max_amplitude')}, RMS: {result.get('rms_level', 0):.2f}")
         return True
 
+    elif command == "benchmark-model":
+        config = args or {}
+        audio_data = _benchmark_audio(config)
+
+        def transcribe(audio, model):
+            return transcription_handler.transcribe_audio(
+                audio, model, language=config.get('language', 'en'), vad_filter=False)
+
+        for compute_type in BENCHMARK_COMPUTE_TYPES:
+            model_cfg = {
+                'name': config.get('model_name', 'base.en'),
+                'device': 'cpu',
+                'compute_type': compute_type
+            }
+            result = model_handler.benchmark_model(
+                transcription_handler.create_whisper_model, model_cfg, audio_data,
+                transcribe=transcribe, runs=config.get('runs', 3)
+            )
+            logger.info(
+                f"{result['model']}: load {result['load_seconds']:.2f}s, "
+                f"RTF {result['rtf']:.3f} (mean {result['rtf_mean']:.3f}), "
+                f"memory +{result['model_mb']:.0f} MB"
+            )
+        return True
+
     else:
         return False
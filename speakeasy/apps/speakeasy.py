@@ -4,10 +4,13 @@
 # META DATA HEADER
 # Name: speakeasy.py - SPEAKEASY Branch Entry Point
 # Date: 2026-02-11
-# Version: 1.0.0
+# Version: 1.2.1
 # Category: speakeasy
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.1 (2026-10-18): Streaming starts recording immediately - model acquired by the segment transcriber
+#   - v1.2.0 (2026-10-18): Background model preload/hot swap, idle unload, model stats in status
+#   - v1.1.0 (2026-10-18): recording.streaming - segments transcribed and typed while recording
 #   - v1.0.0 (2026-02-11): Initial branch creation
 #
 # CODE STANDARDS:
@@ -195,7 +198,7 @@ def start_service(modules: List[Any]):
     """Start Speakeasy voice-to-text service with GUI"""
     try:
         from PyQt5.QtWidgets import QApplication
-        from PyQt5.QtCore import QThread, pyqtSignal
+        from PyQt5.QtCore import QThread, QTimer, pyqtSignal
         from threading import Event
         import signal
         import time
@@ -203,7 +206,8 @@ def start_service(modules: List[Any]):
         sys.path.insert(0, str(Path(__file__).parent))
         from handlers import (
             audio_handler, transcription_handler, hotkey_handler,
-            input_handler, ui_handler, config_handler, cursor_lock_handler
+            input_handler, ui_handler, config_handler, cursor_lock_handler,
+            model_handler
         )
 
         # Load configuration
@@ -215,8 +219,15 @@ def start_service(modules: List[Any]):
         app = QApplication(sys.argv)
         app.setQuitOnLastWindowClosed(False)
 
+        # Whisper model loads in the background - the hotkey loop never waits on it
+        models = model_handler.create_model_manager(
+            transcription_handler.create_whisper_model,
+            idle_unload_seconds=config.get("model", {}).get("idle_unload_minutes", 0) * 60
+        )
+        model_handler.preload_model(models, config.get("model", {}))
+        console.print("[dim]Loading Whisper model in background...[/dim]")
+
         # Shared state
-        model = None
         worker = None
         listener = None
         tray_icon = None
@@ -230,9 +241,9 @@ class RecordingWorker(QThread):
             text_ready = pyqtSignal(str)
             error_occurred = pyqtSignal(str)
 
-            def __init__(self, whisper_model, cfg):
+            def __init__(self, model_manager, cfg):
                 super().__init__()
-                self.model = whisper_model
+                self.models = model_manager
                 self.cfg = cfg
                 self._stop_event = Event()
 
@@ -248,6 +259,26 @@ def run(self):
                     console.print("[red]Recording...[/red]")
 
                     rec = self.cfg.get("recording", {})
+                    mdl = self.cfg.get("model", {})
+
+                    # Streaming: segments transcribed and typed while recording continues.
+                    # The model is acquired on the transcriber thread so recording starts
+                    # at once; segments captured during a load are buffered until it is ready.
+                    transcriber = None
+                    on_segment = None
+                    if rec.get("streaming", False):
+                        transcriber = transcription_handler.start_segment_transcriber(
+                            load_model=lambda: model_handler.acquire_model(self.models, mdl),
+                            language=mdl.get("language", "en"),
+                            temperature=mdl.get("temperature", 0.0),
+                            vad_filter=mdl.get("vad_filter", True),
+                            on_text=self._commit
+                        )
+
+                        def submit(audio, final):
+                            transcription_handler.submit_segment(transcriber, audio)
+                        on_segment = submit
+
                     audio_data = audio_handler.record_audio(
                         sample_rate=rec.get("sample_rate", 16000),
                         silence_duration=rec.get("silence_duration", 900),
@@ -255,10 +286,14 @@ def run(self):
                         min_duration=rec.get("min_duration", 100),
                         device=None,
                         stop_event=self._stop_event,
-                        recording_mode=rec.get("recording_mode", "press_to_toggle")
+                        recording_mode=rec.get("recording_mode", "press_to_toggle"),
+                        on_segment=on_segment
                     )
 
                     if audio_data is None:
+                        if transcriber:
+                            transcription_handler.finish_segment_transcriber(transcriber)
+                            self._record_streamed(transcriber)
                         console.print("[yellow]Recording too short, discarded[/yellow]")
                         self.status_changed.emit("idle")
                         return
@@ -269,36 +304,30 @@ def run(self):
                     self.status_changed.emit("transcribing")
                     console.print("[yellow]Transcribing...[/yellow]")
 
-                    mdl = self.cfg.get("model", {})
+                    if transcriber:
+                        # Only the final segment is left to transcribe
+                        text = transcription_handler.finish_segment_transcriber(transcriber)
+                        self._record_streamed(transcriber)
+                        if text.strip():
+                            console.print(f"[green]Transcribed:[/green] {text.strip()}")
+                        else:
+                            console.print("[yellow]No speech detected in recording[/yellow]")
+                        return
+
+                    # Waits only if the first load (or a post-idle reload) is still running
+                    model = model_handler.acquire_model(self.models, mdl)
+                    started = time.perf_counter()
                     text = transcription_handler.transcribe_audio(
-                        audio_data=audio_data, model=self.model,
+                        audio_data=audio_data, model=model,
                         language=mdl.get("language", "en"),
                         temperature=mdl.get("temperature", 0.0),
                         vad_filter=mdl.get("vad_filter", True)
                     )
+                    model_handler.record_inference(self.models, duration, time.perf_counter() - started)
 
                     if text and text.strip():
-                        post = self.cfg.get("post_processing", {})
-                        text = transcription_handler.post_process_text(
-                            text=text,
-                            remove_trailing_period=post.get("remove_trailing_period", False),
-                            add_trailing_space=post.get("add_trailing_space", True),
-                            remove_capitalization=post.get("remove_capitalization", False)
-                        )
+                        self._commit(text)
                         console.print(f"[green]Transcribed:[/green] {text.strip()}")
-
-                        # Inject text directly (Qt signals unreliable from non-Qt thread)
-                        if cursor_lock_handler.is_locked():
-                            cursor_lock_handler.restore_position()
-                            time.sleep(0.1)
-                        inp = self.cfg.get("input", {})
-                        if len(text) > inp.get("paste_threshold", 50):
-                            input_handler.paste_text(text)
-                        else:
-                            input_handler.type_text(
-                                text, method=inp.get("method", "pynput"),
-                                key_delay=inp.get("key_delay", 0.005))
-                        console.print("[green]Text injected[/green]")
                     else:
                         console.print("[yellow]No speech detected in recording[/yellow]")
 
@@ -311,6 +340,35 @@ def run(self):
                         cursor_lock_handler.unlock_cursor()
                     self.status_changed.emit("idle")
 
+            def _record_streamed(self, transcriber):
+                """Fold streamed segment timings into the model's RTF stats"""
+                if transcriber['audio_seconds'] > 0:
+                    model_handler.record_inference(
+                        self.models, transcriber['audio_seconds'], transcriber['inference_seconds'])
+
+            def _commit(self, text):
+                """Post-process and inject text (whole recording, or one streamed segment)"""
+                post = self.cfg.get("post_processing", {})
+                text = transcription_handler.post_process_text(
+                    text=text,
+                    remove_trailing_period=post.get("remove_trailing_period", False),
+                    add_trailing_space=post.get("add_trailing_space", True),
+                    remove_capitalization=post.get("remove_capitalization", False)
+                )
+
+                # Inject text directly (Qt signals unreliable from non-Qt thread)
+                if cursor_lock_handler.is_locked():
+                    cursor_lock_handler.restore_position()
+                    time.sleep(0.1)
+                inp = self.cfg.get("input", {})
+                if len(text) > inp.get("paste_threshold", 50):
+                    input_handler.paste_text(text)
+                else:
+                    input_handler.type_text(
+                        text, method=inp.get("method", "pynput"),
+                        key_delay=inp.get("key_delay", 0.005))
+                console.print("[green]Text injected[/green]")
+
             def stop(self):
                 self._stop_event.set()
 
@@ -366,7 +424,7 @@ def on_hotkey_activate():
             if worker and worker.isRunning():
                 worker.stop()
                 return
-            worker = RecordingWorker(model, config)
+            worker = RecordingWorker(models, config)
             worker.status_changed.connect(on_status_change)
             worker.text_ready.connect(on_text_ready)
             worker.error_occurred.connect(on_error)
@@ -393,22 +451,11 @@ def start_hotkey_listener():
 
         # --- GUI Actions ---
         def on_start():
-            """User clicked Start - load model and begin listening"""
-            nonlocal model, tray_icon, status_window
+            """User clicked Start - begin listening (model is preloading in background)"""
+            nonlocal tray_icon, status_window
             if main_window:
                 main_window.hide()
 
-            # Load Whisper model if not already loaded
-            if model is None:
-                console.print("[yellow]Loading Whisper model...[/yellow]")
-                mdl_cfg = config.get("model", {})
-                model = transcription_handler.create_whisper_model(
-                    model_name=mdl_cfg.get("name", "base.en"),
-                    device=mdl_cfg.get("device", "auto"),
-                    compute_type=mdl_cfg.get("compute_type", "default")
-                )
-                console.print("[green]✓[/green] Whisper model loaded")
-
             # Create status window and tray icon
             if status_window is None:
                 status_window = ui_handler.create_status_window(app)
@@ -434,6 +481,12 @@ def save_settings(new_config):
                 config_handler.save_config(new_config, config_path)
                 config = new_config
                 logger.info("[SPEAKEASY] Settings saved")
+
+                # Hot swap: new model loads in background, current one serves until ready
+                mdl_cfg = config.get("model", {})
+                models['idle_unload_seconds'] = mdl_cfg.get("idle_unload_minutes", 0) * 60
+                if model_handler.preload_model(models, mdl_cfg):
+                    console.print("[dim]Loading new Whisper model in background...[/dim]")
                 if settings_window:
                     settings_window.close()
                     settings_window = None
@@ -457,8 +510,21 @@ def on_exit():
                 hotkey_handler.stop_listener(listener)
             if tray_icon:
                 ui_handler.hide_tray_icon(tray_icon)
+            model_status_timer.stop()
+            model_handler.unload_model(models)
+            model_handler.save_model_status(models)
             app.quit()
 
+        # Idle unload + status file for `speakeasy status` (GUI thread, cheap)
+        def on_model_tick():
+            if model_handler.unload_if_idle(models):
+                logger.info("[SPEAKEASY] Whisper model unloaded after idle period")
+            model_handler.save_model_status(models)
+
+        model_status_timer = QTimer()
+        model_status_timer.timeout.connect(on_model_tick)
+        model_status_timer.start(model_handler.IDLE_CHECK_SECONDS * 1000)
+
         # Signal handling for Ctrl+C
         def signal_handler(_sig, _frame):
             on_exit()
@@ -512,6 +578,31 @@ def stop_service():
         return 1
 
 
+def print_model_status(pids: List[str]):
+    """Print the running service's model stats (written every few seconds)"""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from handlers import model_handler
+
+    status = model_handler.load_model_status()
+    if not status or str(status.get('pid')) not in pids:
+        return
+
+    def fmt(value, spec, suffix=""):
+        return "-" if value is None else f"{value:{spec}}{suffix}"
+
+    state = status['state']
+    if status.get('loading'):
+        state += f" (loading {status['loading']})"
+    console.print(f"  Model:     {status.get('model') or '-'} [{state}]")
+    if status.get('error'):
+        console.print(f"  [red]Load error:[/red] {status['error']}")
+    console.print(f"  Load time: {fmt(status.get('load_seconds'), '.2f', 's')}")
+    console.print(f"  RTF:       {fmt(status.get('rtf_last'), '.3f')} last, "
+                  f"{fmt(status.get('rtf_mean'), '.3f')} mean over {status.get('inferences', 0)} transcriptions")
+    console.print(f"  Memory:    {fmt(status.get('rss_mb'), '.0f', ' MB')} process, "
+                  f"{fmt(status.get('model_mb'), '.0f', ' MB')} model")
+
+
 def check_status():
     """Check if Speakeasy service is running"""
     import subprocess
@@ -526,6 +617,7 @@ def check_status():
         if result.returncode == 0 and result.stdout.strip():
             pids = result.stdout.strip().split('\n')
             console.print(f"[green]✓[/green] Speakeasy is running (PID: {', '.join(pids)})")
+            print_model_status(pids)
             return 0
         else:
             console.print("[yellow]⊘[/yellow] Speakeasy is not running")
@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: test_audio_handler.py - Test audio handler functions
 # Date: 2026-02-11
-# Version: 1.0.0
+# Version: 1.2.0
 # Category: speakeasy/tests
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): Streaming segmenter tests
+#   - v1.1.0 (2026-10-18): Capture buffer tests and 60s capture benchmark
 #   - v1.0.0 (2026-02-11): Initial implementation
 #
 # CODE STANDARDS:
@@ -18,6 +20,9 @@
 """Tests for audio_handler.py - audio capture and VAD functions."""
 
 import sys
+import time
+import tracemalloc
+from collections import deque
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock, call
 import pytest
@@ -27,9 +32,18 @@
 sys.path.insert(0, str(Path(__file__).parent.parent / "apps"))
 
 from handlers.audio_handler import (
+    append_samples,
+    captured_audio,
     create_audio_stream,
+    create_capture_buffer,
+    create_segmenter,
+    discard_captured,
+    frame_energy,
     is_speech,
+    next_frame,
     record_audio,
+    segment_step,
+    segment_tail,
     test_microphone
 )
 
@@ -92,6 +106,133 @@ def test_detects_no_speech(self):
         mock_vad.is_speech.assert_called_once()
 
 
+class TestCaptureBuffer:
+    """Tests for the int16 capture buffer functions."""
+
+    def test_frames_are_views_in_order(self):
+        """Test frames come out in capture order as views of the buffer."""
+        buffer = create_capture_buffer(sample_rate=100, seconds=1)
+        append_samples(buffer, np.arange(5, dtype=np.int16))
+        assert next_frame(buffer, 3).tolist() == [0, 1, 2]
+        assert next_frame(buffer, 3) is None
+        append_samples(buffer, np.arange(5, 8, dtype=np.int16))
+        frame = next_frame(buffer, 3)
+        assert frame.tolist() == [3, 4, 5]
+        assert np.shares_memory(frame, buffer['data'])
+
+    def test_grows_past_capacity(self):
+        """Test appends beyond the initial capacity keep every sample."""
+        buffer = create_capture_buffer(sample_rate=10, seconds=1)
+        for start in range(0, 100, 7):
+            append_samples(buffer, np.arange(start, min(start + 7, 100), dtype=np.int16))
+        assert captured_audio(buffer).tolist() == list(range(100))
+        assert len(buffer['data']) >= 100
+
+    def test_discard_and_zero_copy_handoff(self):
+        """Test discarded samples are excluded and the result is not a copy."""
+        buffer = create_capture_buffer(sample_rate=100, seconds=1)
+        append_samples(buffer, np.full(10, 7, dtype=np.int16))
+        discard_captured(buffer)
+        append_samples(buffer, np.arange(4, dtype=np.int16))
+        audio = captured_audio(buffer)
+        assert audio.tolist() == [0, 1, 2, 3]
+        assert audio.dtype == np.int16
+        assert audio.flags['C_CONTIGUOUS']
+        assert np.shares_memory(audio, buffer['data'])
+        assert next_frame(buffer, 4).tolist() == [0, 1, 2, 3]
+
+    def test_frame_energy_matches_rms(self):
+        """Test frame energy equals the RMS formula it replaces."""
+        frame = np.array([1000, -2000, 3000, -4000], dtype=np.int16)
+        expected = np.sqrt(np.mean(frame.astype(np.float32) ** 2))
+        assert frame_energy(frame) == pytest.approx(expected)
+
+
+class TestSegmenter:
+    """Tests for streaming VAD segmentation (100 Hz rate: 3 samples per 30ms frame)."""
+
+    def _run(self, segmenter, pattern):
+        """Feed a speech/silence pattern; return emitted (start, end) bounds."""
+        emitted = []
+        for i, speech in enumerate(pattern):
+            bounds = segment_step(segmenter, speech, (i + 1) * 3)
+            if bounds:
+                emitted.append(bounds)
+        return emitted
+
+    def test_pause_completes_segment(self):
+        """Test speech followed by a pause emits one segment with lead-in pad."""
+        segmenter = create_segmenter(sample_rate=100, pause_ms=90, pad_ms=30)
+        pattern = [False] * 5 + [True] * 4 + [False] * 3
+        assert self._run(segmenter, pattern) == [(12, 36)]
+        assert segment_tail(segmenter, 36) is None
+
+    def test_long_speech_is_capped(self):
+        """Test continuous speech is cut at max_ms."""
+        segmenter = create_segmenter(sample_rate=100, max_ms=300)
+        assert self._run(segmenter, [True] * 25) == [(0, 30), (30, 60)]
+        assert segment_tail(segmenter, 75) == (60, 75)
+
+    def test_tail_without_pause(self):
+        """Test speech still running at stop is returned as the tail."""
+        segmenter = create_segmenter(sample_rate=100, pause_ms=90, pad_ms=0)
+        assert self._run(segmenter, [False, True, True]) == []
+        assert segment_tail(segmenter, 9) == (3, 9)
+
+
+class TestCaptureBenchmark:
+    """Benchmark: 60s of 16 kHz callbacks, list/deque capture vs capture buffer."""
+
+    SAMPLE_RATE = 16000
+    FRAME_SIZE = 480  # 30ms
+
+    def _blocks(self):
+        rng = np.random.default_rng(0)
+        audio = rng.integers(-3000, 3000, size=(60 * self.SAMPLE_RATE, 1), dtype=np.int16)
+        return [audio[i:i + self.FRAME_SIZE] for i in range(0, len(audio), self.FRAME_SIZE)]
+
+    def _old_path(self, blocks):
+        """Previous record_audio data path"""
+        audio_buffer = deque(maxlen=self.FRAME_SIZE)
+        recording = []
+        for indata in blocks:
+            audio_buffer.extend(indata[:, 0])
+            frame = np.array(list(audio_buffer), dtype=np.int16)
+            audio_buffer.clear()
+            recording.extend(frame)
+            np.sqrt(np.mean(frame.astype(np.float32) ** 2))
+        return np.array(recording, dtype=np.int16)
+
+    def _new_path(self, blocks):
+        buffer = create_capture_buffer(self.SAMPLE_RATE)
+        for indata in blocks:
+            append_samples(buffer, indata[:, 0])
+            frame = next_frame(buffer, self.FRAME_SIZE)
+            frame_energy(frame)
+        return captured_audio(buffer)
+
+    def _measure(self, fn, blocks):
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = fn(blocks)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result, elapsed, peak
+
+    def test_capture_60s(self):
+        """Test the capture buffer is faster and smaller, with identical audio."""
+        blocks = self._blocks()
+        old_audio, old_time, old_peak = self._measure(self._old_path, blocks)
+        new_audio, new_time, new_peak = self._measure(self._new_path, blocks)
+
+        print(f"\n  60s capture: list/deque {old_time * 1000:.0f} ms, {old_peak / 1e6:.1f} MB peak"
+              f" | buffer {new_time * 1000:.0f} ms, {new_peak / 1e6:.1f} MB peak")
+        assert np.array_equal(old_audio, new_audio)
+        assert new_time < old_time
+        assert new_peak < old_peak
+
+
 class TestRecordAudio:
     """Tests for record_audio function.
 
@@ -4,10 +4,11 @@
 # META DATA HEADER
 # Name: test_config_handler.py - Test config handler functions
 # Date: 2026-02-11
-# Version: 1.0.0
+# Version: 1.1.0
 # Category: speakeasy/tests
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): idle_unload_minutes validation
 #   - v1.0.0 (2026-02-11): Initial implementation
 #
 # CODE STANDARDS:
@@ -295,6 +296,16 @@ def test_invalid_temperature(self):
         assert valid is False
         assert any('Invalid temperature' in err for err in errors)
 
+    def test_invalid_idle_unload_minutes(self):
+        """Test detects negative idle unload period."""
+        config = get_default_config()
+        config['model']['idle_unload_minutes'] = -5
+
+        valid, errors = validate_config(config)
+
+        assert valid is False
+        assert any('Invalid idle_unload_minutes' in err for err in errors)
+
     def test_invalid_recording_mode(self):
         """Test detects invalid recording mode."""
         config = get_default_config()
@@ -0,0 +1,239 @@
+#!/home/aipass/.venv/bin/python3
+
+# ===================AIPASS====================
+# META DATA HEADER
+# Name: test_model_handler.py - Test Whisper model lifecycle handler
+# Date: 2026-10-18
+# Version: 1.1.0
+# Category: speakeasy/tests
+#
+# CHANGELOG (Max 5 entries):
+#   - v1.1.0 (2026-10-18): Reverting to the loaded config cancels a pending swap
+#   - v1.0.0 (2026-10-18): Initial implementation
+#
+# CODE STANDARDS:
+#   - Test file for speakeasy model handler
+#   - Fake loader stands in for faster-whisper
+# =============================================
+
+"""Tests for model_handler.py - background preload, hot swap, idle unload, stats."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+import pytest
+import numpy as np
+
+# Add apps directory to path so 'handlers' package resolves
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps"))
+
+from handlers.model_handler import (
+    acquire_model,
+    benchmark_model,
+    create_model_manager,
+    load_model_status,
+    model_status,
+    preload_model,
+    record_inference,
+    save_model_status,
+    unload_if_idle,
+    unload_model
+)
+
+
+def make_loader(gate=None):
+    """Loader returning a tuple per call; blocks on gate (an Event) if given."""
+    calls = []
+
+    def loader(model_name, device, compute_type):
+        calls.append((model_name, device, compute_type))
+        if gate is not None:
+            assert gate.wait(5)
+        return ("model", model_name, compute_type, len(calls))
+
+    loader.calls = calls
+    return loader
+
+
+BASE = {'name': 'base.en', 'device': 'cpu', 'compute_type': 'int8'}
+SMALL = {'name': 'small.en', 'device': 'cpu', 'compute_type': 'int8'}
+
+
+def wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+class TestPreload:
+    """Tests for background loading."""
+
+    def test_preload_returns_before_load_finishes(self):
+        gate = threading.Event()
+        manager = create_model_manager(make_loader(gate))
+        started = time.perf_counter()
+        assert preload_model(manager, BASE) is True
+        assert time.perf_counter() - started < 0.5
+        assert model_status(manager)['state'] == 'loading'
+        gate.set()
+        assert acquire_model(manager, BASE)[1] == 'base.en'
+        assert model_status(manager)['state'] == 'ready'
+
+    def test_same_config_is_not_reloaded(self):
+        loader = make_loader()
+        manager = create_model_manager(loader)
+        preload_model(manager, BASE)
+        acquire_model(manager, BASE)
+        assert preload_model(manager, dict(BASE, language='de')) is False
+        assert len(loader.calls) == 1
+
+    def test_acquire_timeout(self):
+        gate = threading.Event()
+        manager = create_model_manager(make_loader(gate))
+        preload_model(manager, BASE)
+        with pytest.raises(TimeoutError):
+            acquire_model(manager, BASE, timeout=0.05)
+        gate.set()
+
+    def test_load_error_raised_on_acquire(self):
+        def loader(**kwargs):
+            raise RuntimeError("no such model")
+
+        manager = create_model_manager(loader)
+        preload_model(manager, BASE)
+        with pytest.raises(RuntimeError, match="no such model"):
+            acquire_model(manager, BASE)
+        assert model_status(manager)['state'] == 'error'
+
+
+class TestHotSwap:
+    """Tests for swapping models without blocking users of the current one."""
+
+    def test_old_model_serves_until_new_is_ready(self):
+        gate = threading.Event()
+        gate.set()
+        manager = create_model_manager(make_loader(gate))
+        preload_model(manager, BASE)
+        assert acquire_model(manager, BASE)[1] == 'base.en'
+
+        gate.clear()
+        assert preload_model(manager, SMALL) is True
+        # Returns immediately with the old model while small.en loads
+        assert acquire_model(manager, SMALL, timeout=0.5)[1] == 'base.en'
+        status = model_status(manager)
+        assert status['model'] == 'base.en/cpu/int8'
+        assert status['loading'] == 'small.en/cpu/int8'
+
+        gate.set()
+        wait_until(lambda: model_status(manager)['model'] == 'small.en/cpu/int8')
+        assert acquire_model(manager, SMALL)[1] == 'small.en'
+
+    def test_superseded_load_is_discarded(self):
+        gates = {'base.en': threading.Event(), 'small.en': threading.Event()}
+
+        def loader(model_name, device, compute_type):
+            gates[model_name].wait(5)
+            return ("model", model_name)
+
+        manager = create_model_manager(loader)
+        preload_model(manager, BASE)
+        preload_model(manager, SMALL)
+        gates['small.en'].set()
+        assert acquire_model(manager, SMALL)[1] == 'small.en'
+        gates['base.en'].set()
+        time.sleep(0.05)
+        assert acquire_model(manager, SMALL)[1] == 'small.en'
+
+    def test_switch_back_cancels_pending_load(self):
+        gate = threading.Event()
+        gate.set()
+        manager = create_model_manager(make_loader(gate))
+        preload_model(manager, BASE)
+        acquire_model(manager, BASE)
+
+        gate.clear()
+        assert preload_model(manager, SMALL) is True
+        assert preload_model(manager, BASE) is False  # Config reverted before small.en finished
+        assert model_status(manager)['loading'] is None
+
+        gate.set()
+        time.sleep(0.05)
+        assert acquire_model(manager, BASE)[1] == 'base.en'
+        assert model_status(manager)['model'] == 'base.en/cpu/int8'
+
+
+class TestIdleUnload:
+    """Tests for idle unload and reload on next use."""
+
+    def test_unload_after_idle_and_reload(self):
+        loader = make_loader()
+        manager = create_model_manager(loader, idle_unload_seconds=60)
+        preload_model(manager, BASE)
+        acquire_model(manager, BASE)
+
+        assert unload_if_idle(manager, now=time.monotonic() + 30) is False
+        assert unload_if_idle(manager, now=time.monotonic() + 61) is True
+        assert model_status(manager)['state'] == 'unloaded'
+
+        # Next use reloads
+        assert acquire_model(manager, BASE)[3] == 2
+        assert model_status(manager)['unloads'] == 1
+
+    def test_disabled_by_default(self):
+        manager = create_model_manager(make_loader())
+        preload_model(manager, BASE)
+        acquire_model(manager, BASE)
+        assert unload_if_idle(manager, now=time.monotonic() + 86400) is False
+
+    def test_unload_model(self):
+        manager = create_model_manager(make_loader())
+        preload_model(manager, BASE)
+        acquire_model(manager, BASE)
+        unload_model(manager)
+        assert model_status(manager)['state'] == 'unloaded'
+
+
+class TestStats:
+    """Tests for load time, RTF and status file."""
+
+    def test_rtf_and_load_time(self):
+        manager = create_model_manager(make_loader())
+        preload_model(manager, BASE)
+        acquire_model(manager, BASE)
+        record_inference(manager, 10.0, 1.0)
+        record_inference(manager, 2.0, 1.0)
+
+        status = model_status(manager)
+        assert status['rtf_last'] == pytest.approx(0.5)
+        assert status['rtf_mean'] == pytest.approx(2.0 / 12.0)
+        assert status['inferences'] == 2
+        assert status['load_seconds'] >= 0
+        assert status['rss_mb'] > 0
+
+    def test_status_file_round_trip(self, temp_test_dir):
+        manager = create_model_manager(make_loader())
+        preload_model(manager, BASE)
+        acquire_model(manager, BASE)
+        path = temp_test_dir / "model_status.json"
+
+        assert save_model_status(manager, path) is True
+        status = load_model_status(path)
+        assert status['state'] == 'ready'
+        assert status['model'] == 'base.en/cpu/int8'
+        assert load_model_status(temp_test_dir / "missing.json") is None
+
+    def test_benchmark_model(self):
+        loader = make_loader()
+        runs = []
+
+        def transcribe(audio, model):
+            runs.append(model)
+            return "text"
+
+        result = benchmark_model(loader, BASE, np.zeros(16000, dtype=np.int16),
+                                 transcribe=transcribe, runs=2)
+        assert result['model'] == 'base.en/cpu/int8'
+        assert len(runs) == 3  # Warm-up + 2 timed
+        assert result['rtf'] <= result['rtf_mean']
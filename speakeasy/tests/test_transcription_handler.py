@@ -4,10 +4,12 @@
 # META DATA HEADER
 # Name: test_transcription_handler.py - Test transcription handler functions
 # Date: 2026-02-11
-# Version: 1.0.0
+# Version: 1.2.0
 # Category: speakeasy/tests
 #
 # CHANGELOG (Max 5 entries):
+#   - v1.2.0 (2026-10-18): Model acquired by the segment transcriber thread
+#   - v1.1.0 (2026-10-18): Streaming segment transcriber tests
 #   - v1.0.0 (2026-02-11): Initial implementation
 #
 # CODE STANDARDS:
@@ -18,6 +20,8 @@
 """Tests for transcription_handler.py - Whisper transcription functions."""
 
 import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import pytest
@@ -28,6 +32,11 @@
 
 from handlers.transcription_handler import (
     create_whisper_model,
+    finish_segment_transcriber,
+    segment_prompt,
+    start_segment_transcriber,
+    stitch_segments,
+    submit_segment,
     transcribe_audio,
     post_process_text
 )
@@ -220,6 +229,102 @@ def test_empty_segments_return_empty_string(self):
         assert result == ""
 
 
+class TestSegmentTranscriber:
+    """Tests for the streaming segment transcriber."""
+
+    def _model(self, delay=0.0):
+        """Mock model: text is 'seg<N>' by audio length, sleeps delay per call."""
+        model = Mock()
+
+        def transcribe(audio, **kwargs):
+            time.sleep(delay)
+            segment = Mock()
+            segment.text = f" seg{len(audio)}"
+            return [segment], Mock()
+        model.transcribe.side_effect = transcribe
+        return model
+
+    def test_segments_stitched_in_order_with_context(self):
+        """Test segments are transcribed in order, each prompted with prior text."""
+        model = self._model()
+        partials = []
+        transcriber = start_segment_transcriber(model, initial_prompt="Names: Ada.", on_text=partials.append)
+        for size in (1, 2, 3):
+            submit_segment(transcriber, np.zeros(size, dtype=np.int16))
+        submit_segment(transcriber, np.zeros(0, dtype=np.int16))
+
+        assert finish_segment_transcriber(transcriber, timeout=5) == " seg1 seg2 seg3"
+        assert partials == [" seg1", " seg2", " seg3"]
+        prompts = [c[1]['initial_prompt'] for c in model.transcribe.call_args_list]
+        assert prompts == ["Names: Ada.", "Names: Ada. seg1", "Names: Ada. seg1 seg2"]
+
+    def test_segments_buffered_while_model_loads(self):
+        """Test segments submitted before load_model returns are kept and transcribed."""
+        loaded = threading.Event()
+        model = self._model()
+
+        def load_model():
+            loaded.wait(5)
+            return model
+
+        transcriber = start_segment_transcriber(load_model=load_model)
+        start = time.perf_counter()
+        for size in (1, 2):
+            submit_segment(transcriber, np.zeros(size, dtype=np.int16))
+        assert time.perf_counter() - start < 0.1
+        assert model.transcribe.call_count == 0
+
+        loaded.set()
+        submit_segment(transcriber, np.zeros(3, dtype=np.int16))
+        assert finish_segment_transcriber(transcriber, timeout=5) == " seg1 seg2 seg3"
+
+    def test_model_load_error_raised_on_finish(self):
+        """Test a failed load_model surfaces from finish."""
+        def load_model():
+            raise RuntimeError("model download failed")
+
+        transcriber = start_segment_transcriber(load_model=load_model)
+        submit_segment(transcriber, np.zeros(4, dtype=np.int16))
+        with pytest.raises(RuntimeError, match="model download failed"):
+            finish_segment_transcriber(transcriber, timeout=5)
+
+    def test_error_raised_on_finish(self):
+        """Test a transcription failure surfaces from finish."""
+        model = Mock()
+        model.transcribe.side_effect = RuntimeError("boom")
+        transcriber = start_segment_transcriber(model)
+        submit_segment(transcriber, np.zeros(4, dtype=np.int16))
+        with pytest.raises(RuntimeError):
+            finish_segment_transcriber(transcriber, timeout=5)
+
+    def test_gc_deferred_to_finish(self):
+        """Test per-segment calls skip gc.collect; finish runs it once."""
+        with patch('handlers.transcription_handler.gc.collect') as mock_gc:
+            transcriber = start_segment_transcriber(self._model())
+            for size in (1, 2, 3):
+                submit_segment(transcriber, np.zeros(size, dtype=np.int16))
+            finish_segment_transcriber(transcriber, timeout=5)
+        assert mock_gc.call_count == 1
+
+    def test_time_to_text_depends_on_final_segment(self):
+        """Test finish waits only for the last segment when earlier ones kept up."""
+        transcriber = start_segment_transcriber(self._model(delay=0.1))
+        for size in (1, 2, 3):
+            submit_segment(transcriber, np.zeros(size, dtype=np.int16))
+            time.sleep(0.15)  # Still recording the next segment
+        submit_segment(transcriber, np.zeros(4, dtype=np.int16))
+
+        start = time.perf_counter()
+        finish_segment_transcriber(transcriber, timeout=5)
+        assert time.perf_counter() - start < 0.25  # One segment, not four
+
+    def test_stitch_and_prompt(self):
+        """Test stitching adds missing spaces and prompt context is bounded."""
+        assert stitch_segments(["Hello", " world", "again"]) == "Hello world again"
+        assert segment_prompt(None, []) is None
+        assert len(segment_prompt(None, ["x" * 500])) == 200
+
+
 class TestPostProcessText:
     """Tests for post_process_text function."""
 